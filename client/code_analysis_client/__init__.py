@@ -9,6 +9,7 @@ from __future__ import annotations
 
 from pathlib import Path
 
+from code_analysis_client.batch import ReadOnlyBatch
 from code_analysis_client.client import CodeAnalysisAsyncClient
 from code_analysis_client.commands_proxy import ValidatedCommandsProxy
 from code_analysis_client.config import (
@@ -32,6 +33,7 @@ from code_analysis_client.queue_wait import (
     wait_for_job,
 )
 from code_analysis_client.server_api import (
+    BATCH_COMMANDS,
     CLIENT_FACADE_COMMANDS,
     CST_REMOVED_COMMANDS,
     FILE_SESSION_COMMANDS,
@@ -52,6 +54,7 @@ from code_analysis_client.validation import (
 )
 
 __all__ = [
+    "BATCH_COMMANDS",
     "CLIENT_FACADE_COMMANDS",
     "CST_REMOVED_COMMANDS",
     "ClientValidationError",
@@ -66,6 +69,7 @@ __all__ = [
     "QueueJobError",
     "QueuedJob",
     "REMOVED_COMMANDS",
+    "ReadOnlyBatch",
     "SessionNotFoundError",
     "TRANSFER_FACADE_METHODS",
     "UNIVERSAL_FILE_COMMANDS",
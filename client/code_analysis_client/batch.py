@@ -0,0 +1,114 @@
+"""
+Builder for ``read_only_batch``: several read-only commands in one round-trip.
+
+The server runs the invocations in order in a single command slot, resolves
+the batch ``project_id`` once and, with ``snapshot=True``, reads everything in
+one read-only transaction. Each item gets its own result envelope, so one
+failing invocation does not hide the others.
+
+Author: Vasiliy Zdanovskiy
+email: vasilyvz@gmail.com
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from code_analysis_client.exceptions import ClientValidationError
+from code_analysis_client.responses import unwrap_command_result
+
+if TYPE_CHECKING:
+    from code_analysis_client.client import CodeAnalysisAsyncClient
+
+BATCH_COMMAND = "read_only_batch"
+
+
+class ReadOnlyBatch:
+    """Ordered list of read-only invocations sent as one ``read_only_batch`` call.
+
+    Example::
+
+        batch = client.batch(project_id, snapshot=True)
+        batch.add("universal_file_preview", file_path="src/app.py")
+        batch.add("get_code_entity_info", entity_name="App")
+        preview, entity = await batch.run()
+    """
+
+    __slots__ = ("_client", "_project_id", "_snapshot", "_invocations")
+
+    def __init__(
+        self,
+        client: CodeAnalysisAsyncClient,
+        project_id: Optional[str] = None,
+        *,
+        snapshot: bool = False,
+    ) -> None:
+        """``project_id`` is inherited by invocations that do not set one."""
+        self._client = client
+        self._project_id = project_id
+        self._snapshot = snapshot
+        self._invocations: List[Dict[str, Any]] = []
+
+    def __len__(self) -> int:
+        """Number of invocations added so far."""
+        return len(self._invocations)
+
+    def add(
+        self,
+        command: str,
+        params: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> ReadOnlyBatch:
+        """Append one invocation (``params`` merged with keyword params); chainable."""
+        merged = dict(params or {})
+        merged.update(kwargs)
+        self._invocations.append({"command": command, "params": merged})
+        return self
+
+    def to_params(self) -> Dict[str, Any]:
+        """Return the ``read_only_batch`` request parameters."""
+        params: Dict[str, Any] = {
+            "invocations": [
+                {"command": inv["command"], "params": dict(inv["params"])}
+                for inv in self._invocations
+            ]
+        }
+        if self._project_id:
+            params["project_id"] = self._project_id
+        if self._snapshot:
+            params["snapshot"] = True
+        return params
+
+    async def run(self, **kwargs: Any) -> List[Dict[str, Any]]:
+        """Send the batch; return one result envelope per invocation, in order.
+
+        Each envelope is ``{"success": True, "data": ...}`` or
+        ``{"success": False, "error": ..., "error_code": ...}``. Extra keyword
+        arguments (e.g. ``max_response_bytes``) are passed to the command.
+
+        Raises:
+            ClientValidationError: Empty batch, a command rejected by the server
+                whitelist, or results spilled to a server-side file (raise
+                ``max_response_bytes`` or split the batch).
+        """
+        if not self._invocations:
+            raise ClientValidationError("batch has no invocations", field="invocations")
+        params = self.to_params()
+        params.update(kwargs)
+        data = unwrap_command_result(
+            await self._client.call_validated(BATCH_COMMAND, params)
+        )
+        if data.get("error_code"):
+            raise ClientValidationError(
+                str(data.get("message") or data.get("error")),
+                field="invocations",
+                details=data,
+            )
+        if not data.get("inline", False):
+            raise ClientValidationError(
+                "batch results exceed max_response_bytes and were written to "
+                f"{data.get('output_file')}",
+                field="max_response_bytes",
+                details=data,
+            )
+        return [entry.get("result") or {} for entry in data.get("results") or []]
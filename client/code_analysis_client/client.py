@@ -16,6 +16,7 @@ try:
 except Exception:  # pragma: no cover - compatibility with older layouts
     from mcp_proxy_adapter.client.jsonrpc_client import JsonRpcClient
 
+from code_analysis_client.batch import ReadOnlyBatch
 from code_analysis_client.commands_proxy import ValidatedCommandsProxy
 from code_analysis_client.config import (
     adapter_settings_from_server_config,
@@ -47,13 +48,18 @@ from code_analysis_client.validation import (
 class CodeAnalysisAsyncClient:
     """Async client: domain commands via :meth:`call` / :meth:`call_unified`; full adapter API on :attr:`rpc`."""
 
-    __slots__ = ("_rpc", "_command_schema_cache", "_commands_proxy")
+    __slots__ = ("_rpc", "_command_schema_cache", "_commands_proxy", "_long_poll")
 
-    def __init__(self, **jsonrpc_kwargs: Any) -> None:
-        """Same keyword arguments as ``JsonRpcClient`` (``protocol``, ``host``, ``port``, ``cert``, …)."""
+    def __init__(self, *, long_poll: bool = True, **jsonrpc_kwargs: Any) -> None:
+        """Same keyword arguments as ``JsonRpcClient`` (``protocol``, ``host``, ``port``, ``cert``, …).
+
+        ``long_poll=False`` waits for queued jobs by polling
+        ``queue_get_job_status`` only, never via the server's ``queue_wait_job``.
+        """
         self._rpc = JsonRpcClient(**jsonrpc_kwargs)
         self._command_schema_cache: Dict[str, Dict[str, Any]] = {}
         self._commands_proxy: Optional[ValidatedCommandsProxy] = None
+        self._long_poll = long_poll
 
     @classmethod
     def from_jsonrpc_kwargs(cls, **kwargs: Any) -> CodeAnalysisAsyncClient:
@@ -152,6 +158,16 @@ class CodeAnalysisAsyncClient:
         """Read-only structured preview (``universal_file_preview`` command)."""
         return UniversalFileClient(self)
 
+    def batch(
+        self, project_id: Optional[str] = None, *, snapshot: bool = False
+    ) -> ReadOnlyBatch:
+        """Start a ``read_only_batch``: several read-only commands in one round-trip.
+
+        ``project_id`` is inherited by invocations that do not set one;
+        ``snapshot=True`` makes the server read them all in one transaction.
+        """
+        return ReadOnlyBatch(self, project_id, snapshot=snapshot)
+
     async def get_command_schema(
         self, command: str, *, refresh: bool = False
     ) -> Dict[str, Any]:
@@ -196,8 +212,9 @@ class CodeAnalysisAsyncClient:
         immediate response is a queue-service envelope
         (:func:`code_analysis_client.queue_wait.is_queued_envelope`):
 
-        * ``auto_poll=True`` (default, unchanged behavior) — polls the job to
-          completion (:func:`~code_analysis_client.queue_wait.wait_for_job`)
+        * ``auto_poll=True`` (default, unchanged behavior) — waits for the job
+          to complete (:func:`~code_analysis_client.queue_wait.wait_for_job`,
+          server-side long-poll when available, else polling)
           and returns the unwrapped inner result
           (:func:`~code_analysis_client.queue_wait.unwrap_job_result`), raising
           on failure.
@@ -218,7 +235,9 @@ class CodeAnalysisAsyncClient:
 
         job_id = extract_job_id(resp)
         if not auto_poll:
-            return QueuedJob(job_id=job_id, envelope=resp, rpc=self._rpc)
+            return QueuedJob(
+                job_id=job_id, envelope=resp, rpc=self._rpc, long_poll=self._long_poll
+            )
 
         status = await wait_for_job(
             self._rpc,
@@ -226,6 +245,7 @@ class CodeAnalysisAsyncClient:
             timeout=timeout,
             poll_interval=poll_interval,
             status_hook=status_hook,
+            long_poll=self._long_poll,
         )
         return await unwrap_job_result(status, rpc=self._rpc)
 
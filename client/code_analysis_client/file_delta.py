@@ -0,0 +1,113 @@
+"""
+Client-side encoder for rsync-style delta uploads.
+
+Turns new file content plus the block signatures returned by
+``project_file_transfer_signatures`` into an ``rsync-delta/1`` document that
+``project_file_transfer_upload_save`` (``upload_format="delta"``) rebuilds on
+the server. Weak checksums are Adler-32 (``zlib.adler32``) rolled one byte at
+a time; candidate blocks are confirmed with the BLAKE2b-128 strong hash. After
+a match the scan jumps a whole block, so unchanged regions cost one C-level
+checksum per block and only changed regions are rolled byte by byte.
+
+No dependency on the code_analysis server package.
+
+Author: Vasiliy Zdanovskiy
+email: vasilyvz@gmail.com
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import zlib
+from typing import Any, Dict, List
+
+DELTA_FORMAT = "rsync-delta/1"
+
+_ADLER_MOD = 65521
+
+
+def _strong_hash(block: bytes) -> str:
+    return hashlib.blake2b(block, digest_size=16).hexdigest()
+
+
+def _roll(weak: int, out_byte: int, in_byte: int, block_size: int) -> int:
+    """Slide an Adler-32 window of ``block_size`` bytes forward by one byte."""
+    a = ((weak & 0xFFFF) - out_byte + in_byte) % _ADLER_MOD
+    b = ((weak >> 16) - block_size * out_byte + a - 1) % _ADLER_MOD
+    return (b << 16) | a
+
+
+def compute_delta(content: bytes, signatures: Dict[str, Any]) -> Dict[str, Any]:
+    """Build an ``rsync-delta/1`` document for ``content`` against ``signatures``.
+
+    ``signatures`` is the ``project_file_transfer_signatures`` payload
+    (``block_size``, ``size``, ``sha256`` and ``blocks`` as ``[weak, strong]``).
+    """
+    block_size = int(signatures["block_size"])
+    blocks = signatures.get("blocks") or []
+    base_size = int(signatures.get("size") or 0)
+    index: Dict[int, Dict[str, int]] = {}
+    for i, (weak, strong) in enumerate(blocks):
+        index.setdefault(int(weak), {}).setdefault(str(strong), i)
+    # A short trailing base block can only be matched at the very end.
+    last_len = base_size - (len(blocks) - 1) * block_size if blocks else 0
+    full_blocks = len(blocks) if last_len == block_size else len(blocks) - 1
+
+    ops: List[Dict[str, Any]] = []
+
+    def emit_literal(start: int, end: int) -> None:
+        if end > start:
+            ops.append({"data": base64.b64encode(content[start:end]).decode("ascii")})
+
+    def emit_copy(block: int) -> None:
+        last = ops[-1] if ops else None
+        if (
+            last is not None
+            and "copy" in last
+            and last["copy"] + last["count"] == block
+        ):
+            last["count"] += 1
+        else:
+            ops.append({"copy": block, "count": 1})
+
+    view = memoryview(content)
+    size = len(content)
+    literal_start = 0
+    pos = 0
+    weak = -1
+    while pos + block_size <= size:
+        if weak < 0:
+            weak = zlib.adler32(view[pos : pos + block_size])
+        candidates = index.get(weak)
+        if candidates:
+            match = candidates.get(_strong_hash(view[pos : pos + block_size]))
+            if match is not None and match < full_blocks:
+                emit_literal(literal_start, pos)
+                emit_copy(match)
+                pos += block_size
+                literal_start = pos
+                weak = -1
+                continue
+        if pos + block_size < size:
+            weak = _roll(weak, content[pos], content[pos + block_size], block_size)
+        pos += 1
+
+    tail_start = size - last_len
+    if (
+        0 < last_len < block_size
+        and tail_start >= literal_start
+        and [zlib.adler32(view[tail_start:]), _strong_hash(view[tail_start:])]
+        == [int(blocks[-1][0]), str(blocks[-1][1])]
+    ):
+        emit_literal(literal_start, tail_start)
+        emit_copy(len(blocks) - 1)
+    else:
+        emit_literal(literal_start, size)
+    return {
+        "format": DELTA_FORMAT,
+        "block_size": block_size,
+        "base_sha256": signatures["sha256"],
+        "sha256": hashlib.sha256(content).hexdigest(),
+        "ops": ops,
+    }
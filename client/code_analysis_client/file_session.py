@@ -18,6 +18,9 @@ Transfer mapping (client façade → server command):
 
   Both methods upload bytes through the adapter, then call the same save command
   with the completed ``transfer_id``.
+* **Delta upload** — ``upload_delta`` → ``project_file_transfer_signatures``, then
+  only changed blocks (see :mod:`code_analysis_client.file_delta`) through the
+  same upload + ``project_file_transfer_upload_save`` (``upload_format=delta``).
 
 Author: Vasiliy Zdanovskiy
 email: vasilyvz@gmail.com
@@ -25,12 +28,14 @@ email: vasilyvz@gmail.com
 
 from __future__ import annotations
 
+import json
 import tempfile
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
 from code_analysis_client.exceptions import ClientValidationError
-from code_analysis_client.responses import unwrap_command_result
+from code_analysis_client.file_delta import compute_delta
+from code_analysis_client.responses import command_error_code, unwrap_command_result
 
 if TYPE_CHECKING:
     from code_analysis_client.client import CodeAnalysisAsyncClient
@@ -547,6 +552,7 @@ class FileSessionClient:
         validate_syntax_only: bool = False,
         tree_id: Optional[str] = None,
         lock_mode: Optional[str] = None,
+        upload_format: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Persist a completed adapter upload (``project_file_transfer_upload_save``)."""
         _validate_upload_selector(
@@ -580,6 +586,8 @@ class FileSessionClient:
             params["tree_id"] = tree_id
         if lock_mode is not None:
             params["lock_mode"] = lock_mode
+        if upload_format is not None:
+            params["upload_format"] = upload_format
         return _unwrap(
             await self._client.call_validated(
                 "project_file_transfer_upload_save",
@@ -701,3 +709,110 @@ class FileSessionClient:
         if not dry_run:
             _extract_file_id(saved)
         return saved
+
+    async def file_signatures(
+        self,
+        file_id: str,
+        *,
+        project_id: Optional[str] = None,
+        block_size: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """Block signatures of an indexed file (``project_file_transfer_signatures``)."""
+        params: Dict[str, Any] = {
+            "file_id": _require_non_empty(file_id, field="file_id"),
+        }
+        if project_id is not None:
+            params["project_id"] = project_id
+        if block_size is not None:
+            params["block_size"] = block_size
+        return _unwrap(
+            await self._client.call_validated(
+                "project_file_transfer_signatures",
+                params,
+            )
+        )
+
+    async def upload_delta(
+        self,
+        session_id: str,
+        payload: bytes,
+        file_id: str,
+        *,
+        project_id: Optional[str] = None,
+        filename: Optional[str] = None,
+        compression: str = "identity",
+        unlock: bool = True,
+        backup: bool = True,
+        dry_run: bool = False,
+        diff: bool = False,
+        diff_context_lines: Optional[int] = None,
+        commit_message: Optional[str] = None,
+        validate_syntax_only: bool = False,
+        tree_id: Optional[str] = None,
+        lock_mode: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Overwrite an indexed file sending only the blocks that changed.
+
+        Same contract as :meth:`upload`. Fetches the file's block signatures,
+        uploads an ``rsync-delta/1`` document instead of ``payload`` and saves
+        with ``upload_format=delta``. Falls back to :meth:`upload` when the
+        delta is not smaller than ``payload`` or the server reports
+        ``DELTA_BASE_MISMATCH`` (file changed since the signatures were taken).
+        """
+        fid = _require_non_empty(file_id, field="file_id")
+        options: Dict[str, Any] = {
+            "project_id": project_id,
+            "backup": backup,
+            "dry_run": dry_run,
+            "diff": diff,
+            "diff_context_lines": diff_context_lines,
+            "commit_message": commit_message,
+            "validate_syntax_only": validate_syntax_only,
+            "tree_id": tree_id,
+            "lock_mode": lock_mode,
+        }
+
+        async def full_upload() -> Dict[str, Any]:
+            return await self.upload(
+                session_id,
+                payload,
+                fid,
+                filename=filename,
+                compression=compression,
+                unlock=unlock,
+                **options,
+            )
+
+        signatures = await self.file_signatures(fid, project_id=project_id)
+        delta = json.dumps(
+            compute_delta(payload, signatures), separators=(",", ":")
+        ).encode("ascii")
+        if len(delta) >= len(payload):
+            return await full_upload()
+        receipt = await self.upload_bytes(
+            delta,
+            filename=filename or "payload.delta.json",
+            compression=compression,
+        )
+        if not getattr(receipt, "completed", False):
+            raise ClientValidationError(
+                "upload did not complete",
+                field="transfer_id",
+                details={"receipt": repr(receipt)},
+            )
+        try:
+            saved = await self._commit_upload(
+                session_id,
+                str(receipt.transfer_id),
+                file_id=fid,
+                unlock_after_write=unlock,
+                upload_format="delta",
+                **options,
+            )
+        except ClientValidationError as exc:
+            if command_error_code(exc.details) != "DELTA_BASE_MISMATCH":
+                raise
+            return await full_upload()
+        if not dry_run:
+            _extract_file_id(saved)
+        return saved
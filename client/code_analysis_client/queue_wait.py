@@ -11,6 +11,7 @@ from __future__ import annotations
 import asyncio
 import inspect
 import time
+import weakref
 from dataclasses import dataclass, field
 from typing import Any, Awaitable, Callable, Dict, Optional, Union
 
@@ -120,6 +121,68 @@ async def _call_status_hook(
         await maybe
 
 
+# Server-side long-poll (``queue_wait_job``): one request blocks until the job
+# is terminal or LONG_POLL_SECONDS pass, instead of one status poll per
+# ``poll_interval``. Servers without the command get plain polling.
+LONG_POLL_COMMAND = "queue_wait_job"
+LONG_POLL_SECONDS = 25.0
+_METHOD_NOT_FOUND = -32601
+
+# Transports whose server answered LONG_POLL_COMMAND with "method not found".
+_long_poll_unavailable: "weakref.WeakSet[Any]" = weakref.WeakSet()
+
+
+def _status_data(resp: Any) -> Dict[str, Any]:
+    """Status dict of a ``queue_get_job_status`` / ``queue_wait_job`` response."""
+    data = resp.get("data") if isinstance(resp, dict) else None
+    if not isinstance(data, dict):
+        data = resp if isinstance(resp, dict) else {}
+    return data
+
+
+def _is_method_not_found(error: Any) -> bool:
+    """True when ``error`` (exception or error envelope) is JSON-RPC -32601."""
+    if isinstance(error, BaseException):
+        details = getattr(error, "details", None)
+    elif isinstance(error, dict) and error.get("success") is False:
+        details = error.get("error")
+    else:
+        return False
+    return isinstance(details, dict) and details.get("code") == _METHOD_NOT_FOUND
+
+
+def _long_poll_available(rpc: Any) -> bool:
+    try:
+        return rpc not in _long_poll_unavailable
+    except TypeError:
+        return False
+
+
+def _mark_long_poll_unavailable(rpc: Any) -> None:
+    try:
+        _long_poll_unavailable.add(rpc)
+    except TypeError:
+        pass
+
+
+async def _long_poll_once(
+    rpc: Any, job_id: str, wait_seconds: float
+) -> Optional[Dict[str, Any]]:
+    """One ``queue_wait_job`` call; ``None`` when the server lacks the command."""
+    try:
+        resp = await rpc.execute_command(
+            LONG_POLL_COMMAND, {"job_id": job_id, "timeout": wait_seconds}
+        )
+    except Exception as exc:
+        if not _is_method_not_found(exc):
+            raise
+        resp = exc
+    if _is_method_not_found(resp):
+        _mark_long_poll_unavailable(rpc)
+        return None
+    return _status_data(resp)
+
+
 async def wait_for_job(
     rpc: Any,
     job_id: str,
@@ -127,21 +190,38 @@ async def wait_for_job(
     timeout: Optional[float] = None,
     poll_interval: float = 1.0,
     status_hook: Optional[StatusHook] = None,
+    long_poll: bool = True,
 ) -> Dict[str, Any]:
-    """Poll ``queue_get_job_status`` via the raw adapter ``rpc`` until the job is terminal.
+    """Wait via the raw adapter ``rpc`` until the job is terminal.
+
+    With ``long_poll`` (default) the server's ``queue_wait_job`` is asked to
+    block until the job finishes (at most :data:`LONG_POLL_SECONDS` per
+    request); a server that does not know the command is remembered and the
+    wait falls back to polling ``queue_get_job_status`` every
+    ``poll_interval`` seconds. A long-poll reply without a status (any other
+    error) is retried after ``poll_interval`` as well. ``status_hook`` sees
+    every status returned.
 
     Uses ``rpc.execute_command`` directly (never the queue-aware core) to avoid
-    recursing back into job polling. ``timeout=None`` (default) polls until the
+    recursing back into job polling. ``timeout=None`` (default) waits until the
     job reaches a terminal state, per the user's requirement. If ``timeout`` is
     set and exceeded, raises :class:`JobTimeoutError` — the job keeps running
     server-side.
     """
     start = time.monotonic() if timeout is not None else None
     while True:
-        resp = await rpc.execute_command("queue_get_job_status", {"job_id": job_id})
-        data = resp.get("data") if isinstance(resp, dict) else None
-        if not isinstance(data, dict):
-            data = resp if isinstance(resp, dict) else {}
+        data: Optional[Dict[str, Any]] = None
+        if long_poll and _long_poll_available(rpc):
+            wait_seconds = LONG_POLL_SECONDS
+            if timeout is not None and start is not None:
+                remaining = timeout - (time.monotonic() - start)
+                wait_seconds = max(0.0, min(wait_seconds, remaining))
+            data = await _long_poll_once(rpc, job_id, wait_seconds)
+        polled = data is None
+        if polled:
+            data = _status_data(
+                await rpc.execute_command("queue_get_job_status", {"job_id": job_id})
+            )
 
         await _call_status_hook(status_hook, data)
 
@@ -153,7 +233,10 @@ async def wait_for_job(
             if (time.monotonic() - start) >= timeout:
                 raise JobTimeoutError(job_id, timeout)
 
-        await asyncio.sleep(poll_interval)
+        # A long-poll reply without a status (error envelope) returned at once:
+        # pace the retry like a plain poll instead of spinning on the server.
+        if polled or not status:
+            await asyncio.sleep(poll_interval)
 
 
 _JOB_FAILED_REFETCH_ATTEMPTS = 4
@@ -193,9 +276,7 @@ async def _refetch_inner_command_error(rpc: Any, job_id: str) -> Any:
     for _ in range(_JOB_FAILED_REFETCH_ATTEMPTS):
         await asyncio.sleep(_JOB_FAILED_REFETCH_SLEEP_SECONDS)
         resp = await rpc.execute_command("queue_get_job_status", {"job_id": job_id})
-        data = resp.get("data") if isinstance(resp, dict) else None
-        if not isinstance(data, dict):
-            data = resp if isinstance(resp, dict) else {}
+        data = _status_data(resp)
         inner_error = _extract_inner_command_error(data)
         if inner_error is not None:
             return inner_error
@@ -272,6 +353,7 @@ class QueuedJob:
     job_id: str
     envelope: Dict[str, Any]
     rpc: Any = field(repr=False)
+    long_poll: bool = True
 
     async def wait(
         self,
@@ -294,6 +376,7 @@ class QueuedJob:
             timeout=timeout,
             poll_interval=poll_interval,
             status_hook=status_hook,
+            long_poll=self.long_poll,
         )
         return await unwrap_job_result(status, rpc=self.rpc)
 
@@ -302,7 +385,4 @@ class QueuedJob:
         resp = await self.rpc.execute_command(
             "queue_get_job_status", {"job_id": self.job_id}
         )
-        data = resp.get("data") if isinstance(resp, dict) else None
-        if not isinstance(data, dict):
-            data = resp if isinstance(resp, dict) else {}
-        return data
+        return _status_data(resp)
@@ -152,6 +152,7 @@ FILE_SESSION_COMMANDS: FrozenSet[str] = frozenset(
 TRANSFER_AND_LOCK_COMMANDS: FrozenSet[str] = frozenset(
     {
         "project_file_transfer_download_begin",
+        "project_file_transfer_signatures",
         "project_file_transfer_upload_save",
         "project_file_advisory_lock_batch",
     }
@@ -163,8 +164,18 @@ UNIVERSAL_FILE_COMMANDS: FrozenSet[str] = frozenset(
     }
 )
 
+# ``CodeAnalysisAsyncClient.batch`` (:class:`~code_analysis_client.batch.ReadOnlyBatch`).
+BATCH_COMMANDS: FrozenSet[str] = frozenset(
+    {
+        "read_only_batch",
+    }
+)
+
 CLIENT_FACADE_COMMANDS: FrozenSet[str] = (
-    FILE_SESSION_COMMANDS | TRANSFER_AND_LOCK_COMMANDS | UNIVERSAL_FILE_COMMANDS
+    FILE_SESSION_COMMANDS
+    | TRANSFER_AND_LOCK_COMMANDS
+    | UNIVERSAL_FILE_COMMANDS
+    | BATCH_COMMANDS
 )
 
 # ``FileSessionClient`` method names for each ``FILE_SESSION_COMMANDS`` entry.
@@ -188,7 +199,8 @@ FILE_SESSION_FACADE_METHODS: Dict[str, str] = {
 # Transfer / advisory-lock commands may map to more than one façade method.
 TRANSFER_FACADE_METHODS: Dict[str, Tuple[str, ...]] = {
     "project_file_transfer_download_begin": ("download",),
-    "project_file_transfer_upload_save": ("upload", "upload_new"),
+    "project_file_transfer_signatures": ("file_signatures", "upload_delta"),
+    "project_file_transfer_upload_save": ("upload", "upload_new", "upload_delta"),
     "project_file_advisory_lock_batch": (
         "lock_files_advisory",
         "unlock_files_advisory",
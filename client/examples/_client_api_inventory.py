@@ -46,6 +46,7 @@ REQUIRED_CLIENT_API: FrozenSet[str] = frozenset(
         "CodeAnalysisAsyncClient.commands",
         "CodeAnalysisAsyncClient.file_sessions",
         "CodeAnalysisAsyncClient.universal_files",
+        "CodeAnalysisAsyncClient.batch",
         "CodeAnalysisAsyncClient.clear_command_schema_cache",
         "CodeAnalysisAsyncClient.get_command_schema",
         "CodeAnalysisAsyncClient.call_validated",
@@ -81,8 +82,14 @@ REQUIRED_CLIENT_API: FrozenSet[str] = frozenset(
         "FileSessionClient.upload_bytes",
         "FileSessionClient.upload",
         "FileSessionClient.upload_new",
+        "FileSessionClient.file_signatures",
+        "FileSessionClient.upload_delta",
         # UniversalFileClient (read-only preview; editing lives in ai-editor client)
         "UniversalFileClient.preview",
+        # ReadOnlyBatch (read_only_batch: several read-only commands, one round-trip)
+        "ReadOnlyBatch.add",
+        "ReadOnlyBatch.to_params",
+        "ReadOnlyBatch.run",
     }
 )
 
@@ -95,6 +95,8 @@ CLIENT_API_COVERAGE = frozenset(
         "FileSessionClient.upload_bytes",
         "FileSessionClient.upload",
         "FileSessionClient.upload_new",
+        "FileSessionClient.file_signatures",
+        "FileSessionClient.upload_delta",
         "exceptions.SessionNotFoundError",
         "config.load_server_config",
     }
@@ -666,6 +668,29 @@ async def run_all(*, skip_transfer: bool) -> int:
             finally:
                 await fs.delete_session(sid, force=True)
 
+        async def pos_upload_delta_dry_run() -> None:
+            """Return pos upload delta dry run."""
+            sid = await fs.create_session("ex_file_sessions upload_delta")
+            try:
+                with tempfile.TemporaryDirectory() as tmp:
+                    dest = Path(tmp) / "dl_delta.bin"
+                    await fs.download(sid, dest, fx.file_id, lock=False)
+                    payload = dest.read_bytes()
+                signatures = await fs.file_signatures(fx.file_id)
+                if int(signatures.get("size") or 0) != len(payload):
+                    raise AssertionError(f"signature size mismatch: {signatures!r}")
+                out = await fs.upload_delta(
+                    sid,
+                    payload + b"\n",
+                    fx.file_id,
+                    filename=Path(fx.file_path).name,
+                    dry_run=True,
+                )
+                if out.get("dry_run") is not True:
+                    raise AssertionError(f"upload_delta dry_run returned {out!r}")
+            finally:
+                await fs.delete_session(sid, force=True)
+
         async def pos_download_to_path_explicit() -> None:
             """Return pos download to path explicit."""
             sid = await fs.create_session("ex_file_sessions download_to_path")
@@ -821,6 +846,7 @@ async def run_all(*, skip_transfer: bool) -> int:
                             pos_upload_unlock_false,
                         ),
                         ("dry_run upload", pos_transfer_dry_run_upload),
+                        ("upload_delta dry_run", pos_upload_delta_dry_run),
                         (
                             "download_to_path (explicit two-step)",
                             pos_download_to_path_explicit,
@@ -3,7 +3,8 @@ r"""
 ================================================================================
 NAME
 ================================================================================
-    ex_universal_files — live-server demo of ``UniversalFileClient`` (preview).
+    ex_universal_files — live-server demo of ``UniversalFileClient`` (preview)
+    and ``ReadOnlyBatch`` (several read-only commands in one round-trip).
 
 ================================================================================
 SYNOPSIS
@@ -24,6 +25,10 @@ Exercises the only public method on
 sessions) is not served by this project's code-analysis server; that workflow
 lives in the ai-editor client instead.
 
+Then sends the same preview plus a ``list_code_entities`` call as one
+``read_only_batch`` (``client.batch(project_id, snapshot=True)``) and checks
+that one result envelope comes back per invocation.
+
 Author: Vasiliy Zdanovskiy <vasilyvz@gmail.com>
 """
 
@@ -54,9 +59,13 @@ CLIENT_API_COVERAGE = frozenset(
     {
         "CodeAnalysisAsyncClient.from_server_config_path",
         "CodeAnalysisAsyncClient.universal_files",
+        "CodeAnalysisAsyncClient.batch",
         "CodeAnalysisAsyncClient.__aenter__",
         "CodeAnalysisAsyncClient.__aexit__",
         "UniversalFileClient.preview",
+        "ReadOnlyBatch.add",
+        "ReadOnlyBatch.to_params",
+        "ReadOnlyBatch.run",
     }
 )
 
@@ -114,7 +123,16 @@ async def run_all() -> int:
             raise AssertionError(f"preview unexpected: {prev!r}")
         print("  preview OK")
 
-    print("UniversalFileClient.preview exercised.")
+        batch = client.batch(project_id, snapshot=True)
+        batch.add("universal_file_preview", file_path=file_path)
+        batch.add("list_code_entities", limit=5)
+        print(f"  batch params: {sorted(batch.to_params())}")
+        results = await batch.run()
+        if len(results) != 2:
+            raise AssertionError(f"batch unexpected: {results!r}")
+        print(f"  batch OK ({[r.get('success') for r in results]})")
+
+    print("UniversalFileClient.preview and ReadOnlyBatch exercised.")
     return 0
 
 
@@ -0,0 +1,36 @@
+"""
+Reproducible throughput benchmarks.
+
+A deterministic synthetic repository (:mod:`.synthetic_repo`) and local
+chunker/embedder stand-ins (:mod:`.stand_ins`) make runs independent of real
+projects and services; :mod:`.cases` times watcher scan, ``analyze_file``,
+batch DB writes, fulltext/semantic/grep search, CSTQuery, tree load/save and
+preview; :mod:`.baseline` compares a run with a stored baseline so throughput
+regressions fail before a release. Run ``python -m code_analysis.benchmarks``.
+
+Author: Vasiliy Zdanovskiy
+email: vasilyvz@gmail.com
+"""
+
+from .baseline import ComparisonReport, compare_results, load_results
+from .cases import CASES, BenchmarkContext, select_cases
+from .runner import BenchmarkCase, BenchmarkSkipped, run_benchmarks
+from .stand_ins import LocalChunker, LocalEmbedder
+from .synthetic_repo import SyntheticRepo, SyntheticRepoSpec, generate_synthetic_repo
+
+__all__ = [
+    "BenchmarkCase",
+    "BenchmarkContext",
+    "BenchmarkSkipped",
+    "CASES",
+    "ComparisonReport",
+    "LocalChunker",
+    "LocalEmbedder",
+    "SyntheticRepo",
+    "SyntheticRepoSpec",
+    "compare_results",
+    "generate_synthetic_repo",
+    "load_results",
+    "run_benchmarks",
+    "select_cases",
+]
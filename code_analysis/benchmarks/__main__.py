@@ -0,0 +1,12 @@
+"""
+Run the benchmark CLI (``python -m code_analysis.benchmarks``).
+
+Author: Vasiliy Zdanovskiy
+email: vasilyvz@gmail.com
+"""
+
+import sys
+
+from .cli import main
+
+sys.exit(main())
@@ -0,0 +1,136 @@
+"""
+Compare benchmark results against a stored baseline.
+
+A case regresses when its median round time grew by more than
+``max_regression`` (a fraction: ``0.2`` allows 20% slower) relative to the
+baseline. Only cases that ran successfully in both documents are compared;
+cases missing on either side are listed but never fail the comparison, so
+adding or retiring a benchmark does not require a new baseline first.
+
+Author: Vasiliy Zdanovskiy
+email: vasilyvz@gmail.com
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List
+
+from .runner import STATUS_OK
+
+DEFAULT_MAX_REGRESSION = 0.2
+
+
+@dataclass(frozen=True)
+class CaseComparison:
+    """Median round time of one case in the baseline and the current run."""
+
+    name: str
+    baseline_sec: float
+    current_sec: float
+
+    @property
+    def change(self) -> float:
+        """Relative change (``0.25`` = 25% slower, negative = faster)."""
+        if self.baseline_sec <= 0:
+            return 0.0
+        return self.current_sec / self.baseline_sec - 1.0
+
+
+@dataclass
+class ComparisonReport:
+    """Outcome of comparing a results document with a baseline."""
+
+    max_regression: float
+    compared: List[CaseComparison] = field(default_factory=list)
+    regressions: List[CaseComparison] = field(default_factory=list)
+    missing_in_current: List[str] = field(default_factory=list)
+    missing_in_baseline: List[str] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        """True when no case regressed beyond the threshold."""
+        return not self.regressions
+
+    def as_dict(self) -> Dict[str, Any]:
+        """JSON-serialisable form (embedded in the results document)."""
+
+        def row(c: CaseComparison) -> Dict[str, Any]:
+            return {
+                "name": c.name,
+                "baseline_sec": c.baseline_sec,
+                "current_sec": c.current_sec,
+                "change": round(c.change, 4),
+            }
+
+        return {
+            "ok": self.ok,
+            "max_regression": self.max_regression,
+            "compared": [row(c) for c in self.compared],
+            "regressions": [row(c) for c in self.regressions],
+            "missing_in_current": self.missing_in_current,
+            "missing_in_baseline": self.missing_in_baseline,
+        }
+
+
+def _ok_medians(doc: Dict[str, Any]) -> Dict[str, float]:
+    return {
+        name: float(result["median_sec"])
+        for name, result in (doc.get("results") or {}).items()
+        if result.get("status") == STATUS_OK and result.get("median_sec") is not None
+    }
+
+
+def compare_results(
+    current: Dict[str, Any],
+    baseline: Dict[str, Any],
+    max_regression: float = DEFAULT_MAX_REGRESSION,
+) -> ComparisonReport:
+    """Compare two results documents case by case.
+
+    Args:
+        current: Results of this run (:func:`.runner.run_benchmarks`).
+        baseline: Stored results to compare against.
+        max_regression: Allowed relative slowdown of the median.
+
+    Returns:
+        Per-case comparison with the regressions beyond the threshold.
+    """
+    cur = _ok_medians(current)
+    base = _ok_medians(baseline)
+    report = ComparisonReport(max_regression=max_regression)
+    report.missing_in_current = sorted(set(base) - set(cur))
+    report.missing_in_baseline = sorted(set(cur) - set(base))
+    for name in sorted(set(cur) & set(base)):
+        comparison = CaseComparison(name, base[name], cur[name])
+        report.compared.append(comparison)
+        if comparison.change > max_regression:
+            report.regressions.append(comparison)
+    return report
+
+
+def load_results(path: Path) -> Dict[str, Any]:
+    """Read a results (or baseline) JSON document."""
+    data = json.loads(Path(path).read_text(encoding="utf-8"))
+    if not isinstance(data, dict):
+        raise ValueError(f"{path}: expected a JSON object")
+    return data
+
+
+def format_report(report: ComparisonReport) -> str:
+    """Human-readable comparison table."""
+    lines = [f"{'case':32s} {'baseline':>10s} {'current':>10s} {'change':>8s}"]
+    regressed = {c.name for c in report.regressions}
+    for c in report.compared:
+        flag = "  REGRESSION" if c.name in regressed else ""
+        lines.append(
+            f"{c.name:32s} {c.baseline_sec:10.4f} {c.current_sec:10.4f} "
+            f"{c.change:+8.1%}{flag}"
+        )
+    for name in report.missing_in_current:
+        lines.append(f"{name:32s} (not run / failed in current results)")
+    for name in report.missing_in_baseline:
+        lines.append(f"{name:32s} (new; not in baseline)")
+    return "\n".join(lines)
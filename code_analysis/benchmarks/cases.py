@@ -0,0 +1,504 @@
+"""
+Benchmark cases for indexing, vectorization, search and tree operations.
+
+Every case runs against the synthetic repository in :class:`BenchmarkContext`.
+Offline cases need nothing but the package: watcher scan, CST tree
+load/save, preview, CSTQuery, grep and local vectorization / FAISS semantic
+search with :mod:`.stand_ins`. Database cases (``needs_database``) run
+``analyze_file``, batch writes, docstring chunk persistence and fulltext
+search against the PostgreSQL database of a server config; the synthetic
+project is registered under its own project id and removed again by
+:meth:`BenchmarkContext.close`.
+
+Author: Vasiliy Zdanovskiy
+email: vasilyvz@gmail.com
+"""
+
+from __future__ import annotations
+
+import ast
+import asyncio
+import hashlib
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+from .runner import BenchmarkCase, BenchmarkSkipped
+from .stand_ins import LocalChunker
+from .synthetic_repo import SEARCH_NEEDLE, SyntheticRepo
+
+# Per-round sample sizes for the slower per-file cases.
+PREVIEW_FILES = 20
+SEMANTIC_QUERIES = 50
+FULLTEXT_QUERIES = 20
+
+
+@dataclass
+class BenchmarkContext:
+    """Inputs shared by all cases of one run."""
+
+    repo: SyntheticRepo
+    work_dir: Path
+    database: Optional[Any] = None
+    chunker: LocalChunker = field(default_factory=LocalChunker)
+    _file_ids: Optional[Dict[Path, str]] = None
+    _project_registered: bool = False
+
+    def register_project(self) -> None:
+        """Insert the synthetic project's ``projects`` row (once)."""
+        if self._project_registered:
+            return
+        from ..core.database_driver_pkg.domain.projects import insert_project_row
+
+        insert_project_row(
+            self.database,
+            self.repo.project_id,
+            str(self.repo.root.resolve()),
+            self.repo.root.name,
+            comment="benchmark",
+        )
+        self._project_registered = True
+
+    def file_ids(self) -> Dict[Path, str]:
+        """``files.id`` per module, analyzing the repository on first use."""
+        if self._file_ids is not None:
+            return self._file_ids
+        from ..commands.update_indexes_analyzer import analyze_file
+        from ..core.database_driver_pkg.domain.files import get_project_file_rows
+
+        self.register_project()
+        for path in self.repo.files:
+            analyze_file(
+                self.database, path, self.repo.project_id, self.repo.root, force=True
+            )
+        ids: Dict[Path, str] = {}
+        for row in get_project_file_rows(self.database, self.repo.project_id):
+            path = Path(str(row["path"]))
+            if not path.is_absolute():
+                path = self.repo.root / path
+            ids[path.resolve()] = str(row["id"])
+        self._file_ids = ids
+        return ids
+
+    def close(self) -> None:
+        """Remove the synthetic project's rows from the database."""
+        if self.database is None or not self._project_registered:
+            return
+        from ..commands.clear_project_data_impl import _clear_project_data_impl
+
+        asyncio.run(_clear_project_data_impl(self.database, self.repo.project_id))
+        self._project_registered = False
+        self._file_ids = None
+
+
+def _python_docstrings(source: str) -> List[str]:
+    """Module, class and function docstrings of ``source``."""
+    tree = ast.parse(source)
+    docs = [ast.get_docstring(tree)]
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)):
+            docs.append(ast.get_docstring(node))
+    return [d for d in docs if d]
+
+
+def _new_faiss(ctx: BenchmarkContext, name: str) -> Any:
+    try:
+        from ..core.faiss_manager import FaissIndexManager
+
+        index_path = ctx.work_dir / f"{name}.faiss"
+        index_path.unlink(missing_ok=True)
+        return FaissIndexManager(
+            str(index_path), ctx.chunker.embedder.vector_dim, index_type="Flat"
+        )
+    except ImportError as exc:
+        raise BenchmarkSkipped(str(exc)) from exc
+
+
+# --- offline cases ---------------------------------------------------------
+
+
+def _setup_watcher_scan(ctx: BenchmarkContext) -> Callable[[], int]:
+    from ..core.file_watcher_pkg.scanner import iter_watch_dir_project_scans
+
+    watch_dir = ctx.repo.root.parent
+
+    def run() -> int:
+        return sum(
+            len(files_map)
+            for _pid, _root, files_map in iter_watch_dir_project_scans(
+                watch_dir, [watch_dir]
+            )
+        )
+
+    return run
+
+
+def _setup_tree_load(ctx: BenchmarkContext) -> Callable[[], int]:
+    from ..core.cst_tree.tree_builder import load_file_to_tree, remove_tree
+
+    def run() -> int:
+        for path in ctx.repo.files:
+            tree = load_file_to_tree(str(path), write_to_disk=False)
+            remove_tree(tree.tree_id)
+        return len(ctx.repo.files)
+
+    return run
+
+
+def _setup_tree_save(ctx: BenchmarkContext) -> Callable[[], int]:
+    from ..core.cst_tree.tree_builder import create_tree_from_code
+    from ..core.cst_tree.tree_sidecar import write_sidecar_atomic
+
+    out_dir = ctx.work_dir / "tree_save"
+    out_dir.mkdir(parents=True, exist_ok=True)
+    trees = []
+    for i, path in enumerate(ctx.repo.files):
+        target = out_dir / f"mod_{i:04d}.py"
+        trees.append(
+            (
+                target,
+                create_tree_from_code(
+                    str(target),
+                    path.read_text(encoding="utf-8"),
+                    register_in_memory=False,
+                ),
+            )
+        )
+
+    def run() -> int:
+        for target, tree in trees:
+            target.write_text(tree.module.code, encoding="utf-8")
+            write_sidecar_atomic(target, tree)
+        return len(trees)
+
+    return run
+
+
+def _setup_preview(ctx: BenchmarkContext) -> Callable[[], int]:
+    from ..commands.universal_file_preview.budget import PreviewBudget
+    from ..commands.universal_file_preview.marked_tree_navigation import (
+        navigate_marked_tree,
+    )
+
+    budget = PreviewBudget(
+        preview_lines=20, value_preview_len=120, full_text_max_lines=200
+    )
+    files = ctx.repo.files[:PREVIEW_FILES]
+
+    def run() -> int:
+        for path in files:
+            navigate_marked_tree(
+                {
+                    "project_root": ctx.repo.root,
+                    "rel_file_path": str(path.relative_to(ctx.repo.root)),
+                    "file_path": str(path),
+                    "node_ref": None,
+                    "selector": None,
+                    "session_id": None,
+                },
+                budget,
+            )
+        return len(files)
+
+    return run
+
+
+def _setup_cst_query(ctx: BenchmarkContext) -> Callable[[], int]:
+    from ..cst_query.project_query import query_files
+    from ..cst_query.query_index import clear_query_index_cache
+
+    paths = [str(p) for p in ctx.repo.files]
+
+    def run() -> int:
+        # Cold indexes: the cache would otherwise turn later rounds into lookups.
+        clear_query_index_cache()
+        for _ in query_files(paths, 'class method[name^="build"]'):
+            pass
+        return len(paths)
+
+    return run
+
+
+def _setup_grep(ctx: BenchmarkContext) -> Callable[[], int]:
+    from ..commands.fs_grep_budget import FsGrepBudgetState, limits_for_queue
+    from ..commands.fs_grep_command import _phase1_text_scan_targets
+    from ..commands.fs_grep_sources import GrepScanTarget
+
+    root = ctx.repo.root
+    targets = [
+        GrepScanTarget(relative_path=str(p.relative_to(root)), source="disk")
+        for p in ctx.repo.files
+    ]
+
+    def run() -> int:
+        budget = FsGrepBudgetState(limits=limits_for_queue(max_matches=10_000))
+        _phase1_text_scan_targets(
+            project_root=root,
+            scan_targets=targets,
+            needle=SEARCH_NEEDLE,
+            literal=True,
+            case_sensitive=True,
+            regex=None,
+            max_matches=10_000,
+            max_file_bytes=0,
+            line_preview_len=200,
+            budget=budget,
+        )
+        return len(targets)
+
+    return run
+
+
+def _setup_vectorize(ctx: BenchmarkContext) -> Callable[[], int]:
+    sources = [p.read_text(encoding="utf-8") for p in ctx.repo.files]
+
+    async def vectorize(index: Any) -> int:
+        vector_id = 0
+        for source in sources:
+            for chunks in await ctx.chunker.get_chunks_batch(
+                _python_docstrings(source)
+            ):
+                for chunk in chunks:
+                    index.add_vector(
+                        np.asarray(chunk.embedding, dtype="float32"), vector_id
+                    )
+                    vector_id += 1
+        return len(sources)
+
+    def run() -> int:
+        return asyncio.run(vectorize(_new_faiss(ctx, "vectorize")))
+
+    return run
+
+
+def _setup_semantic_search(ctx: BenchmarkContext) -> Callable[[], int]:
+    index = _new_faiss(ctx, "semantic")
+    embed = ctx.chunker.embedder.embed
+    vector_id = 0
+    for path in ctx.repo.files:
+        for doc in _python_docstrings(path.read_text(encoding="utf-8")):
+            for chunk in ctx.chunker.chunk_text(doc):
+                index.add_vector(
+                    np.asarray(chunk.embedding, dtype="float32"), vector_id
+                )
+                vector_id += 1
+    if vector_id == 0:
+        raise BenchmarkSkipped("synthetic repo has no docstrings")
+    words = sorted({w for p in ctx.repo.files[:5] for w in p.read_text().split()})
+    queries = [
+        " ".join(words[(i * 7 + j) % len(words)] for j in range(6))
+        for i in range(SEMANTIC_QUERIES)
+    ]
+
+    def run() -> int:
+        for query in queries:
+            index.search(np.asarray(embed(query), dtype="float32"), k=10)
+        return len(queries)
+
+    return run
+
+
+# --- database cases --------------------------------------------------------
+
+
+def _setup_analyze_file(ctx: BenchmarkContext) -> Callable[[], int]:
+    from ..commands.update_indexes_analyzer import analyze_file
+
+    ctx.register_project()
+
+    def run() -> int:
+        for path in ctx.repo.files:
+            analyze_file(
+                ctx.database, path, ctx.repo.project_id, ctx.repo.root, force=True
+            )
+        return len(ctx.repo.files)
+
+    return run
+
+
+def _setup_batch_write(ctx: BenchmarkContext) -> Callable[[], int]:
+    from ..core.database_driver_pkg.domain.comprehensive_analysis import (
+        save_check_cache_entries,
+    )
+
+    file_ids = ctx.file_ids()
+    checks = ("placeholders", "stubs", "empty_methods", "imports", "docstrings")
+    rounds = [0]
+
+    def run() -> int:
+        rounds[0] += 1
+        items = [
+            (
+                file_id,
+                ctx.repo.project_id,
+                check,
+                hashlib.sha256(f"{file_id}{rounds[0]}".encode()).hexdigest(),
+                "bench",
+                "bench",
+                [{"line": rounds[0], "check": check}],
+            )
+            for file_id in file_ids.values()
+            for check in checks
+        ]
+        save_check_cache_entries(ctx.database, items)
+        return len(items)
+
+    return run
+
+
+def _setup_docstring_chunks(ctx: BenchmarkContext) -> Callable[[], int]:
+    from ..core.docstring_chunker_pkg.docstring_chunker import DocstringChunker
+
+    file_ids = ctx.file_ids()
+    chunker = DocstringChunker(
+        ctx.database,
+        svo_client_manager=ctx.chunker,
+        embedding_model=ctx.chunker.embedder.model_name,
+    )
+    inputs = []
+    for path in ctx.repo.files:
+        file_id = file_ids.get(path.resolve())
+        if file_id is not None:
+            source = path.read_text(encoding="utf-8")
+            inputs.append((file_id, path, ast.parse(source), source))
+    if not inputs:
+        raise BenchmarkSkipped("no indexed files")
+
+    async def persist() -> int:
+        for file_id, path, tree, source in inputs:
+            await chunker.process_file(
+                file_id=file_id,
+                project_id=ctx.repo.project_id,
+                file_path=str(path),
+                tree=tree,
+                file_content=source,
+            )
+        return len(inputs)
+
+    def run() -> int:
+        return asyncio.run(persist())
+
+    return run
+
+
+def _setup_fulltext_search(ctx: BenchmarkContext) -> Callable[[], int]:
+    from ..core.database_driver_pkg.domain.search import full_text_search
+
+    ctx.file_ids()
+    words = [SEARCH_NEEDLE, "ledger", "vector session", '"cache index"', "shard"]
+    queries = [words[i % len(words)] for i in range(FULLTEXT_QUERIES)]
+
+    def run() -> int:
+        for query in queries:
+            full_text_search(ctx.database, query, ctx.repo.project_id, limit=50)
+        return len(queries)
+
+    return run
+
+
+CASES: List[BenchmarkCase] = [
+    BenchmarkCase(
+        "watcher_scan",
+        "File watcher walk of the watch dir into per-project file maps.",
+        _setup_watcher_scan,
+        unit="files",
+    ),
+    BenchmarkCase(
+        "tree_load",
+        "CST tree build from disk (load_file_to_tree, no writes).",
+        _setup_tree_load,
+        unit="files",
+    ),
+    BenchmarkCase(
+        "tree_save",
+        "CST tree code generation and sidecar write.",
+        _setup_tree_save,
+        unit="files",
+    ),
+    BenchmarkCase(
+        "preview",
+        f"Marked-tree preview of the first {PREVIEW_FILES} modules.",
+        _setup_preview,
+        unit="files",
+    ),
+    BenchmarkCase(
+        "cst_query",
+        "CSTQuery selector over every module with cold indexes.",
+        _setup_cst_query,
+        unit="files",
+    ),
+    BenchmarkCase(
+        "grep",
+        "fs_grep literal line scan over every module.",
+        _setup_grep,
+        unit="files",
+    ),
+    BenchmarkCase(
+        "vectorize",
+        "Docstring chunking/embedding via local stand-ins into a FAISS index.",
+        _setup_vectorize,
+        unit="files",
+    ),
+    BenchmarkCase(
+        "semantic_search",
+        f"{SEMANTIC_QUERIES} FAISS nearest-neighbour queries over docstring chunks.",
+        _setup_semantic_search,
+        unit="queries",
+    ),
+    BenchmarkCase(
+        "analyze_file",
+        "analyze_file (AST/CST/entities) of every module into the database.",
+        _setup_analyze_file,
+        unit="files",
+        needs_database=True,
+    ),
+    BenchmarkCase(
+        "batch_write",
+        "Batched comprehensive-analysis check-cache upserts (5 rows per file).",
+        _setup_batch_write,
+        unit="rows",
+        needs_database=True,
+    ),
+    BenchmarkCase(
+        "docstring_chunks",
+        "DocstringChunker.process_file with the local chunker (code_chunks writes).",
+        _setup_docstring_chunks,
+        unit="files",
+        needs_database=True,
+    ),
+    BenchmarkCase(
+        "fulltext_search",
+        f"{FULLTEXT_QUERIES} fulltext queries against the project.",
+        _setup_fulltext_search,
+        unit="queries",
+        needs_database=True,
+    ),
+]
+
+
+def select_cases(names: Optional[List[str]] = None) -> List[BenchmarkCase]:
+    """Cases named in ``names`` (all when empty), in registry order.
+
+    Raises:
+        ValueError: If a name is unknown.
+    """
+    if not names:
+        return list(CASES)
+    known = {c.name for c in CASES}
+    unknown = sorted(set(names) - known)
+    if unknown:
+        raise ValueError(
+            f"Unknown benchmark(s): {', '.join(unknown)}; "
+            f"available: {', '.join(sorted(known))}"
+        )
+    return [c for c in CASES if c.name in names]
+
+
+def describe_cases() -> str:
+    """One line per case (``--list`` output)."""
+    return "\n".join(
+        f"{c.name:18s} {'db' if c.needs_database else '  '}  {c.description}"
+        for c in CASES
+    )
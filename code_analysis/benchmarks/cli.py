@@ -0,0 +1,175 @@
+"""
+Command-line entry point: ``python -m code_analysis.benchmarks``.
+
+Generates the synthetic repository in a scratch directory, runs the selected
+cases, writes the results JSON and, with ``--baseline``, fails (exit code 1)
+when a case is slower than the baseline by more than ``--max-regression``
+or when a case errors. ``--save-baseline`` stores the run as the new
+baseline. Database cases run only with ``--config`` (server config whose
+PostgreSQL database receives the synthetic project for the run).
+
+Author: Vasiliy Zdanovskiy
+email: vasilyvz@gmail.com
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence
+
+from .baseline import (
+    DEFAULT_MAX_REGRESSION,
+    compare_results,
+    format_report,
+    load_results,
+)
+from .cases import BenchmarkContext, describe_cases, select_cases
+from .runner import STATUS_ERROR, STATUS_OK, run_benchmarks
+from .stand_ins import LocalChunker
+from .synthetic_repo import SyntheticRepoSpec, generate_synthetic_repo
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Argument parser of the benchmark CLI."""
+    defaults = SyntheticRepoSpec()
+    parser = argparse.ArgumentParser(
+        prog="python -m code_analysis.benchmarks",
+        description="Run reproducible throughput benchmarks on a synthetic repo.",
+    )
+    parser.add_argument("--list", action="store_true", help="List cases and exit")
+    parser.add_argument(
+        "--cases", default="", help="Comma-separated case names (default: all)"
+    )
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--files", type=int, default=defaults.file_count)
+    parser.add_argument("--functions", type=int, default=defaults.functions_per_module)
+    parser.add_argument("--classes", type=int, default=defaults.classes_per_module)
+    parser.add_argument("--methods", type=int, default=defaults.methods_per_class)
+    parser.add_argument("--statements", type=int, default=defaults.statements_per_body)
+    parser.add_argument(
+        "--docstring-ratio", type=float, default=defaults.docstring_ratio
+    )
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    parser.add_argument(
+        "--chunker-latency-ms",
+        type=float,
+        default=0.0,
+        help="Simulated chunker round-trip per request",
+    )
+    parser.add_argument("--config", help="Server config.json for database cases")
+    parser.add_argument("--work-dir", help="Scratch dir (default: a temp dir)")
+    parser.add_argument("--out", help="Write results JSON here")
+    parser.add_argument("--baseline", help="Compare against this results JSON")
+    parser.add_argument(
+        "--max-regression",
+        type=float,
+        default=DEFAULT_MAX_REGRESSION,
+        help="Allowed median slowdown vs baseline (0.2 = 20%%)",
+    )
+    parser.add_argument(
+        "--save-baseline", help="Also write the results as a baseline here"
+    )
+    return parser
+
+
+def _open_database(config: Optional[str]) -> Optional[Any]:
+    if not config:
+        return None
+    from ..core.database_client.factory import (
+        create_database_client_from_config_path,
+    )
+
+    return create_database_client_from_config_path(Path(config))
+
+
+def _print_result(name: str, result: Dict[str, Any]) -> None:
+    if result["status"] == STATUS_OK:
+        print(
+            f"{name:18s} median {result['median_sec']:9.4f}s  "
+            f"p95 {result['p95_sec']:9.4f}s  "
+            f"{result['units_per_sec'] or 0:10.1f} {result['unit']}/s"
+        )
+    else:
+        print(f"{name:18s} {result['status']}: {result.get('reason', '')}")
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Run the benchmark CLI; return the process exit code."""
+    args = build_parser().parse_args(list(argv) if argv is not None else None)
+    if args.list:
+        print(describe_cases())
+        return 0
+    try:
+        cases = select_cases([n for n in args.cases.split(",") if n.strip()])
+    except ValueError as exc:
+        print(str(exc), file=sys.stderr)
+        return 2
+    logging.basicConfig(level=logging.WARNING)
+
+    spec = SyntheticRepoSpec(
+        file_count=args.files,
+        functions_per_module=args.functions,
+        classes_per_module=args.classes,
+        methods_per_class=args.methods,
+        statements_per_body=args.statements,
+        docstring_ratio=args.docstring_ratio,
+        seed=args.seed,
+    )
+    scratch = Path(args.work_dir or tempfile.mkdtemp(prefix="ca_bench_"))
+    context: Optional[BenchmarkContext] = None
+    try:
+        repo = generate_synthetic_repo(
+            scratch / "watch" / f"synthetic_{spec.seed}", spec
+        )
+        context = BenchmarkContext(
+            repo=repo,
+            work_dir=scratch / "work",
+            database=_open_database(args.config),
+            chunker=LocalChunker(latency_sec=args.chunker_latency_ms / 1000.0),
+        )
+        context.work_dir.mkdir(parents=True, exist_ok=True)
+        results = run_benchmarks(
+            cases,
+            context,
+            repeats=args.repeats,
+            warmup=args.warmup,
+            on_result=_print_result,
+            metadata={
+                "spec": spec.as_dict(),
+                "repo_bytes": repo.total_bytes,
+                "database": bool(args.config),
+            },
+        )
+    finally:
+        if context is not None:
+            context.close()
+            if context.database is not None:
+                context.database.disconnect()
+        if not args.work_dir:
+            shutil.rmtree(scratch, ignore_errors=True)
+
+    exit_code = 0
+    if any(r["status"] == STATUS_ERROR for r in results["results"].values()):
+        exit_code = 1
+    if args.baseline:
+        report = compare_results(
+            results, load_results(Path(args.baseline)), args.max_regression
+        )
+        results["comparison"] = report.as_dict()
+        print()
+        print(format_report(report))
+        if not report.ok:
+            exit_code = 1
+    text = json.dumps(results, indent=2)
+    for target in (args.out, args.save_baseline):
+        if target:
+            Path(target).parent.mkdir(parents=True, exist_ok=True)
+            Path(target).write_text(text + "\n", encoding="utf-8")
+    return exit_code
@@ -0,0 +1,152 @@
+"""
+Benchmark case model, timing loop and result document.
+
+A :class:`BenchmarkCase` has a ``setup`` that prepares its inputs (outside
+the timing) and returns the operation to time. The operation returns the
+number of units it processed (files, queries, rows), so results report
+throughput as well as latency. Each case runs ``warmup`` untimed rounds and
+then ``repeats`` timed rounds; the result keeps every round's wall time and
+the min / median / p95 / mean derived from them.
+
+:func:`run_benchmarks` returns a JSON-serialisable document (see
+:data:`RESULTS_SCHEMA_VERSION`) that :mod:`.baseline` compares against a
+stored one.
+
+Author: Vasiliy Zdanovskiy
+email: vasilyvz@gmail.com
+"""
+
+from __future__ import annotations
+
+import gc
+import logging
+import platform
+import statistics
+import sys
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+RESULTS_SCHEMA_VERSION = 1
+
+STATUS_OK = "ok"
+STATUS_SKIPPED = "skipped"
+STATUS_ERROR = "error"
+
+
+class BenchmarkSkipped(Exception):
+    """Raised by a case's setup when its prerequisites are not available."""
+
+
+@dataclass(frozen=True)
+class BenchmarkCase:
+    """One named benchmark.
+
+    Attributes:
+        name: Stable identifier (key in results and baselines).
+        description: What is measured.
+        setup: ``setup(context) -> operation``; the operation returns the
+            number of units processed per round.
+        unit: Name of the unit counted by the operation.
+        needs_database: Skipped when the context has no database.
+    """
+
+    name: str
+    description: str
+    setup: Callable[[Any], Callable[[], int]]
+    unit: str = "ops"
+    needs_database: bool = False
+
+
+def summarize_timings(timings: Iterable[float], units: int) -> Dict[str, Any]:
+    """Latency statistics and throughput for a list of round wall times."""
+    values = sorted(timings)
+    median = statistics.median(values)
+    if len(values) >= 2:
+        p95 = statistics.quantiles(values, n=20, method="inclusive")[-1]
+    else:
+        p95 = values[0]
+    return {
+        "units": units,
+        "timings_sec": [round(v, 6) for v in values],
+        "min_sec": round(values[0], 6),
+        "median_sec": round(median, 6),
+        "p95_sec": round(p95, 6),
+        "mean_sec": round(statistics.fmean(values), 6),
+        "units_per_sec": round(units / median, 3) if median > 0 else None,
+    }
+
+
+def run_case(
+    case: BenchmarkCase, context: Any, *, repeats: int = 5, warmup: int = 1
+) -> Dict[str, Any]:
+    """Run one case; never raises (failures are reported in the result)."""
+    result: Dict[str, Any] = {"description": case.description, "unit": case.unit}
+    if case.needs_database and getattr(context, "database", None) is None:
+        result.update(status=STATUS_SKIPPED, reason="no database configured")
+        return result
+    try:
+        operation = case.setup(context)
+        for _ in range(max(0, warmup)):
+            operation()
+        timings = []
+        units = 0
+        for _ in range(max(1, repeats)):
+            gc.collect()
+            started = time.perf_counter()
+            units = int(operation())
+            timings.append(time.perf_counter() - started)
+    except BenchmarkSkipped as exc:
+        result.update(status=STATUS_SKIPPED, reason=str(exc))
+        return result
+    except Exception as exc:
+        logger.exception("Benchmark %s failed", case.name)
+        result.update(status=STATUS_ERROR, reason=f"{type(exc).__name__}: {exc}")
+        return result
+    result["status"] = STATUS_OK
+    result.update(summarize_timings(timings, units))
+    return result
+
+
+def run_benchmarks(
+    cases: Iterable[BenchmarkCase],
+    context: Any,
+    *,
+    repeats: int = 5,
+    warmup: int = 1,
+    on_result: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+    metadata: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """Run ``cases`` in order and return the results document.
+
+    Args:
+        cases: Cases to run.
+        context: Passed to each case's setup.
+        repeats: Timed rounds per case.
+        warmup: Untimed rounds per case before timing.
+        on_result: Optional ``(name, result)`` callback after each case.
+        metadata: Extra top-level fields (e.g. the synthetic repo spec).
+
+    Returns:
+        ``{"schema_version", "created_at", "python", "platform", "repeats",
+        "warmup", ..., "results": {name: result}}``.
+    """
+    doc: Dict[str, Any] = {
+        "schema_version": RESULTS_SCHEMA_VERSION,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "repeats": repeats,
+        "warmup": warmup,
+    }
+    doc.update(metadata or {})
+    results: Dict[str, Dict[str, Any]] = {}
+    for case in cases:
+        results[case.name] = run_case(case, context, repeats=repeats, warmup=warmup)
+        if on_result is not None:
+            on_result(case.name, results[case.name])
+    doc["results"] = results
+    return doc
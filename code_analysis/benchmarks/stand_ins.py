@@ -0,0 +1,141 @@
+"""
+Local stand-ins for the SVO chunker and embedding services.
+
+Benchmarks must not depend on a live chunker: its latency and availability
+would dominate the numbers. :class:`LocalEmbedder` and :class:`LocalChunker`
+implement the parts of the ``SVOClientManager`` API the indexing pipeline
+calls (``get_chunks``, ``get_chunks_batch``, ``get_embeddings``) and return
+chunk objects shaped like svo_client's ``SemanticChunk`` (``body``,
+``text``, ``embedding``, ``embedding_model``, ``token_count``).
+
+Embeddings are deterministic feature-hashed bags of words: each word adds
+``±1`` to a dimension chosen by its hash, and the vector is L2-normalised.
+Texts sharing words are therefore close, which keeps semantic-search results
+meaningful. An optional ``latency_sec`` per request models the service
+round-trip when measuring how the pipeline overlaps it.
+
+Author: Vasiliy Zdanovskiy
+email: vasilyvz@gmail.com
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import math
+import re
+from dataclasses import dataclass
+from typing import Any, Iterable, List, Optional
+
+DEFAULT_VECTOR_DIM = 384
+
+_WORD_RE = re.compile(r"\w+")
+
+
+@dataclass
+class LocalChunk:
+    """Chunk object compatible with svo_client ``SemanticChunk`` consumers."""
+
+    body: str
+    embedding: Optional[List[float]] = None
+    embedding_model: Optional[str] = None
+    token_count: Optional[int] = None
+
+    @property
+    def text(self) -> str:
+        """Alias of ``body`` (consumers read either)."""
+        return self.body
+
+
+class LocalEmbedder:
+    """Deterministic hashed bag-of-words embeddings."""
+
+    def __init__(self, vector_dim: int = DEFAULT_VECTOR_DIM) -> None:
+        """Create an embedder producing ``vector_dim``-dimensional vectors."""
+        self.vector_dim = int(vector_dim)
+        self.model_name = f"local-hash-{self.vector_dim}"
+
+    def embed(self, text: str) -> List[float]:
+        """Return the L2-normalised embedding of ``text``."""
+        vec = [0.0] * self.vector_dim
+        for word in _WORD_RE.findall(text.lower()):
+            digest = hashlib.blake2b(word.encode("utf-8"), digest_size=8).digest()
+            value = int.from_bytes(digest, "little")
+            vec[value % self.vector_dim] += 1.0 if value & (1 << 63) else -1.0
+        norm = math.sqrt(sum(v * v for v in vec))
+        if norm:
+            vec = [v / norm for v in vec]
+        return vec
+
+    async def get_embeddings(self, chunks: Iterable[Any], **kwargs: Any) -> List[Any]:
+        """Set ``embedding``/``embedding_model`` on each chunk and return them."""
+        out = []
+        for chunk in chunks:
+            text = getattr(chunk, "body", None) or getattr(chunk, "text", "") or ""
+            chunk.embedding = self.embed(str(text))
+            chunk.embedding_model = self.model_name
+            out.append(chunk)
+        return out
+
+
+class LocalChunker:
+    """Chunker stand-in: splits on blank lines, then caps chunk length in words."""
+
+    def __init__(
+        self,
+        embedder: Optional[LocalEmbedder] = None,
+        *,
+        max_words: int = 64,
+        latency_sec: float = 0.0,
+    ) -> None:
+        """Create a chunker.
+
+        Args:
+            embedder: Embedder for chunk vectors (a default one when omitted).
+            max_words: Maximum words per chunk.
+            latency_sec: Simulated service round-trip per request.
+        """
+        self.embedder = embedder or LocalEmbedder()
+        self.max_words = max(1, int(max_words))
+        self.latency_sec = float(latency_sec)
+        self.requests = 0
+
+    def chunk_text(self, text: str) -> List[LocalChunk]:
+        """Split ``text`` into embedded chunks (synchronous core)."""
+        chunks: List[LocalChunk] = []
+        for block in re.split(r"\n\s*\n", text):
+            words = block.split()
+            for start in range(0, len(words), self.max_words):
+                part = words[start : start + self.max_words]
+                body = " ".join(part)
+                chunks.append(
+                    LocalChunk(
+                        body=body,
+                        embedding=self.embedder.embed(body),
+                        embedding_model=self.embedder.model_name,
+                        token_count=len(part),
+                    )
+                )
+        return chunks
+
+    async def _round_trip(self) -> None:
+        self.requests += 1
+        if self.latency_sec > 0:
+            await asyncio.sleep(self.latency_sec)
+
+    async def get_chunks(self, text: str, **kwargs: Any) -> List[Any]:
+        """Chunk and embed one text (``SVOClientManager.get_chunks``)."""
+        await self._round_trip()
+        return self.chunk_text(text)
+
+    async def get_chunks_batch(
+        self, texts: List[str], **kwargs: Any
+    ) -> List[List[Any]]:
+        """Chunk and embed several texts in one request."""
+        await self._round_trip()
+        return [self.chunk_text(t) for t in texts]
+
+    async def get_embeddings(self, chunks: Iterable[Any], **kwargs: Any) -> List[Any]:
+        """Embed provided chunks (``SVOClientManager.get_embeddings``)."""
+        await self._round_trip()
+        return await self.embedder.get_embeddings(chunks)
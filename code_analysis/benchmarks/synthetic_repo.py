@@ -0,0 +1,245 @@
+"""
+Deterministic synthetic Python repositories for benchmarks.
+
+:func:`generate_synthetic_repo` writes a project (``projectid`` file plus
+packages of modules) whose shape is fixed by a :class:`SyntheticRepoSpec`:
+file count, module size (top-level functions, classes, methods, statements
+per body) and docstring ratio. All names, literals and the project id come
+from ``random.Random(spec.seed)``, so the same spec always produces
+byte-identical files and benchmark runs stay comparable across machines and
+releases.
+
+Every module also contains the marker word :data:`SEARCH_NEEDLE` in a few
+string literals and docstrings, giving grep and fulltext benchmarks a stable
+number of hits.
+
+Author: Vasiliy Zdanovskiy
+email: vasilyvz@gmail.com
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import uuid
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List
+
+SEARCH_NEEDLE = "throughput_marker"
+
+_WORDS = (
+    "account",
+    "batch",
+    "buffer",
+    "cache",
+    "channel",
+    "config",
+    "cursor",
+    "document",
+    "entry",
+    "event",
+    "index",
+    "item",
+    "job",
+    "ledger",
+    "record",
+    "request",
+    "result",
+    "route",
+    "session",
+    "shard",
+    "signal",
+    "token",
+    "vector",
+    "window",
+)
+_VERBS = (
+    "build",
+    "collect",
+    "compute",
+    "decode",
+    "encode",
+    "filter",
+    "flush",
+    "load",
+    "merge",
+    "parse",
+    "render",
+    "resolve",
+    "scan",
+    "split",
+    "store",
+    "update",
+)
+
+
+@dataclass(frozen=True)
+class SyntheticRepoSpec:
+    """Shape of a generated repository.
+
+    Attributes:
+        file_count: Number of Python modules.
+        files_per_package: Modules per package directory.
+        functions_per_module: Top-level functions per module.
+        classes_per_module: Classes per module.
+        methods_per_class: Methods per class.
+        statements_per_body: Statements in each function/method body.
+        docstring_ratio: Share of modules, classes and functions with a docstring.
+        seed: Random seed; equal specs generate identical repositories.
+    """
+
+    file_count: int = 50
+    files_per_package: int = 20
+    functions_per_module: int = 6
+    classes_per_module: int = 2
+    methods_per_class: int = 4
+    statements_per_body: int = 6
+    docstring_ratio: float = 0.7
+    seed: int = 1
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the spec as a JSON-serialisable dict."""
+        return asdict(self)
+
+
+@dataclass
+class SyntheticRepo:
+    """A generated repository on disk."""
+
+    root: Path
+    project_id: str
+    spec: SyntheticRepoSpec
+    files: List[Path] = field(default_factory=list)
+
+    @property
+    def total_bytes(self) -> int:
+        """Total size of the generated modules."""
+        return sum(p.stat().st_size for p in self.files)
+
+
+class _ModuleWriter:
+    """Emits the source of one module from a shared random stream."""
+
+    def __init__(self, rng: random.Random, spec: SyntheticRepoSpec) -> None:
+        """Keep the stream and spec; one writer serves the whole repository."""
+        self.rng = rng
+        self.spec = spec
+
+    def _name(self) -> str:
+        return f"{self.rng.choice(_VERBS)}_{self.rng.choice(_WORDS)}"
+
+    def _sentence(self, needle: bool = False) -> str:
+        words = [self.rng.choice(_WORDS) for _ in range(self.rng.randint(6, 14))]
+        if needle:
+            words.insert(self.rng.randrange(len(words)), SEARCH_NEEDLE)
+        text = " ".join(words)
+        return text[0].upper() + text[1:] + "."
+
+    def _docstring(self, indent: str, needle: bool = False) -> List[str]:
+        if self.rng.random() >= self.spec.docstring_ratio:
+            return []
+        lines = [f'{indent}"""{self._sentence(needle)}', ""]
+        for _ in range(self.rng.randint(1, 3)):
+            lines.append(f"{indent}{self._sentence()}")
+        lines.append(f'{indent}"""')
+        return lines
+
+    def _body(self, indent: str, callees: List[str]) -> List[str]:
+        lines: List[str] = [f"{indent}total = 0"]
+        for i in range(max(1, self.spec.statements_per_body)):
+            kind = self.rng.randrange(5)
+            var = f"{self.rng.choice(_WORDS)}_{i}"
+            if kind == 0:
+                lines.append(f"{indent}{var} = {self.rng.randint(0, 10_000)}")
+                lines.append(f"{indent}total += {var}")
+            elif kind == 1:
+                lines.append(f"{indent}for {var} in range({self.rng.randint(2, 50)}):")
+                lines.append(f"{indent}    total += {var} * {self.rng.randint(1, 9)}")
+            elif kind == 2:
+                lines.append(f"{indent}if total > {self.rng.randint(0, 500)}:")
+                lines.append(f"{indent}    total -= {self.rng.randint(1, 100)}")
+            elif kind == 3 and callees:
+                lines.append(f"{indent}total += {self.rng.choice(callees)}(total)")
+            else:
+                needle = self.rng.random() < 0.2
+                literal = self._sentence(needle).replace('"', "")
+                lines.append(f'{indent}{var} = "{literal}"')
+                lines.append(f"{indent}total += len({var})")
+        lines.append(f"{indent}return total")
+        return lines
+
+    def module_source(self) -> str:
+        """Source of one module."""
+        lines = self._docstring("", needle=True)
+        if lines:
+            lines.append("")
+        lines += ["from __future__ import annotations", "", "import math", ""]
+        functions: List[str] = []
+        for _ in range(self.spec.functions_per_module):
+            name = self._name()
+            while name in functions:
+                name = f"{name}_{len(functions)}"
+            lines += ["", f"def {name}(value: int) -> int:"]
+            lines += self._docstring("    ")
+            lines += self._body("    ", list(functions))
+            lines.append("")
+            functions.append(name)
+        for c in range(self.spec.classes_per_module):
+            cls = "".join(w.capitalize() for w in self._name().split("_")) + str(c)
+            lines += ["", f"class {cls}:"]
+            lines += self._docstring("    ")
+            lines += [
+                "",
+                "    def __init__(self, size: int = 0) -> None:",
+                "        self.size = size",
+                "",
+            ]
+            for m in range(self.spec.methods_per_class):
+                meth = f"{self._name()}_{m}"
+                lines += [f"    def {meth}(self, value: int) -> int:"]
+                lines += self._docstring("        ")
+                lines += self._body("        ", functions)
+                lines.append("")
+            lines.append("")
+        lines += ["", "def main() -> float:", "    return math.fsum(["]
+        lines += [f"        {name}(1)," for name in functions]
+        lines += ["    ])", ""]
+        return "\n".join(lines)
+
+
+def generate_synthetic_repo(root: Path, spec: SyntheticRepoSpec) -> SyntheticRepo:
+    """Write a synthetic project under ``root`` (created; must be empty or new).
+
+    Layout: ``root/projectid`` and ``root/pkg_NNN/mod_MMMM.py`` with
+    ``__init__.py`` per package. The project id is derived from the seed.
+
+    Args:
+        root: Project root directory.
+        spec: Repository shape.
+
+    Returns:
+        The generated repository (root, project id and module paths).
+    """
+    rng = random.Random(spec.seed)
+    root = Path(root)
+    root.mkdir(parents=True, exist_ok=True)
+    project_id = str(uuid.UUID(int=rng.getrandbits(128), version=4))
+    (root / "projectid").write_text(
+        json.dumps(
+            {"id": project_id, "description": f"Synthetic benchmark repo {spec}"}
+        ),
+        encoding="utf-8",
+    )
+    repo = SyntheticRepo(root=root, project_id=project_id, spec=spec)
+    writer = _ModuleWriter(rng, spec)
+    per_package = max(1, spec.files_per_package)
+    for i in range(spec.file_count):
+        package = root / f"pkg_{i // per_package:03d}"
+        if i % per_package == 0:
+            package.mkdir(exist_ok=True)
+            (package / "__init__.py").write_text("", encoding="utf-8")
+        path = package / f"mod_{i:04d}.py"
+        path.write_text(writer.module_source(), encoding="utf-8")
+        repo.files.append(path)
+    return repo
@@ -5,11 +5,21 @@ Author: Vasiliy Zdanovskiy
 email: vasilyvz@gmail.com
 """
 
-# Import commands for automatic registration
-from .project_management_mcp_commands import (  # noqa: F401
-    ChangeProjectIdMCPCommand,
-    ListProjectsMCPCommand,
-)
-from .file_management_mcp_commands import (  # noqa: F401
-    CreateTextFileMCPCommand,
-)
+# Re-exported on first access: importing any ``code_analysis.commands.*``
+# module runs this file, so eager imports here would load the heavy command
+# packages at server startup.
+_LAZY_EXPORTS = {
+    "ChangeProjectIdMCPCommand": ".project_management_mcp_commands",
+    "ListProjectsMCPCommand": ".project_management_mcp_commands",
+    "CreateTextFileMCPCommand": ".file_management_mcp_commands",
+}
+
+
+def __getattr__(name: str) -> object:
+    """Import re-exported command classes on first access."""
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+
+    return getattr(import_module(module, __name__), name)
@@ -37,7 +37,8 @@ class AnalyzeTreeMCPCommand(BaseMCPCommand):
 
     Modes: ``package_boundary`` (extraction analysis), ``dependencies`` (relation
     graph), ``structure`` (composition), ``cycles`` (circular-import defects).
-    Read-only: never mutates project sources, sidecars, or the DB.
+    Read-only: never mutates project sources, sidecars, or index data (it only
+    refreshes the derived import-graph cache tables).
     """
 
     name = "analyze_tree"
@@ -45,3 +45,7 @@ class CoreData:
     structure_by_file: dict[str, dict] = field(default_factory=dict)
     # Filled only for the dead_code mode: raw symbol/usage/import inputs.
     dead_code_inputs: dict = field(default_factory=dict)
+    # Project-wide import-cycle component per file (rel_path → component id),
+    # from the persisted import graph. None when not computed (mode_cycles then
+    # considers every internal edge).
+    component_of: Optional[dict[str, str]] = None
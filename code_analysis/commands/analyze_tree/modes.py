@@ -204,10 +204,24 @@ def mode_structure(core: CoreData) -> dict:
 
 
 def mode_cycles(core: CoreData) -> dict:
-    """Circular-import chains within the sub-tree (defect view)."""
+    """Circular-import chains within the sub-tree (defect view).
+
+    A sub-tree cycle lies inside one project-wide component, so when
+    ``core.component_of`` is known only edges within a component (and
+    self-imports) are handed to Tarjan.
+    """
+    comp = core.component_of
     adjacency: dict[str, set[str]] = {rel: set() for rel in core.internal_set}
     for e in _internal_edges(core):
         if e.kind == "project" and e.target_rel in core.internal_set:
+            if (
+                comp is not None
+                and e.src != e.target_rel
+                and (
+                    comp.get(e.src) is None or comp.get(e.src) != comp.get(e.target_rel)
+                )
+            ):
+                continue
             adjacency[e.src].add(e.target_rel)
     cycles = find_cycles(adjacency)
     return {
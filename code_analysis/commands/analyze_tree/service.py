@@ -2,9 +2,10 @@
 analyze_tree shared core (atom A-CORE).
 
 Enumerates the real files under ``roots`` (disk = existence truth), runs the
-per-file checksum staleness gate, builds the module-resolved relation graph once,
-then hands a ``CoreData`` to the selected mode. Read-only: no project source,
-sidecar, or DB writes.
+per-file checksum staleness gate, reads the module-resolved relation graph from
+the persisted import graph (``core.import_graph.store``), then hands a
+``CoreData`` to the selected mode. Read-only for project sources, sidecars and
+index data; the only DB writes refresh the import-graph cache rows.
 
 Layering: the command stays thin and delegates here; this module owns DB access
 via the shared ``DatabaseClient`` (the same universal entrypoint other read-only
@@ -21,12 +22,12 @@ import os
 from pathlib import Path
 from typing import Any, Optional
 
+from code_analysis.core.import_graph import ImportGraphFile, sync_import_graph
 from code_analysis.core.tree_lifecycle.checksum import compute_content_checksum
 
 from . import staleness as st
 from .core_types import CoreData, Edge
 from .modes import run_mode
-from .resolver import ModulePathResolver
 
 logger = logging.getLogger(__name__)
 
@@ -135,7 +136,7 @@ def build_core(
     # --- project file index (all files, for resolution + inbound) ---
     res = db.execute(
         """
-        SELECT id, path, relative_path, tree_checksum
+        SELECT id, path, relative_path, tree_checksum, updated_at
         FROM files
         WHERE project_id = ? AND (deleted = FALSE OR deleted IS NULL)
         """,
@@ -146,6 +147,7 @@ def build_core(
     rel_by_file_id: dict[str, str] = {}
     checksum_by_rel: dict[str, Optional[str]] = {}
     project_files: set[str] = set()
+    graph_files: list[ImportGraphFile] = []
     for row in file_rows:
         fid = _rv(row, "id")
         rel = _rel_of(_rv(row, "path"), _rv(row, "relative_path"), project_root)
@@ -154,8 +156,12 @@ def build_core(
         rel_by_file_id[str(fid)] = rel
         checksum_by_rel[rel] = _rv(row, "tree_checksum")
         project_files.add(rel)
-
-    resolver = ModulePathResolver(project_files)
+        updated_at = _rv(row, "updated_at")
+        graph_files.append(
+            ImportGraphFile(
+                str(fid), rel, float(updated_at) if updated_at is not None else None
+            )
+        )
 
     # --- internal files: disk existence truth, union with indexed files ---
     disk_files = _enumerate_disk_py_files(project_root, norm_roots)
@@ -211,37 +217,25 @@ def build_core(
     }
 
     # --- relation graph (whole project, so inbound from outside is visible) ---
-    imp_res = db.execute(
-        """
-        SELECT i.file_id, i.module, i.name, i.import_type
-        FROM imports i
-        JOIN files f ON f.id = i.file_id
-        WHERE f.project_id = ?
-        """,
-        (project_id,),
-    )
-    imp_rows = imp_res.get("data", []) if isinstance(imp_res, dict) else (imp_res or [])
+    # Resolved once per file and persisted; only re-indexed files (and imports
+    # the file-set change can affect) are re-resolved here.
+    graph = sync_import_graph(db, project_id, graph_files)
     edges: list[Edge] = []
     truncated = False
-    for row in imp_rows:
+    for row in graph.imports:
         if len(edges) >= limit:
             truncated = True
             break
-        src = rel_by_file_id.get(str(_rv(row, "file_id")))
-        if not src:
-            continue
-        resolved = resolver.resolve(
-            module=_rv(row, "module"),
-            name=_rv(row, "name"),
-            import_type=_rv(row, "import_type"),
-            importer_rel=src,
-        )
         edges.append(
             Edge(
-                src=src,
-                kind=resolved.kind,
-                module=resolved.module,
-                target_rel=resolved.rel_path,
+                src=rel_by_file_id[row.src_file_id],
+                kind=row.kind,
+                module=row.resolved_module,
+                target_rel=(
+                    rel_by_file_id.get(row.target_file_id)
+                    if row.target_file_id
+                    else None
+                ),
             )
         )
 
@@ -253,6 +247,9 @@ def build_core(
         edges=edges,
         staleness=staleness,
         truncated=truncated,
+        component_of={
+            rel_by_file_id[fid]: cid for fid, cid in graph.component_of.items()
+        },
     )
 
     if mode == "structure":
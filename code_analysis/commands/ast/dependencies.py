@@ -6,6 +6,7 @@ email: vasilyvz@gmail.com
 """
 
 import json
+from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from mcp_proxy_adapter.commands.result import ErrorResult, SuccessResult
@@ -13,6 +14,14 @@ from mcp_proxy_adapter.commands.result import ErrorResult, SuccessResult
 from ..base_mcp_command import BaseMCPCommand
 from ...core.exceptions import ValidationError
 from ...core.file_identity import relative_path_for_indexed_row
+from ...core.list_pagination import (
+    DEFAULT_LIST_PAGE_SIZE,
+    SqlListSource,
+    apply_keyset_page_fields,
+    list_cursor_schema_property,
+    resolve_list_cursor,
+    walk_keyset_sources,
+)
 from ...core.uuid_validation import is_valid_uuid4 as _is_valid_uuid4
 
 
@@ -46,6 +55,144 @@ def _get_containing_cst_node_id(db: Any, file_id: int, line: int) -> Optional[st
     return node_id if _is_valid_uuid4(node_id) else None
 
 
+#: Result columns matching each source's ``(f.path, line, id)`` order.
+_DEPENDENCY_KEY_FIELDS = ("file_path", "line", "id")
+
+#: Index of the classes-by-bases source in :func:`_dependency_sources`.
+_INHERITANCE_SOURCE = 1
+
+
+def _dependency_sources(
+    db: Any,
+    project_id: str,
+    *,
+    entity_name: str,
+    entity_type: Optional[str],
+    target_class: Optional[str],
+    root_path: Path,
+) -> List[SqlListSource]:
+    """Return the imports / inheritance / usages sources in output order."""
+
+    def rel_path(row: Dict[str, Any]) -> str:
+        return relative_path_for_indexed_row(
+            {
+                "path": row.get("file_path"),
+                "relative_path": row.get("file_relative_path"),
+            },
+            root_path,
+        )
+
+    def import_entry(row: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        cst_node_id = _get_containing_cst_node_id(db, row["file_id"], row["line"])
+        entry: Dict[str, Any] = {
+            "type": "import",
+            "file_path": rel_path(row),
+            "line": row["line"],
+            "module": row.get("module"),
+            "name": row["name"],
+            "import_type": row["import_type"],
+        }
+        if cst_node_id:
+            entry["cst_node_id"] = cst_node_id
+        return entry
+
+    def inheritance_entry(row: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        # Parse bases JSON to check if entity_name is in bases
+        bases = []
+        if row.get("bases"):
+            try:
+                bases = json.loads(row["bases"])
+            except (json.JSONDecodeError, TypeError):
+                bases = []
+        if entity_name not in bases:
+            return None
+        node_id = row.get("cst_node_id")
+        entry: Dict[str, Any] = {
+            "type": "inheritance",
+            "file_path": rel_path(row),
+            "line": row["line"],
+            "class_name": row["name"],
+            "bases": bases,
+        }
+        if _is_valid_uuid4(node_id):
+            entry["cst_node_id"] = node_id
+        return entry
+
+    def usage_entry(row: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        cst_node_id = _get_containing_cst_node_id(db, row["file_id"], row["line"])
+        entry: Dict[str, Any] = {
+            "type": "usage",
+            "file_path": rel_path(row),
+            "line": row["line"],
+            "target_name": row["target_name"],
+            "target_type": row["target_type"],
+            "target_class": row.get("target_class"),
+        }
+        if cst_node_id:
+            entry["cst_node_id"] = cst_node_id
+        return entry
+
+    # Search in imports table for class/function/module dependencies
+    import_query = """
+        SELECT i.*, f.path as file_path, f.relative_path as file_relative_path
+        FROM imports i
+        JOIN files f ON i.file_id = f.id
+        WHERE f.project_id = ? AND (i.name = ? OR i.module LIKE ?)
+    """
+    import_params = (project_id, entity_name, f"%{entity_name}%")
+
+    # For classes: also search for inheritance (classes that inherit from this class)
+    inheritance_query = """
+        SELECT c.*, f.path as file_path, f.relative_path as file_relative_path
+        FROM classes c
+        JOIN files f ON c.file_id = f.id
+        WHERE f.project_id = ? AND c.bases LIKE ?
+    """
+    inheritance_params = (project_id, f"%{entity_name}%")
+
+    # Also try usages table (may be empty, but check anyway)
+    usage_query = """
+        SELECT u.*, f.path as file_path, f.relative_path as file_relative_path
+        FROM usages u
+        JOIN files f ON u.file_id = f.id
+        WHERE f.project_id = ? AND u.target_name = ?
+    """
+    usage_params: List[Any] = [project_id, entity_name]
+    if entity_type:
+        usage_query += " AND u.target_type = ?"
+        usage_params.append(entity_type)
+    if target_class:
+        usage_query += " AND u.target_class = ?"
+        usage_params.append(target_class)
+
+    return [
+        SqlListSource(
+            sql=import_query,
+            params=import_params,
+            order_columns=("f.path", "i.line", "i.id"),
+            key_fields=_DEPENDENCY_KEY_FIELDS,
+            to_item=import_entry,
+            enabled=entity_type in ("class", "function", "module", None),
+        ),
+        SqlListSource(
+            sql=inheritance_query,
+            params=inheritance_params,
+            order_columns=("f.path", "c.line", "c.id"),
+            key_fields=_DEPENDENCY_KEY_FIELDS,
+            to_item=inheritance_entry,
+            enabled=entity_type in ("class", None),
+        ),
+        SqlListSource(
+            sql=usage_query,
+            params=tuple(usage_params),
+            order_columns=("f.path", "u.line", "u.id"),
+            key_fields=_DEPENDENCY_KEY_FIELDS,
+            to_item=usage_entry,
+            enabled=entity_type in ("class", "function", "method", None),
+        ),
+    ]
+
+
 class FindDependenciesMCPCommand(BaseMCPCommand):
     """Find dependencies - where classes, functions, or modules are used."""
 
@@ -89,6 +236,7 @@ class FindDependenciesMCPCommand(BaseMCPCommand):
                     "description": "Offset for pagination",
                     "default": 0,
                 },
+                **list_cursor_schema_property(),
             },
             "required": ["project_id", "entity_name"],
             "additionalProperties": False,
@@ -102,6 +250,7 @@ class FindDependenciesMCPCommand(BaseMCPCommand):
         target_class: Optional[str] = None,
         limit: Optional[int] = None,
         offset: int = 0,
+        cursor: Optional[str] = None,
         **kwargs,
     ) -> SuccessResult | ErrorResult:
         """Execute the command."""
@@ -112,6 +261,7 @@ class FindDependenciesMCPCommand(BaseMCPCommand):
             "target_class": target_class,
             "limit": limit,
             "offset": offset,
+            "cursor": cursor,
         }
         params.update(kwargs)
         try:
@@ -125,6 +275,14 @@ class FindDependenciesMCPCommand(BaseMCPCommand):
         limit = params.get("limit")
         offset = int(params.get("offset", 0))
 
+        cursor_scope = f"find_dependencies:{entity_type or 'all'}"
+        try:
+            keyset_mode, after = resolve_list_cursor(
+                params, scope=cursor_scope, key_length=4
+            )
+        except ValidationError as e:
+            return self._handle_error(e, "VALIDATION_ERROR", "find_dependencies")
+
         try:
             root_path = self._resolve_project_root(project_id)
             db = self._open_database_from_config(auto_analyze=False)
@@ -134,144 +292,55 @@ class FindDependenciesMCPCommand(BaseMCPCommand):
             # - usages table: actual function calls, method calls, class instantiations
             # - imports table: module/class/function imports
             # - classes table: inheritance relationships (bases)
-            results: List[Dict[str, Any]] = []
-
-            # Search in imports table for class/function/module dependencies
-            if entity_type in ("class", "function", "module", None):
-                import_query = """
-                    SELECT i.*, f.path as file_path, f.relative_path as file_relative_path
-                    FROM imports i
-                    JOIN files f ON i.file_id = f.id
-                    WHERE f.project_id = ? AND (i.name = ? OR i.module LIKE ?)
-                """
-                import_params = [project_id, entity_name, f"%{entity_name}%"]
-
-                import_query += " ORDER BY f.path, i.line"
-                if limit:
-                    import_query += f" LIMIT {limit}"
-                if offset:
-                    import_query += f" OFFSET {offset}"
+            sources = _dependency_sources(
+                db,
+                project_id,
+                entity_name=entity_name,
+                entity_type=entity_type,
+                target_class=target_class,
+                root_path=root_path,
+            )
 
-                result = db.execute(import_query, tuple(import_params))
-                import_rows = result.get("data", [])
-                for row in import_rows:
-                    cst_node_id = _get_containing_cst_node_id(
-                        db, row["file_id"], row["line"]
-                    )
-                    entry: Dict[str, Any] = {
-                        "type": "import",
-                        "file_path": relative_path_for_indexed_row(
-                            {
-                                "path": row.get("file_path"),
-                                "relative_path": row.get("file_relative_path"),
-                            },
-                            root_path,
-                        ),
-                        "line": row["line"],
-                        "module": row.get("module"),
-                        "name": row["name"],
-                        "import_type": row["import_type"],
-                    }
-                    if cst_node_id:
-                        entry["cst_node_id"] = cst_node_id
-                    results.append(entry)
-
-            # For classes: also search for inheritance (classes that inherit from this class)
-            if entity_type in ("class", None):
-                inheritance_query = """
-                    SELECT c.*, f.path as file_path, f.relative_path as file_relative_path
-                    FROM classes c
-                    JOIN files f ON c.file_id = f.id
-                    WHERE f.project_id = ? AND c.bases LIKE ?
-                """
-                inheritance_params = [project_id, f"%{entity_name}%"]
-
-                inheritance_query += " ORDER BY f.path, c.line"
-                if limit:
-                    # Apply limit to total results, not just this query
-                    inheritance_query += (
-                        f" LIMIT {limit * 2}"  # Get more to account for imports
+            if keyset_mode:
+                page, next_key = walk_keyset_sources(
+                    [source.keyset_fetch(db) for source in sources],
+                    page_size=limit or DEFAULT_LIST_PAGE_SIZE,
+                    after=after,
+                )
+                db.disconnect()
+                return SuccessResult(
+                    data=apply_keyset_page_fields(
+                        {
+                            "success": True,
+                            "entity_name": entity_name,
+                            "entity_type": entity_type,
+                            "dependencies": page,
+                            "count": len(page),
+                        },
+                        scope=cursor_scope,
+                        next_key=next_key,
                     )
-                if offset:
-                    inheritance_query += f" OFFSET {offset}"
-
-                result = db.execute(inheritance_query, tuple(inheritance_params))
-                inheritance_rows = result.get("data", [])
-                for row in inheritance_rows:
-                    # Parse bases JSON to check if entity_name is in bases
-                    bases = []
-                    if row.get("bases"):
-                        try:
-                            bases = json.loads(row["bases"])
-                        except (json.JSONDecodeError, TypeError):
-                            bases = []
-
-                    if entity_name in bases:
-                        node_id = row.get("cst_node_id")
-                        entry = {
-                            "type": "inheritance",
-                            "file_path": relative_path_for_indexed_row(
-                                {
-                                    "path": row.get("file_path"),
-                                    "relative_path": row.get("file_relative_path"),
-                                },
-                                root_path,
-                            ),
-                            "line": row["line"],
-                            "class_name": row["name"],
-                            "bases": bases,
-                        }
-                        if _is_valid_uuid4(node_id):
-                            entry["cst_node_id"] = node_id
-                        results.append(entry)
+                )
 
-            # Also try usages table (may be empty, but check anyway)
-            if entity_type in ("class", "function", "method", None):
-                usage_query = """
-                    SELECT u.*, f.path as file_path, f.relative_path as file_relative_path
-                    FROM usages u
-                    JOIN files f ON u.file_id = f.id
-                    WHERE f.project_id = ? AND u.target_name = ?
-                """
-                usage_params = [project_id, entity_name]
-
-                if entity_type:
-                    usage_query += " AND u.target_type = ?"
-                    usage_params.append(entity_type)
-
-                if target_class:
-                    usage_query += " AND u.target_class = ?"
-                    usage_params.append(target_class)
-
-                usage_query += " ORDER BY f.path, u.line"
+            results: List[Dict[str, Any]] = []
+            for source in sources:
+                if not source.enabled:
+                    continue
+                query = source.sql + source.order_by_sql()
+                query_params = list(source.params)
                 if limit:
-                    usage_query += f" LIMIT {limit}"
+                    # Inheritance rows are post-filtered on bases: fetch more.
+                    over_fetch = 2 if source is sources[_INHERITANCE_SOURCE] else 1
+                    query += " LIMIT ?"
+                    query_params.append(int(limit) * over_fetch)
                 if offset:
-                    usage_query += f" OFFSET {offset}"
-
-                result = db.execute(usage_query, tuple(usage_params))
-                usage_rows = result.get("data", [])
-                for row in usage_rows:
-                    cst_node_id = _get_containing_cst_node_id(
-                        db, row["file_id"], row["line"]
-                    )
-                    entry = {
-                        "type": "usage",
-                        "file_path": relative_path_for_indexed_row(
-                            {
-                                "path": row.get("file_path"),
-                                "relative_path": row.get("file_relative_path"),
-                            },
-                            root_path,
-                        ),
-                        "line": row["line"],
-                        "target_name": row["target_name"],
-                        "target_type": row["target_type"],
-                        "target_class": row.get("target_class"),
-                    }
-                    if cst_node_id:
-                        entry["cst_node_id"] = cst_node_id
-                    results.append(entry)
+                    query += " OFFSET ?"
+                    query_params.append(offset)
+                result = db.execute(query, tuple(query_params))
+                for row in result.get("data", []):
+                    entry = source.to_item(row)
+                    if entry is not None:
+                        results.append(entry)
 
             # Apply limit and offset to final results
             if limit:
@@ -397,6 +466,17 @@ class FindDependenciesMCPCommand(BaseMCPCommand):
                     "required": False,
                     "default": 0,
                 },
+                "cursor": {
+                    "description": (
+                        "Opaque keyset cursor. Empty string starts a cursor walk "
+                        "(page size = limit, default 20); pass next_cursor from the "
+                        "previous response for the next page. Overrides offset. "
+                        "Sources are walked in order (imports, inheritance, usages); "
+                        "rows filtered after the query can make a page shorter."
+                    ),
+                    "type": "string",
+                    "required": False,
+                },
             },
             "usage_examples": [
                 {
@@ -483,6 +563,10 @@ class FindDependenciesMCPCommand(BaseMCPCommand):
                             "- For inheritance: class_name, bases"
                         ),
                         "count": "Number of dependencies found",
+                        "next_cursor": (
+                            "Cursor mode only: pass as cursor for the next page; "
+                            "null on the last page"
+                        ),
                     },
                     "example": {
                         "success": True,
@@ -5,19 +5,22 @@ Author: Vasiliy Zdanovskiy
 email: vasilyvz@gmail.com
 """
 
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 
 from mcp_proxy_adapter.commands.result import ErrorResult, SuccessResult
 
 from ...core.exceptions import ValidationError
 from ..base_mcp_command import BaseMCPCommand
 
+from ...core.symbol_graph import get_project_symbol_graph
 from .entity_dependencies_helpers import (
     CALLEE_TYPES,
     CALLER_TYPES,
+    MAX_REF_DEPTH,
     get_entity_dependencies_via_execute,
     get_entity_dependents_via_execute,
-    resolve_entity_id_by_name,
+    get_entity_refs_via_graph,
+    resolve_entity_node_by_name,
 )
 from .entity_dependencies_metadata import (
     get_entity_dependencies_metadata,
@@ -25,6 +28,37 @@ from .entity_dependencies_metadata import (
 )
 
 
+_MAX_DEPTH_SCHEMA: Dict[str, Any] = {
+    "type": "integer",
+    "description": (
+        "How many reference hops to follow (1 = direct only, default). "
+        f"Values above 1 add a 'depth' field to each entry; maximum {MAX_REF_DEPTH}."
+    ),
+    "default": 1,
+    "minimum": 1,
+    "maximum": MAX_REF_DEPTH,
+}
+
+
+def _validate_max_depth_param(raw: Optional[Any], *, command_name: str) -> None:
+    """Reject ``max_depth`` outside 1..MAX_REF_DEPTH after schema validation."""
+    if raw is None:
+        return
+    if isinstance(raw, bool) or not isinstance(raw, int):
+        raise ValidationError(
+            f"{command_name}: parameter 'max_depth' must be an integer",
+            field="max_depth",
+            details={},
+        )
+    if not 1 <= raw <= MAX_REF_DEPTH:
+        raise ValidationError(
+            f"{command_name}: parameter 'max_depth' must be between 1 and "
+            f"{MAX_REF_DEPTH}, got {raw!r}",
+            field="max_depth",
+            details={"minimum": 1, "maximum": MAX_REF_DEPTH},
+        )
+
+
 def _entity_identifier_present(
     entity_id: Optional[Any], entity_name: Optional[Any]
 ) -> tuple[bool, bool]:
@@ -100,6 +134,54 @@ def _normalize_entity_id_param(
     return None
 
 
+def _collect_entity_refs(
+    db: Any,
+    project_id: str,
+    entity_type: str,
+    entity_id: Optional[Any],
+    entity_name: Optional[str],
+    target_class: Optional[str],
+    root_path: Any,
+    *,
+    reverse: bool,
+    max_depth: int,
+    command_name: str,
+) -> Union[List[Dict[str, Any]], ErrorResult]:
+    """Resolve the entity in the project symbol graph and list its references.
+
+    An entity_id outside the project's graph falls back to the direct
+    entity_cross_ref query (one hop).
+    """
+    graph = get_project_symbol_graph(db, project_id)
+    eid = _normalize_entity_id_param(entity_id, command_name=command_name)
+    if eid is None:
+        if not entity_name:
+            return ErrorResult(
+                message="Provide entity_id or entity_name",
+                code="VALIDATION_ERROR",
+            )
+        node = resolve_entity_node_by_name(
+            graph, entity_type, entity_name, target_class
+        )
+        if node is None:
+            return ErrorResult(
+                message=f"Entity not found: {entity_type!r} {entity_name!r}",
+                code="ENTITY_NOT_FOUND",
+            )
+    else:
+        node = graph.entity_node(entity_type, eid)
+        if node is None:
+            via_execute = (
+                get_entity_dependents_via_execute
+                if reverse
+                else get_entity_dependencies_via_execute
+            )
+            return via_execute(db, entity_type, eid, root_path)
+    return get_entity_refs_via_graph(
+        graph, node, root_path, reverse=reverse, max_depth=max_depth or 1
+    )
+
+
 class GetEntityDependenciesMCPCommand(BaseMCPCommand):
     """Get dependencies of an entity (what it calls/uses) by entity id."""
 
@@ -159,6 +241,7 @@ class GetEntityDependenciesMCPCommand(BaseMCPCommand):
                         "Optional class name when entity_type is 'method' and entity_name is used."
                     ),
                 },
+                "max_depth": _MAX_DEPTH_SCHEMA,
             },
             "required": ["project_id", "entity_type"],
             "additionalProperties": False,
@@ -169,6 +252,7 @@ class GetEntityDependenciesMCPCommand(BaseMCPCommand):
         params = super().validate_params(params)
         _validate_entity_id_param(params.get("entity_id"), command_name=self.name)
         _validate_entity_identifier_params(params, command_name=self.name)
+        _validate_max_depth_param(params.get("max_depth"), command_name=self.name)
         return params
 
     async def execute(
@@ -178,6 +262,7 @@ class GetEntityDependenciesMCPCommand(BaseMCPCommand):
         entity_id: Optional[Any] = None,
         entity_name: Optional[str] = None,
         target_class: Optional[str] = None,
+        max_depth: int = 1,
         **kwargs,
     ) -> SuccessResult:
         """Execute the command."""
@@ -189,22 +274,20 @@ class GetEntityDependenciesMCPCommand(BaseMCPCommand):
                     message=f"entity_type must be one of {CALLER_TYPES!r}",
                     code="VALIDATION_ERROR",
                 )
-            eid = _normalize_entity_id_param(entity_id, command_name=self.name)
-            if eid is None:
-                if not entity_name:
-                    return ErrorResult(
-                        message="Provide entity_id or entity_name",
-                        code="VALIDATION_ERROR",
-                    )
-                eid = resolve_entity_id_by_name(
-                    db, project_id, entity_type, entity_name, target_class
-                )
-                if eid is None:
-                    return ErrorResult(
-                        message=f"Entity not found: {entity_type!r} {entity_name!r}",
-                        code="ENTITY_NOT_FOUND",
-                    )
-            deps = get_entity_dependencies_via_execute(db, entity_type, eid, root_path)
+            deps = _collect_entity_refs(
+                db,
+                project_id,
+                entity_type,
+                entity_id,
+                entity_name,
+                target_class,
+                root_path,
+                reverse=False,
+                max_depth=max_depth,
+                command_name=self.name,
+            )
+            if isinstance(deps, ErrorResult):
+                return deps
             return SuccessResult(data={"dependencies": deps})
         except Exception as e:
             return self._handle_error(
@@ -276,6 +359,7 @@ class GetEntityDependentsMCPCommand(BaseMCPCommand):
                         "Optional class name when entity_type is 'method' and entity_name is used."
                     ),
                 },
+                "max_depth": _MAX_DEPTH_SCHEMA,
             },
             "required": ["project_id", "entity_type"],
             "additionalProperties": False,
@@ -286,6 +370,7 @@ class GetEntityDependentsMCPCommand(BaseMCPCommand):
         params = super().validate_params(params)
         _validate_entity_id_param(params.get("entity_id"), command_name=self.name)
         _validate_entity_identifier_params(params, command_name=self.name)
+        _validate_max_depth_param(params.get("max_depth"), command_name=self.name)
         return params
 
     async def execute(
@@ -295,6 +380,7 @@ class GetEntityDependentsMCPCommand(BaseMCPCommand):
         entity_id: Optional[Any] = None,
         entity_name: Optional[str] = None,
         target_class: Optional[str] = None,
+        max_depth: int = 1,
         **kwargs,
     ) -> SuccessResult:
         """Execute the command."""
@@ -306,22 +392,20 @@ class GetEntityDependentsMCPCommand(BaseMCPCommand):
                     message=f"entity_type must be one of {CALLEE_TYPES!r}",
                     code="VALIDATION_ERROR",
                 )
-            eid = _normalize_entity_id_param(entity_id, command_name=self.name)
-            if eid is None:
-                if not entity_name:
-                    return ErrorResult(
-                        message="Provide entity_id or entity_name",
-                        code="VALIDATION_ERROR",
-                    )
-                eid = resolve_entity_id_by_name(
-                    db, project_id, entity_type, entity_name, target_class
-                )
-                if eid is None:
-                    return ErrorResult(
-                        message=f"Entity not found: {entity_type!r} {entity_name!r}",
-                        code="ENTITY_NOT_FOUND",
-                    )
-            deps = get_entity_dependents_via_execute(db, entity_type, eid, root_path)
+            deps = _collect_entity_refs(
+                db,
+                project_id,
+                entity_type,
+                entity_id,
+                entity_name,
+                target_class,
+                root_path,
+                reverse=True,
+                max_depth=max_depth,
+                command_name=self.name,
+            )
+            if isinstance(deps, ErrorResult):
+                return deps
             return SuccessResult(data={"dependents": deps})
         except Exception as e:
             return self._handle_error(
@@ -9,10 +9,12 @@ import uuid
 from typing import Any, Dict, List, Optional
 
 from ...core.file_identity import PathLike, relative_path_for_indexed_row
+from ...core.symbol_graph import SymbolGraph
 from ...core.uuid_validation import is_valid_uuid4
 
 CALLER_TYPES = ("class", "method", "function")
 CALLEE_TYPES = ("class", "method", "function")
+MAX_REF_DEPTH = 10
 
 
 def _bind_entity_id_for_cross_ref(entity_id: Any) -> Any:
@@ -226,3 +228,61 @@ def get_entity_dependents_via_execute(
             entry["cst_node_id"] = cst_node_id
         out.append(entry)
     return out
+
+
+def resolve_entity_node_by_name(
+    graph: SymbolGraph,
+    entity_type: str,
+    entity_name: str,
+    target_class: Optional[str] = None,
+) -> Optional[int]:
+    """Resolve entity name to a symbol graph node (first match in file path order)."""
+    if entity_type not in CALLER_TYPES:
+        return None
+    name = entity_name
+    if entity_type == "method" and target_class:
+        name = f"{target_class}.{entity_name}"
+    nodes = graph.nodes_named(entity_type, name)
+    return nodes[0] if nodes else None
+
+
+def get_entity_refs_via_graph(
+    graph: SymbolGraph,
+    node: int,
+    project_root: Optional[PathLike] = None,
+    *,
+    reverse: bool = False,
+    max_depth: int = 1,
+) -> List[Dict[str, Any]]:
+    """Get dependencies (or dependents if ``reverse``) of a graph node.
+
+    Same entries as :func:`get_entity_dependencies_via_execute` /
+    :func:`get_entity_dependents_via_execute`; with ``max_depth`` > 1 the walk
+    follows edges transitively and each entry also carries its ``depth``.
+    """
+    role = "caller" if reverse else "callee"
+    path_by_file: Dict[int, str] = {}
+    out: List[Dict[str, Any]] = []
+    for depth, edge in graph.walk_refs(node, reverse=reverse, max_depth=max_depth):
+        other = edge.source if reverse else edge.target
+        file_path = ""
+        if edge.file >= 0:
+            file_path = path_by_file.get(edge.file, "")
+            if edge.file not in path_by_file:
+                file_path = path_by_file[edge.file] = relative_path_for_indexed_row(
+                    graph.file_row(edge.file), project_root
+                )
+        entry: Dict[str, Any] = {
+            f"{role}_entity_type": graph.kind(other),
+            f"{role}_entity_id": graph.entity_id(other),
+            "ref_type": edge.ref_type,
+            "file_path": file_path,
+            "line": edge.line,
+        }
+        cst_node_id = graph.cst_node_id(other)
+        if is_valid_uuid4(cst_node_id):
+            entry["cst_node_id"] = cst_node_id
+        if max_depth != 1:
+            entry["depth"] = depth
+        out.append(entry)
+    return out
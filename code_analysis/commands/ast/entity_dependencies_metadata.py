@@ -7,7 +7,7 @@ email: vasilyvz@gmail.com
 
 from typing import Any, Dict
 
-from .entity_dependencies_helpers import CALLEE_TYPES, CALLER_TYPES
+from .entity_dependencies_helpers import CALLEE_TYPES, CALLER_TYPES, MAX_REF_DEPTH
 
 
 def get_entity_dependencies_metadata() -> Dict[str, Any]:
@@ -22,7 +22,8 @@ def get_entity_dependencies_metadata() -> Dict[str, Any]:
         "author": "Vasiliy Zdanovskiy",
         "email": "vasilyvz@gmail.com",
         "parameters_summary": (
-            "Required: project_id, entity_type. Optional: entity_id, entity_name, target_class. "
+            "Required: project_id, entity_type. Optional: entity_id, entity_name, target_class, "
+            "max_depth. "
             "No limit parameter; provide either entity_id or entity_name."
         ),
         "detailed_description": (
@@ -34,8 +35,9 @@ def get_entity_dependencies_metadata() -> Dict[str, Any]:
             "2. Opens database connection for the project\n"
             "3. If entity_name given, resolves entity_name + entity_type to entity_id in the project; "
             "if entity_id given, uses it\n"
-            "4. Queries entity_cross_ref table by caller_* column (class_id, method_id, or function_id)\n"
-            "5. Resolves file_id to file_path and cst_node_id via JOIN with classes/methods/functions\n"
+            "4. Looks up outgoing entity_cross_ref edges in the cached project symbol graph "
+            "(following them up to max_depth hops)\n"
+            "5. Resolves the call-site file_id to file_path and the callee's cst_node_id\n"
             "6. Returns list of callee entities with type, id, ref_type, file_path, line, cst_node_id (only valid UUID4)\n\n"
             "Data source: entity_cross_ref table; ref_type: 'call', 'instantiation', 'attribute', 'inherit'. "
             "Use entity_name + entity_type when you have the name from code. Use entity_id when you have the id. "
@@ -75,6 +77,17 @@ def get_entity_dependencies_metadata() -> Dict[str, Any]:
                 "type": "string",
                 "required": False,
             },
+            "max_depth": {
+                "description": (
+                    "Reference hops to follow (1 = direct only). Above 1 the walk is "
+                    "transitive and each entry carries 'depth'."
+                ),
+                "type": "integer",
+                "required": False,
+                "default": 1,
+                "minimum": 1,
+                "maximum": MAX_REF_DEPTH,
+            },
         },
         "usage_examples": [
             {
@@ -152,7 +165,8 @@ def get_entity_dependents_metadata() -> Dict[str, Any]:
         "author": "Vasiliy Zdanovskiy",
         "email": "vasilyvz@gmail.com",
         "parameters_summary": (
-            "Required: project_id, entity_type. Optional: entity_id, entity_name, target_class. "
+            "Required: project_id, entity_type. Optional: entity_id, entity_name, target_class, "
+            "max_depth. "
             "No limit parameter; provide either entity_id or entity_name."
         ),
         "detailed_description": (
@@ -162,7 +176,8 @@ def get_entity_dependents_metadata() -> Dict[str, Any]:
             "Operation flow:\n"
             "1. Validates project_id via project registry\n"
             "2. Opens database connection for the project; if entity_name given, resolves to entity_id\n"
-            "3. Queries entity_cross_ref by callee_* column\n"
+            "3. Looks up incoming entity_cross_ref edges in the cached project symbol graph "
+            "(following them up to max_depth hops)\n"
             "4. Returns list of caller entities with type, id, ref_type, file_path, line, cst_node_id (valid UUID4)\n\n"
             "Use for impact analysis before renaming or deleting. Run update_indexes after code changes."
         ),
@@ -200,6 +215,17 @@ def get_entity_dependents_metadata() -> Dict[str, Any]:
                 "type": "string",
                 "required": False,
             },
+            "max_depth": {
+                "description": (
+                    "Reference hops to follow (1 = direct only). Above 1 the walk is "
+                    "transitive and each entry carries 'depth'."
+                ),
+                "type": "integer",
+                "required": False,
+                "default": 1,
+                "minimum": 1,
+                "maximum": MAX_REF_DEPTH,
+            },
         },
         "usage_examples": [
             {
@@ -5,7 +5,6 @@ Author: Vasiliy Zdanovskiy
 email: vasilyvz@gmail.com
 """
 
-import json
 import uuid
 from typing import Any, Dict, List, Optional
 
@@ -14,6 +13,7 @@ from mcp_proxy_adapter.commands.result import ErrorResult, SuccessResult
 from ..base_mcp_command import BaseMCPCommand
 from ...core.exceptions import ValidationError
 from ...core.file_identity import relative_path_for_indexed_row
+from ...core.symbol_graph import get_project_symbol_graph
 from .graph_entity_nodes import (
     build_entity_nodes_call_graph,
     build_entity_nodes_hierarchy,
@@ -188,38 +188,20 @@ class ExportGraphMCPCommand(BaseMCPCommand):
                 edges: list[dict[str, str]] = []
                 entity_nodes: List[Dict[str, str]] = []
 
+                graph = get_project_symbol_graph(db, proj_id)
+
                 if graph_type == "hierarchy":
-                    result = db.execute(
-                        """
-                        SELECT c.name, c.bases, f.path AS file_path, f.relative_path,
-                               c.cst_node_id
-                        FROM classes c
-                        JOIN files f ON f.id = c.file_id
-                        WHERE f.project_id = ?
-                        """,
-                        (proj_id,),
-                    )
-                    rows = result.get("data", [])
+                    class_nodes = list(graph.entities("class"))
                     entity_nodes = build_entity_nodes_hierarchy(
-                        rows, _is_valid_uuid4, root_path
+                        graph, class_nodes, _is_valid_uuid4, root_path
                     )
 
-                    for r in rows:
-                        child = r.get("name") if hasattr(r, "get") else r["name"]
-                        bases_raw = r.get("bases") if hasattr(r, "get") else r["bases"]
-                        if not child:
+                    for node in class_nodes:
+                        child_s = graph.name(node)
+                        if not child_s:
                             continue
-                        child_s = str(child)
                         nodes.add(child_s)
-                        if not bases_raw:
-                            continue
-                        bases_list: list[str] = []
-                        try:
-                            bases_list = json.loads(bases_raw)
-                        except Exception:
-                            bases_list = []
-                        for b in bases_list or []:
-                            base_s = str(b)
+                        for base_s in graph.bases(node):
                             if not base_s:
                                 continue
                             nodes.add(base_s)
@@ -229,113 +211,38 @@ class ExportGraphMCPCommand(BaseMCPCommand):
                         if len(edges) >= edge_limit:
                             break
 
-                elif graph_type == "call_graph":
-                    where_extra = ""
-                    params: list[Any] = [proj_id]
-                    if file_path:
-                        where_extra = " AND f.path = ?"
-                        params.append(file_path)
-
-                    result = db.execute(
-                        """
-                        SELECT f.path AS file_path, f.relative_path, u.target_name,
-                               u.target_class
-                        FROM usages u
-                        JOIN files f ON f.id = u.file_id
-                        WHERE f.project_id = ?
-                        """ + where_extra,
-                        tuple(params),
-                    )
-                    rows = result.get("data", [])
-                    for r in rows:
-                        raw_src = (
-                            r.get("file_path") if hasattr(r, "get") else r["file_path"]
-                        )
-                        raw_rel = (
-                            r.get("relative_path")
-                            if hasattr(r, "get")
-                            else r["relative_path"]
-                        )
-                        src = (
-                            relative_path_for_indexed_row(
-                                {"path": raw_src, "relative_path": raw_rel}, root_path
-                            )
-                            if raw_src
-                            else raw_src
-                        )
-                        target_name = (
-                            r.get("target_name")
-                            if hasattr(r, "get")
-                            else r["target_name"]
-                        )
-                        target_class = (
-                            r.get("target_class")
-                            if hasattr(r, "get")
-                            else r["target_class"]
-                        )
-                        if not src or not target_name:
-                            continue
-                        dst = (
-                            f"{target_class}.{target_name}"
-                            if target_class
-                            else str(target_name)
-                        )
-                        nodes.add(str(src))
-                        nodes.add(str(dst))
-                        edges.append({"from": str(src), "to": str(dst)})
-                        if len(edges) >= edge_limit:
-                            break
-
-                    to_node_ids = {str(e["to"]) for e in edges}
-                    entity_nodes = build_entity_nodes_call_graph(
-                        db, proj_id, to_node_ids, _is_valid_uuid4, root_path
-                    )
-
                 else:
-                    where_extra = ""
-                    params = [proj_id]
-                    if file_path:
-                        where_extra = " AND f.path = ?"
-                        params.append(file_path)
-
-                    result = db.execute(
-                        """
-                        SELECT f.path AS file_path, f.relative_path, i.module, i.name
-                        FROM imports i
-                        JOIN files f ON f.id = i.file_id
-                        WHERE f.project_id = ?
-                        """ + where_extra,
-                        tuple(params),
+                    relation = "uses" if graph_type == "call_graph" else "imports"
+                    scope = graph.file_node(file_path) if file_path else None
+                    symbol_edges = (
+                        graph.symbol_edges(relation, scope)
+                        if scope is not None or not file_path
+                        else iter(())
                     )
-                    rows = result.get("data", [])
-                    for r in rows:
-                        raw_src = (
-                            r.get("file_path") if hasattr(r, "get") else r["file_path"]
-                        )
-                        raw_rel = (
-                            r.get("relative_path")
-                            if hasattr(r, "get")
-                            else r["relative_path"]
-                        )
-                        src = (
-                            relative_path_for_indexed_row(
-                                {"path": raw_src, "relative_path": raw_rel}, root_path
+                    src_by_file: Dict[int, str] = {}
+                    for file_node, dst, _line in symbol_edges:
+                        src = src_by_file.get(file_node)
+                        if src is None:
+                            raw = graph.file_row(file_node)
+                            src = src_by_file[file_node] = (
+                                relative_path_for_indexed_row(raw, root_path)
+                                if raw.get("path")
+                                else ""
                             )
-                            if raw_src
-                            else raw_src
-                        )
-                        module = r.get("module") if hasattr(r, "get") else r["module"]
-                        name = r.get("name") if hasattr(r, "get") else r["name"]
-                        dst_val = module or name
-                        if not src or not dst_val:
+                        if not src:
                             continue
-                        dst = str(dst_val)
-                        nodes.add(str(src))
+                        nodes.add(src)
                         nodes.add(dst)
-                        edges.append({"from": str(src), "to": dst})
+                        edges.append({"from": src, "to": dst})
                         if len(edges) >= edge_limit:
                             break
 
+                    if graph_type == "call_graph":
+                        to_node_ids = {str(e["to"]) for e in edges}
+                        entity_nodes = build_entity_nodes_call_graph(
+                            graph, to_node_ids, _is_valid_uuid4, root_path
+                        )
+
                 node_list = sorted(nodes)
 
                 if format == "json":
@@ -13,6 +13,7 @@ from .file_resolution import resolve_project_file_record
 from ..base_mcp_command import BaseMCPCommand
 from ...core.exceptions import ValidationError
 from ...core.file_identity import relative_path_for_indexed_row
+from ...core.symbol_graph import get_project_symbol_graph
 from ...core.uuid_validation import is_valid_uuid4 as _is_valid_uuid4
 
 
@@ -75,20 +76,9 @@ class GetClassHierarchyMCPCommand(BaseMCPCommand):
             db = self._open_database()
             proj_id = project_id
 
-            # Get class hierarchy from database
-            # Classes table has 'bases' field (JSON array of base class names)
-            import json
-
-            hierarchy = {}
-
-            # Get all classes for the project
-            query = """
-                SELECT c.*, f.path as file_path, f.relative_path as file_relative_path
-                FROM classes c
-                JOIN files f ON c.file_id = f.id
-                WHERE f.project_id = ?
-            """
-            params = [proj_id]
+            hierarchy: Dict[str, Dict[str, Any]] = {}
+            graph = get_project_symbol_graph(db, proj_id)
+            file_node: Optional[int] = None
 
             if file_path:
                 resolution = resolve_project_file_record(
@@ -98,7 +88,12 @@ class GetClassHierarchyMCPCommand(BaseMCPCommand):
                     file_path=file_path,
                 )
                 file_record = resolution["file_record"]
-                if not file_record:
+                file_node = (
+                    graph.entity_node("file", file_record["id"])
+                    if file_record
+                    else None
+                )
+                if file_node is None:
                     db.disconnect()
                     return SuccessResult(
                         data={
@@ -108,47 +103,20 @@ class GetClassHierarchyMCPCommand(BaseMCPCommand):
                             "count": 0,
                         }
                     )
-                query += " AND c.file_id = ?"
-                params.append(file_record["id"])
-
-            result = db.execute(query, tuple(params))
-            rows = result.get("data", [])
 
-            for row in rows:
-                class_info = row
-                class_name_val = class_info["name"]
-                node_id = class_info.get("cst_node_id")
-                if not class_info.get("file_path"):
+            for node in graph.entities("class", file_node):
+                class_name_val = graph.name(node)
+                file_row = graph.file_row(node)
+                if not file_row.get("path"):
                     continue
-                file_path_val = relative_path_for_indexed_row(
-                    {
-                        "path": class_info.get("file_path"),
-                        "relative_path": class_info.get("file_relative_path"),
-                    },
-                    root_path,
-                )
-
-                bases_str = class_info.get("bases")
-                # Parse bases (JSON array or string)
-                bases = []
-                if bases_str:
-                    try:
-                        if isinstance(bases_str, str):
-                            bases = json.loads(bases_str)
-                        else:
-                            bases = bases_str
-                        if not isinstance(bases, list):
-                            bases = [bases] if bases else []
-                    except (json.JSONDecodeError, TypeError):
-                        bases = []
-
                 entity: Dict[str, Any] = {
                     "name": class_name_val,
-                    "file_path": file_path_val,
-                    "line": class_info.get("line"),
-                    "bases": bases,
+                    "file_path": relative_path_for_indexed_row(file_row, root_path),
+                    "line": graph.line(node),
+                    "bases": list(graph.bases(node)),
                     "children": [],
                 }
+                node_id = graph.cst_node_id(node)
                 if _is_valid_uuid4(node_id):
                     entity["cst_node_id"] = node_id
                 hierarchy[class_name_val] = entity
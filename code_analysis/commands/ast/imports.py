@@ -5,12 +5,23 @@ Author: Vasiliy Zdanovskiy
 email: vasilyvz@gmail.com
 """
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 from mcp_proxy_adapter.commands.result import ErrorResult, SuccessResult
 
 from .file_resolution import resolve_project_file_record
 from ..base_mcp_command import BaseMCPCommand
+from ...core.exceptions import ValidationError
+from ...core.list_pagination import (
+    DEFAULT_LIST_PAGE_SIZE,
+    apply_keyset_page_fields,
+    keyset_after_sql,
+    list_cursor_schema_property,
+    resolve_list_cursor,
+    walk_keyset_sources,
+)
+
+_CURSOR_SCOPE = "get_imports"
 
 
 class GetImportsMCPCommand(BaseMCPCommand):
@@ -54,6 +65,7 @@ class GetImportsMCPCommand(BaseMCPCommand):
                     "description": "Offset for pagination",
                     "default": 0,
                 },
+                **list_cursor_schema_property(),
             },
             "required": ["project_id"],
             "additionalProperties": False,
@@ -67,9 +79,16 @@ class GetImportsMCPCommand(BaseMCPCommand):
         module_name: Optional[str] = None,
         limit: Optional[int] = None,
         offset: int = 0,
+        cursor: Optional[str] = None,
         **kwargs,
-    ) -> SuccessResult:
+    ) -> SuccessResult | ErrorResult:
         """Execute the command."""
+        try:
+            keyset_mode, after = resolve_list_cursor(
+                {"cursor": cursor}, scope=_CURSOR_SCOPE, key_length=4
+            )
+        except ValidationError as e:
+            return self._handle_error(e, "VALIDATION_ERROR", "get_imports")
         try:
             root_path = self._resolve_project_root(project_id)
             db = self._open_database()
@@ -77,7 +96,7 @@ class GetImportsMCPCommand(BaseMCPCommand):
 
             # Get imports from database
             query = "SELECT * FROM imports WHERE file_id IN (SELECT id FROM files WHERE project_id = ?)"
-            params = [proj_id]
+            params: List[Any] = [proj_id]
 
             if file_path:
                 resolution = resolve_project_file_record(
@@ -109,12 +128,47 @@ class GetImportsMCPCommand(BaseMCPCommand):
                 query += " AND module LIKE ?"
                 params.append(f"%{module_name}%")
 
-            query += " ORDER BY file_id, line"
+            if keyset_mode:
+
+                def fetch_after(resume: Any, fetch_limit: int) -> List[Any]:
+                    keyset, keyset_params = keyset_after_sql(
+                        ("file_id", "line", "id"), resume
+                    )
+                    page_query = query + keyset + " ORDER BY file_id, line, id LIMIT ?"
+                    page_rows = db.execute(
+                        page_query, (*params, *keyset_params, fetch_limit)
+                    ).get("data", [])
+                    return [
+                        ((row.get("file_id"), row.get("line"), row.get("id")), row)
+                        for row in page_rows
+                    ]
+
+                imports, next_key = walk_keyset_sources(
+                    [fetch_after],
+                    page_size=limit or DEFAULT_LIST_PAGE_SIZE,
+                    after=after,
+                )
+                db.disconnect()
+                return SuccessResult(
+                    data=apply_keyset_page_fields(
+                        {
+                            "success": True,
+                            "imports": imports,
+                            "count": len(imports),
+                        },
+                        scope=_CURSOR_SCOPE,
+                        next_key=next_key,
+                    )
+                )
+
+            query += " ORDER BY file_id, line, id"
 
             if limit:
-                query += f" LIMIT {limit}"
+                query += " LIMIT ?"
+                params.append(int(limit))
             if offset:
-                query += f" OFFSET {offset}"
+                query += " OFFSET ?"
+                params.append(int(offset))
 
             result = db.execute(query, tuple(params))
             rows = result.get("data", [])
@@ -236,6 +290,15 @@ class GetImportsMCPCommand(BaseMCPCommand):
                     "required": False,
                     "default": 0,
                 },
+                "cursor": {
+                    "description": (
+                        "Opaque keyset cursor. Empty string starts a cursor walk "
+                        "(page size = limit, default 20); pass next_cursor from the "
+                        "previous response for the next page. Overrides offset."
+                    ),
+                    "type": "string",
+                    "required": False,
+                },
                 "project_id": {
                     "description": (
                         "Optional project UUID. If omitted, inferred from root_dir."
@@ -333,6 +396,10 @@ class GetImportsMCPCommand(BaseMCPCommand):
                             "- Additional database fields as available"
                         ),
                         "count": "Number of imports found",
+                        "next_cursor": (
+                            "Cursor mode only: pass as cursor for the next page; "
+                            "null on the last page"
+                        ),
                     },
                     "example": {
                         "success": True,
@@ -10,13 +10,22 @@ from typing import Any, Dict, List, Optional
 from mcp_proxy_adapter.commands.result import ErrorResult, SuccessResult
 
 from .file_resolution import resolve_project_file_record
-from .list_entities_page import count_code_entities, fetch_code_entities_page
+from .list_entities_page import (
+    count_code_entities,
+    entity_keyset_length,
+    fetch_code_entities_keyset,
+    fetch_code_entities_page,
+)
 from ..base_mcp_command import BaseMCPCommand
 from ...core.exceptions import ValidationError
 from ...core.list_pagination import (
+    build_keyset_page_payload,
     build_list_page_payload,
+    list_cursor_schema_property,
     list_pagination_schema_properties,
+    resolve_list_cursor,
     resolve_list_pagination,
+    walk_keyset_sources,
 )
 from ...core.uuid_validation import is_valid_uuid4 as _is_valid_uuid4
 
@@ -25,11 +34,12 @@ class ListCodeEntitiesMCPCommand(BaseMCPCommand):
     """List code entities (classes, functions, methods) in a file or project."""
 
     name = "list_code_entities"
-    version = "1.1.0"
+    version = "1.2.0"
     descr = (
         "List classes, functions, or methods in a file or project. "
         "Returns paginated ``items`` (default ``page_size`` 20); use "
-        "``block_position`` for the next page."
+        "``block_position`` for the next page, or ``cursor`` / ``next_cursor`` "
+        "to walk large projects."
     )
     category = "ast"
     author = "Vasiliy Zdanovskiy"
@@ -55,6 +65,7 @@ class ListCodeEntitiesMCPCommand(BaseMCPCommand):
                     "description": "Optional file path to filter by (relative to project root)",
                 },
                 **pagination,
+                **list_cursor_schema_property(),
             },
             "required": ["project_id"],
             "additionalProperties": False,
@@ -69,8 +80,9 @@ class ListCodeEntitiesMCPCommand(BaseMCPCommand):
         block_position: Optional[int] = None,
         limit: Optional[int] = None,
         offset: int = 0,
+        cursor: Optional[str] = None,
         **kwargs,
-    ) -> SuccessResult:
+    ) -> SuccessResult | ErrorResult:
         """Execute the command."""
         params: Dict[str, Any] = {
             "project_id": project_id,
@@ -80,6 +92,7 @@ class ListCodeEntitiesMCPCommand(BaseMCPCommand):
             "block_position": block_position,
             "limit": limit,
             "offset": offset,
+            "cursor": cursor,
         }
         params.update(kwargs)
         try:
@@ -90,6 +103,15 @@ class ListCodeEntitiesMCPCommand(BaseMCPCommand):
         entity_type = params.get("entity_type")
         file_path = params.get("file_path")
         page_size, offset, block_position = resolve_list_pagination(params)
+        cursor_scope = f"list_code_entities:{entity_type or 'all'}"
+        try:
+            keyset_mode, after = resolve_list_cursor(
+                params,
+                scope=cursor_scope,
+                key_length=1 + entity_keyset_length(entity_type),
+            )
+        except ValidationError as e:
+            return self._handle_error(e, "VALIDATION_ERROR", "list_code_entities")
 
         try:
             root_path = self._resolve_project_root(project_id)
@@ -119,6 +141,33 @@ class ListCodeEntitiesMCPCommand(BaseMCPCommand):
                     )
                 resolved_file_id = file_record["id"]
 
+            if keyset_mode:
+                entities, next_key = walk_keyset_sources(
+                    [
+                        lambda resume, fetch_limit: fetch_code_entities_keyset(
+                            db,
+                            project_id=proj_id,
+                            entity_type=entity_type,
+                            file_id=resolved_file_id,
+                            limit=fetch_limit,
+                            after=resume,
+                            project_root=root_path,
+                        )
+                    ],
+                    page_size=page_size,
+                    after=after,
+                )
+                db.disconnect()
+                return SuccessResult(
+                    data=build_keyset_page_payload(
+                        items=entities,
+                        page_size=page_size,
+                        scope=cursor_scope,
+                        next_key=next_key,
+                        legacy_items_key="entities",
+                    )
+                )
+
             total = count_code_entities(
                 db,
                 project_id=proj_id,
@@ -202,7 +251,10 @@ class ListCodeEntitiesMCPCommand(BaseMCPCommand):
                 "- If entity_type is null, returns all types combined\n"
                 "- Each entity includes 'type' field indicating its type\n"
                 "- Results ordered by file_path and line number\n"
-                "- Supports pagination with limit and offset"
+                "- Supports pagination with limit and offset\n"
+                "- For full walks of large projects pass cursor='' and then each "
+                "response's next_cursor: keyset pages cost the same at any depth "
+                "and do not shift while indexing runs (no total in cursor mode)"
             ),
             "parameters": {
                 "root_dir": {
@@ -247,6 +299,15 @@ class ListCodeEntitiesMCPCommand(BaseMCPCommand):
                     "required": False,
                     "default": 0,
                 },
+                "cursor": {
+                    "description": (
+                        "Opaque keyset cursor. Empty string starts a cursor walk; "
+                        "pass next_cursor from the previous response for the next "
+                        "page. Overrides offset/block_position."
+                    ),
+                    "type": "string",
+                    "required": False,
+                },
                 "project_id": {
                     "description": (
                         "Optional project UUID. If omitted, inferred from root_dir."
@@ -331,6 +392,10 @@ class ListCodeEntitiesMCPCommand(BaseMCPCommand):
                             "- All entities matching the filters are returned regardless of cst_node_id"
                         ),
                         "count": "Number of entities found",
+                        "next_cursor": (
+                            "Cursor mode only: pass as cursor for the next page; "
+                            "null on the last page"
+                        ),
                     },
                     "example": {
                         "success": True,
@@ -7,9 +7,10 @@ email: vasilyvz@gmail.com
 
 from __future__ import annotations
 
-from typing import Any, List, Optional
+from typing import Any, List, Optional, Sequence, Tuple
 
 from ...core.file_identity import PathLike, relative_path_for_indexed_row
+from ...core.list_pagination import KeysetKey, keyset_after_sql
 
 # Entity-listing predicate (kept as a per-alias template so callers are unchanged).
 # Historically this required a populated ``cst_node_id``, but that column is NULL
@@ -77,26 +78,32 @@ def count_code_entities(
     parts: List[str] = []
     params: List[Any] = []
     ff, ff_params = _file_filter_sql("c.file_id", file_id)
-    parts.append(f"""
+    parts.append(
+        f"""
         SELECT c.id FROM classes c
         JOIN files f ON c.file_id = f.id
         WHERE f.project_id = ? AND {_CST_WHERE.format(alias='c')}{ff}
-        """)
+        """
+    )
     params.extend([project_id, *ff_params])
     ff, ff_params = _file_filter_sql("func.file_id", file_id)
-    parts.append(f"""
+    parts.append(
+        f"""
         SELECT func.id FROM functions func
         JOIN files f ON func.file_id = f.id
         WHERE f.project_id = ? AND {_CST_WHERE.format(alias='func')}{ff}
-        """)
+        """
+    )
     params.extend([project_id, *ff_params])
     ff, ff_params = _file_filter_sql("c.file_id", file_id)
-    parts.append(f"""
+    parts.append(
+        f"""
         SELECT m.id FROM methods m
         JOIN classes c ON m.class_id = c.id
         JOIN files f ON c.file_id = f.id
         WHERE f.project_id = ? AND {_CST_WHERE.format(alias='m')}{ff}
-        """)
+        """
+    )
     params.extend([project_id, *ff_params])
     sql = "SELECT COUNT(*) AS cnt FROM (" + " UNION ALL ".join(parts) + ") AS combined"
     result = db.execute(sql, tuple(params))
@@ -122,6 +129,66 @@ def fetch_code_entities_page(
     from ``files.relative_path``, with a ``project_root``-aware legacy
     fallback via :func:`relative_path_for_indexed_row`).
     """
+    return [
+        entity
+        for _key, entity in _fetch_entities(
+            db,
+            project_id=project_id,
+            entity_type=entity_type,
+            file_id=file_id,
+            limit=limit,
+            offset=offset,
+            after=None,
+            project_root=project_root,
+        )
+    ]
+
+
+def entity_keyset_length(entity_type: Optional[str]) -> int:
+    """Return the keyset key length for ``entity_type`` (combined adds ``type``)."""
+    return 3 if entity_type in ("class", "function", "method") else 4
+
+
+def fetch_code_entities_keyset(
+    db: Any,
+    *,
+    project_id: str,
+    entity_type: Optional[str],
+    file_id: Optional[Any],
+    limit: int,
+    after: Optional[Sequence[Any]],
+    project_root: Optional[PathLike] = None,
+) -> List[Tuple[KeysetKey, dict[str, Any]]]:
+    """Fetch up to ``limit`` ``(key, entity)`` pairs sorting after ``after``.
+
+    Same ordering as :func:`fetch_code_entities_page`; the key is
+    ``(files.path, line, id)`` (``(files.path, line, type, id)`` when all kinds
+    are combined) and resumes with a row-value comparison instead of OFFSET.
+    """
+    return _fetch_entities(
+        db,
+        project_id=project_id,
+        entity_type=entity_type,
+        file_id=file_id,
+        limit=limit,
+        offset=0,
+        after=after,
+        project_root=project_root,
+    )
+
+
+def _fetch_entities(
+    db: Any,
+    *,
+    project_id: str,
+    entity_type: Optional[str],
+    file_id: Optional[Any],
+    limit: int,
+    offset: int,
+    after: Optional[Sequence[Any]],
+    project_root: Optional[PathLike] = None,
+) -> List[Tuple[KeysetKey, dict[str, Any]]]:
+    """Return ``(key, entity)`` pairs for one offset or keyset page."""
     if entity_type == "class":
         return _fetch_typed(
             db,
@@ -132,11 +199,13 @@ def fetch_code_entities_page(
             JOIN files f ON c.file_id = f.id
             WHERE f.project_id = ? AND {_CST_WHERE.format(alias='c')}
             """,
+            alias="c",
             file_column="c.file_id",
             file_id=file_id,
             project_id=project_id,
             limit=limit,
             offset=offset,
+            after=after,
             project_root=project_root,
         )
     if entity_type == "function":
@@ -149,32 +218,41 @@ def fetch_code_entities_page(
             JOIN files f ON func.file_id = f.id
             WHERE f.project_id = ? AND {_CST_WHERE.format(alias='func')}
             """,
+            alias="func",
             file_column="func.file_id",
             file_id=file_id,
             project_id=project_id,
             limit=limit,
             offset=offset,
+            after=after,
             project_root=project_root,
         )
     if entity_type == "method":
-        extra, extra_params = _file_filter_sql("c.file_id", file_id)
-        sql = f"""
+        return _fetch_typed(
+            db,
+            entity_kind="method",
+            sql=f"""
             SELECT m.*, c.name AS class_name, f.path AS file_path,
                    f.relative_path AS file_relative_path
             FROM methods m
             JOIN classes c ON m.class_id = c.id
             JOIN files f ON c.file_id = f.id
             WHERE f.project_id = ? AND {_CST_WHERE.format(alias='m')}
-            {extra}
-            ORDER BY f.path, m.line
-            LIMIT ? OFFSET ?
-        """
-        params: List[Any] = [project_id, *extra_params, limit, offset]
-        return _rows_to_entities(db, "method", sql, params, project_root=project_root)
+            """,
+            alias="m",
+            file_column="c.file_id",
+            file_id=file_id,
+            project_id=project_id,
+            limit=limit,
+            offset=offset,
+            after=after,
+            project_root=project_root,
+        )
 
     ff_c, ff_c_params = _file_filter_sql("c.file_id", file_id)
     ff_f, ff_f_params = _file_filter_sql("func.file_id", file_id)
     ff_m, ff_m_params = _file_filter_sql("c.file_id", file_id)
+    keyset, keyset_params = keyset_after_sql(("file_path", "line", "type", "id"), after)
     sql = f"""
         SELECT * FROM (
             SELECT 'class' AS type, c.id, c.file_id, c.name, c.line, c.bases,
@@ -198,8 +276,9 @@ def fetch_code_entities_page(
             JOIN files f ON c.file_id = f.id
             WHERE f.project_id = ? AND {_CST_WHERE.format(alias='m')}{ff_m}
         ) AS combined
-        ORDER BY file_path, line
-        LIMIT ? OFFSET ?
+        WHERE 1=1{keyset}
+        ORDER BY file_path, line, type, id
+        {_page_sql(after)}
     """
     params = [
         project_id,
@@ -208,16 +287,17 @@ def fetch_code_entities_page(
         *ff_f_params,
         project_id,
         *ff_m_params,
-        limit,
-        offset,
+        *keyset_params,
+        *_page_params(after, limit, offset),
     ]
     result = db.execute(sql, tuple(params))
     rows = result.get("data") or []
-    entities: List[dict[str, Any]] = []
+    entities: List[Tuple[KeysetKey, dict[str, Any]]] = []
     for row in rows:
         if not row.get("file_path"):
             continue
         entity = dict(row)
+        key = tuple(entity.get(name) for name in ("file_path", "line", "type", "id"))
         entity["file_path"] = relative_path_for_indexed_row(
             {
                 "path": entity.pop("file_path", None),
@@ -225,10 +305,20 @@ def fetch_code_entities_page(
             },
             project_root,
         )
-        entities.append(entity)
+        entities.append((key, entity))
     return entities
 
 
+def _page_sql(after: Optional[Sequence[Any]]) -> str:
+    """Return the LIMIT clause: keyset pages never use OFFSET."""
+    return "LIMIT ?" if after is not None else "LIMIT ? OFFSET ?"
+
+
+def _page_params(after: Optional[Sequence[Any]], limit: int, offset: int) -> List[Any]:
+    """Return params for :func:`_page_sql`."""
+    return [limit] if after is not None else [limit, offset]
+
+
 def _count_table(
     db: Any,
     sql: str,
@@ -251,17 +341,33 @@ def _fetch_typed(
     *,
     entity_kind: str,
     sql: str,
+    alias: str,
     file_column: str,
     file_id: Optional[Any],
     project_id: str,
     limit: int,
     offset: int,
+    after: Optional[Sequence[Any]],
     project_root: Optional[PathLike] = None,
-) -> List[dict[str, Any]]:
+) -> List[Tuple[KeysetKey, dict[str, Any]]]:
     """Return fetch typed."""
     extra, extra_params = _file_filter_sql(file_column, file_id)
-    full_sql = sql.strip() + extra + " ORDER BY f.path, line LIMIT ? OFFSET ?"
-    params = [project_id, *extra_params, limit, offset]
+    keyset, keyset_params = keyset_after_sql(
+        ("f.path", f"{alias}.line", f"{alias}.id"), after
+    )
+    full_sql = (
+        sql.strip()
+        + extra
+        + keyset
+        + f" ORDER BY f.path, {alias}.line, {alias}.id "
+        + _page_sql(after)
+    )
+    params = [
+        project_id,
+        *extra_params,
+        *keyset_params,
+        *_page_params(after, limit, offset),
+    ]
     return _rows_to_entities(
         db, entity_kind, full_sql, params, project_root=project_root
     )
@@ -274,15 +380,16 @@ def _rows_to_entities(
     params: List[Any],
     *,
     project_root: Optional[PathLike] = None,
-) -> List[dict[str, Any]]:
+) -> List[Tuple[KeysetKey, dict[str, Any]]]:
     """Return rows to entities."""
     result = db.execute(sql, tuple(params))
     rows = result.get("data") or []
-    entities: List[dict[str, Any]] = []
+    entities: List[Tuple[KeysetKey, dict[str, Any]]] = []
     for row in rows:
         if not row.get("file_path"):
             continue
         entity = {"type": entity_kind, **row}
+        key = tuple(entity.get(name) for name in ("file_path", "line", "id"))
         entity["file_path"] = relative_path_for_indexed_row(
             {
                 "path": entity.pop("file_path", None),
@@ -290,5 +397,5 @@ def _rows_to_entities(
             },
             project_root,
         )
-        entities.append(entity)
+        entities.append((key, entity))
     return entities
@@ -18,6 +18,14 @@ from ...core.cst_tree.tree_builder import load_file_to_tree
 from ...core.cst_tree.tree_range_finder import find_node_by_range
 from ...core.database_driver_pkg.domain.files import get_file_by_path
 from ...core.file_identity import relative_path_for_indexed_row
+from ...core.list_pagination import (
+    DEFAULT_LIST_PAGE_SIZE,
+    SqlListSource,
+    apply_keyset_page_fields,
+    list_cursor_schema_property,
+    resolve_list_cursor,
+    walk_keyset_sources,
+)
 from ...core.uuid_validation import is_valid_uuid4 as _is_valid_uuid4
 
 
@@ -78,6 +86,155 @@ def _resolve_usages_with_cst_node_id(
     return resolved
 
 
+#: Result columns matching each source's ``(f.path, line, id)`` order.
+_USAGE_KEY_FIELDS = ("file_path", "line", "id")
+
+#: Index of the classes-by-bases source in :func:`_usage_sources`.
+_INHERITANCE_SOURCE = 1
+
+
+def _usage_sources(
+    project_id: str,
+    *,
+    target_name: str,
+    target_type: Optional[str],
+    target_class: Optional[str],
+    file_id: Optional[Any],
+    root_path: Path,
+) -> List[SqlListSource]:
+    """Return the imports / inheritance / usages sources in output order."""
+
+    def rel_path(row: Dict[str, Any]) -> str:
+        return relative_path_for_indexed_row(
+            {
+                "path": row.get("file_path"),
+                "relative_path": row.get("file_relative_path"),
+            },
+            root_path,
+        )
+
+    def import_usage(row: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        return {
+            "file_id": row["file_id"],
+            "file_path": rel_path(row),
+            "line": row["line"],
+            "target_name": row["name"],
+            "target_type": target_type or "import",
+            "target_class": None,
+            "usage_type": "import",
+            "module": row.get("module"),
+            "import_type": row["import_type"],
+        }
+
+    def inheritance_usage(row: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        # Parse bases JSON to check if target_name is in bases
+        bases = []
+        if row.get("bases"):
+            try:
+                bases = json.loads(row["bases"])
+            except (json.JSONDecodeError, TypeError):
+                bases = []
+        if target_name not in bases:
+            return None
+        return {
+            "file_id": row["file_id"],
+            "file_path": rel_path(row),
+            "line": row["line"],
+            "target_name": target_name,
+            "target_type": "class",
+            "target_class": None,
+            "usage_type": "inheritance",
+            "class_name": row["name"],
+            "bases": bases,
+        }
+
+    def table_usage(row: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        return {
+            "file_id": row["file_id"],
+            "file_path": rel_path(row),
+            "line": row["line"],
+            "target_name": row["target_name"],
+            "target_type": row["target_type"],
+            "target_class": row.get("target_class"),
+            "usage_type": row.get("usage_type", "usage"),
+            "context": row.get("context"),
+        }
+
+    # Search in imports table for class/function usages
+    import_query = """
+        SELECT i.*, f.path as file_path, f.relative_path as file_relative_path,
+               f.id as file_id
+        FROM imports i
+        JOIN files f ON i.file_id = f.id
+        WHERE f.project_id = ? AND i.name = ?
+    """
+    import_params: List[Any] = [project_id, target_name]
+    if file_id is not None:
+        import_query += " AND i.file_id = ?"
+        import_params.append(file_id)
+
+    # For classes: search for inheritance (classes that inherit from target)
+    inheritance_query = """
+        SELECT c.*, f.path as file_path, f.relative_path as file_relative_path,
+               f.id as file_id
+        FROM classes c
+        JOIN files f ON c.file_id = f.id
+        WHERE f.project_id = ? AND c.bases LIKE ?
+    """
+    inheritance_params: List[Any] = [project_id, f"%{target_name}%"]
+    if file_id is not None:
+        inheritance_query += " AND c.file_id = ?"
+        inheritance_params.append(file_id)
+
+    # Also try usages table (may be empty, but check anyway)
+    usage_query = """
+        SELECT u.*, f.path as file_path, f.relative_path as file_relative_path,
+               f.id as file_id
+        FROM usages u
+        JOIN files f ON u.file_id = f.id
+        WHERE f.project_id = ?
+    """
+    usage_params: List[Any] = [project_id]
+    if target_name:
+        usage_query += " AND u.target_name = ?"
+        usage_params.append(target_name)
+    if target_type:
+        usage_query += " AND u.target_type = ?"
+        usage_params.append(target_type)
+    if target_class:
+        usage_query += " AND u.target_class = ?"
+        usage_params.append(target_class)
+    if file_id is not None:
+        usage_query += " AND u.file_id = ?"
+        usage_params.append(file_id)
+
+    return [
+        SqlListSource(
+            sql=import_query,
+            params=tuple(import_params),
+            order_columns=("f.path", "i.line", "i.id"),
+            key_fields=_USAGE_KEY_FIELDS,
+            to_item=import_usage,
+            enabled=target_type in ("class", "function", None),
+        ),
+        SqlListSource(
+            sql=inheritance_query,
+            params=tuple(inheritance_params),
+            order_columns=("f.path", "c.line", "c.id"),
+            key_fields=_USAGE_KEY_FIELDS,
+            to_item=inheritance_usage,
+            enabled=target_type in ("class", None),
+        ),
+        SqlListSource(
+            sql=usage_query,
+            params=tuple(usage_params),
+            order_columns=("f.path", "u.line", "u.id"),
+            key_fields=_USAGE_KEY_FIELDS,
+            to_item=table_usage,
+        ),
+    ]
+
+
 class FindUsagesMCPCommand(BaseMCPCommand):
     """Find usages of methods, properties, classes, or functions."""
 
@@ -123,6 +280,7 @@ class FindUsagesMCPCommand(BaseMCPCommand):
                     "description": "Offset for pagination",
                     "default": 0,
                 },
+                **list_cursor_schema_property(),
             },
             "required": ["project_id", "target_name"],
             "additionalProperties": False,
@@ -137,6 +295,7 @@ class FindUsagesMCPCommand(BaseMCPCommand):
         file_path: Optional[str] = None,
         limit: Optional[int] = None,
         offset: int = 0,
+        cursor: Optional[str] = None,
         **kwargs,
     ) -> SuccessResult | ErrorResult:
         """Execute the command."""
@@ -148,6 +307,7 @@ class FindUsagesMCPCommand(BaseMCPCommand):
             "file_path": file_path,
             "limit": limit,
             "offset": offset,
+            "cursor": cursor,
         }
         call_params.update(kwargs)
         try:
@@ -161,178 +321,79 @@ class FindUsagesMCPCommand(BaseMCPCommand):
         file_path = call_params.get("file_path")
         limit = call_params.get("limit")
         offset = int(call_params.get("offset", 0))
+        cursor_scope = f"find_usages:{target_type or 'all'}"
+        try:
+            keyset_mode, after = resolve_list_cursor(
+                call_params, scope=cursor_scope, key_length=4
+            )
+        except ValidationError as e:
+            return self._handle_error(e, "VALIDATION_ERROR", "find_usages")
 
         try:
             root_path = self._resolve_project_root(project_id)
             db = self._open_database()
             proj_id = project_id
 
+            file_id: Optional[Any] = None
+            if file_path:
+                file_record = get_file_by_path(db, file_path, proj_id)
+                if file_record:
+                    file_id = file_record["id"]
+
             # Find usages from database
             # Uses multiple sources for comprehensive results:
             # - usages table: actual function calls, method calls, class instantiations
             # - imports table: module/class/function imports
             # - classes table: inheritance relationships (bases)
-            raw_usages: List[Dict[str, Any]] = []
-
-            # Search in imports table for class/function usages
-            if target_type in ("class", "function", None):
-                import_query = """
-                    SELECT i.*, f.path as file_path, f.relative_path as file_relative_path,
-                           f.id as file_id
-                    FROM imports i
-                    JOIN files f ON i.file_id = f.id
-                    WHERE f.project_id = ? AND i.name = ?
-                """
-                import_params = [proj_id, target_name]
-
-                if file_path:
-                    file_record = get_file_by_path(db, file_path, proj_id)
-                    if file_record:
-                        import_query += " AND i.file_id = ?"
-                        import_params.append(file_record["id"])
-
-                import_query += " ORDER BY f.path, i.line"
-                if limit:
-                    import_query += f" LIMIT {limit}"
-                if offset:
-                    import_query += f" OFFSET {offset}"
+            sources = _usage_sources(
+                proj_id,
+                target_name=target_name,
+                target_type=target_type,
+                target_class=target_class,
+                file_id=file_id,
+                root_path=root_path,
+            )
 
-                result = db.execute(import_query, tuple(import_params))
-                import_rows = result.get("data", [])
-                for row in import_rows:
-                    raw_usages.append(
+            if keyset_mode:
+                page, next_key = walk_keyset_sources(
+                    [source.keyset_fetch(db) for source in sources],
+                    page_size=limit or DEFAULT_LIST_PAGE_SIZE,
+                    after=after,
+                )
+                db.disconnect()
+                usages = _resolve_usages_with_cst_node_id(root_path, page)
+                return SuccessResult(
+                    data=apply_keyset_page_fields(
                         {
-                            "file_id": row["file_id"],
-                            "file_path": relative_path_for_indexed_row(
-                                {
-                                    "path": row.get("file_path"),
-                                    "relative_path": row.get("file_relative_path"),
-                                },
-                                root_path,
-                            ),
-                            "line": row["line"],
-                            "target_name": row["name"],
-                            "target_type": target_type or "import",
-                            "target_class": None,
-                            "usage_type": "import",
-                            "module": row.get("module"),
-                            "import_type": row["import_type"],
-                        }
+                            "success": True,
+                            "target_name": target_name,
+                            "usages": usages,
+                            "count": len(usages),
+                        },
+                        scope=cursor_scope,
+                        next_key=next_key,
                     )
+                )
 
-            # For classes: search for inheritance (classes that inherit from target)
-            if target_type in ("class", None):
-                inheritance_query = """
-                    SELECT c.*, f.path as file_path, f.relative_path as file_relative_path,
-                           f.id as file_id
-                    FROM classes c
-                    JOIN files f ON c.file_id = f.id
-                    WHERE f.project_id = ? AND c.bases LIKE ?
-                """
-                inheritance_params = [proj_id, f"%{target_name}%"]
-
-                if file_path:
-                    file_record = get_file_by_path(db, file_path, proj_id)
-                    if file_record:
-                        inheritance_query += " AND c.file_id = ?"
-                        inheritance_params.append(file_record["id"])
-
-                inheritance_query += " ORDER BY f.path, c.line"
+            raw_usages: List[Dict[str, Any]] = []
+            for source in sources:
+                if not source.enabled:
+                    continue
+                query = source.sql + source.order_by_sql()
+                params = list(source.params)
                 if limit:
-                    inheritance_query += (
-                        f" LIMIT {limit * 2}"  # Get more to account for imports
-                    )
+                    # Inheritance rows are post-filtered on bases: fetch more.
+                    query += " LIMIT ?"
+                    over_fetch = 2 if source is sources[_INHERITANCE_SOURCE] else 1
+                    params.append(int(limit) * over_fetch)
                 if offset:
-                    inheritance_query += f" OFFSET {offset}"
-
-                result = db.execute(inheritance_query, tuple(inheritance_params))
-                inheritance_rows = result.get("data", [])
-                for row in inheritance_rows:
-                    # Parse bases JSON to check if target_name is in bases
-                    bases = []
-                    if row.get("bases"):
-                        try:
-                            bases = json.loads(row["bases"])
-                        except (json.JSONDecodeError, TypeError):
-                            bases = []
-
-                    if target_name in bases:
-                        raw_usages.append(
-                            {
-                                "file_id": row["file_id"],
-                                "file_path": relative_path_for_indexed_row(
-                                    {
-                                        "path": row.get("file_path"),
-                                        "relative_path": row.get("file_relative_path"),
-                                    },
-                                    root_path,
-                                ),
-                                "line": row["line"],
-                                "target_name": target_name,
-                                "target_type": "class",
-                                "target_class": None,
-                                "usage_type": "inheritance",
-                                "class_name": row["name"],
-                                "bases": bases,
-                            }
-                        )
-
-            # Also try usages table (may be empty, but check anyway)
-            query = """
-                SELECT u.*, f.path as file_path, f.relative_path as file_relative_path,
-                       f.id as file_id
-                FROM usages u
-                JOIN files f ON u.file_id = f.id
-                WHERE f.project_id = ?
-            """
-            params = [proj_id]
-
-            if target_name:
-                query += " AND u.target_name = ?"
-                params.append(target_name)
-
-            if target_type:
-                query += " AND u.target_type = ?"
-                params.append(target_type)
-
-            if target_class:
-                query += " AND u.target_class = ?"
-                params.append(target_class)
-
-            if file_path:
-                file_record = get_file_by_path(db, file_path, proj_id)
-                if file_record:
-                    query += " AND u.file_id = ?"
-                    params.append(file_record["id"])
-
-            query += " ORDER BY f.path, u.line"
-
-            if limit:
-                query += f" LIMIT {limit}"
-            if offset:
-                query += f" OFFSET {offset}"
-
-            result = db.execute(query, tuple(params))
-            usage_rows = result.get("data", [])
-            for row in usage_rows:
-                raw_usages.append(
-                    {
-                        "file_id": row["file_id"],
-                        "file_path": relative_path_for_indexed_row(
-                            {
-                                "path": row.get("file_path"),
-                                "relative_path": row.get("file_relative_path"),
-                            },
-                            root_path,
-                        ),
-                        "line": row["line"],
-                        "target_name": row["target_name"],
-                        "target_type": row["target_type"],
-                        "target_class": row.get("target_class"),
-                        "usage_type": row.get("usage_type", "usage"),
-                        "context": row.get("context"),
-                    }
-                )
+                    query += " OFFSET ?"
+                    params.append(offset)
+                result = db.execute(query, tuple(params))
+                for row in result.get("data", []):
+                    usage = source.to_item(row)
+                    if usage is not None:
+                        raw_usages.append(usage)
 
             db.disconnect()
 
@@ -472,6 +533,17 @@ class FindUsagesMCPCommand(BaseMCPCommand):
                     "required": False,
                     "default": 0,
                 },
+                "cursor": {
+                    "description": (
+                        "Opaque keyset cursor. Empty string starts a cursor walk "
+                        "(page size = limit, default 20); pass next_cursor from the "
+                        "previous response for the next page. Overrides offset. "
+                        "Sources are walked in order (imports, inheritance, usages); "
+                        "rows filtered after the query can make a page shorter."
+                    ),
+                    "type": "string",
+                    "required": False,
+                },
             },
             "usage_examples": [
                 {
@@ -552,6 +624,10 @@ class FindUsagesMCPCommand(BaseMCPCommand):
                             "- No fallback identity by line/range; only entities with resolved cst_node_id"
                         ),
                         "count": "Number of usages found",
+                        "next_cursor": (
+                            "Cursor mode only: pass as cursor for the next page; "
+                            "null on the last page"
+                        ),
                     },
                     "example": {
                         "success": True,
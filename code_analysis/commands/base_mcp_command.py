@@ -38,6 +38,11 @@ from ..core.shared_database import (
     get_shared_database,
 )
 from .base_mcp_command_resolve_path import resolve_file_path_from_project
+from .base_mcp_command_schema import (
+    compile_params_validator,
+    compile_value_validator,
+    params_validator_for,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -189,10 +194,15 @@ class BaseMCPCommand(Command):
             """
             if lock_gate_active:
                 from ..core.project_exclusive_lock import get_project_exclusive_lock
+                from ..core.project_registry_cache import cached_project_lookup
 
                 db = cls._open_database_from_config()
                 try:
-                    lock = get_project_exclusive_lock(db, str(project_id))
+                    lock = cached_project_lookup(
+                        "lock",
+                        project_id,
+                        lambda: get_project_exclusive_lock(db, str(project_id)),
+                    )
                 finally:
                     db.disconnect()
                 if lock:
@@ -445,9 +455,16 @@ class BaseMCPCommand(Command):
                 field="project_id",
                 details={},
             )
+        from ..core.project_registry_cache import cached_project_lookup
+
         db = BaseMCPCommand._open_database_from_config()
         try:
-            project = get_project(db, project_id)
+            project = cached_project_lookup(
+                "project",
+                project_id,
+                lambda: get_project(db, project_id),
+                cache_none=False,
+            )
             if not project:
                 hint = ""
                 if "-" not in project_id or len(project_id) < 36:
@@ -463,7 +480,11 @@ class BaseMCPCommand(Command):
             from ..core.exceptions import ProjectLockedError
             from ..core.project_exclusive_lock import is_project_exclusively_locked
 
-            if is_project_exclusively_locked(db, project_id):
+            if cached_project_lookup(
+                "locked",
+                project_id,
+                lambda: is_project_exclusively_locked(db, project_id),
+            ):
                 raise ProjectLockedError(
                     f"Project {project_id!r} is exclusively locked; the operation "
                     "was refused. Use emergency_unlock_project if the lock is stuck.",
@@ -550,10 +571,13 @@ class BaseMCPCommand(Command):
         if not project_id:
             return None
         from ..core.project_exclusive_lock import get_project_exclusive_lock
+        from ..core.project_registry_cache import cached_project_lookup
 
         db = BaseMCPCommand._open_database_from_config()
         try:
-            lock = get_project_exclusive_lock(db, project_id)
+            lock = cached_project_lookup(
+                "lock", project_id, lambda: get_project_exclusive_lock(db, project_id)
+            )
         finally:
             db.disconnect()
         if not lock:
@@ -636,8 +660,11 @@ class BaseMCPCommand(Command):
                 field="project_id",
                 details={},
             )
+        from ..core.project_registry_cache import cached_project_lookup
+
         db = BaseMCPCommand._open_database_from_config()
-        try:
+
+        def _load_record() -> Optional[tuple]:
             rows = db.select("projects", where={"id": project_id})
             project = None
             if hasattr(db, "get_project"):
@@ -646,6 +673,14 @@ class BaseMCPCommand(Command):
                 except Exception:
                     project = None
             if not rows and not project:
+                return None
+            return (dict(rows[0]) if rows else {}), project
+
+        try:
+            record = cached_project_lookup(
+                "record", project_id, _load_record, cache_none=False
+            )
+            if record is None:
                 hint = ""
                 if "-" not in project_id or len(project_id) < 36:
                     hint = " Use list_projects to get the project id (UUID), or read projectid in the project root."
@@ -654,11 +689,15 @@ class BaseMCPCommand(Command):
                     field="project_id",
                     details={"project_id": project_id},
                 )
-            row = dict(rows[0]) if rows else {}
+            row, project = record
             from ..core.exceptions import ProjectLockedError
             from ..core.project_exclusive_lock import is_project_exclusively_locked
 
-            if is_project_exclusively_locked(db, project_id):
+            if cached_project_lookup(
+                "locked",
+                project_id,
+                lambda: is_project_exclusively_locked(db, project_id),
+            ):
                 raise ProjectLockedError(
                     f"Project {project_id!r} is exclusively locked; the operation "
                     "was refused. Use emergency_unlock_project if the lock is stuck.",
@@ -672,21 +711,25 @@ class BaseMCPCommand(Command):
             elif not row and project_root_attr and Path(project_root_attr).is_absolute():
                 abs_str = str(Path(project_root_attr).resolve())
             else:
-                abs_str = resolve_project_root_absolute_str(
-                    project_id=project_id,
-                    root_path_stored=str(row_root_path or project_root_attr or ""),
-                    watch_dir_id=(
-                        str(row["watch_dir_id"])
-                        if row.get("watch_dir_id") is not None
-                        else getattr(project, "watch_dir_id", None)
-                    ),
-                    project_name=str(
-                        row.get("name") or getattr(project, "name", "") or ""
-                    ).strip()
-                    or None,
-                    database=db,
-                    require_exists=True,
-                ).strip()
+                abs_str = cached_project_lookup(
+                    "root",
+                    project_id,
+                    lambda: resolve_project_root_absolute_str(
+                        project_id=project_id,
+                        root_path_stored=str(row_root_path or project_root_attr or ""),
+                        watch_dir_id=(
+                            str(row["watch_dir_id"])
+                            if row.get("watch_dir_id") is not None
+                            else getattr(project, "watch_dir_id", None)
+                        ),
+                        project_name=str(
+                            row.get("name") or getattr(project, "name", "") or ""
+                        ).strip()
+                        or None,
+                        database=db,
+                        require_exists=True,
+                    ).strip(),
+                )
             if not abs_str or not Path(abs_str).is_absolute():
                 raise ValidationError(
                     f"Cannot resolve absolute project root for project_id {project_id!r}",
@@ -862,157 +905,9 @@ class BaseMCPCommand(Command):
         Supports type, enum, minimum/maximum, minItems/maxItems, simple
         array ``items`` schemas (single object with ``type`` only), and
         ``oneOf`` / ``anyOf`` unions when no top-level ``type`` is set.
+        See :func:`~.base_mcp_command_schema.compile_value_validator`.
         """
-        expected_type = prop.get("type")
-        one_of = prop.get("oneOf")
-        any_of = prop.get("anyOf")
-        if expected_type is None and (one_of or any_of):
-            branches: list[Dict[str, Any]] = []
-            union_label = ""
-            if isinstance(one_of, list):
-                branches = [b for b in one_of if isinstance(b, dict)]
-                union_label = "oneOf"
-            elif isinstance(any_of, list):
-                branches = [b for b in any_of if isinstance(b, dict)]
-                union_label = "anyOf"
-            if not branches:
-                raise ValidationError(
-                    f"{command_name}: parameter {field!r} has empty {union_label}",
-                    field=field,
-                    details={union_label: one_of or any_of},
-                )
-            match_count = sum(
-                1
-                for branch in branches
-                if BaseMCPCommand._try_validate_schema_value(
-                    value,
-                    branch,
-                    field=field,
-                    command_name=command_name,
-                )
-            )
-            if union_label == "anyOf":
-                if match_count < 1:
-                    raise ValidationError(
-                        f"{command_name}: parameter {field!r} must match at least "
-                        f"one branch of anyOf, got {type(value).__name__}",
-                        field=field,
-                        details={"anyOf": any_of},
-                    )
-            elif match_count < 1:
-                raise ValidationError(
-                    f"{command_name}: parameter {field!r} must match one branch "
-                    f"of oneOf, got {type(value).__name__}",
-                    field=field,
-                    details={"oneOf": one_of},
-                )
-            if "enum" in prop and value is not None and value not in prop["enum"]:
-                raise ValidationError(
-                    f"{command_name}: parameter {field!r} must be one of {prop['enum']!r}, got {value!r}",
-                    field=field,
-                    details={"enum": prop["enum"]},
-                )
-            return
-
-        expected_type = prop.get("type")
-        if expected_type == "string":
-            if not isinstance(value, str):
-                raise ValidationError(
-                    f"{command_name}: parameter {field!r} must be string, got {type(value).__name__}",
-                    field=field,
-                    details={},
-                )
-        elif expected_type == "integer":
-            if not isinstance(value, int) or isinstance(value, bool):
-                raise ValidationError(
-                    f"{command_name}: parameter {field!r} must be integer, got {type(value).__name__}",
-                    field=field,
-                    details={},
-                )
-            if "minimum" in prop and value < prop["minimum"]:
-                raise ValidationError(
-                    f"{command_name}: parameter {field!r} must be >= {prop['minimum']}, got {value}",
-                    field=field,
-                    details={"minimum": prop["minimum"], "value": value},
-                )
-            if "maximum" in prop and value > prop["maximum"]:
-                raise ValidationError(
-                    f"{command_name}: parameter {field!r} must be <= {prop['maximum']}, got {value}",
-                    field=field,
-                    details={"maximum": prop["maximum"], "value": value},
-                )
-        elif expected_type == "number":
-            if not isinstance(value, (int, float)) or isinstance(value, bool):
-                raise ValidationError(
-                    f"{command_name}: parameter {field!r} must be number, got {type(value).__name__}",
-                    field=field,
-                    details={},
-                )
-            if "minimum" in prop and value < prop["minimum"]:
-                raise ValidationError(
-                    f"{command_name}: parameter {field!r} must be >= {prop['minimum']}, got {value}",
-                    field=field,
-                    details={"minimum": prop["minimum"], "value": value},
-                )
-            if "maximum" in prop and value > prop["maximum"]:
-                raise ValidationError(
-                    f"{command_name}: parameter {field!r} must be <= {prop['maximum']}, got {value}",
-                    field=field,
-                    details={"maximum": prop["maximum"], "value": value},
-                )
-        elif expected_type == "boolean":
-            if not isinstance(value, bool):
-                raise ValidationError(
-                    f"{command_name}: parameter {field!r} must be boolean, got {type(value).__name__}",
-                    field=field,
-                    details={},
-                )
-        elif expected_type == "array":
-            if not isinstance(value, list):
-                raise ValidationError(
-                    f"{command_name}: parameter {field!r} must be array, got {type(value).__name__}",
-                    field=field,
-                    details={},
-                )
-            if "minItems" in prop and len(value) < prop["minItems"]:
-                raise ValidationError(
-                    f"{command_name}: parameter {field!r} must have at least "
-                    f"{prop['minItems']} items, got {len(value)}",
-                    field=field,
-                    details={"minItems": prop["minItems"], "actual": len(value)},
-                )
-            if "maxItems" in prop and len(value) > prop["maxItems"]:
-                raise ValidationError(
-                    f"{command_name}: parameter {field!r} must have at most "
-                    f"{prop['maxItems']} items, got {len(value)}",
-                    field=field,
-                    details={"maxItems": prop["maxItems"], "actual": len(value)},
-                )
-            items_schema = prop.get("items")
-            if isinstance(items_schema, dict) and "type" in items_schema:
-                for index, item in enumerate(value):
-                    if item is None:
-                        continue
-                    BaseMCPCommand._validate_schema_value(
-                        item,
-                        items_schema,
-                        field=f"{field}[{index}]",
-                        command_name=command_name,
-                    )
-        elif expected_type == "object":
-            if not isinstance(value, dict):
-                raise ValidationError(
-                    f"{command_name}: parameter {field!r} must be object, got {type(value).__name__}",
-                    field=field,
-                    details={},
-                )
-        if "enum" in prop and value is not None:
-            if value not in prop["enum"]:
-                raise ValidationError(
-                    f"{command_name}: parameter {field!r} must be one of {prop['enum']!r}, got {value!r}",
-                    field=field,
-                    details={"enum": prop["enum"]},
-                )
+        compile_value_validator(prop, command_name)(value, field)
 
     @staticmethod
     def validate_params_against_schema(
@@ -1032,41 +927,7 @@ class BaseMCPCommand(Command):
         Raises:
             ValidationError: If any key is disallowed or any value fails type/enum check.
         """
-        if not isinstance(params, dict):
-            raise ValidationError(
-                f"{command_name}: params must be a dict, got {type(params).__name__}",
-                field="params",
-                details={},
-            )
-        props = schema.get("properties") or {}
-        additional_ok = schema.get("additionalProperties", False)
-        required_set = set(schema.get("required") or [])
-        for key, value in params.items():
-            if key not in props:
-                if not additional_ok:
-                    raise ValidationError(
-                        f"{command_name}: unknown parameter {key!r}. "
-                        "Only schema-defined properties are allowed.",
-                        field=key,
-                        details={"allowed": list(props.keys())},
-                    )
-                continue
-            if value is None:
-                continue
-            BaseMCPCommand._validate_schema_value(
-                value,
-                props[key],
-                field=key,
-                command_name=command_name,
-            )
-        # Required keys presence check
-        for key in required_set:
-            if key not in params or params[key] is None:
-                raise ValidationError(
-                    f"{command_name}: required parameter {key!r} is missing",
-                    field=key,
-                    details={},
-                )
+        compile_params_validator(schema, command_name)(params)
 
     def validate_params(
         self: "BaseMCPCommand", params: Dict[str, Any]
@@ -1074,6 +935,10 @@ class BaseMCPCommand(Command):
         """
         Validate parameters against command schema. Override to add identifier checks.
 
+        The schema is compiled once per command class (see
+        :func:`~.base_mcp_command_schema.params_validator_for`), so
+        ``get_schema()`` is not rebuilt per request.
+
         Call this before queuing so invalid project_id (and other IDs) are rejected
         immediately instead of after job start. When schema has additionalProperties
         False, unknown keys raise ValidationError.
@@ -1087,9 +952,6 @@ class BaseMCPCommand(Command):
         Raises:
             ValidationError: If params fail schema or identifier validation.
         """
-        schema = self.get_schema()
         params = {k: v for k, v in params.items() if k != "context"}
-        BaseMCPCommand.validate_params_against_schema(
-            params, schema, command_name=getattr(self, "name", "command")
-        )
+        params_validator_for(type(self), getattr(self, "name", "command"))(params)
         return params
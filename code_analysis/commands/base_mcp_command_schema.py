@@ -0,0 +1,298 @@
+"""
+Compiled parameter validators for BaseMCPCommand JSON schemas.
+
+``BaseMCPCommand.validate_params`` used to call ``get_schema()`` (rebuilding
+the nested dict literals) and walk the schema for every request. This module
+compiles a schema once into closures: each property becomes a
+``check(value, field)`` callable with its type test, bounds, enum and
+``oneOf``/``anyOf`` branches resolved up front. :func:`params_validator_for`
+caches the compiled validator per command class, built from a deep copy of
+``get_schema()`` so later mutation of a returned schema dict cannot change it.
+
+Property checks are compiled on first use, so a one-off validation of a large
+schema only pays for the parameters actually passed. Error messages, fields
+and details are those of the former interpreted validator.
+
+Author: Vasiliy Zdanovskiy
+email: vasilyvz@gmail.com
+"""
+
+from __future__ import annotations
+
+import copy
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ..core.exceptions import ValidationError
+
+ValueCheck = Callable[[Any, str], None]
+ParamsCheck = Callable[[Dict[str, Any]], None]
+
+_SIMPLE_TYPES: Dict[str, type] = {"string": str, "boolean": bool, "object": dict}
+
+_class_lock = threading.Lock()
+_class_validators: Dict[type, Tuple[Any, str, ParamsCheck]] = {}
+
+
+def _no_check(value: Any, field: str) -> None:
+    return None
+
+
+def _compile_enum(enum: Any, command_name: str) -> ValueCheck:
+    def check(value: Any, field: str) -> None:
+        if value is not None and value not in enum:
+            raise ValidationError(
+                f"{command_name}: parameter {field!r} must be one of {enum!r}, got {value!r}",
+                field=field,
+                details={"enum": enum},
+            )
+
+    return check
+
+
+def _type_error(command_name: str, field: str, type_name: str, value: Any) -> None:
+    raise ValidationError(
+        f"{command_name}: parameter {field!r} must be {type_name}, got {type(value).__name__}",
+        field=field,
+        details={},
+    )
+
+
+def _compile_bounds(prop: Dict[str, Any], command_name: str) -> List[ValueCheck]:
+    checks: List[ValueCheck] = []
+    if "minimum" in prop:
+        minimum = prop["minimum"]
+
+        def check_minimum(value: Any, field: str) -> None:
+            if value < minimum:
+                raise ValidationError(
+                    f"{command_name}: parameter {field!r} must be >= {minimum}, got {value}",
+                    field=field,
+                    details={"minimum": minimum, "value": value},
+                )
+
+        checks.append(check_minimum)
+    if "maximum" in prop:
+        maximum = prop["maximum"]
+
+        def check_maximum(value: Any, field: str) -> None:
+            if value > maximum:
+                raise ValidationError(
+                    f"{command_name}: parameter {field!r} must be <= {maximum}, got {value}",
+                    field=field,
+                    details={"maximum": maximum, "value": value},
+                )
+
+        checks.append(check_maximum)
+    return checks
+
+
+def _compile_array(prop: Dict[str, Any], command_name: str) -> ValueCheck:
+    min_items = prop.get("minItems")
+    max_items = prop.get("maxItems")
+    items_schema = prop.get("items")
+    item_check: Optional[ValueCheck] = None
+    if isinstance(items_schema, dict) and "type" in items_schema:
+        item_check = compile_value_validator(items_schema, command_name)
+
+    def check(value: Any, field: str) -> None:
+        if not isinstance(value, list):
+            _type_error(command_name, field, "array", value)
+        if min_items is not None and len(value) < min_items:
+            raise ValidationError(
+                f"{command_name}: parameter {field!r} must have at least "
+                f"{min_items} items, got {len(value)}",
+                field=field,
+                details={"minItems": min_items, "actual": len(value)},
+            )
+        if max_items is not None and len(value) > max_items:
+            raise ValidationError(
+                f"{command_name}: parameter {field!r} must have at most "
+                f"{max_items} items, got {len(value)}",
+                field=field,
+                details={"maxItems": max_items, "actual": len(value)},
+            )
+        if item_check is not None:
+            for index, item in enumerate(value):
+                if item is not None:
+                    item_check(item, f"{field}[{index}]")
+
+    return check
+
+
+def _compile_type(prop: Dict[str, Any], command_name: str) -> Optional[ValueCheck]:
+    expected_type = prop.get("type")
+    if expected_type == "array":
+        return _compile_array(prop, command_name)
+    if expected_type in ("integer", "number"):
+        bounds = _compile_bounds(prop, command_name)
+        accepted: Any = int if expected_type == "integer" else (int, float)
+
+        def check_numeric(value: Any, field: str) -> None:
+            if not isinstance(value, accepted) or isinstance(value, bool):
+                _type_error(command_name, field, expected_type, value)
+            for bound in bounds:
+                bound(value, field)
+
+        return check_numeric
+    simple = (
+        _SIMPLE_TYPES.get(expected_type) if isinstance(expected_type, str) else None
+    )
+    if simple is None:
+        return None
+
+    def check_simple(value: Any, field: str) -> None:
+        if not isinstance(value, simple):
+            _type_error(command_name, field, str(expected_type), value)
+
+    return check_simple
+
+
+def _compile_union(prop: Dict[str, Any], command_name: str) -> ValueCheck:
+    one_of = prop.get("oneOf")
+    any_of = prop.get("anyOf")
+    raw_branches: List[Any] = []
+    union_label = ""
+    if isinstance(one_of, list):
+        raw_branches, union_label = one_of, "oneOf"
+    elif isinstance(any_of, list):
+        raw_branches, union_label = any_of, "anyOf"
+    branches = [
+        compile_value_validator(b, command_name)
+        for b in raw_branches
+        if isinstance(b, dict)
+    ]
+    enum_check = _compile_enum(prop["enum"], command_name) if "enum" in prop else None
+
+    def matches(branch: ValueCheck, value: Any, field: str) -> bool:
+        try:
+            branch(value, field)
+            return True
+        except ValidationError:
+            return False
+
+    def check(value: Any, field: str) -> None:
+        if not branches:
+            raise ValidationError(
+                f"{command_name}: parameter {field!r} has empty {union_label}",
+                field=field,
+                details={union_label: one_of or any_of},
+            )
+        if not any(matches(branch, value, field) for branch in branches):
+            if union_label == "anyOf":
+                raise ValidationError(
+                    f"{command_name}: parameter {field!r} must match at least "
+                    f"one branch of anyOf, got {type(value).__name__}",
+                    field=field,
+                    details={"anyOf": any_of},
+                )
+            raise ValidationError(
+                f"{command_name}: parameter {field!r} must match one branch "
+                f"of oneOf, got {type(value).__name__}",
+                field=field,
+                details={"oneOf": one_of},
+            )
+        if enum_check is not None:
+            enum_check(value, field)
+
+    return check
+
+
+def compile_value_validator(prop: Dict[str, Any], command_name: str) -> ValueCheck:
+    """Compile one JSON Schema property into ``check(value, field)``.
+
+    Supports the shallow subset of ``BaseMCPCommand``: type, enum,
+    minimum/maximum, minItems/maxItems, array ``items`` schemas that set
+    ``type``, and ``oneOf``/``anyOf`` unions when no top-level ``type`` is set.
+    """
+    if not isinstance(prop, dict):
+        return _no_check
+    if prop.get("type") is None and (prop.get("oneOf") or prop.get("anyOf")):
+        return _compile_union(prop, command_name)
+    type_check = _compile_type(prop, command_name)
+    enum_check = _compile_enum(prop["enum"], command_name) if "enum" in prop else None
+    if enum_check is None:
+        return type_check or _no_check
+    if type_check is None:
+        return enum_check
+
+    def check(value: Any, field: str) -> None:
+        type_check(value, field)
+        enum_check(value, field)
+
+    return check
+
+
+def compile_params_validator(
+    schema: Dict[str, Any], command_name: str = "command"
+) -> ParamsCheck:
+    """Compile a command schema into ``check(params)``.
+
+    Unknown keys are rejected unless ``additionalProperties`` is truthy, present
+    non-``None`` values must match their property, and required keys must be
+    present and non-``None``.
+    """
+    props: Dict[str, Any] = schema.get("properties") or {}
+    additional_ok = schema.get("additionalProperties", False)
+    required = list(dict.fromkeys(schema.get("required") or []))
+    allowed = list(props.keys())
+    checks: Dict[str, ValueCheck] = {}
+
+    def check(params: Dict[str, Any]) -> None:
+        if not isinstance(params, dict):
+            raise ValidationError(
+                f"{command_name}: params must be a dict, got {type(params).__name__}",
+                field="params",
+                details={},
+            )
+        for key, value in params.items():
+            if key not in props:
+                if not additional_ok:
+                    raise ValidationError(
+                        f"{command_name}: unknown parameter {key!r}. "
+                        "Only schema-defined properties are allowed.",
+                        field=key,
+                        details={"allowed": list(allowed)},
+                    )
+                continue
+            if value is None:
+                continue
+            value_check = checks.get(key)
+            if value_check is None:
+                value_check = compile_value_validator(props[key], command_name)
+                checks[key] = value_check
+            value_check(value, key)
+        for key in required:
+            if params.get(key) is None:
+                raise ValidationError(
+                    f"{command_name}: required parameter {key!r} is missing",
+                    field=key,
+                    details={},
+                )
+
+    return check
+
+
+def params_validator_for(cls: type, command_name: Optional[str] = None) -> ParamsCheck:
+    """Return the compiled validator of ``cls.get_schema()``, built once per class.
+
+    The cache is keyed by class and revalidated against the current
+    ``get_schema`` function and command name, so a patched ``get_schema`` (tests)
+    is recompiled instead of served stale.
+    """
+    name = command_name if command_name is not None else getattr(cls, "name", "command")
+    get_schema = cls.get_schema  # type: ignore[attr-defined]
+    schema_fn = getattr(get_schema, "__func__", get_schema)
+    entry = _class_validators.get(cls)
+    if entry is not None and entry[0] is schema_fn and entry[1] == name:
+        return entry[2]
+    validator = compile_params_validator(copy.deepcopy(get_schema()), name)
+    with _class_lock:
+        _class_validators[cls] = (schema_fn, name, validator)
+    return validator
+
+
+def clear_params_validators() -> None:
+    """Drop every cached per-class validator (e.g. after hot-reloading commands)."""
+    with _class_lock:
+        _class_validators.clear()
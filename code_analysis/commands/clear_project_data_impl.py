@@ -16,6 +16,7 @@ import time
 from typing import Any, List
 
 from ..core.database.logical_write_program import LogicalWriteProgramV1, SqlParamPair
+from ..core.shared_library_index import build_library_release_ops
 from ..core.sql_portable import database_has_sqlite_code_content_fts
 
 # Driver-direct (stage 2): DatabaseClient class removed; "database" params
@@ -140,6 +141,12 @@ def build_delete_project_full_clear_batch(
             (pid,),
         )
     )
+    ops.append(
+        (
+            "DELETE FROM comprehensive_analysis_check_cache WHERE project_id = ?",
+            (pid,),
+        )
+    )
 
     # duplicate_occurrences also references files(id)
     ops.append(
@@ -171,9 +178,14 @@ def build_delete_project_full_clear_batch(
         )
     )
 
+    # Shared library index: hand canonical copies over to other projects
+    ops.extend(build_library_release_ops(_FILES_OF, (pid,)))
+
     ops.append(("DELETE FROM files WHERE project_id = ?", (pid,)))
 
     ops.append(("DELETE FROM indexing_errors WHERE project_id = ?", (pid,)))
+    ops.append(("DELETE FROM import_graph_edges WHERE project_id = ?", (pid,)))
+    ops.append(("DELETE FROM import_graph_nodes WHERE project_id = ?", (pid,)))
     ops.append(("DELETE FROM vector_index WHERE project_id = ?", (pid,)))
     ops.append(("DELETE FROM projects WHERE id = ?", (pid,)))
 
@@ -16,6 +16,7 @@ from typing import Any, Callable, Dict, List, Optional, Tuple
 from ...core.duplicate_detector import DuplicateDetector
 from ...core.file_handlers import is_registered_python_suffix
 from .batch_summary import quality_findings_counts
+from .check_cache import CHECK_RESULT_KEYS
 
 logger = logging.getLogger(__name__)
 
@@ -45,6 +46,7 @@ def analyze_one_file_in_batch(
     check_isort: bool = False,
     check_bandit: bool = False,
     bandit_config: Optional[Path] = None,
+    cached_results: Optional[Dict[str, Any]] = None,
 ) -> Tuple[Dict[str, Any], Dict[str, Any], Any]:
     """
     Run all analysis checks for one file in batch mode.
@@ -56,6 +58,9 @@ def analyze_one_file_in_batch(
     regardless of ``check_flake8`` — non-Python files (e.g. markdown) never
     reach flake8 and never produce findings (bug a012547c).
 
+    ``cached_results`` maps check names (see ``check_cache.CHECK_RESULT_KEYS``)
+    to findings still valid for this content; those checks are not re-run.
+
     Mutates timings_sec. Returns (file_results, file_summary, file_project_id).
     """
     file_results: Dict[str, Any] = {
@@ -71,8 +76,11 @@ def analyze_one_file_in_batch(
         "bandit_findings": [],
         "missing_docstrings": [],
     }
+    reuse = cached_results or {}
+    for check, findings in reuse.items():
+        file_results[CHECK_RESULT_KEYS[check]] = findings
 
-    if check_placeholders:
+    if check_placeholders and "placeholders" not in reuse:
         if set_step_desc:
             set_step_desc("placeholders")
         t0 = time.perf_counter()
@@ -82,7 +90,7 @@ def analyze_one_file_in_batch(
             p["file_path"] = file_path_str
         file_results["placeholders"] = placeholders
 
-    if check_stubs:
+    if check_stubs and "stubs" not in reuse:
         if set_step_desc:
             set_step_desc("stubs")
         t0 = time.perf_counter()
@@ -92,7 +100,7 @@ def analyze_one_file_in_batch(
             s["file_path"] = file_path_str
         file_results["stubs"] = stubs
 
-    if check_empty_methods:
+    if check_empty_methods and "empty_methods" not in reuse:
         if set_step_desc:
             set_step_desc("empty_methods")
         t0 = time.perf_counter()
@@ -102,7 +110,7 @@ def analyze_one_file_in_batch(
             m["file_path"] = file_path_str
         file_results["empty_methods"] = empty_methods
 
-    if check_imports:
+    if check_imports and "imports" not in reuse:
         if set_step_desc:
             set_step_desc("imports")
         t0 = time.perf_counter()
@@ -112,7 +120,7 @@ def analyze_one_file_in_batch(
             imp["file_path"] = file_path_str
         file_results["imports_not_at_top"] = imports_not_at_top
 
-    if check_duplicates:
+    if check_duplicates and "duplicates" not in reuse:
         if set_step_desc:
             set_step_desc("duplicates")
         t0 = time.perf_counter()
@@ -128,7 +136,11 @@ def analyze_one_file_in_batch(
                 occ["file_path"] = file_path_str
         file_results["duplicates"] = duplicates
 
-    if check_flake8 and is_registered_python_suffix(file_path_str):
+    if (
+        check_flake8
+        and is_registered_python_suffix(file_path_str)
+        and "flake8" not in reuse
+    ):
         if set_step_desc:
             set_step_desc("flake8")
         t0 = time.perf_counter()
@@ -155,37 +167,43 @@ def analyze_one_file_in_batch(
         else:
             file_results["mypy_errors"] = []
 
-    if check_black:
+    if check_black and "black" not in reuse:
         if set_step_desc:
             set_step_desc("black")
         t0 = time.perf_counter()
         black_result = analyzer.check_black(full_path)
-        timings_sec["black"] = timings_sec.get("black", 0.0) + (time.perf_counter() - t0)
+        timings_sec["black"] = timings_sec.get("black", 0.0) + (
+            time.perf_counter() - t0
+        )
         if not black_result["success"]:
             black_result["file_path"] = file_path_str
             file_results["black_findings"] = [black_result]
 
-    if check_isort:
+    if check_isort and "isort" not in reuse:
         if set_step_desc:
             set_step_desc("isort")
         t0 = time.perf_counter()
         isort_result = analyzer.check_isort(full_path)
-        timings_sec["isort"] = timings_sec.get("isort", 0.0) + (time.perf_counter() - t0)
+        timings_sec["isort"] = timings_sec.get("isort", 0.0) + (
+            time.perf_counter() - t0
+        )
         if not isort_result["success"]:
             isort_result["file_path"] = file_path_str
             file_results["isort_findings"] = [isort_result]
 
-    if check_bandit:
+    if check_bandit and "bandit" not in reuse:
         if set_step_desc:
             set_step_desc("bandit")
         t0 = time.perf_counter()
         bandit_result = analyzer.check_bandit(full_path, bandit_config)
-        timings_sec["bandit"] = timings_sec.get("bandit", 0.0) + (time.perf_counter() - t0)
+        timings_sec["bandit"] = timings_sec.get("bandit", 0.0) + (
+            time.perf_counter() - t0
+        )
         if not bandit_result["success"]:
             bandit_result["file_path"] = file_path_str
             file_results["bandit_findings"] = [bandit_result]
 
-    if check_docstrings:
+    if check_docstrings and "docstrings" not in reuse:
         if set_step_desc:
             set_step_desc("docstrings")
         t0 = time.perf_counter()
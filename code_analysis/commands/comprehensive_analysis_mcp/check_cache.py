@@ -0,0 +1,230 @@
+"""
+Per-check result cache for comprehensive_analysis batch runs.
+
+Each per-file check result is stored in ``comprehensive_analysis_check_cache``
+together with the key it was computed under: the file content's SHA-256, the
+version of whatever produced it (the quality tool, or this package for the
+AST-based checks) and a hash of the effective configuration (tool config
+files governing the file, analyzer thresholds). A later run re-uses a result
+whose key still matches and re-runs only the checks whose key moved, so an
+edited file, a tool upgrade or a config change each invalidate exactly the
+results they affect.
+
+mypy is not cached per file: its findings depend on the files a module
+imports, so it keeps running once per project.
+
+Author: Vasiliy Zdanovskiy
+email: vasilyvz@gmail.com
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from ...core.code_quality import tool_version
+from ...core.file_handlers import is_registered_python_suffix
+
+# Cached check name -> key of its findings in the per-file results dict.
+CHECK_RESULT_KEYS = {
+    "placeholders": "placeholders",
+    "stubs": "stubs",
+    "empty_methods": "empty_methods",
+    "imports": "imports_not_at_top",
+    "duplicates": "duplicates",
+    "flake8": "flake8_errors",
+    "black": "black_findings",
+    "isort": "isort_findings",
+    "bandit": "bandit_findings",
+    "docstrings": "missing_docstrings",
+}
+
+# External tool checks and the config files each one discovers from the file's
+# directory upwards (bandit only reads an explicit ``-c`` config).
+_TOOL_CONFIG_FILENAMES = {
+    "flake8": (".flake8", "setup.cfg", "tox.ini"),
+    "black": ("pyproject.toml",),
+    "isort": (".isort.cfg", "pyproject.toml", "setup.cfg", "tox.ini", ".editorconfig"),
+    "bandit": (),
+}
+
+
+def _package_version() -> str:
+    """Installed code-analysis version (versions the AST-based checks)."""
+    try:
+        from importlib.metadata import version
+
+        return version("code-analysis")
+    except Exception:
+        return "unknown"
+
+
+def _digest(payload: Any) -> str:
+    """Short SHA-256 of a JSON-serialisable payload."""
+    text = json.dumps(payload, sort_keys=True, default=str)
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:32]
+
+
+def content_sha256(source_code: str) -> str:
+    """SHA-256 hex digest of the UTF-8 encoded file content."""
+    return hashlib.sha256(source_code.encode("utf-8")).hexdigest()
+
+
+def requested_checks(flags: Dict[str, bool], file_path: str) -> List[str]:
+    """Cached check names requested for ``file_path``, in execution order.
+
+    ``flags`` maps ``check_<name>`` (``check_imports`` for ``imports``) to
+    whether it was requested; flake8 only applies to Python files.
+    """
+    checks = [c for c in CHECK_RESULT_KEYS if flags.get(f"check_{c}")]
+    if "flake8" in checks and not is_registered_python_suffix(file_path):
+        checks.remove("flake8")
+    return checks
+
+
+def is_cacheable(check: str, findings: Any) -> bool:
+    """Whether a check's findings are a result worth re-using.
+
+    A tool that was missing, timed out or crashed without reporting any
+    finding yields a failure with no errors; that is retried next run rather
+    than cached as the file's result.
+    """
+    if check not in _TOOL_CONFIG_FILENAMES:
+        return True
+    for result in findings or []:
+        if not result.get("tool_available", True) or not result.get("errors"):
+            return False
+    return True
+
+
+class CheckCacheKeys:
+    """Computes ``(tool_version, config_hash)`` per check and file for one run."""
+
+    def __init__(
+        self,
+        root_path: Path,
+        analyzer: Any,
+        duplicate_min_lines: int,
+        duplicate_min_similarity: float,
+        bandit_config: Optional[Path] = None,
+    ) -> None:
+        """Capture the run-wide settings that feed the config hashes.
+
+        Args:
+            root_path: Project root; tool config lookup stops there.
+            analyzer: ``ComprehensiveAnalyzer`` whose settings shape AST checks.
+            duplicate_min_lines: Duplicate detector threshold.
+            duplicate_min_similarity: Duplicate detector threshold.
+            bandit_config: Optional explicit bandit config file.
+        """
+        self.root_path = Path(root_path).resolve()
+        self._versions: Dict[str, str] = {}
+        self._dir_hashes: Dict[Tuple[str, Path], str] = {}
+        analyzer_settings = {
+            "placeholder_patterns": list(
+                getattr(analyzer, "placeholder_patterns", []) or []
+            ),
+            "ignore_abstract": getattr(analyzer, "ignore_abstract", True),
+        }
+        self._static_hashes = {
+            "placeholders": _digest(analyzer_settings["placeholder_patterns"]),
+            "stubs": _digest(None),
+            "empty_methods": _digest(analyzer_settings["ignore_abstract"]),
+            "imports": _digest(None),
+            "docstrings": _digest(None),
+            "duplicates": _digest([duplicate_min_lines, duplicate_min_similarity]),
+        }
+        self._bandit_config = bandit_config
+
+    def version(self, check: str) -> str:
+        """Version of the tool behind ``check`` (package version for AST checks)."""
+        if check not in self._versions:
+            if check in _TOOL_CONFIG_FILENAMES:
+                self._versions[check] = tool_version(check) or "unavailable"
+            else:
+                self._versions[check] = _package_version()
+        return self._versions[check]
+
+    def key(self, check: str, full_path: Path) -> Tuple[str, str]:
+        """``(tool_version, config_hash)`` for ``check`` on ``full_path``."""
+        if check in self._static_hashes:
+            return self.version(check), self._static_hashes[check]
+        return self.version(check), self._tool_config_hash(check, full_path.parent)
+
+    def _tool_config_hash(self, check: str, directory: Path) -> str:
+        """Hash of the tool config files visible from ``directory`` up to the root."""
+        cache_key = (check, directory)
+        cached = self._dir_hashes.get(cache_key)
+        if cached is not None:
+            return cached
+        found: List[Tuple[str, str]] = []
+        if check == "bandit" and self._bandit_config is not None:
+            found.append(("-c", _read_text(Path(self._bandit_config))))
+        for d in _dirs_up_to(directory, self.root_path):
+            for name in _TOOL_CONFIG_FILENAMES[check]:
+                candidate = d / name
+                if candidate.is_file():
+                    found.append((str(candidate), _read_text(candidate)))
+        value = _digest(found)
+        self._dir_hashes[cache_key] = value
+        return value
+
+
+def plan_file_checks(
+    checks: List[str],
+    cached: Dict[str, Dict[str, Any]],
+    sha: str,
+    keys: CheckCacheKeys,
+    full_path: Path,
+) -> Tuple[Dict[str, Any], Dict[str, Tuple[str, str]]]:
+    """Split ``checks`` into re-usable cached findings and checks to re-run.
+
+    Args:
+        checks: Requested cached check names for the file.
+        cached: ``{check_name: entry}`` loaded for the file (may be empty).
+        sha: Current content SHA-256 of the file.
+        keys: Run-wide key calculator.
+        full_path: File on disk.
+
+    Returns:
+        ``(reused, stale)``: findings by check name whose key matches, and
+        ``{check_name: (tool_version, config_hash)}`` for checks to re-run.
+    """
+    reused: Dict[str, Any] = {}
+    stale: Dict[str, Tuple[str, str]] = {}
+    for check in checks:
+        version, config_hash = keys.key(check, full_path)
+        entry = cached.get(check)
+        if (
+            entry is not None
+            and entry.get("content_sha256") == sha
+            and entry.get("tool_version") == version
+            and entry.get("config_hash") == config_hash
+        ):
+            reused[check] = entry.get("result")
+        else:
+            stale[check] = (version, config_hash)
+    return reused, stale
+
+
+def _dirs_up_to(directory: Path, root: Path) -> List[Path]:
+    """``directory`` and its parents up to ``root`` (or the filesystem root)."""
+    directory = directory.resolve()
+    dirs = [directory]
+    if directory == root:
+        return dirs
+    for parent in directory.parents:
+        dirs.append(parent)
+        if parent == root:
+            break
+    return dirs
+
+
+def _read_text(path: Path) -> str:
+    """File content for hashing; unreadable files hash as empty."""
+    try:
+        return path.read_text(encoding="utf-8", errors="replace")
+    except OSError:
+        return ""
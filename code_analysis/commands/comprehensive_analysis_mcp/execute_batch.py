@@ -18,13 +18,22 @@ from mcp_proxy_adapter.commands.result import SuccessResult
 
 from ..base_mcp_command import BaseMCPCommand
 from ...core.database_driver_pkg.domain.comprehensive_analysis import (
+    get_check_cache_entries,
+    save_check_cache_entries,
     save_comprehensive_analysis_results_batch,
-    should_analyze_file,
 )
 from ...core.database_driver_pkg.domain.files import get_project_files
 from ...core.sql_portable import WHERE_FILES_ACTIVE
 from .batch_one_file import analyze_one_file_in_batch
 from .batch_summary import build_batch_summary, _merge_project_integrity_summary
+from .check_cache import (
+    CHECK_RESULT_KEYS,
+    CheckCacheKeys,
+    content_sha256,
+    is_cacheable,
+    plan_file_checks,
+    requested_checks,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -42,6 +51,11 @@ async def run_batch(
     Uses ctx for db, root_path, proj_id, analysis_logger, log_timing,
     progress_tracker, analyzer, results, and all execute params including
     limit, offset. Mutates ctx["results"] and returns SuccessResult.
+
+    Per-check findings are re-used from ``comprehensive_analysis_check_cache``
+    while the file content, tool version and effective config are unchanged
+    (see ``check_cache``); only invalidated checks run. A file whose requested
+    checks were all served from the cache counts as skipped up to date.
     """
     db = ctx["db"]
     root_path = ctx["root_path"]
@@ -114,9 +128,9 @@ async def run_batch(
     file_records: List[Dict[str, Any]] = []
 
     files_analyzed = 0
-    # Legacy summary key: skipped only when mtime/up-to-date gate says not to re-analyze.
+    # Legacy summary key: skipped when every requested check was served from the cache.
     files_skipped = 0
-    # Explicit bucket matching files_skipped (gate / up-to-date); kept in sync for clarity in summary.
+    # Explicit bucket matching files_skipped (up-to-date); kept in sync for clarity in summary.
     files_skipped_up_to_date = 0
     # Missing path, not a file, stat() failure, or read_text failure (rows that hit continue before analyze).
     files_skipped_unreadable_or_missing = 0
@@ -140,6 +154,26 @@ async def run_batch(
         return f" | avg {avg_sec:.1f}s/file ETA {eta_dt:%H:%M}"
 
     save_batch: List[tuple] = []
+    cache_batch: List[tuple] = []
+    cache_keys = CheckCacheKeys(
+        root_path,
+        analyzer,
+        duplicate_min_lines,
+        duplicate_min_similarity,
+        bandit_config,
+    )
+    check_flags = {
+        "check_placeholders": check_placeholders,
+        "check_stubs": check_stubs,
+        "check_empty_methods": check_empty_methods,
+        "check_imports": check_imports,
+        "check_duplicates": check_duplicates,
+        "check_flake8": check_flake8,
+        "check_black": check_black,
+        "check_isort": check_isort,
+        "check_bandit": check_bandit,
+        "check_docstrings": check_docstrings,
+    }
     timings_sec: Dict[str, float] = {
         "placeholders": 0.0,
         "stubs": 0.0,
@@ -227,6 +261,11 @@ async def run_batch(
             files_total = len(files)
 
         log_timing("multi_get_files", t_get_files)
+        try:
+            page_cache = get_check_cache_entries(db, [f["id"] for f in files])
+        except Exception as e:
+            logger.warning("Failed to load analysis check cache: %s", e)
+            page_cache = {}
         if progress_tracker and files_total > 0:
             progress_tracker.set_description(f"Analyzing: 0/{files_total} (0%)")
             progress_tracker.set_progress(0)
@@ -264,31 +303,6 @@ async def run_batch(
                 files_skipped_unreadable_or_missing += 1
                 continue
 
-            gate = should_analyze_file(db, file_id, file_mtime)
-            if not gate["should_analyze"]:
-                files_skipped += 1
-                files_skipped_up_to_date += 1
-                reason = gate.get("reason", "unknown")
-                logger.debug(
-                    "Skipping %s: %s (disk_mtime older or equal)",
-                    file_path_str,
-                    reason,
-                )
-                analysis_logger.debug(
-                    "Skipping %s: %s (db_mtime=%s, disk_mtime=%s)",
-                    file_path_str,
-                    reason,
-                    gate.get("db_mtime"),
-                    gate.get("disk_mtime"),
-                )
-                file_records.append(
-                    {
-                        "path": file_path_str,
-                        "lines": file_record.get("lines", 0),
-                    }
-                )
-                continue
-
             t0 = time.perf_counter()
             try:
                 source_code = full_path.read_text(encoding="utf-8")
@@ -305,14 +319,34 @@ async def run_batch(
                 }
             )
 
-            files_analyzed += 1
+            sha = content_sha256(source_code)
+            reused, stale = plan_file_checks(
+                requested_checks(check_flags, file_path_str),
+                page_cache.get(str(file_id), {}),
+                sha,
+                cache_keys,
+                full_path,
+            )
+            up_to_date = bool(reused) and not stale
             global_idx = batch_offset + idx + 1
             percent = int((global_idx / files_total) * 100)
-            file_name = Path(file_path_str).name
-            logger.info(f"Analyzing file {global_idx}/{files_total}: {file_path_str}")
-            analysis_logger.info(
-                f"Analyzing file {global_idx}/{files_total}: {file_path_str}"
-            )
+            if up_to_date:
+                files_skipped += 1
+                files_skipped_up_to_date += 1
+                analysis_logger.debug(
+                    "Up to date %s: %s cached check(s) re-used",
+                    file_path_str,
+                    len(reused),
+                )
+            else:
+                files_analyzed += 1
+                logger.info(
+                    f"Analyzing file {global_idx}/{files_total}: {file_path_str}"
+                )
+                analysis_logger.info(
+                    f"Analyzing file {global_idx}/{files_total}: {file_path_str}"
+                    + (f" ({len(reused)} cached check(s) re-used)" if reused else "")
+                )
 
             def set_step_desc(step: str) -> None:
                 """Update progress text for the current batch analysis step."""
@@ -347,6 +381,7 @@ async def run_batch(
                 check_isort=check_isort,
                 check_bandit=check_bandit,
                 bandit_config=bandit_config,
+                cached_results=reused,
             )
             all_placeholders.extend(file_results["placeholders"])
             all_stubs.extend(file_results["stubs"])
@@ -360,7 +395,23 @@ async def run_batch(
             all_bandit_findings.extend(file_results.get("bandit_findings", []))
             all_missing_docstrings.extend(file_results["missing_docstrings"])
 
+            if up_to_date:
+                continue
             if file_project_id:
+                for check, (version, config_hash) in stale.items():
+                    findings = file_results[CHECK_RESULT_KEYS[check]]
+                    if is_cacheable(check, findings):
+                        cache_batch.append(
+                            (
+                                file_id,
+                                file_project_id,
+                                check,
+                                sha,
+                                version,
+                                config_hash,
+                                findings,
+                            )
+                        )
                 save_batch.append(
                     (
                         file_id,
@@ -374,6 +425,7 @@ async def run_batch(
                     try:
                         t_save0 = time.perf_counter()
                         save_comprehensive_analysis_results_batch(db, save_batch)
+                        save_check_cache_entries(db, cache_batch)
                         timings_sec["save"] += time.perf_counter() - t_save0
                         results_persisted += len(save_batch)
                         analysis_logger.info(
@@ -381,6 +433,7 @@ async def run_batch(
                             len(save_batch),
                         )
                         save_batch.clear()
+                        cache_batch.clear()
                     except Exception as e:
                         save_errors += 1
                         logger.error(
@@ -417,6 +470,7 @@ async def run_batch(
         try:
             t_save0 = time.perf_counter()
             save_comprehensive_analysis_results_batch(db, save_batch)
+            save_check_cache_entries(db, cache_batch)
             timings_sec["save"] += time.perf_counter() - t_save0
             results_persisted += len(save_batch)
             analysis_logger.info(
@@ -42,11 +42,14 @@ def get_metadata(cls: Type[Any]) -> Dict[str, Any]:
             "→ ``issues`` table (when file watcher idle)\n"
             "9. Saves results to database (comprehensive_analysis_results table)\n"
             "10. Returns comprehensive analysis results\n\n"
-            "Incremental Analysis (mtime gate):\n"
-            "- Analyzes only if file on disk is newer than latest DB analysis (or no prior record).\n"
-            "- Skips when disk mtime is equal to DB mtime within tolerance (0.1s).\n"
-            "- Skips when disk mtime is older than DB mtime (no re-analysis of older files).\n"
-            "- Single file mode: returns cached results when file is skipped.\n\n"
+            "Incremental Analysis (per-check cache):\n"
+            "- Each check's findings are cached per file with the content SHA-256, "
+            "tool version and effective config hash (comprehensive_analysis_check_cache).\n"
+            "- A check re-runs only when one of those changed; other findings are re-used "
+            "and still reported.\n"
+            "- Files whose requested checks were all re-used count as skipped up to date.\n"
+            "- mypy runs once per project and is not cached per file.\n"
+            "- Single file mode always runs every requested check.\n\n"
             "Analysis Types:\n"
             "- Placeholders: Finds TODO, FIXME, XXX, HACK, NOTE comments\n"
             "- Stubs: Finds functions/methods with pass, ellipsis, NotImplementedError\n"
@@ -76,9 +79,9 @@ def get_metadata(cls: Type[Any]) -> Dict[str, Any]:
             "- Each check can be enabled/disabled via boolean parameters\n"
             "- Results include summary statistics for all analysis types\n"
             "- Results are saved to database (comprehensive_analysis_results table)\n"
-            "- Incremental analysis: only analyzes files whose disk mtime is newer than latest DB (with tolerance)\n"
-            "- Older-than-DB files are skipped; equal-within-tolerance files are skipped\n"
-            "- Single file mode: returns cached results when file is skipped"
+            "- Incremental analysis: only checks whose content, tool version or config "
+            "changed are re-run; cached findings are re-used\n"
+            "- Single file mode always runs every requested check"
         ),
         "parameters": {
             "root_dir": {
@@ -380,7 +383,7 @@ def get_metadata(cls: Type[Any]) -> Dict[str, Any]:
             "Run this command regularly to track code quality over time",
             "Use custom duplicate settings to focus on significant duplicates",
             "Results are automatically saved to database - incremental analysis improves performance",
-            "Only changed files are analyzed - unchanged files are skipped automatically",
+            "Only invalidated checks are re-run - unchanged files re-use cached findings",
         ],
         "data_persistence": {
             "results_saved_to_database": True,
@@ -399,12 +402,15 @@ def get_metadata(cls: Type[Any]) -> Dict[str, Any]:
                 "Results are stored in comprehensive_analysis_results table with UNIQUE(file_id, file_mtime) constraint."
             ),
             "incremental_analysis": (
-                "Mtime gate: analyze only if file is newer than latest DB analysis (or no record).\n"
-                "1. Gets file mtime from disk; fetches latest analysis mtime from DB for file_id.\n"
-                "2. No DB record -> analyze.\n"
-                "3. disk_mtime > db_mtime + tolerance (0.1s) -> analyze.\n"
-                "4. abs(disk_mtime - db_mtime) <= tolerance -> skip (use cached).\n"
-                "5. disk_mtime older than db_mtime (beyond tolerance) -> skip (older-than-DB files not re-analyzed)."
+                "Per-check cache (comprehensive_analysis_check_cache, one row per file and check).\n"
+                "1. Reads the file and hashes its content (SHA-256).\n"
+                "2. For each requested check, computes the tool version (package version for "
+                "AST checks) and the effective config hash (tool config files up to the "
+                "project root, analyzer thresholds, bandit config).\n"
+                "3. Cached findings whose three keys match are re-used.\n"
+                "4. Other checks run; AST-based checks share one parse of the file.\n"
+                "5. New findings are cached, except tool failures without findings "
+                "(timeouts, missing tool), which are retried next run."
             ),
             "what_is_returned": (
                 "Complete analysis results including:\n"
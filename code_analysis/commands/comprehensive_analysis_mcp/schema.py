@@ -18,8 +18,8 @@ def get_schema(cls: Any) -> Dict[str, Any]:
             "placeholders, stubs, empty methods, imports not at top, long files, "
             "duplicates, missing docstrings, flake8 linting, mypy type checking. "
             "This is a long-running command and is executed via queue. "
-            "Incremental: analyzes only files whose disk mtime is newer than or equal to "
-            "the latest analysis timestamp in DB (with tolerance); older-than-DB files are skipped."
+            "Incremental: per-file check results are cached by content hash, tool version "
+            "and effective config; only invalidated checks are re-run."
         ),
         "properties": {
             **base_props,
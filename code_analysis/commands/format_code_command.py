@@ -15,6 +15,7 @@ from mcp_proxy_adapter.commands.base import Command
 from mcp_proxy_adapter.commands.result import ErrorResult, SuccessResult
 
 from .base_mcp_command import BaseMCPCommand
+from .base_mcp_command_schema import params_validator_for
 from .command_metadata_helpers import finalize_command_metadata
 from ..core.backup_manager import BackupManager
 from ..core.code_quality import format_code_with_black
@@ -83,9 +84,7 @@ class FormatCodeCommand(Command):
 
     def validate_params(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Validate parameters against command schema before queue or execute."""
-        BaseMCPCommand.validate_params_against_schema(
-            params, self.get_schema(), command_name=self.name
-        )
+        params_validator_for(type(self), self.name)(params)
         return params
 
     async def execute(
@@ -16,7 +16,8 @@ import re
 import threading
 import time
 from time import perf_counter
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
 from mcp_proxy_adapter.commands.result import ErrorResult, SuccessResult
 
@@ -24,6 +25,7 @@ from ..core.progress_tracker import get_progress_tracker_from_context
 from .base_mcp_command import BaseMCPCommand
 from .command_metadata_helpers import finalize_command_metadata
 from ..core.exceptions import ValidationError
+from ..core.file_handlers.line_index import get_line_index, iter_lines_containing
 from .fs_grep_budget import (
     GREP_BUDGET_EXCEEDED,
     GREP_HARD_TIMEOUT,
@@ -544,6 +546,12 @@ class FsGrepCommand(BaseMCPCommand):
                 ),
                 timeout=hard_limit,
             )
+        except asyncio.CancelledError:
+            # Caller gave up (e.g. cross search settled its first page): stop
+            # the offloaded scan the same way as on hard timeout.
+            if cancel_event is not None:
+                cancel_event.set()
+            raise
         except asyncio.TimeoutError:
             # asyncio.wait_for only cancels the awaiting Task; the underlying
             # asyncio.to_thread worker keeps running (and its DB connection stays
@@ -1068,18 +1076,28 @@ def _phase1_text_scan_targets(
 
         files_scanned += 1
         file_matches: List[Dict[str, Any]] = []
-        try:
-            text = target.read_content(project_root)
-        except ValueError as exc:
-            code = str(exc).split(":")[0] if ":" in str(exc) else str(exc)
-            budget.add_warning(code, str(exc), relative_path=rel)
-            files_skipped_io += 1
-            continue
-        except OSError:
-            files_skipped_io += 1
-            continue
+        line_source: Optional[Iterator[Tuple[int, str]]] = None
+        if target.source == "disk":
+            line_source = _indexed_literal_lines(
+                abs_path,
+                needle=needle,
+                literal=literal,
+                case_sensitive=case_sensitive,
+            )
+        if line_source is None:
+            try:
+                text = target.read_content(project_root)
+            except ValueError as exc:
+                code = str(exc).split(":")[0] if ":" in str(exc) else str(exc)
+                budget.add_warning(code, str(exc), relative_path=rel)
+                files_skipped_io += 1
+                continue
+            except OSError:
+                files_skipped_io += 1
+                continue
+            line_source = enumerate(text.splitlines(), start=1)
 
-        for i, raw_line in enumerate(text.splitlines(), start=1):
+        for i, raw_line in line_source:
             if len(matches) >= max_matches:
                 break
             if budget.should_stop_scan(
@@ -1128,6 +1146,34 @@ def _phase1_text_scan_targets(
     }
 
 
+def _indexed_literal_lines(
+    abs_path: Path,
+    *,
+    needle: str,
+    literal: bool,
+    case_sensitive: bool,
+) -> Optional[Iterator[Tuple[int, str]]]:
+    """Return ``(line_number, line)`` candidates found by a byte search, or None.
+
+    Only for literal case-sensitive needles on files with a line-offset index
+    (see ``line_index``): the UTF-8 needle is searched in the mapped bytes and
+    hits are mapped to line numbers, so lines without a hit are never decoded.
+    None means scan the decoded lines as usual.
+    """
+    if not (literal and case_sensitive and needle):
+        return None
+    if any(ch in needle for ch in "\r\n\0\ufffd"):
+        return None
+    try:
+        needle_bytes = needle.encode("utf-8")
+    except UnicodeEncodeError:
+        return None
+    index = get_line_index(abs_path)
+    if index is None:
+        return None
+    return iter_lines_containing(abs_path, index, needle_bytes)
+
+
 def _line_matches(
     raw_line: str,
     *,
@@ -19,8 +19,10 @@ from .base_mcp_command_resolve_path import resolve_under_project_root
 from .line_command_cst_gate import (
     LINE_CMD_DISALLOWED_MSG,
     healthy_parse_blocks_line_ops,
+    line_ops_gate_needs_source,
 )
 from ..core.exceptions import ValidationError
+from ..core.file_handlers.line_index import TextLines, open_text_lines
 from ..core.file_handlers.text_ranges import validate_range_against_length
 
 logger = logging.getLogger(__name__)
@@ -195,7 +197,6 @@ class GetFileLinesCommand(BaseMCPCommand):
                     },
                 )
 
-            text = absolute_path.read_text(encoding="utf-8", errors="replace")
             try:
                 config_data = self._get_raw_config()
             except FileNotFoundError:
@@ -203,12 +204,21 @@ class GetFileLinesCommand(BaseMCPCommand):
             allow_on_healthy = config_data.get("code_analysis", {}).get(
                 "allow_line_commands_on_healthy_files", False
             )
-            if healthy_parse_blocks_line_ops(
-                text,
-                allow_healthy_line_ops=allow_healthy_line_ops,
-                allow_line_commands_on_healthy_files=bool(allow_on_healthy),
-                file_path=file_path,
-            ):
+            gate_kwargs: Dict[str, Any] = {
+                "allow_healthy_line_ops": allow_healthy_line_ops,
+                "allow_line_commands_on_healthy_files": bool(allow_on_healthy),
+                "file_path": file_path,
+            }
+            if line_ops_gate_needs_source(**gate_kwargs):
+                text = absolute_path.read_text(encoding="utf-8", errors="replace")
+                text_lines = TextLines(
+                    absolute_path, lines=text.splitlines(keepends=False)
+                )
+            else:
+                # No parse needed: large files are served from the line index.
+                text = ""
+                text_lines = open_text_lines(absolute_path)
+            if healthy_parse_blocks_line_ops(text, **gate_kwargs):
                 return ErrorResult(
                     message=LINE_CMD_DISALLOWED_MSG,
                     code="USE_CST_COMMANDS",
@@ -221,8 +231,7 @@ class GetFileLinesCommand(BaseMCPCommand):
                         ],
                     },
                 )
-            all_lines = text.splitlines(keepends=False)
-            total_lines = len(all_lines)
+            total_lines = text_lines.total_lines
 
             if total_lines == 0:
                 return SuccessResult(
@@ -252,7 +261,7 @@ class GetFileLinesCommand(BaseMCPCommand):
                         "total_lines": total_lines,
                     },
                 )
-            lines = all_lines[start_line - 1 : end_line]
+            lines = text_lines.window(start_line, end_line)
             low = start_line
             high = end_line
 
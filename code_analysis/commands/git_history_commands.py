@@ -24,6 +24,7 @@ from code_analysis.commands.git_worktree_base import (
     string_list,
     validation_error,
 )
+from code_analysis.core.git_ops.inprocess_read import read_tag_names
 
 
 def _git_output_data(
@@ -381,6 +382,26 @@ class GitTagCommand(GitWorktreeCommand):
         tag_name = (name or "").strip()
         remote_value = (remote or "origin").strip() or "origin"
 
+        if action_value == "list":
+            root, root_error = self._resolve_git_root_or_error(project_id)
+            if root_error is not None:
+                return root_error
+            tags_served = read_tag_names(root, pattern)
+            if tags_served is not None:
+                data = _git_output_data(
+                    success=True,
+                    stdout="\n".join(tags_served),
+                    stderr="",
+                    extra={
+                        "action": action_value,
+                        "name": tag_name,
+                        "remote": remote_value,
+                    },
+                )
+                data["tags"] = tags_served
+                data["count"] = len(tags_served)
+                return SuccessResult(data=cast(Dict[str, Any], data))
+
         args: List[str]
         if action_value == "list":
             args = ["tag", "--list"]
@@ -3,6 +3,7 @@
 """git_branch MCP command (C-009): local branch enumeration.
 
 Reports the list of local branches with the current branch marked.
+Served in-process (dulwich) when HEAD is attached, else via ``git branch``.
 Read-only; never mutates the working tree, index, or refs. When the
 resolved project root is not a usable git repository, returns the
 uniform read-availability outcome instead of a malformed-call error
@@ -22,6 +23,7 @@ from code_analysis.commands.git_ops.read_availability import (
     run_git_read,
 )
 from code_analysis.core.exceptions import ValidationError
+from code_analysis.core.git_ops.inprocess_read import read_local_branches
 
 
 class GitBranchCommand(BaseMCPCommand):
@@ -116,27 +118,28 @@ class GitBranchCommand(BaseMCPCommand):
         if outcome is not None:
             return availability_success_result(outcome)
 
-        rc, out, err = run_git_read(
-            root, ["branch", "--list", "--format=%(refname:short)%09%(HEAD)"]
-        )
-        if rc != 0:
-            return ErrorResult(
-                message=err.strip() or "git command failed",
-                code=cast(Any, "GIT_COMMAND_FAILED"),
-                details={"returncode": rc},
+        branches = read_local_branches(root)
+        if branches is None:
+            rc, out, err = run_git_read(
+                root, ["branch", "--list", "--format=%(refname:short)%09%(HEAD)"]
             )
-
-        branches: List[Dict[str, Any]] = []
-        current: Optional[str] = None
-        for line in out.splitlines():
-            if not line:
-                continue
-            parts = line.split("\t")
-            name = parts[0]
-            is_current = len(parts) > 1 and parts[1].strip() == "*"
-            branches.append({"name": name, "current": is_current})
-            if is_current:
-                current = name
+            if rc != 0:
+                return ErrorResult(
+                    message=err.strip() or "git command failed",
+                    code=cast(Any, "GIT_COMMAND_FAILED"),
+                    details={"returncode": rc},
+                )
+
+            branches = []
+            for line in out.splitlines():
+                if not line:
+                    continue
+                parts = line.split("\t")
+                is_current = len(parts) > 1 and parts[1].strip() == "*"
+                branches.append({"name": parts[0], "current": is_current})
+        current: Optional[str] = next(
+            (branch["name"] for branch in branches if branch["current"]), None
+        )
 
         payload: Dict[str, Any] = {
             "success": True,
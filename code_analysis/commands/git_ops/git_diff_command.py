@@ -3,7 +3,9 @@
 """git_diff MCP command (C-009): working-tree and revision differences.
 
 Reports the diff between two revisions, or between a revision and the
-working tree/index, optionally scoped to a tracked file. Read-only;
+working tree/index, optionally scoped to a tracked file. A single-file
+diff between two revisions is computed in-process (dulwich blob diff);
+everything else runs ``git diff``. Read-only;
 never mutates the working tree, index, or refs. When the resolved
 project root is not a usable git repository, returns the uniform
 read-availability outcome instead of a malformed-call error (spec
@@ -23,6 +25,7 @@ from code_analysis.commands.git_ops.read_availability import (
     run_git_read,
 )
 from code_analysis.core.exceptions import ValidationError
+from code_analysis.core.git_ops.inprocess_read import read_blob_diff
 from code_analysis.core.project_git.path_confinement import (
     confine_project_git_path,
 )
@@ -152,21 +155,27 @@ class GitDiffCommand(BaseMCPCommand):
             if confinement_error is not None:
                 return confinement_error
 
-        argv: List[str] = ["diff"]
-        if rev_from:
-            argv.append(rev_from)
-        if rev_to:
-            argv.append(rev_to)
-        if file_path:
-            argv.extend(["--", file_path])
-
-        rc, out, err = run_git_read(root, argv)
-        if rc != 0:
-            return ErrorResult(
-                message=err.strip() or "git command failed",
-                code=cast(Any, "GIT_COMMAND_FAILED"),
-                details={"returncode": rc},
+        out: Optional[str] = None
+        if rev_from and rev_to and file_path:
+            out = read_blob_diff(
+                root, rev_from=rev_from, rev_to=rev_to, file_path=file_path
             )
+        if out is None:
+            argv: List[str] = ["diff"]
+            if rev_from:
+                argv.append(rev_from)
+            if rev_to:
+                argv.append(rev_to)
+            if file_path:
+                argv.extend(["--", file_path])
+
+            rc, out, err = run_git_read(root, argv)
+            if rc != 0:
+                return ErrorResult(
+                    message=err.strip() or "git command failed",
+                    code=cast(Any, "GIT_COMMAND_FAILED"),
+                    details={"returncode": rc},
+                )
 
         payload: Dict[str, Any] = {
             "success": True,
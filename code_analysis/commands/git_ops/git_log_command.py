@@ -4,7 +4,9 @@
 
 Reports commit history for a registered project's git repository,
 optionally scoped to a revision range start and/or a tracked file.
-Read-only; never mutates the working tree, index, or refs. When the
+Read-only; never mutates the working tree, index, or refs. History not
+scoped to a file is read in-process (dulwich); file-scoped history and
+revision syntax not handled there fall back to ``git log``. When the
 resolved project root is not a usable git repository, returns the
 uniform read-availability outcome instead of a malformed-call error
 (spec {u1v2} {w3x4}).
@@ -23,6 +25,7 @@ from code_analysis.commands.git_ops.read_availability import (
     run_git_read,
 )
 from code_analysis.core.exceptions import ValidationError
+from code_analysis.core.git_ops.inprocess_read import read_log
 from code_analysis.core.project_git.path_confinement import (
     confine_project_git_path,
 )
@@ -149,39 +152,43 @@ class GitLogCommand(BaseMCPCommand):
             if confinement_error is not None:
                 return confinement_error
 
-        argv: List[str] = [
-            "log",
-            "--pretty=format:%H%x1f%an%x1f%ae%x1f%aI%x1f%s",
-            "-n",
-            str(max_count),
-        ]
-        if rev:
-            argv.append(rev)
-        if file_path:
-            argv.extend(["--", file_path])
-
-        rc, out, err = run_git_read(root, argv)
-        if rc != 0:
-            return ErrorResult(
-                message=err.strip() or "git command failed",
-                code=cast(Any, "GIT_COMMAND_FAILED"),
-                details={"returncode": rc},
-            )
-
-        commits: List[Dict[str, str]] = []
-        for line in out.splitlines():
-            if not line:
-                continue
-            fields = line.split("\x1f")
-            commits.append(
-                {
-                    "hash": fields[0],
-                    "author_name": fields[1],
-                    "author_email": fields[2],
-                    "date": fields[3],
-                    "subject": fields[4],
-                }
-            )
+        commits: Optional[List[Dict[str, str]]] = None
+        if not file_path:
+            commits = read_log(root, rev=rev or None, max_count=max_count)
+        if commits is None:
+            argv: List[str] = [
+                "log",
+                "--pretty=format:%H%x1f%an%x1f%ae%x1f%aI%x1f%s",
+                "-n",
+                str(max_count),
+            ]
+            if rev:
+                argv.append(rev)
+            if file_path:
+                argv.extend(["--", file_path])
+
+            rc, out, err = run_git_read(root, argv)
+            if rc != 0:
+                return ErrorResult(
+                    message=err.strip() or "git command failed",
+                    code=cast(Any, "GIT_COMMAND_FAILED"),
+                    details={"returncode": rc},
+                )
+
+            commits = []
+            for line in out.splitlines():
+                if not line:
+                    continue
+                fields = line.split("\x1f")
+                commits.append(
+                    {
+                        "hash": fields[0],
+                        "author_name": fields[1],
+                        "author_email": fields[2],
+                        "date": fields[3],
+                        "subject": fields[4],
+                    }
+                )
 
         payload: Dict[str, Any] = {
             "success": True,
@@ -9,7 +9,9 @@ commits yet, the operation returns a distinct, non-error availability
 outcome that names the condition rather than raising as though the call
 were malformed. This module defines that shared outcome and the
 read-only subprocess runner used to detect it, so every read operation
-in the read set applies the identical uniform outcome.
+in the read set applies the identical uniform outcome. The git
+availability probe is memoized per process and the HEAD check is served
+in-process (dulwich) when the repository can be opened.
 
 Author: Vasiliy Zdanovskiy
 email: vasilyvz@gmail.com
@@ -24,6 +26,7 @@ from typing import Any, Dict, List, Optional, Tuple
 from mcp_proxy_adapter.commands.result import SuccessResult
 
 from code_analysis.core.git_integration import is_git_available, is_git_repository
+from code_analysis.core.git_ops.inprocess_read import has_commits
 
 GIT_NOT_AVAILABLE = "GIT_NOT_AVAILABLE"
 GIT_NOT_A_REPO = "GIT_NOT_A_REPO"
@@ -91,10 +94,13 @@ def check_read_availability(resolved_root: Path) -> Optional[Dict[str, Any]]:
             "reason": GIT_NOT_A_REPO,
             "message": "The resolved project root is not a git repository.",
         }
-    returncode, _stdout, _stderr = run_git_read(
-        resolved_root, ["rev-parse", "--verify", "HEAD"]
-    )
-    if returncode != 0:
+    head_present = has_commits(resolved_root)
+    if head_present is None:
+        returncode, _stdout, _stderr = run_git_read(
+            resolved_root, ["rev-parse", "--verify", "HEAD"]
+        )
+        head_present = returncode == 0
+    if not head_present:
         return {
             "success": True,
             "available": False,
@@ -28,6 +28,23 @@ LINE_CMD_DISALLOWED_MSG = (
 )
 
 
+def line_ops_gate_needs_source(
+    *,
+    allow_healthy_line_ops: bool,
+    allow_line_commands_on_healthy_files: bool,
+    file_path: str = "",
+) -> bool:
+    """
+    Return True if healthy_parse_blocks_line_ops would parse the source text.
+
+    When False the gate passes without looking at the text, so callers may
+    read only the requested line window instead of the whole file.
+    """
+    if allow_healthy_line_ops or allow_line_commands_on_healthy_files:
+        return False
+    return not file_path or Path(file_path).suffix.lower() in FORBIDDEN_PYTHON_SOURCE_SUFFIXES
+
+
 def healthy_parse_blocks_line_ops(
     source_text: str,
     *,
@@ -44,9 +61,11 @@ def healthy_parse_blocks_line_ops(
     Only runs the CST parse check for Python source files (based on file extension).
     Non-Python files are always allowed through without parsing.
     """
-    if allow_healthy_line_ops or allow_line_commands_on_healthy_files:
-        return False
-    if file_path and Path(file_path).suffix.lower() not in FORBIDDEN_PYTHON_SOURCE_SUFFIXES:
+    if not line_ops_gate_needs_source(
+        allow_healthy_line_ops=allow_healthy_line_ops,
+        allow_line_commands_on_healthy_files=allow_line_commands_on_healthy_files,
+        file_path=file_path,
+    ):
         return False
     try:
         cst.parse_module(source_text)
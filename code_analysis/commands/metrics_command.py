@@ -0,0 +1,84 @@
+"""
+Export hot-path metrics (SQL, pool, indexing, SVO, search, watcher) as Prometheus text.
+
+Author: Vasiliy Zdanovskiy
+email: vasilyvz@gmail.com
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Optional
+
+from mcp_proxy_adapter.commands.base import Command
+from mcp_proxy_adapter.commands.result import ErrorResult, SuccessResult
+from mcp_proxy_adapter.core.errors import ValidationError
+
+from code_analysis.core.metrics import (
+    CONTENT_TYPE,
+    collect_metrics,
+    metrics_enabled,
+    render_prometheus_text,
+)
+
+
+class MetricsCommand(Command):
+    """Merged server and worker metrics in Prometheus text format."""
+
+    name = "metrics"
+    version = "1.0.0"
+    descr = "Latency histograms and counters of server hot paths (Prometheus text)"
+    category = "system"
+    author = "Vasiliy Zdanovskiy"
+    email = "vasilyvz@gmail.com"
+
+    @classmethod
+    def get_schema(cls) -> Dict[str, Any]:
+        """Return the command input schema."""
+        from code_analysis.commands.command_metadata_helpers import empty_params_schema
+
+        return empty_params_schema(
+            description="No parameters; returns metrics of all server processes.",
+        )
+
+    @classmethod
+    def metadata(cls: type["MetricsCommand"]) -> Dict[str, Any]:
+        """Return metadata for the zero-argument metrics command."""
+        from code_analysis.commands.zero_arg_commands_metadata import (
+            metrics_command_metadata,
+        )
+
+        return metrics_command_metadata(cls)
+
+    def validate_params(self, params: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Adapter Command validates unknown keys; server execute path calls this explicitly."""
+        return super().validate_params(params)
+
+    async def execute(self, **kwargs: Any) -> SuccessResult | ErrorResult:
+        """Return the merged metrics rendered as Prometheus text."""
+        params = {k: v for k, v in kwargs.items() if k != "context"}
+        try:
+            self.validate_params(params)
+        except ValidationError as e:
+            data = getattr(e, "data", None) or {}
+            return ErrorResult(
+                message=str(e),
+                code="VALIDATION_ERROR",  # type: ignore[arg-type]
+                details={"field": data.get("field")},
+            )
+        try:
+            merged = collect_metrics()
+            text = render_prometheus_text(merged)
+        except Exception as e:
+            return ErrorResult(
+                message=f"Failed to collect metrics: {e}",
+                code="METRICS_ERROR",  # type: ignore[arg-type]
+            )
+        return SuccessResult(
+            data={
+                "enabled": metrics_enabled(),
+                "content_type": CONTENT_TYPE,
+                "metric_count": len(merged),
+                "series_count": sum(len(m["series"]) for m in merged.values()),
+                "text": text,
+            }
+        )
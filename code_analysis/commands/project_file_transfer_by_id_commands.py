@@ -3,7 +3,9 @@ MCP commands: chunked download / upload for project files addressed by DB file U
 
 Bridges ``files.id`` to the mcp-proxy-adapter transfer API (transfer_download_begin flow)
 and to the same save pipeline as ``universal_file_save`` for uploads (backups, handlers,
-metadata, optional git).
+metadata, optional git). Uploads may carry an rsync-style delta against the current
+file (``project_file_transfer_signatures`` + ``upload_format=delta``; see
+:mod:`code_analysis.core.file_delta`).
 
 Author: Vasiliy Zdanovskiy
 email: vasilyvz@gmail.com
@@ -34,10 +36,12 @@ from .base_mcp_command import BaseMCPCommand
 from .base_mcp_command_resolve_path import resolve_under_project_root
 from .project_file_transfer_by_id_commands_metadata import (
     get_project_file_transfer_download_begin_metadata,
+    get_project_file_transfer_signatures_metadata,
     get_project_file_transfer_upload_save_metadata,
 )
 from .project_file_transfer_by_id_commands_schema import (
     get_project_file_transfer_download_begin_schema,
+    get_project_file_transfer_signatures_schema,
     get_project_file_transfer_upload_save_schema,
 )
 from .universal_file_save_command import UniversalFileSaveCommand
@@ -56,6 +60,13 @@ from ..core.database.file_purge_cascade import purge_file_ids_cascade_via_client
 from ..core.database_driver_pkg.domain.files import get_file_by_path
 from ..core.database_driver_pkg.domain.projects import get_project
 from ..core.exceptions import ValidationError
+from ..core.file_delta import (
+    MAX_BLOCK_SIZE,
+    DeltaError,
+    apply_delta,
+    file_signatures,
+    parse_delta,
+)
 from ..core.file_lock import acquire_persistent_file_lock, release_persistent_file_lock
 from ..core.runtime_lock_sessions import (
     ensure_client_lock_session,
@@ -277,6 +288,51 @@ def _read_completed_upload_text(
     return text, compression
 
 
+def _reconstruct_delta_upload(
+    database: DatabaseClient,
+    project_id: str,
+    rel_posix: str,
+    transfer_id: str,
+    delta_text: str,
+) -> Union[str, ErrorResult]:
+    """Rebuild full file text from an rsync-style delta and the on-disk base.
+
+    The delta references blocks of the bytes currently on disk (see
+    ``project_file_transfer_signatures``); both the base and the result are
+    checked against the sha256 values the client declared.
+    """
+    disk_out = _require_on_disk_project_file(database, project_id, rel_posix)
+    if isinstance(disk_out, ErrorResult):
+        return disk_out
+    details: Dict[str, Any] = {
+        "transfer_id": str(transfer_id).strip(),
+        "project_id": project_id,
+        "file_path": rel_posix,
+    }
+    try:
+        content = apply_delta(disk_out.read_bytes(), parse_delta(delta_text))
+    except DeltaError as e:
+        return ErrorResult(
+            message=str(e),
+            code=e.code,  # type: ignore[arg-type]
+            details={**details, **e.details},
+        )
+    except OSError as e:
+        return ErrorResult(
+            message=f"Failed to read delta base file: {e}",
+            code="FILE_NOT_FOUND",  # type: ignore[arg-type]
+            details=details,
+        )
+    try:
+        return content.decode("utf-8")
+    except UnicodeDecodeError as e:
+        return ErrorResult(
+            message=f"Reconstructed content is not valid UTF-8: {e}",
+            code="BUFFER_READ_ERROR",  # type: ignore[arg-type]
+            details=details,
+        )
+
+
 def _resolve_file_by_id(
     database: DatabaseClient,
     file_id: str,
@@ -896,6 +952,97 @@ class ProjectFileTransferDownloadBeginCommand(BaseMCPCommand):
         return SuccessResult(data=merged)
 
 
+class ProjectFileTransferSignaturesCommand(BaseMCPCommand):
+    """Publish rsync-style block signatures of an indexed file for delta uploads."""
+
+    name = "project_file_transfer_signatures"
+    version = "1.0.0"
+    descr = (
+        "Return block signatures (Adler-32 rolling checksum + BLAKE2b strong hash) "
+        "of the current bytes of an indexed project file, addressed by ``file_id``. "
+        "Clients send only changed blocks through the upload transfer and save with "
+        "``project_file_transfer_upload_save`` ``upload_format=delta``. Client "
+        "façade: ``FileSessionClient.upload_delta``."
+    )
+    category = "file_management"
+    author = "Vasiliy Zdanovskiy"
+    email = "vasilyvz@gmail.com"
+    use_queue = False
+
+    @classmethod
+    def get_schema(cls) -> Dict[str, Any]:
+        """Return the schema for block-signature requests."""
+        return cast(Dict[str, Any], get_project_file_transfer_signatures_schema())
+
+    def validate_params(  # type: ignore[override]
+        self, params: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Validate the file selector and the optional block size."""
+        params = super().validate_params(params)
+        _validate_download_params(params)
+        bs = params.get("block_size")
+        if bs is not None:
+            if not isinstance(bs, int) or bs <= 0 or bs > MAX_BLOCK_SIZE:
+                raise ValidationError(
+                    f"block_size must be an integer in 1..{MAX_BLOCK_SIZE}",
+                    field="block_size",
+                    details={"block_size": bs},
+                )
+        return params
+
+    @classmethod
+    def metadata(
+        cls: Type["ProjectFileTransferSignaturesCommand"],
+    ) -> Dict[str, Any]:
+        """Return registration metadata for block signatures."""
+        return cast(Dict[str, Any], get_project_file_transfer_signatures_metadata(cls))
+
+    async def execute(  # type: ignore[override]
+        self,
+        file_id: str,
+        project_id: Optional[str] = None,
+        block_size: Optional[int] = None,
+        **kwargs: Any,
+    ) -> SuccessResult | ErrorResult:
+        """Compute block signatures of the on-disk file behind ``file_id``."""
+        database = self._open_database_from_config(auto_analyze=False)
+        resolved = _resolve_file_by_id(database, file_id, project_id)
+        if isinstance(resolved, ErrorResult):
+            return resolved
+        row, rel_posix, effective_project_id = resolved
+        disk_out = _require_on_disk_project_file(
+            database, effective_project_id, rel_posix
+        )
+        if isinstance(disk_out, ErrorResult):
+            return disk_out
+        try:
+            data = disk_out.read_bytes()
+        except OSError as e:
+            return ErrorResult(
+                message=f"Failed to read file: {e}",
+                code="FILE_NOT_FOUND",  # type: ignore[arg-type]
+                details={"project_id": effective_project_id, "file_path": rel_posix},
+            )
+        signatures = file_signatures(data, block_size)
+        logger.info(
+            "[%s] project_id=%s file_id=%s path=%s size=%d block_size=%d",
+            self.name,
+            effective_project_id,
+            row.get("id"),
+            rel_posix,
+            signatures["size"],
+            signatures["block_size"],
+        )
+        return SuccessResult(
+            data={
+                "file_id": str(row.get("id") or file_id).strip(),
+                "project_id": effective_project_id,
+                "file_path": rel_posix,
+                **signatures,
+            }
+        )
+
+
 class ProjectFileTransferUploadSaveCommand(BaseMCPCommand):
     """Apply a completed transfer upload to the file row identified by ``files.id``."""
 
@@ -907,7 +1054,8 @@ class ProjectFileTransferUploadSaveCommand(BaseMCPCommand):
         "if ``project_id`` is set it must match the row). **Create new:** pass "
         "``project_id`` + project-relative ``file_path`` (path must not already be "
         "in the ``files`` index). Same pipeline as ``universal_file_save``. Client "
-        "façade: ``upload`` / ``upload_new`` with ``unlock`` → ``unlock_after_write``."
+        "façade: ``upload`` / ``upload_new`` with ``unlock`` → ``unlock_after_write``; "
+        "``upload_delta`` sends only changed blocks (``upload_format=delta``)."
     )
     category = "file_management"
     author = "Vasiliy Zdanovskiy"
@@ -938,6 +1086,19 @@ class ProjectFileTransferUploadSaveCommand(BaseMCPCommand):
                     field="diff_context_lines",
                     details={"diff_context_lines": dcl},
                 )
+        upload_format = params.get("upload_format") or "full"
+        if upload_format not in ("full", "delta"):
+            raise ValidationError(
+                "upload_format must be full or delta",
+                field="upload_format",
+                details={"upload_format": upload_format},
+            )
+        if upload_format == "delta" and not str(params.get("file_id") or "").strip():
+            raise ValidationError(
+                "upload_format=delta updates an existing file; file_id is required",
+                field="file_id",
+                details={"upload_format": upload_format},
+            )
         try:
             normalize_lock_mode(params.get("lock_mode") or "none")
         except ValueError as exc:
@@ -977,6 +1138,7 @@ class ProjectFileTransferUploadSaveCommand(BaseMCPCommand):
         unlock_after_write: bool = True,
         lock_mode: str = "none",
         session_id: Optional[str] = None,
+        upload_format: str = "full",
         **kwargs: Any,
     ) -> SuccessResult | ErrorResult:
         """Save a completed upload through the universal file-save pipeline."""
@@ -1024,6 +1186,13 @@ class ProjectFileTransferUploadSaveCommand(BaseMCPCommand):
         if isinstance(read_out, ErrorResult):
             return read_out
         content, _compression = read_out
+        if upload_format == "delta":
+            rebuilt = _reconstruct_delta_upload(
+                database, effective_project_id, rel_posix, transfer_id, content
+            )
+            if isinstance(rebuilt, ErrorResult):
+                return rebuilt
+            content = rebuilt
 
         mode = normalize_lock_mode(lock_mode)
         is_create = _row is None
@@ -1140,6 +1309,7 @@ class ProjectFileTransferUploadSaveCommand(BaseMCPCommand):
             result.data.setdefault("resolved_file_path", rel_posix)
             result.data.setdefault("lock_mode", lock_mode)
             result.data.setdefault("lock_session_id", lock_session_id)
+            result.data.setdefault("upload_format", upload_format)
             if not dry_run:
                 if pre_registered_file_id is not None:
                     # Durability post-condition: never return a file_id whose row
@@ -294,6 +294,124 @@ def get_project_file_transfer_download_begin_metadata(
     }
 
 
+def get_project_file_transfer_signatures_metadata(cls: Type[Any]) -> Dict[str, Any]:
+    """Documentation-oriented metadata for ``project_file_transfer_signatures``."""
+    return {
+        "name": cls.name,
+        "version": cls.version,
+        "description": cls.descr,
+        "category": cls.category,
+        "author": cls.author,
+        "email": cls.email,
+        "detailed_description": (
+            "First step of an rsync-style **delta upload**. Returns one signature per "
+            "fixed-size block of the current on-disk bytes of the file behind ``file_id``: "
+            "``[adler32, blake2b_128_hex]``. Adler-32 equals ``zlib.adler32`` of the block, "
+            "so the client can roll it one byte at a time over its new content.\n\n"
+            "The client emits ``{\"copy\": i, \"count\": n}`` for runs of matching blocks "
+            "and ``{\"data\": base64}`` for everything else, uploads the JSON "
+            "``rsync-delta/1`` document through the normal upload transfer, and calls "
+            "``project_file_transfer_upload_save`` with ``upload_format=delta``. The server "
+            "checks ``base_sha256`` against the file, rebuilds the content, verifies "
+            "``sha256`` and only then runs the usual save pipeline (backups, handlers, "
+            "metadata).\n\n"
+            "**Client façade:** ``FileSessionClient.upload_delta`` (falls back to a full "
+            "upload when the delta is not smaller or the base changed).\n\n"
+            "**Safety:** Read-only; no locks, no transfer session."
+        ),
+        "parameters": {
+            "file_id": {
+                "description": "UUID primary key of the ``files`` row. **Required.**",
+                "type": "string",
+                "required": True,
+                "examples": ["f1e2d3c4-b5a6-4789-8012-3456789abcde"],
+            },
+            "project_id": {
+                "description": (
+                    "Optional project UUID. When provided, the ``files`` row must belong to "
+                    "this project."
+                ),
+                "type": "string",
+                "required": False,
+            },
+            "block_size": {
+                "description": (
+                    "Optional block size in bytes (1..65536). Default: power of two near "
+                    "sqrt(file size), at least 1024."
+                ),
+                "type": "integer",
+                "required": False,
+            },
+        },
+        "return_value": {
+            "success": {
+                "description": "Signatures of the current file content.",
+                "data": {
+                    "file_id": "``files.id`` of the target.",
+                    "project_id": "Effective project UUID.",
+                    "file_path": "Project-relative path.",
+                    "format": "``rsync-delta/1``.",
+                    "block_size": "Block size in bytes (last block may be shorter).",
+                    "size": "File size in bytes.",
+                    "sha256": "sha256 of the whole file; send it back as ``base_sha256``.",
+                    "blocks": "List of ``[adler32, blake2b_128_hex]`` per block.",
+                },
+                "example": {
+                    "file_id": "f1e2d3c4-b5a6-4789-8012-3456789abcde",
+                    "project_id": "a1b2c3d4-e5f6-7890-abcd-ef1234567890",
+                    "file_path": "data/fixtures.json",
+                    "format": "rsync-delta/1",
+                    "block_size": 2048,
+                    "size": 4100,
+                    "sha256": "9f86d081884c7d659a2feaa0c55ad015a3bf4f1b2b0b822cd15d6c15b0f00a08",
+                    "blocks": [
+                        [1135609281, "6f1ed002ab5595859014ebf0951522d9"],
+                        [2094338413, "c5e478d59288c841aa530db6845c4c8d"],
+                        [13238274, "1a79a4d60de6718e8e5b326e338ae533"],
+                    ],
+                },
+            },
+            "error": {
+                "description": "Resolver failure.",
+                "code": (
+                    "FILE_NOT_FOUND, FILE_DELETED, FILE_PATH_MISSING, PROJECT_NOT_FOUND, "
+                    "PATH_ERROR, VALIDATION_ERROR."
+                ),
+                "message": "Human-readable explanation.",
+                "details": "file_id, project_id, file_path.",
+            },
+        },
+        "usage_examples": [
+            {
+                "description": "Signatures with the default block size",
+                "command": {"file_id": "f1e2d3c4-b5a6-4789-8012-3456789abcde"},
+                "explanation": "Equivalent to the first call of ``FileSessionClient.upload_delta``.",
+            },
+        ],
+        "error_cases": {
+            "FILE_NOT_FOUND": {
+                "description": "No ``files`` row for ``file_id`` or the file is missing on disk.",
+                "message": "No file with id … / File not found on disk: …",
+                "solution": "Use a valid ``files.id``; upload_new for files not on disk yet.",
+            },
+            "FILE_DELETED": {
+                "description": "Row exists but is marked deleted.",
+                "message": "File is marked deleted in the database",
+                "solution": "Restore the row or pick another file_id.",
+            },
+            "VALIDATION_ERROR": {
+                "description": "Missing ``file_id``, ``file_path`` sent, or bad ``block_size``.",
+                "message": "ValidationError text.",
+                "solution": "Pass ``file_id`` only and a block_size within 1..65536.",
+            },
+        },
+        "best_practices": [
+            "Take signatures right before encoding; a concurrent save makes the delta stale.",
+            "Skip deltas for small files — a full upload costs less than the signature call.",
+        ],
+    }
+
+
 def get_project_file_transfer_upload_save_metadata(cls: Type[Any]) -> Dict[str, Any]:
     """Documentation-oriented metadata for ``project_file_transfer_upload_save``."""
     return {
@@ -428,6 +546,18 @@ def get_project_file_transfer_upload_save_metadata(cls: Type[Any]) -> Dict[str,
                 "default": "none",
                 "enum": ["none", "block_write", "full"],
             },
+            "upload_format": {
+                "description": (
+                    "``full`` (default): the buffer is the new content. ``delta``: the buffer is "
+                    "an ``rsync-delta/1`` JSON document against the blocks returned by "
+                    "``project_file_transfer_signatures``; update mode (``file_id``) only."
+                ),
+                "type": "string",
+                "required": False,
+                "default": "full",
+                "enum": ["full", "delta"],
+                "notes": "Client ``FileSessionClient.upload_delta`` builds and sends the delta.",
+            },
         },
         "return_value": {
             "success": {
@@ -454,6 +584,7 @@ def get_project_file_transfer_upload_save_metadata(cls: Type[Any]) -> Dict[str,
                     "diff": "Unified diff string when diff=true and supported.",
                     "lock_mode": "Requested save-scoped lock mode.",
                     "lock_released": "True when unlock_after_write cleanup ran after a save.",
+                    "upload_format": "``full`` or ``delta`` as requested.",
                 },
                 "example": {
                     "success": True,
@@ -473,6 +604,7 @@ def get_project_file_transfer_upload_save_metadata(cls: Type[Any]) -> Dict[str,
                     "TRANSFER_NOT_FOUND, TRANSFER_NOT_COMPLETE, BUFFER_READ_ERROR, IMPORT_ERROR, "
                     "FILE_NOT_FOUND, FILE_DELETED, FILE_PATH_MISSING, UNSUPPORTED_FILE_EXTENSION, "
                     "BACKUP_REQUIRED, VALIDATION_ERROR, UNIVERSAL_FILE_SAVE_ERROR, PATH_ERROR, "
+                    "DELTA_INVALID, DELTA_BASE_MISMATCH, DELTA_CHECKSUM_MISMATCH, "
                     "or nested universal_file_save codes in details."
                 ),
                 "message": "Human-readable error.",
@@ -606,6 +738,27 @@ def get_project_file_transfer_upload_save_metadata(cls: Type[Any]) -> Dict[str,
                     "Use ``file_id`` (update mode / client ``upload``) instead of ``file_path``."
                 ),
             },
+            "DELTA_INVALID": {
+                "description": (
+                    "``upload_format=delta`` but the buffer is not a valid ``rsync-delta/1`` "
+                    "document or references blocks outside the current file."
+                ),
+                "message": "Delta document is not valid JSON / ops[i] ...",
+                "solution": "Rebuild the delta from fresh project_file_transfer_signatures.",
+            },
+            "DELTA_BASE_MISMATCH": {
+                "description": (
+                    "The file on disk no longer has the ``base_sha256`` the delta was built "
+                    "against (changed since the signatures were taken)."
+                ),
+                "message": "File changed since signatures were taken",
+                "solution": "Upload the full content (``upload_format=full``) or re-fetch signatures.",
+            },
+            "DELTA_CHECKSUM_MISMATCH": {
+                "description": "Reconstructed content does not hash to the declared ``sha256``.",
+                "message": "Reconstructed content does not match the declared sha256",
+                "solution": "Client encoder bug; upload the full content instead.",
+            },
         },
         "best_practices": [
             "Complete transfer_upload_complete before calling this command.",
@@ -616,5 +769,6 @@ def get_project_file_transfer_upload_save_metadata(cls: Type[Any]) -> Dict[str,
             "Keep backup=true so old_code history stays consistent with local saves.",
             "Keep unlock_after_write=true (client unlock=true) unless managing locks manually.",
             "Omit commit_message unless git integration is desired for this change.",
+            "For small edits to large files use upload_format=delta (client upload_delta).",
         ],
     }
@@ -101,6 +101,45 @@ def get_project_file_transfer_download_begin_schema() -> Dict[str, Any]:
     }
 
 
+def get_project_file_transfer_signatures_schema() -> Dict[str, Any]:
+    """Machine-readable schema for ``project_file_transfer_signatures``."""
+    return {
+        "type": "object",
+        "description": (
+            "Return rsync-style block signatures of the current bytes of an indexed "
+            "project file (read-only). ``blocks[i]`` is ``[adler32, blake2b_128_hex]`` "
+            "of block ``i``; ``sha256`` covers the whole file. Clients encode a delta "
+            "against these blocks, upload it through the transfer buffer and call "
+            "``project_file_transfer_upload_save`` with ``upload_format=delta``. Client "
+            "façade: ``FileSessionClient.upload_delta``."
+        ),
+        "properties": {
+            "file_id": {
+                "type": "string",
+                "description": (
+                    "Primary key of the row in table ``files`` (UUID string). Required."
+                ),
+            },
+            "project_id": {
+                "type": "string",
+                "description": (
+                    "Optional project UUID. When provided, the ``files`` row must belong "
+                    "to this project."
+                ),
+            },
+            "block_size": {
+                "type": "integer",
+                "description": (
+                    "Optional block size in bytes (max 65536). Default: a power of two "
+                    "near the square root of the file size, at least 1024."
+                ),
+            },
+        },
+        "required": ["file_id"],
+        "additionalProperties": False,
+    }
+
+
 def get_project_file_transfer_upload_save_schema() -> Dict[str, Any]:
     """Machine-readable schema for ``project_file_transfer_upload_save``."""
     return {
@@ -115,7 +154,9 @@ def get_project_file_transfer_upload_save_schema() -> Dict[str, Any]:
             "project root). The path must **not** already be indexed in ``files`` "
             "(``FILE_ALREADY_INDEXED`` otherwise).\n\n"
             "Client façade: ``FileSessionClient.upload`` (mode 1) and ``.upload_new`` "
-            "(mode 2). Boolean ``unlock`` maps to ``unlock_after_write`` (default ``true``)."
+            "(mode 2). Boolean ``unlock`` maps to ``unlock_after_write`` (default ``true``). "
+            "``upload_format=delta`` (mode 1 only) treats the buffer as an rsync-style delta "
+            "against ``project_file_transfer_signatures`` (client ``upload_delta``)."
         ),
         "properties": {
             "project_id": {
@@ -230,6 +271,20 @@ def get_project_file_transfer_upload_save_schema() -> Dict[str, Any]:
                     "``session_id``, the lock is attributed to that client session."
                 ),
             },
+            "upload_format": {
+                "type": "string",
+                "enum": ["full", "delta"],
+                "default": "full",
+                "description": (
+                    "``full`` — the buffer is the new file content. ``delta`` — the buffer "
+                    "is a JSON ``rsync-delta/1`` document (block references into the "
+                    "current file plus literal data) built from "
+                    "``project_file_transfer_signatures``; requires ``file_id``. The server "
+                    "rebuilds the content and verifies both sha256 values before saving "
+                    "(``DELTA_BASE_MISMATCH`` when the file changed since the signatures "
+                    "were taken — upload in full instead)."
+                ),
+            },
         },
         "required": ["transfer_id"],
         "additionalProperties": False,
@@ -2,6 +2,8 @@
 MCP command: query_cst
 
 Find LibCST nodes by CSTQuery selector; optional find+replace in one call.
+Without ``file_path`` the selector runs over every indexed Python file of the
+project (query-only).
 
 Typical workflow: discover nodes with ``query_cst``, then patch with
 ``cst_modify_tree`` / ``cst_apply_buffer`` using ``node_id`` or ``cst_query`` selectors.
@@ -12,6 +14,7 @@ email: vasilyvz@gmail.com
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import time
 from typing import Any, Dict, List, Optional
@@ -28,6 +31,7 @@ from .base_mcp_command import BaseMCPCommand
 from .query_cst_handler import (
     build_ops_from_replacements,
     resolve_target_file,
+    run_project_query,
     run_replace_flow,
     validate_query_mode,
     validate_replacements,
@@ -67,7 +71,7 @@ class QueryCSTCommand(BaseMCPCommand):
     async def execute(
         self,
         project_id: str,
-        file_path: str,
+        file_path: Optional[str] = None,
         selector: Optional[str] = None,
         include_code: bool = False,
         max_results: int = 200,
@@ -86,6 +90,33 @@ class QueryCSTCommand(BaseMCPCommand):
         t_start = time.perf_counter()
         preview_mode = preview or dry_run
         try:
+            if not file_path:
+                if (
+                    replacements
+                    or replace_with is not None
+                    or code_lines is not None
+                    or start_line is not None
+                    or end_line is not None
+                ):
+                    return ErrorResult(
+                        message="file_path is required for replace mode",
+                        code="CST_QUERY_MISSING_FILE_PATH",  # type: ignore[arg-type]
+                        details={},
+                    )
+                if not selector:
+                    return ErrorResult(
+                        message="selector is required for query-only mode",
+                        code="CST_QUERY_MISSING_SELECTOR",  # type: ignore[arg-type]
+                        details={},
+                    )
+                return await asyncio.to_thread(
+                    run_project_query,
+                    self,
+                    project_id,
+                    selector,
+                    include_code,
+                    max_results,
+                )
             t0 = time.perf_counter()
             resolved = resolve_target_file(self, project_id, file_path)
             if isinstance(resolved, ErrorResult):
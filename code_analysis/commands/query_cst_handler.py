@@ -20,11 +20,15 @@ from mcp_proxy_adapter.commands.result import ErrorResult, SuccessResult
 
 from ..core.backup_manager import BackupManager
 from ..core.database.files.update_standalone import index_file_via_driver
+from ..core.database_driver_pkg.domain.files import get_project_files
 from ..core.cst_module import ReplaceOp, Selector, apply_replace_ops, unified_diff
+from ..core.cst_tree.node_id_markers import build_exact_key_to_id_from_metadata
+from ..core.cst_tree.tree_builder import create_tree_from_code
 from ..core.cst_tree.tree_modifier_ops_parse import join_code_lines
 from ..core.git_integration import commit_after_write
 from ..core.exceptions import CSTModulePatchError
 from ..core.file_lock import file_lock
+from ..cst_query import query_files
 from .base_mcp_command import BaseMCPCommand
 
 logger = logging.getLogger(__name__)
@@ -159,6 +163,114 @@ def resolve_target_file(
     return (root_path, target)
 
 
+def tree_node_ids_for_source(
+    path: str, source: str
+) -> Dict[Tuple[int, int, int, int, str], str]:
+    """Node ids a loaded tree of ``path`` would report, by exact span + type key.
+
+    A full tree build; :func:`query_files` calls it only for files with matches.
+    """
+    tree = create_tree_from_code(path, source, register_in_memory=False)
+    return build_exact_key_to_id_from_metadata(tree.metadata_map)
+
+
+def indexed_python_files(command: Any, project_id: str, root_path: Path) -> List[Path]:
+    """Absolute paths of the project's indexed (non-deleted) ``.py`` files."""
+    database = command._open_database_from_config(auto_analyze=False)
+    try:
+        files = get_project_files(database, project_id, include_deleted=False)
+    finally:
+        database.disconnect()
+    out: List[Path] = []
+    for f in files:
+        raw = Path(f.path or f.relative_path or "")
+        path = raw if raw.is_absolute() else root_path / (f.relative_path or raw)
+        if path.suffix == ".py":
+            out.append(path)
+    return out
+
+
+def run_project_query(
+    command: Any,
+    project_id: str,
+    selector: str,
+    include_code: bool,
+    max_results: int,
+) -> SuccessResult:
+    """
+    Query every indexed Python file of the project with one selector.
+
+    Files are streamed by :func:`query_files` in-process (sharing the query
+    index cache); collection stops once ``max_results`` matches are gathered.
+    Files that cannot be read or parsed are reported in ``files_failed``.
+    """
+    t_start = time.perf_counter()
+    root_path = command._resolve_project_root(project_id)
+    paths = indexed_python_files(command, project_id, root_path)
+    matches: List[Dict[str, Any]] = []
+    failed: List[Dict[str, str]] = []
+    scanned = 0
+    truncated = False
+    results = query_files(
+        [str(p) for p in paths],
+        selector,
+        include_code=include_code,
+        node_ids_loader=tree_node_ids_for_source,
+    )
+    try:
+        for result in results:
+            scanned += 1
+            try:
+                rel_path = str(Path(result.path).relative_to(root_path))
+            except ValueError:
+                rel_path = result.path
+            if result.error is not None:
+                failed.append({"file_path": rel_path, "error": result.error})
+                continue
+            for m in result.matches:
+                if 0 <= max_results <= len(matches):
+                    truncated = True
+                    break
+                matches.append(
+                    {
+                        "file_path": rel_path,
+                        "node_id": m.node_id,
+                        "kind": m.kind,
+                        "type": m.node_type,
+                        "name": m.name,
+                        "qualname": m.qualname,
+                        "start_line": m.start_line,
+                        "start_col": m.start_col,
+                        "end_line": m.end_line,
+                        "end_col": m.end_col,
+                        "code": m.code,
+                    }
+                )
+            if truncated:
+                break
+    finally:
+        results.close()
+    logger.info(
+        "[TIMING] command=query_cst step=project_query files=%d matches=%d "
+        "elapsed_sec=%.4f",
+        scanned,
+        len(matches),
+        time.perf_counter() - t_start,
+    )
+    return SuccessResult(
+        data={
+            "success": True,
+            "project_id": project_id,
+            "selector": selector,
+            "truncated": truncated,
+            "files_total": len(paths),
+            "files_scanned": scanned,
+            "files_failed": failed,
+            "matches": matches,
+        }
+    )
+
+
 def validate_query_mode(
     is_replace_mode: bool,
     selector: Optional[str],
@@ -77,6 +77,12 @@ def get_detailed_description() -> str:
         "Optionally match_index (0-based, which match to replace) or replace_all (replace every match). "
         "File is backed up, then updated; database is refreshed. "
         "Response is compact: replaced count, file_path, backup_uuid.\n\n"
+        "Project-wide query (file_path omitted):\n"
+        "The selector runs over every indexed .py file of the project, in "
+        "the server process. Each match carries its "
+        "file_path; files that fail to parse are listed in files_failed. "
+        "Parsed trees are cached by content hash, so repeating selectors over "
+        "unchanged files is cheap.\n\n"
         "Important notes:\n"
         "- Selector syntax follows CSTQuery rules (see docs/CST_QUERY.md)\n"
         "- node_id is span-based and stable enough for patch workflows\n"
@@ -108,10 +114,13 @@ def get_parameters() -> Dict[str, Any]:
             "description": (
                 "Target Python file path relative to project root. "
                 "Must be a .py file. "
-                "Resolved using project_id (project root from database)."
+                "Resolved using project_id (project root from database). "
+                "Omit to run the selector over every indexed .py file of the "
+                "project (query-only; matches carry file_path, max_results "
+                "applies to the total)."
             ),
             "type": "string",
-            "required": True,
+            "required": False,
             "examples": [
                 "code_analysis/core/backup_manager.py",
                 "src/main.py",
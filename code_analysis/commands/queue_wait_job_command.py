@@ -0,0 +1,156 @@
+"""
+Long-poll variant of ``queue_get_job_status``: block until a job is terminal.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Optional, cast
+
+from mcp_proxy_adapter.commands.base import Command
+from mcp_proxy_adapter.commands.queue.command_execution_diagnostics import (
+    build_command_execution_fields,
+)
+from mcp_proxy_adapter.commands.queue.job_domain_errors import domain_error_for
+from mcp_proxy_adapter.commands.result import ErrorResult, SuccessResult
+from mcp_proxy_adapter.core.errors import ValidationError
+from mcp_proxy_adapter.integrations.queuemgr_integration import (
+    QueueJobError,
+    get_global_queue_manager,
+)
+
+from code_analysis.core.queue_job_waiter import get_queue_job_waiter
+
+DEFAULT_WAIT_SECONDS = 25.0
+MAX_WAIT_SECONDS = 60.0
+
+
+class QueueWaitJobCommand(Command):
+    """Wait server-side for a queuemgr job to finish (or the wait to time out)."""
+
+    name = "queue_wait_job"
+    version = "1.0.0"
+    descr = (
+        "Block until a queuemgr job is completed/failed/stopped or timeout "
+        "elapses; returns the queue_get_job_status payload plus timed_out"
+    )
+    category = "system"
+    author = "Vasiliy Zdanovskiy"
+    email = "vasilyvz@gmail.com"
+    use_queue = False
+
+    @classmethod
+    def get_schema(cls) -> Dict[str, Any]:
+        """Return the schema for job id and wait timeout."""
+        return {
+            "type": "object",
+            "properties": {
+                "job_id": {
+                    "type": "string",
+                    "minLength": 1,
+                    "description": "Job identifier (queued envelope job_id).",
+                },
+                "timeout": {
+                    "type": "number",
+                    "default": DEFAULT_WAIT_SECONDS,
+                    "minimum": 0,
+                    "maximum": MAX_WAIT_SECONDS,
+                    "description": (
+                        "Seconds to wait for a terminal status before returning "
+                        "the current one with timed_out=true."
+                    ),
+                },
+            },
+            "required": ["job_id"],
+            "additionalProperties": False,
+        }
+
+    @classmethod
+    def metadata(cls: type["QueueWaitJobCommand"]) -> Dict[str, Any]:
+        """Return registration metadata for the queue wait command."""
+        from code_analysis.commands.zero_arg_commands_metadata import (
+            queue_wait_job_command_metadata,
+        )
+
+        return queue_wait_job_command_metadata(cls)
+
+    def validate_params(self, params: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Reject unknown keys (adapter) and a timeout outside the schema bounds."""
+        params = super().validate_params(params)
+        job_id = params.get("job_id")
+        if not isinstance(job_id, str) or not job_id:
+            raise ValidationError(
+                "parameter 'job_id' must be a non-empty string",
+                data={"field": "job_id"},
+            )
+        if "timeout" in params:
+            value = params["timeout"]
+            if not isinstance(value, (int, float)) or isinstance(value, bool):
+                raise ValidationError(
+                    f"parameter 'timeout' must be number, got {type(value).__name__}",
+                    data={"field": "timeout"},
+                )
+            if not 0 <= value <= MAX_WAIT_SECONDS:
+                raise ValidationError(
+                    f"parameter 'timeout' must be between 0 and {MAX_WAIT_SECONDS}, "
+                    f"got {value!r}",
+                    data={"field": "timeout"},
+                )
+        return params
+
+    async def execute(
+        self,
+        job_id: str = "",
+        timeout: float = DEFAULT_WAIT_SECONDS,
+        **kwargs: Any,
+    ) -> SuccessResult | ErrorResult:
+        """Wait on the shared completion event of ``job_id`` and report its status."""
+        params: Dict[str, Any] = {"job_id": job_id, "timeout": timeout}
+        params.update({k: v for k, v in kwargs.items() if k != "context"})
+        try:
+            params = self.validate_params(params)
+        except ValidationError as e:
+            data = getattr(e, "data", None) or {}
+            return ErrorResult(
+                message=str(e),
+                code="VALIDATION_ERROR",  # type: ignore[arg-type]
+                details={"field": data.get("field")},
+            )
+        job_id = params["job_id"]
+        try:
+            result, timed_out = await get_queue_job_waiter().wait(
+                job_id, float(params.get("timeout", DEFAULT_WAIT_SECONDS))
+            )
+            if result is None:
+                queue_manager = await get_global_queue_manager()
+                result = await queue_manager.get_job_status(job_id)
+        except QueueJobError as e:
+            domain = domain_error_for(e, job_id)
+            if domain is not None:
+                return cast(ErrorResult, domain.to_error_result())
+            return ErrorResult(
+                message="Queue job error",
+                code=-32603,
+                details={"job_id": job_id, "original_error": str(e)},
+            )
+        except Exception as e:
+            return ErrorResult(
+                message="Failed to wait for job",
+                code=-32603,
+                details={"job_id": job_id, "original_error": str(e)},
+            )
+
+        return SuccessResult(
+            data={
+                "job_id": result.job_id,
+                "status": result.status,
+                "progress": result.progress,
+                "description": result.description,
+                "result": result.result,
+                "error": result.error,
+                "created_at": result.created_at,
+                "started_at": result.started_at,
+                "completed_at": result.completed_at,
+                **build_command_execution_fields(result.status, result.result),
+                "timed_out": timed_out,
+            }
+        )
@@ -6,6 +6,13 @@ executes each command, and builds the response envelope. Delegates oversized
 output to read_only_batch_output (Step 18). No whitelist or storage logic
 duplicated here.
 
+All invocations run in the caller's offload slot under one
+``project_lookup_scope`` (the project row/root/lock state is resolved once per
+batch) and, with ``snapshot_database``, inside one REPEATABLE READ READ ONLY
+transaction so every item sees the same database snapshot. Each item then
+runs under its own savepoint, so a failing query does not abort the
+transaction for the items after it.
+
 Author: Vasiliy Zdanovskiy
 email: vasilyvz@gmail.com
 """
@@ -15,10 +22,11 @@ from __future__ import annotations
 import json
 import logging
 import uuid
+from contextlib import AbstractContextManager, contextmanager, nullcontext
 from datetime import date, datetime
 from decimal import Decimal
 from pathlib import Path
-from typing import Any, Optional, Sequence, TypedDict
+from typing import Any, Callable, Iterator, Optional, Sequence, TypedDict
 
 from mcp_proxy_adapter.commands.command_registry import CommandRegistry
 from mcp_proxy_adapter.commands.command_registry import registry as default_registry
@@ -35,9 +43,13 @@ from ..core.list_pagination import (
     paginate_sequence,
     resolve_list_pagination,
 )
+from ..core.project_registry_cache import project_lookup_scope
+from ..core.shared_database import bind_shared_transaction
 
 logger = logging.getLogger(__name__)
 
+_ITEM_SAVEPOINT = "read_only_batch_item"
+
 
 class _Invocation(TypedDict):
     """Single batch invocation: command name and params."""
@@ -93,6 +105,66 @@ def _result_to_payload(result: SuccessResult | ErrorResult) -> dict[str, Any]:
     }
 
 
+def _accepts_param(command_class: Any, name: str) -> bool:
+    """Return True when the command schema declares parameter ``name``."""
+    get_schema = getattr(command_class, "get_schema", None)
+    if get_schema is None:
+        return False
+    try:
+        properties = (get_schema() or {}).get("properties") or {}
+    except Exception:
+        return False
+    return name in properties
+
+
+@contextmanager
+def _snapshot_transaction(
+    database: Any,
+) -> Iterator[Callable[[], AbstractContextManager[None]]]:
+    """Bind one read-only REPEATABLE READ transaction to the batch context.
+
+    Proxy ``execute``/``execute_batch`` calls of the items run on it; it is
+    rolled back afterwards (nothing to commit). Yields a factory of per-item
+    savepoint scopes: each item is rolled back to its savepoint, so an item
+    whose query failed (aborting the transaction) does not fail the next
+    ones. The snapshot itself is kept across savepoint rollbacks.
+    """
+    transaction_id = database.begin_transaction()
+
+    @contextmanager
+    def _item_savepoint() -> Iterator[None]:
+        database.execute(
+            f"SAVEPOINT {_ITEM_SAVEPOINT}", None, transaction_id=transaction_id
+        )
+        try:
+            yield
+        finally:
+            database.execute(
+                f"ROLLBACK TO SAVEPOINT {_ITEM_SAVEPOINT}",
+                None,
+                transaction_id=transaction_id,
+            )
+            database.execute(
+                f"RELEASE SAVEPOINT {_ITEM_SAVEPOINT}",
+                None,
+                transaction_id=transaction_id,
+            )
+
+    try:
+        database.execute(
+            "SET TRANSACTION ISOLATION LEVEL REPEATABLE READ, READ ONLY",
+            None,
+            transaction_id=transaction_id,
+        )
+        with bind_shared_transaction(transaction_id):
+            yield _item_savepoint
+    finally:
+        try:
+            database.rollback_transaction(transaction_id)
+        except Exception:
+            logger.warning("read_only_batch snapshot rollback failed", exc_info=True)
+
+
 def _serialized_size_bytes(results: Sequence[_ResultEntry]) -> int:
     """Compute deterministic JSON serialization size in bytes (UTF-8)."""
     payload = [
@@ -105,6 +177,65 @@ def _serialized_size_bytes(results: Sequence[_ResultEntry]) -> int:
     )
 
 
+async def _run_invocations(
+    reg: CommandRegistry,
+    invocations: Sequence[_Invocation],
+    project_id: Optional[str],
+    results: list[_ResultEntry],
+    item_scope: Callable[[], AbstractContextManager[None]] = nullcontext,
+) -> Optional[dict[str, Any]]:
+    """Execute invocations in order into ``results``; return a rejection envelope.
+
+    Each command runs inside ``item_scope()`` (a savepoint in snapshot mode).
+    """
+    for inv in invocations:
+        raw_cmd = inv.get("command")
+        command_name = raw_cmd if isinstance(raw_cmd, str) else ""
+        ok, error_payload = validate_command(command_name)
+        if not ok:
+            err = error_payload or {}
+            return {
+                "inline": False,
+                "error": err.get("error", "Command not whitelisted"),
+                "error_code": err.get("error_code", "BATCH_COMMAND_NOT_WHITELISTED"),
+                "command": err.get("command", command_name),
+                "message": err.get("message", ""),
+            }
+
+        try:
+            command_class = reg.get_command(command_name)
+        except KeyError:
+            return {
+                "inline": False,
+                "error": f"Command not found: {command_name}",
+                "error_code": "BATCH_COMMAND_NOT_FOUND",
+                "command": command_name,
+                "message": "Command is whitelisted but not registered.",
+            }
+        params = dict(inv.get("params") or {})
+        if (
+            project_id
+            and "project_id" not in params
+            and _accepts_param(command_class, "project_id")
+        ):
+            params["project_id"] = project_id
+        cmd = command_class()
+        try:
+            with item_scope():
+                validated_params = cmd.validate_params(params)
+                result = await cmd.execute(**validated_params)
+        except Exception as e:
+            logger.exception("Batch command %s failed", command_name)
+            result = ErrorResult(
+                message=str(e),
+                code="BATCH_EXECUTION_ERROR",
+            )
+
+        payload = _result_to_payload(result)
+        results.append(_ResultEntry(command=command_name, result=payload))
+    return None
+
+
 async def run_read_only_batch(
     invocations: Sequence[_Invocation],
     max_response_bytes: int,
@@ -116,6 +247,8 @@ async def run_read_only_batch(
     block_position: Optional[int] = None,
     offset: Optional[int] = None,
     limit: Optional[int] = None,
+    project_id: Optional[str] = None,
+    snapshot_database: Optional[Any] = None,
 ) -> dict[str, Any]:
     """Orchestrate batch execution of read-only commands.
 
@@ -146,6 +279,11 @@ async def run_read_only_batch(
         offset: Paginated mode: legacy row offset, ignored when
             ``block_position`` is set.
         limit: Paginated mode: legacy alias for ``page_size``.
+        project_id: Default ``project_id`` for invocations whose command
+            accepts one and whose params do not set it.
+        snapshot_database: When given, run every invocation inside one
+            REPEATABLE READ READ ONLY transaction on this (shared) database,
+            each under its own savepoint.
 
     Returns:
         Inline mode: {"inline": True, "results": [{"command": str, "result": dict}, ...]}.
@@ -158,45 +296,16 @@ async def run_read_only_batch(
     """
     reg = registry if registry is not None else default_registry
     results: list[_ResultEntry] = []
-
-    for inv in invocations:
-        raw_cmd = inv.get("command")
-        command_name = raw_cmd if isinstance(raw_cmd, str) else ""
-        ok, error_payload = validate_command(command_name)
-        if not ok:
-            err = error_payload or {}
-            return {
-                "inline": False,
-                "error": err.get("error", "Command not whitelisted"),
-                "error_code": err.get("error_code", "BATCH_COMMAND_NOT_WHITELISTED"),
-                "command": err.get("command", command_name),
-                "message": err.get("message", ""),
-            }
-
-        params = inv.get("params") or {}
-        try:
-            command_class = reg.get_command(command_name)
-        except KeyError:
-            return {
-                "inline": False,
-                "error": f"Command not found: {command_name}",
-                "error_code": "BATCH_COMMAND_NOT_FOUND",
-                "command": command_name,
-                "message": "Command is whitelisted but not registered.",
-            }
-        cmd = command_class()
-        validated_params = cmd.validate_params(params)
-        try:
-            result = await cmd.execute(**validated_params)
-        except Exception as e:
-            logger.exception("Batch command %s failed", command_name)
-            result = ErrorResult(
-                message=str(e),
-                code="BATCH_EXECUTION_ERROR",
-            )
-
-        payload = _result_to_payload(result)
-        results.append(_ResultEntry(command=command_name, result=payload))
+    with project_lookup_scope():
+        if snapshot_database is None:
+            error = await _run_invocations(reg, invocations, project_id, results)
+        else:
+            with _snapshot_transaction(snapshot_database) as item_savepoint:
+                error = await _run_invocations(
+                    reg, invocations, project_id, results, item_savepoint
+                )
+    if error is not None:
+        return error
 
     if pagination_requested:
         page_size_r, offset_r, block_position_r = resolve_list_pagination(
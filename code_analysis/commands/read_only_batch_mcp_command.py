@@ -5,6 +5,10 @@ Exposes batch execution of whitelisted read-only commands. Input: list of
 command invocations. Output: inline results or file reference when over
 threshold. No mutating commands are exposed through this endpoint.
 
+The whole batch occupies one offload slot and one lock-gate check; a batch
+``project_id`` is inherited by the invocations and resolved once, and
+``snapshot`` runs all invocations in one read-only transaction.
+
 Author: Vasiliy Zdanovskiy
 email: vasilyvz@gmail.com
 """
@@ -98,6 +102,21 @@ class ReadOnlyBatchMCPCommand(BaseMCPCommand):
                         "additionalProperties": True,
                     },
                 },
+                "project_id": {
+                    "type": "string",
+                    "description": (
+                        "Optional default project_id (UUID4) for invocations whose "
+                        "params do not set one; the project is resolved once per batch."
+                    ),
+                },
+                "snapshot": {
+                    "type": "boolean",
+                    "default": False,
+                    "description": (
+                        "Run all invocations in one REPEATABLE READ READ ONLY "
+                        "transaction so they see the same database state."
+                    ),
+                },
                 "max_response_bytes": {
                     "type": "integer",
                     "description": (
@@ -122,6 +141,8 @@ class ReadOnlyBatchMCPCommand(BaseMCPCommand):
         block_position: Optional[int] = None,
         offset: Optional[int] = None,
         limit: Optional[int] = None,
+        project_id: Optional[str] = None,
+        snapshot: bool = False,
         **kwargs: Any,
     ) -> SuccessResult:
         """Run batch and return inline results, a paginated inline page, or file metadata."""
@@ -163,6 +184,10 @@ class ReadOnlyBatchMCPCommand(BaseMCPCommand):
             block_position=block_position,
             offset=offset,
             limit=limit,
+            project_id=project_id,
+            snapshot_database=(
+                BaseMCPCommand._open_database_from_config() if snapshot else None
+            ),
         )
         return SuccessResult(data=result)
 
@@ -185,7 +210,9 @@ class ReadOnlyBatchMCPCommand(BaseMCPCommand):
                 "Operation flow:\n"
                 "1. Validates invocations list is non-empty\n"
                 "2. For each invocation, validates command name against whitelist (fail-fast on first rejection)\n"
-                "3. Resolves command instances from registry and executes in order\n"
+                "3. Resolves command instances from registry and executes in order, "
+                "inheriting the batch project_id; the project is resolved once and, "
+                "with snapshot=true, all invocations share one read-only transaction\n"
                 "4. If page_size/block_position/offset/limit was passed, returns one "
                 "bounded inline page over results (TODO 9c2018a3) -- see Pagination below\n"
                 "5. Otherwise: serializes combined results; if size <= max_response_bytes returns inline\n"
@@ -243,6 +270,23 @@ class ReadOnlyBatchMCPCommand(BaseMCPCommand):
                         "required": ["command"],
                     },
                 },
+                "project_id": {
+                    "description": (
+                        "Optional default project_id for invocations whose params do "
+                        "not set one. Also takes the project lock-gate check once."
+                    ),
+                    "type": "string",
+                    "required": False,
+                },
+                "snapshot": {
+                    "description": (
+                        "When true, all invocations run in one REPEATABLE READ READ "
+                        "ONLY transaction (consistent reads across the batch)."
+                    ),
+                    "type": "boolean",
+                    "required": False,
+                    "default": False,
+                },
                 "max_response_bytes": {
                     "description": (
                         "Optional override for max inline response size in bytes. "
@@ -311,6 +355,31 @@ class ReadOnlyBatchMCPCommand(BaseMCPCommand):
                         "both commands are read-only and whitelisted."
                     ),
                 },
+                {
+                    "description": "Preview, find nodes and look up an entity on one snapshot",
+                    "command": {
+                        "project_id": "proj-uuid",
+                        "snapshot": True,
+                        "invocations": [
+                            {
+                                "command": "universal_file_preview",
+                                "params": {"file_path": "src/example.py"},
+                            },
+                            {
+                                "command": "search_ast_nodes",
+                                "params": {"node_type": "ClassDef"},
+                            },
+                            {
+                                "command": "get_code_entity_info",
+                                "params": {"entity_name": "ExampleClass"},
+                            },
+                        ],
+                    },
+                    "explanation": (
+                        "One round-trip instead of three; every invocation inherits "
+                        "project_id and reads the same database snapshot."
+                    ),
+                },
                 {
                     "description": "Small batch inline",
                     "command": {
@@ -490,6 +559,8 @@ class ReadOnlyBatchMCPCommand(BaseMCPCommand):
                 "Set max_response_bytes when you expect large combined output and want file reference.",
                 "Use results_metadata offset/length to read per-command fragments from output_file without loading whole file.",
                 "Keep batch size reasonable to avoid timeouts; threshold only limits response size, not execution time.",
+                "Set the batch project_id instead of repeating it per invocation; add snapshot=true "
+                "when later invocations rely on what earlier ones saw.",
                 "Prefer page_size/block_position over max_response_bytes when you want to page through "
                 "results inline without ever writing/reading a file; every page re-runs all invocations "
                 "(no server-side session), so it only bounds response size, not execution cost.",
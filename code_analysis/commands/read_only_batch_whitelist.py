@@ -23,6 +23,7 @@ READ_ONLY_BATCH_WHITELIST: frozenset[str] = frozenset(
         "get_entity_dependents",
         "list_class_methods",
         "list_code_entities",
+        "search_ast_nodes",
         "universal_file_preview",
     }
 )
@@ -47,6 +47,7 @@ def register_file_management_commands(reg: Any) -> None:
     """
     from .project_file_transfer_by_id_commands import (
         ProjectFileTransferDownloadBeginCommand,
+        ProjectFileTransferSignaturesCommand,
         ProjectFileTransferUploadSaveCommand,
     )
     from .project_file_advisory_lock_batch_command import (
@@ -57,4 +58,5 @@ def register_file_management_commands(reg: Any) -> None:
     reg.register(ProjectFileAdvisoryLockBatchCommand, "custom")
     reg.register(ProjectFileLockStatusCommand, "custom")
     reg.register(ProjectFileTransferDownloadBeginCommand, "custom")
+    reg.register(ProjectFileTransferSignaturesCommand, "custom")
     reg.register(ProjectFileTransferUploadSaveCommand, "custom")
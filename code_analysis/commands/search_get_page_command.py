@@ -68,7 +68,7 @@ class SearchGetPageCommand(BaseMCPCommand):
                     "type": "string",
                     "enum": ["temporal", "relevance"],
                     "default": "temporal",
-                    "description": "Block set to read: temporal (arrival order) or relevance (score DESC).",
+                    "description": "Block set to read: temporal (arrival order) or relevance (hybrid rank, best first).",
                 },
                 "wait_for_new_results": {
                     "type": "boolean",
@@ -187,6 +187,15 @@ class SearchMCPCommand(BaseMCPCommand):
                     "default": 120.0,
                     "description": "Wall-clock cap for grep phase.",
                 },
+                "early_termination": {
+                    "type": "boolean",
+                    "default": True,
+                    "description": (
+                        "Publish the top results (reciprocal rank fusion of "
+                        "fulltext and semantic) and stop grep once no grep hit "
+                        "can outrank them."
+                    ),
+                },
                 "first_block_wait_seconds": {
                     "type": "number",
                     "default": _FIRST_BLOCK_WAIT_SECONDS,
@@ -462,7 +471,7 @@ class SearchMCPCommand(BaseMCPCommand):
                 "First response already contains items for block 1 when hits exist.",
                 "Call search_get_page(job_id, block_position=2, ...) for the next page.",
                 "Call search_get_status(job_id) to see phase and block_ready_count.",
-                "Use ordering=relevance after status is completed for score-sorted pages.",
+                "Use ordering=relevance after status is completed for hybrid-ranked pages.",
                 "Use file_pattern or path_filter to limit fulltext, semantic, and grep phases.",
             ],
         )
@@ -104,6 +104,11 @@ _SUPPORTED_EXTENSIONS = frozenset(
     }
 )
 
+# Longest time temporal blocks are held back while semantic may still settle
+# the hybrid head as block_1 (early termination); bounded so search_start is
+# never kept waiting on a slow semantic backend.
+_SETTLED_HEAD_HOLD_SECONDS = 5.0
+
 
 _IndexedSource = Literal["fulltext", "semantic"]
 
@@ -373,6 +378,12 @@ async def run_paginated_cross(
     Phase 2 (grep/disk): fs_grep with skip_indexed_unchanged. Each pattern's
     results are written and flushed as they arrive.
 
+    Once fulltext and semantic are final, the head of the hybrid (RRF)
+    ranking is published as a block as soon as no grep hit could outrank it
+    (``early_termination``, default true); the grep phase then stops. To let
+    that head become block_1, temporal blocks are held back until semantic
+    is final or ``_SETTLED_HEAD_HOLD_SECONDS`` pass.
+
     search_start waits until block_1 exists or all phases complete.
     """
     t0 = time.monotonic()
@@ -400,6 +411,14 @@ async def run_paginated_cross(
     if enable_grep and not grep_patterns and query:
         grep_patterns = [query]
     hard_timeout = float(params.get("hard_timeout_seconds", 120.0))
+    early_termination = bool(params.get("early_termination", True))
+    # Grep rows reach the buffer as structural ``cross`` findings, plus line
+    # ``grep`` findings when structural evidence is not required.
+    grep_sources = (
+        (FindingSource.cross.value,)
+        if require_structural
+        else (FindingSource.cross.value, FindingSource.grep.value)
+    )
     min_score = float(params.get("min_semantic_score", 0.45))
     file_pattern = str(params.get("file_pattern") or "").strip()
 
@@ -452,9 +471,22 @@ async def run_paginated_cross(
         on_block_published=_on_block_published,
     )
     idx = 0
+    # Publishing fulltext in arrival order would fill block_1 before the
+    # settled hybrid head can claim it, so hold temporal flushes until
+    # semantic is final (or the hold expires) when early termination applies.
+    hold_temporal = (
+        early_termination
+        and enable_semantic
+        and semantic_limit > 0
+        and enable_grep
+        and bool(grep_patterns)
+    )
 
     def _flush(search_completed: bool = False) -> None:
         """Return flush."""
+        if hold_temporal and not search_completed:
+            profile.checkpoint("block_flush_held", buffer_bytes=buffer.total_bytes())
+            return
         buffer_bytes = buffer.total_bytes()
         t_flush = time.monotonic()
         published = assembler.run_until_idle(search_completed=search_completed)
@@ -469,6 +501,34 @@ async def run_paginated_cross(
         if search_completed and published == 0 and buffer_bytes == 0:
             profile.checkpoint("assembler_finalize", relevance=True)
 
+    settled_early = False
+    grep_task: Optional[asyncio.Task[None]] = None
+    grep_call: Optional[asyncio.Future[Any]] = None
+
+    def _release_temporal_hold() -> None:
+        """Stop holding temporal blocks back and flush what is buffered."""
+        nonlocal hold_temporal
+        if not hold_temporal:
+            return
+        hold_temporal = False
+        _flush(search_completed=False)
+
+    def _publish_settled_head() -> bool:
+        """Publish the settled head of the hybrid ranking while grep runs.
+
+        Returns True when a full block of top results was published that no
+        grep hit can reorder, i.e. the rest of the grep phase may be skipped.
+        """
+        if not early_termination:
+            return False
+        published = assembler.publish_settled(pending_sources=grep_sources)
+        profile.checkpoint(
+            "hybrid_rank_settled_head",
+            pending_sources=list(grep_sources),
+            items=published,
+        )
+        return published > 0
+
     def _bump_scanned_files(delta: int) -> None:
         """Increment metrics.scanned_files so a polling client sees live progress
         during the (possibly long-running) grep phase instead of a value frozen
@@ -880,6 +940,7 @@ async def run_paginated_cross(
 
     async def _run_grep_phase() -> None:
         """Return run grep phase."""
+        nonlocal grep_call
         if not grep_patterns:
             log.info("[TIMING] phase3_grep skipped: no patterns")
             profile.checkpoint("grep_phase_skipped", reason="no_patterns")
@@ -899,6 +960,8 @@ async def run_paginated_cross(
         t_g = time.monotonic()
         grep_cmd = FsGrepCommand()
         for i, pattern in enumerate(grep_patterns):
+            if settled_early:
+                return
             t_pat = time.monotonic()
             profile.checkpoint(
                 "grep_pattern_start",
@@ -916,6 +979,8 @@ async def run_paginated_cross(
             ) -> None:
                 """Return on grep batch."""
                 nonlocal batches_flushed, matched_files_counted
+                if settled_early:
+                    return
                 # One callback invocation == one scanned file that had >=1 match
                 # (fs_grep calls on_match_batch per file, see
                 # FsGrepCommand._deliver_file_matches). Bump scanned_files
@@ -957,8 +1022,8 @@ async def run_paginated_cross(
                     batches_flushed,
                 )
 
-            try:
-                result = await grep_cmd.execute(
+            grep_call = asyncio.ensure_future(
+                grep_cmd.execute(
                     project_id=project_id,
                     pattern=pattern,
                     file_pattern=file_pattern or None,
@@ -976,6 +1041,19 @@ async def run_paginated_cross(
                     auto_queue_on_inline_timeout=False,
                     on_match_batch=_on_grep_batch,
                 )
+            )
+            try:
+                result = await grep_call
+            except asyncio.CancelledError:
+                if not settled_early:
+                    raise
+                log.info("[TIMING] phase3_grep cut short: first page settled")
+                profile.checkpoint(
+                    "grep_phase_settled",
+                    pattern_index=i,
+                    total_sec=round(time.monotonic() - t_g, 4),
+                )
+                return
             except Exception as exc:
                 log.warning("[TIMING] phase3 pattern[%d] exception: %s", i, exc)
                 profile.checkpoint(
@@ -1037,14 +1115,25 @@ async def run_paginated_cross(
 
     async def _run_semantic_phase() -> None:
         """Return run semantic phase."""
+        nonlocal settled_early
         if not (enable_semantic and semantic_limit > 0):
             return
         log.info("[TIMING] phase2_semantic start")
         profile.checkpoint("phase2_semantic_start")
         t_sem = time.monotonic()
-        sem_rows = await _run_semantic()
-        n_sem = _write_indexed_findings(sem_rows, "sem", "semantic")
-        profile.checkpoint("phase2_semantic_buffered", findings=n_sem)
+        try:
+            sem_rows = await _run_semantic()
+            n_sem = _write_indexed_findings(sem_rows, "sem", "semantic")
+            profile.checkpoint("phase2_semantic_buffered", findings=n_sem)
+            grep_running = grep_task is not None and not grep_task.done()
+            if grep_running and _publish_settled_head():
+                # Fulltext and semantic are final; the published head outranks
+                # anything grep could still add, so stop scanning.
+                settled_early = True
+                if grep_call is not None:
+                    grep_call.cancel()
+        finally:
+            _release_temporal_hold()
         _flush(search_completed=False)
         log.info(
             "[TIMING] phase2_semantic done: semantic=%d elapsed=%.3fs",
@@ -1093,10 +1182,22 @@ async def run_paginated_cross(
     if semantic_enabled:
         parallel_tasks.append(asyncio.create_task(_run_semantic_phase()))
     if grep_enabled:
-        parallel_tasks.append(asyncio.create_task(_run_grep_phase()))
+        grep_task = asyncio.create_task(_run_grep_phase())
+        parallel_tasks.append(grep_task)
     if parallel_tasks:
-        await asyncio.gather(*parallel_tasks)
-        if not grep_enabled:
+        hold_timer = (
+            asyncio.get_running_loop().call_later(
+                _SETTLED_HEAD_HOLD_SECONDS, _release_temporal_hold
+            )
+            if hold_temporal
+            else None
+        )
+        try:
+            await asyncio.gather(*parallel_tasks)
+        finally:
+            if hold_timer is not None:
+                hold_timer.cancel()
+        if not grep_enabled or settled_early:
             _flush(search_completed=True)
     else:
         log.info("[TIMING] phase3_grep skipped")
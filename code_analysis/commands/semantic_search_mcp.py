@@ -15,6 +15,17 @@ from ..core.config import get_driver_config
 from ..core.exceptions import ValidationError
 from ..core.faiss_manager import FaissIndexManager
 from ..core.pgvector_embedding import numpy_embedding_to_pgvector_text
+from ..core.pgvector_search import (
+    ITERATIVE_SCAN_MODES,
+    MAX_EF_SEARCH,
+    has_library_refs,
+    pgvector_knn_query,
+    pgvector_version,
+    plan_pgvector_query,
+    project_hnsw_index_exists,
+    run_pgvector_query,
+)
+from ..core.shared_library_index import localize_library_rows
 from ..core.config_json import ConfigJSONDecodeError
 from ..core.embedding_input import EmbeddingInput
 from ..core.storage_paths import (
@@ -106,17 +117,36 @@ class SemanticSearchMCPCommand(BaseMCPCommand):
                     "minimum": 0.0,
                     "maximum": 1.0,
                 },
+                "ef_search": {
+                    "type": "integer",
+                    "description": (
+                        "pgvector only: HNSW candidate list size (hnsw.ef_search, "
+                        f"1–{MAX_EF_SEARCH}). Raised to the number of candidates "
+                        "fetched; higher values improve recall at some latency."
+                    ),
+                    "minimum": 1,
+                    "maximum": MAX_EF_SEARCH,
+                },
+                "iterative_scan": {
+                    "type": "string",
+                    "description": (
+                        "pgvector >= 0.8 only: hnsw.iterative_scan mode. Default "
+                        "relaxed_order when the shared index is filtered by project, "
+                        "off on the project's own partial index."
+                    ),
+                    "enum": list(ITERATIVE_SCAN_MODES),
+                },
             },
             "required": ["project_id", "query"],
             "additionalProperties": False,
         }
 
     def validate_params(self, params: Dict[str, Any]) -> Dict[str, Any]:
-        """Reject ``limit`` and ``min_score`` outside schema bounds after schema validation."""
+        """Reject ``limit``, ``min_score`` and ``ef_search`` outside schema bounds."""
         params = super().validate_params(params)
         schema = self.get_schema()
         props = schema.get("properties") or {}
-        for key in ("limit", "min_score"):
+        for key in ("limit", "min_score", "ef_search"):
             if key not in params or params[key] is None:
                 continue
             value = params[key]
@@ -143,6 +173,8 @@ class SemanticSearchMCPCommand(BaseMCPCommand):
         query: str,
         limit: int = 10,
         min_score: Optional[float] = None,
+        ef_search: Optional[int] = None,
+        iterative_scan: Optional[str] = None,
         **kwargs,
     ) -> SuccessResult | ErrorResult:
         """Execute semantic search.
@@ -153,6 +185,8 @@ class SemanticSearchMCPCommand(BaseMCPCommand):
             query: Search query text.
             limit: Maximum number of results to return (same semantics as fulltext_search limit).
             min_score: Optional minimum similarity score threshold.
+            ef_search: Optional ``hnsw.ef_search`` (pgvector backend only).
+            iterative_scan: Optional ``hnsw.iterative_scan`` (pgvector backend only).
 
         Returns:
             SuccessResult with search results or ErrorResult on failure.
@@ -163,6 +197,10 @@ class SemanticSearchMCPCommand(BaseMCPCommand):
             "limit": limit,
             "min_score": min_score,
         }
+        if ef_search is not None:
+            params["ef_search"] = ef_search
+        if iterative_scan is not None:
+            params["iterative_scan"] = iterative_scan
         try:
             params = self.validate_params(params)
         except ValidationError as e:
@@ -171,6 +209,8 @@ class SemanticSearchMCPCommand(BaseMCPCommand):
         query = params["query"]
         limit = int(params.get("limit", 10))
         min_score = params.get("min_score")
+        ef_search = params.get("ef_search")
+        iterative_scan = params.get("iterative_scan")
 
         try:
             self._resolve_project_root(project_id)
@@ -270,9 +310,21 @@ class SemanticSearchMCPCommand(BaseMCPCommand):
                         )
 
                     qtxt = numpy_embedding_to_pgvector_text(query_vec)
-                    pq = database.execute(
+                    plan = plan_pgvector_query(
+                        chunk_count=n_pg,
+                        has_project_index=project_hnsw_index_exists(
+                            database, project_id
+                        ),
+                        limit=int(limit),
+                        post_filtered=min_score is not None
+                        or not docs_markdown_vectorize_enabled,
+                        ef_search=ef_search,
+                        iterative_scan=iterative_scan,
+                        supports_iterative_scan=(pgvector_version(database) or (0,))
+                        >= (0, 8, 0),
+                    )
+                    pq_sql, pq_params = pgvector_knn_query(
                         """
-                        SELECT
                             c.id AS chunk_id,
                             c.file_id,
                             c.vector_id,
@@ -286,19 +338,17 @@ class SemanticSearchMCPCommand(BaseMCPCommand):
                             f.project_id AS project_id,
                             p.name AS project_name,
                             c.bm25_score,
-                            c.token_count,
-                            (c.embedding_vec <=> ?::vector) AS dist
-                        FROM code_chunks c
-                        JOIN files f ON f.id = c.file_id
-                        JOIN projects p ON p.id = f.project_id
-                        WHERE c.project_id = ?
-                          AND c.embedding_vec IS NOT NULL
-                        ORDER BY c.embedding_vec <=> ?::vector
-                        LIMIT ?
+                            c.token_count
                         """,
-                        (qtxt, project_id, qtxt, int(limit)),
+                        qtxt,
+                        project_id,
+                        plan,
+                        include_library=has_library_refs(database, project_id),
                     )
-                    prow = pq.get("data", []) if isinstance(pq, dict) else []
+                    prow = run_pgvector_query(
+                        database, pq_sql, pq_params, plan.settings
+                    )
+                    prow = localize_library_rows(database, project_id, prow)
                     results_pg: list[dict[str, Any]] = []
                     for row in prow:
                         dist = float(row.get("dist") or 0.0)
@@ -330,7 +380,11 @@ class SemanticSearchMCPCommand(BaseMCPCommand):
                             item_pg["bm25_score"] = float(row["bm25_score"])
                         if row.get("token_count") is not None:
                             item_pg["token_count"] = int(row["token_count"])
+                        if row.get("shared_library"):
+                            item_pg["shared_library"] = True
                         results_pg.append(item_pg)
+                        if len(results_pg) >= int(limit):
+                            break
 
                     return SuccessResult(
                         data={
@@ -339,6 +393,7 @@ class SemanticSearchMCPCommand(BaseMCPCommand):
                             "min_score": min_score,
                             "index_path": None,
                             "vector_backend": "pgvector",
+                            "pgvector_strategy": plan.strategy,
                             "project_id": project_id,
                             "results": results_pg,
                             "count": len(results_pg),
@@ -639,7 +694,13 @@ class SemanticSearchMCPCommand(BaseMCPCommand):
                 "- Requires a working embedding service\n"
                 "- Requires FAISS (optional dependency); missing FAISS may yield empty results with a warning\n"
                 "- ``limit`` must be 1–100; out-of-range values are rejected in ``validate_params``\n"
-                "- ``min_score`` must be 0.0–1.0 when set; filters by similarity threshold"
+                "- ``min_score`` must be 0.0–1.0 when set; filters by similarity threshold\n\n"
+                "pgvector backend:\n"
+                "- Projects up to 20k embedded chunks are ranked exactly\n"
+                "- Larger projects use their partial HNSW index (created by the schema "
+                "migrations from 10k chunks), else the shared index with over-fetch and "
+                "iterative scans; ``pgvector_strategy`` in the response names the plan\n"
+                "- ``ef_search`` / ``iterative_scan`` tune the HNSW scan per query"
             ),
             "parameters": {
                 "project_id": {
@@ -687,6 +748,29 @@ class SemanticSearchMCPCommand(BaseMCPCommand):
                     "maximum": 1.0,
                     "examples": [0.5, 0.7, 0.9],
                 },
+                "ef_search": {
+                    "description": (
+                        "pgvector backend only: ``hnsw.ef_search`` for this query "
+                        f"(1–{MAX_EF_SEARCH}). Never lower than the number of candidates "
+                        "fetched (``limit``, times 4 when results are post-filtered or "
+                        "the shared index is filtered by project)."
+                    ),
+                    "type": "integer",
+                    "required": False,
+                    "minimum": 1,
+                    "maximum": MAX_EF_SEARCH,
+                },
+                "iterative_scan": {
+                    "description": (
+                        "pgvector >= 0.8 only: ``hnsw.iterative_scan`` "
+                        "(off, strict_order, relaxed_order). Default relaxed_order when "
+                        "the shared HNSW index is filtered by project; off on the "
+                        "project's partial index. Ignored on older pgvector."
+                    ),
+                    "type": "string",
+                    "required": False,
+                    "enum": list(ITERATIVE_SCAN_MODES),
+                },
             },
             "usage_examples": [
                 {
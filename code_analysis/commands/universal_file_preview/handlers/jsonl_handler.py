@@ -18,6 +18,7 @@ import logging
 from pathlib import Path
 from typing import Any
 
+from code_analysis.core.file_handlers.line_index import open_text_lines
 from code_analysis.core.fs_permissions import log_fs_access_error
 
 from ..base_handler import FileHandler
@@ -134,16 +135,18 @@ class JsonLinesFileHandler(FileHandler):
                 "open_root must be called before resolve_node_ref.",
             )
         try:
-            lines = Path(fp).read_text(encoding="utf-8", errors="replace").splitlines()
+            text_lines = open_text_lines(Path(fp))
+            total_lines = text_lines.total_lines
+            if 0 <= idx < total_lines:
+                line_text = text_lines.window(idx + 1, idx + 1)[0]
         except OSError as exc:
             return file_structure_error(parser="json", message=str(exc))
-        if idx < 0 or idx >= len(lines):
+        if idx < 0 or idx >= total_lines:
             return input_error(
                 INPUT_ERROR_UNKNOWN_NODE_REF,
-                f"Line index {idx} out of range [0, {len(lines)}).",
+                f"Line index {idx} out of range [0, {total_lines}).",
                 details={"node_ref": node_ref},
             )
-        line_text = lines[idx]
         try:
             doc = json.loads(line_text)
         except json.JSONDecodeError as exc:
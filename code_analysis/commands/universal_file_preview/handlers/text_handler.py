@@ -15,6 +15,7 @@ import logging
 from pathlib import Path
 from typing import Any
 
+from code_analysis.core.file_handlers.line_index import open_text_lines
 from code_analysis.core.fs_permissions import log_fs_access_error
 
 from ..base_handler import FileHandler
@@ -127,23 +128,25 @@ class TextFileHandler(FileHandler):
                 "(TextFileHandler needs the file path).",
                 details={"node_ref": node_ref},
             )
-        root_result = self.open_root(fp, session)
-        if isinstance(root_result, PreviewError):
-            return root_result
-        lines = root_result.children
-        if idx < 0 or idx >= len(lines):
+        try:
+            text_lines = open_text_lines(Path(fp))
+            total_lines = text_lines.total_lines
+        except OSError:
+            log_fs_access_error(fp, "text_handler.resolve_node_ref")
+            text_lines, total_lines = None, 0
+        if text_lines is None or idx < 0 or idx >= total_lines:
             return input_error(
                 INPUT_ERROR_UNKNOWN_NODE_REF,
-                f"Line index {idx} out of range [0, {len(lines)}).",
-                details={"node_ref": node_ref, "total_lines": len(lines)},
+                f"Line index {idx} out of range [0, {total_lines}).",
+                details={"node_ref": node_ref, "total_lines": total_lines},
             )
         line_no = idx + 1
-        line_node = lines[idx]
-        attrs = dict(line_node.attributes or {})
-        attrs["start_line"] = str(line_no)
-        attrs["end_line"] = str(line_no)
         return Node(
-            node_kind=line_node.node_kind,
-            node_ref=line_node.node_ref,
-            attributes=attrs,
+            node_kind=NodeKind.SCALAR,
+            node_ref=str(idx),
+            attributes={
+                "value": text_lines.window(line_no, line_no)[0],
+                "start_line": str(line_no),
+                "end_line": str(line_no),
+            },
         )
@@ -30,6 +30,7 @@ from ..core.database_driver_pkg.domain.files import (
 from ..core.docs_indexing_defaults import DOCS_INDEX_FILE_SUFFIXES
 from ..core.docs_indexing_eligibility import is_docs_markdown_eligible
 from ..core.docstring_chunker_pkg.docstring_chunker import DocstringChunker
+from ..core.metrics import PhaseTimer, inc
 from ..core.text_index_whitelist import (
     TEXT_INDEX_BINARY_SNIFF_BYTES,
     TEXT_INDEX_MAX_BYTES,
@@ -261,7 +262,8 @@ def analyze_file(
     :mod:`code_analysis.core.text_index_whitelist`) get a lighter path: a
     ``files`` row (lockable ``file_id``) and ``code_content`` for fulltext
     search, never CST/AST/entities. Emits progress_callback(phase) for
-    heartbeat during long per-file phases.
+    heartbeat during long per-file phases; the wall time of each phase is
+    recorded in the ``code_analysis_analyze_file_phase_seconds`` histogram.
 
     Args:
         database: DatabaseClient instance.
@@ -279,6 +281,46 @@ def analyze_file(
         Status ``skipped`` means disk mtime matches DB within :data:`FILE_MODIFICATION_TOLERANCE`
         and no work was done (no file read, no parse).
     """
+    phases = PhaseTimer("code_analysis_analyze_file_phase_seconds")
+
+    def _on_phase(phase: str) -> None:
+        """Close the previous phase's timing, then forward the heartbeat."""
+        phases.enter(phase)
+        if progress_callback:
+            progress_callback(phase)
+
+    phases.enter("prepare")
+    try:
+        result = _analyze_file(
+            database,
+            file_path,
+            project_id,
+            root_path,
+            _on_phase,
+            force,
+            docs_indexing,
+            server_config_path,
+            skip_file_edit_lock=skip_file_edit_lock,
+        )
+    finally:
+        phases.close()
+    inc("code_analysis_analyze_file_total", outcome=result.get("status", "unknown"))
+    return result
+
+
+def _analyze_file(
+    database: Any,
+    file_path: Path,
+    project_id: str,
+    root_path: Path,
+    progress_callback: Optional[Callable[[str], None]] = None,
+    force: bool = False,
+    docs_indexing: Any = None,
+    server_config_path: Optional[str] = None,
+    *,
+    skip_file_edit_lock: bool = False,
+) -> Dict[str, Any]:
+    """Body of :func:`analyze_file` (phases are reported via ``progress_callback``)."""
 
     def _heartbeat(phase: str) -> None:
         """Return heartbeat."""
@@ -19,6 +19,7 @@ from ...core.config import get_driver_config
 from ...core.database_driver_pkg.domain.projects import get_project
 from ...core.faiss_manager import FaissIndexManager
 from ...core.pgvector_embedding import numpy_embedding_to_pgvector_text
+from ...core.pgvector_search import ensure_project_hnsw_index
 from ...core.config_json import ConfigJSONDecodeError
 from ...core.storage_paths import (
     get_faiss_index_path,
@@ -179,6 +180,7 @@ class RebuildFaissCommand(BaseMCPCommand):
                             "REINDEX idx_code_chunks_embedding_vec_hnsw skipped: %s",
                             re_ix_e,
                         )
+                    ensure_project_hnsw_index(database, project_id)
                     return SuccessResult(
                         data={
                             "project_id": project_id,
@@ -178,6 +178,45 @@ def queue_health_command_metadata(cls: Type[Any]) -> Dict[str, Any]:
     )
 
 
+def queue_wait_job_command_metadata(cls: Type[Any]) -> Dict[str, Any]:
+    """Return queue wait job command metadata."""
+    return build_command_metadata(
+        cls,
+        detailed_description=(
+            "Long-poll form of queue_get_job_status: blocks until the queuemgr job "
+            "reaches completed/failed/stopped or ``timeout`` seconds pass, then "
+            "returns the same payload as queue_get_job_status plus ``timed_out``. "
+            "All waiters of a job share one server-side completion event, so a "
+            "short queued command is reported within tens of milliseconds."
+        ),
+        usage_examples=[
+            {
+                "description": "Wait for a queued command",
+                "command": {"job_id": "<job_id from queued envelope>", "timeout": 25},
+                "explanation": "Repeat while timed_out is true and status is not terminal.",
+            },
+        ],
+        error_cases={
+            "JOB_NOT_FOUND": {
+                "description": "Unknown or already evicted job id.",
+                "solution": "Use the job_id of a queued envelope.",
+            },
+        },
+        return_value=simple_success_return(
+            data_fields={
+                "status": "Job status (terminal unless timed_out).",
+                "result": "Queued command envelope once completed.",
+                "timed_out": "True when timeout elapsed before a terminal status.",
+            },
+            example={"job_id": "j1", "status": "completed", "timed_out": False},
+        ),
+        best_practices=[
+            "Prefer over polling queue_get_job_status; keep timeout below the "
+            "client HTTP timeout.",
+        ],
+    )
+
+
 def qa_sleep_command_metadata(cls: Type[Any]) -> Dict[str, Any]:
     """Return qa sleep command metadata."""
     return build_command_metadata(
@@ -200,3 +239,45 @@ def qa_sleep_command_metadata(cls: Type[Any]) -> Dict[str, Any]:
         ),
         best_practices=["Use only in automated queue tests."],
     )
+
+
+def metrics_command_metadata(cls: Type[Any]) -> Dict[str, Any]:
+    """Return metrics command metadata."""
+    return _zero_arg_meta(
+        cls,
+        detailed_description=(
+            "Counters and fixed-bucket latency histograms of server hot paths, merged "
+            "across the server and its worker processes: SQL statements by fingerprint, "
+            "connection pool waits, analyze_file phases, chunker/embedding round-trips, "
+            "search phases and file watcher scan phases. Rendered in Prometheus text "
+            "format; the same text is served at GET /metrics when metrics.http_endpoint "
+            "is enabled."
+        ),
+        usage_examples=[
+            {
+                "description": "Dump metrics",
+                "command": {},
+                "explanation": "Feed data.text to promtool or compare two dumps.",
+            },
+        ],
+        error_cases={
+            "METRICS_ERROR": {
+                "description": "Collecting or rendering the snapshots failed.",
+                "solution": "Check server logs; snapshots live under the state dir.",
+            },
+        },
+        return_value=simple_success_return(
+            data_fields={
+                "enabled": "Whether recording is on (metrics.enabled).",
+                "content_type": "Prometheus text exposition content type.",
+                "metric_count": "Number of metrics with at least one series.",
+                "series_count": "Number of label sets across all metrics.",
+                "text": "Prometheus text exposition.",
+            },
+            example={"enabled": True, "metric_count": 0, "series_count": 0, "text": ""},
+        ),
+        best_practices=[
+            "Histograms are cumulative since process start; diff two dumps for a window.",
+            "Watch _bucket tails (le=1, le=5) for latency regressions, not only _sum.",
+        ],
+    )
@@ -0,0 +1,328 @@
+"""
+Long-lived mypy daemons (``dmypy``) for incremental type checking.
+
+A one-shot ``python -m mypy <file>`` run re-analyzes the file's whole import
+closure every time, which takes 10+ seconds on projects with heavy
+dependencies. When enabled, :func:`get_mypy_daemon` keeps one ``dmypy`` server
+per (project root, mypy config) that holds the analyzed program in memory and
+answers per-file and multi-file checks incrementally.
+
+- Daemons are opt-in: ``configure_mypy_daemon(enabled=True)`` (server config
+  ``mypy_daemon.enabled``) or ``CODE_ANALYSIS_MYPY_DAEMON=1``.
+- State lives under ``<state_dir>/<key>/``: the dmypy status file and log and
+  the effective (single-file scoped) config, written once per daemon instead
+  of per call. The analyzed program itself stays in daemon memory: dmypy does
+  not re-report errors of files it loads from a fine-grained cache, so no
+  on-disk cache is shared with it.
+- Idle daemons are stopped by :func:`reap_idle_mypy_daemons` (run on every
+  lookup) and also exit on their own after the same idle timeout, so a crashed
+  server does not leave them behind. :func:`shutdown_mypy_daemons` stops all
+  of them on server shutdown.
+- Every check passes the same growing source list (all files and
+  directories ever checked through the daemon): dmypy mis-reports files when
+  the source set changes between runs (a newly added file with a syntax error
+  comes back clean). Callers filter the output to the files they asked for.
+- A daemon that cannot start or answer is reported as ``None`` / a failed
+  result; callers fall back to the one-shot subprocess.
+
+Author: Vasiliy Zdanovskiy
+email: vasilyvz@gmail.com
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import re
+import subprocess
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+from .tool_runtime import module_missing, sanitized_env, tool_command
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_IDLE_TIMEOUT_SEC = 600.0
+START_TIMEOUT_SEC = 120.0
+
+# dmypy exit code for "daemon failed / not running" and for blocking errors
+# such as invalid syntax (0 clean, 1 type errors).
+DMYPY_FAILED = 2
+
+# "<file>:<line>: error:" -- a report line, i.e. the daemon did answer.
+_ERROR_LINE = re.compile(r"^.+:\d+: error:", re.MULTILINE)
+
+# Directories that mark a project root when no mypy config is given.
+_ROOT_MARKERS = ("pyproject.toml", "setup.cfg", "setup.py", "mypy.ini", ".git")
+
+_lock = threading.Lock()
+_daemons: Dict[str, "MypyDaemon"] = {}
+
+# Configuration (set via configure_mypy_daemon(); otherwise env/defaults).
+_enabled_override: Optional[bool] = None
+_idle_timeout_override: Optional[float] = None
+_state_dir_override: Optional[Path] = None
+
+
+def configure_mypy_daemon(
+    *,
+    enabled: Optional[bool] = None,
+    idle_timeout_sec: Optional[float] = None,
+    state_dir: Optional[Path] = None,
+) -> None:
+    """Override daemon settings (call once at startup from server config)."""
+    global _enabled_override, _idle_timeout_override, _state_dir_override
+    if enabled is not None:
+        _enabled_override = bool(enabled)
+    if idle_timeout_sec is not None and float(idle_timeout_sec) > 0:
+        _idle_timeout_override = float(idle_timeout_sec)
+    if state_dir is not None:
+        _state_dir_override = Path(state_dir)
+
+
+def mypy_daemon_enabled() -> bool:
+    """Return whether type checks should go through a mypy daemon (default off)."""
+    if _enabled_override is not None:
+        return _enabled_override
+    env = os.environ.get("CODE_ANALYSIS_MYPY_DAEMON")
+    if env is not None:
+        return env.strip().lower() in ("1", "true", "yes", "on")
+    return False
+
+
+def _idle_timeout() -> float:
+    if _idle_timeout_override:
+        return _idle_timeout_override
+    env = os.environ.get("CODE_ANALYSIS_MYPY_DAEMON_IDLE_SEC")
+    if env:
+        try:
+            value = float(env)
+            if value > 0:
+                return value
+        except ValueError:
+            logger.warning("Ignoring CODE_ANALYSIS_MYPY_DAEMON_IDLE_SEC=%r", env)
+    return DEFAULT_IDLE_TIMEOUT_SEC
+
+
+def _state_dir() -> Path:
+    if _state_dir_override is not None:
+        return _state_dir_override
+    from ..runtime_state_root import default_state_home
+
+    return default_state_home() / "mypy_daemons"
+
+
+def daemon_root_for(
+    file_path: Path, config_file: Optional[Path] = None
+) -> Optional[Path]:
+    """Directory a daemon for ``file_path`` runs in, or None when there is none.
+
+    With a config the daemon runs next to it (as the one-shot run does);
+    otherwise the nearest parent holding a project marker is used. Files
+    outside any project (e.g. scratch copies in a temp dir) get no daemon.
+    """
+    if config_file is not None:
+        return config_file.resolve().parent
+    cur = file_path.resolve()
+    for d in [cur.parent, *cur.parents]:
+        if any((d / marker).exists() for marker in _ROOT_MARKERS):
+            return d
+    return None
+
+
+class MypyDaemon:
+    """One ``dmypy`` server for a project root and effective mypy config."""
+
+    def __init__(
+        self,
+        root: Path,
+        config_text: str,
+        config_suffix: str,
+        state_dir: Path,
+        idle_timeout_sec: float,
+    ) -> None:
+        """Prepare the daemon's state directory; the server starts lazily.
+
+        Args:
+            root: Working directory of the daemon (project root / config dir).
+            config_text: Effective mypy config content.
+            config_suffix: ``.ini`` or ``.toml`` (how mypy parses the config).
+            state_dir: Directory for status file, log and config.
+            idle_timeout_sec: Stop after this long without a check.
+        """
+        self.root = root
+        self.state_dir = state_dir
+        self.status_file = state_dir / "dmypy.json"
+        self.log_file = state_dir / "dmypy.log"
+        self.config_file = state_dir / f"mypy{config_suffix}"
+        self.idle_timeout_sec = idle_timeout_sec
+        self.last_used = time.monotonic()
+        self._lock = threading.Lock()
+        self._started = False
+        self._sources: List[Path] = []
+        state_dir.mkdir(parents=True, exist_ok=True)
+        if (
+            not self.config_file.is_file()
+            or self.config_file.read_text(encoding="utf-8") != config_text
+        ):
+            self.config_file.write_text(config_text, encoding="utf-8")
+
+    def _run(self, *args: str, timeout: float) -> subprocess.CompletedProcess:
+        """Run ``python -m mypy.dmypy --status-file <file> <args>``."""
+        return subprocess.run(
+            tool_command("mypy.dmypy", "--status-file", str(self.status_file), *args),
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+            env=sanitized_env(),
+            cwd=str(self.root),
+        )
+
+    def _start(self) -> bool:
+        """Start the server (``dmypy start``); return whether it is running."""
+        proc = self._run(
+            "start",
+            "--timeout",
+            str(int(self.idle_timeout_sec)),
+            "--log-file",
+            str(self.log_file),
+            "--",
+            "--config-file",
+            str(self.config_file),
+            timeout=START_TIMEOUT_SEC,
+        )
+        if proc.returncode == 0:
+            return True
+        if module_missing(proc.stderr, "mypy"):
+            logger.warning("Mypy module not importable from server interpreter")
+        elif "Daemon is still alive" in (proc.stdout or "") + (proc.stderr or ""):
+            # Left over from a previous server process with the same state dir.
+            return True
+        else:
+            logger.warning(
+                "mypy daemon failed to start in %s: %s",
+                self.root,
+                (proc.stderr or proc.stdout or "").strip(),
+            )
+        return False
+
+    def _track_sources(self, paths: Sequence[Path]) -> List[str]:
+        """Add ``paths`` to the daemon's source list; return the list to check.
+
+        Files under an already listed directory are covered by it; paths that
+        no longer exist are dropped (dmypy fails on unreadable sources).
+        """
+        for path in (p.resolve() for p in paths):
+            if any(path == s or s in path.parents for s in self._sources):
+                continue
+            self._sources = [s for s in self._sources if path not in s.parents]
+            self._sources.append(path)
+        self._sources = [s for s in self._sources if s.exists()]
+        return [str(s) for s in self._sources]
+
+    def _alive(self) -> bool:
+        """Return whether ``dmypy status`` reports a running server."""
+        try:
+            return self._run("status", timeout=30).returncode == 0
+        except (subprocess.TimeoutExpired, OSError):
+            return False
+
+    def check(
+        self, paths: Sequence[Path], *, timeout: float = 60.0
+    ) -> Optional[subprocess.CompletedProcess]:
+        """Type check ``paths`` incrementally; None when the daemon is unusable.
+
+        The daemon checks its whole source list (see module docstring), so the
+        output may also cover files checked earlier. Exit code 0 is clean;
+        1 and 2 with ``file:line: error:`` lines are reports (2 for blocking
+        errors such as invalid syntax). A daemon that ``dmypy status`` reports
+        gone (idle timeout, crash) is restarted once.
+        """
+        with self._lock:
+            args = self._track_sources(paths)
+            self.last_used = time.monotonic()
+            for attempt in range(2):
+                if not self._started or attempt:
+                    self._started = self._start()
+                    if not self._started:
+                        return None
+                proc = self._run("check", *args, timeout=timeout)
+                output = (proc.stdout or "") + (proc.stderr or "")
+                if proc.returncode != DMYPY_FAILED or _ERROR_LINE.search(output):
+                    self.last_used = time.monotonic()
+                    return proc
+                if self._alive():
+                    logger.warning(
+                        "mypy daemon in %s failed the check: %s",
+                        self.root,
+                        output.strip(),
+                    )
+                    return None
+                logger.info(
+                    "mypy daemon in %s did not answer (%s); restarting",
+                    self.root,
+                    output.strip(),
+                )
+                self._started = False
+            return None
+
+    def stop(self) -> None:
+        """Stop the server if running (best-effort)."""
+        with self._lock:
+            if not self._started:
+                return
+            self._started = False
+            try:
+                self._run("stop", timeout=30)
+            except (subprocess.TimeoutExpired, OSError) as exc:
+                logger.warning("mypy daemon stop failed in %s: %s", self.root, exc)
+                try:
+                    self._run("kill", timeout=10)
+                except (subprocess.TimeoutExpired, OSError):
+                    pass
+
+
+def get_mypy_daemon(root: Path, config_text: str, config_suffix: str) -> MypyDaemon:
+    """Return the daemon for ``root`` and this effective config, creating it."""
+    root = root.resolve()
+    digest = hashlib.sha256(
+        f"{root}\0{config_suffix}\0{config_text}".encode("utf-8")
+    ).hexdigest()[:16]
+    reap_idle_mypy_daemons()
+    with _lock:
+        daemon = _daemons.get(digest)
+        if daemon is None:
+            daemon = MypyDaemon(
+                root,
+                config_text,
+                config_suffix,
+                _state_dir() / digest,
+                _idle_timeout(),
+            )
+            _daemons[digest] = daemon
+        return daemon
+
+
+def reap_idle_mypy_daemons(now: Optional[float] = None) -> int:
+    """Stop daemons idle longer than their timeout; return how many were stopped."""
+    now = time.monotonic() if now is None else now
+    with _lock:
+        idle = [
+            key for key, d in _daemons.items() if now - d.last_used > d.idle_timeout_sec
+        ]
+        stopped = [_daemons.pop(key) for key in idle]
+    for daemon in stopped:
+        daemon.stop()
+    return len(stopped)
+
+
+def shutdown_mypy_daemons() -> None:
+    """Stop every daemon (server shutdown; idempotent)."""
+    with _lock:
+        daemons: List[MypyDaemon] = list(_daemons.values())
+        _daemons.clear()
+    for daemon in daemons:
+        daemon.stop()
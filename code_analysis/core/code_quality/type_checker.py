@@ -4,6 +4,10 @@ Type checker using mypy as a library.
 When no config is provided, uses a minimal config that excludes .venv, venv,
 and .mypy_cache so mypy does not crawl the virtualenv (major speedup).
 
+When the mypy daemon is enabled (see :mod:`.mypy_daemon`), checks go to a
+long-lived ``dmypy`` server per project and config first and only fall back
+to a one-shot mypy subprocess when no daemon can answer.
+
 Author: Vasiliy Zdanovskiy
 email: vasilyvz@gmail.com
 """
@@ -16,6 +20,12 @@ import tempfile
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+from .mypy_daemon import (
+    DMYPY_FAILED,
+    daemon_root_for,
+    get_mypy_daemon,
+    mypy_daemon_enabled,
+)
 from .tool_runtime import module_missing, sanitized_env, tool_command
 
 logger = logging.getLogger(__name__)
@@ -30,10 +40,10 @@ exclude = (\\.venv|venv|\\.mypy_cache)/
 """
 
 
-def _build_single_file_config(config_file: Path) -> Optional[Path]:
+def _single_file_config_text(config_file: Path) -> Optional[str]:
     """
-    Create a temporary mypy config that keeps original options but removes
-    top-level scope expanders (`files`/`modules`) in primary mypy section.
+    Return the config text with top-level scope expanders (`files`/`modules`)
+    removed from the primary mypy section.
 
     This keeps single-file invocation bounded to the explicit target argument.
 
@@ -41,7 +51,8 @@ def _build_single_file_config(config_file: Path) -> Optional[Path]:
         config_file: Path to original mypy config file (.ini or pyproject.toml).
 
     Returns:
-        Path to temporary sanitised config, or None if no scope keys were removed.
+        Sanitised config text, or None if no scope keys were removed (or the
+        config could not be read).
     """
     try:
         text = config_file.read_text(encoding="utf-8")
@@ -79,6 +90,23 @@ def _build_single_file_config(config_file: Path) -> Optional[Path]:
 
     if not removed_scope_keys:
         return None
+    return "\n".join(sanitized_lines) + "\n"
+
+
+def _build_single_file_config(config_file: Path) -> Optional[Path]:
+    """
+    Create a temporary mypy config that keeps original options but removes
+    top-level scope expanders (`files`/`modules`) in primary mypy section.
+
+    Args:
+        config_file: Path to original mypy config file (.ini or pyproject.toml).
+
+    Returns:
+        Path to temporary sanitised config, or None if no scope keys were removed.
+    """
+    text = _single_file_config_text(config_file)
+    if text is None:
+        return None
 
     with tempfile.NamedTemporaryFile(
         mode="w",
@@ -87,7 +115,7 @@ def _build_single_file_config(config_file: Path) -> Optional[Path]:
         delete=False,
         encoding="utf-8",
     ) as temp_file:
-        temp_file.write("\n".join(sanitized_lines) + "\n")
+        temp_file.write(text)
         return Path(temp_file.name)
 
 
@@ -187,10 +215,116 @@ def type_check_with_mypy(
     # shadow the stdlib `ast` module for in-process tooling. Running mypy via its
     # library API inside the server process can therefore fail in non-obvious ways.
     # To keep the MCP command robust, always run mypy via subprocess with sanitized
-    # environment (see `_type_check_with_subprocess`).
+    # environment (see `_type_check_with_subprocess`), or through a dmypy
+    # server (itself a separate process) when the daemon is enabled.
+    if mypy_daemon_enabled():
+        result = _type_check_with_daemon(file_path, config_file, ignore_errors)
+        if result is not None:
+            return result
     return _type_check_with_subprocess(file_path, config_file, ignore_errors)
 
 
+def _daemon_config(
+    config_file: Optional[Path], *, single_file: bool
+) -> Optional[Tuple[str, str]]:
+    """Return ``(config_text, suffix)`` a daemon should run with, or None."""
+    if config_file is None:
+        return _MYPY_EXCLUDE_VENV_CONFIG.decode("utf-8"), ".ini"
+    text = _single_file_config_text(config_file) if single_file else None
+    if text is None:
+        try:
+            text = config_file.read_text(encoding="utf-8")
+        except OSError as exc:
+            logger.warning("Failed to read mypy config %s: %s", config_file, exc)
+            return None
+    return text, config_file.suffix or ".ini"
+
+
+def _type_check_with_daemon(
+    file_path: Path,
+    config_file: Optional[Path] = None,
+    ignore_errors: bool = False,
+) -> Optional[Tuple[bool, Optional[str], List[str]]]:
+    """
+    Check one file through the project's mypy daemon.
+
+    Uses the same single-file scoped config and output filtering as the
+    subprocess path.
+
+    Returns:
+        Same tuple as :func:`type_check_with_mypy`, or None when no daemon
+        applies or it could not answer (caller falls back to a subprocess).
+    """
+    target_file = file_path.resolve()
+    root = daemon_root_for(target_file, config_file)
+    daemon_config = _daemon_config(config_file, single_file=True)
+    if root is None or daemon_config is None:
+        return None
+    try:
+        result = get_mypy_daemon(root, *daemon_config).check([target_file])
+    except subprocess.TimeoutExpired:
+        logger.warning("Mypy daemon check timed out for %s", target_file)
+        return None
+    except OSError as e:
+        logger.warning("Mypy daemon unavailable: %s", e)
+        return None
+    if result is None:
+        return None
+    outcome = _single_file_result(target_file, result, str(root), ignore_errors)
+    output = (result.stdout or "") + (result.stderr or "")
+    if (
+        not outcome[2]
+        and result.returncode != 0
+        and (result.returncode == DMYPY_FAILED or "[syntax]" in output)
+    ):
+        # A blocking error in another file of the daemon's source list stops
+        # analysis before the target is reported; let the one-shot run answer.
+        return None
+    return outcome
+
+
+def _single_file_result(
+    target_file: Path,
+    result: subprocess.CompletedProcess,
+    cwd: Optional[str],
+    ignore_errors: bool,
+) -> Tuple[bool, Optional[str], List[str]]:
+    """Turn a mypy/dmypy run over ``target_file`` into the checker result tuple."""
+    raw_lines: List[str] = []
+    if result.stdout:
+        raw_lines.extend([line for line in result.stdout.split("\n") if line.strip()])
+    if result.stderr:
+        raw_lines.extend([line for line in result.stderr.split("\n") if line.strip()])
+
+    # Scope output to the single requested file (mypy follows imports and
+    # reports errors from many modules; we return only errors for target_file).
+    errors = _filter_mypy_errors_to_target(target_file, raw_lines, cwd)
+
+    if result.returncode != 0:
+        # After filtering output to the target file, errors may be empty even
+        # when mypy returned non-zero exit code (e.g. mypy only printed a
+        # summary line like 'Found 1 error in 1 file (checked 1 source file)'
+        # that does not match the target path pattern). In that case the file
+        # itself is clean — treat as success.
+        if not errors:
+            logger.debug(
+                "mypy returncode=%d but no target-file errors after"
+                " output filtering; treating as success for %s",
+                result.returncode,
+                target_file,
+            )
+            return (True, None, [])
+        error_msg = f"Found {len(errors)} mypy errors"
+        if ignore_errors:
+            logger.info(f"{error_msg} in {target_file} (ignored)")
+            return (True, None, errors)
+        logger.warning(f"{error_msg} in {target_file}")
+        return (False, error_msg, errors)
+
+    logger.debug(f"No mypy errors found in {target_file}")
+    return (True, None, [])
+
+
 def _type_check_with_subprocess(
     file_path: Path,
     config_file: Optional[Path] = None,
@@ -270,43 +404,7 @@ def _type_check_with_subprocess(
             except OSError:
                 pass
 
-        raw_lines: List[str] = []
-        if result.stdout:
-            raw_lines.extend(
-                [line for line in result.stdout.split("\n") if line.strip()]
-            )
-        if result.stderr:
-            raw_lines.extend(
-                [line for line in result.stderr.split("\n") if line.strip()]
-            )
-
-        # Scope output to the single requested file (mypy follows imports and
-        # reports errors from many modules; we return only errors for target_file).
-        errors = _filter_mypy_errors_to_target(target_file, raw_lines, cwd)
-
-        if result.returncode != 0:
-            # After filtering output to the target file, errors may be empty even
-            # when mypy returned non-zero exit code (e.g. mypy only printed a
-            # summary line like 'Found 1 error in 1 file (checked 1 source file)'
-            # that does not match the target path pattern). In that case the file
-            # itself is clean — treat as success.
-            if not errors:
-                logger.debug(
-                    "mypy returncode=%d but no target-file errors after"
-                    " output filtering; treating as success for %s",
-                    result.returncode,
-                    target_file,
-                )
-                return (True, None, [])
-            error_msg = f"Found {len(errors)} mypy errors"
-            if ignore_errors:
-                logger.info(f"{error_msg} in {target_file} (ignored)")
-                return (True, None, errors)
-            logger.warning(f"{error_msg} in {target_file}")
-            return (False, error_msg, errors)
-
-        logger.debug(f"No mypy errors found in {target_file}")
-        return (True, None, [])
+        return _single_file_result(target_file, result, cwd, ignore_errors)
 
     except subprocess.TimeoutExpired:
         logger.warning("Mypy type checking timed out")
@@ -328,7 +426,8 @@ def type_check_project_with_mypy(
     Run mypy once on the whole project directory (excluding .venv/venv).
 
     Much faster than per-file runs. Returns per-file error lines keyed by
-    normalized absolute path.
+    normalized absolute path. With the mypy daemon enabled the project's
+    daemon answers (incrementally after the first run).
 
     Args:
         project_path: Root directory to check.
@@ -339,10 +438,39 @@ def type_check_project_with_mypy(
         (success, per_file_errors). per_file_errors maps path str -> list of
         error/note lines for that file.
     """
-    per_file: Dict[str, List[str]] = {}
     project_path = project_path.resolve()
     cwd = str(project_path)
 
+    result: Optional[subprocess.CompletedProcess] = None
+    if mypy_daemon_enabled():
+        daemon_config = _daemon_config(config_file, single_file=False)
+        if daemon_config is not None:
+            try:
+                result = get_mypy_daemon(project_path, *daemon_config).check(
+                    [project_path], timeout=timeout_sec
+                )
+            except (subprocess.TimeoutExpired, OSError) as e:
+                logger.warning("Mypy daemon project check failed: %s", e)
+    if result is None:
+        result = _run_project_subprocess(project_path, config_file, timeout_sec)
+
+    per_file = _per_file_errors(
+        project_path, (result.stdout or "") + "\n" + (result.stderr or "")
+    )
+    if result.returncode != 0 and not per_file:
+        logger.debug(
+            "mypy returncode=%d but no parsed file errors; treating as success for %s",
+            result.returncode,
+            cwd,
+        )
+        return (True, per_file)
+    return (result.returncode == 0, per_file)
+
+
+def _run_project_subprocess(
+    project_path: Path, config_file: Optional[Path], timeout_sec: int
+) -> subprocess.CompletedProcess:
+    """Run one-shot ``mypy <project_path>`` with the project or exclude-venv config."""
     if config_file:
         config_path = str(config_file)
     else:
@@ -357,13 +485,13 @@ def type_check_project_with_mypy(
     try:
         cmd = tool_command("mypy", str(project_path), "--config-file", config_path)
         env = sanitized_env()
-        result = subprocess.run(
+        return subprocess.run(
             cmd,
             capture_output=True,
             text=True,
             timeout=timeout_sec,
             env=env,
-            cwd=cwd,
+            cwd=str(project_path),
         )
     finally:
         if not config_file:
@@ -372,7 +500,10 @@ def type_check_project_with_mypy(
             except OSError:
                 pass
 
-    out = (result.stdout or "") + "\n" + (result.stderr or "")
+
+def _per_file_errors(project_path: Path, out: str) -> Dict[str, List[str]]:
+    """Group mypy error/note lines of ``out`` by absolute file path."""
+    per_file: Dict[str, List[str]] = {}
     for line in out.split("\n"):
         line = line.strip()
         if not line or (": error:" not in line and ": note:" not in line):
@@ -393,11 +524,4 @@ def type_check_project_with_mypy(
             per_file[key].append(line)
         except Exception:
             continue
-    if result.returncode != 0 and not per_file:
-        logger.debug(
-            "mypy returncode=%d but no parsed file errors; treating as success for %s",
-            result.returncode,
-            project_path,
-        )
-        return (True, per_file)
-    return (result.returncode == 0, per_file)
+    return per_file
@@ -14,7 +14,7 @@ import re
 import tokenize
 from io import StringIO
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from ..core.constants import DEFAULT_MAX_FILE_LINES, PLACEHOLDER_PATTERNS
 
@@ -68,6 +68,34 @@ class ComprehensiveAnalyzer:
             self.placeholder_patterns = PLACEHOLDER_PATTERNS
         else:
             self.placeholder_patterns = placeholder_patterns
+        # Last parsed source, shared by the AST-based checks of one file.
+        self._parsed: Optional[Tuple[str, str, Optional[ast.Module]]] = None
+
+    def _parse(self, file_path: Path, source_code: str) -> Optional[ast.Module]:
+        """
+        Parse ``source_code`` once for all AST-based checks of a file.
+
+        The ``find_*`` checks run back to back on the same source, so the tree
+        of the most recent call is reused; a different path or source parses
+        again. The tree is shared and must not be mutated.
+
+        Returns:
+            The module tree, or None when the source has a syntax error.
+        """
+        key = str(file_path)
+        cached = self._parsed
+        if (
+            cached is not None
+            and cached[0] == key
+            and (cached[1] is source_code or cached[1] == source_code)
+        ):
+            return cached[2]
+        try:
+            tree: Optional[ast.Module] = ast.parse(source_code, filename=key)
+        except SyntaxError:
+            tree = None
+        self._parsed = (key, source_code, tree)
+        return tree
 
     def find_placeholders(
         self, file_path: Path, source_code: str
@@ -113,49 +141,27 @@ class ComprehensiveAnalyzer:
         except Exception as e:
             logger.debug(f"Error tokenizing {file_path}: {e}")
 
-        # Check docstrings
-        try:
-            tree = ast.parse(source_code, filename=str(file_path))
-            for node in ast.walk(tree):
-                if isinstance(
-                    node,
-                    (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef, ast.Module),
-                ):
-                    docstring = ast.get_docstring(node, clean=False)
-                    if docstring:
-                        match = pattern.search(docstring)
-                        if match:
-                            line_num = node.lineno if hasattr(node, "lineno") else 1
-                            placeholders.append(
-                                {
-                                    "line": line_num,
-                                    "type": "docstring",
-                                    "pattern": match.group(1).upper(),
-                                    "text": docstring[:100],  # First 100 chars
-                                    "context": (
-                                        lines[line_num - 1]
-                                        if line_num <= len(lines)
-                                        else ""
-                                    ),
-                                }
-                            )
-        except SyntaxError:
-            pass
+        tree = self._parse(file_path, source_code)
+        if tree is None:
+            return placeholders
 
-        # Check string literals
-        try:
-            tree = ast.parse(source_code, filename=str(file_path))
-            for node in ast.walk(tree):
-                if isinstance(node, ast.Constant) and isinstance(node.value, str):
-                    match = pattern.search(node.value)
+        # Check docstrings
+        for node in ast.walk(tree):
+            if isinstance(
+                node,
+                (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef, ast.Module),
+            ):
+                docstring = ast.get_docstring(node, clean=False)
+                if docstring:
+                    match = pattern.search(docstring)
                     if match:
                         line_num = node.lineno if hasattr(node, "lineno") else 1
                         placeholders.append(
                             {
                                 "line": line_num,
-                                "type": "string",
+                                "type": "docstring",
                                 "pattern": match.group(1).upper(),
-                                "text": node.value[:100],
+                                "text": docstring[:100],  # First 100 chars
                                 "context": (
                                     lines[line_num - 1]
                                     if line_num <= len(lines)
@@ -163,8 +169,24 @@ class ComprehensiveAnalyzer:
                                 ),
                             }
                         )
-        except SyntaxError:
-            pass
+
+        # Check string literals
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Constant) and isinstance(node.value, str):
+                match = pattern.search(node.value)
+                if match:
+                    line_num = node.lineno if hasattr(node, "lineno") else 1
+                    placeholders.append(
+                        {
+                            "line": line_num,
+                            "type": "string",
+                            "pattern": match.group(1).upper(),
+                            "text": node.value[:100],
+                            "context": (
+                                lines[line_num - 1] if line_num <= len(lines) else ""
+                            ),
+                        }
+                    )
 
         return placeholders
 
@@ -181,83 +203,84 @@ class ComprehensiveAnalyzer:
         """
         stubs: List[Dict[str, Any]] = []
 
-        try:
-            tree = ast.parse(source_code, filename=str(file_path))
-            lines = source_code.split("\n")
-
-            for node in ast.walk(tree):
-                if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                    # Check if it's a method
-                    is_method = False
-                    class_name = None
-                    for parent in ast.walk(tree):
-                        if isinstance(parent, ast.ClassDef):
-                            if node in parent.body:
-                                is_method = True
-                                class_name = parent.name
-                                break
-
-                    # Check body
-                    body = node.body
-                    if not body:
-                        continue
+        tree = self._parse(file_path, source_code)
+        if tree is None:
+            return stubs
 
-                    # Check for pass only
-                    if len(body) == 1 and isinstance(body[0], ast.Pass):
-                        stub_type = "pass"
-                    # Check for ellipsis only
-                    elif (
-                        len(body) == 1
-                        and isinstance(body[0], ast.Expr)
-                        and isinstance(body[0].value, ast.Constant)
-                        and body[0].value.value is Ellipsis
-                    ):
-                        stub_type = "ellipsis"
-                    # Check for raise NotImplementedError only
-                    elif (
-                        len(body) == 1
-                        and isinstance(body[0], ast.Raise)
-                        and isinstance(body[0].exc, ast.Call)
-                        and isinstance(body[0].exc.func, ast.Name)
-                        and body[0].exc.func.id == "NotImplementedError"
-                    ):
-                        stub_type = "not_implemented"
-                    # Check for return None only (if not abstract)
-                    elif (
-                        len(body) == 1
-                        and isinstance(body[0], ast.Return)
-                        and isinstance(body[0].value, ast.Constant)
-                        and body[0].value.value is None
-                    ):
-                        # Check if abstract
-                        is_abstract = any(
-                            isinstance(d, ast.Name) and d.id == "abstractmethod"
-                            for d in node.decorator_list
-                        )
-                        if not is_abstract:
-                            stub_type = "return_none"
-                        else:
-                            continue
+        lines = source_code.split("\n")
+        # Owning class of every direct class-body statement (methods).
+        class_of: Dict[int, str] = {
+            id(item): parent.name
+            for parent in ast.walk(tree)
+            if isinstance(parent, ast.ClassDef)
+            for item in parent.body
+        }
+
+        for node in ast.walk(tree):
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                # Check if it's a method
+                class_name = class_of.get(id(node))
+                is_method = class_name is not None
+
+                # Check body
+                body = node.body
+                if not body:
+                    continue
+
+                # Check for pass only
+                if len(body) == 1 and isinstance(body[0], ast.Pass):
+                    stub_type = "pass"
+                # Check for ellipsis only
+                elif (
+                    len(body) == 1
+                    and isinstance(body[0], ast.Expr)
+                    and isinstance(body[0].value, ast.Constant)
+                    and body[0].value.value is Ellipsis
+                ):
+                    stub_type = "ellipsis"
+                # Check for raise NotImplementedError only
+                elif (
+                    len(body) == 1
+                    and isinstance(body[0], ast.Raise)
+                    and isinstance(body[0].exc, ast.Call)
+                    and isinstance(body[0].exc.func, ast.Name)
+                    and body[0].exc.func.id == "NotImplementedError"
+                ):
+                    stub_type = "not_implemented"
+                # Check for return None only (if not abstract)
+                elif (
+                    len(body) == 1
+                    and isinstance(body[0], ast.Return)
+                    and isinstance(body[0].value, ast.Constant)
+                    and body[0].value.value is None
+                ):
+                    # Check if abstract
+                    is_abstract = any(
+                        isinstance(d, ast.Name) and d.id == "abstractmethod"
+                        for d in node.decorator_list
+                    )
+                    if not is_abstract:
+                        stub_type = "return_none"
                     else:
                         continue
+                else:
+                    continue
 
-                    # Extract code snippet
-                    start_line = node.lineno
-                    end_line = getattr(node, "end_lineno", start_line) or start_line
-                    code_snippet = "\n".join(lines[start_line - 1 : end_line])
+                # Extract code snippet
+                start_line = node.lineno
+                end_line = getattr(node, "end_lineno", start_line) or start_line
+                code_snippet = "\n".join(lines[start_line - 1 : end_line])
 
-                    stubs.append(
-                        {
-                            "function_name": node.name,
-                            "class_name": class_name,
-                            "line": start_line,
-                            "type": "method" if is_method else "function",
-                            "stub_type": stub_type,
-                            "code_snippet": code_snippet,
-                        }
-                    )
-        except SyntaxError:
-            pass
+                stubs.append(
+                    {
+                        "function_name": node.name,
+                        "class_name": class_name,
+                        "line": start_line,
+                        "type": "method" if is_method else "function",
+                        "stub_type": stub_type,
+                        "code_snippet": code_snippet,
+                    }
+                )
 
         return stubs
 
@@ -276,81 +299,79 @@ class ComprehensiveAnalyzer:
         """
         empty_methods: List[Dict[str, Any]] = []
 
-        try:
-            tree = ast.parse(source_code, filename=str(file_path))
-            lines = source_code.split("\n")
-
-            for node in ast.walk(tree):
-                if isinstance(node, ast.ClassDef):
-                    # Check if class is abstract
-                    is_abc = any(
-                        isinstance(base, ast.Name) and base.id == "ABC"
-                        for base in node.bases
-                    )
+        tree = self._parse(file_path, source_code)
+        if tree is None:
+            return empty_methods
 
-                    for item in node.body:
-                        if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                            # Check if abstract
-                            is_abstract = (
-                                any(
-                                    isinstance(d, ast.Name) and d.id == "abstractmethod"
-                                    for d in item.decorator_list
-                                )
-                                or is_abc
+        lines = source_code.split("\n")
+
+        for node in ast.walk(tree):
+            if isinstance(node, ast.ClassDef):
+                # Check if class is abstract
+                is_abc = any(
+                    isinstance(base, ast.Name) and base.id == "ABC"
+                    for base in node.bases
+                )
+
+                for item in node.body:
+                    if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                        # Check if abstract
+                        is_abstract = (
+                            any(
+                                isinstance(d, ast.Name) and d.id == "abstractmethod"
+                                for d in item.decorator_list
                             )
+                            or is_abc
+                        )
 
-                            if is_abstract and self.ignore_abstract:
-                                continue
+                        if is_abstract and self.ignore_abstract:
+                            continue
 
-                            # Check body
-                            body = item.body
-                            if not body:
-                                body_type = "empty"
-                            elif len(body) == 1:
-                                if isinstance(body[0], ast.Pass):
-                                    body_type = "pass"
-                                elif (
-                                    isinstance(body[0], ast.Expr)
-                                    and isinstance(body[0].value, ast.Constant)
-                                    and body[0].value.value is Ellipsis
-                                ):
-                                    body_type = "ellipsis"
-                                elif isinstance(body[0], ast.Expr):
-                                    # Check if it's a docstring (string constant)
-                                    if isinstance(
-                                        body[0].value, ast.Constant
-                                    ) and isinstance(body[0].value.value, str):
-                                        # Only docstring (Python 3.8+)
-                                        body_type = "docstring_only"
-                                    elif isinstance(body[0].value, ast.Str):
-                                        # Only docstring (Python < 3.8)
-                                        body_type = "docstring_only"
-                                    else:
-                                        continue
+                        # Check body
+                        body = item.body
+                        if not body:
+                            body_type = "empty"
+                        elif len(body) == 1:
+                            if isinstance(body[0], ast.Pass):
+                                body_type = "pass"
+                            elif (
+                                isinstance(body[0], ast.Expr)
+                                and isinstance(body[0].value, ast.Constant)
+                                and body[0].value.value is Ellipsis
+                            ):
+                                body_type = "ellipsis"
+                            elif isinstance(body[0], ast.Expr):
+                                # Check if it's a docstring (string constant)
+                                if isinstance(
+                                    body[0].value, ast.Constant
+                                ) and isinstance(body[0].value.value, str):
+                                    # Only docstring (Python 3.8+)
+                                    body_type = "docstring_only"
+                                elif isinstance(body[0].value, ast.Str):
+                                    # Only docstring (Python < 3.8)
+                                    body_type = "docstring_only"
                                 else:
                                     continue
                             else:
                                 continue
+                        else:
+                            continue
 
-                            # Extract code snippet
-                            start_line = item.lineno
-                            end_line = (
-                                getattr(item, "end_lineno", start_line) or start_line
-                            )
-                            code_snippet = "\n".join(lines[start_line - 1 : end_line])
-
-                            empty_methods.append(
-                                {
-                                    "method_name": item.name,
-                                    "class_name": node.name,
-                                    "line": start_line,
-                                    "body_type": body_type,
-                                    "code_snippet": code_snippet,
-                                    "is_abstract": is_abstract,
-                                }
-                            )
-        except SyntaxError:
-            pass
+                        # Extract code snippet
+                        start_line = item.lineno
+                        end_line = getattr(item, "end_lineno", start_line) or start_line
+                        code_snippet = "\n".join(lines[start_line - 1 : end_line])
+
+                        empty_methods.append(
+                            {
+                                "method_name": item.name,
+                                "class_name": node.name,
+                                "line": start_line,
+                                "body_type": body_type,
+                                "code_snippet": code_snippet,
+                                "is_abstract": is_abstract,
+                            }
+                        )
 
         return empty_methods
 
@@ -369,62 +390,62 @@ class ComprehensiveAnalyzer:
         """
         imports_not_at_top: List[Dict[str, Any]] = []
 
-        try:
-            tree = ast.parse(source_code, filename=str(file_path))
-            lines = source_code.split("\n")
-
-            # Find first non-import, non-docstring statement
-            first_non_import_line = None
-            for stmt in tree.body:
-                # Skip docstrings and imports
-                if isinstance(stmt, (ast.Import, ast.ImportFrom)):
-                    continue
-                if isinstance(stmt, ast.Expr):
-                    # Check if it's a docstring
-                    if isinstance(stmt.value, ast.Constant) and isinstance(
-                        stmt.value.value, str
-                    ):
-                        continue
-                    if isinstance(stmt.value, ast.Str):
-                        continue
-                first_non_import_line = stmt.lineno
-                break
+        tree = self._parse(file_path, source_code)
+        if tree is None:
+            return imports_not_at_top
 
-            # Check all imports at module level
-            for node in tree.body:
-                if isinstance(node, (ast.Import, ast.ImportFrom)):
-                    import_line = node.lineno
+        lines = source_code.split("\n")
 
-                    # Skip if import is at top (before first non-import)
-                    if first_non_import_line and import_line < first_non_import_line:
-                        continue
+        # Find first non-import, non-docstring statement
+        first_non_import_line = None
+        for stmt in tree.body:
+            # Skip docstrings and imports
+            if isinstance(stmt, (ast.Import, ast.ImportFrom)):
+                continue
+            if isinstance(stmt, ast.Expr):
+                # Check if it's a docstring
+                if isinstance(stmt.value, ast.Constant) and isinstance(
+                    stmt.value.value, str
+                ):
+                    continue
+                if isinstance(stmt.value, ast.Str):
+                    continue
+            first_non_import_line = stmt.lineno
+            break
 
-                    # Get import details
-                    if isinstance(node, ast.Import):
-                        import_names = [alias.name for alias in node.names]
-                        import_type = "import"
-                        module = None
-                    else:
-                        import_names = [alias.name for alias in node.names]
-                        import_type = "import_from"
-                        module = node.module
+        # Check all imports at module level
+        for node in tree.body:
+            if isinstance(node, (ast.Import, ast.ImportFrom)):
+                import_line = node.lineno
 
-                    for name in import_names:
-                        imports_not_at_top.append(
-                            {
-                                "line": import_line,
-                                "import_name": name,
-                                "module": module,
-                                "import_type": import_type,
-                                "code_snippet": (
-                                    lines[import_line - 1]
-                                    if import_line <= len(lines)
-                                    else ""
-                                ),
-                            }
-                        )
-        except SyntaxError:
-            pass
+                # Skip if import is at top (before first non-import)
+                if first_non_import_line and import_line < first_non_import_line:
+                    continue
+
+                # Get import details
+                if isinstance(node, ast.Import):
+                    import_names = [alias.name for alias in node.names]
+                    import_type = "import"
+                    module = None
+                else:
+                    import_names = [alias.name for alias in node.names]
+                    import_type = "import_from"
+                    module = node.module
+
+                for name in import_names:
+                    imports_not_at_top.append(
+                        {
+                            "line": import_line,
+                            "import_name": name,
+                            "module": module,
+                            "import_type": import_type,
+                            "code_snippet": (
+                                lines[import_line - 1]
+                                if import_line <= len(lines)
+                                else ""
+                            ),
+                        }
+                    )
 
         return imports_not_at_top
 
@@ -561,77 +582,75 @@ class ComprehensiveAnalyzer:
         """
         missing_docstrings: List[Dict[str, Any]] = []
 
-        try:
-            tree = ast.parse(source_code, filename=str(file_path))
-
-            # 1. Check file-level docstring
-            file_docstring = ast.get_docstring(tree)
-            if not file_docstring or not file_docstring.strip():
-                missing_docstrings.append(
-                    {
-                        "type": "file",
-                        "name": str(file_path),
-                        "line": 1,
-                        "context": "File-level docstring is missing",
-                    }
-                )
-
-            # 2. Check classes and methods
-            for node in ast.walk(tree):
-                if isinstance(node, ast.ClassDef):
-                    # Check class docstring
-                    class_docstring = ast.get_docstring(node)
-                    if not class_docstring or not class_docstring.strip():
-                        missing_docstrings.append(
-                            {
-                                "type": "class",
-                                "name": node.name,
-                                "line": node.lineno,
-                                "context": f"Class '{node.name}' is missing docstring",
-                            }
-                        )
+        tree = self._parse(file_path, source_code)
+        if tree is None:
+            return missing_docstrings
+
+        # 1. Check file-level docstring
+        file_docstring = ast.get_docstring(tree)
+        if not file_docstring or not file_docstring.strip():
+            missing_docstrings.append(
+                {
+                    "type": "file",
+                    "name": str(file_path),
+                    "line": 1,
+                    "context": "File-level docstring is missing",
+                }
+            )
+
+        # 2. Check classes and methods
+        for node in ast.walk(tree):
+            if isinstance(node, ast.ClassDef):
+                # Check class docstring
+                class_docstring = ast.get_docstring(node)
+                if not class_docstring or not class_docstring.strip():
+                    missing_docstrings.append(
+                        {
+                            "type": "class",
+                            "name": node.name,
+                            "line": node.lineno,
+                            "context": f"Class '{node.name}' is missing docstring",
+                        }
+                    )
 
-                    # Check methods in class
-                    for item in node.body:
-                        if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                            # Skip special methods (__init__, __str__, etc.) if they're empty
-                            # but still check if they have docstrings
-                            method_docstring = ast.get_docstring(item)
-                            if not method_docstring or not method_docstring.strip():
-                                # Skip if it's a property getter/setter/deleter
-                                is_property = any(
-                                    isinstance(d, ast.Name) and d.id == "property"
-                                    for d in item.decorator_list
+                # Check methods in class
+                for item in node.body:
+                    if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                        # Skip special methods (__init__, __str__, etc.) if they're empty
+                        # but still check if they have docstrings
+                        method_docstring = ast.get_docstring(item)
+                        if not method_docstring or not method_docstring.strip():
+                            # Skip if it's a property getter/setter/deleter
+                            is_property = any(
+                                isinstance(d, ast.Name) and d.id == "property"
+                                for d in item.decorator_list
+                            )
+                            if not is_property:
+                                missing_docstrings.append(
+                                    {
+                                        "type": "method",
+                                        "name": f"{node.name}.{item.name}",
+                                        "class_name": node.name,
+                                        "line": item.lineno,
+                                        "context": (
+                                            f"Method '{node.name}.{item.name}' "
+                                            f"is missing docstring"
+                                        ),
+                                    }
                                 )
-                                if not is_property:
-                                    missing_docstrings.append(
-                                        {
-                                            "type": "method",
-                                            "name": f"{node.name}.{item.name}",
-                                            "class_name": node.name,
-                                            "line": item.lineno,
-                                            "context": (
-                                                f"Method '{node.name}.{item.name}' "
-                                                f"is missing docstring"
-                                            ),
-                                        }
-                                    )
-
-            # 3. Check top-level functions (not in classes)
-            for node in tree.body:
-                if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                    function_docstring = ast.get_docstring(node)
-                    if not function_docstring or not function_docstring.strip():
-                        missing_docstrings.append(
-                            {
-                                "type": "function",
-                                "name": node.name,
-                                "line": node.lineno,
-                                "context": f"Function '{node.name}' is missing docstring",
-                            }
-                        )
 
-        except SyntaxError:
-            pass
+        # 3. Check top-level functions (not in classes)
+        for node in tree.body:
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                function_docstring = ast.get_docstring(node)
+                if not function_docstring or not function_docstring.strip():
+                    missing_docstrings.append(
+                        {
+                            "type": "function",
+                            "name": node.name,
+                            "line": node.lineno,
+                            "context": f"Function '{node.name}' is missing docstring",
+                        }
+                    )
 
         return missing_docstrings
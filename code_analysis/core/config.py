@@ -222,6 +222,27 @@ def get_driver_config(config: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     """
     Extract database driver configuration from full config.
 
+    Memoized per config snapshot when ``config`` is a ``load_raw_config`` result;
+    the returned dict is then shared and must not be mutated.
+
+    Args:
+        config: Full configuration dictionary
+
+    Returns:
+        Driver configuration dict with 'type' and 'config' keys, or None if not found
+    """
+    from .config_state import snapshot_for_config_data
+
+    snapshot = snapshot_for_config_data(config)
+    if snapshot is None:
+        return _build_driver_config(config)
+    return snapshot.derive("driver_config", _build_driver_config)
+
+
+def _build_driver_config(config: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Extract database driver configuration from full config (uncached).
+
     Looks for driver config in code_analysis.database.driver section.
     If not found, falls back to creating config from code_analysis.db_path.
 
@@ -18,6 +18,15 @@ in-process cache without re-parsing or re-validating. A failed validation is
 cached exactly as it occurred (its own ``valid=False`` outcome, not coerced to
 success) so a broken config stays reported broken until the file changes.
 
+Each cache entry is an immutable :class:`ConfigSnapshot` keyed on
+``(mtime_ns, size, inode)`` -- the inode catches an atomic replace
+(write-temp + rename) that lands within the same mtime tick at the same size.
+Views derived from the config (driver config, storage paths, docs_indexing,
+ignore patterns) are memoized on the snapshot via :meth:`ConfigSnapshot.derive`,
+so they are computed once per config version rather than once per command;
+:func:`snapshot_for_config_data` maps a ``load_raw_config`` result back to its
+snapshot for those helpers.
+
 Author: Vasiliy Zdanovskiy
 email: vasilyvz@gmail.com
 """
@@ -28,7 +37,7 @@ import logging
 import threading
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple, TypeVar, cast
 
 from code_analysis.core.config_errors import (
     format_config_json_error_report,
@@ -42,6 +51,8 @@ logger = logging.getLogger(__name__)
 
 ALLOWED_COMMANDS_WHEN_CONFIG_INVALID: FrozenSet[str] = frozenset({"help", "health"})
 
+_T = TypeVar("_T")
+
 
 @dataclass
 class ConfigRuntimeState:
@@ -168,14 +179,31 @@ def mark_config_invalid_from_exception(
 
 
 @dataclass(frozen=True)
-class _CachedConfigValidation:
-    """One process-cached ``revalidate_config_at_path`` outcome for one config path."""
+class ConfigSnapshot:
+    """One parsed and validated version of one ``config.json``.
+
+    ``config_data`` is shared by every caller served from this snapshot and must
+    be treated as read-only.
+    """
 
-    stat_key: Tuple[int, int]  # (mtime_ns, size) at the time this entry was built
+    path: Path
+    stat_key: Tuple[int, int, int]  # (mtime_ns, size, inode) when this was built
     config_data: Dict[str, Any]
     valid: bool
-    error_lines: List[str]
-    warning_lines: List[str]
+    error_lines: Tuple[str, ...]
+    warning_lines: Tuple[str, ...]
+    _derived: Dict[Any, Any] = field(default_factory=dict, compare=False, repr=False)
+
+    def derive(self, key: Any, build: Callable[[Dict[str, Any]], _T]) -> _T:
+        """Return ``build(config_data)``, computed at most once per ``key``.
+
+        Concurrent first calls may both build; the first stored value wins.
+        """
+        try:
+            return cast(_T, self._derived[key])
+        except KeyError:
+            pass
+        return cast(_T, self._derived.setdefault(key, build(self.config_data)))
 
 
 # Per-path validation cache: guarded by its own lock (separate from ``_lock`` above,
@@ -187,18 +215,28 @@ class _CachedConfigValidation:
 # change -- never a correctness issue, only a rare, bounded duplicate of work that
 # would have happened unconditionally before this cache existed.
 _validation_cache_lock = threading.Lock()
-_validation_cache: Dict[str, _CachedConfigValidation] = {}
+_validation_cache: Dict[str, ConfigSnapshot] = {}
+# id(config_data) -> snapshot, for the snapshots currently in ``_validation_cache``.
+_snapshot_by_data_id: Dict[int, ConfigSnapshot] = {}
 _config_validation_load_count = 0
 _config_validation_cache_hit_count = 0
 
 
-def _stat_key(path: Path) -> Optional[Tuple[int, int]]:
-    """Return ``(mtime_ns, size)`` for ``path``, or ``None`` if it cannot be stat'd."""
+def _stat_key(path: Path) -> Optional[Tuple[int, int, int]]:
+    """Return ``(mtime_ns, size, inode)`` for ``path``, or ``None`` if it cannot be stat'd."""
     try:
         st = path.stat()
     except OSError:
         return None
-    return (st.st_mtime_ns, st.st_size)
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+def snapshot_for_config_data(config_data: Any) -> Optional[ConfigSnapshot]:
+    """Return the cached snapshot whose ``config_data`` is this exact object, if any."""
+    snapshot = _snapshot_by_data_id.get(id(config_data))
+    if snapshot is not None and snapshot.config_data is config_data:
+        return snapshot
+    return None
 
 
 def get_config_validation_cache_diagnostics() -> Dict[str, int]:
@@ -221,20 +259,40 @@ def reset_config_validation_cache() -> None:
     global _config_validation_load_count, _config_validation_cache_hit_count
     with _validation_cache_lock:
         _validation_cache.clear()
+        _snapshot_by_data_id.clear()
         _config_validation_load_count = 0
         _config_validation_cache_hit_count = 0
 
 
-def revalidate_config_at_path(config_path: Path) -> tuple[Dict[str, Any], bool]:
+def _set_state_from_snapshot(snapshot: ConfigSnapshot) -> None:
+    """Publish a cached snapshot as the runtime state (no-op when already current)."""
+    global _state
+    with _lock:
+        if (
+            _state.last_config_data is snapshot.config_data
+            and _state.valid == snapshot.valid
+            and _state.config_path == snapshot.path
+        ):
+            return
+        _state = ConfigRuntimeState(
+            valid=snapshot.valid,
+            config_path=snapshot.path,
+            error_lines=list(snapshot.error_lines),
+            warning_lines=list(snapshot.warning_lines),
+            last_config_data=snapshot.config_data,
+        )
+
+
+def load_config_snapshot(config_path: Path) -> ConfigSnapshot:
     """
     Parse and semantically validate ``config.json``, cached per process.
 
-    Updates global runtime state. Returns ``(config_data, is_valid)``.
-    Raises ``ConfigJSONDecodeError`` on syntax failure (state marked invalid).
+    Updates global runtime state. Raises ``ConfigJSONDecodeError`` on syntax
+    failure (state marked invalid).
 
-    Cached on ``(resolved_path, mtime_ns, size)``: an unchanged file is served
-    from the in-process cache (no re-parse, no re-validate, no repeated
-    ``load_pem_private_key`` calls); editing the file (mtime/size change) always
+    Cached on ``(resolved_path, mtime_ns, size, inode)``: an unchanged file is
+    served from the in-process cache (no re-parse, no re-validate, no repeated
+    ``load_pem_private_key`` calls); editing or replacing the file always
     triggers a fresh parse+validate on the next call. A cache hit still refreshes
     the externally visible runtime state (:func:`get_config_runtime_state`) from
     the cached outcome, so callers observe identical behavior to an uncached call
@@ -256,14 +314,8 @@ def revalidate_config_at_path(config_path: Path) -> tuple[Dict[str, Any], bool]:
             else:
                 hit = None
         if hit is not None:
-            _set_state(
-                valid=hit.valid,
-                config_path=path,
-                error_lines=list(hit.error_lines),
-                warning_lines=list(hit.warning_lines),
-                config_data=hit.config_data,
-            )
-            return hit.config_data, hit.valid
+            _set_state_from_snapshot(hit)
+            return hit
 
     try:
         config_data = load_config_json(path)
@@ -287,23 +339,23 @@ def revalidate_config_at_path(config_path: Path) -> tuple[Dict[str, Any], bool]:
         valid = False
         error_lines = format_validation_error_report(results, config_path=path).splitlines()
 
-    _set_state(
-        valid=valid,
-        config_path=path,
-        error_lines=error_lines,
-        warning_lines=warning_lines,
+    snapshot = ConfigSnapshot(
+        path=path,
+        stat_key=stat_key or (0, 0, 0),
         config_data=config_data,
+        valid=valid,
+        error_lines=tuple(error_lines),
+        warning_lines=tuple(warning_lines),
     )
+    _set_state_from_snapshot(snapshot)
 
     if stat_key is not None:
         with _validation_cache_lock:
-            _validation_cache[path_key] = _CachedConfigValidation(
-                stat_key=stat_key,
-                config_data=config_data,
-                valid=valid,
-                error_lines=list(error_lines),
-                warning_lines=list(warning_lines),
-            )
+            previous = _validation_cache.get(path_key)
+            if previous is not None:
+                _snapshot_by_data_id.pop(id(previous.config_data), None)
+            _validation_cache[path_key] = snapshot
+            _snapshot_by_data_id[id(config_data)] = snapshot
             _config_validation_load_count += 1
 
     if valid:
@@ -313,9 +365,19 @@ def revalidate_config_at_path(config_path: Path) -> tuple[Dict[str, Any], bool]:
                 len(warning_lines),
                 "\n".join(f"  - {w}" for w in warning_lines),
             )
-        return config_data, True
+        return snapshot
 
     logger.error(
         "Configuration validation failed:\n%s", "\n".join(error_lines)
     )
-    return config_data, False
+    return snapshot
+
+
+def revalidate_config_at_path(config_path: Path) -> tuple[Dict[str, Any], bool]:
+    """
+    Parse and semantically validate ``config.json``, cached per process.
+
+    Returns ``(config_data, is_valid)`` of :func:`load_config_snapshot`.
+    """
+    snapshot = load_config_snapshot(config_path)
+    return snapshot.config_data, snapshot.valid
@@ -384,6 +384,13 @@ def validate_field_types_code_analysis_impl(
             file_watcher.get("ignore_patterns"),
             (list, type(None)),
         )
+        validate_field_type(
+            results,
+            "code_analysis",
+            "file_watcher.git_index_scan",
+            file_watcher.get("git_index_scan"),
+            (bool, type(None)),
+        )
         log_rotation = file_watcher.get("log_rotation", {})
         if log_rotation and isinstance(log_rotation, dict):
             validate_field_type(
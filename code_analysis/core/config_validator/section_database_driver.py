@@ -16,6 +16,7 @@ _WRITE_RETRY_CANONICAL = (
     "write_retry_jitter_seconds",
 )
 _TIMEOUT_CANONICAL = ("lock_timeout_seconds", "statement_timeout_seconds")
+_QUERY_LOG_FULL_POLICIES = ("block", "drop")
 
 
 def _is_number_non_bool(value: Any) -> bool:
@@ -291,6 +292,64 @@ def _validate_driver_pool_size_config(
             )
 
 
+def _validate_driver_query_log_config(
+    driver_config: Dict[str, Any], results: List[ValidationResult]
+) -> None:
+    """Validate async query journal keys under code_analysis.database.driver.config.
+
+    ``query_log_async`` / ``query_log_compress`` are booleans,
+    ``query_log_buffer_size`` is an integer >= 1, ``query_log_blob_min_bytes``
+    an integer >= 0 and ``query_log_full_policy`` one of ``block`` / ``drop``.
+    """
+    cfg_prefix = "code_analysis.database.driver.config"
+
+    for key in ("query_log_async", "query_log_compress"):
+        v = driver_config.get(key)
+        if v is not None and not isinstance(v, bool):
+            results.append(
+                ValidationResult(
+                    level="error",
+                    message=f"{cfg_prefix}.{key} must be a boolean, got {v!r}",
+                    section="code_analysis",
+                    key=f"database.driver.config.{key}",
+                    suggestion=f"Set {key} to true or false",
+                )
+            )
+
+    for key, lo in (("query_log_buffer_size", 1), ("query_log_blob_min_bytes", 0)):
+        v = driver_config.get(key)
+        if v is None:
+            continue
+        if not _is_int_non_bool(v) or v < lo:
+            results.append(
+                ValidationResult(
+                    level="error",
+                    message=(
+                        f"{cfg_prefix}.{key} must be an integer >= {lo} "
+                        f"(not bool, float, or string), got {v!r}"
+                    ),
+                    section="code_analysis",
+                    key=f"database.driver.config.{key}",
+                    suggestion=f"Set {key} to an integer of at least {lo}",
+                )
+            )
+
+    policy = driver_config.get("query_log_full_policy")
+    if policy is not None and policy not in _QUERY_LOG_FULL_POLICIES:
+        results.append(
+            ValidationResult(
+                level="error",
+                message=(
+                    f"{cfg_prefix}.query_log_full_policy must be one of "
+                    f"{', '.join(_QUERY_LOG_FULL_POLICIES)}, got {policy!r}"
+                ),
+                section="code_analysis",
+                key="database.driver.config.query_log_full_policy",
+                suggestion="Use 'block' (wait for the writer) or 'drop'",
+            )
+        )
+
+
 def validate_database_driver_section_impl(
     config_data: Dict[str, Any], results: List[ValidationResult]
 ) -> None:
@@ -454,6 +513,7 @@ def validate_database_driver_section_impl(
                     )
             _validate_driver_pool_size_config(driver_config, results)
             _validate_driver_retry_timeout_config(driver_config, results)
+            _validate_driver_query_log_config(driver_config, results)
 
     rpc = database.get("rpc")
     if rpc is not None and isinstance(rpc, dict):
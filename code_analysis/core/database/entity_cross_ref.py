@@ -6,7 +6,7 @@ email: vasilyvz@gmail.com
 """
 
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -14,6 +14,19 @@ logger = logging.getLogger(__name__)
 REF_TYPES = ("call", "instantiation", "attribute", "inherit")
 CALLER_TYPES = ("class", "method", "function")
 CALLEE_TYPES = ("class", "method", "function")
+CROSS_REF_COLUMNS = (
+    "caller_class_id",
+    "caller_method_id",
+    "caller_function_id",
+    "callee_class_id",
+    "callee_method_id",
+    "callee_function_id",
+    "ref_type",
+    "file_id",
+    "line",
+)
+# Rows per multi-row INSERT (9 params each, well under driver param limits).
+CROSS_REF_INSERT_CHUNK = 500
 
 
 def _fetchall(db: Any, sql: str, params: tuple) -> List[Dict[str, Any]]:
@@ -90,48 +103,90 @@ def add_entity_cross_ref(
     Raises:
         ValueError: If caller or callee triple is invalid.
     """
-    caller_count = sum(
-        x is not None for x in (caller_class_id, caller_method_id, caller_function_id)
-    )
-    callee_count = sum(
-        x is not None for x in (callee_class_id, callee_method_id, callee_function_id)
-    )
-    if caller_count != 1:
-        raise ValueError(
-            "Exactly one of caller_class_id, caller_method_id, caller_function_id must be set"
-        )
-    if callee_count != 1:
-        raise ValueError(
-            "Exactly one of callee_class_id, callee_method_id, callee_function_id must be set"
-        )
-    if ref_type not in REF_TYPES:
-        raise ValueError(f"ref_type must be one of {REF_TYPES!r}")
+    row = {
+        "caller_class_id": caller_class_id,
+        "caller_method_id": caller_method_id,
+        "caller_function_id": caller_function_id,
+        "callee_class_id": callee_class_id,
+        "callee_method_id": callee_method_id,
+        "callee_function_id": callee_function_id,
+        "ref_type": ref_type,
+        "file_id": file_id,
+        "line": line,
+    }
+    validate_entity_cross_ref_row(row)
 
     result = self.execute(
-        """
+        f"""
         INSERT INTO entity_cross_ref (
-            caller_class_id, caller_method_id, caller_function_id,
-            callee_class_id, callee_method_id, callee_function_id,
-            ref_type, file_id, line
+            {", ".join(CROSS_REF_COLUMNS)}
         ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
         """,
-        (
-            caller_class_id,
-            caller_method_id,
-            caller_function_id,
-            callee_class_id,
-            callee_method_id,
-            callee_function_id,
-            ref_type,
-            file_id,
-            line,
-        ),
+        tuple(row[c] for c in CROSS_REF_COLUMNS),
     )
     lastrowid = result.get("lastrowid") if isinstance(result, dict) else None
     assert lastrowid is not None
     return lastrowid
 
 
+def validate_entity_cross_ref_row(row: Dict[str, Any]) -> None:
+    """
+    Check one cross-ref row dict (keys: :data:`CROSS_REF_COLUMNS`).
+
+    Raises:
+        ValueError: Unless exactly one caller id and one callee id are set and
+            ``ref_type`` is one of :data:`REF_TYPES`.
+    """
+    for side in ("caller", "callee"):
+        ids = (row.get(f"{side}_{kind}_id") for kind in CALLER_TYPES)
+        if sum(x is not None for x in ids) != 1:
+            raise ValueError(
+                f"Exactly one of {side}_class_id, {side}_method_id, "
+                f"{side}_function_id must be set"
+            )
+    if row.get("ref_type") not in REF_TYPES:
+        raise ValueError(f"ref_type must be one of {REF_TYPES!r}")
+
+
+def add_entity_cross_refs(self, rows: Sequence[Dict[str, Any]]) -> int:
+    """
+    Insert many entity cross-reference rows with multi-row INSERT statements.
+
+    Each row is a dict keyed by :data:`CROSS_REF_COLUMNS` and is validated like
+    :func:`add_entity_cross_ref`. Statements of up to
+    :data:`CROSS_REF_INSERT_CHUNK` rows go through one ``execute_batch`` call
+    when the client has it (one round trip), else one ``execute`` each.
+
+    Args:
+        rows: Cross-ref rows to insert.
+
+    Returns:
+        Number of rows inserted.
+
+    Raises:
+        ValueError: If any row is invalid (nothing is written).
+    """
+    for row in rows:
+        validate_entity_cross_ref_row(row)
+    ops: List[Tuple[str, tuple]] = []
+    placeholders = "(" + ", ".join("?" * len(CROSS_REF_COLUMNS)) + ")"
+    for start in range(0, len(rows), CROSS_REF_INSERT_CHUNK):
+        chunk = rows[start : start + CROSS_REF_INSERT_CHUNK]
+        ops.append(
+            (
+                f"INSERT INTO entity_cross_ref ({', '.join(CROSS_REF_COLUMNS)}) "
+                f"VALUES {', '.join([placeholders] * len(chunk))}",
+                tuple(row.get(c) for row in chunk for c in CROSS_REF_COLUMNS),
+            )
+        )
+    if len(ops) > 1 and hasattr(self, "execute_batch"):
+        self.execute_batch(ops)
+    else:
+        for sql, params in ops:
+            self.execute(sql, params)
+    return len(rows)
+
+
 def get_dependencies_by_caller(
     self, caller_entity_type: str, caller_entity_id: int
 ) -> List[Dict[str, Any]]:
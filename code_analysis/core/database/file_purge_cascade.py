@@ -13,6 +13,7 @@ from __future__ import annotations
 from typing import Any, List, Sequence, Tuple, cast
 
 from code_analysis.core.database.logical_write_program import LogicalWriteProgramV1
+from code_analysis.core.shared_library_index import build_library_release_ops
 from code_analysis.core.sql_portable import database_has_sqlite_code_content_fts
 
 TEMP_PURGE_TABLE = "watcher_ignore_purge_ids"
@@ -153,6 +154,12 @@ def build_file_purge_sql_batch(
     ops.append(
         (f"DELETE FROM comprehensive_analysis_results WHERE file_id IN ({_PURGE})", ())
     )
+    ops.append(
+        (
+            f"DELETE FROM comprehensive_analysis_check_cache WHERE file_id IN ({_PURGE})",
+            (),
+        )
+    )
 
     ops.append(
         (
@@ -195,6 +202,8 @@ def build_file_purge_sql_batch(
         )
     )
 
+    ops.extend(build_library_release_ops(_PURGE))
+
     ops.append((f"DELETE FROM files WHERE id IN ({_PURGE})", ()))
 
     return ops
@@ -287,6 +296,13 @@ DELETE FROM entity_cross_ref WHERE
             (),
         )
     )
+    ops.append(
+        (
+            "DELETE FROM comprehensive_analysis_check_cache "
+            f"WHERE file_id IN ({purge_sel})",
+            (),
+        )
+    )
     ops.append(
         (
             "DELETE FROM file_tree_snapshot_nodes WHERE snapshot_id IN ("
@@ -325,6 +341,7 @@ DELETE FROM entity_cross_ref WHERE
             (pid,),
         )
     )
+    ops.extend(build_library_release_ops(purge_sel))
     ops.append((f"DELETE FROM files WHERE id IN ({purge_sel})", ()))
     return ops
 
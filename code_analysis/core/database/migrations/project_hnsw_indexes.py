@@ -0,0 +1,66 @@
+"""
+Create and drop per-project partial HNSW indexes on ``code_chunks.embedding_vec``.
+
+Author: Vasiliy Zdanovskiy
+email: vasilyvz@gmail.com
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+from code_analysis.core.pgvector_search import (
+    PROJECT_HNSW_INDEX_PREFIX,
+    plan_project_hnsw_indexes,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def migrate_project_hnsw_indexes(database: Any) -> None:
+    """Idempotent: bring the partial HNSW indexes in line with chunk counts.
+
+    Projects with at least ``PROJECT_HNSW_MIN_CHUNKS`` embedded chunks get
+    ``idx_code_chunks_emb_hnsw_p_<uuid hex>``; indexes of projects that shrank
+    below half of that, or no longer exist, are dropped (see
+    :func:`code_analysis.core.pgvector_search.plan_project_hnsw_indexes`).
+
+    Args:
+        database: Migration adapter exposing ``_fetchall(sql, params)`` and
+            ``_execute(sql, params)`` (same surface as the other modules in
+            this package). Its connection must be in autocommit mode: the
+            statements are ``CREATE/DROP INDEX CONCURRENTLY``.
+
+    Returns:
+        None. Failures are caught and logged, never raised; search then falls
+        back to the shared index.
+    """
+    try:
+        if not database._fetchall(
+            "SELECT 1 AS present FROM information_schema.columns "
+            "WHERE table_name = 'code_chunks' AND column_name = 'embedding_vec'"
+        ):
+            return
+        counts = {
+            str(row["project_id"]): int(row["n"] or 0)
+            for row in database._fetchall(
+                "SELECT project_id, COUNT(*) AS n FROM code_chunks "
+                "WHERE embedding_vec IS NOT NULL GROUP BY project_id"
+            )
+            if row.get("project_id") is not None
+        }
+        existing = [
+            str(row["indexname"])
+            for row in database._fetchall(
+                "SELECT indexname FROM pg_indexes "
+                "WHERE tablename = 'code_chunks' AND indexname LIKE ?",
+                (PROJECT_HNSW_INDEX_PREFIX.replace("_", "\\_") + "%",),
+            )
+        ]
+        creates, drops = plan_project_hnsw_indexes(counts, existing)
+        for sql in drops + creates:
+            logger.info("Project HNSW index: %s", sql.split(" ON ")[0])
+            database._execute(sql)
+    except Exception as exc:
+        logger.warning("Could not update per-project HNSW indexes: %s", exc)
@@ -0,0 +1,75 @@
+"""
+Create ``NOTIFY`` triggers that invalidate the project registry cache.
+
+Author: Vasiliy Zdanovskiy
+email: vasilyvz@gmail.com
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+NOTIFY_FUNCTION = "code_analysis_notify_project_registry"
+NOTIFY_TABLES = ("projects", "watch_dir_paths", "project_exclusive_locks")
+
+
+def notify_trigger_name(table: str) -> str:
+    """Return the name of the registry ``NOTIFY`` trigger on ``table``."""
+    return f"{table}_registry_notify"
+
+
+# Keep the channel name in sync with core/project_registry_cache.NOTIFY_CHANNEL.
+_FUNCTION_SQL = (
+    f"CREATE OR REPLACE FUNCTION {NOTIFY_FUNCTION}() RETURNS trigger AS $$\n"
+    "DECLARE\n"
+    "    rec RECORD;\n"
+    "    pid TEXT;\n"
+    "BEGIN\n"
+    "    IF TG_OP = 'DELETE' THEN rec := OLD; ELSE rec := NEW; END IF;\n"
+    "    IF TG_TABLE_NAME = 'projects' THEN\n"
+    "        pid := rec.id::text;\n"
+    "    ELSIF TG_TABLE_NAME = 'project_exclusive_locks' THEN\n"
+    "        pid := rec.project_id::text;\n"
+    "    END IF;\n"
+    "    PERFORM pg_notify(\n"
+    "        'code_analysis_project_registry',\n"
+    "        json_build_object('table', TG_TABLE_NAME, 'op', TG_OP,"
+    " 'project_id', pid)::text\n"
+    "    );\n"
+    "    RETURN NULL;\n"
+    "END;\n"
+    "$$ LANGUAGE plpgsql"
+)
+
+
+def migrate_project_registry_notify_triggers(database: Any) -> None:
+    """Idempotent: (re)create the registry ``NOTIFY`` function and row triggers.
+
+    ``projects`` and ``project_exclusive_locks`` notify with their project id;
+    ``watch_dir_paths`` notifies without one (listeners drop every entry, since
+    a watch-dir path change moves every project root under it).
+
+    Args:
+        database: Migration adapter exposing ``_execute(sql, params)`` and
+            ``_commit()`` (same surface as the other modules in this package).
+
+    Returns:
+        None. Failures are caught and logged, never raised; the cache then
+        only relies on its short fallback TTL.
+    """
+    try:
+        database._execute(_FUNCTION_SQL)
+        for table in NOTIFY_TABLES:
+            trigger = notify_trigger_name(table)
+            database._execute(f"DROP TRIGGER IF EXISTS {trigger} ON {table}")
+            database._execute(
+                f"CREATE TRIGGER {trigger} "
+                f"AFTER INSERT OR UPDATE OR DELETE ON {table} "
+                f"FOR EACH ROW EXECUTE FUNCTION {NOTIFY_FUNCTION}()"
+            )
+        database._commit()
+    except Exception as exc:
+        logger.warning("Could not create project registry notify triggers: %s", exc)
@@ -24,6 +24,7 @@ from code_analysis.core.project_root_path import (
     find_project_id_by_resolved_absolute_root,
     persist_projects_root_path_stored_value,
 )
+from code_analysis.core.shared_library_index import build_library_release_ops
 from code_analysis.core.vector_search_backend import uses_pgvector_ann_for_database
 
 from .watch_dirs_partition import (
@@ -487,6 +488,15 @@ async def clear_project_data(self, project_id: str) -> None:
         logger.warning(
             f"Failed to delete indexing_errors for project {project_id}: {e}"
         )
+    for table in (
+        "import_graph_edges",
+        "import_graph_nodes",
+        "comprehensive_analysis_check_cache",
+    ):
+        try:
+            self._execute(f"DELETE FROM {table} WHERE project_id = ?", (project_id,))
+        except Exception as e:
+            logger.warning(f"Failed to delete {table} for project {project_id}: {e}")
     try:
         self._execute(
             "DELETE FROM comprehensive_analysis_results WHERE project_id = ?",
@@ -580,6 +590,16 @@ async def clear_project_data(self, project_id: str) -> None:
             tuple(file_ids),
         )
 
+    try:
+        for sql, params in build_library_release_ops(
+            "SELECT id FROM files WHERE project_id = ?", (project_id,)
+        ):
+            self._execute(sql, params)
+    except Exception as e:
+        logger.warning(
+            f"Failed to release library_file_refs for project {project_id}: {e}"
+        )
+
     self._execute("DELETE FROM vector_index WHERE project_id = ?", (project_id,))
     self._execute("DELETE FROM files WHERE project_id = ?", (project_id,))
     self._execute("DELETE FROM projects WHERE id = ?", (project_id,))
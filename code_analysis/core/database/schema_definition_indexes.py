@@ -502,6 +502,34 @@ def get_schema_indexes() -> List[Dict[str, Any]]:
             "unique": False,
             "where_clause": None,
         },
+        {
+            "name": "idx_import_graph_edges_target",
+            "table": "import_graph_edges",
+            "columns": ["project_id", "target_file_id"],
+            "unique": False,
+            "where_clause": None,
+        },
+        {
+            "name": "idx_library_file_refs_library_file",
+            "table": "library_file_refs",
+            "columns": ["library_file_id"],
+            "unique": False,
+            "where_clause": None,
+        },
+        {
+            "name": "idx_library_file_refs_project",
+            "table": "library_file_refs",
+            "columns": ["project_id"],
+            "unique": False,
+            "where_clause": None,
+        },
+        {
+            "name": "idx_library_files_canonical",
+            "table": "library_files",
+            "columns": ["canonical_file_id"],
+            "unique": False,
+            "where_clause": None,
+        },
         {
             "name": "idx_project_activity_locks_lease_until",
             "table": "project_activity_locks",
@@ -9,7 +9,7 @@ from typing import Any, Dict
 
 
 def get_tables_rest() -> Dict[str, Any]:
-    """Return rest tables dict: code_duplicates, duplicate_occurrences, comprehensive_analysis_results, file_watcher_stats, vectorization_stats, indexing_errors, indexing_worker_stats, file_tree_snapshots, file_tree_snapshot_roots, file_tree_snapshot_nodes, project_activity_locks, client_sessions, session_file_locks, roles, role_permissions, session_roles."""
+    """Return rest tables dict: code_duplicates, duplicate_occurrences, comprehensive_analysis_results, comprehensive_analysis_check_cache, file_watcher_stats, vectorization_stats, indexing_errors, indexing_worker_stats, file_tree_snapshots, file_tree_snapshot_roots, file_tree_snapshot_nodes, project_activity_locks, client_sessions, session_file_locks, roles, role_permissions, session_roles."""
     return {
         "code_duplicates": {
             "columns": [
@@ -121,6 +121,33 @@ def get_tables_rest() -> Dict[str, Any]:
             "unique_constraints": [{"columns": ["file_id", "file_mtime"]}],
             "check_constraints": [],
         },
+        "comprehensive_analysis_check_cache": {
+            "columns": [
+                {"name": "file_id", "type": "UUID", "not_null": True},
+                {"name": "project_id", "type": "UUID", "not_null": True},
+                {"name": "check_name", "type": "TEXT", "not_null": True},
+                {"name": "content_sha256", "type": "TEXT", "not_null": True},
+                {"name": "tool_version", "type": "TEXT", "not_null": True},
+                {"name": "config_hash", "type": "TEXT", "not_null": True},
+                {"name": "result_json", "type": "TEXT", "not_null": True},
+                {
+                    "name": "updated_at",
+                    "type": "REAL",
+                    "not_null": False,
+                    "default": "julianday('now')",
+                },
+            ],
+            "foreign_keys": [
+                {
+                    "columns": ["file_id"],
+                    "references_table": "files",
+                    "references_columns": ["id"],
+                    "on_delete": "CASCADE",
+                },
+            ],
+            "unique_constraints": [{"columns": ["file_id", "check_name"]}],
+            "check_constraints": [],
+        },
         "file_watcher_stats": {
             "columns": [
                 {
@@ -450,6 +477,104 @@ def get_tables_rest() -> Dict[str, Any]:
             ],
             "check_constraints": [],
         },
+        "import_graph_nodes": {
+            "columns": [
+                {"name": "project_id", "type": "UUID", "not_null": True},
+                {"name": "file_id", "type": "UUID", "not_null": True},
+                {"name": "rel_path", "type": "TEXT", "not_null": True},
+                {"name": "source_updated_at", "type": "REAL", "not_null": False},
+                {"name": "scc_id", "type": "UUID", "not_null": False},
+            ],
+            "foreign_keys": [
+                {
+                    "columns": ["project_id"],
+                    "references_table": "projects",
+                    "references_columns": ["id"],
+                    "on_delete": "CASCADE",
+                },
+            ],
+            "unique_constraints": [{"columns": ["project_id", "file_id"]}],
+            "check_constraints": [],
+        },
+        "import_graph_edges": {
+            "columns": [
+                {"name": "project_id", "type": "UUID", "not_null": True},
+                {"name": "src_file_id", "type": "UUID", "not_null": True},
+                {"name": "ordinal", "type": "INTEGER", "not_null": True},
+                {"name": "module", "type": "TEXT", "not_null": False},
+                {"name": "name", "type": "TEXT", "not_null": False},
+                {"name": "import_type", "type": "TEXT", "not_null": False},
+                {"name": "kind", "type": "TEXT", "not_null": True},
+                {"name": "resolved_module", "type": "TEXT", "not_null": False},
+                {"name": "target_file_id", "type": "UUID", "not_null": False},
+            ],
+            "foreign_keys": [
+                {
+                    "columns": ["project_id"],
+                    "references_table": "projects",
+                    "references_columns": ["id"],
+                    "on_delete": "CASCADE",
+                },
+            ],
+            "unique_constraints": [
+                {"columns": ["project_id", "src_file_id", "ordinal"]}
+            ],
+            "check_constraints": [],
+        },
+        "library_files": {
+            "columns": [
+                {
+                    "name": "id",
+                    "type": "UUID",
+                    "not_null": True,
+                    "primary_key": True,
+                },
+                {"name": "dist_name", "type": "TEXT", "not_null": True},
+                {"name": "dist_version", "type": "TEXT", "not_null": True},
+                {"name": "relative_path", "type": "TEXT", "not_null": True},
+                {"name": "sha256", "type": "TEXT", "not_null": True},
+                {"name": "canonical_file_id", "type": "UUID", "not_null": False},
+                {
+                    "name": "created_at",
+                    "type": "REAL",
+                    "not_null": False,
+                    "default": "julianday('now')",
+                },
+            ],
+            "foreign_keys": [],
+            "unique_constraints": [
+                {"columns": ["dist_name", "dist_version", "relative_path", "sha256"]}
+            ],
+            "check_constraints": [],
+        },
+        "library_file_refs": {
+            "columns": [
+                {
+                    "name": "file_id",
+                    "type": "UUID",
+                    "not_null": True,
+                    "primary_key": True,
+                },
+                {"name": "project_id", "type": "UUID", "not_null": True},
+                {"name": "library_file_id", "type": "UUID", "not_null": True},
+                {
+                    "name": "created_at",
+                    "type": "REAL",
+                    "not_null": False,
+                    "default": "julianday('now')",
+                },
+            ],
+            "foreign_keys": [
+                {
+                    "columns": ["library_file_id"],
+                    "references_table": "library_files",
+                    "references_columns": ["id"],
+                    "on_delete": "CASCADE",
+                },
+            ],
+            "unique_constraints": [],
+            "check_constraints": [],
+        },
         "project_activity_locks": {
             "columns": [
                 {
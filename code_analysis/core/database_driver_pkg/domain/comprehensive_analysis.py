@@ -41,6 +41,10 @@ logger = logging.getLogger(__name__)
 # Type for one batch item: (file_id, project_id, file_mtime, results, summary)
 _ComprehensiveAnalysisItem = Tuple[int, str, float, Dict[str, Any], Dict[str, Any]]
 
+# Type for one check-cache item:
+# (file_id, project_id, check_name, content_sha256, tool_version, config_hash, result)
+_CheckCacheItem = Tuple[Any, str, str, str, str, str, Any]
+
 
 def should_analyze_file(
     driver: Any,
@@ -236,3 +240,104 @@ VALUES (?, ?, ?, ?, ?, {_now})
                     len(items),
                     rb,
                 )
+
+
+def get_check_cache_entries(
+    driver: Any,
+    file_ids: List[Any],
+) -> Dict[str, Dict[str, Dict[str, Any]]]:
+    """Load cached per-check results for ``file_ids`` in one query.
+
+    Returns ``{str(file_id): {check_name: entry}}`` where ``entry`` holds
+    ``content_sha256``, ``tool_version``, ``config_hash`` and the decoded
+    ``result``. Rows whose ``result_json`` does not decode are left out (the
+    check is simply re-run).
+    """
+    if not file_ids:
+        return {}
+    placeholders = ",".join("?" * len(file_ids))
+    result = driver.execute(
+        f"""
+        SELECT file_id, check_name, content_sha256, tool_version, config_hash,
+               result_json
+        FROM comprehensive_analysis_check_cache
+        WHERE file_id IN ({placeholders})
+        """,
+        tuple(file_ids),
+    )
+    data = result.get("data", []) if isinstance(result, dict) else []
+    entries: Dict[str, Dict[str, Dict[str, Any]]] = {}
+    for row in data or []:
+        try:
+            decoded = json.loads(row["result_json"])
+        except (json.JSONDecodeError, KeyError, TypeError) as e:
+            logger.debug(
+                "Ignoring cached %s result for file_id %s: %s",
+                row.get("check_name"),
+                row.get("file_id"),
+                e,
+            )
+            continue
+        entries.setdefault(str(row["file_id"]), {})[row["check_name"]] = {
+            "content_sha256": row["content_sha256"],
+            "tool_version": row["tool_version"],
+            "config_hash": row["config_hash"],
+            "result": decoded,
+        }
+    return entries
+
+
+def save_check_cache_entries(
+    driver: Any,
+    items: List[_CheckCacheItem],
+) -> None:
+    """Upsert per-check results (one row per file and check) in one transaction."""
+    if not items:
+        return
+    upsert_sql = """
+INSERT INTO comprehensive_analysis_check_cache
+(file_id, project_id, check_name, content_sha256, tool_version, config_hash, result_json)
+VALUES (?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (file_id, check_name) DO UPDATE SET
+project_id = EXCLUDED.project_id,
+content_sha256 = EXCLUDED.content_sha256,
+tool_version = EXCLUDED.tool_version,
+config_hash = EXCLUDED.config_hash,
+result_json = EXCLUDED.result_json,
+updated_at = EXCLUDED.updated_at
+"""
+    operations: List[Tuple[str, Optional[tuple]]] = []
+    for file_id, project_id, check_name, sha, version, config_hash, value in items:
+        operations.append(
+            (
+                upsert_sql,
+                (
+                    file_id,
+                    project_id,
+                    check_name,
+                    sha,
+                    version,
+                    config_hash,
+                    json.dumps(value, ensure_ascii=False),
+                ),
+            )
+        )
+    tid = driver.begin_transaction()
+    committed = False
+    try:
+        driver.execute_batch(operations, transaction_id=tid)
+        driver.commit_transaction(tid)
+        committed = True
+    except Exception as e:
+        logger.warning("save_check_cache_entries failed (n=%s): %s", len(items), e)
+        raise
+    finally:
+        if not committed:
+            try:
+                driver.rollback_transaction(tid)
+            except Exception as rb:
+                logger.warning(
+                    "save_check_cache_entries rollback failed (n=%s): %s",
+                    len(items),
+                    rb,
+                )
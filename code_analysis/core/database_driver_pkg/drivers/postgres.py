@@ -27,6 +27,7 @@ from .base import BaseDatabaseDriver, DbIdentity
 from .postgres_connection_pool import PostgreSQLConnectionPool
 from .postgres_execute_lane import (
     postgres_batch_requires_write_pool,
+    postgres_execute_requires_autocommit,
     postgres_execute_requires_write_pool,
 )
 from .postgres_migrations import ensure_postgres_schema
@@ -303,12 +304,43 @@ class PostgreSQLDriver(BaseDatabaseDriver):
                 backup_count = config.get(
                     "query_log_backup_count", DEFAULT_JOURNAL_BACKUP_COUNT
                 )
-                self._query_journal = QueryJournal(
-                    Path(query_log_path),
-                    max_bytes=max_bytes,
-                    backup_count=backup_count,
+                if config.get("query_log_async"):
+                    from ..query_journal_async import (
+                        DEFAULT_ASYNC_JOURNAL_BUFFER_SIZE,
+                        DEFAULT_JOURNAL_BLOB_MIN_BYTES,
+                        AsyncQueryJournal,
+                    )
+
+                    self._query_journal = AsyncQueryJournal(
+                        Path(query_log_path),
+                        max_bytes=max_bytes,
+                        backup_count=backup_count,
+                        buffer_size=int(
+                            config.get(
+                                "query_log_buffer_size",
+                                DEFAULT_ASYNC_JOURNAL_BUFFER_SIZE,
+                            )
+                        ),
+                        full_policy=str(config.get("query_log_full_policy", "block")),
+                        compress=bool(config.get("query_log_compress", False)),
+                        blob_min_bytes=int(
+                            config.get(
+                                "query_log_blob_min_bytes",
+                                DEFAULT_JOURNAL_BLOB_MIN_BYTES,
+                            )
+                        ),
+                    )
+                else:
+                    self._query_journal = QueryJournal(
+                        Path(query_log_path),
+                        max_bytes=max_bytes,
+                        backup_count=backup_count,
+                    )
+                logger.info(
+                    "Query journal enabled: %s (async=%s)",
+                    query_log_path,
+                    bool(config.get("query_log_async")),
                 )
-                logger.info("Query journal enabled: %s", query_log_path)
             self._pool = PostgreSQLConnectionPool(
                 self._connect_kwargs,
                 max_wait_seconds=self._pool_max_wait_seconds,
@@ -733,6 +765,8 @@ class PostgreSQLDriver(BaseDatabaseDriver):
             raise DriverOperationError("Database connection not established")
         if not self._pool:
             raise DriverOperationError("Database connection pool not initialized")
+        if postgres_execute_requires_autocommit(sql):
+            return self._execute_autocommit(sql, params)
         need_write = postgres_execute_requires_write_pool(sql)
         pool = self._pool
 
@@ -751,6 +785,25 @@ class PostgreSQLDriver(BaseDatabaseDriver):
 
         return self._run_self_managed_with_retry("execute", do_run)
 
+    def _execute_autocommit(self, sql: str, params: Optional[tuple]) -> Dict[str, Any]:
+        """Run ``CONCURRENTLY`` DDL on a short-lived autocommit connection.
+
+        A dedicated connection keeps a long index build from holding one of
+        the write pool slots; it is not retried (the statements are
+        ``IF [NOT] EXISTS`` and the caller's next pass picks them up again).
+        """
+        import psycopg
+
+        with psycopg.connect(**self._connect_kwargs, autocommit=True) as conn:
+            return run_execute(
+                conn,
+                sql,
+                params,
+                None,
+                self._query_journal,
+                self._schema_tables,
+            )
+
     def begin_transaction(self) -> str:
         """Return begin transaction."""
         if not self._transaction_manager:
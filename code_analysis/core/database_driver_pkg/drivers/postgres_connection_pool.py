@@ -83,6 +83,7 @@ import time
 from contextlib import contextmanager
 from typing import Any, Dict, Iterator, List, Optional
 
+from ...metrics import inc, observe
 from ..exceptions import DriverConnectionError, DriverOperationError
 
 logger = logging.getLogger(__name__)
@@ -243,6 +244,7 @@ class PostgreSQLConnectionPool:
                         break
                 if idx is not None:
                     elapsed = time.monotonic() - wait_started
+                    observe("code_analysis_pool_wait_seconds", elapsed, lane=lane)
                     if elapsed > 0.001:
                         logger.debug(
                             "Pool acquire(%s) got slot %d in %.3fs",
@@ -253,6 +255,7 @@ class PostgreSQLConnectionPool:
                     break
                 remaining = deadline - time.monotonic()
                 if remaining <= 0:
+                    inc("code_analysis_pool_timeouts_total", lane=lane)
                     raise DriverOperationError(
                         f"Pool acquire timeout: all {lane} connections busy for "
                         f"{self._max_wait_seconds:g}s"
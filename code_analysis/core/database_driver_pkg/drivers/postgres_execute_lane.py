@@ -27,6 +27,9 @@ _WRITE_STMT_HINT = re.compile(
     re.IGNORECASE | re.DOTALL,
 )
 
+# Statements PostgreSQL refuses inside a transaction block.
+_AUTOCOMMIT_STMT_HINT = re.compile(r"\bCONCURRENTLY\b", re.IGNORECASE)
+
 
 def _strip_sql_comments(sql: str) -> str:
     """Best-effort strip of -- and /* */ comments for classification."""
@@ -65,6 +68,18 @@ def postgres_execute_requires_write_pool(sql: str) -> bool:
     return False
 
 
+def postgres_execute_requires_autocommit(sql: str) -> bool:
+    """True if any statement in batched SQL must run outside a transaction.
+
+    ``CREATE INDEX CONCURRENTLY`` / ``DROP INDEX CONCURRENTLY`` fail with
+    "cannot run inside a transaction block" on the pooled connections.
+    """
+    for stmt in split_batch_sql(sql):
+        if _AUTOCOMMIT_STMT_HINT.search(_strip_sql_comments(stmt)):
+            return True
+    return False
+
+
 def postgres_batch_requires_write_pool(
     operations: List[Tuple[str, Optional[tuple]]],
 ) -> bool:
@@ -466,6 +466,54 @@ def _ensure_projects_root_path_migrations(conn: Any, schema_manager: Any) -> Non
         )
 
 
+def _ensure_project_registry_notify_triggers(conn: Any, schema_manager: Any) -> None:
+    """NOTIFY triggers for the command-preamble project registry cache."""
+    from code_analysis.core.database.migrations.project_registry_notify_triggers import (
+        migrate_project_registry_notify_triggers,
+    )
+
+    _rollback_conn(conn)
+    try:
+        migrate_project_registry_notify_triggers(
+            _PostgresConnMigrateAdapter(conn, schema_manager)
+        )
+    except Exception as exc:
+        _rollback_conn(conn)
+        logger.warning(
+            "PostgreSQL project registry notify triggers failed: %s",
+            exc,
+            exc_info=True,
+        )
+
+
+def _ensure_project_hnsw_indexes(conn: Any, schema_manager: Any) -> None:
+    """Per-project partial HNSW indexes for filtered pgvector search.
+
+    The indexes are built ``CONCURRENTLY``, which PostgreSQL only accepts
+    outside a transaction block, so the sweep runs with autocommit on.
+    """
+    from code_analysis.core.database.migrations.project_hnsw_indexes import (
+        migrate_project_hnsw_indexes,
+    )
+
+    _rollback_conn(conn)
+    try:
+        conn.autocommit = True
+        try:
+            migrate_project_hnsw_indexes(
+                _PostgresConnMigrateAdapter(conn, schema_manager)
+            )
+        finally:
+            conn.autocommit = False
+    except Exception as exc:
+        _rollback_conn(conn)
+        logger.warning(
+            "PostgreSQL per-project HNSW indexes failed: %s",
+            exc,
+            exc_info=True,
+        )
+
+
 _EMBEDDING_VEC_DIM_RE = re.compile(r"vector\((\d+)\)")
 
 
@@ -793,11 +841,13 @@ def _ensure_postgres_schema_once(
             add_sql="ALTER TABLE files ADD COLUMN editing_pid INTEGER DEFAULT NULL",
         )
         _ensure_pgvector_embedding_column(conn, vector_dim)
+        _ensure_project_hnsw_indexes(conn, PostgreSQLSchemaManager(conn))
         _ensure_watch_dirs_server_instance_partition(
             conn, PostgreSQLSchemaManager(conn)
         )
         _ensure_watch_dirs_deleted_column(conn, PostgreSQLSchemaManager(conn))
         _ensure_projects_root_path_migrations(conn, PostgreSQLSchemaManager(conn))
+        _ensure_project_registry_notify_triggers(conn, PostgreSQLSchemaManager(conn))
         conn.commit()
     except Exception as exc:
         _rollback_conn(conn)
@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import logging
 import re
+import time
 from dataclasses import replace
 from typing import Any, Dict, List, NoReturn, Optional, Tuple
 
@@ -20,6 +21,7 @@ from code_analysis.core.database.watch_dir_sql import (
     watch_dir_paths_upsert_null_norm_for_postgres_adapter,
     watch_dirs_upsert_norm_for_postgres_adapter,
 )
+from code_analysis.core.metrics import inc, observe, sql_fingerprint
 from code_analysis.core.sql_portable import sql_julian_timestamp_now_expr
 
 from ..exceptions import (
@@ -479,6 +481,20 @@ def _rows_to_dicts(cursor: Any) -> List[Dict[str, Any]]:
     return [dict(zip(cols, row)) for row in rows]
 
 
+def _record_sql_time(sql: str, started: float) -> None:
+    """Observe one statement's (or executemany run's) execution time."""
+    observe(
+        "code_analysis_sql_statement_seconds",
+        time.perf_counter() - started,
+        statement=sql_fingerprint(sql),
+    )
+
+
+def _record_sql_error(sql: str) -> None:
+    """Count a statement that raised."""
+    inc("code_analysis_sql_errors_total", statement=sql_fingerprint(sql))
+
+
 def run_execute(
     conn: Any,
     sql: str,
@@ -516,6 +532,7 @@ def run_execute(
             stmt = _maybe_append_returning(stmt, schema_tables)
 
             cursor = conn.cursor()
+            started = time.perf_counter()
             try:
                 if conv_params:
                     cursor.execute(stmt, conv_params)
@@ -545,8 +562,12 @@ def run_execute(
                         transaction_id=transaction_id,
                         success=True,
                     )
+            except Exception:
+                _record_sql_error(raw_stmt)
+                raise
             finally:
                 cursor.close()
+                _record_sql_time(raw_stmt, started)
 
         if not transaction_id:
             try:
@@ -621,6 +642,7 @@ def run_execute_batch(
                 )
                 stmt = _maybe_append_returning(stmt, schema_tables)
                 cursor = conn.cursor()
+                started = time.perf_counter()
                 try:
                     if bind_params:
                         cursor.execute(stmt, bind_params)
@@ -648,8 +670,12 @@ def run_execute_batch(
                             transaction_id=transaction_id,
                             success=True,
                         )
+                except Exception:
+                    _record_sql_error(sql)
+                    raise
                 finally:
                     cursor.close()
+                    _record_sql_time(sql, started)
             else:
                 sql, params_list = payload
                 if params_list is None:
@@ -664,12 +690,15 @@ def run_execute_batch(
                 else:
                     sql_pg = _adapt_sqlite_dml_for_postgres(sql)
                 cursor = conn.cursor()
+                started = time.perf_counter()
                 try:
                     try:
                         cursor.executemany(sql_pg, params_list)
                     except TransientDatabaseError:
+                        _record_sql_error(sql)
                         raise
                     except Exception as ie:
+                        _record_sql_error(sql)
                         if pg_errors and isinstance(ie, pg_errors.IntegrityError):
                             raise DriverOperationError(
                                 f"execute_batch failed: {ie}"
@@ -700,6 +729,7 @@ def run_execute_batch(
                             )
                 finally:
                     cursor.close()
+                    _record_sql_time(sql, started)
 
         if not transaction_id:
             try:
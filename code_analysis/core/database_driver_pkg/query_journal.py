@@ -8,6 +8,11 @@ with params (only success=True entries if replaying writes).
 Supports rotation: when file size reaches max_bytes, current file is rotated to
  .1, .2, ... and a new file is opened.
 
+Segments written by :class:`~.query_journal_async.AsyncQueryJournal` may also be
+zstd-compressed (``.N.zst``) and may reference large string params by content
+hash (``{"$journal_blob": "<sha256>"}``, stored under ``<journal>.blobs/``);
+:func:`replay_journal` reads both transparently.
+
 Author: Vasiliy Zdanovskiy
 email: vasilyvz@gmail.com
 """
@@ -21,7 +26,7 @@ import threading
 import uuid
 from datetime import date, datetime, time, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import IO, Any, Dict, List, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -39,10 +44,109 @@ def _journal_param_json(value: Any) -> Any:
     return value
 
 
+def _journal_params_json(
+    params: Optional[tuple | list | dict],
+) -> Optional[List[Any]] | Optional[Dict[str, Any]]:
+    """Serialize bound params for JSON (tuple/list/dict only)."""
+    if params is None:
+        return None
+    if isinstance(params, dict):
+        return {k: _journal_param_json(v) for k, v in params.items()}
+    return [_journal_param_json(v) for v in params]
+
+
+def journal_entry(
+    sql: str,
+    params_ser: Optional[List[Any]] | Optional[Dict[str, Any]],
+    *,
+    ts: datetime,
+    transaction_id: Optional[str] = None,
+    success: bool = True,
+    error: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Build one journal record (the JSON object written per line)."""
+    entry: Dict[str, Any] = {
+        "ts": ts.isoformat(),
+        "sql": sql,
+        "params": params_ser,
+        "success": success,
+    }
+    if transaction_id is not None:
+        entry["transaction_id"] = transaction_id
+    if error is not None:
+        entry["error"] = error
+    return entry
+
+
 # Default max size before rotation (100 MB)
 DEFAULT_JOURNAL_MAX_BYTES = 100 * 1024 * 1024
 DEFAULT_JOURNAL_BACKUP_COUNT = 5
 
+COMPRESSED_SEGMENT_SUFFIX = ".zst"
+JOURNAL_BLOB_KEY = "$journal_blob"
+
+
+def segment_path(journal_path: Path, index: int) -> Optional[Path]:
+    """Return the existing rotated segment ``.index`` (plain or ``.zst``), if any."""
+    plain = Path(f"{journal_path}.{index}")
+    if plain.exists():
+        return plain
+    compressed = Path(f"{plain}{COMPRESSED_SEGMENT_SUFFIX}")
+    if compressed.exists():
+        return compressed
+    return None
+
+
+def journal_segments(journal_path: str | Path) -> List[Path]:
+    """Return existing journal segments, oldest first (current file last)."""
+    base = Path(journal_path)
+    rotated: List[tuple[int, Path]] = []
+    for candidate in base.parent.glob(f"{base.name}.*"):
+        suffix = candidate.name[len(base.name) + 1 :]
+        if suffix.endswith(COMPRESSED_SEGMENT_SUFFIX):
+            suffix = suffix[: -len(COMPRESSED_SEGMENT_SUFFIX)]
+        if suffix.isdigit():
+            rotated.append((int(suffix), candidate))
+    segments = [p for _, p in sorted(rotated, key=lambda item: -item[0])]
+    if base.exists():
+        segments.append(base)
+    return segments
+
+
+def journal_blob_dir(journal_path: str | Path) -> Path:
+    """Return the blob directory shared by all segments of a journal."""
+    path = Path(journal_path)
+    name = path.name
+    if name.endswith(COMPRESSED_SEGMENT_SUFFIX):
+        name = name[: -len(COMPRESSED_SEGMENT_SUFFIX)]
+    stem, _, last = name.rpartition(".")
+    if stem and last.isdigit():
+        name = stem
+    return path.with_name(f"{name}.blobs")
+
+
+def shift_journal_segments(journal_path: Path, backup_count: int) -> Optional[int]:
+    """Rename ``.1 -> .2``, ... then current -> ``.1``; file must be closed.
+
+    Returns:
+        mtime (ns) of the segment that fell off the end, or None.
+    """
+    dropped_mtime_ns: Optional[int] = None
+    for i in range(backup_count - 1, 0, -1):
+        old = segment_path(journal_path, i)
+        if old is None:
+            continue
+        new = Path(f"{journal_path}.{i + 1}")
+        if old.name.endswith(COMPRESSED_SEGMENT_SUFFIX):
+            new = Path(f"{new}{COMPRESSED_SEGMENT_SUFFIX}")
+        existing = segment_path(journal_path, i + 1)
+        if existing is not None:
+            dropped_mtime_ns = existing.stat().st_mtime_ns
+            existing.unlink()
+        old.rename(new)
+    journal_path.rename(Path(f"{journal_path}.1"))
+    return dropped_mtime_ns
+
 
 class QueryJournal:
     """Append-only journal of SQL executions for logging and recovery, with rotation."""
@@ -83,15 +187,7 @@ class QueryJournal:
             if self._path.exists() and self._path.stat().st_size >= self._max_bytes:
                 self._file.close()
                 self._file = None
-                # Shift backups: .1 -> .2, .2 -> .3, ... then current -> .1
-                for i in range(self._backup_count - 1, 0, -1):
-                    old = Path(str(self._path) + f".{i}")
-                    new = Path(str(self._path) + f".{i + 1}")
-                    if old.exists():
-                        if new.exists():
-                            new.unlink()
-                        old.rename(new)
-                self._path.rename(Path(str(self._path) + ".1"))
+                shift_journal_segments(self._path, self._backup_count)
                 self._file = open(
                     self._path,
                     "a",
@@ -130,24 +226,14 @@ class QueryJournal:
                 return
             try:
                 self._rotate_if_needed()
-                # Serialize params for JSON (tuple/list/dict only)
-                params_ser: Optional[List[Any]] | Optional[Dict[str, Any]]
-                if params is None:
-                    params_ser = None
-                elif isinstance(params, dict):
-                    params_ser = {k: _journal_param_json(v) for k, v in params.items()}
-                else:
-                    params_ser = [_journal_param_json(v) for v in params]
-                entry: Dict[str, Any] = {
-                    "ts": datetime.now(timezone.utc).isoformat(),
-                    "sql": sql,
-                    "params": params_ser,
-                    "success": success,
-                }
-                if transaction_id is not None:
-                    entry["transaction_id"] = transaction_id
-                if error is not None:
-                    entry["error"] = error
+                entry = journal_entry(
+                    sql,
+                    _journal_params_json(params),
+                    ts=datetime.now(timezone.utc),
+                    transaction_id=transaction_id,
+                    success=success,
+                    error=error,
+                )
                 line = json.dumps(entry, ensure_ascii=False) + "\n"
                 self._file.write(line)
                 self._file.flush()
@@ -170,6 +256,25 @@ class QueryJournal:
         return self._path
 
 
+def _open_segment(path: Path) -> IO[str]:
+    """Open a journal segment for reading, decompressing ``.zst`` segments."""
+    if not path.name.endswith(COMPRESSED_SEGMENT_SUFFIX):
+        return open(path, "r", encoding="utf-8")
+    import zstandard
+
+    raw = open(path, "rb")
+    reader = zstandard.ZstdDecompressor().stream_reader(raw, closefd=True)
+    return io.TextIOWrapper(reader, encoding="utf-8")
+
+
+def _resolve_journal_blob(value: Any, blob_dir: Path) -> Any:
+    """Return the stored text for a ``{"$journal_blob": sha}`` param, else value."""
+    if isinstance(value, dict) and len(value) == 1 and JOURNAL_BLOB_KEY in value:
+        digest = str(value[JOURNAL_BLOB_KEY])
+        return (blob_dir / digest[:2] / digest).read_text(encoding="utf-8")
+    return value
+
+
 def replay_journal(
     journal_path: str | Path,
     execute_fn: Any,
@@ -180,23 +285,32 @@ def replay_journal(
     """Replay journal entries by calling execute_fn(sql, params) for each.
 
     Args:
-        journal_path: Path to .jsonl journal file.
+        journal_path: Path to a .jsonl journal segment (plain or ``.zst``).
         execute_fn: Callable(sql: str, params: Optional[tuple|dict]) -> None.
             Typically a database execute; params are passed as returned from JSON
-            (list -> tuple for positional, dict for named).
+            (list -> tuple for positional, dict for named), with externalized
+            blobs read back from the journal's blob directory.
         only_success: If True, replay only entries with success=True.
         limit: Max number of entries to replay (None = all).
 
     Returns:
-        Dict with keys: replayed (int), failed (int), errors (list of str).
+        Dict with keys: replayed (int), failed (int), errors (list of str),
+        dropped (int, entries the async writer reported as dropped).
     """
     path = Path(journal_path)
     if not path.exists():
-        return {"replayed": 0, "failed": 0, "errors": ["Journal file not found"]}
+        return {
+            "replayed": 0,
+            "failed": 0,
+            "errors": ["Journal file not found"],
+            "dropped": 0,
+        }
+    blob_dir = journal_blob_dir(path)
     replayed = 0
     failed = 0
+    dropped = 0
     errors: List[str] = []
-    with open(path, "r", encoding="utf-8") as f:
+    with _open_segment(path) as f:
         for line in f:
             if limit is not None and replayed + failed >= limit:
                 break
@@ -209,6 +323,9 @@ def replay_journal(
                 errors.append(f"Invalid JSON: {e}")
                 failed += 1
                 continue
+            if "dropped" in entry and "sql" not in entry:
+                dropped += int(entry.get("dropped") or 0)
+                continue
             if only_success and not entry.get("success", True):
                 continue
             sql = entry.get("sql")
@@ -218,18 +335,33 @@ def replay_journal(
                 continue
             params_raw = entry.get("params")
             params: Any
-            if params_raw is None:
-                params = None
-            elif isinstance(params_raw, dict):
-                params = params_raw
-            elif isinstance(params_raw, list):
-                params = tuple(params_raw)
-            else:
-                params = None
+            try:
+                if params_raw is None:
+                    params = None
+                elif isinstance(params_raw, dict):
+                    params = {
+                        k: _resolve_journal_blob(v, blob_dir)
+                        for k, v in params_raw.items()
+                    }
+                elif isinstance(params_raw, list):
+                    params = tuple(
+                        _resolve_journal_blob(v, blob_dir) for v in params_raw
+                    )
+                else:
+                    params = None
+            except OSError as e:
+                failed += 1
+                errors.append(f"{sql[:50]}...: missing journal blob: {e}")
+                continue
             try:
                 execute_fn(sql, params)
                 replayed += 1
             except Exception as e:
                 failed += 1
                 errors.append(f"{sql[:50]}...: {e}")
-    return {"replayed": replayed, "failed": failed, "errors": errors}
+    return {
+        "replayed": replayed,
+        "failed": failed,
+        "errors": errors,
+        "dropped": dropped,
+    }
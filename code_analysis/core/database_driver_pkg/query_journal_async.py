@@ -0,0 +1,338 @@
+"""
+Background group-commit writer for the query journal (optional).
+
+:class:`AsyncQueryJournal` has the same ``write`` / ``close`` / ``path`` surface
+as :class:`~.query_journal.QueryJournal`, but ``write`` only appends a record to
+a bounded in-memory buffer. A dedicated thread drains everything queued so far,
+serializes it, writes it and flushes once per group, so SQL execution no longer
+waits on a file flush per statement.
+
+- Rotation is driven by a byte counter (one ``stat`` when the file is opened),
+  not by ``flush`` + ``stat`` before every write.
+- String params of at least ``blob_min_bytes`` (UTF-8) are stored once per
+  content hash under ``<journal>.blobs/`` and journaled as
+  ``{"$journal_blob": "<sha256>"}``. Index writes otherwise repeat whole source
+  files (``cst_trees.cst_code``) in every entry. Blobs are touched on every
+  reference and removed once older than the last segment dropped by rotation.
+- With ``compress=True`` rotated segments are zstd-compressed to ``.N.zst``
+  (needs the ``zstandard`` package; without it segments stay plain).
+- When the buffer is full, ``full_policy="block"`` makes the caller wait for
+  space and ``"drop"`` discards the record. Drops are counted and written as a
+  ``{"ts": ..., "dropped": n}`` marker so gaps stay visible to replay.
+
+Enabled by ``query_log_async: true`` in ``code_analysis.database.driver.config``.
+
+Author: Vasiliy Zdanovskiy
+email: vasilyvz@gmail.com
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import deque
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import IO, Any, Deque, Dict, List, Optional, Tuple
+
+from .query_journal import (
+    COMPRESSED_SEGMENT_SUFFIX,
+    DEFAULT_JOURNAL_BACKUP_COUNT,
+    DEFAULT_JOURNAL_MAX_BYTES,
+    JOURNAL_BLOB_KEY,
+    _journal_param_json,
+    journal_blob_dir,
+    journal_entry,
+    shift_journal_segments,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ASYNC_JOURNAL_BUFFER_SIZE = 10_000
+DEFAULT_JOURNAL_BLOB_MIN_BYTES = 64 * 1024
+JOURNAL_FULL_POLICIES = ("block", "drop")
+
+# How long close() waits for the writer to drain before giving up.
+_CLOSE_TIMEOUT_SECONDS = 30.0
+
+_Record = Tuple[
+    datetime, str, Optional[tuple | list | dict], Optional[str], bool, Optional[str]
+]
+
+
+class AsyncQueryJournal:
+    """Query journal whose file I/O runs on a dedicated writer thread."""
+
+    def __init__(
+        self,
+        log_path: str | Path,
+        max_bytes: int = DEFAULT_JOURNAL_MAX_BYTES,
+        backup_count: int = DEFAULT_JOURNAL_BACKUP_COUNT,
+        *,
+        buffer_size: int = DEFAULT_ASYNC_JOURNAL_BUFFER_SIZE,
+        full_policy: str = "block",
+        compress: bool = False,
+        blob_min_bytes: int = DEFAULT_JOURNAL_BLOB_MIN_BYTES,
+    ) -> None:
+        """Open the journal file and start the writer thread.
+
+        Args:
+            log_path: Path to journal file (e.g. .jsonl). Parent dir is created if needed.
+            max_bytes: Rotate when the file reaches this size. 0 disables rotation.
+            backup_count: Number of rotated segments to keep (.1, .2, ...).
+            buffer_size: Max records waiting for the writer thread.
+            full_policy: ``"block"`` (wait for space) or ``"drop"`` when full.
+            compress: zstd-compress rotated segments.
+            blob_min_bytes: Externalize string params at least this large. 0 disables.
+        """
+        if full_policy not in JOURNAL_FULL_POLICIES:
+            raise ValueError(
+                f"full_policy must be one of {JOURNAL_FULL_POLICIES}, got {full_policy!r}"
+            )
+        if buffer_size < 1:
+            raise ValueError(f"buffer_size must be >= 1, got {buffer_size!r}")
+        self._path = Path(log_path).resolve()
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._max_bytes = max_bytes
+        self._backup_count = backup_count
+        self._buffer_size = buffer_size
+        self._full_policy = full_policy
+        self._blob_min_bytes = blob_min_bytes
+        self._blob_dir = journal_blob_dir(self._path)
+        self._zstd: Any = None
+        if compress:
+            try:
+                import zstandard
+
+                self._zstd = zstandard
+            except ImportError:
+                logger.warning(
+                    "query_log_compress requested but zstandard is not installed; "
+                    "rotated journal segments stay uncompressed"
+                )
+
+        self._file: Optional[IO[bytes]] = open(self._path, "ab")
+        self._size = self._path.stat().st_size
+
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+        self._pending: Deque[_Record] = deque()
+        self._closing = False
+        self._dropped_unreported = 0
+        self._stats: Dict[str, int] = {
+            "written": 0,
+            "dropped": 0,
+            "flushes": 0,
+            "rotations": 0,
+            "blobs_written": 0,
+        }
+        self._thread = threading.Thread(
+            target=self._run, name="query-journal-writer", daemon=True
+        )
+        self._thread.start()
+
+    def write(
+        self,
+        sql: str,
+        params: Optional[tuple | list | dict] = None,
+        transaction_id: Optional[str] = None,
+        success: bool = True,
+        error: Optional[str] = None,
+    ) -> None:
+        """Queue one journal entry; serialization and I/O happen on the writer thread.
+
+        Args:
+            sql: SQL statement.
+            params: Bound parameters (tuple, list, or dict); stored for replay.
+            transaction_id: Optional transaction ID for context.
+            success: Whether execution succeeded.
+            error: Error message if success is False.
+        """
+        if isinstance(params, list):
+            params = tuple(params)
+        elif isinstance(params, dict):
+            params = dict(params)
+        record: _Record = (
+            datetime.now(timezone.utc),
+            sql,
+            params,
+            transaction_id,
+            success,
+            error,
+        )
+        with self._lock:
+            if self._closing:
+                return
+            while len(self._pending) >= self._buffer_size:
+                if self._full_policy == "drop" or not self._thread.is_alive():
+                    self._dropped_unreported += 1
+                    self._stats["dropped"] += 1
+                    return
+                self._not_full.wait(timeout=1.0)
+                if self._closing:
+                    return
+            self._pending.append(record)
+            self._not_empty.notify()
+
+    def close(self) -> None:
+        """Drain queued entries, stop the writer thread and close the file."""
+        with self._lock:
+            if self._closing:
+                return
+            self._closing = True
+            self._not_empty.notify_all()
+            self._not_full.notify_all()
+        self._thread.join(timeout=_CLOSE_TIMEOUT_SECONDS)
+        if self._thread.is_alive():
+            logger.warning(
+                "Query journal writer did not drain within %.0fs; %d entries lost",
+                _CLOSE_TIMEOUT_SECONDS,
+                len(self._pending),
+            )
+            return
+        if self._file is not None:
+            try:
+                self._file.close()
+            except Exception:
+                pass
+            self._file = None
+
+    def stats(self) -> Dict[str, int]:
+        """Return writer counters plus the current queue depth."""
+        with self._lock:
+            return {**self._stats, "pending": len(self._pending)}
+
+    @property
+    def path(self) -> Path:
+        """Return journal file path."""
+        return self._path
+
+    def _run(self) -> None:
+        """Writer loop: take everything queued, write it, flush once."""
+        while True:
+            with self._lock:
+                while not self._pending and not self._closing:
+                    self._not_empty.wait()
+                batch: List[_Record] = list(self._pending)
+                self._pending.clear()
+                dropped = self._dropped_unreported
+                self._dropped_unreported = 0
+                closing = self._closing
+                self._not_full.notify_all()
+            if batch or dropped:
+                try:
+                    self._write_batch(batch, dropped)
+                except Exception as e:
+                    logger.warning("Query journal write failed: %s", e)
+            if closing:
+                return
+
+    def _write_batch(self, batch: List[_Record], dropped: int) -> None:
+        """Serialize and append one group of records, then flush."""
+        if self._file is None:
+            return
+        lines: List[bytes] = []
+        if dropped:
+            marker = {"ts": datetime.now(timezone.utc).isoformat(), "dropped": dropped}
+            lines.append(json.dumps(marker).encode("utf-8") + b"\n")
+        for ts, sql, params, transaction_id, success, error in batch:
+            entry = journal_entry(
+                sql,
+                self._params_json(params),
+                ts=ts,
+                transaction_id=transaction_id,
+                success=success,
+                error=error,
+            )
+            lines.append(json.dumps(entry, ensure_ascii=False).encode("utf-8") + b"\n")
+        for line in lines:
+            if self._max_bytes > 0 and self._size >= self._max_bytes:
+                self._rotate()
+            self._file.write(line)
+            self._size += len(line)
+        self._file.flush()
+        self._stats["written"] += len(batch)
+        self._stats["flushes"] += 1
+
+    def _params_json(
+        self, params: Optional[tuple | list | dict]
+    ) -> Optional[List[Any]] | Optional[Dict[str, Any]]:
+        """Serialize params, externalizing large strings by content hash."""
+        if params is None:
+            return None
+        if isinstance(params, dict):
+            return {k: self._param_json(v) for k, v in params.items()}
+        return [self._param_json(v) for v in params]
+
+    def _param_json(self, value: Any) -> Any:
+        """Return the JSON form of one top-level param."""
+        if (
+            self._blob_min_bytes > 0
+            and isinstance(value, str)
+            and len(value) * 4 >= self._blob_min_bytes
+        ):
+            data = value.encode("utf-8")
+            if len(data) >= self._blob_min_bytes:
+                return {JOURNAL_BLOB_KEY: self._store_blob(data)}
+        return _journal_param_json(value)
+
+    def _store_blob(self, data: bytes) -> str:
+        """Write ``data`` once per content hash (refreshing mtime on reuse)."""
+        digest = hashlib.sha256(data).hexdigest()
+        target = self._blob_dir / digest[:2] / digest
+        try:
+            os.utime(target)
+            return digest
+        except FileNotFoundError:
+            pass
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp = target.with_name(f"{digest}.{os.getpid()}.tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, target)
+        self._stats["blobs_written"] += 1
+        return digest
+
+    def _rotate(self) -> None:
+        """Close, shift and reopen the journal; compress and prune after."""
+        assert self._file is not None
+        self._file.close()
+        self._file = None
+        try:
+            dropped_mtime_ns = shift_journal_segments(self._path, self._backup_count)
+            self._stats["rotations"] += 1
+            if self._zstd is not None:
+                self._compress_segment(Path(f"{self._path}.1"))
+            if dropped_mtime_ns is not None:
+                self._prune_blobs(dropped_mtime_ns)
+        except Exception as e:
+            logger.warning("Query journal rotation failed: %s", e)
+        finally:
+            self._file = open(self._path, "ab")
+            self._size = self._path.stat().st_size
+
+    def _compress_segment(self, segment: Path) -> None:
+        """Replace ``segment`` with ``segment.zst``, keeping its mtime."""
+        target = Path(f"{segment}{COMPRESSED_SEGMENT_SUFFIX}")
+        st = segment.stat()
+        with open(segment, "rb") as src, open(target, "wb") as dst:
+            self._zstd.ZstdCompressor().copy_stream(src, dst)
+        os.utime(target, ns=(st.st_atime_ns, st.st_mtime_ns))
+        segment.unlink()
+
+    def _prune_blobs(self, older_than_ns: int) -> None:
+        """Remove blobs not referenced since before the dropped segment ended."""
+        if not self._blob_dir.is_dir():
+            return
+        for shard in self._blob_dir.iterdir():
+            if not shard.is_dir():
+                continue
+            for blob in shard.iterdir():
+                try:
+                    if blob.stat().st_mtime_ns < older_than_ns:
+                        blob.unlink()
+                except OSError:
+                    continue
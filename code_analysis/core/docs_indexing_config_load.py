@@ -37,6 +37,18 @@ def load_docs_indexing_from_config_path(config_path: Path) -> Optional[Dict[str,
             "Could not load raw config for docs_indexing from %s: %s", resolved, e
         )
         return None
+    from .config_state import snapshot_for_config_data
+
+    snapshot = snapshot_for_config_data(raw)
+    if snapshot is None:
+        di = _docs_indexing_from_config(raw)
+    else:
+        di = snapshot.derive("docs_indexing", _docs_indexing_from_config)
+    return dict(di) if di is not None else None
+
+
+def _docs_indexing_from_config(raw: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Return the enabled ``code_analysis.docs_indexing`` of ``raw``, or ``None``."""
     ca = raw.get("code_analysis") or {}
     if not isinstance(ca, dict):
         return None
@@ -11,6 +11,12 @@ from code_analysis.core.edit_session.edit_session import (
     SessionTreeValidity,
     get_active_session,
 )
+from code_analysis.core.edit_session.packed_session_repo import (
+    SESSION_REPO_BACKEND_LOOSE,
+    SESSION_REPO_BACKEND_PACKED,
+    PackedSessionRepo,
+    resolve_session_repo_backend,
+)
 from code_analysis.core.edit_session.session_repo import (
     ONE_COMMIT_PER_MUTATION_INVARIANT,
     SessionCommit,
@@ -26,6 +32,10 @@ __all__ = [
     "SESSION_VALID_TRUTH_INVARIANT",
     "SESSION_INVALID_TRUTH_INVARIANT",
     "SessionRepo",
+    "PackedSessionRepo",
+    "SESSION_REPO_BACKEND_LOOSE",
+    "SESSION_REPO_BACKEND_PACKED",
+    "resolve_session_repo_backend",
     "SessionCommit",
     "ONE_COMMIT_PER_MUTATION_INVARIANT",
 ]
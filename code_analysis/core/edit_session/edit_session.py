@@ -26,6 +26,11 @@ from code_analysis.core.edit_session.marker_cycle import (
     restore_marked_tree,
 )
 from code_analysis.core.edit_session.session_history import SessionHistory
+from code_analysis.core.edit_session.packed_session_repo import (
+    SESSION_REPO_BACKEND_PACKED,
+    PackedSessionRepo,
+    resolve_session_repo_backend,
+)
 from code_analysis.core.edit_session.session_repo import SessionRepo
 from code_analysis.core.tree_file_write import match_file_owner
 from code_analysis.core.search_session.tree_representation import sidecar_path_for
@@ -207,7 +212,12 @@ class EditSession:
         include_tree = (
             tree_validity == SessionTreeValidity.VALID and session_tree_path.is_file()
         )
-        session_repo = SessionRepo.init(
+        repo_cls = (
+            PackedSessionRepo
+            if resolve_session_repo_backend() == SESSION_REPO_BACKEND_PACKED
+            else SessionRepo
+        )
+        session_repo = repo_cls.init(
             repo_dir=session_dir,
             source_name=session_source_path.name,
             tree_name=session_tree_path.name,
@@ -296,8 +306,8 @@ class EditSession:
             self.session_tree_path.read_text(encoding="utf-8")
         )
         self.tree_validity = SessionTreeValidity.VALID
-        self.session_repo.commit_full(message="session: mutation")
-        self._record_history_commit(self.session_repo.log()[0].hash)
+        commit_hash = self.session_repo.commit_full(message="session: mutation")
+        self._record_history_commit(commit_hash)
 
     def _post_mutation_full(self) -> None:
         """Return post mutation full."""
@@ -309,8 +319,8 @@ class EditSession:
         self.tree_checksum = compute_content_checksum(
             self.session_tree_path.read_text(encoding="utf-8")
         )
-        self.session_repo.commit_full(message="session: mutation")
-        self._record_history_commit(self.session_repo.log()[0].hash)
+        commit_hash = self.session_repo.commit_full(message="session: mutation")
+        self._record_history_commit(commit_hash)
 
     def _post_mutation_degraded(self) -> None:
         """Return post mutation degraded."""
@@ -318,8 +328,10 @@ class EditSession:
             self.session_source_path.read_text(encoding="utf-8")
         )
         self.tree_checksum = None
-        self.session_repo.commit_degraded(message="session: plaintext mutation")
-        self._record_history_commit(self.session_repo.log()[0].hash)
+        commit_hash = self.session_repo.commit_degraded(
+            message="session: plaintext mutation"
+        )
+        self._record_history_commit(commit_hash)
 
     def _record_history_commit(self, commit_hash: str) -> None:
         """Return record history commit."""
@@ -467,8 +479,8 @@ class EditSession:
         self.tree_checksum = compute_content_checksum(
             self.session_tree_path.read_text(encoding="utf-8")
         )
-        self.session_repo.commit_full(message="session: revalidation")
-        self._record_history_commit(self.session_repo.log()[0].hash)
+        commit_hash = self.session_repo.commit_full(message="session: revalidation")
+        self._record_history_commit(commit_hash)
 
     def preview_external_write(self) -> dict[str, Any]:
         """Compute unified diffs of in-session artefacts vs live external files; no external writes."""
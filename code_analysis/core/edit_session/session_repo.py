@@ -22,7 +22,7 @@ from code_analysis.core.tree_lifecycle.node_id_map import (
 from code_analysis.tree.handler_registry import HandlerRegistry
 from dulwich.object_store import tree_lookup_path
 from dulwich.objects import Blob, Commit, Tree
-from dulwich.repo import Repo
+from dulwich.repo import BaseRepo, Repo
 
 ONE_COMMIT_PER_MUTATION_INVARIANT: str = (
     "Every mutation produces exactly one SessionRepo commit; "
@@ -51,7 +51,7 @@ class SessionRepo:
         source_name: str,
         tree_name: str,
         source_abs: Path,
-        repo: Repo,
+        repo: BaseRepo,
     ) -> None:
         """Initialize the instance."""
         self._repo_dir = repo_dir
@@ -87,25 +87,25 @@ class SessionRepo:
 
     def commit_full(self, *, message: str) -> str:
         """Stage source_name + tree_name; one commit (valid-tree {d003})."""
-        paths = [
-            str(self._repo_dir / self._source_name),
-            str(self._repo_dir / self._tree_name),
-        ]
-        porcelain.add(self._repo, paths=paths)
-        sha = porcelain.commit(
-            self._repo,
-            message=message.encode("utf-8"),
-            author=SESSION_COMMIT_IDENTITY,
-            committer=SESSION_COMMIT_IDENTITY,
+        return self._commit_names(
+            names=[self._source_name, self._tree_name], message=message
         )
-        return sha.decode("ascii")
 
     def commit_degraded(self, *, message: str) -> str:
         """Stage source_name only (invalid-tree DEGRADED {d003})."""
-        paths = [str(self._repo_dir / self._source_name)]
-        porcelain.add(self._repo, paths=paths)
+        return self._commit_names(names=[self._source_name], message=message)
+
+    def flush(self) -> None:
+        """Persist pending objects; no-op for the loose-object backend."""
+
+    def _commit_names(self, *, names: List[str], message: str) -> str:
+        """Stage ``names`` (relative to repo_dir) and create one commit."""
+        paths = [str(self._repo_dir / name) for name in names]
+        # The loose backend always wraps an on-disk Repo (see ``init``).
+        repo = cast(Repo, self._repo)
+        porcelain.add(repo, paths=paths)
         sha = porcelain.commit(
-            self._repo,
+            repo,
             message=message.encode("utf-8"),
             author=SESSION_COMMIT_IDENTITY,
             committer=SESSION_COMMIT_IDENTITY,
@@ -1,6 +1,10 @@
 """
 Entity cross-reference builder: resolve caller/callee from file+line and usages.
 
+Per file, caller spans and callee names are loaded once into in-memory indexes
+(:mod:`.entity_cross_ref_index`) and the resulting rows are inserted in one
+batch, so query count no longer grows with the number of usages.
+
 Author: Vasiliy Zdanovskiy
 email: vasilyvz@gmail.com
 """
@@ -9,10 +13,14 @@ import json
 import logging
 from typing import Any, Dict, List, Optional, Tuple
 
+from .database.entity_cross_ref import CROSS_REF_COLUMNS
 from .database.entity_cross_ref import add_entity_cross_ref as _add_entity_cross_ref
+from .database.entity_cross_ref import add_entity_cross_refs as _add_entity_cross_refs
 from .database.entity_cross_ref import (
     delete_entity_cross_ref_for_file as _delete_entity_cross_ref_for_file,
 )
+from .database.entity_cross_ref import validate_entity_cross_ref_row
+from .entity_cross_ref_index import EntitySpanIndex, ProjectEntityNames
 
 logger = logging.getLogger(__name__)
 
@@ -42,6 +50,8 @@ def resolve_caller(db: Any, file_id: Any, line: int) -> Optional[Tuple[str, int]
 
     Prefer smallest containing span: method > function > class.
     Uses end_line when present; if end_line is NULL, treats entity as single-line (line only).
+    Single-line form of :meth:`EntitySpanIndex.locate_many`, which
+    :func:`build_entity_cross_ref_for_file` uses for all usages of a file.
 
     Args:
         db: DB instance exposing the portable ``execute()`` (CodeDatabase or
@@ -52,63 +62,7 @@ def resolve_caller(db: Any, file_id: Any, line: int) -> Optional[Tuple[str, int]
     Returns:
         (entity_type, entity_id) e.g. ('method', 42), or None if not found.
     """
-    candidates: List[Tuple[str, int, int, int]] = []  # (type, id, start, end)
-
-    # Methods for this file (via classes)
-    rows = _fetchall(
-        db,
-        """
-        SELECT m.id, m.line, m.end_line
-        FROM methods m
-        JOIN classes c ON m.class_id = c.id
-        WHERE c.file_id = ?
-        """,
-        (file_id,),
-    )
-    for row in rows:
-        start = row["line"]
-        end = row["end_line"] if row["end_line"] is not None else row["line"]
-        if start <= line <= end:
-            candidates.append(("method", row["id"], start, end))
-
-    # Functions for this file
-    rows = _fetchall(
-        db,
-        "SELECT id, line, end_line FROM functions WHERE file_id = ?",
-        (file_id,),
-    )
-    for row in rows:
-        start = row["line"]
-        end = row["end_line"] if row["end_line"] is not None else row["line"]
-        if start <= line <= end:
-            candidates.append(("function", row["id"], start, end))
-
-    # Classes for this file
-    rows = _fetchall(
-        db,
-        "SELECT id, line, end_line FROM classes WHERE file_id = ?",
-        (file_id,),
-    )
-    for row in rows:
-        start = row["line"]
-        end = row["end_line"] if row["end_line"] is not None else row["line"]
-        if start <= line <= end:
-            candidates.append(("class", row["id"], start, end))
-
-    if not candidates:
-        return None
-
-    # Prefer smallest containing span; then order: method > function > class
-    def key(item: Tuple[str, int, int, int]) -> Tuple[int, int, int]:
-        """Return key."""
-        entity_type, entity_id, start, end = item
-        span = end - start
-        type_rank = {"method": 0, "function": 1, "class": 2}[entity_type]
-        return (span, type_rank, -start)
-
-    candidates.sort(key=key)
-    best = candidates[0]
-    return (best[0], best[1])
+    return EntitySpanIndex.load(db, file_id).locate(line)
 
 
 def resolve_callee(
@@ -123,7 +77,8 @@ def resolve_callee(
     """
     Resolve (target_type, target_name, target_class) to (entity_type, entity_id) in project.
 
-    Prefer same file_id when multiple matches.
+    Prefer same file_id when multiple matches. Single-usage form of
+    :meth:`ProjectEntityNames.resolve`.
 
     Args:
         db: DB instance exposing the portable execute() (CodeDatabase or DatabaseClient).
@@ -209,218 +164,165 @@ def _base_names_from_bases_raw(bases_raw: Any) -> Optional[List[str]]:
     return names
 
 
-def _resolve_unique_base_class_id(
-    db: Any, project_id: str, base_name: str
-) -> Optional[Any]:
+def _inheritance_cross_ref_rows(
+    db: Any, file_id: Any, project_id: str
+) -> List[Dict[str, Any]]:
     """
-    Resolve a base class name to a class id, project-wide, ONLY when unambiguous.
+    Build entity_cross_ref inheritance rows to/from this file's classes.
 
-    Unlike :func:`resolve_callee` (which breaks ties by preferring a same-file
-    match - fine for usages, but risks silently binding an inheritance edge to
-    the wrong same-named class when the real base lives in another file and an
-    unrelated class happens to share its name in the child's own file), this
-    resolves the base class by name across the whole project and returns a hit
-    ONLY when exactly one class with that name exists in the project. Zero or
-    more than one match -> unresolved (None), same "skip, do not guess"
-    convention as other unresolved callees in this module.
+    For each class defined in the file:
+    - Forward: resolves each base name in ``classes.bases`` (qualified names
+      reduced to the last segment, same convention as ``get_class_hierarchy``)
+      project-wide and adds a ``ref_type='inherit'`` row (this class = caller,
+      base = callee) ONLY when exactly one class with that name exists in the
+      project. Unlike :func:`resolve_callee` (which prefers a same-file match,
+      fine for usages), a same-named unrelated class in the child's own file
+      must not capture the edge; zero or ambiguous matches are skipped.
+    - Backward: any other class in the project that lists this class as a base
+      gets its edge too. ``update_indexes`` processes files in a fixed order
+      with no notion of base-before-derived, so a child indexed before its base
+      existed would otherwise never get the edge.
+
+    Project classes and the existing inherit edges of this file's classes are
+    read once (two SELECTs plus the file's own classes), not per class/base.
+    Edges already present, or produced earlier in this pass (base and child in
+    the same file), are not duplicated.
 
     Args:
         db: DB instance exposing the portable execute() (CodeDatabase or DatabaseClient).
-        project_id: Project id for scoping.
-        base_name: Simple (unqualified) base class name.
+        file_id: File id.
+        project_id: Project id for resolution.
 
     Returns:
-        The unique class id, or None if zero or ambiguous (>1) matches.
+        Cross-ref row dicts (see :data:`CROSS_REF_COLUMNS`) to insert.
     """
-    rows = _fetchall(
+    file_classes = _fetchall(
+        db,
+        "SELECT id, name, line, bases FROM classes WHERE file_id = ?",
+        (file_id,),
+    )
+    if not file_classes:
+        return []
+    project_classes = _fetchall(
         db,
         """
-        SELECT c.id FROM classes c
+        SELECT c.id, c.file_id, c.name, c.line, c.bases FROM classes c
         JOIN files f ON c.file_id = f.id
-        WHERE f.project_id = ? AND c.name = ?
+        WHERE f.project_id = ?
         """,
-        (project_id, base_name),
+        (project_id,),
     )
-    if len(rows) == 1:
-        return rows[0]["id"]
-    return None
-
+    ids_by_name: Dict[str, List[Any]] = {}
+    children_by_base: Dict[str, List[Dict[str, Any]]] = {}
+    for row in project_classes:
+        ids_by_name.setdefault(row["name"], []).append(row["id"])
+        for base_name in _base_names_from_bases_raw(row.get("bases")) or []:
+            children_by_base.setdefault(base_name, []).append(row)
+
+    class_ids = [row["id"] for row in file_classes]
+    marks = ",".join("?" * len(class_ids))
+    existing = {
+        (str(r["caller_class_id"]), str(r["callee_class_id"]))
+        for r in _fetchall(
+            db,
+            f"SELECT caller_class_id, callee_class_id FROM entity_cross_ref "
+            f"WHERE ref_type = 'inherit' AND (caller_class_id IN ({marks}) "
+            f"OR callee_class_id IN ({marks}))",
+            (*class_ids, *class_ids),
+        )
+    }
+
+    rows: List[Dict[str, Any]] = []
+
+    def add(child_id: Any, parent_id: Any, at_file: Any, line: Any) -> None:
+        """Queue one inherit edge unless it already exists."""
+        key = (str(child_id), str(parent_id))
+        if key in existing:
+            return
+        existing.add(key)
+        rows.append(
+            _cross_ref_row(
+                ("class", child_id), ("class", parent_id), "inherit", at_file, line
+            )
+        )
 
-def _inherit_edge_exists(db: Any, caller_class_id: Any, callee_class_id: Any) -> bool:
-    """True if a ``ref_type='inherit'`` entity_cross_ref row already links these classes."""
-    rows = _fetchall(
-        db,
-        "SELECT 1 FROM entity_cross_ref "
-        "WHERE caller_class_id = ? AND callee_class_id = ? AND ref_type = 'inherit'",
-        (caller_class_id, callee_class_id),
-    )
-    return bool(rows)
+    for row in file_classes:
+        class_id = row["id"]
+        for base_name in _base_names_from_bases_raw(row.get("bases")) or []:
+            candidates = ids_by_name.get(base_name, [])
+            if len(candidates) == 1:
+                add(class_id, candidates[0], file_id, row["line"])
+        class_name = row.get("name")
+        if class_name:
+            for child in children_by_base.get(class_name, []):
+                if str(child["id"]) != str(class_id):
+                    add(child["id"], class_id, child.get("file_id"), child.get("line"))
+    return rows
 
 
-def _backfill_children_inheritance_for_class(
-    db: Any, project_id: str, parent_class_id: Any, parent_name: str
+def _cross_ref_row(
+    caller: Tuple[str, Any],
+    callee: Tuple[str, Any],
+    ref_type: Any,
+    file_id: Any,
+    line: Any,
+) -> Dict[str, Any]:
+    """Cross-ref row dict for ``(entity_type, entity_id)`` caller and callee."""
+    row: Dict[str, Any] = dict.fromkeys(CROSS_REF_COLUMNS)
+    row[f"caller_{caller[0]}_id"] = caller[1]
+    row[f"callee_{callee[0]}_id"] = callee[1]
+    row.update(ref_type=ref_type, file_id=file_id, line=line)
+    return row
+
+
+def _write_cross_ref_rows(
+    db: Any, rows: List[Dict[str, Any]], file_id: Any, project_id: str
 ) -> int:
-    """
-    Retroactively add inherit edges FROM already-indexed children TO this class.
-
-    ``update_indexes`` processes a project's files in a fixed (sorted) order that
-    has no notion of base-before-derived; when a child's file is (re)indexed
-    before its base class exists in the DB, the forward resolution in
-    :func:`_add_inheritance_cross_ref_for_file` finds nothing for that base name
-    and skips the edge - and nothing else ever revisits that child once the base
-    class is indexed later in the same run. This closes that gap: every time a
-    class is (re)indexed, scan the project for OTHER classes whose ``bases``
-    reference this class's name and add the missing edge for each, regardless
-    of which file was processed first. Idempotent via :func:`_inherit_edge_exists`
-    so re-running (e.g. the base class file touched again later) never duplicates
-    an edge already present.
-
-    Args:
-        db: DB instance exposing the portable execute() (CodeDatabase or DatabaseClient).
-        project_id: Project id for scoping.
-        parent_class_id: Id of the class that may be a base of others.
-        parent_name: Simple (unqualified) name of that class.
-
-    Returns:
-        Number of entity_cross_ref rows added.
-    """
-    rows = _fetchall(
-        db,
-        """
-        SELECT c.id, c.file_id, c.line, c.bases FROM classes c
-        JOIN files f ON c.file_id = f.id
-        WHERE f.project_id = ? AND c.id != ?
-        """,
-        (project_id, parent_class_id),
-    )
+    """Insert ``rows`` in one batch; on failure fall back to row-by-row inserts."""
+    if not rows:
+        return 0
+    try:
+        return _add_entity_cross_refs(db, rows)
+    except Exception as e:
+        logger.warning(
+            "Batch entity_cross_ref insert failed for project_id=%s file_id=%s "
+            "(%d rows); retrying row by row: %s",
+            project_id,
+            file_id,
+            len(rows),
+            e,
+        )
     added = 0
     for row in rows:
-        base_names = _base_names_from_bases_raw(row.get("bases"))
-        if not base_names or parent_name not in base_names:
-            continue
-        child_id = row["id"]
-        if _inherit_edge_exists(db, child_id, parent_class_id):
-            continue
         try:
-            _add_entity_cross_ref(
-                db,
-                caller_class_id=child_id,
-                caller_method_id=None,
-                caller_function_id=None,
-                callee_class_id=parent_class_id,
-                callee_method_id=None,
-                callee_function_id=None,
-                ref_type="inherit",
-                file_id=row.get("file_id"),
-                line=row.get("line"),
-            )
+            _add_entity_cross_ref(db, **row)
             added += 1
         except Exception as e:
             logger.warning(
-                "Failed to backfill inheritance entity_cross_ref: child_class_id=%s "
-                "parent_class_id=%s project_id=%s file_id=%s line=%s: %s",
-                child_id,
-                parent_class_id,
+                "Failed to add entity_cross_ref: project_id=%s file_id=%s row=%s: %s",
                 project_id,
-                row.get("file_id"),
-                row.get("line"),
+                file_id,
+                row,
                 e,
                 exc_info=True,
             )
     return added
 
 
-def _add_inheritance_cross_ref_for_file(db: Any, file_id: int, project_id: str) -> int:
-    """
-    Build entity_cross_ref inheritance edges to/from this file's classes.
-
-    For each class defined in the file:
-    - Forward: resolves each base name in ``classes.bases`` (qualified names
-      reduced to the last segment, same convention as ``get_class_hierarchy``)
-      via :func:`_resolve_unique_base_class_id` (project-wide, unique-name-only)
-      and inserts a ``ref_type='inherit'`` row (this class = caller, base = callee).
-      Unresolved bases (external/stdlib, not found, or ambiguous - multiple
-      same-named classes in the project) are skipped.
-    - Backward: calls :func:`_backfill_children_inheritance_for_class` so any
-      already-indexed class elsewhere in the project that lists this class as a
-      base gets its edge filled in too - order-independent w.r.t. batch reindex.
-
-    Args:
-        db: DB instance exposing the portable execute() (CodeDatabase or DatabaseClient).
-        file_id: File id.
-        project_id: Project id for resolution.
-
-    Returns:
-        Number of entity_cross_ref rows added.
-    """
-    rows = _fetchall(
-        db,
-        "SELECT id, name, line, bases FROM classes WHERE file_id = ?",
-        (file_id,),
-    )
-    added = 0
-    for row in rows:
-        class_id = row["id"]
-        class_name = row.get("name")
-        line = row["line"]
-
-        base_names = _base_names_from_bases_raw(row.get("bases"))
-        for base_name in base_names or []:
-            callee_id = _resolve_unique_base_class_id(db, project_id, base_name)
-            if callee_id is None:
-                continue
-            # Another class in this same file, processed earlier in this loop,
-            # may already have backfilled this exact edge via
-            # _backfill_children_inheritance_for_class (e.g. base and child
-            # both defined in the file being indexed) - do not duplicate it.
-            if _inherit_edge_exists(db, class_id, callee_id):
-                continue
-            try:
-                _add_entity_cross_ref(
-                    db,
-                    caller_class_id=class_id,
-                    caller_method_id=None,
-                    caller_function_id=None,
-                    callee_class_id=callee_id,
-                    callee_method_id=None,
-                    callee_function_id=None,
-                    ref_type="inherit",
-                    file_id=file_id,
-                    line=line,
-                )
-                added += 1
-            except Exception as e:
-                logger.warning(
-                    "Failed to add inheritance entity_cross_ref: caller_class_id=%s "
-                    "base_name=%s callee_class_id=%s project_id=%s file_id=%s line=%s: %s",
-                    class_id,
-                    base_name,
-                    callee_id,
-                    project_id,
-                    file_id,
-                    line,
-                    e,
-                    exc_info=True,
-                )
-
-        if class_name:
-            added += _backfill_children_inheritance_for_class(
-                db, project_id, class_id, class_name
-            )
-    return added
-
-
 def build_entity_cross_ref_for_file(
     db: Any, file_id: Any, project_id: str, source_code: str
 ) -> int:
     """
     Build entity_cross_ref rows for a file from its usages and class inheritance.
 
-    Fetches usages for file_id, resolves caller and callee for each usage,
-    and inserts into entity_cross_ref when both are resolved. Also derives
-    inheritance edges from this file's classes.bases (see
-    :func:`_add_inheritance_cross_ref_for_file`). On failure for a single
-    usage/inheritance edge, logs and continues.
+    Fetches usages for file_id, resolves caller and callee for each usage in
+    memory (an :class:`EntitySpanIndex` of the file's entity spans and a
+    :class:`ProjectEntityNames` map of the names the usages refer to, each
+    loaded once per file), and keeps a row when both are resolved. Also
+    derives inheritance edges from this file's classes.bases (see
+    :func:`_inheritance_cross_ref_rows`). All rows are then written in one
+    batch (see :func:`_write_cross_ref_rows`). On failure for a single
+    usage, logs and continues.
 
     Note: this only runs on (re-)index of the file - existing projects only get
     inheritance rows once their files are re-indexed (update_indexes / file change),
@@ -430,7 +332,7 @@ def build_entity_cross_ref_for_file(
         db: DB instance exposing the portable execute() (CodeDatabase or DatabaseClient).
         file_id: File id (UUID string post-migration; ``Any`` since callers pass
             the real runtime id, not the legacy pre-migration ``int``).
-        project_id: Project id for resolve_callee.
+        project_id: Project id for callee resolution.
         source_code: Unused; for future context.
 
     Returns:
@@ -441,59 +343,33 @@ def build_entity_cross_ref_for_file(
         "SELECT line, usage_type, target_type, target_name, target_class FROM usages WHERE file_id = ?",
         (file_id,),
     )
-    added = 0
+    rows: List[Dict[str, Any]] = []
+    if usages:
+        callers = EntitySpanIndex.load(db, file_id).locate_many(
+            row["line"] for row in usages
+        )
+        callees = ProjectEntityNames.load(db, project_id, usages)
     for row in usages:
         line = row["line"]
         usage_type = row["usage_type"]
         target_type = row["target_type"]
         target_name = row["target_name"]
-        target_class = row.get("target_class")
 
-        # A single bad usage row (resolver or insert raising) must never abort
-        # the whole function - that would also skip the inheritance step below
-        # for the entire file, silently, with only a warning one level up in
-        # atomic.py ("do not fail the whole file update"). Wrap the full
-        # per-usage body, not just the insert.
+        # A single bad usage row must never abort the whole function - that
+        # would also skip the inheritance step below for the entire file,
+        # silently, with only a warning one level up in atomic.py ("do not
+        # fail the whole file update"). Invalid rows (e.g. an unknown
+        # usage_type) are dropped here so they cannot fail the batch insert.
         try:
-            caller = resolve_caller(db, file_id, line)
-            callee = resolve_callee(
-                db, project_id, file_id, line, target_type, target_name, target_class
+            caller = callers.get(line)
+            callee = callees.resolve(
+                file_id, target_type, target_name, row.get("target_class")
             )
             if caller is None or callee is None:
                 continue
-
-            caller_type, caller_id = caller
-            callee_type, callee_id = callee
-
-            caller_class_id = caller_method_id = caller_function_id = None
-            if caller_type == "class":
-                caller_class_id = caller_id
-            elif caller_type == "method":
-                caller_method_id = caller_id
-            else:
-                caller_function_id = caller_id
-
-            callee_class_id = callee_method_id = callee_function_id = None
-            if callee_type == "class":
-                callee_class_id = callee_id
-            elif callee_type == "method":
-                callee_method_id = callee_id
-            else:
-                callee_function_id = callee_id
-
-            _add_entity_cross_ref(
-                db,
-                caller_class_id=caller_class_id,
-                caller_method_id=caller_method_id,
-                caller_function_id=caller_function_id,
-                callee_class_id=callee_class_id,
-                callee_method_id=callee_method_id,
-                callee_function_id=callee_function_id,
-                ref_type=usage_type,
-                file_id=file_id,
-                line=line,
-            )
-            added += 1
+            xref = _cross_ref_row(caller, callee, usage_type, file_id, line)
+            validate_entity_cross_ref_row(xref)
+            rows.append(xref)
         except Exception as e:
             logger.warning(
                 "Failed to add usage-based entity_cross_ref: project_id=%s file_id=%s "
@@ -509,7 +385,7 @@ def build_entity_cross_ref_for_file(
             )
 
     try:
-        added += _add_inheritance_cross_ref_for_file(db, file_id, project_id)
+        rows.extend(_inheritance_cross_ref_rows(db, file_id, project_id))
     except Exception as e:
         logger.warning(
             "Failed to add inheritance entity_cross_ref for project_id=%s file_id=%s: %s",
@@ -518,7 +394,7 @@ def build_entity_cross_ref_for_file(
             e,
             exc_info=True,
         )
-    return added
+    return _write_cross_ref_rows(db, rows, file_id, project_id)
 
 
 def rebuild_entity_cross_ref_for_file(
@@ -0,0 +1,255 @@
+"""
+Line-offset index for large UTF-8 text files (line windows without a full read).
+
+Line reads (``get_file_lines``, text ``read``, preview drill-in) used to
+decode the whole file and ``splitlines()`` it to return a handful of lines.
+For files of at least :data:`LINE_INDEX_MIN_BYTES` this module scans the file
+once through ``mmap`` for ``\\n`` offsets and caches the result keyed by the
+stat fingerprint ``(st_dev, st_ino, st_size, st_mtime_ns)``. A window of lines
+is then one positioned read (``os.pread``) of exactly its byte span.
+
+The index is only used when byte-level ``\\n`` splitting equals
+``str.splitlines()`` of the decoded text: no lone ``\\r`` and none of the
+other separators ``splitlines`` honours (``\\v``, ``\\f``, ``\\x1c``-``\\x1e``,
+U+0085, U+2028, U+2029). Other files, small files and unreadable stats fall
+back to ``read_text`` + ``splitlines``, so results are identical either way.
+
+Author: Vasiliy Zdanovskiy
+email: vasilyvz@gmail.com
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import re
+import threading
+from array import array
+from bisect import bisect_right
+from collections import OrderedDict
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple
+
+LINE_INDEX_MIN_BYTES = 256 * 1024
+_MAX_CACHED_INDEXES = 32
+
+# Separators of str.splitlines() other than \n and \r\n (checked with find()).
+_EXTRA_LINE_BREAKS = (
+    b"\x0b",
+    b"\x0c",
+    b"\x1c",
+    b"\x1d",
+    b"\x1e",
+    b"\xc2\x85",
+    b"\xe2\x80\xa8",
+    b"\xe2\x80\xa9",
+)
+_NEWLINE = re.compile(rb"\n")
+_LONE_CR = re.compile(rb"\r(?!\n)")
+
+Fingerprint = Tuple[int, int, int, int]
+
+_cache_lock = threading.Lock()
+_cache: "OrderedDict[str, Tuple[Fingerprint, Optional[LineIndex]]]" = OrderedDict()
+
+
+def _fingerprint(st: os.stat_result) -> Fingerprint:
+    return (st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns)
+
+
+class LineIndex:
+    """Start offsets of every line of one file version.
+
+    ``line_starts[i]`` is the byte offset of line ``i + 1``; a final entry
+    equal to ``size`` (trailing newline) does not start a line.
+    ``nul_offset`` is the first NUL byte or -1.
+    """
+
+    __slots__ = ("fingerprint", "size", "line_starts", "nul_offset")
+
+    def __init__(
+        self,
+        fingerprint: Fingerprint,
+        size: int,
+        line_starts: array,
+        nul_offset: int,
+    ) -> None:
+        """Store an index built by :func:`build_line_index`."""
+        self.fingerprint = fingerprint
+        self.size = size
+        self.line_starts = line_starts
+        self.nul_offset = nul_offset
+
+    @property
+    def total_lines(self) -> int:
+        """Number of lines, as ``len(text.splitlines())``."""
+        starts = self.line_starts
+        return len(starts) - 1 if starts[-1] == self.size else len(starts)
+
+    def line_of_offset(self, offset: int) -> int:
+        """Return the 1-based line containing byte ``offset``."""
+        return bisect_right(self.line_starts, offset)
+
+    def line_span(self, start_line: int, end_line: int) -> Tuple[int, int]:
+        """Byte span ``[lo, hi)`` of 1-based lines ``start_line..end_line``."""
+        starts = self.line_starts
+        lo = starts[start_line - 1]
+        hi = starts[end_line] if end_line < len(starts) else self.size
+        return lo, hi
+
+    def read_lines(
+        self, fd: int, start_line: int, end_line: int
+    ) -> Optional[List[str]]:
+        """Read lines ``start_line..end_line`` from ``fd``; None on a short read."""
+        lo, hi = self.line_span(start_line, end_line)
+        data = os.pread(fd, hi - lo, lo)
+        if len(data) != hi - lo:
+            return None
+        return data.decode("utf-8", errors="replace").splitlines()
+
+
+def build_line_index(path: Path) -> Optional[LineIndex]:
+    """Scan ``path`` once through ``mmap``; None when bytes do not split like text."""
+    with open(path, "rb") as fh:
+        st = os.fstat(fh.fileno())
+        if st.st_size == 0:
+            return LineIndex(_fingerprint(st), 0, array("q", [0]), -1)
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if _LONE_CR.search(mm) is not None:
+                return None
+            if any(mm.find(sep) != -1 for sep in _EXTRA_LINE_BREAKS):
+                return None
+            starts = array("q", [0])
+            starts.extend(m.end() for m in _NEWLINE.finditer(mm))
+            return LineIndex(_fingerprint(st), st.st_size, starts, mm.find(b"\0"))
+
+
+def get_line_index(path: Path, min_bytes: Optional[int] = None) -> Optional[LineIndex]:
+    """Return the cached index of ``path`` or build it; None for small files.
+
+    Files under ``min_bytes`` (default :data:`LINE_INDEX_MIN_BYTES`) are cheaper
+    to read whole. None is also returned for files that must be split as
+    decoded text (see module docstring) and on stat/read errors; callers then
+    read the whole file.
+    """
+    key = str(path)
+    try:
+        st = os.stat(key)
+    except OSError:
+        return None
+    if st.st_size < (LINE_INDEX_MIN_BYTES if min_bytes is None else min_bytes):
+        return None
+    fingerprint = _fingerprint(st)
+    with _cache_lock:
+        cached = _cache.get(key)
+        if cached is not None and cached[0] == fingerprint:
+            _cache.move_to_end(key)
+            return cached[1]
+    try:
+        index = build_line_index(path)
+    except (OSError, ValueError):
+        return None
+    if index is not None and index.fingerprint != fingerprint:
+        return None
+    with _cache_lock:
+        _cache[key] = (fingerprint, index)
+        _cache.move_to_end(key)
+        while len(_cache) > _MAX_CACHED_INDEXES:
+            _cache.popitem(last=False)
+    return index
+
+
+def clear_line_index_cache() -> None:
+    """Drop every cached index."""
+    with _cache_lock:
+        _cache.clear()
+
+
+def iter_lines_containing(
+    path: Path, index: LineIndex, needle: bytes
+) -> Iterator[Tuple[int, str]]:
+    """Yield ``(line_number, line)`` once per line containing ``needle``.
+
+    Lines from the first one holding a NUL byte on are not searched (the
+    grep convention for binary content). ``needle`` must not contain ``\\n``
+    or ``\\r``. Yields nothing if the file is gone or no longer matches
+    ``index``.
+    """
+    try:
+        fh = open(path, "rb")
+    except OSError:
+        return
+    with fh:
+        if _fingerprint(os.fstat(fh.fileno())) != index.fingerprint:
+            return
+        if index.size == 0:
+            return
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            limit = index.size
+            if index.nul_offset >= 0:
+                nul_line = index.line_of_offset(index.nul_offset)
+                limit = index.line_starts[nul_line - 1]
+            pos = mm.find(needle, 0, limit)
+            while pos != -1:
+                line_no = index.line_of_offset(pos)
+                lo, hi = index.line_span(line_no, line_no)
+                line = mm[lo:hi].decode("utf-8", errors="replace")
+                yield line_no, line.rstrip("\r\n")
+                pos = mm.find(needle, hi, limit) if hi < limit else -1
+
+
+class TextLines:
+    """1-based line view of a text file, served from a :class:`LineIndex` if any."""
+
+    __slots__ = ("_path", "_index", "_lines")
+
+    def __init__(
+        self,
+        path: Path,
+        index: Optional[LineIndex] = None,
+        lines: Optional[List[str]] = None,
+    ) -> None:
+        """Use :func:`open_text_lines` rather than constructing directly."""
+        self._path = path
+        self._index = index
+        self._lines = lines
+
+    @property
+    def indexed(self) -> bool:
+        """True when windows are read through the line-offset index."""
+        return self._index is not None
+
+    @property
+    def total_lines(self) -> int:
+        """Number of lines, as ``len(text.splitlines())``."""
+        if self._index is not None:
+            return self._index.total_lines
+        return len(self._lines or [])
+
+    def window(self, start_line: int, end_line: int) -> List[str]:
+        """Return lines ``start_line..end_line`` (1-based, inclusive, in range)."""
+        index = self._index
+        if index is not None:
+            fd = os.open(self._path, os.O_RDONLY)
+            try:
+                if _fingerprint(os.fstat(fd)) == index.fingerprint:
+                    lines = index.read_lines(fd, start_line, end_line)
+                    if lines is not None:
+                        return lines
+            finally:
+                os.close(fd)
+            self._index = None
+            self._lines = _read_all_lines(self._path)
+        return (self._lines or [])[start_line - 1 : end_line]
+
+
+def _read_all_lines(path: Path) -> List[str]:
+    return path.read_text(encoding="utf-8", errors="replace").splitlines()
+
+
+def open_text_lines(path: Path) -> TextLines:
+    """Return a line view of ``path`` (raises ``OSError`` like ``read_text``)."""
+    index = get_line_index(path)
+    if index is not None:
+        return TextLines(path, index=index)
+    return TextLines(path, lines=_read_all_lines(path))
@@ -31,6 +31,7 @@ from .base import (
     standard_error_result,
 )
 from .diff_support import diff_data_for_text_mutation
+from .line_index import open_text_lines
 from .path_utils import ensure_parent_directories
 from .registry import HANDLER_TEXT, get_handler_schema
 from .text_ranges import (
@@ -81,9 +82,8 @@ def read_lines_range_ok(
 ) -> Dict[str, Any]:
     """Stable payload including clamped lines (read compat; clamp documented in MCP schema)."""
     ensure_text_suffix(str(absolute_path))
-    text = absolute_path.read_text(encoding="utf-8", errors="replace")
-    all_lines = text.splitlines(keepends=False)
-    total_lines = len(all_lines)
+    text_lines = open_text_lines(absolute_path)
+    total_lines = text_lines.total_lines
 
     if start_line > end_line:
         return {
@@ -114,7 +114,7 @@ def read_lines_range_ok(
         }
 
     low, high = clamp_read_range(start_line, end_line, total_lines)
-    slice_lines = all_lines[low - 1 : high]
+    slice_lines = text_lines.window(low, high)
     return {
         "success": True,
         "handler_id": HANDLER_TEXT,
@@ -0,0 +1,338 @@
+"""
+Git-index-assisted change source for the file watcher (optional).
+
+For a project root that carries its own ``.git`` directory, the tracked file
+list comes from the repository index instead of an ``os.walk`` over the whole
+tree. Tracked files get one ``stat`` each. Directories holding tracked files
+are only re-listed when their mtime changed since the previous cycle, which is
+how untracked files appear or vanish. That is the same idea as git's untracked
+cache. Untracked subdirectories are walked with the normal tree walk.
+
+The result is the same ``files`` map :func:`~.scanner._scan_tree_into_files`
+produces (same ignore, traversal and normalization rules via
+:func:`~.scanner.is_traversable_dir` / :func:`~.scanner.add_scanned_file`), so
+manifest, signature and delta code downstream are unchanged.
+
+:func:`scan_project_via_git_index` returns ``False`` and leaves ``files``
+untouched when the index cannot be used. Then the caller falls back to the
+normal walk. That happens when there is no ``.git`` directory, the index is
+missing or unreadable, or it has merge conflicts, skip-worktree / sparse
+entries, or submodules.
+
+Enabled by ``code_analysis.file_watcher.git_index_scan: true``.
+
+Author: Vasiliy Zdanovskiy
+email: vasilyvz@gmail.com
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import stat as stat_module
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import AbstractSet, Any, Dict, FrozenSet, List, Optional, Set, Tuple, Union
+
+from .scanner import (
+    _best_project_root_for_path,
+    _resolve_path_set,
+    _scan_tree_into_files,
+    add_scanned_file,
+    is_traversable_dir,
+)
+
+logger = logging.getLogger(__name__)
+
+CONFIG_KEY_GIT_INDEX_SCAN = "git_index_scan"
+
+_GITLINK_MODE = 0o160000
+
+_IndexFingerprint = Tuple[int, int, int]
+
+
+@dataclass
+class _DirListing:
+    """Untracked entries of one tracked directory at a given directory mtime."""
+
+    mtime_ns: int
+    untracked_files: Tuple[str, ...]
+    untracked_dirs: Tuple[str, ...]
+
+
+@dataclass
+class GitIndexScanState:
+    """Per-project state carried between watcher cycles."""
+
+    index_fingerprint: Optional[_IndexFingerprint] = None
+    tracked_files: Tuple[str, ...] = ()
+    tracked_dirs: FrozenSet[str] = frozenset()
+    dir_listings: Dict[str, _DirListing] = field(default_factory=dict)
+    last_stats: Dict[str, int] = field(default_factory=dict)
+
+
+def load_git_index_scan_enabled_from_config_path(config_path: Optional[Path]) -> bool:
+    """Return ``code_analysis.file_watcher.git_index_scan`` (default False)."""
+    if config_path is None:
+        return False
+    try:
+        from ..storage_paths import load_raw_config
+
+        raw = load_raw_config(Path(config_path))
+    except Exception as e:
+        logger.debug("Could not load config for git_index_scan: %s", e)
+        return False
+    ca = raw.get("code_analysis") or {}
+    fw = ca.get("file_watcher") if isinstance(ca, dict) else None
+    if not isinstance(fw, dict):
+        return False
+    return bool(fw.get(CONFIG_KEY_GIT_INDEX_SCAN))
+
+
+def _index_fingerprint(index_path: Path) -> Optional[_IndexFingerprint]:
+    """Return (mtime_ns, size, inode) of the index file, or None if absent."""
+    try:
+        st = os.stat(index_path)
+    except OSError:
+        return None
+    if not stat_module.S_ISREG(st.st_mode):
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+def _read_tracked_paths(index_path: Path) -> Optional[Tuple[str, ...]]:
+    """Return sorted tracked paths, or None when the index is unsupported."""
+    from dulwich.index import ConflictedIndexEntry, Index
+
+    try:
+        index = Index(str(index_path))
+    except Exception as e:
+        logger.debug("[GIT_INDEX_SCAN] unreadable index %s: %s", index_path, e)
+        return None
+    paths: List[str] = []
+    for raw_path, entry in index.items():
+        if isinstance(entry, ConflictedIndexEntry):
+            return None
+        if entry.skip_worktree or (entry.mode & 0o170000) == _GITLINK_MODE:
+            return None
+        try:
+            paths.append(raw_path.decode("utf-8"))
+        except UnicodeDecodeError:
+            return None
+    paths.sort()
+    return tuple(paths)
+
+
+def _parent_dirs(tracked: Tuple[str, ...]) -> FrozenSet[str]:
+    """Return every directory (POSIX, ``""`` = root) that holds tracked paths."""
+    dirs: Set[str] = {""}
+    for rel in tracked:
+        parent = rel.rpartition("/")[0]
+        while parent and parent not in dirs:
+            dirs.add(parent)
+            parent = parent.rpartition("/")[0]
+    return frozenset(dirs)
+
+
+def scan_project_via_git_index(
+    files: Dict[str, Dict[str, Any]],
+    project_root: Path,
+    watch_dirs_resolved: List[Union[str, Path]],
+    state: GitIndexScanState,
+    *,
+    ignore_patterns: Optional[List[str]] = None,
+    allowed_venv_py_files: Optional[Set[Path]] = None,
+    ignore_exception_files: Optional[Set[Path]] = None,
+    ignore_exception_patterns: Optional[List[str]] = None,
+    immediate_project_roots: Optional[AbstractSet[Path]] = None,
+    soft_deleted_project_roots: Optional[AbstractSet[Path]] = None,
+    docs_indexing: Optional[Dict[str, Any]] = None,
+) -> bool:
+    """
+    Fill ``files`` for ``project_root`` from the git index; False means "walk instead".
+
+    Args:
+        files: Mutable scan result map (absolute path -> file info).
+        project_root: Resolved project root containing ``.git``.
+        watch_dirs_resolved: Resolved watch directories for path normalization.
+        state: Per-project state reused across cycles (mutated).
+        ignore_patterns: Glob patterns to ignore.
+        allowed_venv_py_files: Allowlisted venv ``.py`` paths.
+        ignore_exception_files: Force-include paths from config exceptions.
+        ignore_exception_patterns: Glob patterns for ignore exceptions.
+        immediate_project_roots: Known project roots (for ``test_data`` exemption).
+        soft_deleted_project_roots: Project subtrees excluded from traversal.
+        docs_indexing: Optional docs-indexing config snapshot.
+
+    Returns:
+        True when ``files`` was filled from the index; False to fall back.
+    """
+    git_dir = project_root / ".git"
+    if not git_dir.is_dir():
+        return False
+    index_path = git_dir / "index"
+    fingerprint = _index_fingerprint(index_path)
+    if fingerprint is None:
+        return False
+    if fingerprint != state.index_fingerprint:
+        tracked = _read_tracked_paths(index_path)
+        if tracked is None:
+            state.index_fingerprint = None
+            return False
+        state.index_fingerprint = fingerprint
+        state.tracked_files = tracked
+        state.tracked_dirs = _parent_dirs(tracked)
+        # Index membership changed: cached "untracked" listings may be stale.
+        state.dir_listings.clear()
+
+    resolved_roots = _resolve_path_set(immediate_project_roots)
+    resolved_soft_deleted = _resolve_path_set(soft_deleted_project_roots)
+    dir_filters: Dict[str, Any] = {
+        "ignore_patterns": ignore_patterns,
+        "allowed_venv_py_files": allowed_venv_py_files,
+        "ignore_exception_files": ignore_exception_files,
+        "ignore_exception_patterns": ignore_exception_patterns,
+        "docs_indexing": docs_indexing,
+    }
+
+    traversable: Dict[str, bool] = {"": True}
+    for rel_dir in sorted(state.tracked_dirs, key=lambda d: (d.count("/"), d)):
+        if rel_dir == "":
+            continue
+        parent = rel_dir.rpartition("/")[0]
+        abs_dir = project_root / rel_dir
+        # os.walk never descends through symlinked directories.
+        traversable[rel_dir] = (
+            traversable.get(parent, False)
+            and not abs_dir.is_symlink()
+            and is_traversable_dir(
+                abs_dir,
+                project_root,
+                immediate_project_roots=resolved_roots,
+                soft_deleted_project_roots=resolved_soft_deleted,
+                project_root=_best_project_root_for_path(
+                    abs_dir.parent, resolved_roots, project_root
+                ),
+                **dir_filters,
+            )
+        )
+
+    scanned: Dict[str, Dict[str, Any]] = {}
+    stats = {
+        "tracked": 0,
+        "untracked": 0,
+        "dirs_relisted": 0,
+        "untracked_dirs_walked": 0,
+    }
+
+    def _add(item: Path) -> None:
+        add_scanned_file(
+            scanned,
+            item,
+            watch_dirs_resolved,
+            project_root=_best_project_root_for_path(
+                item, resolved_roots, project_root
+            ),
+            **dir_filters,
+        )
+
+    for rel in state.tracked_files:
+        if not traversable.get(rel.rpartition("/")[0], False):
+            continue
+        stats["tracked"] += 1
+        _add(project_root / rel)
+
+    tracked_set = set(state.tracked_files)
+    live_listings: Dict[str, _DirListing] = {}
+    for rel_dir, is_walked in traversable.items():
+        if not is_walked:
+            continue
+        abs_dir = project_root / rel_dir if rel_dir else project_root
+        listing = _dir_listing(
+            abs_dir, rel_dir, state, tracked_set, state.tracked_dirs, stats
+        )
+        if listing is None:
+            continue
+        live_listings[rel_dir] = listing
+        for name in listing.untracked_files:
+            stats["untracked"] += 1
+            _add(abs_dir / name)
+        for name in listing.untracked_dirs:
+            sub_dir = abs_dir / name
+            if not is_traversable_dir(
+                sub_dir,
+                project_root,
+                immediate_project_roots=resolved_roots,
+                soft_deleted_project_roots=resolved_soft_deleted,
+                project_root=_best_project_root_for_path(
+                    abs_dir, resolved_roots, project_root
+                ),
+                **dir_filters,
+            ):
+                continue
+            stats["untracked_dirs_walked"] += 1
+            _scan_tree_into_files(
+                scanned,
+                sub_dir,
+                watch_dirs_resolved,
+                immediate_project_roots=(resolved_roots or set()) | {project_root},
+                soft_deleted_project_roots=resolved_soft_deleted,
+                **dir_filters,
+            )
+
+    state.dir_listings = live_listings
+    state.last_stats = stats
+    files.update(scanned)
+    logger.debug(
+        "[GIT_INDEX_SCAN] root=%s tracked=%s untracked=%s dirs_relisted=%s "
+        "untracked_dirs_walked=%s",
+        project_root,
+        stats["tracked"],
+        stats["untracked"],
+        stats["dirs_relisted"],
+        stats["untracked_dirs_walked"],
+    )
+    return True
+
+
+def _dir_listing(
+    abs_dir: Path,
+    rel_dir: str,
+    state: GitIndexScanState,
+    tracked_files: AbstractSet[str],
+    tracked_dirs: AbstractSet[str],
+    stats: Dict[str, int],
+) -> Optional[_DirListing]:
+    """Return untracked entries of ``abs_dir``; re-list only when its mtime changed."""
+    try:
+        mtime_ns = os.stat(abs_dir).st_mtime_ns
+    except OSError:
+        return None
+    cached = state.dir_listings.get(rel_dir)
+    if cached is not None and cached.mtime_ns == mtime_ns:
+        return cached
+    stats["dirs_relisted"] += 1
+    prefix = f"{rel_dir}/" if rel_dir else ""
+    untracked_files: List[str] = []
+    untracked_dirs: List[str] = []
+    try:
+        with os.scandir(abs_dir) as entries:
+            for entry in entries:
+                rel = prefix + entry.name
+                try:
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                except OSError:
+                    continue
+                if is_dir:
+                    if rel not in tracked_dirs:
+                        untracked_dirs.append(entry.name)
+                elif rel not in tracked_files:
+                    untracked_files.append(entry.name)
+    except OSError as e:
+        logger.debug("[GIT_INDEX_SCAN] cannot list %s: %s", abs_dir, e)
+        return None
+    return _DirListing(
+        mtime_ns=mtime_ns,
+        untracked_files=tuple(sorted(untracked_files)),
+        untracked_dirs=tuple(sorted(untracked_dirs)),
+    )
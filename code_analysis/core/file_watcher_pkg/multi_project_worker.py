@@ -94,6 +94,9 @@ class MultiProjectFileWatcherWorker:
         # Last-seen per-project (db_signature, policy_stamp) for the pre-scan
         # ignore-purge gate (bug 5b663fbb cost fix); see purge_gate_signature.py.
         self._purge_signature_cache: Dict[str, Any] = {}
+        # Per-project git-index scan state (index fingerprint, tracked paths,
+        # per-directory untracked listings); see git_index_scan.py.
+        self._git_index_scan_states: Dict[str, Any] = {}
 
     def stop(self) -> None:
         """Stop the worker."""
@@ -106,6 +106,7 @@ async def run_scan_cycle(worker: Any, database: Any, processors: Any) -> Dict[st
             config_path=scan_config_path,
             manifest_signature_cache=getattr(worker, "_manifest_signature_cache", None),
             purge_signature_cache=getattr(worker, "_purge_signature_cache", None),
+            git_index_scan_states=getattr(worker, "_git_index_scan_states", None),
         )
         watch_dir_duration = time.time() - watch_dir_start
 
@@ -10,7 +10,8 @@ from __future__ import annotations
 import logging
 import uuid
 from pathlib import Path
-from typing import Any, Dict, Optional, Sequence, Set, Tuple
+from typing import (Any, Dict, Iterable, Iterator, Optional, Sequence, Set,
+                    Tuple, TypeVar)
 
 from code_analysis.core.database.files.trash_standalone_support import (
     clear_file_data_via_driver,
@@ -25,6 +26,7 @@ from code_analysis.core.project_root_path import (
     persist_projects_root_path_stored_value, resolve_project_root_absolute_str)
 
 from ..docs_indexing_config_load import load_docs_indexing_from_config_path
+from ..metrics import PhaseTimer
 from ..project_ignore_policy import \
     filter_ignore_exception_py_paths_for_watcher
 from ..sql_portable import sql_julian_timestamp_now_expr
@@ -40,6 +42,7 @@ from ..worker_project_activity import (get_project_activity,
                                        release_project_activity,
                                        try_acquire_project_activity)
 from .cycle_divergence import log_cycle_divergence_if_any
+from .git_index_scan import load_git_index_scan_enabled_from_config_path
 from .lock_manager import LockManager
 from .multi_project_worker_specs import WatchDirSpec
 from .processor import FileChangeProcessor
@@ -57,6 +60,8 @@ from .watcher_soft_deleted_projects import \
 
 logger = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
 
 def _merge_queue_stats(into: Dict[str, Any], part: Dict[str, Any]) -> None:
     """Add per-project queue counters into watch-dir totals."""
@@ -64,6 +69,18 @@ def _merge_queue_stats(into: Dict[str, Any], part: Dict[str, Any]) -> None:
         into[key] = int(into.get(key, 0)) + int(part.get(key, 0))
 
 
+def _alternate_phases(
+    phases: PhaseTimer, items: Iterable[_T], fetch_phase: str, body_phase: str
+) -> Iterator[_T]:
+    """Yield ``items``, timing each ``next()`` as ``fetch_phase`` and the
+    caller's loop body as ``body_phase``."""
+    phases.enter(fetch_phase)
+    for item in items:
+        phases.enter(body_phase)
+        yield item
+        phases.enter(fetch_phase)
+
+
 def _abspath_dedup_ts(value: Any) -> float:
     """Return abspath dedup ts."""
     if value is None:
@@ -343,6 +360,7 @@ def scan_watch_dir(
     config_path: Optional[Path] = None,
     manifest_signature_cache: Optional[Dict[str, Tuple[int, float, int]]] = None,
     purge_signature_cache: Optional[Dict[str, Any]] = None,
+    git_index_scan_states: Optional[Dict[str, Any]] = None,
 ) -> Dict[str, Any]:
     """
     Scan a watched directory and process all discovered projects.
@@ -368,6 +386,11 @@ def scan_watch_dir(
             skipped for that project this cycle (bug 5b663fbb cost fix -- the
             purge's outcome cannot have changed). None disables the gate (always
             runs, prior behavior). See :mod:`.purge_gate_signature`.
+        git_index_scan_states: Mutable per-worker map of project root ->
+            ``GitIndexScanState``. Used only when
+            ``code_analysis.file_watcher.git_index_scan`` is enabled: projects
+            with a usable ``.git/index`` are listed from the index instead of a
+            full tree walk. See :mod:`.git_index_scan`.
 
     Returns:
         Per-watch-dir scan stats.
@@ -405,7 +428,9 @@ def scan_watch_dir(
         stats["errors"] += 1
         return stats
 
+    phases = PhaseTimer("code_analysis_watcher_scan_phase_seconds")
     try:
+        phases.enter("discover")
         _now_sql = sql_julian_timestamp_now_expr(database)
         try:
             _deduplicate_absolute_paths(database, watch_dir)
@@ -716,6 +741,7 @@ def scan_watch_dir(
             f"time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
         )
 
+        phases.enter("prepare")
         from code_analysis.core.watch_dir_settings import \
             merge_watch_ignore_patterns
 
@@ -729,6 +755,11 @@ def scan_watch_dir(
         docs_indexing_snap: Optional[Dict[str, Any]] = None
         if config_path is not None:
             docs_indexing_snap = load_docs_indexing_from_config_path(config_path)
+        git_index_states: Optional[Dict[str, Any]] = None
+        if git_index_scan_states is not None and (
+            load_git_index_scan_enabled_from_config_path(config_path)
+        ):
+            git_index_states = git_index_scan_states
         allowlist = load_venv_site_packages_index_allowlist_from_config()
         allowed_venv_py: Set[Path] = set()
         if allowlist:
@@ -786,16 +817,22 @@ def scan_watch_dir(
             p.project_id: Path(p.root_path) for p in discovered_projects
         }
 
-        for project_id, project_root, project_files in iter_watch_dir_project_scans(
-            watch_dir,
-            [spec.watch_dir],
-            merged_ignore,
-            allowed_venv_py_files=allowed_venv_py or None,
-            ignore_exception_files=exc_files_filtered or None,
-            ignore_exception_patterns=exc_patterns or None,
-            immediate_project_roots=immediate_roots,
-            soft_deleted_project_roots=soft_deleted_roots or None,
-            docs_indexing=docs_indexing_snap,
+        for project_id, project_root, project_files in _alternate_phases(
+            phases,
+            iter_watch_dir_project_scans(
+                watch_dir,
+                [spec.watch_dir],
+                merged_ignore,
+                allowed_venv_py_files=allowed_venv_py or None,
+                ignore_exception_files=exc_files_filtered or None,
+                ignore_exception_patterns=exc_patterns or None,
+                immediate_project_roots=immediate_roots,
+                soft_deleted_project_roots=soft_deleted_roots or None,
+                docs_indexing=docs_indexing_snap,
+                git_index_states=git_index_states,
+            ),
+            "walk",
+            "queue",
         ):
             processed_project_ids.add(project_id)
             all_scanned_files.update(project_files)
@@ -891,6 +928,7 @@ def scan_watch_dir(
                 len(project_files),
             )
 
+        phases.enter("supplemental")
         supplemental = compute_supplemental_watch_dir_deltas(
             database,
             [spec.watch_dir.resolve()],
@@ -1057,6 +1095,7 @@ def scan_watch_dir(
         )
         stats["errors"] += 1
     finally:
+        phases.close()
         lock_manager.release_lock(watch_dir)
 
     return stats
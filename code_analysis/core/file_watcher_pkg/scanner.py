@@ -251,6 +251,113 @@ def _is_resolved_watch_dir_root(
     return False
 
 
+def is_traversable_dir(
+    dir_path: Path,
+    walk_root: Optional[Path],
+    *,
+    ignore_patterns: Optional[List[str]] = None,
+    allowed_venv_py_files: Optional[Set[Path]] = None,
+    ignore_exception_files: Optional[Set[Path]] = None,
+    ignore_exception_patterns: Optional[List[str]] = None,
+    immediate_project_roots: Optional[AbstractSet[Path]] = None,
+    soft_deleted_project_roots: Optional[AbstractSet[Path]] = None,
+    project_root: Optional[Path] = None,
+    docs_indexing: Optional[Dict[str, Any]] = None,
+) -> bool:
+    """
+    Return True when the watcher descends into ``dir_path``.
+
+    Combines traversal skips (:func:`should_skip_dir`), ignore pruning
+    (:func:`should_prune_ignored_dir`) and readability, in that order, so the
+    tree walk and the git-index change source prune identically.
+    """
+    if should_skip_dir(
+        dir_path,
+        walk_root,
+        immediate_project_roots=immediate_project_roots,
+        soft_deleted_project_roots=soft_deleted_project_roots,
+    ):
+        return False
+    if should_prune_ignored_dir(
+        dir_path,
+        ignore_patterns,
+        allowed_venv_py_files=allowed_venv_py_files,
+        ignore_exception_files=ignore_exception_files,
+        ignore_exception_patterns=ignore_exception_patterns,
+        project_root=project_root,
+        docs_indexing=docs_indexing,
+    ):
+        return False
+    # Of the directories we would actually descend into, drop any we
+    # cannot read/traverse (logs a [FS_PERM] error and skips).
+    return is_readable_dir(dir_path, log=logger)
+
+
+def add_scanned_file(
+    files: Dict[str, Dict[str, Any]],
+    item: Path,
+    watch_dirs_resolved: List[Union[str, Path]],
+    *,
+    ignore_patterns: Optional[List[str]] = None,
+    allowed_venv_py_files: Optional[Set[Path]] = None,
+    ignore_exception_files: Optional[Set[Path]] = None,
+    ignore_exception_patterns: Optional[List[str]] = None,
+    project_root: Optional[Path] = None,
+    docs_indexing: Optional[Dict[str, Any]] = None,
+) -> None:
+    """
+    Apply ignore rules to one candidate file and merge its scan info into ``files``.
+
+    Shared by the tree walk and the git-index change source so both produce
+    identical ``files`` entries (absolute path -> file info).
+    """
+    from ..exceptions import NestedProjectError, ProjectNotFoundError
+    from ..path_normalization import normalize_file_path
+
+    if should_ignore_path(
+        item,
+        ignore_patterns,
+        allowed_venv_py_files=allowed_venv_py_files,
+        ignore_exception_files=ignore_exception_files,
+        ignore_exception_patterns=ignore_exception_patterns,
+        project_root=project_root,
+        docs_indexing=docs_indexing,
+    ):
+        return
+    if not item.is_file():
+        return
+    try:
+        stat = item.stat()
+        try:
+            normalized = normalize_file_path(item, watch_dirs=watch_dirs_resolved)
+            path_key = normalized.absolute_path
+
+            file_info: Dict[str, Any] = {
+                "path": Path(normalized.absolute_path),
+                "mtime": stat.st_mtime,
+                "size": stat.st_size,
+                "project_root": normalized.project_root,
+                "project_id": normalized.project_id,
+            }
+            files[path_key] = file_info
+        except (ProjectNotFoundError, NestedProjectError) as e:
+            logger.warning(f"No project found for file {item}: {e}, skipping")
+            return
+        except Exception as e:
+            logger.debug(f"Error normalizing path for {item}: {e}")
+            return
+    except PermissionError as e:
+        logger.error(
+            "[FS_PERM] no permission to read file, skipping: %s (%s)",
+            item,
+            e,
+        )
+        return
+    except OSError as e:
+        logger.debug(f"Error accessing file {item}: {e}")
+        return
+
+
 def _scan_tree_into_files(
     files: Dict[str, Dict[str, Any]],
     walk_root: Path,
@@ -279,9 +386,6 @@ def _scan_tree_into_files(
         soft_deleted_project_roots: Project subtrees excluded from traversal.
         docs_indexing: Optional docs-indexing config snapshot.
     """
-    from ..exceptions import NestedProjectError, ProjectNotFoundError
-    from ..path_normalization import normalize_file_path
-
     resolved_project_roots = _resolve_path_set(immediate_project_roots)
     resolved_soft_deleted = _resolve_path_set(soft_deleted_project_roots)
 
@@ -304,83 +408,36 @@ def _scan_tree_into_files(
             dirnames[:] = [
                 d
                 for d in sorted(dirnames)
-                if not should_skip_dir(
+                if is_traversable_dir(
                     dir_path / d,
                     walk_resolved,
-                    immediate_project_roots=resolved_project_roots,
-                    soft_deleted_project_roots=resolved_soft_deleted,
-                )
-            ]
-            dirnames[:] = [
-                d
-                for d in dirnames
-                if not should_prune_ignored_dir(
-                    dir_path / d,
-                    ignore_patterns,
+                    ignore_patterns=ignore_patterns,
                     allowed_venv_py_files=allowed_venv_py_files,
                     ignore_exception_files=ignore_exception_files,
                     ignore_exception_patterns=ignore_exception_patterns,
+                    immediate_project_roots=resolved_project_roots,
+                    soft_deleted_project_roots=resolved_soft_deleted,
                     project_root=current_project_root,
                     docs_indexing=docs_indexing,
                 )
             ]
-            # Of the directories we would actually descend into, drop any we
-            # cannot read/traverse (logs a [FS_PERM] error and skips).
-            dirnames[:] = [
-                d for d in dirnames if is_readable_dir(dir_path / d, log=logger)
-            ]
 
             for name in filenames:
                 item = dir_path / name
                 file_project_root = _best_project_root_for_path(
                     item, resolved_project_roots, current_project_root
                 )
-                if should_ignore_path(
+                add_scanned_file(
+                    files,
                     item,
-                    ignore_patterns,
+                    watch_dirs_resolved,
+                    ignore_patterns=ignore_patterns,
                     allowed_venv_py_files=allowed_venv_py_files,
                     ignore_exception_files=ignore_exception_files,
                     ignore_exception_patterns=ignore_exception_patterns,
                     project_root=file_project_root,
                     docs_indexing=docs_indexing,
-                ):
-                    continue
-                if not item.is_file():
-                    continue
-                try:
-                    stat = item.stat()
-                    try:
-                        normalized = normalize_file_path(
-                            item, watch_dirs=watch_dirs_resolved
-                        )
-                        path_key = normalized.absolute_path
-
-                        file_info: Dict[str, Any] = {
-                            "path": Path(normalized.absolute_path),
-                            "mtime": stat.st_mtime,
-                            "size": stat.st_size,
-                            "project_root": normalized.project_root,
-                            "project_id": normalized.project_id,
-                        }
-                        files[path_key] = file_info
-                    except (ProjectNotFoundError, NestedProjectError) as e:
-                        logger.warning(
-                            f"No project found for file {item}: {e}, skipping"
-                        )
-                        continue
-                    except Exception as e:
-                        logger.debug(f"Error normalizing path for {item}: {e}")
-                        continue
-                except PermissionError as e:
-                    logger.error(
-                        "[FS_PERM] no permission to read file, skipping: %s (%s)",
-                        item,
-                        e,
-                    )
-                    continue
-                except OSError as e:
-                    logger.debug(f"Error accessing file {item}: {e}")
-                    continue
+                )
 
     except OSError as e:
         logger.error(f"Error scanning directory {walk_root}: {e}")
@@ -444,12 +501,18 @@ def iter_watch_dir_project_scans(
     immediate_project_roots: Optional[AbstractSet[Path]] = None,
     soft_deleted_project_roots: Optional[AbstractSet[Path]] = None,
     docs_indexing: Optional[Dict[str, Any]] = None,
+    git_index_states: Optional[Dict[str, Any]] = None,
 ) -> Iterator[Tuple[str, Path, Dict[str, Dict[str, Any]]]]:
     """
     Yield ``(project_id, project_root, files_map)`` for each validated watch-dir child.
 
     Each yield completes one project tree walk, explicit merge paths for that project,
     and is ready for per-project delta/queue (buffer flush) before the next child.
+
+    When ``git_index_states`` is given (project root -> ``GitIndexScanState``,
+    kept by the caller across cycles), projects with a usable ``.git/index`` are
+    listed from the index via :func:`.git_index_scan.scan_project_via_git_index`
+    instead of a full tree walk; other projects are walked as usual.
     """
     from ..exceptions import InvalidProjectIdFormatError, ProjectIdError
     from ..project_resolution import load_project_info
@@ -516,18 +579,42 @@ def iter_watch_dir_project_scans(
             roots_for_walk = merged_roots
 
         project_files: Dict[str, Dict[str, Any]] = {}
-        _scan_tree_into_files(
-            project_files,
-            project_root,
-            watch_dirs_resolved,
-            ignore_patterns=ignore_patterns,
-            allowed_venv_py_files=allowed_venv_py_files,
-            ignore_exception_files=ignore_exception_files,
-            ignore_exception_patterns=ignore_exception_patterns,
-            immediate_project_roots=roots_for_walk,
-            soft_deleted_project_roots=resolved_soft_deleted,
-            docs_indexing=docs_indexing,
-        )
+        scanned_via_index = False
+        if git_index_states is not None:
+            from .git_index_scan import GitIndexScanState, scan_project_via_git_index
+
+            state_key = str(project_root)
+            state = git_index_states.get(state_key)
+            if state is None:
+                state = git_index_states[state_key] = GitIndexScanState()
+            scanned_via_index = scan_project_via_git_index(
+                project_files,
+                project_root,
+                watch_dirs_resolved,
+                state,
+                ignore_patterns=ignore_patterns,
+                allowed_venv_py_files=allowed_venv_py_files,
+                ignore_exception_files=ignore_exception_files,
+                ignore_exception_patterns=ignore_exception_patterns,
+                immediate_project_roots=roots_for_walk,
+                soft_deleted_project_roots=resolved_soft_deleted,
+                docs_indexing=docs_indexing,
+            )
+            if not scanned_via_index:
+                git_index_states.pop(state_key, None)
+        if not scanned_via_index:
+            _scan_tree_into_files(
+                project_files,
+                project_root,
+                watch_dirs_resolved,
+                ignore_patterns=ignore_patterns,
+                allowed_venv_py_files=allowed_venv_py_files,
+                ignore_exception_files=ignore_exception_files,
+                ignore_exception_patterns=ignore_exception_patterns,
+                immediate_project_roots=roots_for_walk,
+                soft_deleted_project_roots=resolved_soft_deleted,
+                docs_indexing=docs_indexing,
+            )
         merge_paths = _build_project_merge_paths(
             project_root,
             allowed_venv_py_files=allowed_venv_py_files,
@@ -15,6 +15,7 @@ email: vasilyvz@gmail.com
 
 import logging
 import subprocess
+import threading
 from pathlib import Path
 from typing import Any, List, Mapping, Optional, Tuple
 
@@ -22,6 +23,10 @@ logger = logging.getLogger(__name__)
 
 CONFIG_KEY_GIT_COMMIT_ON_WRITE = "git_commit_on_write"
 
+#: Process-wide memo for :func:`is_git_available` (None until first probe).
+_git_available: Optional[bool] = None
+_git_available_lock = threading.Lock()
+
 
 def get_git_commit_on_write_from_config(
     config_data: Optional[Mapping[str, Any]] = None,
@@ -64,23 +69,39 @@ def is_git_available() -> bool:
     """
     Check if git command is available in system.
 
+    The ``git --version`` probe runs once per process; the result is memoized
+    (see :func:`reset_git_available_cache`).
+
     Returns:
         True if git is available, False otherwise
     """
-    try:
-        subprocess.run(
-            ["git", "--version"],
-            capture_output=True,
-            check=True,
-            timeout=5,
-        )
-        return True
-    except (
-        subprocess.CalledProcessError,
-        FileNotFoundError,
-        subprocess.TimeoutExpired,
-    ):
-        return False
+    global _git_available
+    if _git_available is not None:
+        return _git_available
+    with _git_available_lock:
+        if _git_available is None:
+            try:
+                subprocess.run(
+                    ["git", "--version"],
+                    capture_output=True,
+                    check=True,
+                    timeout=5,
+                )
+                _git_available = True
+            except (
+                subprocess.CalledProcessError,
+                FileNotFoundError,
+                subprocess.TimeoutExpired,
+            ):
+                _git_available = False
+        return _git_available
+
+
+def reset_git_available_cache() -> None:
+    """Forget the memoized git availability so the next call re-probes."""
+    global _git_available
+    with _git_available_lock:
+        _git_available = None
 
 
 def create_git_commit(
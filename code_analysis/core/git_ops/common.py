@@ -1,6 +1,7 @@
 """Shared helpers for the local git working-tree and history mutation operations
 in code_analysis/core/git_ops/: a no-shell subprocess runner around git, a
-local-repository availability check, and project-root path confinement for
+local-repository availability check (memoized per process and per
+repository ``.git`` fingerprint), and project-root path confinement for
 path-consuming operations (stage, unstage, restore). Path confinement delegates
 to the canonical project-scoped guard in
 code_analysis/core/project_git/path_confinement.py. These operations act only
@@ -9,10 +10,47 @@ on the resolved local repository and never contact a remote.
 
 import os
 import subprocess
+import threading
 from pathlib import Path
 
+from code_analysis.core.git_integration import is_git_available
 from code_analysis.core.project_git.path_confinement import confine_project_git_path
 
+#: Work-tree probe results keyed by root_dir -> ((mtime_ns, inode) of .git, ok).
+_work_tree_probe_cache: dict[str, tuple[tuple[int, int], bool]] = {}
+_work_tree_probe_lock = threading.Lock()
+
+
+def _git_dir_fingerprint(root_dir: str) -> tuple[int, int] | None:
+    """Return (mtime_ns, inode) of ``root_dir/.git`` or None when absent."""
+    try:
+        st = os.stat(os.path.join(root_dir, ".git"))
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_ino)
+
+
+def _is_inside_work_tree(root_dir: str) -> bool:
+    """Probe ``git rev-parse --is-inside-work-tree``; memoized per .git fingerprint.
+
+    Only roots that carry their own ``.git`` are memoized; anything else (for
+    example a subdirectory of a repository) is probed on every call.
+    """
+    fingerprint = _git_dir_fingerprint(root_dir)
+    if fingerprint is not None:
+        with _work_tree_probe_lock:
+            cached = _work_tree_probe_cache.get(root_dir)
+        if cached is not None and cached[0] == fingerprint:
+            return cached[1]
+    returncode, stdout, _stderr = run_git(
+        root_dir, ["rev-parse", "--is-inside-work-tree"]
+    )
+    inside = returncode == 0 and stdout.strip() == "true"
+    if fingerprint is not None:
+        with _work_tree_probe_lock:
+            _work_tree_probe_cache[root_dir] = (fingerprint, inside)
+    return inside
+
 
 def run_git(
     root_dir: str, args: list[str], timeout_seconds: int = 60
@@ -47,6 +85,9 @@ def run_git(
 def ensure_local_repo(root_dir: str) -> dict | None:
     """Confirm git is available and root_dir is a git work tree.
 
+    Both probes are memoized: git availability once per process, the
+    work-tree check per repository until its ``.git`` entry changes.
+
     Args:
         root_dir: Absolute path to the candidate git working tree.
 
@@ -58,30 +99,13 @@ def ensure_local_repo(root_dir: str) -> dict | None:
         {"success": False, "code": "GIT_NOT_A_REPO", "message": str} when
         root_dir is not a git work tree.
     """
-    try:
-        availability = subprocess.run(
-            ["git", "--version"],
-            shell=False,
-            capture_output=True,
-            text=True,
-            timeout=10,
-        )
-    except (OSError, subprocess.TimeoutExpired):
-        return {
-            "success": False,
-            "code": "GIT_NOT_AVAILABLE",
-            "message": "git executable is not available on this system.",
-        }
-    if availability.returncode != 0:
+    if not is_git_available():
         return {
             "success": False,
             "code": "GIT_NOT_AVAILABLE",
             "message": "git executable is not available on this system.",
         }
-    returncode, stdout, _stderr = run_git(
-        root_dir, ["rev-parse", "--is-inside-work-tree"]
-    )
-    if returncode != 0 or stdout.strip() != "true":
+    if not _is_inside_work_tree(root_dir):
         return {
             "success": False,
             "code": "GIT_NOT_A_REPO",
@@ -0,0 +1,350 @@
+"""In-process (dulwich) readers for read-only git operations.
+
+Serves the hot read paths (commit history, local branch and tag listing,
+single-path blob diffs between two commits, HEAD presence) without spawning
+``git``. Repository handles are cached per resolved root and reopened when
+the ``.git`` directory's stat fingerprint (mtime_ns, inode) changes.
+
+Every reader returns ``None`` when the request falls outside what is served
+in-process (revision ranges, pathspec magic, detached HEAD, unreadable
+repository formats, unknown revisions, ...). Callers then fall back to the
+``git`` subprocess path, which stays the source of truth for error messages
+and for anything not reproduced here.
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import io
+import logging
+import os
+import re
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, cast
+
+from dulwich.object_store import tree_lookup_path
+from dulwich.objects import Commit, Tree
+from dulwich.objectspec import parse_commit
+from dulwich.patch import write_object_diff
+from dulwich.refs import HEADREF, LOCAL_BRANCH_PREFIX, LOCAL_TAG_PREFIX, Ref
+from dulwich.repo import Repo
+
+logger = logging.getLogger(__name__)
+
+#: Maximum number of repository handles kept open per process.
+MAX_CACHED_REPO_HANDLES = 64
+
+#: Revision syntax that is left to the git CLI (ranges, reflog, pathspecs).
+_UNSUPPORTED_REV_TOKENS = ("..", ":", "@{", "^!", "^@", " ", "\t")
+
+#: Pathspec characters that require git's pathspec matching.
+_PATHSPEC_MAGIC_CHARS = frozenset("*?[]:!\\")
+
+#: Abbreviated object ids are resolved by git (dulwich scans every object).
+_ABBREV_SHA_RE = re.compile(r"^[0-9a-fA-F]{4,39}$")
+
+#: ``<base>`` followed by ancestry suffixes such as ``~2``, ``^`` or ``^2``.
+_ANCESTRY_RE = re.compile(r"^(?P<base>.*?)(?P<suffix>(?:[~^]\d*)*)$")
+_ANCESTRY_STEP_RE = re.compile(r"([~^])(\d*)")
+
+_Fingerprint = Tuple[int, int]
+
+_handles: "OrderedDict[str, Tuple[_Fingerprint, Repo, threading.Lock]]" = OrderedDict()
+_handles_lock = threading.Lock()
+
+
+def _git_dir_fingerprint(root: Path) -> Optional[_Fingerprint]:
+    """Return (mtime_ns, inode) of ``root/.git`` when it is a directory."""
+    try:
+        st = os.stat(root / ".git")
+    except OSError:
+        return None
+    if not os.path.isdir(root / ".git"):
+        return None
+    return (st.st_mtime_ns, st.st_ino)
+
+
+def _acquire_handle(root: Path) -> Optional[Tuple[Repo, threading.Lock]]:
+    """Return cached (Repo, lock) for ``root``; reopen when ``.git`` changed."""
+    key = str(root)
+    fingerprint = _git_dir_fingerprint(root)
+    if fingerprint is None:
+        return None
+    with _handles_lock:
+        cached = _handles.get(key)
+        if cached is not None and cached[0] == fingerprint:
+            _handles.move_to_end(key)
+            return cached[1], cached[2]
+        if cached is not None:
+            _close_quietly(cached[1])
+            del _handles[key]
+        try:
+            repo = Repo(key)
+        except Exception as exc:
+            logger.debug("in-process git: cannot open %s: %s", key, exc)
+            return None
+        entry = (fingerprint, repo, threading.Lock())
+        _handles[key] = entry
+        while len(_handles) > MAX_CACHED_REPO_HANDLES:
+            _old_key, old_entry = _handles.popitem(last=False)
+            _close_quietly(old_entry[1])
+        return repo, entry[2]
+
+
+def _close_quietly(repo: Repo) -> None:
+    """Close a dulwich repo, ignoring errors."""
+    try:
+        repo.close()
+    except Exception:
+        pass
+
+
+@contextmanager
+def _repo_handle(root: Path) -> Iterator[Optional[Repo]]:
+    """Yield the cached Repo for ``root`` under its per-repo lock (or None)."""
+    acquired = _acquire_handle(root)
+    if acquired is None:
+        yield None
+        return
+    repo, lock = acquired
+    with lock:
+        yield repo
+
+
+def clear_repo_handle_cache() -> None:
+    """Close and drop every cached repository handle."""
+    with _handles_lock:
+        for _fingerprint, repo, _lock in _handles.values():
+            _close_quietly(repo)
+        _handles.clear()
+
+
+def _is_simple_rev(rev: str) -> bool:
+    """Return True when ``rev`` uses syntax resolved in-process."""
+    return bool(rev) and not any(token in rev for token in _UNSUPPORTED_REV_TOKENS)
+
+
+def _normalize_plain_path(file_path: str) -> Optional[bytes]:
+    """Return repo-relative path bytes, or None for pathspec magic / escapes."""
+    if not file_path or any(ch in _PATHSPEC_MAGIC_CHARS for ch in file_path):
+        return None
+    parts = [p for p in file_path.replace(os.sep, "/").split("/") if p not in ("", ".")]
+    if not parts or ".." in parts or file_path.startswith("/"):
+        return None
+    return "/".join(parts).encode("utf-8")
+
+
+def _iso_strict(timestamp: int, tz_offset_seconds: int) -> str:
+    """Format a commit time like git's ``%aI`` (strict ISO 8601)."""
+    tz = timezone(timedelta(seconds=tz_offset_seconds))
+    return datetime.fromtimestamp(timestamp, tz=tz).isoformat()
+
+
+def _split_identity(identity: bytes) -> Tuple[str, str]:
+    """Split ``Name <email>`` into (name, email)."""
+    text = identity.decode("utf-8", errors="replace")
+    name, sep, rest = text.partition("<")
+    if not sep:
+        return text.strip(), ""
+    return name.strip(), rest.split(">", 1)[0].strip()
+
+
+def _subject(message: bytes, encoding: Optional[bytes]) -> str:
+    """Return git's ``%s``: first paragraph joined into one line."""
+    codec = (encoding or b"utf-8").decode("ascii", errors="replace")
+    try:
+        text = message.decode(codec, errors="replace")
+    except LookupError:
+        text = message.decode("utf-8", errors="replace")
+    lines: List[str] = []
+    for line in text.lstrip("\n").splitlines():
+        if not line.strip():
+            break
+        lines.append(line.strip())
+    return " ".join(lines)
+
+
+def _resolve_commit(repo: Repo, rev: Optional[str]) -> Optional[Commit]:
+    """Resolve ``rev`` (default HEAD) to a commit, or None when unsupported."""
+    if rev is None:
+        rev = "HEAD"
+    if not _is_simple_rev(rev):
+        return None
+    match = _ANCESTRY_RE.match(rev)
+    if match is None or not match.group("base"):
+        return None
+    base = match.group("base")
+    if _ABBREV_SHA_RE.match(base) and not _names_a_ref(repo, base):
+        return None
+    try:
+        commit = parse_commit(repo, base.encode("utf-8"))
+    except Exception:
+        return None
+    for op, digits in _ANCESTRY_STEP_RE.findall(match.group("suffix")):
+        count = int(digits) if digits else 1
+        if op == "~":
+            for _ in range(count):
+                if not commit.parents:
+                    return None
+                commit = cast(Commit, repo[commit.parents[0]])
+        elif count:
+            if len(commit.parents) < count:
+                return None
+            commit = cast(Commit, repo[commit.parents[count - 1]])
+    return commit
+
+
+def _names_a_ref(repo: Repo, rev: str) -> bool:
+    """Return True when ``rev`` is a ref name rather than an abbreviated id."""
+    name = rev.encode("utf-8")
+    return any(
+        Ref(candidate) in repo.refs
+        for candidate in (name, LOCAL_TAG_PREFIX + name, LOCAL_BRANCH_PREFIX + name)
+    )
+
+
+def has_commits(root: Path) -> Optional[bool]:
+    """Return whether HEAD resolves to a commit; None when not served in-process."""
+    with _repo_handle(root) as repo:
+        if repo is None:
+            return None
+        try:
+            repo.head()
+        except KeyError:
+            return False
+        except Exception:
+            return None
+        return True
+
+
+def read_log(
+    root: Path, *, rev: Optional[str], max_count: int
+) -> Optional[List[Dict[str, str]]]:
+    """Return commit history like ``git log -n <max_count> [rev]``.
+
+    File-scoped history is not served here: dulwich would diff trees of every
+    walked commit in Python, which is slower than one git subprocess.
+    """
+    with _repo_handle(root) as repo:
+        if repo is None:
+            return None
+        try:
+            start = _resolve_commit(repo, rev)
+            if start is None:
+                return None
+            commits: List[Dict[str, str]] = []
+            for entry in repo.get_walker(include=[start.id], max_entries=max_count):
+                commit = entry.commit
+                name, email = _split_identity(commit.author)
+                commits.append(
+                    {
+                        "hash": commit.id.decode("ascii"),
+                        "author_name": name,
+                        "author_email": email,
+                        "date": _iso_strict(commit.author_time, commit.author_timezone),
+                        "subject": _subject(commit.message, commit.encoding),
+                    }
+                )
+            return commits
+        except Exception as exc:
+            logger.debug("in-process git log failed for %s: %s", root, exc)
+            return None
+
+
+def read_local_branches(root: Path) -> Optional[List[Dict[str, Any]]]:
+    """Return local branches like ``git branch --list`` (attached HEAD only)."""
+    with _repo_handle(root) as repo:
+        if repo is None:
+            return None
+        try:
+            head_chain, _sha = repo.refs.follow(HEADREF)
+            if len(head_chain) < 2:
+                return None
+            current_ref = head_chain[-1]
+            names = sorted(repo.refs.keys(base=Ref(LOCAL_BRANCH_PREFIX)))
+            return [
+                {
+                    "name": name.decode("utf-8"),
+                    "current": LOCAL_BRANCH_PREFIX + name == current_ref,
+                }
+                for name in names
+            ]
+        except Exception as exc:
+            logger.debug("in-process git branch failed for %s: %s", root, exc)
+            return None
+
+
+def read_tag_names(root: Path, pattern: Optional[str] = None) -> Optional[List[str]]:
+    """Return tag names like ``git tag --list [pattern]``."""
+    with _repo_handle(root) as repo:
+        if repo is None:
+            return None
+        try:
+            names = sorted(
+                name.decode("utf-8")
+                for name in repo.refs.keys(base=Ref(LOCAL_TAG_PREFIX))
+            )
+        except Exception as exc:
+            logger.debug("in-process git tag list failed for %s: %s", root, exc)
+            return None
+    if pattern:
+        names = [name for name in names if fnmatch.fnmatchcase(name, pattern)]
+    return names
+
+
+def read_blob_diff(
+    root: Path, *, rev_from: str, rev_to: str, file_path: str
+) -> Optional[str]:
+    """Return the unified diff of one file between two commits, or None.
+
+    Only plain file paths are served; directories, submodules and unknown
+    revisions fall back to ``git diff``.
+    """
+    path = _normalize_plain_path(file_path)
+    if path is None:
+        return None
+    with _repo_handle(root) as repo:
+        if repo is None:
+            return None
+        try:
+            old_commit = _resolve_commit(repo, rev_from)
+            new_commit = _resolve_commit(repo, rev_to)
+            if old_commit is None or new_commit is None:
+                return None
+            old_entry = _lookup_blob(repo, old_commit, path)
+            new_entry = _lookup_blob(repo, new_commit, path)
+            if old_entry is False or new_entry is False:
+                return None
+            if old_entry is None and new_entry is None:
+                return ""
+            if old_entry is not None and old_entry == new_entry:
+                return ""
+            buf = io.BytesIO()
+            write_object_diff(
+                buf,
+                repo.object_store,
+                (path, *old_entry) if old_entry else (None, None, None),
+                (path, *new_entry) if new_entry else (None, None, None),
+            )
+            return buf.getvalue().decode("utf-8", errors="replace")
+        except Exception as exc:
+            logger.debug("in-process git diff failed for %s: %s", root, exc)
+            return None
+
+
+def _lookup_blob(repo: Repo, commit: Commit, path: bytes) -> Any:
+    """Return (mode, sha) of a blob at ``path``; None if absent; False if not a blob."""
+    tree = repo[commit.tree]
+    if not isinstance(tree, Tree):
+        return False
+    try:
+        mode, sha = tree_lookup_path(repo.get_object, tree.id, path)
+    except KeyError:
+        return None
+    if mode is None or (mode & 0o170000) not in (0o100000, 0o120000):
+        return False
+    return (mode, sha)
@@ -1,9 +1,11 @@
 """
 Shared import-graph primitives: module→path resolution and cycle detection.
 
-These are pure utilities (no DB, no disk) used by both the ``analyze_tree``
-command and the comprehensive_analysis project-integrity phase, so the two share
-ONE resolution + cycle-detection implementation and cannot diverge. Lives in
+The resolver, ``find_cycles`` and ``SccIndex`` are pure utilities (no DB, no
+disk); ``store`` persists the resolved graph per project and keeps its cycle
+components up to date incrementally. Both the ``analyze_tree`` command and the
+comprehensive_analysis project-integrity phase read it, so the two share ONE
+resolution + cycle-detection implementation and cannot diverge. Lives in
 ``core`` (not under a command package) to respect the command→core layering.
 
 Author: Vasiliy Zdanovskiy
@@ -17,7 +19,16 @@ from .resolver import (
     STDLIB_TOP_LEVELS,
     ModulePathResolver,
     ResolvedImport,
+    dotted_attempts,
     is_stdlib_module,
+    module_names_for_path,
+)
+from .scc import SccIndex
+from .store import (
+    ImportGraphFile,
+    ProjectImportGraph,
+    StoredImport,
+    sync_import_graph,
 )
 
 __all__ = [
@@ -26,4 +37,11 @@ __all__ = [
     "ResolvedImport",
     "is_stdlib_module",
     "STDLIB_TOP_LEVELS",
+    "dotted_attempts",
+    "module_names_for_path",
+    "SccIndex",
+    "ImportGraphFile",
+    "ProjectImportGraph",
+    "StoredImport",
+    "sync_import_graph",
 ]
@@ -71,6 +71,32 @@ def is_stdlib_module(module: str) -> bool:
     return top in STDLIB_TOP_LEVELS
 
 
+def dotted_attempts(module: Optional[str], name: Optional[str]) -> list[str]:
+    """Dotted names an import row is resolved by, most specific first."""
+    primary_module = (module or "").strip()
+    nm = (name or "").strip()
+    if primary_module:
+        return [f"{primary_module}.{nm}", primary_module] if nm else [primary_module]
+    return [nm] if nm else []
+
+
+def module_names_for_path(rel_path: str) -> set[str]:
+    """Every dotted name whose resolution could land on ``rel_path``.
+
+    A project file matches a dotted name when the name's path tail is a suffix
+    of it, so ``a/b/c.py`` answers ``c``, ``b.c`` and ``a.b.c`` (and a package
+    ``__init__.py`` also answers its directory names).
+    """
+    if not rel_path.endswith(".py"):
+        return set()
+    parts = rel_path[:-3].split("/")
+    names = {".".join(parts[i:]) for i in range(len(parts))}
+    if parts[-1] == "__init__" and len(parts) > 1:
+        package = parts[:-1]
+        names.update(".".join(package[i:]) for i in range(len(package)))
+    return names
+
+
 @dataclass(frozen=True)
 class ResolvedImport:
     """Outcome of resolving one import row.
@@ -136,22 +162,12 @@ class ModulePathResolver:
         importer_rel: Optional[str] = None,
     ) -> ResolvedImport:
         """Resolve one import row to a project file or an external classification."""
-        dotted_attempts: list[str] = []
-        primary_module = (module or "").strip()
-        nm = (name or "").strip()
-        if primary_module:
-            if nm:
-                dotted_attempts.append(f"{primary_module}.{nm}")
-            dotted_attempts.append(primary_module)
-        elif nm:
-            dotted_attempts.append(nm)
-
-        for dotted in dotted_attempts:
+        for dotted in dotted_attempts(module, name):
             for tail in self._module_to_tails(dotted):
                 hit = self._match_tail(tail, importer_rel)
                 if hit:
                     return ResolvedImport(kind="project", module=dotted, rel_path=hit)
 
-        external_module = primary_module or nm or ""
+        external_module = (module or "").strip() or (name or "").strip()
         kind = "stdlib" if is_stdlib_module(external_module) else "third_party"
         return ResolvedImport(kind=kind, module=external_module)
@@ -0,0 +1,172 @@
+"""
+Strongly connected components maintained under edge edits (shared core utility).
+
+:class:`SccIndex` keeps, for every node that sits on a cycle, the id of its
+strongly connected component (the smallest member id, so ids are stable across
+processes). Updates touch only what an edit can change:
+
+- removing an edge (or node) inside a component re-runs Tarjan on that
+  component's members alone, since a deletion can only split it;
+- adding an edge ``u -> v`` between different components merges every node
+  that is both reachable from ``v`` and able to reach ``u``; nothing merges
+  when ``v`` cannot reach ``u``.
+
+Self-loops never form a component on their own (callers that report them read
+the edge directly). Pure; no DB or disk access.
+
+Author: Vasiliy Zdanovskiy
+email: vasilyvz@gmail.com
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from .cycles import find_cycles
+
+
+class SccIndex:
+    """Component membership of a directed graph, patched per edge edit."""
+
+    def __init__(
+        self,
+        adjacency: Dict[str, Set[str]],
+        component_of: Optional[Dict[str, str]] = None,
+    ) -> None:
+        """Index ``adjacency``; recompute components unless ``component_of`` is given.
+
+        Args:
+            adjacency: Node -> successor ids. Copied; targets become nodes too.
+            component_of: Previously computed membership (node -> component id)
+                for exactly this adjacency, e.g. loaded from storage.
+        """
+        self._adj: Dict[str, Set[str]] = {}
+        self._radj: Dict[str, Set[str]] = {}
+        for node, targets in adjacency.items():
+            self.add_node(node)
+            for target in targets:
+                self._link(node, target)
+        self._comp: Dict[str, str] = {}
+        self._members: Dict[str, Set[str]] = {}
+        if component_of is None:
+            for cycle in find_cycles(self._adj):
+                if len(cycle) >= 2:
+                    self._assign(cycle)
+        else:
+            for node, cid in component_of.items():
+                if node in self._adj:
+                    self._comp[node] = cid
+                    self._members.setdefault(cid, set()).add(node)
+
+    def add_node(self, node: str) -> None:
+        """Add ``node`` with no edges (no-op when present)."""
+        self._adj.setdefault(node, set())
+        self._radj.setdefault(node, set())
+
+    def component(self, node: str) -> Optional[str]:
+        """Component id of ``node``, or None when it is on no cycle."""
+        return self._comp.get(node)
+
+    def component_of(self) -> Dict[str, str]:
+        """Return node -> component id for every node on a cycle."""
+        return dict(self._comp)
+
+    def update(
+        self,
+        *,
+        removed_nodes: Iterable[str] = (),
+        removed_edges: Iterable[Tuple[str, str]] = (),
+        added_edges: Iterable[Tuple[str, str]] = (),
+    ) -> Set[str]:
+        """Apply edits (deletions first) and return nodes whose component changed."""
+        before = dict(self._comp)
+        split: Set[str] = set()
+        for node in removed_nodes:
+            if node not in self._adj:
+                continue
+            for target in self._adj.pop(node):
+                self._radj.get(target, set()).discard(node)
+            for source in self._radj.pop(node):
+                self._adj.get(source, set()).discard(node)
+            cid = self._comp.pop(node, None)
+            if cid is not None:
+                self._members[cid].discard(node)
+                split.add(cid)
+        for u, v in removed_edges:
+            if v not in self._adj.get(u, ()):
+                continue
+            self._adj[u].discard(v)
+            self._radj[v].discard(u)
+            cid = self._comp.get(u)
+            if cid is not None and cid == self._comp.get(v):
+                split.add(cid)
+        for cid in split:
+            self._resplit(cid)
+        for u, v in added_edges:
+            self._insert(u, v)
+        changed = {n for n, cid in before.items() if self._comp.get(n) != cid}
+        changed.update(n for n, cid in self._comp.items() if before.get(n) != cid)
+        return changed
+
+    def _link(self, u: str, v: str) -> None:
+        """Add edge ``u -> v`` to both adjacency maps."""
+        self.add_node(u)
+        self.add_node(v)
+        self._adj[u].add(v)
+        self._radj[v].add(u)
+
+    def _assign(self, nodes: Iterable[str]) -> None:
+        """Make ``nodes`` one component, dropping their previous membership."""
+        group = set(nodes)
+        for node in group:
+            old = self._comp.get(node)
+            if old is not None:
+                self._members.get(old, set()).discard(node)
+                if not self._members.get(old):
+                    self._members.pop(old, None)
+        cid = min(group)
+        self._members[cid] = group
+        for node in group:
+            self._comp[node] = cid
+
+    def _resplit(self, cid: str) -> None:
+        """Recompute components among the former members of ``cid`` only."""
+        members = self._members.pop(cid, set())
+        for node in members:
+            self._comp.pop(node, None)
+        sub = {node: self._adj[node] & members for node in members}
+        for cycle in find_cycles(sub):
+            if len(cycle) >= 2:
+                self._assign(cycle)
+
+    def _insert(self, u: str, v: str) -> None:
+        """Add ``u -> v`` and merge the components it closes a cycle through."""
+        self._link(u, v)
+        if u == v:
+            return
+        cu = self._comp.get(u)
+        if cu is not None and cu == self._comp.get(v):
+            return
+        forward = self._reach(v, self._adj)
+        if u not in forward:
+            return
+        backward = self._reach(u, self._radj, within=forward)
+        self._assign(backward)
+
+    @staticmethod
+    def _reach(
+        start: str,
+        adjacency: Dict[str, Set[str]],
+        within: Optional[Set[str]] = None,
+    ) -> Set[str]:
+        """Nodes reachable from ``start`` (optionally staying inside ``within``)."""
+        seen = {start}
+        stack: List[str] = [start]
+        while stack:
+            node = stack.pop()
+            for nxt in adjacency.get(node, ()):
+                if nxt in seen or (within is not None and nxt not in within):
+                    continue
+                seen.add(nxt)
+                stack.append(nxt)
+        return seen
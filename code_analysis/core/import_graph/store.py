@@ -0,0 +1,508 @@
+"""
+Persisted per-project import graph with incrementally maintained cycles.
+
+``import_graph_edges`` holds every import row of every active file together
+with its resolution (``kind``, resolved dotted module and, for project imports,
+the target ``file_id``). ``import_graph_nodes`` holds one row per file: the
+path and ``files.updated_at`` the edges were resolved against, and the id of
+the strongly connected component the file belongs to (NULL when it is on no
+import cycle).
+
+:func:`sync_import_graph` brings both tables up to date for the current file
+list and returns the result. Only these source files are re-resolved:
+
+- files whose ``updated_at`` or path moved (their ``imports`` rows are reread);
+- files with an import that pointed at a removed or moved file, or whose
+  dotted name could now match a newly added path (re-resolved from the stored
+  rows, since the resolver's longest-suffix match depends on the file set).
+
+Components are then patched with :class:`~.scc.SccIndex` from the edge
+difference, so only the components an edit touches are recomputed. Syncing
+happens on read (``analyze_tree``, the circular-import integrity check) rather
+than inside the per-file index write, which must stay one logical write.
+A failed write-back is logged and the computed graph is still returned.
+
+Author: Vasiliy Zdanovskiy
+email: vasilyvz@gmail.com
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+from .cycles import find_cycles
+from .resolver import ModulePathResolver, dotted_attempts, module_names_for_path
+from .scc import SccIndex
+
+logger = logging.getLogger(__name__)
+
+# More re-resolved sources than this (or than a tenth of the project) rebuild
+# the components from scratch instead of patching them edge by edge.
+PATCH_MAX_SOURCES = 256
+# Above this many changed files their imports are read project-wide.
+_READ_PROJECT_WIDE_FILES = 1000
+_IN_CHUNK = 500
+_INSERT_CHUNK = 200
+
+_EDGE_COLUMNS = (
+    "project_id, src_file_id, ordinal, module, name, import_type, kind, "
+    "resolved_module, target_file_id"
+)
+_NODE_COLUMNS = "project_id, file_id, rel_path, source_updated_at, scc_id"
+
+
+class ImportGraphFile(NamedTuple):
+    """One active project file as the import graph sees it."""
+
+    file_id: str
+    rel_path: str
+    updated_at: Optional[float]
+
+
+class StoredImport(NamedTuple):
+    """One resolved import row of ``import_graph_edges``."""
+
+    src_file_id: str
+    ordinal: int
+    module: Optional[str]
+    name: Optional[str]
+    import_type: Optional[str]
+    kind: str
+    resolved_module: str
+    target_file_id: Optional[str]
+
+
+@dataclass
+class ProjectImportGraph:
+    """Resolved imports and cycle membership of one project."""
+
+    rel_by_file_id: Dict[str, str]
+    imports: List[StoredImport]
+    component_of: Dict[str, str]
+    refreshed_sources: int = 0
+
+    def cycles(self) -> List[List[str]]:
+        """Import cycles (components of >= 2 files) as lists of ``file_id``."""
+        adjacency: Dict[str, Set[str]] = {fid: set() for fid in self.component_of}
+        for row in self.imports:
+            cid = self.component_of.get(row.src_file_id)
+            if (
+                cid is not None
+                and row.target_file_id != row.src_file_id
+                and self.component_of.get(row.target_file_id or "") == cid
+            ):
+                adjacency[row.src_file_id].add(row.target_file_id or "")
+        return find_cycles(adjacency)
+
+
+def sync_import_graph(
+    db: Any,
+    project_id: str,
+    files: Iterable[ImportGraphFile],
+    *,
+    project_only: bool = False,
+) -> ProjectImportGraph:
+    """Bring the persisted import graph of ``project_id`` up to date and return it.
+
+    Args:
+        db: Database client exposing ``execute(sql, params) -> {"data": [...]}``
+            (and optionally ``begin_transaction`` / ``execute_batch``).
+        project_id: Project UUID.
+        files: Active project files (``file_id``, project-relative path,
+            ``files.updated_at``).
+        project_only: When nothing changed, load only imports resolved to a
+            project file (enough for cycle queries).
+
+    Returns:
+        :class:`ProjectImportGraph` with imports ordered by source path and
+        position in the file.
+    """
+    current = {f.file_id: f for f in files}
+    rel_by_id = {fid: f.rel_path for fid, f in current.items()}
+    stored = {
+        str(row["file_id"]): row
+        for row in _rows(
+            db,
+            "SELECT file_id, rel_path, source_updated_at, scc_id "
+            "FROM import_graph_nodes WHERE project_id = ?",
+            (project_id,),
+        )
+    }
+    changed = {
+        fid
+        for fid, f in current.items()
+        if fid not in stored
+        or stored[fid]["rel_path"] != f.rel_path
+        or _as_float(stored[fid]["source_updated_at"]) != f.updated_at
+    }
+    removed = set(stored) - set(current)
+    if not changed and not removed:
+        return ProjectImportGraph(
+            rel_by_file_id=rel_by_id,
+            imports=_ordered(
+                _load_edges(db, project_id, project_only=project_only), rel_by_id
+            ),
+            component_of={
+                fid: str(row["scc_id"])
+                for fid, row in stored.items()
+                if row["scc_id"] is not None
+            },
+        )
+
+    old_edges = _load_edges(db, project_id)
+    old_by_src: Dict[str, List[StoredImport]] = {}
+    for row in old_edges:
+        old_by_src.setdefault(row.src_file_id, []).append(row)
+
+    old_rels = {str(row["rel_path"]) for row in stored.values()}
+    moved = {
+        fid
+        for fid in changed
+        if fid in stored and stored[fid]["rel_path"] != rel_by_id[fid]
+    }
+    new_names: Set[str] = set()
+    for rel in set(rel_by_id.values()) - old_rels:
+        new_names |= module_names_for_path(rel)
+
+    refresh = set(changed)
+    for src, rows in old_by_src.items():
+        if src in refresh or src not in current:
+            continue
+        for row in rows:
+            target = row.target_file_id
+            if (
+                target is not None and (target not in current or target in moved)
+            ) or not new_names.isdisjoint(dotted_attempts(row.module, row.name)):
+                refresh.add(src)
+                break
+
+    resolver = ModulePathResolver(rel_by_id.values())
+    id_by_rel = {rel: fid for fid, rel in rel_by_id.items()}
+    fresh = _read_imports(db, project_id, changed)
+    new_by_src: Dict[str, List[StoredImport]] = {}
+    for src in refresh:
+        if src in changed:
+            raw = fresh.get(src, [])
+        else:
+            raw = [(r.module, r.name, r.import_type) for r in old_by_src.get(src, [])]
+        new_by_src[src] = [
+            _resolve(resolver, id_by_rel, src, rel_by_id[src], i, *row)
+            for i, row in enumerate(raw)
+        ]
+
+    component_of = _patch_components(
+        stored, old_by_src, new_by_src, removed, current, refresh
+    )
+    _write_back(
+        db,
+        project_id,
+        current,
+        stored,
+        new_by_src,
+        removed,
+        component_of,
+    )
+    edges = [
+        row
+        for src, rows in old_by_src.items()
+        if src in current and src not in refresh
+        for row in rows
+    ]
+    for rows in new_by_src.values():
+        edges.extend(rows)
+    return ProjectImportGraph(
+        rel_by_file_id=rel_by_id,
+        imports=_ordered(edges, rel_by_id),
+        component_of=component_of,
+        refreshed_sources=len(refresh),
+    )
+
+
+def _rows(db: Any, sql: str, params: tuple) -> List[Dict[str, Any]]:
+    """Return result rows of ``db.execute`` as a list."""
+    res = db.execute(sql, params)
+    return list((res.get("data") if isinstance(res, dict) else res) or [])
+
+
+def _as_float(value: Any) -> Optional[float]:
+    """Return ``value`` as float (None stays None)."""
+    return None if value is None else float(value)
+
+
+def _chunks(values: Iterable[str], size: int) -> Iterable[List[str]]:
+    """Yield sorted ``values`` in lists of at most ``size``."""
+    ordered = sorted(values)
+    for start in range(0, len(ordered), size):
+        yield ordered[start : start + size]
+
+
+def _load_edges(
+    db: Any, project_id: str, *, project_only: bool = False
+) -> List[StoredImport]:
+    """Load stored import rows of the project."""
+    where = " AND target_file_id IS NOT NULL" if project_only else ""
+    rows = _rows(
+        db,
+        f"SELECT src_file_id, ordinal, module, name, import_type, kind, "
+        f"resolved_module, target_file_id FROM import_graph_edges "
+        f"WHERE project_id = ?{where}",
+        (project_id,),
+    )
+    return [
+        StoredImport(
+            src_file_id=str(r["src_file_id"]),
+            ordinal=int(r["ordinal"]),
+            module=r["module"],
+            name=r["name"],
+            import_type=r["import_type"],
+            kind=str(r["kind"]),
+            resolved_module=str(r["resolved_module"] or ""),
+            target_file_id=(
+                str(r["target_file_id"]) if r["target_file_id"] is not None else None
+            ),
+        )
+        for r in rows
+    ]
+
+
+def _ordered(
+    edges: List[StoredImport], rel_by_id: Dict[str, str]
+) -> List[StoredImport]:
+    """Keep edges of active sources, ordered by source path then position."""
+    return sorted(
+        (e for e in edges if e.src_file_id in rel_by_id),
+        key=lambda e: (rel_by_id[e.src_file_id], e.ordinal),
+    )
+
+
+def _read_imports(
+    db: Any, project_id: str, file_ids: Set[str]
+) -> Dict[str, List[Tuple[Any, Any, Any]]]:
+    """Read ``imports`` rows of ``file_ids`` as ``(module, name, import_type)`` in file order."""
+    if not file_ids:
+        return {}
+    select = "SELECT i.file_id, i.module, i.name, i.import_type, i.line FROM imports i"
+    if len(file_ids) > _READ_PROJECT_WIDE_FILES:
+        rows = _rows(
+            db,
+            f"{select} JOIN files f ON f.id = i.file_id WHERE f.project_id = ?",
+            (project_id,),
+        )
+    else:
+        rows = []
+        for chunk in _chunks(file_ids, _IN_CHUNK):
+            rows.extend(
+                _rows(
+                    db,
+                    f"{select} WHERE i.file_id IN ({','.join('?' * len(chunk))})",
+                    tuple(chunk),
+                )
+            )
+    by_file: Dict[str, List[Tuple[int, str, str, Tuple[Any, Any, Any]]]] = {}
+    for r in rows:
+        fid = str(r["file_id"])
+        if fid not in file_ids:
+            continue
+        by_file.setdefault(fid, []).append(
+            (
+                int(r.get("line") or 0),
+                str(r.get("name") or ""),
+                str(r.get("module") or ""),
+                (r.get("module"), r.get("name"), r.get("import_type")),
+            )
+        )
+    return {
+        fid: [item[3] for item in sorted(items, key=lambda t: t[:3])]
+        for fid, items in by_file.items()
+    }
+
+
+def _resolve(
+    resolver: ModulePathResolver,
+    id_by_rel: Dict[str, str],
+    src: str,
+    src_rel: str,
+    ordinal: int,
+    module: Any,
+    name: Any,
+    import_type: Any,
+) -> StoredImport:
+    """Resolve one import row of ``src`` into a :class:`StoredImport`."""
+    resolved = resolver.resolve(
+        module=module, name=name, import_type=import_type, importer_rel=src_rel
+    )
+    return StoredImport(
+        src_file_id=src,
+        ordinal=ordinal,
+        module=module,
+        name=name,
+        import_type=import_type,
+        kind=resolved.kind,
+        resolved_module=resolved.module,
+        target_file_id=id_by_rel.get(resolved.rel_path or ""),
+    )
+
+
+def _targets(rows: Iterable[StoredImport]) -> Set[str]:
+    """Project files imported by ``rows`` (self-imports excluded)."""
+    return {
+        r.target_file_id
+        for r in rows
+        if r.target_file_id is not None and r.target_file_id != r.src_file_id
+    }
+
+
+def _patch_components(
+    stored: Dict[str, Dict[str, Any]],
+    old_by_src: Dict[str, List[StoredImport]],
+    new_by_src: Dict[str, List[StoredImport]],
+    removed: Set[str],
+    current: Dict[str, ImportGraphFile],
+    refresh: Set[str],
+) -> Dict[str, str]:
+    """Return file -> component id after applying the re-resolved edges."""
+    old_adjacency = {src: _targets(rows) for src, rows in old_by_src.items()}
+    if not stored or len(refresh) > max(PATCH_MAX_SOURCES, len(current) // 10):
+        adjacency: Dict[str, Set[str]] = {fid: set() for fid in current}
+        for src, targets in old_adjacency.items():
+            if src in current and src not in refresh:
+                adjacency[src] = {t for t in targets if t in current}
+        for src, rows in new_by_src.items():
+            adjacency[src] = _targets(rows)
+        return SccIndex(adjacency).component_of()
+
+    index = SccIndex(
+        old_adjacency,
+        component_of={
+            fid: str(row["scc_id"])
+            for fid, row in stored.items()
+            if row["scc_id"] is not None
+        },
+    )
+    for fid in current:
+        index.add_node(fid)
+    removed_edges: List[Tuple[str, str]] = []
+    added_edges: List[Tuple[str, str]] = []
+    for src, rows in new_by_src.items():
+        before = old_adjacency.get(src, set())
+        after = _targets(rows)
+        removed_edges.extend((src, t) for t in before - after)
+        added_edges.extend((src, t) for t in sorted(after - before))
+    index.update(
+        removed_nodes=removed, removed_edges=removed_edges, added_edges=added_edges
+    )
+    return index.component_of()
+
+
+def _write_back(
+    db: Any,
+    project_id: str,
+    current: Dict[str, ImportGraphFile],
+    stored: Dict[str, Dict[str, Any]],
+    new_by_src: Dict[str, List[StoredImport]],
+    removed: Set[str],
+    component_of: Dict[str, str],
+) -> None:
+    """Persist re-resolved edges and changed node rows in one transaction."""
+    node_writes = {
+        fid
+        for fid, f in current.items()
+        if fid not in stored
+        or stored[fid]["rel_path"] != f.rel_path
+        or _as_float(stored[fid]["source_updated_at"]) != f.updated_at
+        or (None if stored[fid]["scc_id"] is None else str(stored[fid]["scc_id"]))
+        != component_of.get(fid)
+    }
+    ops: List[Tuple[str, tuple]] = []
+    for chunk in _chunks(set(new_by_src) | removed, _IN_CHUNK):
+        ops.append(
+            (
+                f"DELETE FROM import_graph_edges WHERE project_id = ? "
+                f"AND src_file_id IN ({','.join('?' * len(chunk))})",
+                (project_id, *chunk),
+            )
+        )
+    edge_rows = [
+        (
+            project_id,
+            r.src_file_id,
+            r.ordinal,
+            r.module,
+            r.name,
+            r.import_type,
+            r.kind,
+            r.resolved_module,
+            r.target_file_id,
+        )
+        for src in sorted(new_by_src)
+        for r in new_by_src[src]
+    ]
+    ops.extend(_insert_ops("import_graph_edges", _EDGE_COLUMNS, edge_rows))
+    for chunk in _chunks(node_writes | removed, _IN_CHUNK):
+        ops.append(
+            (
+                f"DELETE FROM import_graph_nodes WHERE project_id = ? "
+                f"AND file_id IN ({','.join('?' * len(chunk))})",
+                (project_id, *chunk),
+            )
+        )
+    node_rows = [
+        (
+            project_id,
+            fid,
+            current[fid].rel_path,
+            current[fid].updated_at,
+            component_of.get(fid),
+        )
+        for fid in sorted(node_writes)
+    ]
+    ops.extend(_insert_ops("import_graph_nodes", _NODE_COLUMNS, node_rows))
+    if not ops:
+        return
+    try:
+        _run_in_transaction(db, ops)
+    except Exception as exc:
+        logger.warning(
+            "import graph write-back failed for project %s (%d statements): %s",
+            project_id,
+            len(ops),
+            exc,
+        )
+
+
+def _insert_ops(table: str, columns: str, rows: List[tuple]) -> List[Tuple[str, tuple]]:
+    """Multi-row INSERT statements for ``rows``."""
+    ops: List[Tuple[str, tuple]] = []
+    if not rows:
+        return ops
+    placeholders = "(" + ",".join("?" * len(rows[0])) + ")"
+    for start in range(0, len(rows), _INSERT_CHUNK):
+        chunk = rows[start : start + _INSERT_CHUNK]
+        params: List[Any] = []
+        for row in chunk:
+            params.extend(row)
+        ops.append(
+            (
+                f"INSERT INTO {table} ({columns}) VALUES "
+                + ",".join([placeholders] * len(chunk)),
+                tuple(params),
+            )
+        )
+    return ops
+
+
+def _run_in_transaction(db: Any, ops: List[Tuple[str, tuple]]) -> None:
+    """Run ``ops`` in one transaction when the client supports it."""
+    if hasattr(db, "begin_transaction") and hasattr(db, "execute_batch"):
+        tid = db.begin_transaction()
+        try:
+            db.execute_batch(ops, transaction_id=tid)
+            db.commit_transaction(tid)
+        except Exception:
+            db.rollback_transaction(tid)
+            raise
+        return
+    for sql, params in ops:
+        db.execute(sql, params)
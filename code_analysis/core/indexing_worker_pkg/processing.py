@@ -47,6 +47,8 @@ from code_analysis.core.database.files.update_standalone import (
     index_file_via_driver,
 )
 from code_analysis.core.runtime_lock_sessions import register_runtime_session
+from code_analysis.core.shared_library_index import claim_shared_library_file
+from code_analysis.core.venv_path_policy import path_is_under_project_local_venv
 
 logger = logging.getLogger(__name__)
 
@@ -87,6 +89,33 @@ def _docs_relative_path_from_row_path(*, path: str, project_root: Path) -> str:
         return ""
 
 
+def _claim_shared_library_file(
+    database: Any, project_id: str, file_id: Any, path: str, project_root: Path
+) -> None:
+    """
+    Register an allowlisted venv file as a copy of a shared library file.
+
+    The file is still indexed normally (entities, AST/CST, code_content stay
+    per project); only its chunks and embeddings are shared with the other
+    copies (see ``core/shared_library_index``). Failures are logged and ignored.
+    """
+    p = Path(path)
+    abs_p = p if p.is_absolute() else project_root / p
+    if not path_is_under_project_local_venv(abs_p, project_root):
+        return
+    try:
+        claim_shared_library_file(
+            database, project_id, file_id, str(abs_p), project_root
+        )
+    except Exception as e:
+        logger.warning(
+            "Shared library claim failed for file_id=%s path=%s: %s",
+            file_id,
+            path[:120],
+            e,
+        )
+
+
 async def process_cycle(self: Any, poll_interval: int = 30) -> Dict[str, Any]:
     """Run indexing cycles until stop: query projects with needs_chunking=1, index batch per project.
 
@@ -436,6 +465,14 @@ async def process_cycle(self: Any, poll_interval: int = 30) -> Dict[str, Any]:
                                             rpc_priority=BACKGROUND_WORKER_DB_RPC_PRIORITY,
                                         )
                                         continue
+                                    if is_python and proj_root_for_docs is not None:
+                                        _claim_shared_library_file(
+                                            database,
+                                            project_id,
+                                            row.get("id"),
+                                            path,
+                                            proj_root_for_docs,
+                                        )
                                     file_start = time.time()
                                     progress_pct = (
                                         round(
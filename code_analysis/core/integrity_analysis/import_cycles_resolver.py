@@ -7,8 +7,10 @@ import X`` stored as ``module='tree_builder_index'``) against full path-derived
 module keys, and so reported ZERO cycles where ``analyze_tree`` reported several
 (TZ-CA-INDEX-INTEGRITY-001 C-3).
 
-This uses the SAME ``ModulePathResolver`` + ``find_cycles`` as ``analyze_tree``
-(both now in ``core.import_graph``), so the two detectors agree by construction.
+This reads the SAME persisted import graph as ``analyze_tree``
+(``core.import_graph.store``: one ``ModulePathResolver`` resolution, cycle
+components kept up to date incrementally), so the two detectors agree by
+construction.
 Returns cycles as lists of ``file_id`` strings, matching the shape the issues
 registry already consumes.
 
@@ -21,7 +23,7 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Any, List, Optional
 
-from code_analysis.core.import_graph import ModulePathResolver, find_cycles
+from code_analysis.core.import_graph import ImportGraphFile, sync_import_graph
 from code_analysis.core.sql_portable import WHERE_FILES_ACTIVE
 
 DEFAULT_MAX_CHAIN_DEPTH = 10
@@ -64,7 +66,7 @@ def fetch_import_cycles_resolver(
     cycles of any length and does not need a hop bound.
     """
     file_res = database.execute(
-        f"SELECT id, path, relative_path FROM files "
+        f"SELECT id, path, relative_path, updated_at FROM files "
         f"WHERE project_id = ? AND {WHERE_FILES_ACTIVE}",
         (project_id,),
     )
@@ -72,44 +74,19 @@ def fetch_import_cycles_resolver(
         file_res.get("data", []) if isinstance(file_res, dict) else (file_res or [])
     )
 
-    rel_by_id: dict[str, str] = {}
-    id_by_rel: dict[str, str] = {}
+    files: List[ImportGraphFile] = []
     for row in file_rows:
-        fid = str(_rv(row, "id"))
         rel = _rel_of(_rv(row, "path"), _rv(row, "relative_path"), project_root)
         if not rel:
             continue
-        rel_by_id[fid] = rel
-        id_by_rel[rel] = fid
-
-    resolver = ModulePathResolver(rel_by_id.values())
-
-    imp_res = database.execute(
-        """
-        SELECT i.file_id, i.module, i.name, i.import_type
-        FROM imports i
-        JOIN files f ON f.id = i.file_id
-        WHERE f.project_id = ?
-        """,
-        (project_id,),
-    )
-    imp_rows = imp_res.get("data", []) if isinstance(imp_res, dict) else (imp_res or [])
-
-    adjacency: dict[str, set[str]] = {fid: set() for fid in rel_by_id}
-    for row in imp_rows:
-        src_id = str(_rv(row, "file_id"))
-        src_rel = rel_by_id.get(src_id)
-        if not src_rel:
-            continue
-        resolved = resolver.resolve(
-            module=_rv(row, "module"),
-            name=_rv(row, "name"),
-            import_type=_rv(row, "import_type"),
-            importer_rel=src_rel,
+        updated_at = _rv(row, "updated_at")
+        files.append(
+            ImportGraphFile(
+                str(_rv(row, "id")),
+                rel,
+                float(updated_at) if updated_at is not None else None,
+            )
         )
-        if resolved.kind == "project" and resolved.rel_path:
-            tgt_id = id_by_rel.get(resolved.rel_path)
-            if tgt_id and tgt_id != src_id:
-                adjacency[src_id].add(tgt_id)
 
-    return find_cycles(adjacency)
+    graph = sync_import_graph(database, project_id, files, project_only=True)
+    return graph.cycles()
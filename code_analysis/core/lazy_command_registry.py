@@ -0,0 +1,418 @@
+"""
+Lazy, manifest-backed command registration (optional).
+
+Eager registration imports every command module (and with them LibCST, numpy,
+faiss, dulwich, ...) before the server can answer a heartbeat. In lazy mode the
+first successful eager registration writes a manifest with, per command, its
+module path, class qualname, identity attributes, schema and finalized
+metadata. Later startups register lightweight stub classes built from that
+manifest; a stub imports its real module on first invocation, re-registers the
+real class in place of itself and delegates. :func:`start_lazy_command_prewarm`
+can import the remaining modules in a background thread once the server is up.
+
+The manifest is only used while the package tree (every ``.py`` path, mtime
+and size), the Python version and the mcp_proxy_adapter version are unchanged;
+otherwise registration falls back to the eager path, which rewrites it.
+
+Enabled by ``CODE_ANALYSIS_LAZY_COMMANDS=1``. An environment variable (not a
+config key) because the registration hook first runs when ``code_analysis.hooks``
+is imported, before the server config is loaded.
+
+Author: Vasiliy Zdanovskiy
+email: vasilyvz@gmail.com
+"""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import hashlib
+import importlib
+import json
+import logging
+import os
+import sys
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Type, cast
+
+from mcp_proxy_adapter.commands.base import Command
+
+logger = logging.getLogger(__name__)
+
+ENV_LAZY_COMMANDS = "CODE_ANALYSIS_LAZY_COMMANDS"
+ENV_LAZY_COMMANDS_PREWARM = "CODE_ANALYSIS_LAZY_COMMANDS_PREWARM"
+ENV_COMMAND_MANIFEST = "CODE_ANALYSIS_COMMAND_MANIFEST"
+
+MANIFEST_FORMAT = 1
+MANIFEST_DIR_NAME = "command_manifests"
+
+# Class attributes the adapter reads from the registered class before it
+# instantiates or runs it (help payloads, queue routing, naming).
+MANIFEST_CLASS_ATTRS = (
+    "name",
+    "version",
+    "descr",
+    "category",
+    "author",
+    "email",
+    "use_queue",
+)
+
+_PACKAGE_DIR = Path(__file__).resolve().parent.parent
+_FALSE_VALUES = ("0", "false", "no", "off")
+
+_enabled_override: Optional[bool] = None
+_prewarm_override: Optional[bool] = None
+_resolve_lock = threading.RLock()
+
+
+def configure_lazy_commands(
+    *, enabled: Optional[bool] = None, prewarm: Optional[bool] = None
+) -> None:
+    """Override the environment toggles (tests and embedders)."""
+    global _enabled_override, _prewarm_override
+    if enabled is not None:
+        _enabled_override = bool(enabled)
+    if prewarm is not None:
+        _prewarm_override = bool(prewarm)
+
+
+def lazy_commands_enabled() -> bool:
+    """Return whether commands are registered from the manifest (default off)."""
+    if _enabled_override is not None:
+        return _enabled_override
+    env = (os.environ.get(ENV_LAZY_COMMANDS) or "").strip().lower()
+    return bool(env) and env not in _FALSE_VALUES
+
+
+def prewarm_enabled() -> bool:
+    """Return whether stub modules are imported in the background (default on)."""
+    if _prewarm_override is not None:
+        return _prewarm_override
+    env = os.environ.get(ENV_LAZY_COMMANDS_PREWARM)
+    if env is not None:
+        return env.strip().lower() not in _FALSE_VALUES
+    return True
+
+
+def default_manifest_path() -> Path:
+    """
+    Return the manifest path for this installation.
+
+    ``CODE_ANALYSIS_COMMAND_MANIFEST`` wins; otherwise one file per package
+    directory under the user state home, so several checkouts on one host do
+    not keep invalidating each other's manifest.
+    """
+    explicit = (os.environ.get(ENV_COMMAND_MANIFEST) or "").strip()
+    if explicit:
+        return Path(explicit).expanduser()
+    from .runtime_state_root import default_state_home
+
+    key = hashlib.sha256(str(_PACKAGE_DIR).encode("utf-8")).hexdigest()[:16]
+    return default_state_home() / MANIFEST_DIR_NAME / f"{key}.json"
+
+
+def package_fingerprint(package_dir: Optional[Path] = None) -> str:
+    """Return a digest of the package's ``.py`` files plus runtime versions."""
+    import mcp_proxy_adapter
+
+    root = Path(package_dir) if package_dir is not None else _PACKAGE_DIR
+    digest = hashlib.sha256()
+    digest.update(f"{sys.version}\0".encode("utf-8"))
+    adapter_version = getattr(mcp_proxy_adapter, "__version__", "")
+    digest.update(f"{adapter_version}\0".encode("utf-8"))
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames if d != "__pycache__")
+        for filename in sorted(filenames):
+            if not filename.endswith(".py"):
+                continue
+            path = os.path.join(dirpath, filename)
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            rel = os.path.relpath(path, root)
+            digest.update(f"{rel}\0{st.st_mtime_ns}\0{st.st_size}\n".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _manifest_entry(name: str, cmd_cls: Type[Any], cmd_type: str) -> Dict[str, Any]:
+    """Describe one registered command class for the manifest."""
+    entry: Dict[str, Any] = {
+        "name": name,
+        "cmd_type": cmd_type,
+        "module": cmd_cls.__module__,
+        "qualname": cmd_cls.__qualname__,
+        "doc": cmd_cls.__doc__,
+        "attrs": {
+            attr: getattr(cmd_cls, attr)
+            for attr in MANIFEST_CLASS_ATTRS
+            if hasattr(cmd_cls, attr)
+        },
+        "schema": cmd_cls.get_schema(),
+        "metadata": cmd_cls.metadata(),
+    }
+    if "get_result_schema" in vars(cmd_cls):
+        entry["result_schema"] = cmd_cls.get_result_schema()
+    return entry
+
+
+def build_command_manifest(
+    reg: Any,
+    *,
+    fingerprint: str,
+    module_prefix: str = "code_analysis.",
+) -> Optional[Dict[str, Any]]:
+    """
+    Build a manifest from the commands currently registered in ``reg``.
+
+    Returns None when some command cannot be served from a manifest (a class
+    not reachable as ``module.qualname``, or schema/metadata that is not plain
+    JSON); lazy mode then stays on the eager path.
+    """
+    commands: Dict[str, Any] = reg.get_all_commands()
+    command_types: Dict[str, str] = dict(getattr(reg, "_command_types", {}) or {})
+    entries: List[Dict[str, Any]] = []
+    for name in sorted(commands):
+        cmd_cls = commands[name]
+        if not isinstance(cmd_cls, type) or issubclass(cmd_cls, LazyCommand):
+            continue
+        if not (cmd_cls.__module__ or "").startswith(module_prefix):
+            continue
+        try:
+            found = _import_command_class(cmd_cls.__module__, cmd_cls.__qualname__)
+            if found is not cmd_cls:
+                raise ImportError("class is not reachable by qualname")
+            entry = _manifest_entry(name, cmd_cls, command_types.get(name, "custom"))
+            if json.loads(json.dumps(entry)) != entry:
+                raise ValueError("schema or metadata is not plain JSON")
+        except Exception as e:
+            logger.info("[LAZY_COMMANDS] %s cannot be served lazily: %s", name, e)
+            return None
+        entries.append(entry)
+    return {"format": MANIFEST_FORMAT, "fingerprint": fingerprint, "commands": entries}
+
+
+def save_command_manifest(reg: Any, path: Optional[Path] = None) -> bool:
+    """Write the manifest for ``reg`` atomically; return True when written."""
+    if not hasattr(reg, "get_all_commands"):
+        return False
+    manifest = build_command_manifest(reg, fingerprint=package_fingerprint())
+    if manifest is None:
+        return False
+    target = Path(path) if path is not None else default_manifest_path()
+    tmp = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+    try:
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp.write_text(json.dumps(manifest), encoding="utf-8")
+        os.replace(tmp, target)
+    except OSError as e:
+        logger.warning("[LAZY_COMMANDS] cannot write manifest %s: %s", target, e)
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+        return False
+    logger.info(
+        "[LAZY_COMMANDS] wrote manifest with %d commands to %s",
+        len(manifest["commands"]),
+        target,
+    )
+    return True
+
+
+def load_command_manifest(
+    path: Optional[Path] = None, *, fingerprint: Optional[str] = None
+) -> Optional[Dict[str, Any]]:
+    """Return the manifest when present and current, else None."""
+    source = Path(path) if path is not None else default_manifest_path()
+    try:
+        manifest = json.loads(source.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(manifest, dict) or manifest.get("format") != MANIFEST_FORMAT:
+        return None
+    expected = fingerprint if fingerprint is not None else package_fingerprint()
+    if manifest.get("fingerprint") != expected:
+        logger.info("[LAZY_COMMANDS] manifest %s is stale", source)
+        return None
+    if not isinstance(manifest.get("commands"), list):
+        return None
+    return manifest
+
+
+def _import_command_class(module: str, qualname: str) -> Type[Any]:
+    """Import ``module`` and return the attribute at ``qualname``."""
+    obj: Any = importlib.import_module(module)
+    for part in qualname.split("."):
+        obj = getattr(obj, part)
+    return cast(Type[Any], obj)
+
+
+class LazyCommand(Command):
+    """
+    Stand-in registered under a command's name until its module is imported.
+
+    Schema, metadata and identity attributes come from the manifest. Any call
+    that needs the real command resolves it first (see
+    :meth:`resolve_command_class`).
+    """
+
+    _lazy_entry: Dict[str, Any] = {}
+    _lazy_registry: Any = None
+    _lazy_resolved: Optional[Type[Command]] = None
+    _metadata_finalized = True
+
+    @classmethod
+    def get_schema(cls) -> Dict[str, Any]:
+        """Return the cached parameter schema."""
+        return copy.deepcopy(cls._lazy_entry["schema"])
+
+    @classmethod
+    def metadata(cls) -> Dict[str, Any]:
+        """Return the cached finalized metadata."""
+        return copy.deepcopy(cls._lazy_entry["metadata"])
+
+    @classmethod
+    def get_result_schema(cls) -> Dict[str, Any]:
+        """Return the cached result schema, or the adapter default."""
+        if "result_schema" in cls._lazy_entry:
+            return copy.deepcopy(cls._lazy_entry["result_schema"])
+        return super().get_result_schema()
+
+    @classmethod
+    def resolve_command_class(cls) -> Type[Command]:
+        """Import the real command class and swap it into the registry."""
+        resolved = cls._lazy_resolved
+        if resolved is not None:
+            return resolved
+        with _resolve_lock:
+            if cls._lazy_resolved is not None:
+                return cls._lazy_resolved
+            entry = cls._lazy_entry
+            real = _import_command_class(entry["module"], entry["qualname"])
+            from ..commands.command_metadata_helpers import (
+                wrap_command_metadata_class,
+            )
+
+            wrap_command_metadata_class(real)
+            reg = cls._lazy_registry
+            try:
+                if reg is not None and reg.get_command(entry["name"]) is cls:
+                    reg.register(real, entry.get("cmd_type", "custom"))
+            except KeyError:
+                pass
+            cls._lazy_resolved = real
+            logger.debug("[LAZY_COMMANDS] loaded %s", entry["name"])
+            return real
+
+    @classmethod
+    async def run(cls, **kwargs: Any) -> Any:
+        """Resolve off the event loop, then run the real command."""
+        real = await asyncio.to_thread(cls.resolve_command_class)
+        return await real.run(**kwargs)
+
+    def validate_params(self, params: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Validate with the real command (nested specs, relations)."""
+        real = type(self).resolve_command_class()
+        return real().validate_params(params)
+
+    async def execute(self, **kwargs: Any) -> Any:
+        """Execute the real command (direct ``cls().execute`` callers)."""
+        real = await asyncio.to_thread(type(self).resolve_command_class)
+        return await real().execute(**kwargs)
+
+
+def _make_lazy_command(entry: Dict[str, Any], reg: Any) -> Type[LazyCommand]:
+    """Build the stub class for one manifest entry."""
+    namespace: Dict[str, Any] = dict(entry.get("attrs") or {})
+    namespace.update(
+        {
+            # The real module keeps hook discovery (auto-import in spawn
+            # children) and ``code_analysis.`` prefix checks unchanged.
+            "__module__": entry["module"],
+            "__qualname__": entry["qualname"],
+            "__doc__": entry.get("doc"),
+            "_lazy_entry": entry,
+            "_lazy_registry": reg,
+        }
+    )
+    class_name = entry["qualname"].rpartition(".")[2]
+    return type(class_name, (LazyCommand,), namespace)
+
+
+def register_lazy_commands(reg: Any, path: Optional[Path] = None) -> bool:
+    """
+    Register every manifest command in ``reg``; False means "register eagerly".
+
+    Commands whose module is already imported are registered as the real
+    class right away.
+    """
+    manifest = load_command_manifest(path)
+    if manifest is None:
+        return False
+    from ..commands.command_metadata_helpers import wrap_command_metadata_class
+
+    stubs = 0
+    for entry in manifest["commands"]:
+        cmd_type = entry.get("cmd_type", "custom")
+        if entry["module"] in sys.modules:
+            try:
+                real = _import_command_class(entry["module"], entry["qualname"])
+            except AttributeError:
+                real = None
+            if real is not None:
+                reg.register(wrap_command_metadata_class(real), cmd_type)
+                continue
+        reg.register(_make_lazy_command(entry, reg), cmd_type)
+        stubs += 1
+    logger.info(
+        "[LAZY_COMMANDS] registered %d commands (%d deferred) from manifest",
+        len(manifest["commands"]),
+        stubs,
+    )
+    return True
+
+
+def pending_lazy_commands(reg: Any) -> List[Type[LazyCommand]]:
+    """Return the stubs in ``reg`` whose module has not been imported yet."""
+    return [
+        cmd_cls
+        for cmd_cls in reg.get_all_commands().values()
+        if isinstance(cmd_cls, type)
+        and issubclass(cmd_cls, LazyCommand)
+        and cmd_cls._lazy_resolved is None
+    ]
+
+
+def prewarm_lazy_commands(reg: Any) -> int:
+    """Import every pending stub module; return how many commands were loaded."""
+    loaded = 0
+    for stub in pending_lazy_commands(reg):
+        try:
+            stub.resolve_command_class()
+            loaded += 1
+        except Exception as e:
+            logger.warning(
+                "[LAZY_COMMANDS] pre-warm of %s failed: %s",
+                stub._lazy_entry.get("name"),
+                e,
+            )
+    return loaded
+
+
+def start_lazy_command_prewarm(reg: Any = None) -> Optional[threading.Thread]:
+    """Start the background pre-warm thread when lazy stubs are registered."""
+    if reg is None:
+        from mcp_proxy_adapter.commands.command_registry import registry as reg
+    if not prewarm_enabled() or not pending_lazy_commands(reg):
+        return None
+
+    def _run() -> None:
+        loaded = prewarm_lazy_commands(reg)
+        logger.info("[LAZY_COMMANDS] pre-warm loaded %d commands", loaded)
+
+    thread = threading.Thread(target=_run, name="lazy-command-prewarm", daemon=True)
+    thread.start()
+    return thread
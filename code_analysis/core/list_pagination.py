@@ -1,5 +1,13 @@
 """
-Shared offset pagination for list-style MCP commands (search-aligned response shape).
+Shared pagination for list-style MCP commands (search-aligned response shape).
+
+Two modes are supported:
+
+* offset pagination (``page_size`` / ``block_position`` / legacy ``offset``);
+* keyset pagination via an opaque ``cursor``: the response carries
+  ``next_cursor`` encoding the sort key of the last row, and the next request
+  resumes with ``WHERE (sort columns) > (key)``. Deep pages cost the same as
+  the first one and rows do not shift when indexing runs between pages.
 
 Author: Vasiliy Zdanovskiy
 email: vasilyvz@gmail.com
@@ -7,13 +15,32 @@ email: vasilyvz@gmail.com
 
 from __future__ import annotations
 
-from typing import Any, Mapping, MutableMapping, Sequence, TypeVar
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Mapping,
+    MutableMapping,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
+
+from .exceptions import ValidationError
 
 DEFAULT_LIST_PAGE_SIZE = 20
 MAX_LIST_PAGE_SIZE = 200
 
 T = TypeVar("T")
 
+#: Keyset sort key of one row (compared as a tuple, column by column).
+KeysetKey = Tuple[Any, ...]
+
 
 def list_pagination_schema_properties(
     *,
@@ -167,3 +194,223 @@ def apply_pagination_fields(
         }
     )
     return dict(payload)
+
+
+def list_cursor_schema_property() -> dict[str, dict[str, Any]]:
+    """Schema field for keyset pagination (``cursor`` from ``next_cursor``)."""
+    return {
+        "cursor": {
+            "type": "string",
+            "description": (
+                "Opaque keyset cursor: pass ``next_cursor`` from the previous "
+                "response to fetch the following page. When set, ``offset`` / "
+                "``block_position`` are ignored. Pass an empty string to start "
+                "a cursor walk from the first row."
+            ),
+        },
+    }
+
+
+def encode_list_cursor(scope: str, key: Sequence[Any]) -> str:
+    """Encode ``key`` of the last returned row as an opaque cursor for ``scope``."""
+    raw = json.dumps([scope, list(key)], separators=(",", ":"), default=str)
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_list_cursor(cursor: str, *, scope: str, key_length: int) -> KeysetKey:
+    """
+    Decode a cursor produced by :func:`encode_list_cursor`.
+
+    Raises:
+        ValidationError: When the cursor is malformed or was issued for another
+            listing (different ``scope`` or key shape).
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        decoded = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (ValueError, UnicodeError, binascii.Error) as e:
+        raise ValidationError("Malformed pagination cursor", field="cursor") from e
+    if (
+        not isinstance(decoded, list)
+        or len(decoded) != 2
+        or decoded[0] != scope
+        or not isinstance(decoded[1], list)
+        or len(decoded[1]) != key_length
+    ):
+        raise ValidationError(
+            "Pagination cursor does not belong to this listing",
+            field="cursor",
+            details={"scope": scope},
+        )
+    return tuple(decoded[1])
+
+
+def resolve_list_cursor(
+    params: Mapping[str, Any], *, scope: str, key_length: int
+) -> tuple[bool, Optional[KeysetKey]]:
+    """
+    Return ``(keyset_mode, after_key)`` from request params.
+
+    ``cursor`` absent -> offset mode; empty string -> keyset mode from the
+    first row; otherwise the decoded key of the last row already returned.
+    """
+    cursor = params.get("cursor")
+    if cursor is None:
+        return False, None
+    if cursor == "":
+        return True, None
+    return True, decode_list_cursor(str(cursor), scope=scope, key_length=key_length)
+
+
+def keyset_after_sql(
+    columns: Sequence[str], key: Optional[Sequence[Any]]
+) -> tuple[str, list[Any]]:
+    """
+    Return ``" AND (c1, c2, ...) > (?, ?, ...)"`` and its params (empty without key).
+
+    Row-value comparison lets PostgreSQL (and SQLite >= 3.15) seek a matching
+    composite index instead of scanning and discarding earlier rows.
+    """
+    if key is None:
+        return "", []
+    cols = ", ".join(columns)
+    marks = ", ".join("?" for _ in columns)
+    return f" AND ({cols}) > ({marks})", list(key)
+
+
+#: Fetches one keyset-ordered source: ``(after_key, limit) -> [(key, item)]``.
+KeysetFetch = Callable[[Optional[KeysetKey], int], Sequence[Tuple[KeysetKey, Any]]]
+
+
+@dataclass(frozen=True)
+class SqlListSource:
+    """
+    One SQL source of a list command: filtered query plus keyset ordering.
+
+    ``sql`` ends with its WHERE clause (no ORDER BY / LIMIT). ``order_columns``
+    is a unique sort (last column a row id) and ``key_fields`` names the result
+    columns holding the same values, in the same order.
+    """
+
+    sql: str
+    params: Tuple[Any, ...]
+    order_columns: Tuple[str, ...]
+    key_fields: Tuple[str, ...]
+    to_item: Callable[[Dict[str, Any]], Any]
+    enabled: bool = True
+
+    def order_by_sql(self) -> str:
+        """Return the ``ORDER BY`` clause shared by offset and keyset pages."""
+        return " ORDER BY " + ", ".join(self.order_columns)
+
+    def keyset_fetch(self, db: Any) -> KeysetFetch:
+        """Return a :data:`KeysetFetch` running this source on ``db``."""
+
+        def fetch(
+            after: Optional[KeysetKey], limit: int
+        ) -> list[Tuple[KeysetKey, Any]]:
+            if not self.enabled:
+                return []
+            keyset, keyset_params = keyset_after_sql(self.order_columns, after)
+            query = self.sql + keyset + self.order_by_sql() + " LIMIT ?"
+            result = db.execute(query, (*self.params, *keyset_params, limit))
+            return [
+                (tuple(row.get(name) for name in self.key_fields), self.to_item(row))
+                for row in result.get("data") or []
+            ]
+
+        return fetch
+
+
+def walk_keyset_sources(
+    sources: Sequence[KeysetFetch],
+    *,
+    page_size: int,
+    after: Optional[Sequence[Any]] = None,
+) -> tuple[list[Any], Optional[KeysetKey]]:
+    """
+    Fill one page from keyset-ordered sources walked one after another.
+
+    The page key is ``(source_index, *source_key)``: a source is exhausted
+    before the next one starts, matching how multi-source commands concatenate
+    their results. Each fetch is called with the resume key for that source
+    (None to start from its first row) and ``remaining + 1`` as the limit, so
+    one extra row tells whether more rows follow without a COUNT. A fetched
+    ``item`` may be None for rows filtered out after the query; they advance
+    the cursor but are not returned, so pages can be shorter than ``page_size``.
+
+    Args:
+        sources: Fetch callables in output order.
+        page_size: Maximum rows consumed for this page.
+        after: Decoded cursor key (``(source_index, *source_key)``) or None.
+
+    Returns:
+        ``(items, next_key)``; ``next_key`` is None on the last page.
+    """
+    items: list[Any] = []
+    remaining = page_size
+    last_key: Optional[KeysetKey] = None
+    start_index = int(after[0]) if after is not None else 0
+    for index, fetch in enumerate(sources):
+        if index < start_index:
+            continue
+        resume = (
+            tuple(after[1:]) if after is not None and index == start_index else None
+        )
+        rows = list(fetch(resume, remaining + 1))
+        if len(rows) > remaining:
+            for key, item in rows[:remaining]:
+                last_key = (index, *key)
+                if item is not None:
+                    items.append(item)
+            return items, last_key
+        for key, item in rows:
+            last_key = (index, *key)
+            if item is not None:
+                items.append(item)
+        remaining -= len(rows)
+    return items, None
+
+
+def apply_keyset_page_fields(
+    payload: MutableMapping[str, Any],
+    *,
+    scope: str,
+    next_key: Optional[Sequence[Any]],
+) -> dict[str, Any]:
+    """Merge ``next_cursor`` / ``has_more`` for a keyset page into ``payload``."""
+    payload["next_cursor"] = (
+        encode_list_cursor(scope, next_key) if next_key is not None else None
+    )
+    payload["has_more"] = next_key is not None
+    return dict(payload)
+
+
+def build_keyset_page_payload(
+    *,
+    items: Sequence[Any],
+    page_size: int,
+    scope: str,
+    next_key: Optional[Sequence[Any]],
+    legacy_items_key: str,
+) -> dict[str, Any]:
+    """
+    Build a search-aligned keyset page dict (no ``total``: no COUNT per page).
+
+    Args:
+        items: Current page rows.
+        page_size: Resolved page size.
+        scope: Cursor scope of the listing (see :func:`encode_list_cursor`).
+        next_key: Key of the last consumed row, or None on the last page.
+        legacy_items_key: ``files`` or ``entities`` for backward compatibility.
+    """
+    page_items = list(items)
+    payload: dict[str, Any] = {
+        "success": True,
+        "paginated": True,
+        "items": page_items,
+        legacy_items_key: page_items,
+        "count": len(page_items),
+        "page_size": page_size,
+    }
+    return apply_keyset_page_fields(payload, scope=scope, next_key=next_key)
@@ -0,0 +1,49 @@
+"""
+Hot-path metrics: counters, gauges and fixed-bucket latency histograms.
+
+``registry`` records samples per process (thread-safe, shared across the
+server's worker processes through published snapshots); ``prometheus``
+merges them and renders the Prometheus text format served by the ``metrics``
+command and the optional ``GET /metrics`` endpoint.
+
+Author: Vasiliy Zdanovskiy
+email: vasilyvz@gmail.com
+"""
+
+from __future__ import annotations
+
+from .prometheus import CONTENT_TYPE, collect_metrics, render_prometheus_text
+from .registry import (
+    LATENCY_BUCKETS,
+    METRICS,
+    PhaseTimer,
+    configure_metrics,
+    inc,
+    metrics_enabled,
+    observe,
+    publish_snapshot,
+    reset_metrics,
+    set_gauge,
+    snapshot,
+    timed,
+)
+from .sql_fingerprint import sql_fingerprint
+
+__all__ = [
+    "CONTENT_TYPE",
+    "collect_metrics",
+    "render_prometheus_text",
+    "LATENCY_BUCKETS",
+    "METRICS",
+    "PhaseTimer",
+    "configure_metrics",
+    "inc",
+    "metrics_enabled",
+    "observe",
+    "publish_snapshot",
+    "reset_metrics",
+    "set_gauge",
+    "snapshot",
+    "timed",
+    "sql_fingerprint",
+]
@@ -0,0 +1,30 @@
+"""
+Optional ``GET /metrics`` route serving the Prometheus text exposition.
+
+Author: Vasiliy Zdanovskiy
+email: vasilyvz@gmail.com
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from fastapi.responses import PlainTextResponse
+
+from .prometheus import CONTENT_TYPE, render_prometheus_text
+
+
+def register_metrics_route(app: Any, *, path: str = "/metrics") -> None:
+    """Register ``GET {path}`` returning the merged metrics as Prometheus text."""
+
+    def get_metrics() -> PlainTextResponse:
+        """Return get metrics."""
+        return PlainTextResponse(render_prometheus_text(), media_type=CONTENT_TYPE)
+
+    app.add_api_route(
+        path,
+        get_metrics,
+        methods=["GET"],
+        name="metrics_prometheus_text",
+        include_in_schema=False,
+    )
@@ -0,0 +1,146 @@
+"""
+Merge per-process metric snapshots and render Prometheus text format.
+
+:func:`collect_metrics` combines this process's registry with the snapshots
+other live server processes published under the metrics state dir (see
+:mod:`.registry`). Counters, gauges and histogram buckets of the same series
+are summed across processes. Snapshots of processes that no longer exist are
+removed instead of being merged, so a restarted worker does not double-count.
+
+Author: Vasiliy Zdanovskiy
+email: vasilyvz@gmail.com
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from .registry import HISTOGRAM, LATENCY_BUCKETS, metrics_state_dir, snapshot
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _peer_snapshots(state_dir: Path) -> List[Dict[str, Any]]:
+    """Snapshots published by other live processes; stale files are removed."""
+    own_pid = os.getpid()
+    out: List[Dict[str, Any]] = []
+    for path in sorted(state_dir.glob("*.json")):
+        try:
+            pid = int(path.stem)
+        except ValueError:
+            continue
+        if pid == own_pid:
+            continue
+        if not _pid_alive(pid):
+            try:
+                path.unlink()
+            except OSError:
+                pass
+            continue
+        try:
+            out.append(json.loads(path.read_text(encoding="utf-8")))
+        except (OSError, ValueError) as exc:
+            logger.debug("Skipping unreadable metrics snapshot %s: %s", path, exc)
+    return out
+
+
+def collect_metrics(state_dir: Optional[Path] = None) -> Dict[str, Dict[str, Any]]:
+    """Merged ``{name: {"type", "help", "series": {labels: value}}}``.
+
+    Args:
+        state_dir: Snapshot directory; defaults to the configured one. Without
+            one only this process's metrics are returned.
+    """
+    state_dir = state_dir if state_dir is not None else metrics_state_dir()
+    snapshots = [snapshot()]
+    if state_dir is not None and state_dir.is_dir():
+        snapshots.extend(_peer_snapshots(state_dir))
+    merged: Dict[str, Dict[str, Any]] = {}
+    for snap in snapshots:
+        for name, metric in (snap.get("metrics") or {}).items():
+            entry = merged.setdefault(
+                name, {"type": metric["type"], "help": metric["help"], "series": {}}
+            )
+            series = entry["series"]
+            for labels, value in metric.get("series") or []:
+                key: Tuple[Tuple[str, str], ...] = tuple(sorted(labels.items()))
+                series[key] = _add(metric["type"], series.get(key), value)
+    return merged
+
+
+def _add(kind: str, current: Any, value: Any) -> Any:
+    """Sum ``value`` into ``current`` (None for a new series)."""
+    if kind != HISTOGRAM:
+        return float(value) + (current or 0.0)
+    if current is None:
+        return {
+            "buckets": list(value["buckets"]),
+            "sum": float(value["sum"]),
+            "count": int(value["count"]),
+        }
+    current["buckets"] = [a + b for a, b in zip(current["buckets"], value["buckets"])]
+    current["sum"] += float(value["sum"])
+    current["count"] += int(value["count"])
+    return current
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels_text(pairs: Tuple[Tuple[str, str], ...]) -> str:
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in pairs) + "}"
+
+
+def _number(value: float) -> str:
+    if value == int(value):
+        return str(int(value))
+    return repr(float(value))
+
+
+def render_prometheus_text(metrics: Optional[Dict[str, Dict[str, Any]]] = None) -> str:
+    """Prometheus text exposition (format 0.0.4) of ``metrics``.
+
+    Args:
+        metrics: Output of :func:`collect_metrics`; collected when omitted.
+    """
+    if metrics is None:
+        metrics = collect_metrics()
+    lines: List[str] = []
+    for name in sorted(metrics):
+        metric = metrics[name]
+        lines.append(f"# HELP {name} {metric['help']}")
+        lines.append(f"# TYPE {name} {metric['type']}")
+        for pairs in sorted(metric["series"]):
+            value = metric["series"][pairs]
+            if metric["type"] != HISTOGRAM:
+                lines.append(f"{name}{_labels_text(pairs)} {_number(value)}")
+                continue
+            cumulative = 0
+            for bound, count in zip(LATENCY_BUCKETS, value["buckets"]):
+                cumulative += count
+                le = pairs + (("le", _number(bound)),)
+                lines.append(f"{name}_bucket{_labels_text(le)} {cumulative}")
+            inf = pairs + (("le", "+Inf"),)
+            lines.append(f"{name}_bucket{_labels_text(inf)} {value['count']}")
+            lines.append(f"{name}_sum{_labels_text(pairs)} {_number(value['sum'])}")
+            lines.append(f"{name}_count{_labels_text(pairs)} {value['count']}")
+    return "\n".join(lines) + "\n" if lines else ""
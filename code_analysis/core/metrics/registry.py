@@ -0,0 +1,356 @@
+"""
+In-process metrics registry: counters, gauges and fixed-bucket histograms.
+
+Hot paths record into one module-level registry guarded by a lock; each
+update is a dict lookup and a few additions, so instrumentation stays on in
+production. Every metric name is declared in :data:`METRICS` (type and help
+text), which doubles as the catalogue of what is measured.
+
+- Series are keyed by metric name and sorted label pairs. A metric keeps at
+  most :data:`MAX_SERIES_PER_METRIC` label sets; further ones are folded into
+  a single series whose label values are ``"other"``, so an unexpected label
+  source (e.g. unbounded SQL text) cannot grow memory without bound.
+- Histograms share the fixed buckets :data:`LATENCY_BUCKETS` (seconds).
+- Process safety: the server's workers are separate processes. When a state
+  directory is configured, each process atomically publishes its snapshot to
+  ``<state_dir>/<pid>.json`` at most every ``publish_interval_sec`` (and at
+  exit); :mod:`.prometheus` merges the live processes' snapshots for export.
+  A forked child starts from an empty registry so the parent's samples are
+  not counted twice.
+- Metrics are on by default: ``configure_metrics(enabled=False)`` (server
+  config ``metrics.enabled``) or ``CODE_ANALYSIS_METRICS=0`` turns recording
+  into a no-op.
+
+Author: Vasiliy Zdanovskiy
+email: vasilyvz@gmail.com
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+COUNTER = "counter"
+GAUGE = "gauge"
+HISTOGRAM = "histogram"
+
+# Seconds; the implicit +Inf bucket is the series count.
+LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+    300.0,
+)
+
+MAX_SERIES_PER_METRIC = 200
+OVERFLOW_LABEL_VALUE = "other"
+DEFAULT_PUBLISH_INTERVAL_SEC = 5.0
+
+# name -> (type, help text); every recorded metric name must be declared here.
+METRICS: Dict[str, Tuple[str, str]] = {
+    "code_analysis_sql_statement_seconds": (
+        HISTOGRAM,
+        "PostgreSQL statement execution time by statement fingerprint.",
+    ),
+    "code_analysis_sql_errors_total": (
+        COUNTER,
+        "PostgreSQL statements that raised, by statement fingerprint.",
+    ),
+    "code_analysis_pool_wait_seconds": (
+        HISTOGRAM,
+        "Time spent waiting for a connection pool slot, by lane.",
+    ),
+    "code_analysis_pool_timeouts_total": (
+        COUNTER,
+        "Connection pool acquires that timed out, by lane.",
+    ),
+    "code_analysis_analyze_file_phase_seconds": (
+        HISTOGRAM,
+        "Time spent in each analyze_file phase (read, parse, ast, cst, ...).",
+    ),
+    "code_analysis_analyze_file_total": (
+        COUNTER,
+        "analyze_file calls by outcome.",
+    ),
+    "code_analysis_svo_request_seconds": (
+        HISTOGRAM,
+        "Chunker/embedding service round-trip time, by service and outcome.",
+    ),
+    "code_analysis_search_phase_seconds": (
+        HISTOGRAM,
+        "Search phase durations reported at profile checkpoints.",
+    ),
+    "code_analysis_watcher_scan_phase_seconds": (
+        HISTOGRAM,
+        "File watcher scan cycle phase durations.",
+    ),
+    "code_analysis_operation_seconds": (
+        HISTOGRAM,
+        "Worker operation durations reported through log_operation_timing.",
+    ),
+}
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+_lock = threading.Lock()
+# (name, labels) -> float (counter/gauge) or [bucket counts..., sum, count].
+_series: Dict[Tuple[str, LabelKey], Any] = {}
+_series_per_metric: Dict[str, int] = {}
+_last_publish = 0.0
+_publishing = False
+
+# Configuration (set via configure_metrics(); otherwise env/defaults).
+_enabled_override: Optional[bool] = None
+_state_dir_override: Optional[Path] = None
+_publish_interval_override: Optional[float] = None
+
+
+def configure_metrics(
+    *,
+    enabled: Optional[bool] = None,
+    state_dir: Optional[Path] = None,
+    publish_interval_sec: Optional[float] = None,
+) -> None:
+    """Override metrics settings (call once at startup from server config).
+
+    Args:
+        enabled: Record metrics at all (default on).
+        state_dir: Directory for per-process snapshots; without it only the
+            calling process's own samples are exported.
+        publish_interval_sec: Minimum time between snapshot writes.
+    """
+    global _enabled_override, _state_dir_override, _publish_interval_override
+    if enabled is not None:
+        _enabled_override = bool(enabled)
+    if state_dir is not None:
+        _state_dir_override = Path(state_dir)
+    if publish_interval_sec is not None and float(publish_interval_sec) > 0:
+        _publish_interval_override = float(publish_interval_sec)
+
+
+def metrics_enabled() -> bool:
+    """Return whether metrics are recorded (default on)."""
+    if _enabled_override is not None:
+        return _enabled_override
+    env = os.environ.get("CODE_ANALYSIS_METRICS")
+    if env is not None:
+        return env.strip().lower() in ("1", "true", "yes", "on")
+    return True
+
+
+def metrics_state_dir() -> Optional[Path]:
+    """Directory holding per-process snapshots, or None when not shared."""
+    return _state_dir_override
+
+
+def _publish_interval() -> float:
+    return _publish_interval_override or DEFAULT_PUBLISH_INTERVAL_SEC
+
+
+def _label_key(name: str, labels: Dict[str, Any]) -> LabelKey:
+    """Sorted label pairs; folded to ``other`` once the metric is at its cap.
+
+    Caller holds ``_lock``.
+    """
+    key = tuple(sorted((k, str(v)) for k, v in labels.items()))
+    if (name, key) in _series:
+        return key
+    if _series_per_metric.get(name, 0) >= MAX_SERIES_PER_METRIC:
+        key = tuple((k, OVERFLOW_LABEL_VALUE) for k, _ in key)
+    if (name, key) not in _series:
+        _series_per_metric[name] = _series_per_metric.get(name, 0) + 1
+    return key
+
+
+def inc(name: str, value: float = 1.0, **labels: Any) -> None:
+    """Add ``value`` to counter ``name``."""
+    if not metrics_enabled():
+        return
+    with _lock:
+        key = _label_key(name, labels)
+        _series[(name, key)] = _series.get((name, key), 0.0) + value
+    _maybe_publish()
+
+
+def set_gauge(name: str, value: float, **labels: Any) -> None:
+    """Set gauge ``name`` to ``value``."""
+    if not metrics_enabled():
+        return
+    with _lock:
+        key = _label_key(name, labels)
+        _series[(name, key)] = float(value)
+    _maybe_publish()
+
+
+def observe(name: str, value: float, **labels: Any) -> None:
+    """Record ``value`` (seconds for latency histograms) into histogram ``name``."""
+    if not metrics_enabled():
+        return
+    with _lock:
+        key = _label_key(name, labels)
+        hist = _series.get((name, key))
+        if hist is None:
+            hist = [0] * len(LATENCY_BUCKETS) + [0.0, 0]
+            _series[(name, key)] = hist
+        for i, bound in enumerate(LATENCY_BUCKETS):
+            if value <= bound:
+                hist[i] += 1
+                break
+        hist[-2] += value
+        hist[-1] += 1
+    _maybe_publish()
+
+
+@contextmanager
+def timed(name: str, **labels: Any) -> Iterator[None]:
+    """Observe the duration of the ``with`` block into histogram ``name``."""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        observe(name, time.perf_counter() - started, **labels)
+
+
+class PhaseTimer:
+    """Times consecutive phases of one operation into a histogram.
+
+    ``enter(phase)`` closes the running phase and starts the next one;
+    ``close()`` closes the last. The phase label is ``phase``.
+    """
+
+    def __init__(self, name: str, **labels: Any) -> None:
+        """Start with no running phase; ``labels`` are added to every sample."""
+        self.name = name
+        self.labels = labels
+        self._phase: Optional[str] = None
+        self._started = 0.0
+
+    def enter(self, phase: str) -> None:
+        """Finish the current phase (if any) and start ``phase``."""
+        now = time.perf_counter()
+        if self._phase is not None:
+            observe(self.name, now - self._started, phase=self._phase, **self.labels)
+        self._phase = phase
+        self._started = now
+
+    def close(self) -> None:
+        """Finish the current phase; idempotent."""
+        if self._phase is not None:
+            observe(
+                self.name,
+                time.perf_counter() - self._started,
+                phase=self._phase,
+                **self.labels,
+            )
+            self._phase = None
+
+
+def snapshot() -> Dict[str, Any]:
+    """JSON-serialisable copy of this process's metrics.
+
+    Returns:
+        ``{"pid": int, "metrics": {name: {"type", "help", "buckets"?,
+        "series": [[labels_dict, value], ...]}}}``; histogram values are
+        ``{"buckets": [per-bucket counts], "sum": float, "count": int}``.
+    """
+    with _lock:
+        items = [
+            (n, k, list(v) if isinstance(v, list) else v)
+            for (n, k), v in _series.items()
+        ]
+    metrics: Dict[str, Dict[str, Any]] = {}
+    for name, key, value in items:
+        kind, help_text = METRICS[name]
+        entry = metrics.setdefault(
+            name, {"type": kind, "help": help_text, "series": []}
+        )
+        if kind == HISTOGRAM:
+            entry["buckets"] = list(LATENCY_BUCKETS)
+            value = {"buckets": value[:-2], "sum": value[-2], "count": value[-1]}
+        entry["series"].append([dict(key), value])
+    return {"pid": os.getpid(), "metrics": metrics}
+
+
+def publish_snapshot() -> Optional[Path]:
+    """Write this process's snapshot to the state dir; return its path.
+
+    Written to a temporary file and renamed, so readers never see a partial
+    snapshot. Returns None when no state dir is configured or writing fails.
+    """
+    state_dir = metrics_state_dir()
+    if state_dir is None:
+        return None
+    data = snapshot()
+    target = state_dir / f"{data['pid']}.json"
+    try:
+        state_dir.mkdir(parents=True, exist_ok=True)
+        tmp = target.with_suffix(f".{threading.get_ident()}.tmp")
+        tmp.write_text(json.dumps(data), encoding="utf-8")
+        os.replace(tmp, target)
+    except OSError as exc:
+        logger.debug("Metrics snapshot write failed: %s", exc)
+        return None
+    return target
+
+
+def _maybe_publish() -> None:
+    """Publish the snapshot when the interval elapsed (one writer at a time)."""
+    global _last_publish, _publishing
+    if _state_dir_override is None:
+        return
+    now = time.monotonic()
+    with _lock:
+        if _publishing or now - _last_publish < _publish_interval():
+            return
+        _publishing = True
+        _last_publish = now
+    try:
+        publish_snapshot()
+    finally:
+        _publishing = False
+
+
+def reset_metrics() -> None:
+    """Drop every recorded series (tests, forked children)."""
+    global _last_publish, _publishing
+    with _lock:
+        _series.clear()
+        _series_per_metric.clear()
+        _last_publish = 0.0
+        _publishing = False
+
+
+def _after_fork_in_child() -> None:
+    global _lock
+    _lock = threading.Lock()
+    reset_metrics()
+
+
+def _publish_at_exit() -> None:
+    if _state_dir_override is not None and _series:
+        publish_snapshot()
+
+
+os.register_at_fork(after_in_child=_after_fork_in_child)
+atexit.register(_publish_at_exit)
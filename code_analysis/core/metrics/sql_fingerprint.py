@@ -0,0 +1,44 @@
+"""
+Statement fingerprints: SQL text with literals and value lists normalised.
+
+Used as the ``statement`` label of the SQL metrics, so executions of the same
+statement with different parameters (or a different number of ``IN`` list
+entries) land in one series. Fingerprints are memoised per raw SQL string;
+call sites pass a small set of distinct statement texts.
+
+Author: Vasiliy Zdanovskiy
+email: vasilyvz@gmail.com
+"""
+
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+
+MAX_FINGERPRINT_LEN = 160
+
+_STRING_RE = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_RE = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?\b")
+_PLACEHOLDER_RE = re.compile(r"\?|%s|\$\d+")
+_LIST_RE = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_VALUES_RE = re.compile(r"(\(\?(?:, \?)*\))(?:\s*,\s*\(\?(?:, \?)*\))+")
+_SPACE_RE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=4096)
+def sql_fingerprint(sql: str) -> str:
+    """Normalised, length-capped form of ``sql``.
+
+    Whitespace is collapsed, string/number literals and driver placeholders
+    become ``?``, ``(?, ?, ...)`` lists become ``(...)`` and repeated
+    ``VALUES`` tuples collapse to one.
+    """
+    text = _SPACE_RE.sub(" ", sql).strip()
+    text = _STRING_RE.sub("?", text)
+    text = _PLACEHOLDER_RE.sub("?", text)
+    text = _NUMBER_RE.sub("?", text)
+    text = _VALUES_RE.sub(r"\1", text)
+    text = _LIST_RE.sub("(...)", text)
+    if len(text) > MAX_FINGERPRINT_LEN:
+        text = text[: MAX_FINGERPRINT_LEN - 3] + "..."
+    return text
@@ -0,0 +1,360 @@
+"""
+Filtered pgvector nearest-neighbour search for one project.
+
+``code_chunks`` from every project share one table. A query that filters by
+project and orders by ``embedding_vec <=> q`` against the global
+``idx_code_chunks_embedding_vec_hnsw`` walks neighbours from all projects and
+drops the foreign ones afterwards, so a small project in a large database gets
+too few results, slowly. This module picks one of three plans:
+
+- ``exact``: projects with at most :data:`EXACT_SCAN_MAX_CHUNKS` embedded
+  chunks are ranked exactly (the ORDER BY expression is written so the global
+  HNSW index cannot serve it; the ``project_id`` b-tree narrows the scan).
+- ``project_index``: larger projects get a partial HNSW index
+  ``WHERE project_id = '<uuid>'`` (:func:`project_hnsw_index_sql`), created and
+  dropped ``CONCURRENTLY`` by the schema migration sweep and by
+  :func:`ensure_project_hnsw_index` once the vectorization worker pushes a
+  project over the threshold. pgvector maintains HNSW on insert, so the index
+  is never rebuilt. The project id is inlined as a literal so the planner can
+  match the partial index predicate.
+- ``global_index``: a large project whose partial index does not exist yet
+  falls back to the global index, over-fetching candidates and (pgvector
+  >= 0.8) an iterative index scan so the filter does not starve the result.
+
+Shared library chunks (see ``shared_library_index``) come from a second
+branch over the global index and are merged by distance. ``hnsw.ef_search``
+and ``hnsw.iterative_scan`` are applied with ``set_config(..., true)`` inside
+a short transaction, so they never leak into pooled connections.
+
+Author: Vasiliy Zdanovskiy
+email: vasilyvz@gmail.com
+"""
+
+from __future__ import annotations
+
+import logging
+import uuid
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from .shared_library_index import library_scope_sql
+
+logger = logging.getLogger(__name__)
+
+GLOBAL_HNSW_INDEX = "idx_code_chunks_embedding_vec_hnsw"
+PROJECT_HNSW_INDEX_PREFIX = "idx_code_chunks_emb_hnsw_p_"
+
+# A project gets its own partial HNSW index from this many embedded chunks and
+# loses it again below half of it (hysteresis, so a project hovering around
+# the threshold is not rebuilt on every sweep).
+PROJECT_HNSW_MIN_CHUNKS = 10_000
+EXACT_SCAN_MAX_CHUNKS = 20_000
+
+OVERFETCH_FACTOR = 4
+MAX_CANDIDATES = 1000
+DEFAULT_EF_SEARCH = 40
+MAX_EF_SEARCH = 1000
+ITERATIVE_SCAN_MODES = ("off", "strict_order", "relaxed_order")
+
+STRATEGY_EXACT = "exact"
+STRATEGY_PROJECT_INDEX = "project_index"
+STRATEGY_GLOBAL_INDEX = "global_index"
+
+_extversion: Dict[str, Optional[Tuple[int, ...]]] = {}
+
+
+@dataclass(frozen=True)
+class PgvectorQueryPlan:
+    """How one semantic query is executed.
+
+    Attributes:
+        strategy: ``exact``, ``project_index`` or ``global_index``.
+        candidate_limit: Rows fetched per branch before post-filtering.
+        settings: ``(name, value)`` pairs applied with ``set_config`` for the
+            duration of the query.
+    """
+
+    strategy: str
+    candidate_limit: int
+    settings: Tuple[Tuple[str, str], ...] = ()
+
+
+def project_hnsw_index_name(project_id: Any) -> str:
+    """Return the partial HNSW index name of ``project_id`` (must be a UUID)."""
+    return f"{PROJECT_HNSW_INDEX_PREFIX}{uuid.UUID(str(project_id)).hex}"
+
+
+def _project_literal(project_id: Any) -> str:
+    """``'<uuid>'::uuid`` literal; the UUID round-trip rejects anything else."""
+    return f"'{uuid.UUID(str(project_id))}'::uuid"
+
+
+def project_hnsw_index_sql(project_id: Any) -> str:
+    """``CREATE INDEX CONCURRENTLY`` for the partial HNSW index of one project.
+
+    Must run outside a transaction (autocommit), so writes to ``code_chunks``
+    from other projects are not blocked while the index builds.
+    """
+    name = project_hnsw_index_name(project_id)
+    return (
+        f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} "
+        "ON code_chunks USING hnsw (embedding_vec vector_cosine_ops) "
+        f"WHERE project_id = {_project_literal(project_id)}"
+    )
+
+
+def plan_project_hnsw_indexes(
+    chunk_counts: Mapping[str, int], existing: Iterable[str]
+) -> Tuple[List[str], List[str]]:
+    """Return ``(create_sql, drop_sql)`` bringing partial indexes up to date.
+
+    Args:
+        chunk_counts: Embedded chunk count per project id.
+        existing: Names of the partial indexes currently defined.
+    """
+    present = {name for name in existing if name.startswith(PROJECT_HNSW_INDEX_PREFIX)}
+    wanted: Dict[str, str] = {}
+    keep: set[str] = set()
+    for project_id, count in chunk_counts.items():
+        try:
+            name = project_hnsw_index_name(project_id)
+        except ValueError:
+            continue
+        if count >= PROJECT_HNSW_MIN_CHUNKS:
+            wanted[name] = project_id
+        elif name in present and count >= PROJECT_HNSW_MIN_CHUNKS // 2:
+            keep.add(name)
+    creates = [
+        project_hnsw_index_sql(project_id)
+        for name, project_id in sorted(wanted.items())
+        if name not in present
+    ]
+    drops = [
+        f"DROP INDEX CONCURRENTLY IF EXISTS {name}"
+        for name in sorted(present - set(wanted) - keep)
+    ]
+    return creates, drops
+
+
+def _rows(database: Any, sql: str, params: Tuple[Any, ...] = (), **kw: Any) -> list:
+    result = database.execute(sql, params, **kw)
+    if not isinstance(result, dict):
+        return []
+    return list(result.get("data") or [])
+
+
+def project_hnsw_index_exists(database: Any, project_id: Any) -> bool:
+    """Return True when the partial HNSW index of ``project_id`` is defined."""
+    try:
+        name = project_hnsw_index_name(project_id)
+    except ValueError:
+        return False
+    return bool(
+        _rows(
+            database,
+            "SELECT 1 AS present FROM pg_indexes "
+            "WHERE tablename = 'code_chunks' AND indexname = ?",
+            (name,),
+        )
+    )
+
+
+def ensure_project_hnsw_index(database: Any, project_id: Any) -> None:
+    """Create or drop the partial HNSW index of one project.
+
+    Called after embedding writes (vectorization worker cycle, revectorize,
+    rebuild_faiss) so a project crossing the threshold does not wait for the
+    next schema sweep. The driver runs ``CONCURRENTLY`` statements on an
+    autocommit connection. Failures are logged only.
+    """
+    try:
+        name = project_hnsw_index_name(project_id)
+        count_rows = _rows(
+            database,
+            "SELECT COUNT(*) AS n FROM code_chunks "
+            "WHERE project_id = ? AND embedding_vec IS NOT NULL",
+            (str(project_id),),
+        )
+        count = int((count_rows[0] if count_rows else {}).get("n") or 0)
+        exists = project_hnsw_index_exists(database, project_id)
+        creates, drops = plan_project_hnsw_indexes(
+            {str(project_id): count}, [name] if exists else []
+        )
+        for sql in drops + creates:
+            database.execute(sql)
+    except Exception as exc:
+        logger.warning("Partial HNSW index upkeep for %s skipped: %s", project_id, exc)
+
+
+def pgvector_version(database: Any) -> Optional[Tuple[int, ...]]:
+    """Installed pgvector extension version (cached per process)."""
+    if "vector" not in _extversion:
+        version: Optional[Tuple[int, ...]] = None
+        try:
+            rows = _rows(
+                database,
+                "SELECT extversion FROM pg_extension WHERE extname = 'vector'",
+            )
+            if rows:
+                version = tuple(
+                    int(part) for part in str(rows[0]["extversion"]).split(".")[:3]
+                )
+        except Exception as exc:
+            logger.debug("pgvector version lookup failed: %s", exc)
+            return None
+        _extversion["vector"] = version
+    return _extversion["vector"]
+
+
+def plan_pgvector_query(
+    *,
+    chunk_count: int,
+    has_project_index: bool,
+    limit: int,
+    post_filtered: bool,
+    ef_search: Optional[int] = None,
+    iterative_scan: Optional[str] = None,
+    supports_iterative_scan: bool = False,
+) -> PgvectorQueryPlan:
+    """Choose the execution plan for a project-scoped KNN query.
+
+    Args:
+        chunk_count: Embedded chunks of the project.
+        has_project_index: Whether its partial HNSW index exists.
+        limit: Results requested.
+        post_filtered: True when rows may still be dropped after the query
+            (``min_score``, docs policy); the query then over-fetches.
+        ef_search: Requested ``hnsw.ef_search`` (raised to the candidate
+            count, since HNSW never returns more than ``ef_search`` rows).
+        iterative_scan: Requested ``hnsw.iterative_scan``; by default
+            ``relaxed_order`` wherever the global index is filtered.
+        supports_iterative_scan: pgvector >= 0.8.
+    """
+    if chunk_count <= EXACT_SCAN_MAX_CHUNKS and not has_project_index:
+        strategy = STRATEGY_EXACT
+    elif has_project_index:
+        strategy = STRATEGY_PROJECT_INDEX
+    else:
+        strategy = STRATEGY_GLOBAL_INDEX
+    overfetch = post_filtered or strategy == STRATEGY_GLOBAL_INDEX
+    candidates = limit * OVERFETCH_FACTOR if overfetch else limit
+    candidates = max(limit, min(candidates, MAX_CANDIDATES))
+
+    ef = max(int(ef_search or DEFAULT_EF_SEARCH), candidates)
+    settings: List[Tuple[str, str]] = [("hnsw.ef_search", str(min(ef, MAX_EF_SEARCH)))]
+    mode = iterative_scan
+    if mode is None:
+        mode = "off" if strategy == STRATEGY_PROJECT_INDEX else "relaxed_order"
+    if supports_iterative_scan and mode in ITERATIVE_SCAN_MODES:
+        settings.append(("hnsw.iterative_scan", mode))
+    return PgvectorQueryPlan(strategy, candidates, tuple(settings))
+
+
+def pgvector_knn_query(
+    select_columns: str,
+    query_vector: str,
+    project_id: Any,
+    plan: PgvectorQueryPlan,
+    *,
+    include_library: bool,
+) -> Tuple[str, Tuple[Any, ...]]:
+    """Build the KNN query for ``plan`` and its parameters.
+
+    ``select_columns`` is the column list over ``code_chunks c``, ``files f``
+    and ``projects p``; ``dist`` (cosine distance) is appended and results
+    come back ordered by it.
+    """
+    base = (
+        f"SELECT {select_columns}, (c.embedding_vec <=> ?::vector) AS dist "
+        "FROM code_chunks c "
+        "JOIN files f ON f.id = c.file_id "
+        "JOIN projects p ON p.id = f.project_id "
+    )
+    if plan.strategy == STRATEGY_PROJECT_INDEX:
+        own_filter = f"c.project_id = {_project_literal(project_id)}"
+        own_params: Tuple[Any, ...] = ()
+    else:
+        own_filter = "c.project_id = ?"
+        own_params = (str(project_id),)
+    # ``+ 0`` keeps the planner off the global HNSW index for exact ranking.
+    own_order = (
+        "(c.embedding_vec <=> ?::vector) + 0"
+        if plan.strategy == STRATEGY_EXACT
+        else "c.embedding_vec <=> ?::vector"
+    )
+    branches = [
+        (
+            f"({base}WHERE {own_filter} AND c.embedding_vec IS NOT NULL "
+            f"ORDER BY {own_order} LIMIT ?)",
+            (query_vector, *own_params, query_vector, plan.candidate_limit),
+        )
+    ]
+    if include_library:
+        branches.append(
+            (
+                f"({base}WHERE {library_scope_sql('c.file_id')} "
+                "AND c.project_id <> ? AND c.embedding_vec IS NOT NULL "
+                "ORDER BY c.embedding_vec <=> ?::vector LIMIT ?)",
+                (
+                    query_vector,
+                    str(project_id),
+                    str(project_id),
+                    query_vector,
+                    plan.candidate_limit,
+                ),
+            )
+        )
+    sql = (
+        "SELECT * FROM ("
+        + " UNION ALL ".join(branch for branch, _ in branches)
+        + ") hits ORDER BY dist LIMIT ?"
+    )
+    params: List[Any] = [p for _, branch_params in branches for p in branch_params]
+    params.append(plan.candidate_limit)
+    return sql, tuple(params)
+
+
+def run_pgvector_query(
+    database: Any,
+    sql: str,
+    params: Sequence[Any],
+    settings: Sequence[Tuple[str, str]] = (),
+) -> List[Dict[str, Any]]:
+    """Run ``sql`` with ``settings`` applied transaction-locally.
+
+    Without settings (or when no transaction can be opened) the query runs
+    on its own with the server defaults.
+    """
+    tid = None
+    if settings:
+        try:
+            tid = database.begin_transaction()
+        except Exception as exc:
+            logger.debug("pgvector settings skipped (no transaction): %s", exc)
+    if not tid:
+        return _rows(database, sql, tuple(params))
+    try:
+        for name, value in settings:
+            database.execute(
+                "SELECT set_config(?, ?, true)", (name, value), transaction_id=tid
+            )
+        rows = _rows(database, sql, tuple(params), transaction_id=tid)
+        database.commit_transaction(tid)
+        return rows
+    except Exception:
+        try:
+            database.rollback_transaction(tid)
+        except Exception:
+            pass
+        raise
+
+
+def has_library_refs(database: Any, project_id: Any) -> bool:
+    """Return True when the project references shared library files."""
+    return bool(
+        _rows(
+            database,
+            "SELECT 1 AS present FROM library_file_refs WHERE project_id = ? LIMIT 1",
+            (str(project_id),),
+        )
+    )
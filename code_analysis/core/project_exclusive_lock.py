@@ -25,6 +25,8 @@ import time
 import uuid
 from typing import Any, Dict, Final, Optional, Union, cast
 
+from .project_registry_cache import invalidate_project
+
 logger = logging.getLogger(__name__)
 
 _LOG_PREFIX: Final[str] = "[PROJECT_EXCLUSIVE_LOCK]"
@@ -137,6 +139,7 @@ def acquire_project_exclusive_lock(
             transaction_id=None,
         ),
     )
+    invalidate_project(project_id)
     ok = _affected(res) > 0
     logger.info(
         "%s op=acquire project_id=%r owner=%r reason=%r result=%s",
@@ -171,6 +174,7 @@ def release_project_exclusive_lock(
         Dict[str, Any],
         database.execute(_RELEASE_SQL, (project_id,), transaction_id=None),
     )
+    invalidate_project(project_id)
     ok = _affected(res) > 0
     logger.info(
         "%s op=release project_id=%r result=%s",
@@ -0,0 +1,349 @@
+"""
+Process-local cache of project registry lookups used by command preambles.
+
+Nearly every command resolves its project before doing real work: the
+``run()`` exclusive-lock gate, ``_validate_project_id_exists`` and
+``_resolve_project_root`` each cost one or more synchronous round-trips on
+the shared driver. This module caches their results per ``project_id``
+(project row, resolved root, exclusive-lock state) and keeps the cache
+honest with PostgreSQL ``LISTEN/NOTIFY``:
+
+- Row triggers on ``projects``, ``watch_dir_paths`` and
+  ``project_exclusive_locks`` (see
+  ``core/database/migrations/project_registry_notify_triggers.py``) send a
+  JSON payload on :data:`NOTIFY_CHANNEL`.
+- :class:`ProjectRegistryListener` holds one dedicated autocommit
+  connection that ``LISTEN``\\ s on the channel and drops the affected
+  project (or everything, for a watch-dir change). The cache is cleared on
+  every (re)connect, because notifications sent while disconnected are lost.
+- Entries live ``ttl_sec`` while the listener is connected and has seen the
+  triggers in ``pg_trigger``, and only ``fallback_ttl_sec`` otherwise, so a
+  dead listener or a failed trigger migration degrades to a short TTL
+  instead of serving stale locks.
+
+Only successful lookups are cached; a loader that raises (project not
+found, DB error) is never remembered. Enabled by config
+(``project_registry_cache.enabled``) or ``CODE_ANALYSIS_PROJECT_REGISTRY_CACHE=1``;
+default off so tests and one-shot tools always read through.
+
+:func:`project_lookup_scope` additionally memoizes lookups for the duration
+of one request (``read_only_batch``), whether or not the cache is enabled, so
+a batch of N commands on one project resolves it once.
+
+Author: Vasiliy Zdanovskiy
+email: vasilyvz@gmail.com
+"""
+
+from __future__ import annotations
+
+import contextvars
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple, TypeVar, cast
+
+logger = logging.getLogger(__name__)
+
+NOTIFY_CHANNEL = "code_analysis_project_registry"
+
+DEFAULT_TTL_SEC = 60.0
+DEFAULT_FALLBACK_TTL_SEC = 2.0
+_MAX_ENTRIES = 4096
+
+_TRIGGERS_SQL = (
+    "SELECT t.tgname, c.relname FROM pg_trigger t "
+    "JOIN pg_class c ON c.oid = t.tgrelid "
+    "WHERE t.tgname = ANY(%s) AND t.tgenabled <> 'D'"
+)
+
+_T = TypeVar("_T")
+
+_enabled_override: Optional[bool] = None
+_ttl_override: Optional[float] = None
+_fallback_ttl_override: Optional[float] = None
+
+_cache_lock = threading.Lock()
+_cache: "OrderedDict[Tuple[str, str], Tuple[float, Any]]" = OrderedDict()
+# Bumped by every invalidation; a load that started before an invalidation
+# must not store its (possibly stale) result.
+_generation = 0
+_listener_connected = False
+_listener: Optional["ProjectRegistryListener"] = None
+_scope: contextvars.ContextVar[Optional[Dict[Tuple[str, str], Any]]] = (
+    contextvars.ContextVar("project_lookup_scope", default=None)
+)
+
+
+def configure_project_registry_cache(
+    *,
+    enabled: Optional[bool] = None,
+    ttl_sec: Optional[float] = None,
+    fallback_ttl_sec: Optional[float] = None,
+) -> None:
+    """Apply config overrides (``project_registry_cache`` section)."""
+    global _enabled_override, _ttl_override, _fallback_ttl_override
+    if enabled is not None:
+        _enabled_override = bool(enabled)
+        if not _enabled_override:
+            clear_project_registry_cache()
+    if ttl_sec is not None and float(ttl_sec) >= 0:
+        _ttl_override = float(ttl_sec)
+    if fallback_ttl_sec is not None and float(fallback_ttl_sec) >= 0:
+        _fallback_ttl_override = float(fallback_ttl_sec)
+
+
+def project_registry_cache_enabled() -> bool:
+    """Return whether preamble lookups are cached (default off)."""
+    if _enabled_override is not None:
+        return _enabled_override
+    env = os.environ.get("CODE_ANALYSIS_PROJECT_REGISTRY_CACHE")
+    if env is not None:
+        return env.strip().lower() in ("1", "true", "yes", "on")
+    return False
+
+
+def _current_ttl() -> float:
+    if _listener_connected:
+        return _ttl_override if _ttl_override is not None else DEFAULT_TTL_SEC
+    if _fallback_ttl_override is not None:
+        return _fallback_ttl_override
+    return DEFAULT_FALLBACK_TTL_SEC
+
+
+def cached_project_lookup(
+    kind: str,
+    project_id: Any,
+    loader: Callable[[], _T],
+    *,
+    cache_none: bool = True,
+) -> _T:
+    """Return ``loader()`` for ``(kind, project_id)``, cached when enabled.
+
+    ``kind`` names the lookup (e.g. ``"lock"``, ``"root"``); invalidation is
+    per project and drops every kind at once. With ``cache_none=False`` a
+    ``None`` result (e.g. project not found yet) is returned but not stored.
+    Inside :func:`project_lookup_scope` results are also memoized per scope.
+    """
+    key = (kind, str(project_id).strip())
+    scope = _scope.get()
+    if scope is None:
+        return _cached_lookup(key, loader, cache_none)
+    if key in scope:
+        return cast(_T, scope[key])
+    value = _cached_lookup(key, loader, cache_none)
+    if value is not None or cache_none:
+        scope[key] = value
+    return value
+
+
+@contextmanager
+def project_lookup_scope() -> Iterator[None]:
+    """Memoize :func:`cached_project_lookup` results until the block exits.
+
+    Nested scopes share the outermost memo. :func:`invalidate_project` and
+    :func:`clear_project_registry_cache` called in the same context drop the
+    affected entries (e.g. when a command takes the project lock).
+    """
+    if _scope.get() is not None:
+        yield
+        return
+    token = _scope.set({})
+    try:
+        yield
+    finally:
+        _scope.reset(token)
+
+
+def _cached_lookup(
+    key: Tuple[str, str], loader: Callable[[], _T], cache_none: bool
+) -> _T:
+    if not project_registry_cache_enabled():
+        return loader()
+    now = time.monotonic()
+    with _cache_lock:
+        hit = _cache.get(key)
+        if hit is not None and hit[0] > now:
+            _cache.move_to_end(key)
+            return cast(_T, hit[1])
+        generation = _generation
+    value = loader()
+    ttl = _current_ttl()
+    if ttl <= 0 or (value is None and not cache_none):
+        return value
+    with _cache_lock:
+        if generation == _generation:
+            _cache[key] = (time.monotonic() + ttl, value)
+            _cache.move_to_end(key)
+            while len(_cache) > _MAX_ENTRIES:
+                _cache.popitem(last=False)
+    return value
+
+
+def invalidate_project(project_id: Any) -> None:
+    """Drop every cached lookup for ``project_id``."""
+    global _generation
+    pid = str(project_id).strip()
+    scope = _scope.get()
+    if scope is not None:
+        for key in [k for k in scope if k[1] == pid]:
+            del scope[key]
+    with _cache_lock:
+        _generation += 1
+        for key in [k for k in _cache if k[1] == pid]:
+            del _cache[key]
+
+
+def clear_project_registry_cache() -> None:
+    """Drop all cached lookups."""
+    global _generation
+    scope = _scope.get()
+    if scope is not None:
+        scope.clear()
+    with _cache_lock:
+        _generation += 1
+        _cache.clear()
+
+
+def handle_notification(payload: str) -> None:
+    """Apply one ``NOTIFY`` payload from the registry triggers."""
+    try:
+        data = json.loads(payload) if payload else {}
+    except ValueError:
+        data = {}
+    project_id = data.get("project_id") if isinstance(data, dict) else None
+    if project_id:
+        invalidate_project(project_id)
+    else:
+        # watch_dir_paths changes move every project root under that watch dir.
+        clear_project_registry_cache()
+
+
+def notify_triggers_installed(conn: Any) -> bool:
+    """Return whether every registry ``NOTIFY`` trigger exists and is enabled.
+
+    The trigger migration only logs its failures; without this check a
+    connected listener would extend the TTL while no notification can arrive.
+    """
+    from .database.migrations.project_registry_notify_triggers import (
+        NOTIFY_TABLES,
+        notify_trigger_name,
+    )
+
+    expected = {(notify_trigger_name(table), table) for table in NOTIFY_TABLES}
+    rows = conn.execute(_TRIGGERS_SQL, ([name for name, _ in expected],)).fetchall()
+    return expected <= {(str(row[0]), str(row[1])) for row in rows}
+
+
+def _set_listener_connected(connected: bool) -> None:
+    global _listener_connected
+    _listener_connected = connected
+    clear_project_registry_cache()
+
+
+class ProjectRegistryListener:
+    """Background ``LISTEN`` on :data:`NOTIFY_CHANNEL` with reconnect."""
+
+    def __init__(
+        self,
+        connect_kwargs: Dict[str, Any],
+        *,
+        poll_timeout_sec: float = 1.0,
+        reconnect_delay_sec: float = 5.0,
+        trigger_recheck_sec: float = 60.0,
+    ) -> None:
+        """Store connection parameters (same as the driver's ``psycopg.connect``)."""
+        self._connect_kwargs = dict(connect_kwargs)
+        self._poll_timeout_sec = poll_timeout_sec
+        self._reconnect_delay_sec = reconnect_delay_sec
+        self._trigger_recheck_sec = trigger_recheck_sec
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def connected(self) -> bool:
+        """True while ``LISTEN`` is up and the notify triggers are installed."""
+        return _listener_connected
+
+    def start(self) -> None:
+        """Start the listener thread (idempotent)."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="project-registry-listener", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop the listener thread and close its connection."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self) -> None:
+        import psycopg
+
+        while not self._stop.is_set():
+            conn = None
+            try:
+                conn = psycopg.connect(**self._connect_kwargs, autocommit=True)
+                conn.execute(f"LISTEN {NOTIFY_CHANNEL}")
+                # Until the triggers are seen, keep the fallback TTL and look
+                # again every trigger_recheck_sec.
+                next_check = 0.0
+                while not self._stop.is_set():
+                    if not _listener_connected and time.monotonic() >= next_check:
+                        if notify_triggers_installed(conn):
+                            _set_listener_connected(True)
+                            logger.info(
+                                "Project registry listener connected (%s)",
+                                NOTIFY_CHANNEL,
+                            )
+                        else:
+                            if next_check == 0.0:
+                                logger.warning(
+                                    "Project registry notify triggers missing; "
+                                    "cache keeps the fallback TTL"
+                                )
+                            next_check = time.monotonic() + self._trigger_recheck_sec
+                    for notify in conn.notifies(timeout=self._poll_timeout_sec):
+                        handle_notification(notify.payload)
+            except Exception as exc:
+                if not self._stop.is_set():
+                    logger.warning(
+                        "Project registry listener lost (retry in %.0fs): %s",
+                        self._reconnect_delay_sec,
+                        exc,
+                    )
+            finally:
+                if _listener_connected:
+                    _set_listener_connected(False)
+                if conn is not None:
+                    try:
+                        conn.close()
+                    except Exception:
+                        pass
+            self._stop.wait(self._reconnect_delay_sec)
+
+
+def start_project_registry_listener(connect_kwargs: Dict[str, Any]) -> None:
+    """Start the process-wide listener when the cache is enabled."""
+    global _listener
+    if not project_registry_cache_enabled() or not connect_kwargs:
+        return
+    if _listener is None:
+        _listener = ProjectRegistryListener(connect_kwargs)
+    _listener.start()
+
+
+def stop_project_registry_listener() -> None:
+    """Stop the process-wide listener (shutdown hook)."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
@@ -0,0 +1,174 @@
+"""
+Server-side wait for queued jobs (long-poll backend of ``queue_wait_job``).
+
+Clients used to poll ``queue_get_job_status`` once per second until a queued
+command finished, so every ``use_queue`` command paid up to a second of extra
+latency plus one HTTP round-trip per poll. ``queue_wait_job`` instead blocks
+inside the server until the job is terminal or the wait times out.
+
+Jobs run in queuemgr child processes and the queue manager offers no
+completion callback, so one watcher task per event loop reads the status of
+every job somebody waits for and sets that job's completion event once it is
+terminal. The first read happens immediately, later reads back off from
+:data:`MIN_CHECK_INTERVAL_SEC` to :data:`MAX_CHECK_INTERVAL_SEC`: short jobs
+finish within tens of milliseconds, long ones cost a few in-host status reads
+per second however many clients wait on them.
+
+Author: Vasiliy Zdanovskiy
+email: vasilyvz@gmail.com
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+TERMINAL_JOB_STATUSES = frozenset({"completed", "failed", "stopped", "cancelled"})
+
+MIN_CHECK_INTERVAL_SEC = 0.01
+MAX_CHECK_INTERVAL_SEC = 0.25
+
+StatusReader = Callable[[str], Awaitable[Any]]
+
+
+def job_status_name(status: Any) -> str:
+    """Lower-case status string of a ``QueueJobResult`` (or a status dict)."""
+    raw = (
+        status.get("status")
+        if isinstance(status, dict)
+        else getattr(status, "status", "")
+    )
+    return str(getattr(raw, "value", raw) or "").strip().lower()
+
+
+@dataclass
+class _Watch:
+    """Completion event and last observed status of one job."""
+
+    done: asyncio.Event = field(default_factory=asyncio.Event)
+    status: Any = None
+    error: Optional[BaseException] = None
+    waiters: int = 0
+    interval: float = MIN_CHECK_INTERVAL_SEC
+    next_check: float = 0.0
+
+
+class QueueJobWaiter:
+    """Completion events for queue jobs, fed by one shared status watcher."""
+
+    def __init__(
+        self,
+        read_status: StatusReader,
+        *,
+        min_interval: float = MIN_CHECK_INTERVAL_SEC,
+        max_interval: float = MAX_CHECK_INTERVAL_SEC,
+    ) -> None:
+        """``read_status(job_id)`` returns the current job status or raises."""
+        self._read_status = read_status
+        self._min_interval = min_interval
+        self._max_interval = max_interval
+        self._watches: Dict[str, _Watch] = {}
+        self._wake = asyncio.Event()
+        self._task: Optional["asyncio.Task[None]"] = None
+
+    @property
+    def watched_jobs(self) -> int:
+        """Number of jobs somebody is currently waiting for."""
+        return len(self._watches)
+
+    async def wait(self, job_id: str, timeout: float) -> Tuple[Any, bool]:
+        """Wait until ``job_id`` is terminal or ``timeout`` seconds pass.
+
+        Returns:
+            ``(status, timed_out)`` with the last observed status (``None``
+            when the job was never read before the timeout).
+
+        Raises:
+            Whatever ``read_status`` raised for this job (e.g. not found).
+        """
+        watch = self._watches.get(job_id)
+        if watch is None:
+            watch = _Watch(interval=self._min_interval)
+            self._watches[job_id] = watch
+            self._wake.set()
+        watch.waiters += 1
+        self._ensure_watcher()
+        try:
+            await asyncio.wait_for(watch.done.wait(), timeout=max(timeout, 0.0))
+            timed_out = False
+        except asyncio.TimeoutError:
+            timed_out = True
+        finally:
+            watch.waiters -= 1
+            if watch.waiters <= 0 and self._watches.get(job_id) is watch:
+                del self._watches[job_id]
+        if watch.error is not None:
+            raise watch.error
+        return watch.status, timed_out
+
+    def _ensure_watcher(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._watch_loop())
+
+    async def _check(self, job_id: str, watch: _Watch) -> None:
+        try:
+            watch.status = await self._read_status(job_id)
+        except Exception as exc:
+            watch.error = exc
+            watch.done.set()
+            return
+        if job_status_name(watch.status) in TERMINAL_JOB_STATUSES:
+            watch.done.set()
+            return
+        watch.next_check = time.monotonic() + watch.interval
+        watch.interval = min(watch.interval * 2, self._max_interval)
+
+    async def _watch_loop(self) -> None:
+        while any(not w.done.is_set() for w in self._watches.values()):
+            self._wake.clear()
+            now = time.monotonic()
+            due = [
+                (job_id, watch)
+                for job_id, watch in list(self._watches.items())
+                if not watch.done.is_set() and watch.next_check <= now
+            ]
+            if due:
+                await asyncio.gather(*(self._check(j, w) for j, w in due))
+                continue
+            next_due = min(
+                w.next_check for w in self._watches.values() if not w.done.is_set()
+            )
+            try:
+                await asyncio.wait_for(
+                    self._wake.wait(), timeout=max(next_due - now, 0.0)
+                )
+            except asyncio.TimeoutError:
+                pass
+
+
+_waiters: Dict[int, QueueJobWaiter] = {}
+
+
+async def _read_queue_job_status(job_id: str) -> Any:
+    from mcp_proxy_adapter.integrations.queuemgr_integration import (
+        get_global_queue_manager,
+    )
+
+    queue_manager = await get_global_queue_manager()
+    return await queue_manager.get_job_status(job_id)
+
+
+def get_queue_job_waiter() -> QueueJobWaiter:
+    """Process-wide waiter for the running event loop (queuemgr status reads)."""
+    loop = asyncio.get_running_loop()
+    waiter = _waiters.get(id(loop))
+    if waiter is None:
+        _waiters.clear()
+        waiter = QueueJobWaiter(_read_queue_job_status)
+        _waiters[id(loop)] = waiter
+    return waiter
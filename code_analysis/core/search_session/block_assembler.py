@@ -9,14 +9,16 @@ from __future__ import annotations
 
 import json
 import re
-from collections.abc import Callable
+from collections.abc import Callable, Collection
 from pathlib import Path
 
 from code_analysis.core.search_session.atomic_publication import atomic_write_bytes
 from code_analysis.core.search_session.directory import SearchSessionDirectoryLayout
+from code_analysis.core.search_session.hybrid_rank import fusion_key, rank_findings
 from code_analysis.core.search_session.raw_finding_buffer import RawFindingBuffer
 from code_analysis.core.search_session.result_block import (
     assemble_block,
+    block_items_from_payload,
     serialize_block,
 )
 from code_analysis.core.search_session.result_index import (
@@ -34,9 +36,11 @@ class BlockAssembler:
     """
     Drains ``RawFindingBuffer`` into immutable result blocks under a buffer lock.
 
-    Temporal blocks are written in arrival order while the search runs.
-    On completion, all findings are re-segmented by relevance score into a
-    separate ``blocks_relevance/`` set.
+    Temporal blocks are written in arrival order while the search runs;
+    ``publish_settled`` may publish a block of already settled top results
+    ahead of that order. On completion, all findings (published or not) are
+    fused by hybrid rank (see ``hybrid_rank``) into a separate
+    ``blocks_relevance/`` set.
     """
 
     def __init__(
@@ -141,6 +145,88 @@ class BlockAssembler:
 
         return blocks_published
 
+    def publish_settled(self, *, pending_sources: Collection[str]) -> int:
+        """
+        Publish the next temporal block from the head of the hybrid ranking
+        while ``pending_sources`` are still running.
+
+        Only a full block is published (``max_results_per_block`` items, or as
+        many as fit ``max_block_size_bytes``) and only when no pending source
+        can push a result out of it, so the block holds the same results as
+        the head of the final relevance set. Already published items are
+        ranked too: they must form the settled top of the ranking, and the
+        block continues right after them. Buffered findings merged into the
+        block are removed.
+
+        Returns:
+            Number of items published; ``0`` when the head is not settled yet
+            or the lock is unavailable.
+        """
+        if not self._buffer.buffer_dir.exists():
+            return 0
+        if not self._buffer.try_acquire_lock():
+            return 0
+        try:
+            finding_paths = self._buffer.list_findings()
+            findings = [self._load_finding(path) for path in finding_paths]
+            published = self._published_items()
+            published_keys = {fusion_key(item) for item in published}
+            ranking = rank_findings(
+                published + findings, pending_sources=pending_sources
+            )
+            head = len(published_keys)
+            if head and (
+                any(
+                    fusion_key(item) not in published_keys
+                    for item in ranking.items[:head]
+                )
+                or not ranking.head_settled(head)
+            ):
+                return 0
+            candidates = ranking.items[head:]
+            position = self._next_block_position()
+            block = assemble_block(
+                candidates,
+                max_block_size_bytes=self._max_block_size_bytes,
+                max_results=self._max_results_per_block,
+                position=position,
+            )
+            full = len(block.items) < len(candidates) or (
+                self._max_results_per_block is not None
+                and len(block.items) >= self._max_results_per_block
+            )
+            if not full or not ranking.head_settled(head + len(block.items)):
+                return 0
+
+            assembled_count = len(block.items)
+            block_path = self._layout.blocks_dir / f"block_{block.position}.json"
+            atomic_write_bytes(block_path, serialize_block(block))
+            self._append_index_entry(block.position, COMPLETENESS_RUNNING)
+            self._update_manifest_metrics(
+                {
+                    "produced_results": assembled_count,
+                    "written_blocks": 1,
+                    "block_size_bytes": block.serialized_size_bytes,
+                }
+            )
+            published_keys = {fusion_key(item) for item in block.items}
+            self._buffer.remove_findings(
+                [
+                    path
+                    for path, finding in zip(finding_paths, findings)
+                    if fusion_key(finding) in published_keys
+                ]
+            )
+            if self._on_block_published is not None:
+                self._on_block_published(
+                    block.position,
+                    assembled_count,
+                    block.serialized_size_bytes,
+                )
+            return assembled_count
+        finally:
+            self._buffer.release_lock()
+
     def run_until_idle(self, *, search_completed: bool) -> int:
         """Repeatedly run ``run_once`` until it publishes no blocks."""
         total = 0
@@ -184,27 +270,18 @@ class BlockAssembler:
 
     def _build_relevance_blocks(self) -> list[dict]:
         """
-        Read all findings from the buffer, sort by relevance, and write
-        ``blocks_relevance/`` files.  Returns the list of index entries
-        ``{position, size_bytes}`` for the relevance set.
+        Fuse all findings (published temporal blocks plus whatever is left
+        in the buffer) by hybrid rank and write ``blocks_relevance/`` files.
+        Returns the list of index entries ``{position, size_bytes}`` for the
+        relevance set.
         """
-        if not self._buffer.buffer_dir.exists():
+        findings = self._published_items()
+        if self._buffer.buffer_dir.exists():
+            findings.extend(self._load_finding(p) for p in self._buffer.list_findings())
+        if not findings:
             return []
 
-        finding_paths = self._buffer.list_findings()
-        if not finding_paths:
-            return []
-
-        findings = [self._load_finding(p) for p in finding_paths]
-
-        def _sort_key(f: dict) -> tuple:
-            """Return sort key."""
-            score = f.get("score")
-            score_val = -float(score) if score is not None else 0.0
-            result_id = str(f.get("result_id") or "")
-            return (score_val, result_id)
-
-        findings.sort(key=_sort_key)
+        findings = rank_findings(findings).items
 
         relevance_dir = self._layout.relevance_blocks_dir
         relevance_dir.mkdir(parents=True, exist_ok=True)
@@ -230,6 +307,19 @@ class BlockAssembler:
 
         return entries
 
+    def _published_items(self) -> list[dict]:
+        """Return items of the temporal blocks published so far, in order."""
+        positions: list[tuple[int, Path]] = []
+        if self._layout.blocks_dir.is_dir():
+            for path in self._layout.blocks_dir.iterdir():
+                match = _BLOCK_NAME_PATTERN.match(path.name)
+                if match is not None:
+                    positions.append((int(match.group(1)), path))
+        items: list[dict] = []
+        for _position, path in sorted(positions):
+            items.extend(block_items_from_payload(self._load_finding(path)))
+        return items
+
     def _next_block_position(self) -> int:
         """Return next block position."""
         highest = 0
@@ -0,0 +1,218 @@
+"""
+Hybrid ranking of findings from several search sources (reciprocal rank fusion).
+
+``score_for_source`` gives every source a score in ``[0, 1]``, but the scales
+are not comparable: a BM25 rank of 0.3 and a cosine similarity of 0.3 mean
+different things. Cross search therefore fuses by *rank* instead of score:
+
+- findings are grouped by source and ranked inside their source by score
+  (descending, ``result_id`` as the deterministic tie-break);
+- findings pointing at the same file and entity span (see :func:`fusion_key`)
+  are one fused result; inside one source only its best rank counts;
+- a fused result scores ``sum(weight[source] / (k + rank))`` over the sources
+  that found it (``k`` = :data:`RRF_K`, weights :data:`SOURCE_WEIGHTS`).
+
+While some sources are still running, the ranking orders by the score from
+finished sources only and keeps the bounds: each fused result scores at least
+that and at most that plus ``weight / (k + 1)`` per pending source (rank 1 is
+the best any pending source can give). The top ``n`` are *settled*
+(:meth:`HybridRanking.head_settled`) when the lowest of them beats the upper
+bound of everything else, including results no source has returned yet, so
+no later finding can push one of them off the page.
+
+Fused items keep the payload of their best contribution and add
+``rrf_score`` plus ``sources`` (one ``{source, result_id, score}`` per
+contribution), so a published item can be ranked again later.
+
+Author: Vasiliy Zdanovskiy
+email: vasilyvz@gmail.com
+"""
+
+from __future__ import annotations
+
+from collections.abc import Collection, Iterable, Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+from code_analysis.core.search_session.finding import FindingSource
+
+RRF_K: int = 60
+
+# Grep hits (line or structural ``cross`` rows) are literal matches without a
+# relevance model of their own; they only confirm what the indexes rank.
+SOURCE_WEIGHTS: Mapping[str, float] = {
+    FindingSource.fulltext.value: 1.0,
+    FindingSource.semantic.value: 1.0,
+    FindingSource.tree_query.value: 1.0,
+    FindingSource.cross.value: 0.5,
+    FindingSource.grep.value: 0.5,
+}
+
+_DEFAULT_WEIGHT = 1.0
+
+
+@dataclass(frozen=True)
+class HybridRanking:
+    """Fused ranking of a set of findings.
+
+    Attributes:
+        items: Deduplicated findings, best first.
+        floors: Score of each item from finished sources only.
+        slack: Most any item can still gain from pending sources.
+    """
+
+    items: list[dict[str, Any]] = field(default_factory=list)
+    floors: list[float] = field(default_factory=list)
+    slack: float = 0.0
+
+    def head_settled(self, count: int) -> bool:
+        """Return True when no pending result can enter the first ``count`` items.
+
+        The membership of the head is final; the order inside it may still
+        change while sources are pending.
+        """
+        if count <= 0 or count > len(self.items):
+            return False
+        if self.slack <= 0.0:
+            return True
+        outside = self.floors[count] if count < len(self.floors) else 0.0
+        return self.floors[count - 1] > outside + self.slack
+
+
+def fusion_key(finding: Mapping[str, Any]) -> tuple[str, ...]:
+    """Return the identity used to merge findings of different sources.
+
+    Findings match on project, file and entity span: the named entity when
+    the producer reports one, else the stable node id, else the line. A
+    finding with none of these (or without a file) only matches itself.
+    """
+    project = str(finding.get("project_id") or "")
+    file_path = str(finding.get("file_path") or "")
+    if file_path:
+        entity_name = finding.get("entity_name")
+        if entity_name:
+            return (
+                project,
+                file_path,
+                "entity",
+                str(finding.get("entity_type") or ""),
+                str(entity_name),
+            )
+        stable_id = finding.get("stable_id")
+        if stable_id and not str(stable_id).startswith("grep:"):
+            return (project, file_path, "node", str(stable_id))
+        line = finding.get("line") or finding.get("line_start")
+        if line:
+            return (project, file_path, "line", str(line))
+    return ("result", str(finding.get("result_id") or id(finding)))
+
+
+def _contributions(finding: dict[str, Any]) -> list[tuple[str, str, float]]:
+    """``(source, result_id, score)`` of a raw or already fused finding."""
+    fused = finding.get("sources")
+    if isinstance(fused, list) and fused:
+        return [
+            (
+                str(c.get("source") or ""),
+                str(c.get("result_id") or ""),
+                float(c.get("score") or 0.0),
+            )
+            for c in fused
+            if isinstance(c, dict)
+        ]
+    return [
+        (
+            str(finding.get("source") or ""),
+            str(finding.get("result_id") or ""),
+            float(finding.get("score") or 0.0),
+        )
+    ]
+
+
+def rank_findings(
+    findings: Iterable[dict[str, Any]],
+    *,
+    pending_sources: Collection[str] = (),
+    k: int = RRF_K,
+    weights: Mapping[str, float] | None = None,
+) -> HybridRanking:
+    """Fuse ``findings`` by weighted reciprocal rank.
+
+    Args:
+        findings: Buffer or block items (raw or previously fused).
+        pending_sources: Sources still producing results; their partial
+            ranks do not count towards the order, only towards the bounds.
+        k: RRF damping constant.
+        weights: Per-source weights (default :data:`SOURCE_WEIGHTS`).
+
+    Returns:
+        The fused ranking with the bounds needed by
+        :meth:`HybridRanking.head_settled`.
+    """
+    weights = SOURCE_WEIGHTS if weights is None else weights
+    pending = frozenset(pending_sources)
+
+    first_seen: dict[tuple[str, ...], dict[str, Any]] = {}
+    by_result: dict[tuple[str, str], tuple[dict[str, Any], float]] = {}
+    per_source: dict[str, list[tuple[float, str, tuple[str, ...]]]] = {}
+    for finding in findings:
+        key = fusion_key(finding)
+        first_seen.setdefault(key, finding)
+        for source, result_id, score in _contributions(finding):
+            by_result.setdefault((source, result_id), (finding, score))
+            per_source.setdefault(source, []).append((-score, result_id, key))
+
+    lower: dict[tuple[str, ...], float] = dict.fromkeys(first_seen, 0.0)
+    best: dict[tuple[str, ...], tuple[float, str, str]] = {}
+    contribs: dict[tuple[str, ...], list[dict[str, Any]]] = {
+        key: [] for key in first_seen
+    }
+    for source, entries in per_source.items():
+        weight = float(weights.get(source, _DEFAULT_WEIGHT))
+        rank = 0
+        seen: set[tuple[str, ...]] = set()
+        for neg_score, result_id, key in sorted(entries):
+            contribs[key].append(
+                {"source": source, "result_id": result_id, "score": -neg_score}
+            )
+            if key in seen:
+                continue
+            seen.add(key)
+            rank += 1
+            if source in pending:
+                continue
+            contribution = weight / (k + rank)
+            lower[key] += contribution
+            if key not in best or (-contribution, result_id) < best[key][:2]:
+                best[key] = (-contribution, result_id, source)
+
+    def _tie_break(key: tuple[str, ...]) -> str:
+        if key in best:
+            return best[key][1]
+        return min(str(c["result_id"]) for c in contribs[key])
+
+    ranked = sorted(first_seen, key=lambda key: (-lower[key], _tie_break(key), key))
+
+    items: list[dict[str, Any]] = []
+    for key in ranked:
+        winner = best.get(key)
+        if winner is None:
+            item = dict(first_seen[key])
+        else:
+            payload, score = by_result[(winner[2], winner[1])]
+            item = dict(payload)
+            if "sources" in payload:
+                item.update(source=winner[2], result_id=winner[1], score=score)
+        item["rrf_score"] = lower[key]
+        if len(contribs[key]) > 1:
+            item["sources"] = sorted(
+                contribs[key], key=lambda c: (c["source"], -c["score"], c["result_id"])
+            )
+        else:
+            item.pop("sources", None)
+        items.append(item)
+
+    slack = sum(float(weights.get(src, _DEFAULT_WEIGHT)) for src in pending) / (k + 1)
+    return HybridRanking(
+        items=items, floors=[lower[key] for key in ranked], slack=slack
+    )
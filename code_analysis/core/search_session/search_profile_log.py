@@ -3,7 +3,10 @@ Dedicated search profiling log (JSONL) for bottleneck analysis.
 
 Each line is one checkpoint with wall timing since job start and since the
 previous checkpoint. Written to ``{server.log_dir}/search_profile.jsonl`` by
-default (configurable via ``search_session.profile_log_filename``).
+default (configurable via ``search_session.profile_log_filename``). Phase
+durations carried by checkpoints (``backend_sec``, ``phase_sec``, ...) are
+also recorded in the ``code_analysis_search_phase_seconds`` histogram, even
+when the JSONL log is disabled.
 
 Author: Vasiliy Zdanovskiy
 email: vasilyvz@gmail.com
@@ -18,10 +21,21 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Mapping
 
+from code_analysis.core.metrics import observe
 from code_analysis.core.storage_paths import resolve_service_log_dir
 
 _WRITE_LOCK = threading.Lock()
 _DEFAULT_FILENAME = "search_profile.jsonl"
+# Checkpoint fields holding the duration of the phase the checkpoint closes,
+# in order of preference.
+_PHASE_DURATION_FIELDS = (
+    "backend_sec",
+    "phase_sec",
+    "pattern_sec",
+    "walk_sec",
+    "wait_sec",
+    "total_sec",
+)
 
 
 def resolve_search_profile_log_path(
@@ -77,6 +91,7 @@ class SearchProfileRecorder:
 
     def checkpoint(self, name: str, **fields: Any) -> None:
         """Record one timing checkpoint; never raises."""
+        _observe_phase(name, fields)
         if not self.enabled:
             return
         try:
@@ -101,6 +116,20 @@ class SearchProfileRecorder:
             return
 
 
+def _observe_phase(name: str, fields: Mapping[str, Any]) -> None:
+    """Record the checkpoint's phase duration field (if any) as a metric."""
+    for key in _PHASE_DURATION_FIELDS:
+        value = fields.get(key)
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            observe(
+                "code_analysis_search_phase_seconds",
+                float(value),
+                phase=name,
+                scope=str(fields.get("scope") or "project"),
+            )
+            return
+
+
 def open_search_profile_recorder(
     *,
     job_id: str,
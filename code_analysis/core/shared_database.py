@@ -8,15 +8,22 @@ get_shared_database() returns a proxy that forwards all calls to the real client
 except disconnect(), which is a no-op so command code can keep calling
 database.disconnect() in finally blocks without closing the shared connection.
 
+bind_shared_transaction() binds an open RPC transaction to the current context:
+proxy execute()/execute_batch() calls without an explicit transaction_id then
+run on that transaction (read_only_batch snapshots). select() and the other
+helpers keep using the pool.
+
 Author: Vasiliy Zdanovskiy
 email: vasilyvz@gmail.com
 """
 
 from __future__ import annotations
 
+import contextvars
 import os
 import threading
-from typing import Any, Optional, cast
+from contextlib import contextmanager
+from typing import Any, Iterator, Optional, cast
 
 # Driver-direct (stage 2): DatabaseClient class removed; the shared object held
 # here is a duck-typed driver-shaped instance (PostgreSQLDriver in production).
@@ -26,6 +33,9 @@ DatabaseClient = Any
 _lock = threading.Lock()
 _client: Optional[DatabaseClient] = None
 _owner_pid: Optional[int] = None
+_bound_transaction: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar(
+    "shared_database_bound_transaction", default=None
+)
 
 
 class SharedDatabaseNotInitializedError(Exception):
@@ -56,11 +66,39 @@ class _SharedDatabaseProxy:
         """No-op: do not close the shared connection when commands call disconnect()."""
         pass
 
+    def execute(self, *args: Any, **kwargs: Any) -> Any:
+        """Forward execute(), defaulting transaction_id to the bound transaction."""
+        bound = _bound_transaction.get()
+        if bound is not None and len(args) < 3 and kwargs.get("transaction_id") is None:
+            kwargs["transaction_id"] = bound
+        return self._client.execute(*args, **kwargs)
+
+    def execute_batch(self, *args: Any, **kwargs: Any) -> Any:
+        """Forward execute_batch(), defaulting transaction_id to the bound transaction."""
+        bound = _bound_transaction.get()
+        if bound is not None and len(args) < 2 and kwargs.get("transaction_id") is None:
+            kwargs["transaction_id"] = bound
+        return self._client.execute_batch(*args, **kwargs)
+
     def __getattr__(self, name: str) -> Any:
         """Forward all other attribute and method access to the wrapped client."""
         return getattr(self._client, name)
 
 
+@contextmanager
+def bind_shared_transaction(transaction_id: str) -> Iterator[None]:
+    """Route proxy execute()/execute_batch() in this context to ``transaction_id``.
+
+    The caller owns the transaction (begin/commit/rollback). Explicit
+    ``transaction_id`` arguments still win over the bound one.
+    """
+    token = _bound_transaction.set(transaction_id)
+    try:
+        yield
+    finally:
+        _bound_transaction.reset(token)
+
+
 def set_shared_database(client: DatabaseClient) -> None:
     """Store the long-lived database client in the thread-safe holder.
 
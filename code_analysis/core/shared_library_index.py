@@ -0,0 +1,302 @@
+"""
+Shared, deduplicated index of allowlisted third-party library files.
+
+Projects that index the same pip distribution from their own ``.venv`` (see
+``venv_site_packages_index_allowlisted_distributions``) used to chunk and
+embed identical files once per project. This module keeps one canonical copy
+of the chunks and embeddings per library file and lets every other project
+reference it:
+
+- ``library_files`` holds one row per ``(distribution, version, path inside
+  site-packages, sha256)`` with ``canonical_file_id`` pointing at the
+  ``files`` row whose chunks/embeddings are shared.
+- ``library_file_refs`` holds one row per project-local ``files`` row that
+  resolves to a library file (the canonical one included), so purge and
+  project deletion can count references.
+
+Only chunks and embeddings are deduplicated, and only with the pgvector
+backend. Per-project ``files`` rows and everything derived by the indexing
+worker (AST, CST, entities, usages, ``entity_cross_ref``, ``code_content``)
+are still stored once per copy: those rows are keyed by the project's own
+``file_id`` and joined by entity, usage, dependency and graph queries without
+a library scope, so sharing them would mean routing every such query through
+``library_file_refs``.
+
+The indexing worker registers copies with :func:`claim_shared_library_file`;
+with the pgvector backend the vectorization worker skips copies
+(:func:`library_copy_sql`), and semantic search adds :func:`library_scope_sql`
+to its project filter and maps shared hits back to the project's own copy with
+:func:`localize_library_rows`. FAISS indexes are per project, so there every
+copy is still chunked.
+
+When the canonical file is purged, :func:`build_library_release_ops` promotes
+the oldest remaining reference (marked ``needs_chunking = 1`` so it is indexed
+once) and drops library rows nobody references any more.
+
+Author: Vasiliy Zdanovskiy
+email: vasilyvz@gmail.com
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import uuid
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from .sql_portable import WHERE_FILES_ACTIVE
+from .site_packages_cache import cached_record_index
+from .venv_path_policy import iter_site_packages_dirs
+
+logger = logging.getLogger(__name__)
+
+LIBRARY_CANONICAL = "canonical"
+LIBRARY_REFERENCED = "referenced"
+LIBRARY_NOT_SHARED = "not_shared"
+
+
+class LibraryFileKey(NamedTuple):
+    """Identity of a library file shared across projects."""
+
+    dist_name: str
+    dist_version: str
+    relative_path: str
+    sha256: str
+
+
+def library_file_key(path: Path, project_root: Path) -> Optional[LibraryFileKey]:
+    """Return the shared identity of ``path``, or None for non-library files.
+
+    ``path`` must lie in a project-local ``.venv``/``venv`` site-packages and be
+    listed in the RECORD of an installed distribution.
+    """
+    try:
+        resolved = Path(path).resolve()
+    except OSError:
+        return None
+    for site_packages in iter_site_packages_dirs(project_root):
+        try:
+            rel = resolved.relative_to(site_packages).as_posix()
+        except ValueError:
+            continue
+        owner = cached_record_index(site_packages).get(rel)
+        if owner is None:
+            return None
+        try:
+            digest = hashlib.sha256(resolved.read_bytes()).hexdigest()
+        except OSError:
+            return None
+        return LibraryFileKey(owner[0], owner[1], rel, digest)
+    return None
+
+
+def _rows(database: Any, sql: str, params: Tuple[Any, ...]) -> List[Dict[str, Any]]:
+    result = database.execute(sql, params)
+    if not isinstance(result, dict):
+        return []
+    return list(result.get("data") or [])
+
+
+def _library_row(database: Any, key: LibraryFileKey) -> Optional[Dict[str, Any]]:
+    rows = _rows(
+        database,
+        "SELECT id, canonical_file_id FROM library_files "
+        "WHERE dist_name = ? AND dist_version = ? AND relative_path = ? "
+        "AND sha256 = ?",
+        tuple(key),
+    )
+    return rows[0] if rows else None
+
+
+def _file_is_active(database: Any, file_id: Any) -> bool:
+    return bool(
+        _rows(
+            database,
+            f"SELECT id FROM files WHERE id = ? AND {WHERE_FILES_ACTIVE}",
+            (file_id,),
+        )
+    )
+
+
+def build_library_release_ops(
+    purge_sel: str, params: Sequence[Any] = ()
+) -> List[Tuple[str, Tuple[Any, ...]]]:
+    """Ops that drop library references of the files selected by ``purge_sel``.
+
+    Run them before the ``files`` rows themselves are deleted. For every
+    library file whose canonical copy is being purged, the oldest remaining
+    active reference becomes canonical and is marked ``needs_chunking = 1``;
+    library rows left without a canonical copy are deleted.
+
+    ``purge_sel`` is a ``SELECT`` of ``files.id`` values; ``params`` are its
+    bound parameters and are repeated for every occurrence in an op.
+    """
+    successor = (
+        "SELECT r2.file_id FROM library_file_refs r2 "
+        "WHERE r2.library_file_id = {lib} "
+        f"AND r2.file_id NOT IN ({purge_sel}) "
+        "AND r2.file_id IN (SELECT id FROM files WHERE "
+        f"{WHERE_FILES_ACTIVE}) "
+        "ORDER BY r2.created_at, r2.file_id LIMIT 1"
+    )
+    sqls = [
+        "UPDATE files SET needs_chunking = 1 WHERE id IN ("
+        f"SELECT ({successor.format(lib='lf.id')}) FROM library_files lf "
+        f"WHERE lf.canonical_file_id IN ({purge_sel}))",
+        "UPDATE library_files SET canonical_file_id = ("
+        f"{successor.format(lib='library_files.id')}) "
+        f"WHERE canonical_file_id IN ({purge_sel})",
+        f"DELETE FROM library_file_refs WHERE file_id IN ({purge_sel})",
+        "DELETE FROM library_files WHERE canonical_file_id IS NULL",
+    ]
+    return [(sql, tuple(params) * sql.count(purge_sel)) for sql in sqls]
+
+
+def _release_file(database: Any, file_id: Any) -> None:
+    for sql, params in build_library_release_ops(
+        "SELECT id FROM files WHERE id = ?", (file_id,)
+    ):
+        database.execute(sql, params)
+
+
+def claim_shared_library_file(
+    database: Any,
+    project_id: str,
+    file_id: Any,
+    path: str,
+    project_root: Path,
+) -> str:
+    """Register ``file_id`` as a copy of a shared library file before indexing.
+
+    The file is indexed normally either way; only its chunks are shared.
+
+    Returns:
+        :data:`LIBRARY_CANONICAL` when this file holds (or takes over) the
+        shared chunks, :data:`LIBRARY_REFERENCED` when another project's copy
+        holds them (this copy's own chunks are dropped once, when the
+        reference is created), :data:`LIBRARY_NOT_SHARED` for ordinary files.
+    """
+    key = library_file_key(Path(path), project_root)
+    current_rows = _rows(
+        database,
+        "SELECT library_file_id FROM library_file_refs WHERE file_id = ?",
+        (file_id,),
+    )
+    current = current_rows[0]["library_file_id"] if current_rows else None
+    lib = _library_row(database, key) if key is not None else None
+    if current is not None and (lib is None or str(lib["id"]) != str(current)):
+        # Content or version changed: drop the old reference (promoting a
+        # successor if this file was canonical) before claiming the new one.
+        _release_file(database, file_id)
+        current = None
+        lib = _library_row(database, key) if key is not None else None
+    if key is None:
+        return LIBRARY_NOT_SHARED
+
+    if lib is None:
+        database.execute(
+            "INSERT INTO library_files "
+            "(id, dist_name, dist_version, relative_path, sha256, canonical_file_id) "
+            "VALUES (?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT (dist_name, dist_version, relative_path, sha256) DO NOTHING",
+            (str(uuid.uuid4()), *key, file_id),
+        )
+        lib = _library_row(database, key)
+        if lib is None:
+            return LIBRARY_NOT_SHARED
+    if current is None:
+        database.execute(
+            "INSERT INTO library_file_refs (file_id, project_id, library_file_id) "
+            "VALUES (?, ?, ?) ON CONFLICT (file_id) DO UPDATE SET "
+            "project_id = excluded.project_id, "
+            "library_file_id = excluded.library_file_id",
+            (file_id, project_id, lib["id"]),
+        )
+
+    canonical = lib.get("canonical_file_id")
+    if canonical is not None and str(canonical) == str(file_id):
+        return LIBRARY_CANONICAL
+    if canonical is None or not _file_is_active(database, canonical):
+        database.execute(
+            "UPDATE library_files SET canonical_file_id = ? "
+            "WHERE id = ? AND (canonical_file_id IS NULL OR canonical_file_id = ?)",
+            (file_id, lib["id"], canonical),
+        )
+        lib = _library_row(database, key) or lib
+        if str(lib.get("canonical_file_id")) == str(file_id):
+            return LIBRARY_CANONICAL
+
+    if current is None:
+        database.execute("DELETE FROM code_chunks WHERE file_id = ?", (file_id,))
+    return LIBRARY_REFERENCED
+
+
+def library_copy_sql(file_id_column: str) -> str:
+    """SQL predicate: the file is a non-canonical copy of a shared library file.
+
+    Binds no parameters. Used to keep copies out of chunking.
+    """
+    return (
+        f"{file_id_column} IN (SELECT r.file_id FROM library_file_refs r "
+        "JOIN library_files lf ON lf.id = r.library_file_id "
+        "WHERE lf.canonical_file_id <> r.file_id)"
+    )
+
+
+def library_scope_sql(file_id_column: str) -> str:
+    """SQL predicate adding the project's shared library files to a file filter.
+
+    Binds one parameter, the requesting ``project_id``.
+    """
+    return (
+        f"{file_id_column} IN (SELECT lf.canonical_file_id FROM library_file_refs r "
+        "JOIN library_files lf ON lf.id = r.library_file_id WHERE r.project_id = ?)"
+    )
+
+
+def localize_library_rows(
+    database: Any, project_id: str, rows: List[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    """Point search hits on another project's library copy at this project's copy.
+
+    Rows need ``file_id``; matching rows get the local ``file_id`` and
+    ``file_path``, the requesting ``project_id`` (and ``project_name`` when the
+    row has one) and ``shared_library=True``. Other rows are returned unchanged.
+    """
+    file_ids = sorted({str(r["file_id"]) for r in rows if r.get("file_id")})
+    if not file_ids:
+        return rows
+    placeholders = ",".join("?" * len(file_ids))
+    local: Dict[str, Dict[str, Any]] = {}
+    for row in _rows(
+        database,
+        "SELECT lf.canonical_file_id, r.file_id, f.path FROM library_file_refs r "
+        "JOIN library_files lf ON lf.id = r.library_file_id "
+        "JOIN files f ON f.id = r.file_id "
+        "WHERE r.project_id = ? AND r.file_id <> lf.canonical_file_id "
+        f"AND lf.canonical_file_id IN ({placeholders})",
+        (project_id, *file_ids),
+    ):
+        local.setdefault(str(row["canonical_file_id"]), row)
+    if not local:
+        return rows
+    project_name: Optional[str] = None
+    out: List[Dict[str, Any]] = []
+    for row in rows:
+        mine = local.get(str(row.get("file_id")))
+        if mine is None or str(row.get("project_id")) == str(project_id):
+            out.append(row)
+            continue
+        row = dict(row, file_id=mine["file_id"], file_path=mine["path"])
+        row["project_id"] = project_id
+        if "project_name" in row:
+            if project_name is None:
+                names = _rows(
+                    database, "SELECT name FROM projects WHERE id = ?", (project_id,)
+                )
+                project_name = str(names[0]["name"]) if names else ""
+            row["project_name"] = project_name
+        row["shared_library"] = True
+        out.append(row)
+    return out
@@ -0,0 +1,285 @@
+"""
+Persisted cache of ``*.dist-info`` metadata and RECORD file lists per site-packages.
+
+Resolving allowlisted venv files (``venv_site_packages_index_allowlisted_distributions``)
+used to list ``site-packages``, read every ``METADATA`` and parse the RECORD of
+each allowlisted distribution on every watcher cycle and every indexing walk.
+This module remembers, per site-packages directory:
+
+- the directory ``mtime_ns`` and the dist-info directory names seen under it;
+- per dist-info: a fingerprint (directory, ``METADATA`` and ``RECORD``
+  ``mtime_ns``/size), the PEP 503 name, the version and, once requested,
+  the ``.py`` paths listed in RECORD (relative POSIX paths).
+
+A lookup costs one ``stat`` of the directory plus three per dist-info while
+nothing changed. When the directory mtime moves (a package was installed or
+removed) it is listed again; dist-infos whose fingerprint still matches are
+reused, so only changed distributions are re-read. Entries live in memory and
+in one JSON file per directory under the user state home
+(``CODE_ANALYSIS_SITE_PACKAGES_CACHE_DIR`` overrides the location), so the
+file watcher process and the command server share them. Persisting is
+best-effort: an unreadable or corrupt file is ignored and rewritten.
+``CODE_ANALYSIS_SITE_PACKAGES_CACHE=0`` keeps the cache in memory only.
+
+Author: Vasiliy Zdanovskiy
+email: vasilyvz@gmail.com
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import AbstractSet, Any, Dict, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+ENV_SITE_PACKAGES_CACHE = "CODE_ANALYSIS_SITE_PACKAGES_CACHE"
+ENV_SITE_PACKAGES_CACHE_DIR = "CODE_ANALYSIS_SITE_PACKAGES_CACHE_DIR"
+
+CACHE_FORMAT = 1
+CACHE_DIR_NAME = "site_packages_cache"
+
+_FALSE_VALUES = ("0", "false", "no", "off")
+
+_lock = threading.Lock()
+_entries: Dict[str, Dict[str, Any]] = {}
+# site-packages -> (entry the map was built from, RECORD path -> owner).
+_record_indexes: Dict[str, Tuple[Dict[str, Any], Dict[str, Tuple[str, str]]]] = {}
+
+
+def _persist_enabled() -> bool:
+    env = os.environ.get(ENV_SITE_PACKAGES_CACHE)
+    if env is not None:
+        return env.strip().lower() not in _FALSE_VALUES
+    return True
+
+
+def cache_file_for(site_packages: Path) -> Path:
+    """Return the JSON file holding the cache for ``site_packages``."""
+    explicit = (os.environ.get(ENV_SITE_PACKAGES_CACHE_DIR) or "").strip()
+    if explicit:
+        base = Path(explicit).expanduser()
+    else:
+        from .runtime_state_root import default_state_home
+
+        base = default_state_home() / CACHE_DIR_NAME
+    key = hashlib.sha256(str(site_packages).encode("utf-8")).hexdigest()[:16]
+    return base / f"{key}.json"
+
+
+def clear_site_packages_cache() -> None:
+    """Drop the in-memory entries (persisted files are revalidated on load)."""
+    with _lock:
+        _entries.clear()
+        _record_indexes.clear()
+
+
+def _stat_key(path: Path) -> Optional[List[int]]:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+
+def _dist_fingerprint(dist_info: Path) -> Optional[List[Any]]:
+    dir_key = _stat_key(dist_info)
+    if dir_key is None:
+        return None
+    return [
+        dir_key[0],
+        _stat_key(dist_info / "METADATA"),
+        _stat_key(dist_info / "RECORD"),
+    ]
+
+
+def _load_persisted(site_packages: Path) -> Dict[str, Any]:
+    if not _persist_enabled():
+        return {}
+    try:
+        data = json.loads(cache_file_for(site_packages).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if (
+        not isinstance(data, dict)
+        or data.get("format") != CACHE_FORMAT
+        or data.get("site_packages") != str(site_packages)
+        or not isinstance(data.get("dists"), dict)
+    ):
+        return {}
+    return data
+
+
+def _save_persisted(site_packages: Path, entry: Dict[str, Any]) -> None:
+    if not _persist_enabled():
+        return
+    path = cache_file_for(site_packages)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp.write_text(json.dumps(entry), encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError as e:
+        logger.debug("Could not persist site-packages cache %s: %s", path, e)
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+
+
+def _read_dist(site_packages: Path, name: str, fp: List[Any]) -> Dict[str, Any]:
+    from .venv_path_policy import (
+        _read_dist_info_field,
+        normalize_pep503_distribution_name,
+    )
+
+    dist_info = site_packages / name
+    raw_name = _read_dist_info_field(dist_info, "Name")
+    return {
+        "fp": fp,
+        "name": normalize_pep503_distribution_name(raw_name) if raw_name else None,
+        "version": _read_dist_info_field(dist_info, "Version"),
+        "files": None,
+    }
+
+
+def _validated_entry(site_packages: Path) -> Tuple[Dict[str, Any], bool]:
+    """Return the up-to-date entry for ``site_packages`` and whether it changed.
+
+    Caller holds ``_lock``.
+    """
+    key = str(site_packages)
+    dir_key = _stat_key(site_packages)
+    entry = _entries.get(key)
+    if entry is None:
+        entry = _load_persisted(site_packages)
+    dists: Dict[str, Any] = dict(entry.get("dists") or {})
+    changed = not entry
+    if dir_key is None:
+        names: List[str] = []
+    elif entry.get("dir_mtime_ns") == dir_key[0]:
+        names = list(dists)
+    else:
+        try:
+            names = sorted(
+                child.name
+                for child in site_packages.iterdir()
+                if child.name.endswith(".dist-info") and child.is_dir()
+            )
+        except OSError:
+            names = []
+        changed = True
+    fresh: Dict[str, Any] = {}
+    for name in names:
+        fp = _dist_fingerprint(site_packages / name)
+        if fp is None:
+            changed = True
+            continue
+        cached = dists.get(name)
+        if cached is not None and cached.get("fp") == fp:
+            fresh[name] = cached
+        else:
+            fresh[name] = _read_dist(site_packages, name, fp)
+            changed = True
+    if changed:
+        entry = {
+            "format": CACHE_FORMAT,
+            "site_packages": key,
+            "dir_mtime_ns": dir_key[0] if dir_key is not None else None,
+            "dists": fresh,
+        }
+        changed = True
+    _entries[key] = entry
+    return entry, changed
+
+
+def _dist_files(site_packages: Path, name: str, dist: Dict[str, Any]) -> List[str]:
+    """RECORD ``.py`` paths of one dist-info, parsed once per fingerprint."""
+    files = dist.get("files")
+    if files is None:
+        from .venv_path_policy import _record_py_files
+
+        site_resolved = site_packages.resolve()
+        files = sorted(
+            p.relative_to(site_resolved).as_posix()
+            for p in _record_py_files(site_packages, site_packages / name)
+        )
+        dist["files"] = files
+    return files
+
+
+def _collect(
+    site_packages: Path,
+    entry: Dict[str, Any],
+    changed: bool,
+    allow: Optional[AbstractSet[str]],
+) -> List[Tuple[str, str, List[str]]]:
+    """``(name, version, files)`` of ``entry``'s matching distributions.
+
+    Persists ``entry`` when it ``changed`` or a RECORD was parsed. Caller
+    holds ``_lock``.
+    """
+    out: List[Tuple[str, str, List[str]]] = []
+    for name, dist in entry["dists"].items():
+        dname = dist.get("name")
+        if not dname or (allow is not None and dname not in allow):
+            continue
+        if dist.get("files") is None:
+            changed = True
+        out.append(
+            (
+                dname,
+                dist.get("version") or "",
+                _dist_files(site_packages, name, dist),
+            )
+        )
+    if changed:
+        _save_persisted(site_packages, entry)
+    return out
+
+
+def _with_entry(
+    site_packages: Path, allow: Optional[AbstractSet[str]]
+) -> List[Tuple[str, str, List[str]]]:
+    """``(name, version, files)`` for matching distributions (all when ``allow`` is None)."""
+    with _lock:
+        entry, changed = _validated_entry(site_packages)
+        return _collect(site_packages, entry, changed, allow)
+
+
+def cached_allowlisted_py_files(
+    site_packages: Path, allow: AbstractSet[str]
+) -> Set[Path]:
+    """Absolute ``.py`` paths of the distributions in ``allow`` (PEP 503 names)."""
+    base = site_packages.resolve()
+    return {
+        base / rel
+        for _name, _version, files in _with_entry(site_packages, allow)
+        for rel in files
+    }
+
+
+def cached_record_index(site_packages: Path) -> Dict[str, Tuple[str, str]]:
+    """Map RECORD ``.py`` paths (relative POSIX) to ``(PEP 503 name, version)``.
+
+    Distributions without a ``Version`` header are left out. The map is built
+    once per entry and shared until a dist-info changes; do not mutate it.
+    """
+    key = str(site_packages)
+    with _lock:
+        entry, changed = _validated_entry(site_packages)
+        memo = _record_indexes.get(key)
+        if memo is not None and memo[0] is entry and not changed:
+            return memo[1]
+        out: Dict[str, Tuple[str, str]] = {}
+        for name, version, files in _collect(site_packages, entry, changed, None):
+            if not version:
+                continue
+            for rel in files:
+                out[rel] = (name, version)
+        _record_indexes[key] = (entry, out)
+    return out
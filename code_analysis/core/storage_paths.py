@@ -10,6 +10,7 @@ email: vasilyvz@gmail.com
 
 from __future__ import annotations
 
+import os
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Mapping, Optional
@@ -107,6 +108,37 @@ def resolve_storage_paths(
     *,
     config_data: Mapping[str, Any],
     config_path: Path,
+) -> StoragePaths:
+    """
+    Resolve service state paths from config, memoized per config snapshot.
+
+    When ``config_data`` is a ``load_raw_config`` result, the paths are computed
+    once per config version (and per state-root environment), not per call.
+    See :func:`_resolve_storage_paths` for the resolution rules.
+    """
+    from code_analysis.core.config_state import snapshot_for_config_data
+    from code_analysis.core.runtime_state_root import ENV_RUNTIME_DIR, ENV_STATE_HOME
+
+    snapshot = snapshot_for_config_data(config_data)
+    if snapshot is None:
+        return _resolve_storage_paths(config_data=config_data, config_path=config_path)
+    key = (
+        "storage_paths",
+        str(config_path),
+        os.environ.get(ENV_RUNTIME_DIR),
+        os.environ.get(ENV_STATE_HOME),
+        os.environ.get("HOME"),
+    )
+    return snapshot.derive(
+        key,
+        lambda data: _resolve_storage_paths(config_data=data, config_path=config_path),
+    )
+
+
+def _resolve_storage_paths(
+    *,
+    config_data: Mapping[str, Any],
+    config_path: Path,
 ) -> StoragePaths:
     """
     Resolve service state paths from config.
@@ -17,6 +17,7 @@ import time
 from pathlib import Path
 from typing import Any, List, cast
 
+from .metrics import observe
 from .svo_client_manager_logging import (
     TRACE_PREVIEW_LEN as _TRACE_PREVIEW_LEN,
     _get_chunker_logger,
@@ -142,6 +143,12 @@ async def get_chunks(manager: Any, text: str, **kwargs: Any) -> List[Any]:
         rpc = _chunk_rpc_kwargs(chunk_kwargs)
         chunks = await manager._chunker_client.chunk(text=text, **rpc)
         request_duration = time.time() - request_start_time
+        observe(
+            "code_analysis_svo_request_seconds",
+            request_duration,
+            service="chunker",
+            outcome="success",
+        )
         chunks_count = len(chunks) if chunks else 0
         has_embeddings = False
         if chunks:
@@ -173,6 +180,12 @@ async def get_chunks(manager: Any, text: str, **kwargs: Any) -> List[Any]:
         return cast(List[Any], chunks)
     except Exception as e:
         request_duration = time.time() - request_start_time
+        observe(
+            "code_analysis_svo_request_seconds",
+            request_duration,
+            service="chunker",
+            outcome="error",
+        )
         chunker_log.error(
             "ERROR | duration=%.3fs | error_type=%s | error=%s",
             request_duration,
@@ -244,6 +257,12 @@ async def get_chunks_batch(
         rpc = _chunk_rpc_kwargs(chunk_kwargs)
         batch = await manager._chunker_client.chunk_batch(texts=valid_texts, **rpc)
         request_duration = time.time() - request_start_time
+        observe(
+            "code_analysis_svo_request_seconds",
+            request_duration,
+            service="chunker_batch",
+            outcome="success",
+        )
         for k, idx in enumerate(valid_indices):
             if k < len(batch):
                 result[idx] = batch[k]
@@ -281,6 +300,12 @@ async def get_chunks_batch(
         return result
     except Exception as e:
         request_duration = time.time() - request_start_time
+        observe(
+            "code_analysis_svo_request_seconds",
+            request_duration,
+            service="chunker_batch",
+            outcome="error",
+        )
         chunker_log.error(
             "BATCH ERROR | duration=%.3fs | error_type=%s | error=%s",
             request_duration,
@@ -11,8 +11,11 @@ from __future__ import annotations
 
 import logging
 import sys
+import time
 from typing import Any, Iterable, List
 
+from .metrics import observe
+
 logger = logging.getLogger(__name__)
 
 # Max seconds to wait for an in-process embed_execute batch to complete.
@@ -121,6 +124,7 @@ async def get_embeddings(
             "Embedding service is not available or not enabled. "
             "Ensure code_analysis.embedding.enabled=true and service is running."
         )
+    request_start_time = time.perf_counter()
     try:
         texts: list[str] = [get_chunk_text(ch) for ch in chunks_list]
         # Use the embed_client high-level ``embed(wait=True)``: it runs the embed
@@ -161,8 +165,20 @@ async def get_embeddings(
                 if model is not None:
                     setattr(ch, "embedding_model", model)
         manager._record_success()
+        observe(
+            "code_analysis_svo_request_seconds",
+            time.perf_counter() - request_start_time,
+            service="embedding",
+            outcome="success",
+        )
         return chunks_list
     except Exception as e:
+        observe(
+            "code_analysis_svo_request_seconds",
+            time.perf_counter() - request_start_time,
+            service="embedding",
+            outcome="error",
+        )
         manager._record_failure()
         err_str = str(e).lower()
         is_unavailable = (
@@ -0,0 +1,36 @@
+"""
+In-memory per-project symbol graph: files, classes, functions and methods as
+compact integer nodes with CSR ``calls`` / ``inherits`` / ``imports`` / ``uses``
+adjacency, cached per project and patched per re-indexed file.
+
+Read-side relationship commands (``export_graph``, ``get_class_hierarchy``,
+``get_entity_dependencies`` / ``get_entity_dependents``) answer neighbourhood,
+closure and reverse queries from it instead of re-running their joins per
+request. Lives in ``core`` (not under a command package) to respect the
+command→core layering.
+
+Author: Vasiliy Zdanovskiy
+email: vasilyvz@gmail.com
+"""
+
+from __future__ import annotations
+
+from .cache import clear_symbol_graph_cache, get_project_symbol_graph, parse_bases
+from .graph import (
+    ENTITY_KINDS,
+    NODE_KINDS,
+    FileFragment,
+    RefEdge,
+    SymbolGraph,
+)
+
+__all__ = [
+    "ENTITY_KINDS",
+    "NODE_KINDS",
+    "FileFragment",
+    "RefEdge",
+    "SymbolGraph",
+    "clear_symbol_graph_cache",
+    "get_project_symbol_graph",
+    "parse_bases",
+]
@@ -0,0 +1,418 @@
+"""
+Per-project :class:`~.graph.SymbolGraph` cache, patched per re-indexed file.
+
+Each request first runs one aggregate query over the project's ``files`` rows
+(``COUNT(*)``, ``MAX(updated_at)`` and the DB clock). When that signature is
+unchanged the cached graph is returned as is. Otherwise the per-file
+``updated_at`` stamps are compared with the cached fragments and only the
+files that were added, removed or re-indexed are reloaded (entities, imports,
+usages, and every ``entity_cross_ref`` row whose caller or callee lives in one
+of them); the graph is then recompiled in memory from the fragments.
+
+Re-indexing bumps ``files.updated_at`` first and rebuilds ``entity_cross_ref``
+(and, on the ``update_indexes`` path, ``usages``) in later statements, so a
+file stamped within :data:`SETTLE_SECONDS` of the load is reloaded again on the
+next request even when its stamp did not move.
+
+The signature query runs before any lock is taken; loading and patching hold a
+per-project lock only, so a slow refresh never blocks other projects.
+
+Author: Vasiliy Zdanovskiy
+email: vasilyvz@gmail.com
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from ..sql_portable import sql_julian_timestamp_now_expr
+from .graph import FileFragment, SymbolGraph
+
+logger = logging.getLogger(__name__)
+
+# Files stamped more recently than this may still get cross-ref/usage rows.
+SETTLE_SECONDS = 300.0
+# More changed files than this reload the whole project instead of patching.
+PATCH_MAX_FILES = 256
+MAX_CACHED_PROJECTS = 8
+
+_CALLER_FILE_SQL = "COALESCE(rc.file_id, rmc.file_id, rf.file_id)"
+_CALLEE_FILE_SQL = "COALESCE(ec.file_id, emc.file_id, ef.file_id)"
+
+
+@dataclass
+class _ProjectGraph:
+    signature: Tuple[int, Optional[float]]
+    fragments: Dict[str, FileFragment]
+    unsettled: Set[str]
+    graph: SymbolGraph
+
+
+_cache: "OrderedDict[str, _ProjectGraph]" = OrderedDict()
+# Guards ``_cache`` and ``_project_locks`` only; never held across DB queries.
+_lock = threading.Lock()
+# Serializes loading/patching of one project; other projects are not blocked.
+_project_locks: Dict[str, threading.Lock] = {}
+
+
+def _fresh(state: _ProjectGraph, signature: Tuple[int, Optional[float]]) -> bool:
+    return state.signature == signature and not state.unsettled
+
+
+def get_project_symbol_graph(db: Any, project_id: str) -> SymbolGraph:
+    """Return the symbol graph of ``project_id``, loading or patching it first.
+
+    Args:
+        db: Database client exposing ``execute(sql, params) -> {"data": [...]}``.
+        project_id: Project UUID.
+
+    Returns:
+        Current :class:`SymbolGraph` for the project.
+    """
+    count, max_updated, now = _project_signature(db, project_id)
+    signature = (count, max_updated)
+    with _lock:
+        state = _cache.get(project_id)
+        if state is not None and _fresh(state, signature):
+            _cache.move_to_end(project_id)
+            return state.graph
+        project_lock = _project_locks.setdefault(project_id, threading.Lock())
+
+    with project_lock:
+        with _lock:
+            state = _cache.get(project_id)
+        # Another request may have refreshed the project while we waited.
+        if state is not None and _fresh(state, signature):
+            return state.graph
+        try:
+            fragments = _refresh_fragments(db, project_id, state)
+        except Exception:
+            # A half-applied patch must not be reused.
+            with _lock:
+                _cache.pop(project_id, None)
+            raise
+
+        unsettled: Set[str] = set()
+        if now is not None:
+            horizon = now - SETTLE_SECONDS / 86400.0
+            unsettled = {
+                fid
+                for fid, fr in fragments.items()
+                if fr.updated_at is not None and fr.updated_at > horizon
+            }
+        graph = SymbolGraph(fragments.values())
+        with _lock:
+            _cache[project_id] = _ProjectGraph(signature, fragments, unsettled, graph)
+            _cache.move_to_end(project_id)
+            while len(_cache) > MAX_CACHED_PROJECTS:
+                _cache.popitem(last=False)
+        return graph
+
+
+def clear_symbol_graph_cache(project_id: Optional[str] = None) -> None:
+    """Drop the cached graph of one project (or of all projects)."""
+    with _lock:
+        if project_id is None:
+            _cache.clear()
+        else:
+            _cache.pop(project_id, None)
+
+
+def _refresh_fragments(
+    db: Any, project_id: str, state: Optional[_ProjectGraph]
+) -> Dict[str, FileFragment]:
+    """Return fragments for the current ``files`` rows, reusing unchanged ones."""
+    stamps = _file_rows(db, project_id)
+    if state is None:
+        return _load_fragments(db, project_id, stamps, None)
+    fragments = state.fragments
+    changed = {
+        fid
+        for fid, fr in stamps.items()
+        if fid not in fragments
+        or fragments[fid].updated_at != fr.updated_at
+        or fragments[fid].path != fr.path
+        or fragments[fid].relative_path != fr.relative_path
+    }
+    changed |= state.unsettled & stamps.keys()
+    removed = fragments.keys() - stamps.keys()
+    if len(changed) + len(removed) > PATCH_MAX_FILES:
+        return _load_fragments(db, project_id, stamps, None)
+    if changed or removed:
+        _patch_fragments(db, project_id, fragments, stamps, changed, removed)
+    return fragments
+
+
+def _rows(db: Any, sql: str, params: tuple) -> List[Dict[str, Any]]:
+    result = db.execute(sql, params)
+    data = result.get("data") if isinstance(result, dict) else None
+    return list(data) if data else []
+
+
+def _as_float(value: Any) -> Optional[float]:
+    return float(value) if value is not None else None
+
+
+def _as_int(value: Any) -> Optional[int]:
+    return int(value) if value is not None else None
+
+
+def _as_str(value: Any) -> Optional[str]:
+    return str(value) if value is not None else None
+
+
+def _project_signature(
+    db: Any, project_id: str
+) -> Tuple[int, Optional[float], Optional[float]]:
+    """Return ``(file count, max updated_at, DB now)`` in Julian days."""
+    rows = _rows(
+        db,
+        "SELECT COUNT(*) AS file_count, MAX(updated_at) AS max_updated, "
+        f"{sql_julian_timestamp_now_expr(db)} AS now "
+        "FROM files WHERE project_id = ?",
+        (project_id,),
+    )
+    if not rows:
+        return (0, None, None)
+    row = rows[0]
+    return (
+        int(row.get("file_count") or 0),
+        _as_float(row.get("max_updated")),
+        _as_float(row.get("now")),
+    )
+
+
+def _file_rows(db: Any, project_id: str) -> Dict[str, FileFragment]:
+    """Return empty fragments (file metadata only) for every project file."""
+    out: Dict[str, FileFragment] = {}
+    for row in _rows(
+        db,
+        "SELECT id, path, relative_path, updated_at FROM files WHERE project_id = ?",
+        (project_id,),
+    ):
+        fid = str(row.get("id"))
+        out[fid] = FileFragment(
+            file_id=fid,
+            path=str(row.get("path") or ""),
+            relative_path=row.get("relative_path"),
+            updated_at=_as_float(row.get("updated_at")),
+        )
+    return out
+
+
+def parse_bases(bases_raw: Any) -> List[str]:
+    """Parse ``classes.bases`` (JSON array, or already decoded) into strings."""
+    if not bases_raw:
+        return []
+    try:
+        bases = json.loads(bases_raw) if isinstance(bases_raw, str) else bases_raw
+    except (ValueError, TypeError):
+        return []
+    if not isinstance(bases, list):
+        bases = [bases] if bases else []
+    return [b if isinstance(b, str) else str(b) for b in bases]
+
+
+def _in_clause(column: str, file_ids: Set[str]) -> Tuple[str, tuple]:
+    ordered = tuple(sorted(file_ids))
+    return f"{column} IN ({','.join('?' * len(ordered))})", ordered
+
+
+def _load_fragments(
+    db: Any,
+    project_id: str,
+    files: Dict[str, FileFragment],
+    file_ids: Optional[Set[str]],
+) -> Dict[str, FileFragment]:
+    """Fill fragments for ``file_ids`` (all of ``files`` when None) from the DB.
+
+    Cross-refs are loaded for callers in those files only; see
+    :func:`_patch_fragments` for refs into them from other files.
+    """
+    wanted = files if file_ids is None else {fid: files[fid] for fid in file_ids}
+    if not wanted:
+        return {}
+    flt = ""
+    params: tuple = (project_id,)
+    ref_flt = ""
+    ref_params: tuple = (project_id,)
+    if file_ids is not None:
+        clause, ids = _in_clause("f.id", file_ids)
+        flt, params = f" AND {clause}", (project_id, *ids)
+        clause, ids = _in_clause(_CALLER_FILE_SQL, file_ids)
+        ref_flt, ref_params = f" AND {clause}", (project_id, *ids)
+
+    for row in _rows(
+        db,
+        "SELECT c.id, c.file_id, c.name, c.line, c.bases, c.cst_node_id "
+        "FROM classes c JOIN files f ON f.id = c.file_id "
+        f"WHERE f.project_id = ?{flt}",
+        params,
+    ):
+        fr = wanted.get(str(row.get("file_id")))
+        if fr is not None:
+            fr.classes.append(
+                (
+                    str(row.get("id")),
+                    str(row.get("name") or ""),
+                    _as_int(row.get("line")),
+                    parse_bases(row.get("bases")),
+                    _as_str(row.get("cst_node_id")),
+                )
+            )
+    for row in _rows(
+        db,
+        "SELECT fn.id, fn.file_id, fn.name, fn.line, fn.cst_node_id "
+        "FROM functions fn JOIN files f ON f.id = fn.file_id "
+        f"WHERE f.project_id = ?{flt}",
+        params,
+    ):
+        fr = wanted.get(str(row.get("file_id")))
+        if fr is not None:
+            fr.functions.append(
+                (
+                    str(row.get("id")),
+                    str(row.get("name") or ""),
+                    _as_int(row.get("line")),
+                    _as_str(row.get("cst_node_id")),
+                )
+            )
+    for row in _rows(
+        db,
+        "SELECT m.id, c.file_id, c.name AS class_name, m.name, m.line, m.cst_node_id "
+        "FROM methods m JOIN classes c ON c.id = m.class_id "
+        "JOIN files f ON f.id = c.file_id "
+        f"WHERE f.project_id = ?{flt}",
+        params,
+    ):
+        fr = wanted.get(str(row.get("file_id")))
+        if fr is not None:
+            fr.methods.append(
+                (
+                    str(row.get("id")),
+                    f"{row.get('class_name')}.{row.get('name')}",
+                    _as_int(row.get("line")),
+                    _as_str(row.get("cst_node_id")),
+                )
+            )
+    for row in _rows(
+        db,
+        "SELECT i.file_id, i.module, i.name, i.line "
+        "FROM imports i JOIN files f ON f.id = i.file_id "
+        f"WHERE f.project_id = ?{flt}",
+        params,
+    ):
+        fr = wanted.get(str(row.get("file_id")))
+        target = row.get("module") or row.get("name")
+        if fr is not None and target:
+            fr.imports.append((str(target), _as_int(row.get("line"))))
+    for row in _rows(
+        db,
+        "SELECT u.file_id, u.target_class, u.target_name, u.line "
+        "FROM usages u JOIN files f ON f.id = u.file_id "
+        f"WHERE f.project_id = ?{flt}",
+        params,
+    ):
+        fr = wanted.get(str(row.get("file_id")))
+        name = row.get("target_name")
+        if fr is None or not name:
+            continue
+        target_class = row.get("target_class")
+        target = f"{target_class}.{name}" if target_class else str(name)
+        fr.usages.append((target, _as_int(row.get("line"))))
+
+    for caller_file, ref in _load_refs(db, ref_flt, ref_params):
+        fr = wanted.get(caller_file)
+        if fr is not None:
+            fr.refs.append(ref)
+    return dict(wanted)
+
+
+def _load_refs(db: Any, where_extra: str, params: tuple) -> List[Tuple[str, Any]]:
+    """Return ``(caller file_id, ref tuple)`` for project cross-ref rows."""
+    sql = f"""
+        SELECT e.caller_class_id, e.caller_method_id, e.caller_function_id,
+               e.callee_class_id, e.callee_method_id, e.callee_function_id,
+               e.ref_type, e.file_id, e.line,
+               {_CALLER_FILE_SQL} AS caller_file_id
+        FROM entity_cross_ref e
+        LEFT JOIN classes rc ON rc.id = e.caller_class_id
+        LEFT JOIN methods rm ON rm.id = e.caller_method_id
+        LEFT JOIN classes rmc ON rmc.id = rm.class_id
+        LEFT JOIN functions rf ON rf.id = e.caller_function_id
+        LEFT JOIN classes ec ON ec.id = e.callee_class_id
+        LEFT JOIN methods em ON em.id = e.callee_method_id
+        LEFT JOIN classes emc ON emc.id = em.class_id
+        LEFT JOIN functions ef ON ef.id = e.callee_function_id
+        JOIN files f ON f.id = {_CALLER_FILE_SQL}
+        WHERE f.project_id = ?{where_extra}
+    """
+    out: List[Tuple[str, Any]] = []
+    for row in _rows(db, sql, params):
+        caller = _entity_key(row, "caller")
+        callee = _entity_key(row, "callee")
+        if caller is None or callee is None:
+            continue
+        site = row.get("file_id")
+        out.append(
+            (
+                str(row.get("caller_file_id")),
+                (
+                    caller,
+                    callee,
+                    str(row.get("ref_type") or ""),
+                    str(site) if site is not None else None,
+                    row.get("line"),
+                ),
+            )
+        )
+    return out
+
+
+def _entity_key(row: Dict[str, Any], side: str) -> Optional[Tuple[str, str]]:
+    for kind in ("class", "method", "function"):
+        value = row.get(f"{side}_{kind}_id")
+        if value is not None:
+            return (kind, str(value))
+    return None
+
+
+def _patch_fragments(
+    db: Any,
+    project_id: str,
+    fragments: Dict[str, FileFragment],
+    files: Dict[str, FileFragment],
+    changed: Set[str],
+    removed: Set[str],
+) -> None:
+    """Replace fragments of changed/removed files in place."""
+    stale_keys: Set[Tuple[str, str]] = set()
+    for fid in changed | removed:
+        old = fragments.pop(fid, None)
+        if old is not None:
+            stale_keys |= old.entity_keys()
+    if stale_keys:
+        for fr in fragments.values():
+            if fr.refs:
+                fr.refs = [r for r in fr.refs if r[1] not in stale_keys]
+    if not changed:
+        return
+    fresh = _load_fragments(db, project_id, files, changed)
+    # Refs from untouched files into the reloaded ones (re-indexing replaced
+    # the callee rows, so the old edges above were dropped).
+    callee_in, callee_ids = _in_clause(_CALLEE_FILE_SQL, changed)
+    caller_in, caller_ids = _in_clause(_CALLER_FILE_SQL, changed)
+    for caller_file, ref in _load_refs(
+        db,
+        f" AND {callee_in} AND NOT {caller_in}",
+        (project_id, *callee_ids, *caller_ids),
+    ):
+        caller = fragments.get(caller_file)
+        if caller is not None:
+            caller.refs.append(ref)
+    fragments.update(fresh)
@@ -0,0 +1,463 @@
+"""
+Compact in-memory symbol graph for one project.
+
+Nodes are dense integers: each indexed file followed by the classes, functions
+and methods defined in it (files in path order, entities in line order), so the
+entities of a file are the contiguous range after its file node. Per-node
+attributes live in parallel arrays/lists; relationships are CSR adjacency arrays
+(offsets + edge indices) built in both directions:
+
+- ``calls``: entity -> entity, one edge per ``entity_cross_ref`` row (any ``ref_type``).
+- ``inherits``: class -> class, resolving each ``bases`` entry by its last dotted
+  component (the rule ``get_class_hierarchy`` uses).
+- ``imports``: file -> symbol, from ``imports`` (``module`` or ``name``).
+- ``uses``: file -> symbol, from ``usages`` (``Class.name`` or ``name``).
+
+Import and usage targets are plain strings, interned in a separate symbol table
+so "which files import X" is a reverse CSR lookup too. A graph is immutable;
+:mod:`.cache` compiles a new one from its per-file fragments after patching the
+files that were re-indexed.
+
+Author: Vasiliy Zdanovskiy
+email: vasilyvz@gmail.com
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections import deque
+from dataclasses import dataclass, field
+from typing import (
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+NODE_KINDS = ("file", "class", "function", "method")
+ENTITY_KINDS = ("class", "function", "method")
+NODE_RELATIONS = ("calls", "inherits")
+SYMBOL_RELATIONS = ("imports", "uses")
+
+_KIND_CODE = {kind: code for code, kind in enumerate(NODE_KINDS)}
+_NO_LINE = -1
+
+# (entity kind, entity id as str)
+EntityKey = Tuple[str, str]
+
+
+@dataclass
+class FileFragment:
+    """One ``files`` row and everything indexed from it.
+
+    ``refs`` holds the ``entity_cross_ref`` rows whose caller lives in this file.
+    Methods carry their qualified ``Class.method`` name.
+    """
+
+    file_id: str
+    path: str
+    relative_path: Optional[str] = None
+    updated_at: Optional[float] = None
+    # (id, name, line, bases, cst_node_id)
+    classes: List[Tuple[str, str, Optional[int], List[str], Optional[str]]] = field(
+        default_factory=list
+    )
+    # (id, name, line, cst_node_id)
+    functions: List[Tuple[str, str, Optional[int], Optional[str]]] = field(
+        default_factory=list
+    )
+    # (id, "Class.method", line, cst_node_id)
+    methods: List[Tuple[str, str, Optional[int], Optional[str]]] = field(
+        default_factory=list
+    )
+    # (target, line)
+    imports: List[Tuple[str, Optional[int]]] = field(default_factory=list)
+    usages: List[Tuple[str, Optional[int]]] = field(default_factory=list)
+    # (caller, callee, ref_type, site file_id, line)
+    refs: List[Tuple[EntityKey, EntityKey, str, Optional[str], Optional[int]]] = field(
+        default_factory=list
+    )
+
+    def entity_keys(self) -> Set[EntityKey]:
+        """Return keys of every entity defined in this file."""
+        keys: Set[EntityKey] = {("class", row[0]) for row in self.classes}
+        keys.update(("function", row[0]) for row in self.functions)
+        keys.update(("method", row[0]) for row in self.methods)
+        return keys
+
+
+class RefEdge(NamedTuple):
+    """One ``calls`` edge: entity nodes, reference type and call site."""
+
+    source: int
+    target: int
+    ref_type: str
+    file: int
+    line: Optional[int]
+
+
+def _csr(size: int, keys: Sequence[int]) -> Tuple[array, array]:
+    """Group edge indices by key: ``edges[offsets[k]:offsets[k + 1]]`` (stable)."""
+    offsets = array("i", [0]) * (size + 1)
+    for k in keys:
+        offsets[k + 1] += 1
+    for i in range(size):
+        offsets[i + 1] += offsets[i]
+    edges = array("i", [0]) * len(keys)
+    cursor = offsets[:-1]
+    for e, k in enumerate(keys):
+        edges[cursor[k]] = e
+        cursor[k] += 1
+    return offsets, edges
+
+
+class _Relation:
+    """Edge list plus forward and reverse CSR indexes over it."""
+
+    __slots__ = ("src", "dst", "out_offsets", "out_edges", "in_offsets", "in_edges")
+
+    def __init__(self, src: array, dst: array, n_src: int, n_dst: int) -> None:
+        self.src = src
+        self.dst = dst
+        self.out_offsets, self.out_edges = _csr(n_src, src)
+        self.in_offsets, self.in_edges = _csr(n_dst, dst)
+
+    def out(self, n: int) -> array:
+        """Return indices of edges leaving ``n``."""
+        return self.out_edges[self.out_offsets[n] : self.out_offsets[n + 1]]
+
+    def into(self, n: int) -> array:
+        """Return indices of edges entering ``n``."""
+        return self.in_edges[self.in_offsets[n] : self.in_offsets[n + 1]]
+
+
+class SymbolGraph:
+    """Immutable project symbol graph compiled from :class:`FileFragment` rows."""
+
+    def __init__(self, fragments: Iterable[FileFragment]) -> None:
+        """Number nodes, intern symbols and build CSR indexes."""
+        self._kind = array("b")
+        self._file = array("i")
+        self._line = array("i")
+        self._name: List[str] = []
+        self._entity_id: List[str] = []
+        self._cst: List[Optional[str]] = []
+        self._relative: Dict[int, Optional[str]] = {}
+        self._file_end: Dict[int, int] = {}
+        self._bases: Dict[int, List[str]] = {}
+        self._by_key: Dict[EntityKey, int] = {}
+        self._by_name: Dict[Tuple[str, str], List[int]] = {}
+        self._by_path: Dict[str, int] = {}
+        self._file_nodes = array("i")
+        self._symbols: List[str] = []
+        self._symbol_ids: Dict[str, int] = {}
+        self._ref_types: List[str] = []
+        frags = sorted(fragments, key=lambda fr: (fr.path, fr.file_id))
+
+        for fr in frags:
+            fnode = self._add_node("file", fr.file_id, fr.path, _NO_LINE, None, -1)
+            self._relative[fnode] = fr.relative_path
+            self._by_path.setdefault(fr.path, fnode)
+            self._file_nodes.append(fnode)
+            for cid, name, line, bases, cst in sorted(fr.classes, key=_by_line):
+                node = self._add_node("class", cid, name, line, cst, fnode)
+                self._bases[node] = list(bases)
+            for fid, name, line, cst in sorted(fr.functions, key=_by_line):
+                self._add_node("function", fid, name, line, cst, fnode)
+            for mid, qualname, line, cst in sorted(fr.methods, key=_by_line):
+                node = self._add_node("method", mid, qualname, line, cst, fnode)
+                short = qualname.rsplit(".", 1)[-1]
+                if short != qualname:
+                    self._by_name.setdefault(("method", short), []).append(node)
+            self._file_end[fnode] = len(self._kind)
+
+        n = len(self._kind)
+        self._relations: Dict[str, _Relation] = {}
+        self._symbol_lines: Dict[str, array] = {}
+        self._build_calls(frags, n)
+        self._build_inherits(n)
+        for relation, attr in (("imports", "imports"), ("uses", "usages")):
+            src = array("i")
+            dst = array("i")
+            lines = array("i")
+            for fr in frags:
+                fnode = self._by_key[("file", fr.file_id)]
+                for target, line in sorted(getattr(fr, attr), key=_by_target_line):
+                    src.append(fnode)
+                    dst.append(self._intern(target))
+                    lines.append(line if line is not None else _NO_LINE)
+            self._relations[relation] = _Relation(src, dst, n, len(self._symbols))
+            self._symbol_lines[relation] = lines
+
+    def _add_node(
+        self,
+        kind: str,
+        entity_id: str,
+        name: str,
+        line: Optional[int],
+        cst: Optional[str],
+        file_node: int,
+    ) -> int:
+        node = len(self._kind)
+        self._kind.append(_KIND_CODE[kind])
+        self._file.append(node if file_node < 0 else file_node)
+        self._line.append(line if line is not None else _NO_LINE)
+        self._name.append(name)
+        self._entity_id.append(entity_id)
+        self._cst.append(cst)
+        self._by_key[(kind, entity_id)] = node
+        if kind != "file":
+            self._by_name.setdefault((kind, name), []).append(node)
+        return node
+
+    def _intern(self, symbol: str) -> int:
+        sid = self._symbol_ids.get(symbol)
+        if sid is None:
+            sid = len(self._symbols)
+            self._symbols.append(symbol)
+            self._symbol_ids[symbol] = sid
+        return sid
+
+    def _build_calls(self, frags: List[FileFragment], n: int) -> None:
+        src = array("i")
+        dst = array("i")
+        self._ref_site = array("i")
+        self._ref_line = array("i")
+        self._ref_type = array("i")
+        ref_type_ids: Dict[str, int] = {}
+        for fr in frags:
+            for caller, callee, ref_type, site_file_id, line in fr.refs:
+                s = self._by_key.get(caller)
+                t = self._by_key.get(callee)
+                if s is None or t is None:
+                    continue
+                tid = ref_type_ids.get(ref_type)
+                if tid is None:
+                    tid = ref_type_ids[ref_type] = len(self._ref_types)
+                    self._ref_types.append(ref_type)
+                site = (
+                    self._by_key.get(("file", site_file_id), -1)
+                    if site_file_id is not None
+                    else -1
+                )
+                src.append(s)
+                dst.append(t)
+                self._ref_site.append(site)
+                self._ref_line.append(line if line is not None else _NO_LINE)
+                self._ref_type.append(tid)
+        self._relations["calls"] = _Relation(src, dst, n, n)
+
+    def _build_inherits(self, n: int) -> None:
+        src = array("i")
+        dst = array("i")
+        for node, bases in self._bases.items():
+            for base in bases:
+                base_name = base.split(".")[-1]
+                for target in self._by_name.get(("class", base_name), ()):
+                    src.append(node)
+                    dst.append(target)
+        self._relations["inherits"] = _Relation(src, dst, n, n)
+
+    # -- nodes -------------------------------------------------------------
+
+    def __len__(self) -> int:
+        """Return the number of nodes."""
+        return len(self._kind)
+
+    def kind(self, node: int) -> str:
+        """Return ``file``, ``class``, ``function`` or ``method``."""
+        return NODE_KINDS[self._kind[node]]
+
+    def name(self, node: int) -> str:
+        """Return the stored path (files), name, or ``Class.method`` (methods)."""
+        return self._name[node]
+
+    def entity_id(self, node: int) -> str:
+        """Return the database id of the node's row."""
+        return self._entity_id[node]
+
+    def line(self, node: int) -> Optional[int]:
+        """Return the definition line (None for files)."""
+        line = self._line[node]
+        return None if line == _NO_LINE else line
+
+    def cst_node_id(self, node: int) -> Optional[str]:
+        """Return the stored ``cst_node_id`` (unvalidated)."""
+        return self._cst[node]
+
+    def bases(self, node: int) -> List[str]:
+        """Return parsed ``bases`` of a class node."""
+        return self._bases.get(node, [])
+
+    def file_of(self, node: int) -> int:
+        """Return the file node that defines ``node`` (itself for files)."""
+        return self._file[node]
+
+    def file_row(self, node: int) -> Dict[str, Optional[str]]:
+        """Return ``{"path", "relative_path"}`` of the node's file."""
+        fnode = self._file[node]
+        return {"path": self._name[fnode], "relative_path": self._relative[fnode]}
+
+    def file_nodes(self) -> array:
+        """Return file nodes in path order."""
+        return self._file_nodes
+
+    def file_node(self, path: str) -> Optional[int]:
+        """Return the file node stored under ``files.path``."""
+        return self._by_path.get(path)
+
+    def entity_node(self, kind: str, entity_id: object) -> Optional[int]:
+        """Return the node for a ``files``/entity row id."""
+        return self._by_key.get((kind, str(entity_id)))
+
+    def nodes_named(self, kind: str, name: str) -> List[int]:
+        """Return nodes of ``kind`` named ``name``, in file path order.
+
+        Methods match both ``Class.method`` and the bare method name.
+        """
+        return self._by_name.get((kind, name), [])
+
+    def entities(self, kind: str, file_node: Optional[int] = None) -> Iterator[int]:
+        """Yield entity nodes of ``kind`` (optionally only those of one file)."""
+        code = _KIND_CODE[kind]
+        if file_node is None:
+            spans: Iterable[Tuple[int, int]] = (
+                (f + 1, self._file_end[f]) for f in self._file_nodes
+            )
+        else:
+            spans = ((file_node + 1, self._file_end[file_node]),)
+        for start, end in spans:
+            for node in range(start, end):
+                if self._kind[node] == code:
+                    yield node
+
+    # -- edges -------------------------------------------------------------
+
+    def neighbors(self, node: int, relation: str, reverse: bool = False) -> List[int]:
+        """Return direct ``calls``/``inherits`` neighbours (callers/subclasses if reverse)."""
+        rel = self._node_relation(relation)
+        if reverse:
+            return [rel.src[e] for e in rel.into(node)]
+        return [rel.dst[e] for e in rel.out(node)]
+
+    def refs(self, node: int, reverse: bool = False) -> List[RefEdge]:
+        """Return ``calls`` edges leaving ``node`` (or entering it if reverse)."""
+        rel = self._relations["calls"]
+        return [self._ref(e) for e in (rel.into(node) if reverse else rel.out(node))]
+
+    def walk_refs(
+        self, node: int, reverse: bool = False, max_depth: Optional[int] = 1
+    ) -> List[Tuple[int, RefEdge]]:
+        """Breadth-first ``calls`` edges reachable from ``node`` as ``(depth, edge)``.
+
+        Each edge is reported once; ``max_depth=None`` walks the full closure.
+        """
+        rel = self._relations["calls"]
+        out: List[Tuple[int, RefEdge]] = []
+        seen = {node}
+        frontier = deque([(node, 0)])
+        while frontier:
+            current, depth = frontier.popleft()
+            if max_depth is not None and depth >= max_depth:
+                continue
+            for e in rel.into(current) if reverse else rel.out(current):
+                edge = self._ref(e)
+                out.append((depth + 1, edge))
+                nxt = edge.source if reverse else edge.target
+                if nxt not in seen:
+                    seen.add(nxt)
+                    frontier.append((nxt, depth + 1))
+        return out
+
+    def closure(
+        self,
+        nodes: Iterable[int],
+        relation: str,
+        reverse: bool = False,
+        max_depth: Optional[int] = None,
+    ) -> Dict[int, int]:
+        """Return ``{node: depth}`` reachable from ``nodes`` (start nodes excluded)."""
+        rel = self._node_relation(relation)
+        start = list(nodes)
+        depths: Dict[int, int] = {}
+        seen = set(start)
+        frontier = deque((n, 0) for n in start)
+        while frontier:
+            current, depth = frontier.popleft()
+            if max_depth is not None and depth >= max_depth:
+                continue
+            edges = rel.into(current) if reverse else rel.out(current)
+            for e in edges:
+                nxt = rel.src[e] if reverse else rel.dst[e]
+                if nxt not in seen:
+                    seen.add(nxt)
+                    depths[nxt] = depth + 1
+                    frontier.append((nxt, depth + 1))
+        return depths
+
+    def symbol_edges(
+        self, relation: str, file_node: Optional[int] = None
+    ) -> Iterator[Tuple[int, str, Optional[int]]]:
+        """Yield ``(file node, symbol, line)`` for ``imports``/``uses`` edges."""
+        rel = self._symbol_relation(relation)
+        lines = self._symbol_lines[relation]
+        files: Iterable[int] = self._file_nodes if file_node is None else (file_node,)
+        for fnode in files:
+            for e in rel.out(fnode):
+                line = lines[e]
+                yield fnode, self._symbols[rel.dst[e]], (
+                    None if line == _NO_LINE else line
+                )
+
+    def symbol_sources(self, relation: str, symbol: str) -> List[int]:
+        """Return file nodes with an ``imports``/``uses`` edge to ``symbol``."""
+        rel = self._symbol_relation(relation)
+        sid = self._symbol_ids.get(symbol)
+        if sid is None:
+            return []
+        return sorted({rel.src[e] for e in rel.into(sid)})
+
+    def edge_count(self, relation: str) -> int:
+        """Return the number of edges in ``relation``."""
+        return len(self._relations[relation].src)
+
+    def _ref(self, e: int) -> RefEdge:
+        rel = self._relations["calls"]
+        line = self._ref_line[e]
+        return RefEdge(
+            rel.src[e],
+            rel.dst[e],
+            self._ref_types[self._ref_type[e]],
+            self._ref_site[e],
+            None if line == _NO_LINE else line,
+        )
+
+    def _node_relation(self, relation: str) -> _Relation:
+        if relation not in NODE_RELATIONS:
+            raise ValueError(
+                f"relation must be one of {NODE_RELATIONS}, got {relation!r}"
+            )
+        return self._relations[relation]
+
+    def _symbol_relation(self, relation: str) -> _Relation:
+        if relation not in SYMBOL_RELATIONS:
+            raise ValueError(
+                f"relation must be one of {SYMBOL_RELATIONS}, got {relation!r}"
+            )
+        return self._relations[relation]
+
+
+def _by_target_line(row: Tuple[str, Optional[int]]) -> int:
+    """Sort key for import/usage rows: line."""
+    return row[1] if row[1] is not None else _NO_LINE
+
+
+def _by_line(row: Tuple) -> Tuple[int, str]:
+    """Sort key for entity rows: line, then id."""
+    line = row[2]
+    return (line if line is not None else _NO_LINE, row[0])
@@ -2,7 +2,8 @@
 Single cycle execution for vectorization worker.
 
 Runs one full cycle: mark old cycles ended, insert new cycle record,
-query projects, process projects (or update stats if none), rebuild FAISS,
+query projects, process projects (or update stats if none), rebuild FAISS
+(pgvector: create partial HNSW indexes for projects that crossed the threshold),
 update cycle_end_time. Returns deltas and timings.
 
 Author: Vasiliy Zdanovskiy
@@ -19,6 +20,7 @@ from typing import Any, List, Tuple
 from code_analysis.core.database_driver_pkg.domain.projects import list_projects
 from code_analysis.core.docs_markdown_vector_gate import \
     sql_and_exclude_docs_markdown_chunks
+from code_analysis.core.pgvector_search import ensure_project_hnsw_index
 from code_analysis.core.sql_portable import (WHERE_FILES_ACTIVE,
                                              WHERE_FILES_ACTIVE_F,
                                              WHERE_HAS_DOCSTRING_F,
@@ -328,6 +330,12 @@ async def run_one_cycle(
                 "[CYCLE #%s] Skipping per-project FAISS rebuild (pgvector ANN backend)",
                 cycle_count,
             )
+            if cycle_committed_work:
+                # Projects that just crossed PROJECT_HNSW_MIN_CHUNKS get their
+                # partial HNSW index now instead of at the next schema sweep.
+                for project in projects:
+                    if project.get("project_id"):
+                        ensure_project_hnsw_index(database, project["project_id"])
             write_worker_status(
                 getattr(worker, "status_file_path", None),
                 STATUS_OPERATION_IDLE,
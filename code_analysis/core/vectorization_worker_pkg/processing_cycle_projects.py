@@ -18,6 +18,7 @@ from code_analysis.core.sql_portable import (WHERE_FILES_ACTIVE_F,
                                              WHERE_HAS_DOCSTRING_F,
                                              sql_julian_timestamp_now_expr)
 
+from ..shared_library_index import library_copy_sql
 from ..worker_db_rpc_priority import BACKGROUND_WORKER_DB_RPC_PRIORITY
 from ..worker_status_file import (STATUS_OPERATION_CHUNKING,
                                   STATUS_OPERATION_VECTORIZING,
@@ -29,6 +30,18 @@ from .timing_log import log_operation_timing
 logger = logging.getLogger(__name__)
 
 
+def _shared_library_copy_filter(worker: Any) -> str:
+    """Chunking-candidate filter that skips copies of shared library files.
+
+    With pgvector all projects' chunks live in one table and semantic search
+    reads the canonical copy's chunks (see ``shared_library_index``); FAISS
+    indexes are per project, so there every copy is chunked.
+    """
+    if getattr(worker, "vector_ann_backend", "faiss") != "pgvector":
+        return ""
+    return f"AND NOT {library_copy_sql('f.id')}"
+
+
 async def process_projects_in_cycle(
     worker: Any,
     database: Any,
@@ -188,6 +201,7 @@ async def process_projects_in_cycle(
                               SELECT 1 FROM code_chunks cc
                               WHERE cc.file_id = f.id
                           ))
+                          {_shared_library_copy_filter(worker)}
                         ORDER BY f.updated_at DESC, f.id DESC
                         LIMIT ?
                         """,
@@ -2,7 +2,8 @@
 Optional full operation timing log for bottleneck analysis.
 
 When log_all_operations_timing is True, every significant operation is logged
-at INFO with duration and key=value context.
+at INFO with duration and key=value context. Durations are always recorded in
+the ``code_analysis_operation_seconds`` histogram, whether or not logging is on.
 
 Author: Vasiliy Zdanovskiy
 email: vasilyvz@gmail.com
@@ -13,6 +14,8 @@ from __future__ import annotations
 import logging
 from typing import Any
 
+from ..metrics import observe
+
 
 def log_operation_timing(
     enabled: bool,
@@ -25,12 +28,13 @@ def log_operation_timing(
     Log a single operation with timing when full timing is enabled.
 
     Args:
-        enabled: When True, log at INFO; when False, no-op.
+        enabled: When True, log at INFO; when False, only the metric is recorded.
         log: Logger instance.
         op_name: Operation identifier (e.g. "Step0_SELECT", "get_chunks_batch").
         duration_sec: Elapsed time in seconds.
         **kwargs: Optional key=value context (e.g. rows=10, file_id=123).
     """
+    observe("code_analysis_operation_seconds", duration_sec, operation=op_name)
     if not enabled:
         return
     parts = [f"[TIMING] {op_name} duration={duration_sec:.3f}s"]
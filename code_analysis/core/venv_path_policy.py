@@ -16,8 +16,8 @@ import logging
 import os
 import re
 from pathlib import Path
-from typing import (AbstractSet, Collection, FrozenSet, List, Optional,
-                    Sequence, Set, Tuple)
+from typing import (AbstractSet, Any, Collection, Dict, FrozenSet, List,
+                    Optional, Sequence, Set, Tuple)
 
 from .constants import default_ignore_file_suffixes
 from .fs_permissions import log_walk_error
@@ -211,21 +211,30 @@ def _load_global_watch_dir_ignore_patterns_from_config_path(
     config_path: Path,
 ) -> List[str]:
     """Read the global ``file_watcher.ignore_patterns`` from provided config path."""
+    from .config_state import snapshot_for_config_data
     from .storage_paths import load_raw_config
 
     raw = load_raw_config(config_path)
+    snapshot = snapshot_for_config_data(raw)
+    if snapshot is None:
+        return list(_global_watch_dir_ignore_patterns(raw))
+    return list(
+        snapshot.derive("watch_ignore_patterns", _global_watch_dir_ignore_patterns)
+    )
+
+
+def _global_watch_dir_ignore_patterns(raw: Dict[str, Any]) -> Tuple[str, ...]:
+    """Return the cleaned ``file_watcher.ignore_patterns`` of a raw config."""
     fw = raw.get("file_watcher") or {}
     val = fw.get("ignore_patterns")
     if val is None:
-        return []
+        return ()
     if not isinstance(val, list):
         logger.warning("file_watcher.ignore_patterns must be a list; ignoring")
-        return []
-    out: List[str] = []
-    for item in val:
-        if isinstance(item, str) and item.strip():
-            out.append(item.strip())
-    return out
+        return ()
+    return tuple(
+        item.strip() for item in val if isinstance(item, str) and item.strip()
+    )
 
 
 def load_indexing_ignore_glob_patterns_from_config_path(
@@ -338,8 +347,8 @@ def iter_site_packages_dirs(project_root: Path) -> List[Path]:
     return found
 
 
-def _read_dist_info_name(dist_info_dir: Path) -> Optional[str]:
-    """Return read dist info name."""
+def _read_dist_info_field(dist_info_dir: Path, field: str) -> Optional[str]:
+    """Return the first ``field:`` header value from a dist-info METADATA file."""
     meta = dist_info_dir / "METADATA"
     if not meta.is_file():
         return None
@@ -347,12 +356,20 @@ def _read_dist_info_name(dist_info_dir: Path) -> Optional[str]:
         text = meta.read_text(encoding="utf-8", errors="replace")
     except OSError:
         return None
+    prefix = field + ":"
     for line in text.splitlines():
-        if line.startswith("Name:"):
+        if not line.strip():
+            break  # end of the header block; the body is the long description
+        if line.startswith(prefix):
             return line.split(":", 1)[1].strip()
     return None
 
 
+def _read_dist_info_name(dist_info_dir: Path) -> Optional[str]:
+    """Return read dist info name."""
+    return _read_dist_info_field(dist_info_dir, "Name")
+
+
 def _record_py_files(site_packages: Path, dist_info_dir: Path) -> Set[Path]:
     """Resolve .py paths listed in RECORD relative to site-packages."""
     record = dist_info_dir / "RECORD"
@@ -393,6 +410,9 @@ def build_allowlisted_site_packages_py_files(
 
     If RECORD is missing or empty for a match, nothing is added for that distribution
     (no fallback guess by import name).
+
+    Metadata and RECORD lists come from :mod:`code_analysis.core.site_packages_cache`
+    and are only re-read when a dist-info directory or its files change.
     """
     allow = {
         normalize_pep503_distribution_name(x)
@@ -402,24 +422,11 @@ def build_allowlisted_site_packages_py_files(
     if not allow:
         return frozenset()
 
+    from .site_packages_cache import cached_allowlisted_py_files
+
     out: Set[Path] = set()
     for site_packages in iter_site_packages_dirs(project_root):
-        try:
-            entries = list(site_packages.iterdir())
-        except OSError:
-            continue
-        for entry in entries:
-            if not entry.is_dir():
-                continue
-            name = entry.name
-            if not name.endswith(".dist-info"):
-                continue
-            dname = _read_dist_info_name(entry)
-            if dname is None:
-                continue
-            if normalize_pep503_distribution_name(dname) not in allow:
-                continue
-            out |= _record_py_files(site_packages, entry)
+        out |= cached_allowlisted_py_files(site_packages, allow)
 
     return frozenset(out)
 
@@ -7,6 +7,8 @@ separate library if needed.
 Public API:
   - parse_selector(selector: str) -> Query
   - query_source(source: str, selector: str, *, include_code: bool = False) -> list[Match]
+  - query_files(paths, selector, ...) -> Generator[FileQueryResult]
+  - get_query_index(source) -> QueryIndex (cached by source digest)
   - QueryParseError
 
 Author: Vasiliy Zdanovskiy
@@ -23,6 +25,8 @@ from .ast import (
 )
 from .parser import parse_selector
 from .executor import Match, query_source
+from .project_query import FileQueryResult, query_files
+from .query_index import QueryIndex, clear_query_index_cache, get_query_index
 
 __all__ = [
     "QueryParseError",
@@ -34,4 +38,9 @@ __all__ = [
     "parse_selector",
     "Match",
     "query_source",
+    "FileQueryResult",
+    "query_files",
+    "QueryIndex",
+    "clear_query_index_cache",
+    "get_query_index",
 ]
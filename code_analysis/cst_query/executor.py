@@ -1,8 +1,10 @@
 """
 CSTQuery executor for Python source (LibCST).
 
-The executor traverses a LibCST tree, builds a lightweight parent-linked index,
-and evaluates a parsed selector against nodes.
+The executor evaluates a parsed selector against the cached
+:class:`~.query_index.QueryIndex` of the source: each step starts from a
+type/kind/name bucket, and combinators compare pre-order subtree ranges
+instead of walking parent chains.
 
 This executor prefers persisted UUID4 node identifiers when they are available
 from a loaded CST tree or from the file's trailing marker block. It falls back
@@ -16,18 +18,25 @@ email: vasilyvz@gmail.com
 from __future__ import annotations
 
 
-from typing import Optional
+from typing import Optional, TypeVar
 
 
-import libcst as cst
-
+from ..core.cst_tree.node_id_markers import build_exact_node_key
 
 from .ast import Combinator, Predicate, PredicateOp, PseudoKind, Query, SelectorStep
 
-from .index_builder import Match, NodeInfo, build_index, parse_source_for_query
+from .index_builder import Match, NodeInfo
 
 from .parser import parse_selector
 
+from .query_index import QueryIndex, get_query_index
+
+_T = TypeVar("_T")
+
+_KIND_ALIASES = frozenset(
+    {"module", "class", "function", "method", "stmt", "smallstmt", "import", "node"}
+)
+
 
 def query_source(
     source: str,
@@ -39,35 +48,26 @@ def query_source(
     """
     Query python source using CSTQuery selectors.
 
+    The parsed tree and its node index are cached by source digest (see
+    :func:`get_query_index`), so repeated queries over unchanged source skip
+    parsing entirely.
+
     Args:
         source: python module source
         selector: selector string
         include_code: include `code_for_node` snippet for each match (can be large)
+        node_ids_by_exact_key: node ids of a loaded tree, by exact span + type key
     """
     q = parse_selector(selector)
-    (
-        _logical_source,
-        module,
-        parents,
-        positions,
-        persisted_node_ids,
-    ) = parse_source_for_query(source)
-
-    nodes = build_index(
-        module,
-        parents=parents,
-        positions=positions,
-        persisted_node_ids=persisted_node_ids,
-        node_ids_by_exact_key=node_ids_by_exact_key,
-    )
-    matched = _eval_query(nodes, q)
+    index = get_query_index(source)
+    matched = _eval_query(index, q)
 
     out: list[Match] = []
     for info in matched:
-        code = module.code_for_node(info.node) if include_code else None
+        code = index.module.code_for_node(info.node) if include_code else None
         out.append(
             Match(
-                node_id=info.node_id or _legacy_node_id(info),
+                node_id=_node_id(info, node_ids_by_exact_key),
                 kind=info.kind,
                 node_type=info.node_type,
                 name=info.name,
@@ -82,6 +82,28 @@ def query_source(
     return out
 
 
+def _node_id(
+    info: NodeInfo,
+    node_ids_by_exact_key: dict[tuple[int, int, int, int, str], str] | None,
+) -> str:
+    """Persisted id, else the loaded tree's id for the same span, else legacy."""
+    if info.node_id:
+        return info.node_id
+    if node_ids_by_exact_key:
+        node_id = node_ids_by_exact_key.get(
+            build_exact_node_key(
+                info.start_line,
+                info.start_col,
+                info.end_line,
+                info.end_col,
+                info.node_type,
+            )
+        )
+        if node_id:
+            return node_id
+    return _legacy_node_id(info)
+
+
 def _legacy_node_id(info: NodeInfo) -> str:
     """Fallback ID used only for raw source without persisted UUIDs."""
     q = info.qualname or ""
@@ -91,53 +113,45 @@ def _legacy_node_id(info: NodeInfo) -> str:
     )
 
 
-def _eval_query(nodes: list[NodeInfo], q: Query) -> list[NodeInfo]:
-    """Return eval query."""
-    parent_map: dict[cst.CSTNode, Optional[cst.CSTNode]] = {
-        n.node: n.parent for n in nodes
-    }
-    current = _apply_step(nodes, q.first)
+def _eval_query(index: QueryIndex, q: Query) -> list[NodeInfo]:
+    """Return nodes matching ``q`` in traversal order."""
+    current = _apply_step(index, q.first)
     for comb, step in q.rest:
-        nxt_candidates = _apply_step(nodes, step)
-        current = _apply_combinator(
-            current, nxt_candidates, comb, parent_map=parent_map
-        )
-    return current
+        if not current:
+            return []
+        current = _apply_combinator(index, current, _apply_step(index, step), comb)
+    return [index.nodes[i] for i in current]
 
 
 def _apply_combinator(
-    prev: list[NodeInfo],
-    nxt: list[NodeInfo],
+    index: QueryIndex,
+    prev: list[int],
+    nxt: list[int],
     comb: Combinator,
-    *,
-    parent_map: dict[cst.CSTNode, Optional[cst.CSTNode]],
-) -> list[NodeInfo]:
-    """Return apply combinator."""
+) -> list[int]:
+    """Return positions of ``nxt`` related to some position of ``prev`` by ``comb``."""
     if not prev or not nxt:
         return []
-    prev_nodes = {p.node for p in prev}
 
     if comb == Combinator.CHILD:
-        return [n for n in nxt if n.parent in prev_nodes]
+        prev_set = set(prev)
+        return [n for n in nxt if index.parent[n] in prev_set]
 
     # Descendant (space) and recursive descendant (//): any ancestor match.
     if comb not in (Combinator.DESCENDANT, Combinator.RECURSIVE_DESCENDANT):
         return []
-    prev_set = prev_nodes
-    out: list[NodeInfo] = []
-    for n in nxt:
-        p = n.parent
-        while p is not None:
-            if p in prev_set:
-                out.append(n)
-                break
-            p = parent_map.get(p)
-    return out
+    return index.with_ancestor_in(prev, nxt)
+
+
+def _apply_step(index: QueryIndex, step: SelectorStep) -> list[int]:
+    """Return positions matching ``step`` (pseudos applied), ascending."""
+    nodes = index.nodes
+    matched = [i for i in _candidates(index, step) if _matches_step(nodes[i], step)]
+    return _apply_pseudos(matched, step)
 
 
-def _apply_step(nodes: list[NodeInfo], step: SelectorStep) -> list[NodeInfo]:
-    """Return apply step."""
-    matched = [n for n in nodes if _matches_step(n, step)]
+def _apply_pseudos(matched: list[_T], step: SelectorStep) -> list[_T]:
+    """Narrow ``matched`` by the :first / :last / :nth pseudos of ``step``."""
     for pseudo in step.pseudos:
         if pseudo.kind == PseudoKind.FIRST:
             matched = matched[:1]
@@ -149,6 +163,36 @@ def _apply_step(nodes: list[NodeInfo], step: SelectorStep) -> list[NodeInfo]:
     return matched
 
 
+def _candidates(index: QueryIndex, step: SelectorStep) -> list[int]:
+    """Return an ascending superset of the positions ``step`` can match.
+
+    An exact ``[name="..."]`` predicate or a concrete node type/alias selects
+    one bucket; everything else falls back to all nodes.
+    """
+    for pred in step.predicates:
+        if pred.attr.lower() == "name" and pred.op == PredicateOp.EQ:
+            return index.by_name.get(pred.value, [])
+    t = (step.node_type or "").strip()
+    if not t or t == "*":
+        return list(range(len(index.nodes)))
+    if t.endswith(":*"):
+        part = t[:-2].strip().lower()
+        if not part:
+            return list(range(len(index.nodes)))
+        if part in _KIND_ALIASES:
+            return index.by_kind.get(part, [])
+        buckets = [
+            positions
+            for node_type, positions in index.by_type.items()
+            if node_type.startswith(part) or node_type.endswith(part)
+        ]
+        return sorted(set().union(*buckets)) if buckets else []
+    alias = t.lower()
+    if alias in _KIND_ALIASES:
+        return index.by_kind.get(alias, [])
+    return index.by_type.get(alias, [])
+
+
 def _matches_step(node: NodeInfo, step: SelectorStep) -> bool:
     """Return matches step."""
     if not _matches_node_type(node, step.node_type):
@@ -158,12 +202,22 @@ def _matches_step(node: NodeInfo, step: SelectorStep) -> bool:
             return False
     # :not(selector) pseudo-class
     if step.not_selector is not None:
-        not_matches = _eval_query([node], step.not_selector)
-        if not_matches:
+        if _matches_alone(node, step.not_selector):
             return False
     return True
 
 
+def _matches_alone(node: NodeInfo, q: Query) -> bool:
+    """Return True when ``q`` evaluated over ``node`` by itself selects it.
+
+    With a single node no combinator can relate two nodes, so only a
+    one-step query can match.
+    """
+    if q.rest or not _matches_step(node, q.first):
+        return False
+    return bool(_apply_pseudos([node], q.first))
+
+
 def _matches_node_type(node: NodeInfo, node_type: str) -> bool:
     """Return matches node type."""
     if not node_type or node_type == "*":
@@ -174,30 +228,12 @@ def _matches_node_type(node: NodeInfo, node_type: str) -> bool:
         part = t[:-2].strip().lower()
         if not part:
             return True
-        if part in {
-            "module",
-            "class",
-            "function",
-            "method",
-            "stmt",
-            "smallstmt",
-            "import",
-            "node",
-        }:
+        if part in _KIND_ALIASES:
             return node.kind == part
         nt = node.node_type.lower()
         return nt.startswith(part) or nt.endswith(part)
     alias = t.lower()
-    if alias in {
-        "module",
-        "class",
-        "function",
-        "method",
-        "stmt",
-        "smallstmt",
-        "import",
-        "node",
-    }:
+    if alias in _KIND_ALIASES:
         return node.kind == alias
     return node.node_type.lower() == t.lower()
 
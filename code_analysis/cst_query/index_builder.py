@@ -86,8 +86,8 @@ def parse_source_for_query(
 def build_index(
     module: cst.Module,
     *,
-    parents: dict[cst.CSTNode, cst.CSTNode],
-    positions: dict[cst.CSTNode, Any],
+    parents: Mapping[cst.CSTNode, cst.CSTNode],
+    positions: Mapping[cst.CSTNode, Any],
     persisted_node_ids: PersistedNodeIds,
     node_ids_by_exact_key: dict[tuple[int, int, int, int, str], str] | None = None,
 ) -> list[NodeInfo]:
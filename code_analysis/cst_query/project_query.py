@@ -0,0 +1,90 @@
+"""
+Run one CSTQuery selector over many files, streaming per-file results.
+
+Files are read and queried in the calling process, so the :mod:`.query_index`
+cache (keyed by source digest) is shared with single-file queries and reused
+across requests. Results are yielded in input order as each file is done, so
+a caller that only needs the first N matches can stop early (``close()``)
+without reading the remaining files.
+
+Author: Vasiliy Zdanovskiy
+email: vasilyvz@gmail.com
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Callable, Generator, Iterable, Optional
+
+from .executor import query_source
+from .index_builder import Match
+from .parser import parse_selector
+
+NodeIdsLoader = Callable[
+    [str, str], Optional[dict[tuple[int, int, int, int, str], str]]
+]
+
+
+@dataclass(frozen=True)
+class FileQueryResult:
+    """Matches of one file, or the error that prevented querying it."""
+
+    path: str
+    matches: tuple[Match, ...] = ()
+    error: Optional[str] = None
+
+
+def query_files(
+    paths: Iterable[str],
+    selector: str,
+    *,
+    include_code: bool = False,
+    node_ids_loader: Optional[NodeIdsLoader] = None,
+) -> Generator[FileQueryResult, None, None]:
+    """
+    Yield a :class:`FileQueryResult` per path, in order.
+
+    Args:
+        paths: Python files to query (absolute paths).
+        selector: CSTQuery selector; parsed once up front, so a malformed
+            selector raises :class:`QueryParseError` before any file is read.
+        include_code: Include ``code_for_node`` snippets in matches.
+        node_ids_loader: Optional ``(path, source) -> node_ids_by_exact_key``
+            used to report a loaded tree's node ids. Called only for files
+            with at least one match.
+    """
+    parse_selector(selector)
+    for path in paths:
+        yield _query_path(
+            path,
+            selector=selector,
+            include_code=include_code,
+            node_ids_loader=node_ids_loader,
+        )
+
+
+def _query_path(
+    path: str,
+    *,
+    selector: str,
+    include_code: bool,
+    node_ids_loader: Optional[NodeIdsLoader],
+) -> FileQueryResult:
+    """Read and query one file; failures become ``FileQueryResult.error``."""
+    try:
+        with open(path, encoding="utf-8") as fh:
+            source = fh.read()
+        matches = query_source(source, selector, include_code=include_code)
+        if matches and node_ids_loader is not None:
+            node_ids = node_ids_loader(path, source)
+            if node_ids:
+                # Same source: the index is a cache hit, only matches are rebuilt.
+                matches = query_source(
+                    source,
+                    selector,
+                    include_code=include_code,
+                    node_ids_by_exact_key=node_ids,
+                )
+    except Exception as e:
+        return FileQueryResult(path=path, error=f"{type(e).__name__}: {e}")
+    return FileQueryResult(path=path, matches=tuple(matches))
@@ -0,0 +1,138 @@
+"""
+Reusable per-source query index for CSTQuery execution.
+
+Parsing a module, resolving ``ParentNodeProvider``/``PositionProvider`` and
+building the :class:`~.index_builder.NodeInfo` list dominate the cost of a
+query. :class:`QueryIndex` keeps that work together with lookup tables derived
+from it, and :func:`get_query_index` caches indexes by the SHA-256 of the
+source, so repeated selectors over the same file (or the same loaded tree)
+reuse one parse.
+
+- ``by_type`` / ``by_kind`` / ``by_name`` buckets hold node positions in
+  traversal (pre-)order, so a selector step visits only plausible candidates.
+- Each node's subtree is the contiguous range ``[pos, last[pos]]`` of that
+  order, which turns "is A an ancestor of B" into integer comparisons.
+
+The index is read-only once built and is shared between callers.
+
+Author: Vasiliy Zdanovskiy
+email: vasilyvz@gmail.com
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import OrderedDict
+
+import libcst as cst
+
+from .index_builder import NodeInfo, build_index, parse_source_for_query
+
+MAX_CACHED_INDEXES = 64
+
+
+class QueryIndex:
+    """Indexed nodes of one parsed source, with type/name buckets."""
+
+    def __init__(self, module: cst.Module, nodes: list[NodeInfo]) -> None:
+        """Derive buckets, parent positions and subtree ranges from ``nodes``.
+
+        Args:
+            module: Parsed module (used for ``code_for_node``).
+            nodes: Traversal-ordered output of :func:`build_index`.
+        """
+        self.module = module
+        self.nodes = nodes
+        pos_of = {id(info.node): i for i, info in enumerate(nodes)}
+        self.parent: list[int] = [
+            pos_of.get(id(info.parent), -1) if info.parent is not None else -1
+            for info in nodes
+        ]
+        self.last: list[int] = list(range(len(nodes)))
+        for i in range(len(nodes) - 1, 0, -1):
+            p = self.parent[i]
+            if p >= 0 and self.last[i] > self.last[p]:
+                self.last[p] = self.last[i]
+        self.by_type: dict[str, list[int]] = {}
+        self.by_kind: dict[str, list[int]] = {}
+        self.by_name: dict[str, list[int]] = {}
+        for i, info in enumerate(nodes):
+            self.by_type.setdefault(info.node_type.lower(), []).append(i)
+            self.by_kind.setdefault(info.kind, []).append(i)
+            if info.name is not None:
+                self.by_name.setdefault(info.name, []).append(i)
+
+    @classmethod
+    def from_source(cls, source: str) -> "QueryIndex":
+        """Parse ``source`` (persisted node-id markers honoured) and index it."""
+        (
+            _logical_source,
+            module,
+            parents,
+            positions,
+            persisted_node_ids,
+        ) = parse_source_for_query(source)
+        nodes = build_index(
+            module,
+            parents=parents,
+            positions=positions,
+            persisted_node_ids=persisted_node_ids,
+        )
+        return cls(module, nodes)
+
+    def with_ancestor_in(self, prev: list[int], nxt: list[int]) -> list[int]:
+        """Return positions of ``nxt`` that descend from any position in ``prev``.
+
+        Both lists must be ascending. Subtrees are nested or disjoint, so a
+        node is covered exactly when it lies before the furthest subtree end
+        among the ``prev`` positions preceding it.
+        """
+        out: list[int] = []
+        reach = -1
+        j = 0
+        for n in nxt:
+            while j < len(prev) and prev[j] < n:
+                if self.last[prev[j]] > reach:
+                    reach = self.last[prev[j]]
+                j += 1
+            if n <= reach:
+                out.append(n)
+        return out
+
+
+_cache: "OrderedDict[str, QueryIndex]" = OrderedDict()
+_lock = threading.Lock()
+
+
+def source_sha256(source: str) -> str:
+    """Return the SHA-256 hex digest of UTF-8 ``source`` (the cache key)."""
+    return hashlib.sha256(source.encode("utf-8")).hexdigest()
+
+
+def get_query_index(source: str) -> QueryIndex:
+    """Return the cached :class:`QueryIndex` for ``source``, building it on a miss.
+
+    Args:
+        source: Python module source, optionally with a node-id marker block.
+    """
+    key = source_sha256(source)
+    with _lock:
+        index = _cache.get(key)
+        if index is not None:
+            _cache.move_to_end(key)
+            return index
+    # Parse outside the lock; a concurrent miss for the same key just builds twice.
+    index = QueryIndex.from_source(source)
+    with _lock:
+        _cache[key] = index
+        _cache.move_to_end(key)
+        while len(_cache) > MAX_CACHED_INDEXES:
+            _cache.popitem(last=False)
+    return index
+
+
+def clear_query_index_cache() -> None:
+    """Drop every cached query index."""
+    with _lock:
+        _cache.clear()
@@ -14,6 +14,11 @@ from mcp_proxy_adapter.commands.command_registry import registry
 from mcp_proxy_adapter.commands.hooks import register_auto_import_module
 
 from .core.config_command_gate import install_config_command_gate
+from .core.lazy_command_registry import (
+    lazy_commands_enabled,
+    register_lazy_commands,
+    save_command_manifest,
+)
 from .hooks_register_part1 import register_commands_part1
 from .hooks_register_part2 import register_commands_part2
 from .hooks_register_git_github import register_commands_git_github
@@ -28,6 +33,8 @@ def register_code_analysis_commands(reg: registry) -> None:
     Returns:
         None
     """
+    if lazy_commands_enabled() and register_lazy_commands(reg):
+        return
     register_commands_part1(reg)
     register_commands_part2(reg)
     register_commands_git_github(reg)
@@ -36,6 +43,8 @@ def register_code_analysis_commands(reg: registry) -> None:
     )
 
     apply_metadata_finalization_to_registry(reg)
+    if lazy_commands_enabled():
+        save_command_manifest(reg)
 
 
 # Register hook
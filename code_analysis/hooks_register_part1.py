@@ -7,28 +7,37 @@ email: vasilyvz@gmail.com
 
 import logging
 
-from mcp_proxy_adapter.commands.command_registry import registry
+from mcp_proxy_adapter.commands.command_registry import CommandRegistry
 
 logger = logging.getLogger(__name__)
 
 
-def register_commands_part1(reg: registry) -> None:
+def register_commands_part1(reg: CommandRegistry) -> None:
     """Register CST, AST, analysis, search, and code_mapper commands."""
     try:
         from .commands.health_command import HealthCommand
         from .commands.info_command import InfoCommand
+        from .commands.metrics_command import MetricsCommand
         from .commands.queue_health_command import QueueHealthCommand
         from .commands.qa_sleep_command import QASleepCommand
         from .commands.qa_mcp_plan_hooks_command import QAMcpPlanHooksCommand
 
         reg.register(HealthCommand, "custom")
         reg.register(InfoCommand, "custom")
+        reg.register(MetricsCommand, "custom")
         reg.register(QueueHealthCommand, "custom")
         reg.register(QASleepCommand, "custom")
         reg.register(QAMcpPlanHooksCommand, "custom")
     except ImportError:
         pass
 
+    try:
+        from .commands.queue_wait_job_command import QueueWaitJobCommand
+
+        reg.register(QueueWaitJobCommand, "custom")
+    except ImportError:
+        pass
+
     try:
         from .commands.check_vectors_command import CheckVectorsCommand
 
@@ -7,12 +7,12 @@ email: vasilyvz@gmail.com
 
 import logging
 
-from mcp_proxy_adapter.commands.command_registry import registry
+from mcp_proxy_adapter.commands.command_registry import CommandRegistry
 
 logger = logging.getLogger(__name__)
 
 
-def register_commands_part2(reg: registry) -> None:
+def register_commands_part2(reg: CommandRegistry) -> None:
     """Register backup, file management, log viewer, workers, DB integrity, restore, projects."""
     from .commands.backup_mcp_commands import (
         ListBackupFilesMCPCommand,
@@ -36,6 +36,11 @@ from code_analysis.core.shared_database import (
 )
 from code_analysis.core.cst_tree.tree_builder import start_cst_tree_ttl_cleanup
 from code_analysis.core import command_offload
+from code_analysis.core.code_quality import mypy_daemon
+from code_analysis.core import project_registry_cache
+from code_analysis.core.metrics import configure_metrics
+from code_analysis.core.runtime_state_root import default_state_home
+from code_analysis.core.lazy_command_registry import start_lazy_command_prewarm
 from code_analysis.core.loop_liveness import loop_liveness_beat_loop
 from code_analysis.main_workers import (
     startup_database_driver,
@@ -162,6 +167,20 @@ def register_startup_shutdown_events(
         logger.info(
             "🚀 [STARTUP EVENT] Server startup: initializing workers via startup event..."
         )
+        # Metrics: configure before any worker process starts so workers inherit
+        # the snapshot dir and the ``metrics`` command sees their samples.
+        try:
+            metrics_cfg = (
+                app_config.get("metrics") if isinstance(app_config, dict) else None
+            )
+            metrics_cfg = metrics_cfg if isinstance(metrics_cfg, dict) else {}
+            configure_metrics(
+                enabled=metrics_cfg.get("enabled"),
+                state_dir=default_state_home() / "metrics",
+                publish_interval_sec=metrics_cfg.get("publish_interval_sec"),
+            )
+        except Exception as e:  # pragma: no cover - non-fatal
+            logger.warning("Metrics configuration failed: %s", e)
 
         try:
 
@@ -326,6 +345,52 @@ def register_startup_shutdown_events(
                 command_offload.warm_up()
             except Exception as e:  # pragma: no cover - non-fatal
                 logger.warning("Command offload warm-up failed: %s", e)
+            # Optional long-lived mypy daemons (started lazily per project/config).
+            try:
+                mypy_cfg = (
+                    app_config.get("mypy_daemon")
+                    if isinstance(app_config, dict)
+                    else None
+                )
+                if isinstance(mypy_cfg, dict):
+                    mypy_daemon.configure_mypy_daemon(
+                        enabled=mypy_cfg.get("enabled"),
+                        idle_timeout_sec=mypy_cfg.get("idle_timeout_sec"),
+                    )
+            except Exception as e:  # pragma: no cover - non-fatal
+                logger.warning("mypy daemon configuration failed: %s", e)
+            # Command-preamble project cache, invalidated via LISTEN/NOTIFY on a
+            # dedicated connection (on by default in the server).
+            try:
+                from code_analysis.core.config import get_driver_config
+                from code_analysis.core.database_driver_pkg.drivers.postgres import (
+                    _connect_kwargs_from_config,
+                )
+
+                reg_cfg = (
+                    app_config.get("project_registry_cache")
+                    if isinstance(app_config, dict)
+                    else None
+                )
+                reg_cfg = reg_cfg if isinstance(reg_cfg, dict) else {}
+                project_registry_cache.configure_project_registry_cache(
+                    enabled=reg_cfg.get("enabled", True),
+                    ttl_sec=reg_cfg.get("ttl_sec"),
+                    fallback_ttl_sec=reg_cfg.get("fallback_ttl_sec"),
+                )
+                driver_cfg = get_driver_config(app_config) or {}
+                if _db_open_done.is_set() and _db_open_error[0] is None:
+                    project_registry_cache.start_project_registry_listener(
+                        _connect_kwargs_from_config(driver_cfg.get("config") or {})
+                    )
+            except Exception as e:  # pragma: no cover - non-fatal
+                logger.warning("Project registry cache startup failed: %s", e)
+            # Lazy command registration: import the deferred command modules in
+            # the background now that the server answers requests.
+            try:
+                start_lazy_command_prewarm()
+            except Exception as e:  # pragma: no cover - non-fatal
+                logger.warning("Lazy command pre-warm failed to start: %s", e)
         except Exception as e:
             print(
                 f"❌ [STARTUP EVENT] Failed to start workers: {e}",
@@ -356,6 +421,16 @@ def register_startup_shutdown_events(
             except Exception as e:  # pragma: no cover - best-effort
                 logger.warning("Command offload pool shutdown failed: %s", e)
 
+            try:
+                mypy_daemon.shutdown_mypy_daemons()
+            except Exception as e:  # pragma: no cover - best-effort
+                logger.warning("mypy daemon shutdown failed: %s", e)
+
+            try:
+                project_registry_cache.stop_project_registry_listener()
+            except Exception as e:  # pragma: no cover - best-effort
+                logger.warning("Project registry listener shutdown failed: %s", e)
+
             close_shared_database()
             logger.info("✅ Shared database connection closed")
 
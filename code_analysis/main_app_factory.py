@@ -14,6 +14,7 @@ from typing import Any
 from mcp_proxy_adapter.api.core.app_factory import AppFactory
 
 from code_analysis.commands.base_mcp_command import BaseMCPCommand
+from code_analysis.core.metrics.http_routes import register_metrics_route
 from code_analysis.core.search_session.cleaner import register_search_session_cleanup
 from code_analysis.core.search_session.http_routes import register_search_job_routes
 from code_analysis.core.session_lock_reaper import register_client_session_reaper
@@ -55,6 +56,10 @@ def create_app_with_events(
         config_path=config_path,
     )
     register_search_job_routes(app, sessions_root=sessions_root)
+    # Prometheus text endpoint (the ``metrics`` command serves the same text).
+    metrics_cfg = app_config.get("metrics") if isinstance(app_config, dict) else None
+    if isinstance(metrics_cfg, dict) and metrics_cfg.get("http_endpoint"):
+        register_metrics_route(app)
     register_search_session_cleanup(
         app,
         sessions_root=sessions_root,
@@ -124,6 +124,14 @@ def register_cleanup_handlers(
                     "Command offload pool shutdown (cleanup path) failed",
                     exc_info=True,
                 )
+            try:
+                from code_analysis.core.code_quality import mypy_daemon
+
+                mypy_daemon.shutdown_mypy_daemons()
+            except Exception:
+                main_logger.debug(
+                    "mypy daemon shutdown (cleanup path) failed", exc_info=True
+                )
             shutdown_cfg = (
                 app_config.get("process_management")
                 or app_config.get("server_manager")
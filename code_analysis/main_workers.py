@@ -232,7 +232,15 @@ def startup_vectorization_worker() -> None:
                         config_key="database.driver",
                     )
                 if storage.backup_dir and "config" in driver_config:
-                    driver_config["config"]["backup_dir"] = str(storage.backup_dir)
+                    # get_driver_config() is memoized per config snapshot: copy,
+                    # never mutate the shared dict.
+                    driver_config = {
+                        **driver_config,
+                        "config": {
+                            **driver_config["config"],
+                            "backup_dir": str(storage.backup_dir),
+                        },
+                    }
 
                 schema_definition = get_schema_definition()
                 backup_dir = str(storage.backup_dir) if storage.backup_dir else None
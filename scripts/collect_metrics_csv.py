@@ -1,11 +1,12 @@
 """
 Collect quantitative metrics every 10 minutes for 1 hour and append to CSV.
 
-Uses direct SQLite queries so it works regardless of server/driver. Writes to
-data/metrics_YYYYMMDD.csv with columns: datetime_utc, datetime_iso, files_total,
-files_active, files_indexed, files_indexed_pct, files_needing_indexing,
-files_needing_chunking, chunks_total, chunks_vectorized, chunks_vectorized_pct,
-db_size_mb, indexing_worker_operation, vectorization_worker_operation.
+Queries the server's PostgreSQL database through the configured driver
+(``config.json``). Writes to data/metrics_YYYYMMDD.csv with columns:
+datetime_utc, datetime_iso, files_total, files_active, files_indexed,
+files_indexed_pct, files_needing_indexing, files_needing_chunking,
+chunks_total, chunks_vectorized, chunks_vectorized_pct, db_size_mb,
+indexing_worker_operation, vectorization_worker_operation.
 
 Author: Vasiliy Zdanovskiy
 email: vasilyvz@gmail.com
@@ -15,40 +16,43 @@ from __future__ import annotations
 
 import csv
 import json
-import sqlite3
 import sys
 import time
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import Any
 
 # Project root (parent of scripts/)
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 
+_ACTIVE = "(f.deleted IS NOT TRUE OR f.deleted IS NULL)"
+
+METRICS_SQL = f"""
+SELECT
+    (SELECT COUNT(*) FROM files) AS files_total,
+    (SELECT COUNT(*) FROM files f WHERE {_ACTIVE}) AS files_active,
+    (SELECT COUNT(*) FROM files f WHERE {_ACTIVE}
+        AND (f.needs_chunking = 0 OR f.needs_chunking IS NULL)) AS files_indexed,
+    (SELECT COUNT(*) FROM files f WHERE {_ACTIVE}
+        AND f.needs_chunking = 1) AS files_needing_indexing,
+    (SELECT COUNT(*) FROM files f WHERE {_ACTIVE}
+        AND NOT EXISTS (SELECT 1 FROM code_chunks c WHERE c.file_id = f.id))
+        AS files_needing_chunking,
+    (SELECT COUNT(*) FROM code_chunks) AS chunks_total,
+    (SELECT COUNT(*) FROM code_chunks WHERE vector_id IS NOT NULL)
+        AS chunks_vectorized,
+    pg_database_size(current_database()) AS db_size_bytes
+"""
 
-def get_db_path() -> Path:
-    """Resolve database path from config.json."""
-    config_path = PROJECT_ROOT / "config.json"
-    if not config_path.exists():
-        return PROJECT_ROOT / "data" / "code_analysis.db"
-    with open(config_path, "r", encoding="utf-8") as f:
-        config = json.load(f)
-    # Resolve via storage_paths if available
-    try:
-        sys.path.insert(0, str(PROJECT_ROOT))
-        from code_analysis.core.storage_paths import (
-            load_raw_config,
-            resolve_storage_paths,
-        )
-
-        config_data = load_raw_config(str(config_path))
-        storage = resolve_storage_paths(
-            config_data=config_data, config_path=str(config_path)
-        )
-        return storage.db_path
-    except Exception:
-        pass
-    data_dir = config.get("code_analysis", {}).get("data_dir") or "data"
-    return PROJECT_ROOT / data_dir / "code_analysis.db"
+
+def open_database() -> Any:
+    """Open the configured PostgreSQL database (``config.json``)."""
+    sys.path.insert(0, str(PROJECT_ROOT))
+    from code_analysis.core.database_client.factory import (
+        create_database_client_from_config_path,
+    )
+
+    return create_database_client_from_config_path(PROJECT_ROOT / "config.json")
 
 
 def read_worker_operation(status_path: Path) -> str:
@@ -63,50 +67,24 @@ def read_worker_operation(status_path: Path) -> str:
         return ""
 
 
-def collect_row(conn: sqlite3.Connection, db_path: Path, logs_dir: Path) -> list:
-    """Run queries and return one row (list of values) for CSV."""
+def collect_row(db: Any, logs_dir: Path) -> list:
+    """Run the metrics query and return one row (list of values) for CSV."""
     now = datetime.now(timezone.utc)
     datetime_iso = now.isoformat()
     datetime_utc = now.strftime("%Y-%m-%d %H:%M:%S")
 
-    cur = conn.execute("SELECT COUNT(*) FROM files")
-    files_total = cur.fetchone()[0]
-    cur = conn.execute("SELECT COUNT(*) FROM files WHERE deleted = 1")
-    deleted = cur.fetchone()[0]
-    files_active = files_total - deleted
-
-    cur = conn.execute(
-        "SELECT COUNT(*) FROM files WHERE (deleted = 0 OR deleted IS NULL) "
-        "AND (needs_chunking = 0 OR needs_chunking IS NULL)"
-    )
-    files_indexed = cur.fetchone()[0]
+    counts = db.execute(METRICS_SQL, None)["data"][0]
+    files_active = int(counts["files_active"])
+    files_indexed = int(counts["files_indexed"])
     files_indexed_pct = (
         round((files_indexed / files_active * 100), 2) if files_active else 0
     )
-
-    cur = conn.execute(
-        "SELECT COUNT(*) FROM files WHERE (deleted = 0 OR deleted IS NULL) AND needs_chunking = 1"
-    )
-    files_needing_indexing = cur.fetchone()[0]
-
-    cur = conn.execute(
-        "SELECT COUNT(DISTINCT f.id) FROM files f "
-        "WHERE (f.deleted = 0 OR f.deleted IS NULL) "
-        "AND NOT EXISTS (SELECT 1 FROM code_chunks WHERE code_chunks.file_id = f.id)"
-    )
-    files_needing_chunking = cur.fetchone()[0]
-
-    cur = conn.execute("SELECT COUNT(*) FROM code_chunks")
-    chunks_total = cur.fetchone()[0]
-    cur = conn.execute("SELECT COUNT(*) FROM code_chunks WHERE vector_id IS NOT NULL")
-    chunks_vectorized = cur.fetchone()[0]
+    chunks_total = int(counts["chunks_total"])
+    chunks_vectorized = int(counts["chunks_vectorized"])
     chunks_vectorized_pct = (
         round((chunks_vectorized / chunks_total * 100), 2) if chunks_total else 0
     )
-
-    db_size_mb = 0.0
-    if db_path.exists():
-        db_size_mb = round(db_path.stat().st_size / (1024 * 1024), 2)
+    db_size_mb = round(int(counts["db_size_bytes"] or 0) / (1024 * 1024), 2)
 
     idx_status = logs_dir / "indexing_worker.status.json"
     vec_status = logs_dir / "vectorization_worker.status.json"
@@ -116,12 +94,12 @@ def collect_row(conn: sqlite3.Connection, db_path: Path, logs_dir: Path) -> list
     return [
         datetime_utc,
         datetime_iso,
-        files_total,
+        int(counts["files_total"]),
         files_active,
         files_indexed,
         files_indexed_pct,
-        files_needing_indexing,
-        files_needing_chunking,
+        int(counts["files_needing_indexing"]),
+        int(counts["files_needing_chunking"]),
         chunks_total,
         chunks_vectorized,
         chunks_vectorized_pct,
@@ -164,9 +142,10 @@ def main() -> int:
     args = parser.parse_args()
     iterations = 1 if args.once else 6
 
-    db_path = get_db_path()
-    if not db_path.exists():
-        print(f"Database not found: {db_path}", file=sys.stderr)
+    try:
+        db = open_database()
+    except Exception as e:
+        print(f"Cannot open database: {e}", file=sys.stderr)
         return 1
 
     # Logs dir for worker status files
@@ -182,12 +161,7 @@ def main() -> int:
 
     for iteration in range(iterations):
         try:
-            conn = sqlite3.connect(str(db_path))
-            conn.row_factory = sqlite3.Row
-            try:
-                row = collect_row(conn, db_path, logs_dir)
-            finally:
-                conn.close()
+            row = collect_row(db, logs_dir)
 
             with open(csv_path, "a", newline="", encoding="utf-8") as f:
                 w = csv.writer(f)
@@ -203,6 +177,7 @@ def main() -> int:
         if iteration < iterations - 1:
             time.sleep(600)  # 10 minutes
 
+    db.disconnect()
     print(f"Done. CSV: {csv_path}")
     return 0
 
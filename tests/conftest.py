@@ -98,6 +98,16 @@ def _isolate_git_xdg_config(
     monkeypatch.setenv("XDG_CONFIG_HOME", str(xdg_root))
 
 
+@pytest.fixture(autouse=True)
+def _isolate_site_packages_cache(
+    monkeypatch: pytest.MonkeyPatch, tmp_path_factory: pytest.TempPathFactory
+) -> None:
+    """Keep the persisted site-packages cache out of the user state home."""
+
+    cache_dir = Path(tmp_path_factory.mktemp("site-packages-cache"))
+    monkeypatch.setenv("CODE_ANALYSIS_SITE_PACKAGES_CACHE_DIR", str(cache_dir))
+
+
 @pytest.fixture(autouse=True)
 def _isolate_search_sessions_root(
     monkeypatch: pytest.MonkeyPatch, tmp_path_factory: pytest.TempPathFactory
@@ -21,6 +21,27 @@ from code_analysis.commands.ast.imports import GetImportsMCPCommand
 from code_analysis.commands.ast.list_entities import ListCodeEntitiesMCPCommand
 from code_analysis.commands.ast.statistics import ASTStatisticsMCPCommand
 from code_analysis.commands.base_mcp_command import BaseMCPCommand
+from code_analysis.core.symbol_graph import FileFragment, SymbolGraph, parse_bases
+
+_HIERARCHY_GRAPH = "code_analysis.commands.ast.hierarchy.get_project_symbol_graph"
+
+
+def _class_graph(rows: list[dict[str, object]]) -> SymbolGraph:
+    """Build a symbol graph holding one class per row (one file per path)."""
+    files: dict[str, FileFragment] = {}
+    for i, row in enumerate(rows):
+        path = str(row["file_path"])
+        fr = files.setdefault(path, FileFragment(file_id=path, path=path))
+        fr.classes.append(
+            (
+                str(i),
+                str(row["name"]),
+                int(row["line"]),  # type: ignore[call-overload]
+                parse_bases(row["bases"]),
+                row["cst_node_id"],  # type: ignore[arg-type]
+            )
+        )
+    return SymbolGraph(files.values())
 
 
 @pytest.mark.asyncio
@@ -208,8 +229,8 @@ async def test_get_imports_import_from_filter_maps_to_stored_from() -> None:
 async def test_get_class_hierarchy_includes_leaf_class() -> None:
     """Verify test get class hierarchy includes leaf class."""
     mock_db = MagicMock()
-    mock_db.execute.return_value = {
-        "data": [
+    graph = _class_graph(
+        [
             {
                 "name": "AIAdminCommand",
                 "line": 9,
@@ -218,13 +239,14 @@ async def test_get_class_hierarchy_includes_leaf_class() -> None:
                 "cst_node_id": None,
             }
         ]
-    }
+    )
     mock_db.disconnect.return_value = None
 
     with (
         patch.object(
             BaseMCPCommand, "_open_database_from_config", return_value=mock_db
         ),
+        patch(_HIERARCHY_GRAPH, return_value=graph),
         patch.object(
             BaseMCPCommand, "_resolve_project_root", return_value=Path("/tmp/proj")
         ),
@@ -240,8 +262,8 @@ async def test_get_class_hierarchy_includes_leaf_class() -> None:
 async def test_get_class_hierarchy_project_level_includes_all_classes() -> None:
     """Verify test get class hierarchy project level includes all classes."""
     mock_db = MagicMock()
-    mock_db.execute.return_value = {
-        "data": [
+    graph = _class_graph(
+        [
             {
                 "name": "Command",
                 "line": 1,
@@ -257,13 +279,14 @@ async def test_get_class_hierarchy_project_level_includes_all_classes() -> None:
                 "cst_node_id": None,
             },
         ]
-    }
+    )
     mock_db.disconnect.return_value = None
 
     with (
         patch.object(
             BaseMCPCommand, "_open_database_from_config", return_value=mock_db
         ),
+        patch(_HIERARCHY_GRAPH, return_value=graph),
         patch.object(
             BaseMCPCommand, "_resolve_project_root", return_value=Path("/tmp/proj")
         ),
@@ -352,3 +352,44 @@ class TestValidateParamsAgainstSchemaUnionTypes:
                 "union_test",
             )
         assert exc_info.value.field == "selector"
+
+
+class _CountingSchemaCommand(BaseMCPCommand):
+    """Command whose get_schema counts how often it is rebuilt."""
+
+    name = "counting_schema_test"
+    schema_builds = 0
+
+    @classmethod
+    def get_schema(cls) -> Dict[str, Any]:
+        """Return a fresh schema dict like most commands do."""
+        cls.schema_builds += 1
+        return {
+            "type": "object",
+            "properties": {"limit": {"type": "integer", "minimum": 1}},
+            "additionalProperties": False,
+        }
+
+    async def execute(self, **kwargs: Any) -> CommandResult:
+        """Execute the command."""
+        return SuccessResult(data={})
+
+
+def test_validate_params_compiles_schema_once_per_class(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """validate_params reuses the compiled schema; a patched get_schema recompiles."""
+    cmd = _CountingSchemaCommand()
+    for _ in range(3):
+        assert cmd.validate_params({"limit": 2, "context": {}}) == {"limit": 2}
+    with pytest.raises(ValidationError, match="must be >= 1, got 0"):
+        cmd.validate_params({"limit": 0})
+    assert _CountingSchemaCommand.schema_builds == 1
+
+    monkeypatch.setattr(
+        _CountingSchemaCommand,
+        "get_schema",
+        classmethod(lambda cls: {"type": "object", "properties": {}}),
+    )
+    with pytest.raises(ValidationError, match="unknown parameter 'limit'"):
+        cmd.validate_params({"limit": 2})
@@ -0,0 +1,149 @@
+"""
+Tests for the benchmark package: synthetic repos, stand-ins, runner, baseline.
+
+Author: Vasiliy Zdanovskiy
+email: vasilyvz@gmail.com
+"""
+
+from __future__ import annotations
+
+import ast
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+
+from code_analysis.benchmarks import (
+    BenchmarkContext,
+    LocalChunker,
+    SyntheticRepoSpec,
+    compare_results,
+    generate_synthetic_repo,
+    run_benchmarks,
+    select_cases,
+)
+from code_analysis.benchmarks.cli import main
+
+_SMALL = SyntheticRepoSpec(file_count=4, files_per_package=3, seed=7)
+
+
+def _tree_bytes(root: Path) -> dict:
+    return {
+        str(p.relative_to(root)): p.read_bytes()
+        for p in sorted(root.rglob("*"))
+        if p.is_file()
+    }
+
+
+def test_synthetic_repo_is_deterministic_and_valid(tmp_path: Path) -> None:
+    """Verify equal specs produce identical, parseable projects."""
+    a = generate_synthetic_repo(tmp_path / "a", _SMALL)
+    b = generate_synthetic_repo(tmp_path / "b", _SMALL)
+    assert a.project_id == b.project_id
+    assert _tree_bytes(a.root) == _tree_bytes(b.root)
+    assert json.loads((a.root / "projectid").read_text())["id"] == a.project_id
+    assert [p.parent.name for p in a.files] == ["pkg_000"] * 3 + ["pkg_001"]
+    for path in a.files:
+        module = ast.parse(path.read_text())
+        defs = [n for n in module.body if isinstance(n, ast.FunctionDef)]
+        assert len(defs) == _SMALL.functions_per_module + 1  # + main()
+    other = generate_synthetic_repo(tmp_path / "c", SyntheticRepoSpec(seed=8))
+    assert other.project_id != a.project_id
+
+
+def test_docstring_ratio_controls_docstrings(tmp_path: Path) -> None:
+    """Verify docstring_ratio 0 and 1 give none and all docstrings."""
+    for ratio, expected in ((0.0, False), (1.0, True)):
+        repo = generate_synthetic_repo(
+            tmp_path / str(ratio),
+            SyntheticRepoSpec(file_count=2, docstring_ratio=ratio),
+        )
+        for path in repo.files:
+            module = ast.parse(path.read_text())
+            nodes = [module] + [
+                n
+                for n in ast.walk(module)
+                if isinstance(n, (ast.ClassDef, ast.FunctionDef))
+                and n.name not in ("main", "__init__")
+            ]
+            assert all(bool(ast.get_docstring(n)) is expected for n in nodes)
+
+
+def test_local_chunker_matches_svo_api() -> None:
+    """Verify chunks carry text, normalised embeddings and model name."""
+    chunker = LocalChunker(max_words=4)
+    batch = asyncio.run(chunker.get_chunks_batch(["a b c d e f", "x y\n\nz"]))
+    assert [[c.body for c in chunks] for chunks in batch] == [
+        ["a b c d", "e f"],
+        ["x y", "z"],
+    ]
+    chunk = batch[0][0]
+    assert chunk.text == chunk.body and chunk.token_count == 4
+    assert chunk.embedding_model == "local-hash-384"
+    assert sum(v * v for v in chunk.embedding) == pytest.approx(1.0)
+    assert chunk.embedding == chunker.embedder.embed("A B c d")
+    assert chunker.requests == 1
+
+
+def test_compare_flags_only_regressions_beyond_threshold() -> None:
+    """Verify median slowdowns beyond max_regression fail; missing cases do not."""
+
+    def doc(**medians: float) -> dict:
+        return {
+            "results": {
+                n: {"status": "ok", "median_sec": m} for n, m in medians.items()
+            }
+        }
+
+    baseline = doc(scan=1.0, grep=1.0, gone=1.0)
+    current = doc(scan=1.1, grep=1.5, new=2.0)
+    current["results"]["scan_err"] = {"status": "error"}
+    report = compare_results(current, baseline, max_regression=0.2)
+    assert [c.name for c in report.regressions] == ["grep"]
+    assert report.regressions[0].change == pytest.approx(0.5)
+    assert report.missing_in_current == ["gone"]
+    assert report.missing_in_baseline == ["new"]
+    assert not report.ok
+    assert compare_results(current, baseline, max_regression=0.6).ok
+
+
+def test_offline_cases_run_and_db_cases_skip(tmp_path: Path) -> None:
+    """Verify offline cases report throughput and DB cases skip without a DB."""
+    repo = generate_synthetic_repo(tmp_path / "watch" / "proj", _SMALL)
+    ctx = BenchmarkContext(repo=repo, work_dir=tmp_path / "work")
+    ctx.work_dir.mkdir()
+    cases = select_cases(["watcher_scan", "grep", "semantic_search", "batch_write"])
+    doc = run_benchmarks(cases, ctx, repeats=2, warmup=0)
+    results = doc["results"]
+    assert results["watcher_scan"]["status"] == "ok"
+    assert results["watcher_scan"]["units"] >= len(repo.files)
+    assert results["grep"]["units"] == len(repo.files)
+    assert len(results["grep"]["timings_sec"]) == 2
+    assert results["semantic_search"]["units_per_sec"] > 0
+    assert results["batch_write"] == {
+        "description": results["batch_write"]["description"],
+        "unit": "rows",
+        "status": "skipped",
+        "reason": "no database configured",
+    }
+    with pytest.raises(ValueError, match="Unknown benchmark"):
+        select_cases(["nope"])
+
+
+def test_cli_writes_results_and_fails_on_regression(tmp_path: Path) -> None:
+    """Verify the CLI exits 1 when a case is slower than the stored baseline."""
+    out = tmp_path / "results.json"
+    argv = ["--cases", "grep", "--files", "3", "--repeats", "1", "--warmup", "0"]
+    assert main([*argv, "--out", str(out)]) == 0
+    results = json.loads(out.read_text())
+    assert results["spec"]["file_count"] == 3
+    assert results["results"]["grep"]["status"] == "ok"
+
+    results["results"]["grep"]["median_sec"] /= 100.0
+    baseline = tmp_path / "baseline.json"
+    baseline.write_text(json.dumps(results))
+    assert main([*argv, "--baseline", str(baseline), "--out", str(out)]) == 1
+    assert json.loads(out.read_text())["comparison"]["regressions"][0]["name"] == (
+        "grep"
+    )
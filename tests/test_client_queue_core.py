@@ -56,9 +56,15 @@ class FakeRpc:
         return item
 
 
-def make_client(fake_rpc: FakeRpc) -> CodeAnalysisAsyncClient:
-    """Build a client without network I/O and swap in the fake rpc transport."""
-    client = CodeAnalysisAsyncClient()
+def make_client(
+    fake_rpc: FakeRpc, *, long_poll: bool = False
+) -> CodeAnalysisAsyncClient:
+    """Build a client without network I/O and swap in the fake rpc transport.
+
+    Scripted tests pin the ``queue_get_job_status`` polling path unless they
+    opt into ``long_poll``.
+    """
+    client = CodeAnalysisAsyncClient(long_poll=long_poll)
     client._rpc = fake_rpc  # type: ignore[attr-defined]  # __slots__ attribute, no network touched
     return client
 
@@ -686,3 +692,107 @@ async def test_call_unified_auto_poll_false_forwards_and_warns():
     assert isinstance(handle, QueuedJob)
     assert handle.job_id == "j12"
     assert len(fake.calls) == 1
+
+
+# ---------------------------------------------------------------------------
+# server-side long-poll (queue_wait_job) and fallback to polling
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_long_poll_waits_server_side_until_terminal():
+    queued = {
+        "success": True,
+        "job_id": "jL",
+        "status": "pending",
+        "store": "queuemgr",
+        "poll_with": "queue_get_job_status",
+    }
+    still_running = {
+        "success": True,
+        "data": {"job_id": "jL", "status": "running", "timed_out": True},
+    }
+    completed = {
+        "success": True,
+        "data": {
+            "job_id": "jL",
+            "status": "completed",
+            "result": {"command": "c", "result": {"ok": 1}, "status": "completed"},
+            "command_success": True,
+            "timed_out": False,
+        },
+    }
+    fake = FakeRpc([queued, still_running, completed])
+    client = make_client(fake, long_poll=True)
+
+    assert await client.call("c", {}, poll_interval=60.0) == {"ok": 1}
+    assert [c["command"] for c in fake.calls[1:]] == ["queue_wait_job"] * 2
+    assert fake.calls[1]["params"] == {"job_id": "jL", "timeout": 25.0}
+
+
+@pytest.mark.asyncio
+async def test_long_poll_unknown_command_falls_back_and_is_remembered():
+    queued = {
+        "success": True,
+        "job_id": "jF",
+        "status": "pending",
+        "store": "queuemgr",
+        "poll_with": "queue_get_job_status",
+    }
+    unknown = {"success": False, "error": {"code": -32601, "message": "not found"}}
+    completed = {
+        "success": True,
+        "data": {
+            "job_id": "jF",
+            "status": "completed",
+            "result": {"command": "c", "result": {"ok": 2}, "status": "completed"},
+            "command_success": True,
+        },
+    }
+    fake = FakeRpc([queued, unknown, completed, queued, completed])
+    client = make_client(fake, long_poll=True)
+
+    assert await client.call("c", {}, poll_interval=POLL_INTERVAL) == {"ok": 2}
+    assert await client.call("c", {}, poll_interval=POLL_INTERVAL) == {"ok": 2}
+    assert [c["command"] for c in fake.calls] == [
+        "c",
+        "queue_wait_job",
+        "queue_get_job_status",
+        "c",
+        "queue_get_job_status",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_long_poll_error_reply_waits_poll_interval_before_retry(monkeypatch):
+    from code_analysis_client import queue_wait
+
+    slept: List[float] = []
+
+    async def record_sleep(seconds: float) -> None:
+        slept.append(seconds)
+
+    monkeypatch.setattr(queue_wait.asyncio, "sleep", record_sleep)
+    queued = {
+        "success": True,
+        "job_id": "jE",
+        "status": "pending",
+        "store": "queuemgr",
+        "poll_with": "queue_get_job_status",
+    }
+    internal_error = {"success": False, "error": {"code": -32603, "message": "boom"}}
+    completed = {
+        "success": True,
+        "data": {
+            "job_id": "jE",
+            "status": "completed",
+            "result": {"command": "c", "result": {"ok": 3}, "status": "completed"},
+            "command_success": True,
+        },
+    }
+    fake = FakeRpc([queued, internal_error, internal_error, completed])
+    client = make_client(fake, long_poll=True)
+
+    assert await client.call("c", {}, poll_interval=0.5) == {"ok": 3}
+    assert [c["command"] for c in fake.calls[1:]] == ["queue_wait_job"] * 3
+    assert slept == [0.5, 0.5]
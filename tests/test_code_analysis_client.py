@@ -345,6 +345,66 @@ async def test_file_session_view_calls_session_view() -> None:
     )
 
 
+@pytest.mark.asyncio
+async def test_batch_sends_one_read_only_batch_and_returns_item_results() -> None:
+    """Verify client.batch builds read_only_batch params and unwraps per-item results."""
+    mock_rpc = MagicMock()
+    mock_rpc.help = AsyncMock(
+        return_value={
+            "success": True,
+            "data": {
+                "schema": {
+                    "type": "object",
+                    "properties": {
+                        "invocations": {"type": "array"},
+                        "project_id": {"type": "string"},
+                        "snapshot": {"type": "boolean"},
+                    },
+                    "required": ["invocations"],
+                    "additionalProperties": False,
+                },
+                "metadata": {},
+            },
+        }
+    )
+    items = [{"success": True, "data": {"n": 1}}, {"success": False, "error": "x"}]
+    mock_rpc.execute_command = AsyncMock(
+        return_value={
+            "success": True,
+            "data": {
+                "inline": True,
+                "results": [
+                    {"command": "universal_file_preview", "result": items[0]},
+                    {"command": "get_code_entity_info", "result": items[1]},
+                ],
+            },
+        }
+    )
+    with patch(
+        "code_analysis_client.client.JsonRpcClient",
+        return_value=mock_rpc,
+    ):
+        client = CodeAnalysisAsyncClient(host="h", port=1)
+        batch = client.batch("p1", snapshot=True)
+        batch.add("universal_file_preview", file_path="a.py").add(
+            "get_code_entity_info", {"entity_name": "A"}
+        )
+        out = await batch.run()
+    assert out == items
+    mock_rpc.execute_command.assert_awaited_once_with(
+        "read_only_batch",
+        {
+            "invocations": [
+                {"command": "universal_file_preview", "params": {"file_path": "a.py"}},
+                {"command": "get_code_entity_info", "params": {"entity_name": "A"}},
+            ],
+            "project_id": "p1",
+            "snapshot": True,
+        },
+        use_cmd_endpoint=False,
+    )
+
+
 def test_examples_cover_all_public_client_api() -> None:
     """Verify test examples cover all public client api."""
     from pathlib import Path
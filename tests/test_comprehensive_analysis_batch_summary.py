@@ -14,6 +14,10 @@ import pytest
 from code_analysis.commands.comprehensive_analysis_mcp.batch_summary import (
     build_batch_summary,
 )
+from code_analysis.commands.comprehensive_analysis_mcp.check_cache import (
+    CheckCacheKeys,
+    content_sha256,
+)
 from code_analysis.commands.comprehensive_analysis_mcp.execute_batch import run_batch
 from code_analysis.core.comprehensive_analyzer import ComprehensiveAnalyzer
 
@@ -125,16 +129,7 @@ async def test_run_batch_summary_counter_invariants(
     tmp_path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
     """One missing file, one up-to-date skip, one analyzed row: buckets sum to files_total."""
-    # execute_batch calls the driver-direct should_analyze_file free function (stage-2
-    # layer collapse) unconditionally now, instead of hasattr(db, "should_analyze_file")
-    # dispatch - route it back to db.should_analyze_file(fid, mtime) below.
-    monkeypatch.setattr(
-        "code_analysis.commands.comprehensive_analysis_mcp.execute_batch."
-        "should_analyze_file",
-        lambda driver, file_id, file_mtime: driver.should_analyze_file(
-            file_id, file_mtime
-        ),
-    )
+    analyzer = ComprehensiveAnalyzer(max_lines=10_000)
     (tmp_path / "stale.py").write_text("x = 1\n", encoding="utf-8")
     (tmp_path / "live.py").write_text("y = 2\n", encoding="utf-8")
 
@@ -149,13 +144,25 @@ async def test_run_batch_summary_counter_invariants(
     db.disconnect = MagicMock()
     db.save_comprehensive_analysis_results_batch = MagicMock()
 
-    def should_analyze_file(fid, _mtime):
-        """Return should analyze file."""
-        if fid == 2:
-            return {"should_analyze": False, "reason": "up_to_date"}
-        return {"should_analyze": True}
-
-    db.should_analyze_file = should_analyze_file
+    # stale.py's placeholders result is cached under its current key.
+    version, config_hash = CheckCacheKeys(tmp_path, analyzer, 5, 0.8).key(
+        "placeholders", tmp_path / "stale.py"
+    )
+    cached = {
+        "2": {
+            "placeholders": {
+                "content_sha256": content_sha256("x = 1\n"),
+                "tool_version": version,
+                "config_hash": config_hash,
+                "result": [],
+            }
+        }
+    }
+    monkeypatch.setattr(
+        "code_analysis.commands.comprehensive_analysis_mcp.execute_batch."
+        "get_check_cache_entries",
+        lambda driver, file_ids: cached,
+    )
 
     results = {
         **_minimal_results(),
@@ -168,13 +175,13 @@ async def test_run_batch_summary_counter_invariants(
         "analysis_logger": logging.getLogger("test_ca_batch_summary"),
         "log_timing": lambda _phase, t0: time.perf_counter(),
         "progress_tracker": None,
-        "analyzer": ComprehensiveAnalyzer(max_lines=10_000),
+        "analyzer": analyzer,
         "results": results,
         "mypy_config": None,
         "limit": 3,
         "offset": 0,
         "t_start": time.perf_counter(),
-        "check_placeholders": False,
+        "check_placeholders": True,
         "check_stubs": False,
         "check_empty_methods": False,
         "check_imports": False,
@@ -0,0 +1,192 @@
+"""
+Tests for the comprehensive_analysis per-check result cache and shared parse.
+
+Author: Vasiliy Zdanovskiy
+email: vasilyvz@gmail.com
+"""
+
+from __future__ import annotations
+
+import ast
+import sqlite3
+from pathlib import Path
+from typing import Any, Dict, List
+from unittest.mock import MagicMock, patch
+
+from code_analysis.commands.comprehensive_analysis_mcp.batch_one_file import (
+    analyze_one_file_in_batch,
+)
+from code_analysis.commands.comprehensive_analysis_mcp.check_cache import (
+    CheckCacheKeys,
+    content_sha256,
+    is_cacheable,
+    plan_file_checks,
+    requested_checks,
+)
+from code_analysis.core.comprehensive_analyzer import ComprehensiveAnalyzer
+from code_analysis.core.database_driver_pkg.domain.comprehensive_analysis import (
+    get_check_cache_entries,
+    save_check_cache_entries,
+)
+
+_SOURCE = '''"""Module."""
+
+
+class A:
+    def run(self):
+        pass
+
+
+def helper():
+    # TODO: finish
+    ...
+'''
+
+
+class _SqliteDb:
+    """Driver-shaped wrapper over an in-memory SQLite check-cache table."""
+
+    def __init__(self) -> None:
+        self.conn = sqlite3.connect(":memory:")
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute(
+            "CREATE TABLE comprehensive_analysis_check_cache (file_id TEXT, "
+            "project_id TEXT, check_name TEXT, content_sha256 TEXT, "
+            "tool_version TEXT, config_hash TEXT, result_json TEXT, "
+            "updated_at REAL DEFAULT (julianday('now')), "
+            "UNIQUE (file_id, check_name))"
+        )
+
+    def execute(self, sql: str, params: tuple = ()) -> Dict[str, Any]:
+        return {"data": [dict(r) for r in self.conn.execute(sql, params)]}
+
+    def begin_transaction(self) -> str:
+        return "tx"
+
+    def execute_batch(self, operations: List[tuple], transaction_id: str) -> None:
+        for sql, params in operations:
+            self.conn.execute(sql, params)
+
+    def commit_transaction(self, transaction_id: str) -> None:
+        self.conn.commit()
+
+    def rollback_transaction(self, transaction_id: str) -> None:
+        self.conn.rollback()
+
+
+def test_ast_checks_share_one_parse(tmp_path: Path) -> None:
+    """Verify all AST-based checks of one file parse its source once."""
+    analyzer = ComprehensiveAnalyzer()
+    path = tmp_path / "mod.py"
+    real_parse = ast.parse
+    with patch(
+        "code_analysis.core.comprehensive_analyzer.ast.parse", side_effect=real_parse
+    ) as parse:
+        placeholders = analyzer.find_placeholders(path, _SOURCE)
+        stubs = analyzer.find_stubs(path, _SOURCE)
+        empty = analyzer.find_empty_methods(path, _SOURCE)
+        analyzer.find_imports_not_at_top(path, _SOURCE)
+        analyzer.find_missing_docstrings(path, _SOURCE)
+    assert parse.call_count == 1
+    assert [p["pattern"] for p in placeholders] == ["TODO"]
+    assert {(s["function_name"], s["class_name"], s["type"]) for s in stubs} == {
+        ("run", "A", "method"),
+        ("helper", None, "function"),
+    }
+    assert [m["method_name"] for m in empty] == ["run"]
+    assert analyzer.find_stubs(path, "def broken(:\n") == []
+
+
+def test_cache_entries_round_trip_and_upsert() -> None:
+    """Verify entries are upserted per (file, check) and loaded in one query."""
+    db = _SqliteDb()
+    save_check_cache_entries(
+        db,
+        [
+            ("f1", "p1", "stubs", "sha1", "1.0", "cfg", [{"line": 3}]),
+            ("f1", "p1", "flake8", "sha1", "7.0", "cfg", []),
+        ],
+    )
+    save_check_cache_entries(db, [("f1", "p1", "stubs", "sha2", "1.0", "cfg", [])])
+    entries = get_check_cache_entries(db, ["f1", "f2"])
+    assert set(entries) == {"f1"}
+    assert entries["f1"]["stubs"]["content_sha256"] == "sha2"
+    assert entries["f1"]["stubs"]["result"] == []
+    assert entries["f1"]["flake8"]["tool_version"] == "7.0"
+
+
+def test_plan_reruns_only_invalidated_checks(tmp_path: Path) -> None:
+    """Verify content and tool-config changes invalidate only affected checks."""
+    path = tmp_path / "mod.py"
+    path.write_text(_SOURCE, encoding="utf-8")
+    keys = CheckCacheKeys(tmp_path, ComprehensiveAnalyzer(), 5, 0.8)
+    keys._versions["flake8"] = "7.0"
+    sha = content_sha256(_SOURCE)
+    checks = ["stubs", "flake8"]
+    cached = {}
+    for check in checks:
+        version, config_hash = keys.key(check, path)
+        cached[check] = {
+            "content_sha256": sha,
+            "tool_version": version,
+            "config_hash": config_hash,
+            "result": [check],
+        }
+
+    reused, stale = plan_file_checks(checks, cached, sha, keys, path)
+    assert reused == {"stubs": ["stubs"], "flake8": ["flake8"]} and not stale
+
+    reused, stale = plan_file_checks(checks, cached, "other", keys, path)
+    assert not reused and set(stale) == {"stubs", "flake8"}
+
+    (tmp_path / "setup.cfg").write_text("[flake8]\nmax-line-length = 100\n")
+    keys = CheckCacheKeys(tmp_path, ComprehensiveAnalyzer(), 5, 0.8)
+    keys._versions["flake8"] = "7.0"
+    reused, stale = plan_file_checks(checks, cached, sha, keys, path)
+    assert set(reused) == {"stubs"} and set(stale) == {"flake8"}
+
+
+def test_requested_checks_and_cacheability() -> None:
+    """Verify flake8 is Python-only and tool failures without findings are not cached."""
+    flags = {"check_flake8": True, "check_imports": True, "check_mypy": True}
+    assert requested_checks(flags, "a.py") == ["imports", "flake8"]
+    assert requested_checks(flags, "README.md") == ["imports"]
+    assert is_cacheable("flake8", [])
+    assert is_cacheable("flake8", [{"success": False, "errors": ["a.py:1:1 E1"]}])
+    assert not is_cacheable("flake8", [{"success": False, "errors": []}])
+    assert not is_cacheable("black", [{"errors": ["x"], "tool_available": False}])
+
+
+def test_batch_file_skips_cached_checks(tmp_path: Path) -> None:
+    """Verify cached findings are returned without re-running their checks."""
+    path = tmp_path / "mod.py"
+    path.write_text(_SOURCE, encoding="utf-8")
+    analyzer = MagicMock()
+    analyzer.find_stubs.return_value = []
+    cached_placeholder = {"line": 10, "pattern": "TODO", "file_path": "mod.py"}
+    file_results, file_summary, _pid = analyze_one_file_in_batch(
+        full_path=path,
+        file_path_str="mod.py",
+        source_code=_SOURCE,
+        file_id="f1",
+        file_record={"project_id": "p1"},
+        proj_id="p1",
+        analyzer=analyzer,
+        project_mypy_errors={},
+        timings_sec={"placeholders": 0.0, "stubs": 0.0},
+        check_placeholders=True,
+        check_stubs=True,
+        check_empty_methods=False,
+        check_imports=False,
+        check_duplicates=False,
+        check_flake8=False,
+        check_mypy=False,
+        check_docstrings=False,
+        duplicate_min_lines=5,
+        duplicate_min_similarity=0.8,
+        cached_results={"placeholders": [cached_placeholder]},
+    )
+    assert analyzer.find_placeholders.call_count == 0
+    assert analyzer.find_stubs.call_count == 1
+    assert file_results["placeholders"] == [cached_placeholder]
+    assert file_summary["total_placeholders"] == 1
@@ -30,13 +30,17 @@ from cryptography.hazmat.primitives import hashes, serialization
 from cryptography.hazmat.primitives.asymmetric import rsa
 from cryptography.x509.oid import NameOID
 
+from code_analysis.core.config import get_driver_config
 from code_analysis.core.config_state import (
     get_config_runtime_state,
     get_config_validation_cache_diagnostics,
     is_config_valid,
+    load_config_snapshot,
     reset_config_validation_cache,
     revalidate_config_at_path,
+    snapshot_for_config_data,
 )
+from code_analysis.core.storage_paths import load_raw_config, resolve_storage_paths
 
 
 def _make_self_signed_cert_key(cert_path: Path, key_path: Path) -> None:
@@ -222,3 +226,57 @@ def test_revalidate_config_cache_is_per_path(tmp_path: Path) -> None:
     diag = get_config_validation_cache_diagnostics()
     assert diag["load_count"] == 2
     assert diag["cache_hit_count"] == 2
+
+
+def test_atomic_replace_with_same_mtime_and_size_reloads(tmp_path: Path) -> None:
+    """Verify a rename-over with identical mtime and size is caught by the inode."""
+    reset_config_validation_cache()
+    valid_cfg, _ = _server_configs(tmp_path)
+    cfg_path = tmp_path / "config.json"
+    _write_config(cfg_path, valid_cfg)
+    first = load_config_snapshot(cfg_path)
+
+    replacement = tmp_path / "config.json.tmp"
+    changed = dict(valid_cfg, server=dict(valid_cfg["server"], port=15001))
+    _write_config(replacement, changed)
+    assert replacement.stat().st_size == cfg_path.stat().st_size
+    st = cfg_path.stat()
+    os.utime(replacement, ns=(st.st_atime_ns, st.st_mtime_ns))
+    keep_inode_alive = cfg_path.open("rb")
+    try:
+        os.replace(replacement, cfg_path)
+        second = load_config_snapshot(cfg_path)
+    finally:
+        keep_inode_alive.close()
+
+    assert second is not first
+    assert second.config_data["server"]["port"] == 15001
+    assert get_config_validation_cache_diagnostics()["load_count"] == 2
+
+
+def test_derived_views_are_computed_once_per_snapshot(tmp_path: Path) -> None:
+    """Verify driver config and storage paths are memoized until the file changes."""
+    reset_config_validation_cache()
+    valid_cfg, _ = _server_configs(tmp_path)
+    cfg_path = tmp_path / "config.json"
+    _write_config(cfg_path, valid_cfg)
+
+    raw = load_raw_config(cfg_path)
+    assert snapshot_for_config_data(raw) is load_config_snapshot(cfg_path)
+    assert snapshot_for_config_data(dict(raw)) is None
+    driver = get_driver_config(raw)
+    storage = resolve_storage_paths(config_data=raw, config_path=cfg_path)
+    assert get_driver_config(load_raw_config(cfg_path)) is driver
+    assert (
+        resolve_storage_paths(
+            config_data=load_raw_config(cfg_path), config_path=cfg_path
+        )
+        is storage
+    )
+    assert get_driver_config(dict(raw)) == driver
+    assert get_driver_config(dict(raw)) is not driver
+
+    _write_config(cfg_path, dict(valid_cfg, queue_manager={"enabled": False}))
+    future = time.time() + 5
+    os.utime(cfg_path, (future, future))
+    assert get_driver_config(load_raw_config(cfg_path)) is not driver
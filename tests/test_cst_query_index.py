@@ -0,0 +1,163 @@
+"""
+Tests for the cached CSTQuery index and multi-file querying.
+
+Author: Vasiliy Zdanovskiy
+email: vasilyvz@gmail.com
+"""
+
+import pytest
+
+from code_analysis.cst_query import (
+    clear_query_index_cache,
+    get_query_index,
+    parse_selector,
+    query_files,
+    query_source,
+)
+from code_analysis.cst_query.ast import Combinator
+from code_analysis.cst_query.executor import _matches_step
+
+SOURCE = """
+import os
+
+
+class A:
+    def run(self, x):
+        if x:
+            return helper(x)
+        for i in range(3):
+            if i:
+                return i
+
+    class Inner:
+        def run(self):
+            return None
+
+
+def helper(x):
+    def run():
+        return x
+
+    return run()
+"""
+
+SELECTORS = [
+    "function",
+    'Def:*[name="run"]',
+    'class[name="A"] method',
+    'class[name="A"] > IndentedBlock > method',
+    "class // Return",
+    "If Return",
+    "IndentedBlock > SimpleStatementLine > Return",
+    'method[name="run"] Return',
+    "Return:last",
+    "stmt:nth(2)",
+    'function:not(function[name="helper"])',
+    'class Def:*[name="run"] If',
+]
+
+
+def _reference(source, selector):
+    """Evaluate ``selector`` by full scans and parent-chain walks."""
+    q = parse_selector(selector)
+    nodes = get_query_index(source).nodes
+
+    def step_matches(step):
+        matched = [n for n in nodes if _matches_step(n, step)]
+        for pseudo in step.pseudos:
+            if pseudo.kind.value == "first":
+                matched = matched[:1]
+            elif pseudo.kind.value == "last":
+                matched = matched[-1:]
+            elif pseudo.kind.value == "nth":
+                idx = pseudo.index or 0
+                matched = [matched[idx]] if 0 <= idx < len(matched) else []
+        return matched
+
+    parent_of = {n.node: n.parent for n in nodes}
+    current = step_matches(q.first)
+    for comb, step in q.rest:
+        prev = {n.node for n in current}
+        out = []
+        for n in step_matches(step):
+            p = n.parent
+            while p is not None:
+                if p in prev:
+                    out.append(n)
+                    break
+                if comb == Combinator.CHILD:
+                    break
+                p = parent_of.get(p)
+        current = out
+    return [(n.node_type, n.qualname, n.start_line, n.start_col) for n in current]
+
+
+@pytest.mark.parametrize("selector", SELECTORS)
+def test_indexed_evaluation_matches_reference(selector):
+    """Verify bucketed steps and range-based combinators match a full scan."""
+    got = [
+        (m.node_type, m.qualname, m.start_line, m.start_col)
+        for m in query_source(SOURCE, selector)
+    ]
+    assert got == _reference(SOURCE, selector)
+    assert got
+
+
+def test_index_is_cached_by_content():
+    """Verify equal source reuses one index and changed source builds another."""
+    clear_query_index_cache()
+    first = get_query_index(SOURCE)
+    assert get_query_index(str(SOURCE)) is first
+    assert get_query_index(SOURCE + "\nx = 1\n") is not first
+    clear_query_index_cache()
+    assert get_query_index(SOURCE) is not first
+
+
+def test_node_ids_by_exact_key_override_legacy_ids():
+    """Verify loaded-tree ids are applied to cached (id-less) nodes."""
+    source = "def f():\n    pass\n"
+    (legacy,) = query_source(source, "function")
+    key = (1, 0, 2, 8, "FunctionDef")
+    (match,) = query_source(
+        source, "function", node_ids_by_exact_key={key: "tree-node-id"}
+    )
+    assert legacy.node_id.startswith("function:")
+    assert match.node_id == "tree-node-id"
+
+
+def test_query_files_streams_in_order(tmp_path):
+    """Verify per-file results keep input order, failures included."""
+    paths = []
+    for i in range(20):
+        path = tmp_path / f"m{i:02d}.py"
+        path.write_text(f"def f{i}():\n    return {i}\n", encoding="utf-8")
+        paths.append(str(path))
+    bad = tmp_path / "bad.py"
+    bad.write_text("def (:\n", encoding="utf-8")
+    paths.insert(3, str(bad))
+
+    results = list(query_files(paths, "function"))
+    assert [r.path for r in results] == paths
+    assert results[3].error is not None and not results[3].matches
+    names = [m.name for r in results for m in r.matches]
+    assert names == [f"f{i}" for i in range(20)]
+
+
+def test_query_files_loads_node_ids_only_for_matching_files(tmp_path):
+    """Verify the tree node-id loader is skipped for files without matches."""
+    hit = tmp_path / "hit.py"
+    hit.write_text("def f():\n    return 1\n", encoding="utf-8")
+    miss = tmp_path / "miss.py"
+    miss.write_text("x = 1\n", encoding="utf-8")
+    loaded = []
+
+    def loader(path, source):
+        loaded.append(path)
+        return {(1, 0, 2, 12, "FunctionDef"): "tree-node-id"}
+
+    results = list(
+        query_files([str(miss), str(hit)], "function", node_ids_loader=loader)
+    )
+    assert loaded == [str(hit)]
+    assert [m.node_id for m in results[1].matches] == ["tree-node-id"]
+    assert results[0].matches == ()
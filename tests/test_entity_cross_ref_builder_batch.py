@@ -0,0 +1,151 @@
+"""
+Tests for batched entity_cross_ref building (span index + callee name map).
+
+Author: Vasiliy Zdanovskiy
+email: vasilyvz@gmail.com
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from typing import Any, Dict, List
+
+import pytest
+
+from code_analysis.core.entity_cross_ref_builder import (
+    build_entity_cross_ref_for_file,
+    resolve_callee,
+    resolve_caller,
+)
+from code_analysis.core.entity_cross_ref_index import EntitySpanIndex
+
+_SCHEMA = """
+CREATE TABLE files (id TEXT PRIMARY KEY, project_id TEXT);
+CREATE TABLE classes (id TEXT PRIMARY KEY, file_id TEXT, name TEXT, line INTEGER,
+    end_line INTEGER, bases TEXT);
+CREATE TABLE methods (id TEXT PRIMARY KEY, class_id TEXT, name TEXT, line INTEGER,
+    end_line INTEGER);
+CREATE TABLE functions (id TEXT PRIMARY KEY, file_id TEXT, name TEXT, line INTEGER,
+    end_line INTEGER);
+CREATE TABLE usages (file_id TEXT, line INTEGER, usage_type TEXT, target_type TEXT,
+    target_name TEXT, target_class TEXT);
+CREATE TABLE entity_cross_ref (id INTEGER PRIMARY KEY, caller_class_id TEXT,
+    caller_method_id TEXT, caller_function_id TEXT, callee_class_id TEXT,
+    callee_method_id TEXT, callee_function_id TEXT, ref_type TEXT, file_id TEXT,
+    line INTEGER);
+"""
+
+
+class _SqliteDb:
+    """``execute(sql, params) -> {"data": [...]}`` over an in-memory SQLite DB."""
+
+    def __init__(self) -> None:
+        self.conn = sqlite3.connect(":memory:")
+        self.conn.row_factory = sqlite3.Row
+        self.conn.executescript(_SCHEMA)
+        self.statements: List[str] = []
+
+    def execute(self, sql: str, params: tuple = ()) -> Dict[str, Any]:
+        self.statements.append(sql)
+        cur = self.conn.execute(sql, params)
+        return {"data": [dict(r) for r in cur.fetchall()], "lastrowid": cur.lastrowid}
+
+
+@pytest.fixture
+def db() -> _SqliteDb:
+    """a.py: Base, Worker(Base) with run(); helper(); b.py: helper(), Sub(Worker)."""
+    d = _SqliteDb()
+    d.conn.executescript(
+        """
+        INSERT INTO files VALUES ('fa', 'p1'), ('fb', 'p1');
+        INSERT INTO classes VALUES ('c1', 'fa', 'Base', 1, 3, '[]');
+        INSERT INTO classes VALUES ('c2', 'fa', 'Worker', 5, 20, '["mod.Base"]');
+        INSERT INTO methods VALUES ('m1', 'c2', 'run', 6, 12);
+        INSERT INTO functions VALUES ('f1', 'fa', 'helper', 22, 30);
+        INSERT INTO functions VALUES ('f2', 'fb', 'helper', 1, 4);
+        INSERT INTO classes VALUES ('c3', 'fb', 'Sub', 6, 9, '["Worker"]');
+        INSERT INTO usages VALUES ('fa', 7, 'call', 'function', 'helper', NULL);
+        INSERT INTO usages VALUES ('fa', 15, 'instantiation', 'class', 'Base', NULL);
+        INSERT INTO usages VALUES ('fa', 25, 'call', 'method', 'run', 'Worker');
+        INSERT INTO usages VALUES ('fa', 40, 'call', 'function', 'helper', NULL);
+        INSERT INTO usages VALUES ('fa', 26, 'call', 'function', 'missing', NULL);
+        """
+    )
+    return d
+
+
+def _xrefs(db: _SqliteDb) -> List[tuple]:
+    return [
+        tuple(r)
+        for r in db.conn.execute(
+            "SELECT COALESCE(caller_class_id, caller_method_id, caller_function_id), "
+            "COALESCE(callee_class_id, callee_method_id, callee_function_id), "
+            "ref_type, file_id, line FROM entity_cross_ref ORDER BY id"
+        )
+    ]
+
+
+def test_file_rows_match_per_usage_resolvers(db: _SqliteDb) -> None:
+    """Verify batched resolution agrees with resolve_caller/resolve_callee."""
+    expected = []
+    for u in db.conn.execute("SELECT * FROM usages WHERE file_id = 'fa'"):
+        caller = resolve_caller(db, "fa", u["line"])
+        callee = resolve_callee(
+            db,
+            "p1",
+            "fa",
+            u["line"],
+            u["target_type"],
+            u["target_name"],
+            u["target_class"],
+        )
+        if caller and callee:
+            expected.append((caller[1], callee[1], u["usage_type"], "fa", u["line"]))
+
+    db.statements.clear()
+    added = build_entity_cross_ref_for_file(db, "fa", "p1", "")
+    rows = _xrefs(db)
+    assert rows[: len(expected)] == expected
+    assert ("m1", "f1", "call", "fa", 7) in rows  # same-file helper preferred
+    assert ("f1", "m1", "call", "fa", 25) in rows
+    # Worker(Base) forward edge, Sub(Worker) backfilled from b.py.
+    assert rows[len(expected) :] == [
+        ("c2", "c1", "inherit", "fa", 5),
+        ("c3", "c2", "inherit", "fb", 6),
+    ]
+    assert added == len(rows)
+    inserts = [s for s in db.statements if "INSERT" in s]
+    assert len(inserts) == 1
+
+
+def test_query_count_does_not_grow_with_usages(db: _SqliteDb) -> None:
+    """Verify many usages cost the same number of statements as a few."""
+    build_entity_cross_ref_for_file(db, "fa", "p1", "")
+    few = len(db.statements)
+    db.conn.executemany(
+        "INSERT INTO usages VALUES ('fa', ?, 'call', 'function', 'helper', NULL)",
+        [(line,) for line in range(1, 500)],
+    )
+    db.conn.execute("DELETE FROM entity_cross_ref")
+    db.statements.clear()
+    build_entity_cross_ref_for_file(db, "fa", "p1", "")
+    assert len(db.statements) == few
+
+
+def test_span_index_prefers_innermost_then_method() -> None:
+    """Verify overlapping spans resolve like the per-line resolver."""
+    index = EntitySpanIndex(
+        [
+            ("class", "c", 1, 50),
+            ("method", "m", 10, 20),
+            ("function", "f", 10, 20),
+            ("function", "g", 30, 30),
+        ]
+    )
+    assert index.locate_many([5, 15, 30, 31, 99]) == {
+        5: ("class", "c"),
+        15: ("method", "m"),
+        30: ("function", "g"),
+        31: ("class", "c"),
+        99: None,
+    }
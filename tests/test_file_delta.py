@@ -0,0 +1,161 @@
+"""
+Tests for rsync-style delta uploads: server signatures/reconstruction and client encoder.
+
+Author: Vasiliy Zdanovskiy
+email: vasilyvz@gmail.com
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+import random
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from code_analysis.core.file_delta import (
+    DELTA_BASE_MISMATCH,
+    DELTA_CHECKSUM_MISMATCH,
+    DELTA_INVALID,
+    DeltaError,
+    apply_delta,
+    choose_block_size,
+    file_signatures,
+    parse_delta,
+)
+from code_analysis_client import CodeAnalysisAsyncClient, FileSessionClient
+from code_analysis_client.file_delta import compute_delta
+
+
+def _roundtrip(base: bytes, new: bytes, block_size: int) -> dict:
+    delta = compute_delta(new, file_signatures(base, block_size))
+    assert apply_delta(base, parse_delta(json.dumps(delta))) == new
+    return delta
+
+
+def _literal_len(delta: dict) -> int:
+    return sum(len(base64.b64decode(op["data"])) for op in delta["ops"] if "data" in op)
+
+
+def test_block_size_grows_with_sqrt_of_size() -> None:
+    """Verify small files use the minimum and large files a clamped sqrt."""
+    assert choose_block_size(0) == 1024
+    assert choose_block_size(1 << 20) == 1024
+    assert choose_block_size(16 << 20) == 4096
+    assert choose_block_size(1 << 40) == 64 * 1024
+
+
+def test_insert_shifts_are_matched_by_rolling_checksum() -> None:
+    """Verify only the inserted bytes travel when content after them shifts."""
+    base = b"".join(b"row %05d: value\n" % i for i in range(2000))
+    new = base[:10_000] + b"INSERTED\n" + base[10_000:]
+    delta = _roundtrip(base, new, 256)
+    assert _literal_len(delta) <= 256 + len(b"INSERTED\n")
+    assert sum(op.get("count", 0) for op in delta["ops"]) >= len(base) // 256 - 1
+
+
+def test_random_edits_roundtrip() -> None:
+    """Verify inserts, deletes and short trailing blocks always reconstruct."""
+    rnd = random.Random(5)
+    for _ in range(100):
+        base = bytes(rnd.getrandbits(8) for _ in range(rnd.randint(0, 3000)))
+        new = bytearray(base)
+        for _ in range(rnd.randint(0, 3)):
+            pos = rnd.randint(0, len(new))
+            if rnd.random() < 0.5:
+                new[pos:pos] = bytes(rnd.getrandbits(8) for _ in range(40))
+            else:
+                del new[pos : pos + 40]
+        _roundtrip(base, bytes(new), rnd.choice([16, 100, 1024]))
+
+
+def test_unchanged_file_is_all_copies() -> None:
+    """Verify identical content, including a short last block, sends no literals."""
+    base = random.Random(3).randbytes(64 * 40) + b"tail"
+    delta = _roundtrip(base, base, 64)
+    assert delta["ops"] == [{"copy": 0, "count": len(base) // 64 + 1}]
+
+
+def test_apply_rejects_stale_base_and_bad_result() -> None:
+    """Verify base and result sha256 checks and out-of-range copies."""
+    base = b"a" * 100 + b"b" * 100
+    delta = compute_delta(b"b" * 100, file_signatures(base, 100))
+    with pytest.raises(DeltaError) as err:
+        apply_delta(base + b"!", delta)
+    assert err.value.code == DELTA_BASE_MISMATCH
+    with pytest.raises(DeltaError) as err:
+        apply_delta(base, {**delta, "sha256": "0" * 64})
+    assert err.value.code == DELTA_CHECKSUM_MISMATCH
+    with pytest.raises(DeltaError) as err:
+        apply_delta(base, {**delta, "ops": [{"copy": 1, "count": 2}]})
+    assert err.value.code == DELTA_INVALID
+    with pytest.raises(DeltaError, match="format"):
+        parse_delta(json.dumps({**delta, "format": "xdelta"}))
+
+
+def _mock_rpc(exec_side_effect: object) -> MagicMock:
+    mock_rpc = MagicMock()
+    mock_rpc.execute_command = AsyncMock(side_effect=exec_side_effect)
+    mock_rpc.upload_file = AsyncMock(
+        side_effect=[
+            SimpleNamespace(completed=True, transfer_id="up-delta"),
+            SimpleNamespace(completed=True, transfer_id="up-full"),
+        ]
+    )
+    mock_rpc.help = AsyncMock(
+        return_value={
+            "success": True,
+            "data": {
+                "schema": {
+                    "type": "object",
+                    "properties": {},
+                    "required": [],
+                    "additionalProperties": True,
+                }
+            },
+        }
+    )
+    return mock_rpc
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("base_changed", [False, True])
+async def test_upload_delta_saves_delta_or_falls_back(base_changed: bool) -> None:
+    """Verify upload_delta sends a delta and retries in full on DELTA_BASE_MISMATCH."""
+    base = b"".join(b"key_%04d: value\n" % i for i in range(500))
+    new = base.replace(b"key_0250: value", b"key_0250: edited")
+    saves: list[dict] = []
+
+    async def _exec(command: str, params: dict, **_: object) -> dict:
+        if command == "session_validate":
+            return {"success": True, "data": {"session_id": params["session_id"]}}
+        if command == "session_list_file_locks":
+            return {"success": True, "data": {"locks": [], "count": 0}}
+        if command == "project_file_transfer_signatures":
+            sig = file_signatures(base, 1024)
+            return {"success": True, "data": {"file_id": "fid", **sig}}
+        if command == "project_file_transfer_upload_save":
+            saves.append(params)
+            if base_changed and params.get("upload_format") == "delta":
+                return {
+                    "success": False,
+                    "error": {"code": DELTA_BASE_MISMATCH, "message": "changed"},
+                }
+            return {"success": True, "data": {"file_id": "fid"}}
+        raise AssertionError(command)
+
+    mock_rpc = _mock_rpc(_exec)
+    with patch("code_analysis_client.client.JsonRpcClient", return_value=mock_rpc):
+        fs = FileSessionClient(CodeAnalysisAsyncClient(host="h", port=1))
+        out = await fs.upload_delta("sid", new, "fid")
+
+    assert out["file_id"] == "fid"
+    assert saves[0]["upload_format"] == "delta"
+    assert saves[0]["transfer_id"] == "up-delta"
+    staged = mock_rpc.upload_file.await_args_list
+    assert len(staged) == (2 if base_changed else 1)
+    if base_changed:
+        assert "upload_format" not in saves[1]
+        assert saves[1]["transfer_id"] == "up-full"
@@ -0,0 +1,149 @@
+"""Tests for in-process (dulwich) git readers and memoized git probes.
+
+Author: Vasiliy Zdanovskiy
+email: vasilyvz@gmail.com
+"""
+
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+from typing import Any, List
+
+import pytest
+
+from code_analysis.core.git_ops import common as git_common
+from code_analysis.core.git_ops import inprocess_read
+from code_analysis.core.git_ops.inprocess_read import (
+    has_commits,
+    read_blob_diff,
+    read_local_branches,
+    read_log,
+    read_tag_names,
+)
+
+
+def _git(cwd: Path, *args: str) -> str:
+    """Run git in cwd and return stdout."""
+    result = subprocess.run(
+        ["git", *args],
+        cwd=str(cwd),
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return result.stdout
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    """Create a three-commit repository with a lightweight and annotated tag."""
+    _git(tmp_path, "init", "-b", "main")
+    _git(tmp_path, "config", "user.email", "test@example.com")
+    _git(tmp_path, "config", "user.name", "Test User")
+    for idx in range(1, 4):
+        with (tmp_path / "notes.txt").open("a", encoding="utf-8") as handle:
+            handle.write(f"line {idx}\n")
+        _git(tmp_path, "add", "notes.txt")
+        _git(tmp_path, "commit", "-m", f"change {idx}\nwrapped\n\nbody text")
+    _git(tmp_path, "tag", "v1", "HEAD~1")
+    _git(tmp_path, "tag", "-a", "v2", "-m", "release", "HEAD")
+    _git(tmp_path, "branch", "feature", "HEAD~2")
+    inprocess_read.clear_repo_handle_cache()
+    return tmp_path
+
+
+def _cli_log(repo: Path, *args: str) -> List[dict[str, str]]:
+    """Return git log output parsed like git_log does."""
+    out = _git(repo, "log", "--pretty=format:%H%x1f%an%x1f%ae%x1f%aI%x1f%s", *args)
+    keys = ("hash", "author_name", "author_email", "date", "subject")
+    return [dict(zip(keys, line.split("\x1f"))) for line in out.splitlines()]
+
+
+@pytest.mark.parametrize("rev", [None, "HEAD~1", "main^", "v1", "v2", "feature"])
+def test_read_log_matches_git_cli(repo: Path, rev: str | None) -> None:
+    """Verify in-process log output equals git log output."""
+    served = read_log(repo, rev=rev, max_count=10)
+    expected = _cli_log(repo, "-n", "10", *([rev] if rev else []))
+    assert served == expected
+
+
+@pytest.mark.parametrize("rev", ["HEAD~1..HEAD", "does-not-exist", "HEAD~9"])
+def test_read_log_unsupported_or_unknown_falls_back(repo: Path, rev: str) -> None:
+    """Verify ranges and unknown revisions return None for git fallback."""
+    assert read_log(repo, rev=rev, max_count=5) is None
+
+
+def test_abbreviated_sha_is_left_to_git(repo: Path) -> None:
+    """Verify short object ids are not resolved in-process."""
+    short = _git(repo, "rev-parse", "--short", "HEAD").strip()
+    assert read_log(repo, rev=short, max_count=1) is None
+
+
+def test_branches_and_tags_match_git_cli(repo: Path) -> None:
+    """Verify local branch and tag listings equal the git CLI."""
+    assert read_local_branches(repo) == [
+        {"name": "feature", "current": False},
+        {"name": "main", "current": True},
+    ]
+    assert read_tag_names(repo) == _git(repo, "tag", "--list").split()
+    assert read_tag_names(repo, "v1*") == ["v1"]
+
+
+def test_detached_head_branch_listing_falls_back(repo: Path) -> None:
+    """Verify a detached HEAD is left to git branch."""
+    _git(repo, "checkout", "--detach", "HEAD~1")
+    assert read_local_branches(repo) is None
+
+
+def test_blob_diff_matches_git_cli(repo: Path) -> None:
+    """Verify a single-file diff between commits equals git diff."""
+    served = read_blob_diff(
+        repo, rev_from="HEAD~2", rev_to="HEAD", file_path="notes.txt"
+    )
+    assert served == _git(repo, "diff", "HEAD~2", "HEAD", "--", "notes.txt")
+    assert (
+        read_blob_diff(repo, rev_from="HEAD", rev_to="HEAD", file_path="notes.txt")
+        == ""
+    )
+    assert (
+        read_blob_diff(repo, rev_from="HEAD~1", rev_to="HEAD", file_path="*.txt")
+        is None
+    )
+
+
+def test_has_commits(repo: Path, tmp_path_factory: pytest.TempPathFactory) -> None:
+    """Verify HEAD presence is detected in-process."""
+    empty = tmp_path_factory.mktemp("empty")
+    _git(empty, "init")
+    assert has_commits(repo) is True
+    assert has_commits(empty) is False
+    assert has_commits(tmp_path_factory.mktemp("plain")) is None
+
+
+def test_handle_reopened_when_git_dir_changes(repo: Path) -> None:
+    """Verify the handle cache follows .git fingerprint changes."""
+    assert read_tag_names(repo) == ["v1", "v2"]
+    first = inprocess_read._handles[str(repo)][1]
+    _git(repo, "tag", "v3")
+    (repo / ".git" / "touch-marker").write_text("x", encoding="utf-8")
+    assert read_tag_names(repo) == ["v1", "v2", "v3"]
+    assert inprocess_read._handles[str(repo)][1] is not first
+
+
+def test_ensure_local_repo_memoizes_work_tree_probe(
+    repo: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Verify the rev-parse probe runs once per .git fingerprint."""
+    calls: List[Any] = []
+    real_run_git = git_common.run_git
+
+    def counting_run_git(root_dir: str, args: list[str], timeout_seconds: int = 60):
+        calls.append(args)
+        return real_run_git(root_dir, args, timeout_seconds)
+
+    monkeypatch.setattr(git_common, "run_git", counting_run_git)
+    monkeypatch.setattr(git_common, "_work_tree_probe_cache", {})
+    assert git_common.ensure_local_repo(str(repo)) is None
+    assert git_common.ensure_local_repo(str(repo)) is None
+    assert calls == [["rev-parse", "--is-inside-work-tree"]]
@@ -25,6 +25,8 @@ class FakeDB:
 
     def execute(self, sql, params=None):
         """Execute the command."""
+        if "import_graph_" in sql:
+            return {"data": []}  # persisted graph starts empty; writes ignored
         key = "imports" if "FROM imports" in sql else "files"
         return {"data": list(self._t.get(key, []))}
 
@@ -0,0 +1,161 @@
+"""
+Tests for the persisted import graph and its incrementally maintained cycles.
+
+Author: Vasiliy Zdanovskiy
+email: vasilyvz@gmail.com
+"""
+
+from __future__ import annotations
+
+import random
+import sqlite3
+from typing import Any, Dict, List
+
+import pytest
+
+from code_analysis.core.import_graph import (
+    ImportGraphFile,
+    SccIndex,
+    find_cycles,
+    sync_import_graph,
+)
+
+_SCHEMA = """
+CREATE TABLE imports (file_id TEXT, name TEXT, module TEXT, import_type TEXT,
+    line INTEGER);
+CREATE TABLE files (id TEXT, project_id TEXT);
+CREATE TABLE import_graph_nodes (project_id TEXT, file_id TEXT, rel_path TEXT,
+    source_updated_at REAL, scc_id TEXT, UNIQUE (project_id, file_id));
+CREATE TABLE import_graph_edges (project_id TEXT, src_file_id TEXT,
+    ordinal INTEGER, module TEXT, name TEXT, import_type TEXT, kind TEXT,
+    resolved_module TEXT, target_file_id TEXT,
+    UNIQUE (project_id, src_file_id, ordinal));
+"""
+
+
+class _SqliteDb:
+    """``execute(sql, params) -> {"data": [...]}`` over an in-memory SQLite DB."""
+
+    def __init__(self) -> None:
+        self.conn = sqlite3.connect(":memory:")
+        self.conn.row_factory = sqlite3.Row
+        self.conn.executescript(_SCHEMA)
+        self.statements: List[str] = []
+
+    def execute(self, sql: str, params: tuple = ()) -> Dict[str, Any]:
+        self.statements.append(sql)
+        rows = self.conn.execute(sql, params).fetchall()
+        return {"data": [dict(r) for r in rows]}
+
+
+@pytest.fixture
+def db() -> _SqliteDb:
+    """pkg/a.py -> pkg/b.py -> pkg/c.py; c imports os."""
+    d = _SqliteDb()
+    d.conn.executescript(
+        """
+        INSERT INTO imports VALUES ('fa', 'X', 'pkg.b', 'from', 1);
+        INSERT INTO imports VALUES ('fb', 'Y', 'c', 'from', 1);
+        INSERT INTO imports VALUES ('fc', 'os', NULL, 'import', 1);
+        """
+    )
+    return d
+
+
+def _files(stamps: Dict[str, float], extra: Dict[str, str] | None = None) -> list:
+    rels = {"fa": "pkg/a.py", "fb": "pkg/b.py", "fc": "pkg/c.py", **(extra or {})}
+    return [ImportGraphFile(fid, rels[fid], stamps.get(fid, 1.0)) for fid in rels]
+
+
+def _reindex(db: _SqliteDb, file_id: str, rows: List[tuple]) -> None:
+    db.conn.execute("DELETE FROM imports WHERE file_id = ?", (file_id,))
+    for line, (module, name) in enumerate(rows, start=1):
+        db.conn.execute(
+            "INSERT INTO imports VALUES (?, ?, ?, 'from', ?)",
+            (file_id, name, module, line),
+        )
+
+
+def test_sync_persists_and_reuses_resolution(db: _SqliteDb) -> None:
+    """Verify the first sync resolves everything and an unchanged one reads only."""
+    graph = sync_import_graph(db, "p1", _files({}))
+    assert graph.refreshed_sources == 3
+    assert [(e.src_file_id, e.kind, e.target_file_id) for e in graph.imports] == [
+        ("fa", "project", "fb"),
+        ("fb", "project", "fc"),
+        ("fc", "stdlib", None),
+    ]
+    assert graph.component_of == {}
+
+    db.statements.clear()
+    again = sync_import_graph(db, "p1", _files({}))
+    assert again.refreshed_sources == 0
+    assert again.imports == graph.imports
+    assert not [s for s in db.statements if "FROM imports" in s]
+    assert not [s for s in db.statements if s.startswith(("INSERT", "DELETE"))]
+
+
+def test_reindex_merges_and_splits_cycle(db: _SqliteDb) -> None:
+    """Verify a re-indexed file closes, then opens, a cycle through the chain."""
+    sync_import_graph(db, "p1", _files({}))
+    _reindex(db, "fc", [("pkg.a", "Z")])
+    db.statements.clear()
+    graph = sync_import_graph(db, "p1", _files({"fc": 2.0}))
+    assert graph.refreshed_sources == 1
+    reads = [s for s in db.statements if "FROM imports" in s]
+    assert len(reads) == 1 and "IN (?)" in reads[0]
+    assert set(graph.component_of) == {"fa", "fb", "fc"}
+    assert len(set(graph.component_of.values())) == 1
+    assert [set(c) for c in graph.cycles()] == [{"fa", "fb", "fc"}]
+
+    persisted = sync_import_graph(db, "p1", _files({"fc": 2.0}), project_only=True)
+    assert persisted.component_of == graph.component_of
+
+    _reindex(db, "fc", [])
+    graph = sync_import_graph(db, "p1", _files({"fc": 3.0}))
+    assert graph.component_of == {}
+    assert graph.cycles() == []
+
+
+def test_added_file_reresolves_affected_importers(db: _SqliteDb) -> None:
+    """Verify a new file re-resolves only imports its path can now satisfy."""
+    sync_import_graph(db, "p1", _files({}))
+    # ``from os import path`` is stdlib until a project file os/path.py appears.
+    _reindex(db, "fc", [("os", "path")])
+    graph = sync_import_graph(db, "p1", _files({"fc": 2.0}))
+    assert graph.imports[-1].kind == "stdlib"
+
+    graph = sync_import_graph(db, "p1", _files({"fc": 2.0}, {"fd": "os/path.py"}))
+    # fd itself (new) and fc (its ``os.path`` now matches) are re-resolved.
+    assert graph.refreshed_sources == 2
+    fc_edge = [e for e in graph.imports if e.src_file_id == "fc"][0]
+    assert (fc_edge.kind, fc_edge.target_file_id) == ("project", "fd")
+
+    graph = sync_import_graph(db, "p1", _files({"fc": 2.0}))
+    fc_edge = [e for e in graph.imports if e.src_file_id == "fc"][0]
+    assert (fc_edge.kind, fc_edge.target_file_id) == ("stdlib", None)
+    nodes = db.conn.execute("SELECT file_id FROM import_graph_nodes").fetchall()
+    assert sorted(r["file_id"] for r in nodes) == ["fa", "fb", "fc"]
+
+
+def test_scc_index_matches_full_recompute() -> None:
+    """Verify random edge edits leave the same components as a fresh Tarjan run."""
+    rng = random.Random(7)
+    nodes = [f"n{i:02d}" for i in range(30)]
+    adjacency: Dict[str, set] = {n: set() for n in nodes}
+    index = SccIndex(adjacency)
+    for _ in range(300):
+        u, v = rng.choice(nodes), rng.choice(nodes)
+        if v in adjacency[u]:
+            adjacency[u].discard(v)
+            index.update(removed_edges=[(u, v)])
+        else:
+            adjacency[u].add(v)
+            index.update(added_edges=[(u, v)])
+        expected = {
+            n: min(cycle)
+            for cycle in find_cycles(adjacency)
+            if len(cycle) >= 2
+            for n in cycle
+        }
+        assert index.component_of() == expected
@@ -0,0 +1,154 @@
+"""
+Tests for lazy, manifest-backed command registration.
+
+Author: Vasiliy Zdanovskiy
+email: vasilyvz@gmail.com
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import sys
+import textwrap
+from pathlib import Path
+from typing import Any, Dict, Iterator
+
+import pytest
+
+from code_analysis.core.lazy_command_registry import (
+    LazyCommand,
+    build_command_manifest,
+    load_command_manifest,
+    package_fingerprint,
+    prewarm_lazy_commands,
+    register_lazy_commands,
+)
+
+_MODULE = "lazyfix_cmds.echo"
+
+_SOURCE = '''
+from mcp_proxy_adapter.commands.base import Command
+from mcp_proxy_adapter.commands.result import SuccessResult
+
+
+class EchoLazyCommand(Command):
+    """Echo the given text."""
+
+    name = "echo_lazy"
+    version = "1.0.0"
+    descr = "Echo text"
+    category = "test"
+    use_queue = True
+
+    @classmethod
+    def get_schema(cls):
+        return {
+            "type": "object",
+            "properties": {"text": {"type": "string"}},
+            "required": ["text"],
+            "additionalProperties": False,
+        }
+
+    @classmethod
+    def metadata(cls):
+        return {"name": cls.name, "description": cls.descr}
+
+    async def execute(self, text, **kwargs):
+        return SuccessResult(data={"echo": text})
+'''
+
+
+class _Registry:
+    """Minimal registry surface used by registration hooks."""
+
+    def __init__(self) -> None:
+        self._commands: Dict[str, Any] = {}
+        self._command_types: Dict[str, str] = {}
+
+    def register(self, cmd_cls: Any, cmd_type: str = "builtin") -> None:
+        self._commands[cmd_cls.name] = cmd_cls
+        self._command_types[cmd_cls.name] = cmd_type
+
+    def get_command(self, name: str) -> Any:
+        return self._commands[name]
+
+    def get_all_commands(self) -> Dict[str, Any]:
+        return dict(self._commands)
+
+
+def _forget_fixture_modules() -> None:
+    for name in [m for m in sys.modules if m.split(".")[0] == "lazyfix_cmds"]:
+        del sys.modules[name]
+
+
+@pytest.fixture
+def manifest_path(tmp_path: Path) -> Iterator[Path]:
+    """Write a manifest for a fixture command module, then unload the module."""
+    pkg = tmp_path / "lazyfix_cmds"
+    pkg.mkdir()
+    (pkg / "__init__.py").write_text("", encoding="utf-8")
+    (pkg / "echo.py").write_text(textwrap.dedent(_SOURCE), encoding="utf-8")
+    sys.path.insert(0, str(tmp_path))
+    try:
+        from lazyfix_cmds.echo import EchoLazyCommand
+
+        eager = _Registry()
+        eager.register(EchoLazyCommand, "custom")
+        manifest = build_command_manifest(
+            eager, fingerprint=package_fingerprint(), module_prefix="lazyfix_"
+        )
+        assert manifest is not None
+        path = tmp_path / "manifest.json"
+        path.write_text(json.dumps(manifest), encoding="utf-8")
+        _forget_fixture_modules()
+        yield path
+    finally:
+        _forget_fixture_modules()
+        sys.path.remove(str(tmp_path))
+
+
+def test_stub_serves_schema_without_import(manifest_path: Path) -> None:
+    """Verify the stub answers schema/metadata/attrs from the manifest."""
+    reg = _Registry()
+    assert register_lazy_commands(reg, manifest_path) is True
+    stub = reg.get_command("echo_lazy")
+    assert issubclass(stub, LazyCommand)
+    assert _MODULE not in sys.modules
+    assert stub.__module__ == _MODULE
+    assert stub.use_queue is True
+    assert stub.get_schema()["required"] == ["text"]
+    assert stub.metadata()["description"] == "Echo text"
+    assert reg._command_types["echo_lazy"] == "custom"
+
+
+def test_first_execute_imports_and_swaps_real_class(manifest_path: Path) -> None:
+    """Verify first invocation imports the module and re-registers the class."""
+    reg = _Registry()
+    register_lazy_commands(reg, manifest_path)
+    stub = reg.get_command("echo_lazy")
+    result = asyncio.run(stub().execute(text="hi"))
+    assert result.data == {"echo": "hi"}
+    assert _MODULE in sys.modules
+    real = reg.get_command("echo_lazy")
+    assert real is sys.modules[_MODULE].EchoLazyCommand
+    assert not issubclass(real, LazyCommand)
+    assert prewarm_lazy_commands(reg) == 0
+
+
+def test_prewarm_loads_pending_stubs(manifest_path: Path) -> None:
+    """Verify pre-warm imports every deferred module."""
+    reg = _Registry()
+    register_lazy_commands(reg, manifest_path)
+    assert prewarm_lazy_commands(reg) == 1
+    assert not issubclass(reg.get_command("echo_lazy"), LazyCommand)
+
+
+def test_stale_or_missing_manifest_falls_back(
+    manifest_path: Path, tmp_path: Path
+) -> None:
+    """Verify a fingerprint mismatch or missing file means eager registration."""
+    assert load_command_manifest(manifest_path, fingerprint="other") is None
+    reg = _Registry()
+    assert register_lazy_commands(reg, tmp_path / "missing.json") is False
+    assert reg._commands == {}
@@ -0,0 +1,169 @@
+"""
+Tests for the hot-path metrics registry and its Prometheus text export.
+
+Author: Vasiliy Zdanovskiy
+email: vasilyvz@gmail.com
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from code_analysis.commands.metrics_command import MetricsCommand
+from code_analysis.core.metrics import (
+    PhaseTimer,
+    collect_metrics,
+    inc,
+    observe,
+    publish_snapshot,
+    render_prometheus_text,
+    reset_metrics,
+    snapshot,
+    sql_fingerprint,
+)
+from code_analysis.core.metrics import registry
+from code_analysis.core.search_session.search_profile_log import (
+    SearchProfileRecorder,
+)
+
+SQL = "code_analysis_sql_statement_seconds"
+
+
+@pytest.fixture(autouse=True)
+def fresh_registry(monkeypatch):
+    """Enable metrics without a shared snapshot dir; start and end empty."""
+    monkeypatch.setattr(registry, "_enabled_override", True)
+    monkeypatch.setattr(registry, "_state_dir_override", None)
+    reset_metrics()
+    yield
+    reset_metrics()
+
+
+def _series(name: str) -> dict:
+    metric = snapshot()["metrics"].get(name) or {"series": []}
+    return {tuple(sorted(labels.items())): value for labels, value in metric["series"]}
+
+
+def test_histogram_buckets_sum_and_count() -> None:
+    """Verify observations land in the first bucket bounding them."""
+    observe(SQL, 0.003, statement="SELECT ?")
+    observe(SQL, 0.003, statement="SELECT ?")
+    observe(SQL, 1000.0, statement="SELECT ?")
+    hist = _series(SQL)[(("statement", "SELECT ?"),)]
+    assert hist["count"] == 3
+    assert hist["sum"] == pytest.approx(1000.006)
+    assert hist["buckets"][registry.LATENCY_BUCKETS.index(0.005)] == 2
+    assert sum(hist["buckets"]) == 2  # 1000s only counts in +Inf
+
+
+def test_series_cap_folds_into_other(monkeypatch) -> None:
+    """Verify label sets beyond the cap share one overflow series."""
+    monkeypatch.setattr(registry, "MAX_SERIES_PER_METRIC", 3)
+    for i in range(6):
+        inc("code_analysis_sql_errors_total", statement=f"s{i}")
+    series = _series("code_analysis_sql_errors_total")
+    assert len(series) == 4
+    assert series[(("statement", "other"),)] == 3.0
+
+
+def test_disabled_records_nothing(monkeypatch) -> None:
+    """Verify recording is a no-op when metrics are disabled."""
+    monkeypatch.setattr(registry, "_enabled_override", False)
+    inc("code_analysis_sql_errors_total", statement="x")
+    observe(SQL, 0.1, statement="x")
+    assert snapshot()["metrics"] == {}
+
+
+def test_phase_timer_records_each_phase() -> None:
+    """Verify consecutive phases are closed by the next enter and by close."""
+    timer = PhaseTimer("code_analysis_analyze_file_phase_seconds")
+    timer.enter("read")
+    timer.enter("parse")
+    timer.close()
+    timer.close()
+    series = _series("code_analysis_analyze_file_phase_seconds")
+    assert {k[0][1] for k in series} == {"read", "parse"}
+    assert all(v["count"] == 1 for v in series.values())
+
+
+def test_sql_fingerprint_normalises_literals_and_lists() -> None:
+    """Verify parameters and IN/VALUES lists do not split statement series."""
+    a = sql_fingerprint("SELECT * FROM files\n WHERE id IN (?, ?, ?) AND name = 'x'")
+    b = sql_fingerprint("SELECT * FROM files WHERE id IN (?, ?) AND name = 'y'")
+    assert a == b == "SELECT * FROM files WHERE id IN (...) AND name = ?"
+    assert sql_fingerprint("INSERT INTO t (a) VALUES (?), (?)") == (
+        "INSERT INTO t (a) VALUES (?)"
+    )
+    assert sql_fingerprint("SELECT x FROM t WHERE y = $1 LIMIT 10") == (
+        "SELECT x FROM t WHERE y = ? LIMIT ?"
+    )
+
+
+def test_render_merges_live_peers_and_drops_dead(tmp_path: Path) -> None:
+    """Verify peer snapshots are summed and dead processes' files removed."""
+    observe(SQL, 0.002, statement="SELECT ?")
+    peer = snapshot()
+    peer["pid"] = os.getppid()
+    (tmp_path / f"{os.getppid()}.json").write_text(json.dumps(peer))
+    dead = subprocess.run(
+        [sys.executable, "-c", "import os; print(os.getpid())"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    dead_file = tmp_path / f"{int(dead.stdout)}.json"
+    dead_file.write_text(json.dumps(peer))
+
+    merged = collect_metrics(tmp_path)
+    hist = merged[SQL]["series"][(("statement", "SELECT ?"),)]
+    assert hist["count"] == 2
+    assert not dead_file.exists()
+
+    text = render_prometheus_text(merged)
+    assert f"# TYPE {SQL} histogram" in text
+    assert f'{SQL}_bucket{{statement="SELECT ?",le="0.0025"}} 2' in text
+    assert f'{SQL}_bucket{{statement="SELECT ?",le="+Inf"}} 2' in text
+    assert f'{SQL}_count{{statement="SELECT ?"}} 2' in text
+
+
+def test_publish_snapshot_writes_pid_file(tmp_path: Path, monkeypatch) -> None:
+    """Verify the snapshot is published atomically under the state dir."""
+    monkeypatch.setattr(registry, "_state_dir_override", tmp_path)
+    inc("code_analysis_pool_timeouts_total", lane="write")
+    path = publish_snapshot()
+    assert path == tmp_path / f"{os.getpid()}.json"
+    data = json.loads(path.read_text())
+    assert data["metrics"]["code_analysis_pool_timeouts_total"]["series"] == [
+        [{"lane": "write"}, 1.0]
+    ]
+    assert list(tmp_path.glob("*.tmp")) == []
+
+
+def test_search_checkpoint_records_phase_even_when_log_disabled(
+    tmp_path: Path,
+) -> None:
+    """Verify checkpoint phase durations reach the metrics without the JSONL log."""
+    recorder = SearchProfileRecorder(
+        job_id="j", log_path=tmp_path / "p.jsonl", enabled=False
+    )
+    recorder.checkpoint("semantic_backend_done", backend_sec=0.2, rows=3)
+    recorder.checkpoint("cross_run_start")
+    series = _series("code_analysis_search_phase_seconds")
+    assert list(series) == [(("phase", "semantic_backend_done"), ("scope", "project"))]
+    assert not (tmp_path / "p.jsonl").exists()
+
+
+@pytest.mark.asyncio
+async def test_metrics_command_returns_prometheus_text() -> None:
+    """Verify the command returns the rendered text and series count."""
+    inc("code_analysis_analyze_file_total", outcome="success")
+    result = await MetricsCommand().execute()
+    data = result.to_dict()["data"]
+    assert data["series_count"] == 1
+    assert 'code_analysis_analyze_file_total{outcome="success"} 1' in data["text"]
@@ -0,0 +1,137 @@
+"""
+Tests for the long-lived mypy daemon behind the type checker.
+
+Author: Vasiliy Zdanovskiy
+email: vasilyvz@gmail.com
+"""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+
+from code_analysis.core.code_quality import mypy_daemon
+from code_analysis.core.code_quality.tool_runtime import is_tool_available
+from code_analysis.core.code_quality.type_checker import (
+    _daemon_config,
+    type_check_project_with_mypy,
+    type_check_with_mypy,
+)
+
+
+@pytest.fixture
+def daemon_enabled(tmp_path, monkeypatch):
+    """Enable daemons with a private state dir; stop them afterwards."""
+    monkeypatch.setattr(mypy_daemon, "_enabled_override", True)
+    monkeypatch.setattr(mypy_daemon, "_state_dir_override", tmp_path / "state")
+    monkeypatch.setattr(mypy_daemon, "_idle_timeout_override", 120.0)
+    yield tmp_path / "state"
+    mypy_daemon.shutdown_mypy_daemons()
+
+
+@pytest.mark.skipif(not is_tool_available("mypy"), reason="mypy not installed")
+def test_daemon_rechecks_dependents_incrementally(tmp_path, daemon_enabled) -> None:
+    """Verify a warm daemon sees an edit to an imported module."""
+    proj = tmp_path / "proj"
+    proj.mkdir()
+    (proj / "pyproject.toml").write_text("")
+    (proj / "a.py").write_text("def f(x: int) -> str:\n    return str(x)\n")
+    (proj / "b.py").write_text("from a import f\n\ny: int = f(1)\n")
+
+    ok, err, errs = type_check_with_mypy(proj / "b.py")
+    assert (ok, err) == (False, "Found 1 mypy errors")
+    assert len(errs) == 1 and "b.py:3: error:" in errs[0]
+
+    (proj / "a.py").write_text("def f(x: int) -> int:\n    return x\n")
+    with patch.object(
+        mypy_daemon.MypyDaemon, "_start", side_effect=AssertionError("restarted")
+    ):
+        assert type_check_with_mypy(proj / "b.py") == (True, None, [])
+        ok, per_file = type_check_project_with_mypy(proj)
+    assert (ok, per_file) == (True, {})
+    assert list(daemon_enabled.iterdir())  # one state dir per root + config
+
+
+@pytest.mark.skipif(not is_tool_available("mypy"), reason="mypy not installed")
+def test_warm_daemon_reports_syntax_errors(tmp_path, daemon_enabled) -> None:
+    """Verify a blocking error from a warm daemon is a result, not a dead daemon."""
+    proj = tmp_path / "proj"
+    proj.mkdir()
+    (proj / "pyproject.toml").write_text("")
+    (proj / "ok.py").write_text("x = 1\n")
+    (proj / "bad.py").write_text("def (:\n")
+
+    assert type_check_with_mypy(proj / "ok.py") == (True, None, [])
+    with (
+        patch.object(
+            mypy_daemon.MypyDaemon, "_start", side_effect=AssertionError("restarted")
+        ),
+        patch(
+            "code_analysis.core.code_quality.type_checker._type_check_with_subprocess",
+            side_effect=AssertionError("fell back to one-shot"),
+        ),
+    ):
+        ok, err, errs = type_check_with_mypy(proj / "bad.py")
+    assert (ok, err) == (False, "Found 1 mypy errors")
+    assert len(errs) == 1 and "Invalid syntax" in errs[0]
+
+
+def test_file_outside_project_uses_subprocess(tmp_path, daemon_enabled) -> None:
+    """Verify files without a project root never start a daemon."""
+    scratch = tmp_path / "scratch.py"
+    scratch.write_text("x = 1\n")
+    with (
+        patch(
+            "code_analysis.core.code_quality.type_checker.daemon_root_for",
+            return_value=None,
+        ),
+        patch(
+            "code_analysis.core.code_quality.type_checker._type_check_with_subprocess",
+            return_value=(True, None, []),
+        ) as one_shot,
+        patch.object(mypy_daemon.MypyDaemon, "check") as check,
+    ):
+        assert type_check_with_mypy(scratch) == (True, None, [])
+    one_shot.assert_called_once()
+    check.assert_not_called()
+
+
+def test_unusable_daemon_falls_back_to_subprocess(tmp_path, daemon_enabled) -> None:
+    """Verify a daemon that cannot answer leaves the one-shot run in charge."""
+    (tmp_path / "setup.py").write_text("")
+    target = tmp_path / "m.py"
+    target.write_text("x = 1\n")
+    with (
+        patch.object(mypy_daemon.MypyDaemon, "check", return_value=None),
+        patch(
+            "code_analysis.core.code_quality.type_checker._type_check_with_subprocess",
+            return_value=(False, "Mypy not installed", []),
+        ) as one_shot,
+    ):
+        assert type_check_with_mypy(target) == (False, "Mypy not installed", [])
+    one_shot.assert_called_once()
+
+
+def test_idle_daemons_are_reaped(tmp_path, daemon_enabled) -> None:
+    """Verify daemons unused past their idle timeout are stopped and dropped."""
+    busy = mypy_daemon.get_mypy_daemon(tmp_path, "[mypy]\n", ".ini")
+    idle = mypy_daemon.get_mypy_daemon(tmp_path, "[mypy]\nstrict = True\n", ".ini")
+    assert busy is not idle
+    assert mypy_daemon.get_mypy_daemon(tmp_path, "[mypy]\n", ".ini") is busy
+    idle.last_used -= 1000
+    with patch.object(mypy_daemon.MypyDaemon, "stop") as stop:
+        assert mypy_daemon.reap_idle_mypy_daemons() == 1
+    stop.assert_called_once()
+    assert mypy_daemon.get_mypy_daemon(tmp_path, "[mypy]\n", ".ini") is busy
+
+
+def test_daemon_config_is_single_file_scoped(tmp_path) -> None:
+    """Verify files/modules are stripped for per-file daemons only."""
+    cfg = tmp_path / "mypy.ini"
+    cfg.write_text("[mypy]\nfiles = pkg\nstrict = True\n")
+    text, suffix = _daemon_config(cfg, single_file=True)
+    assert suffix == ".ini"
+    assert "files" not in text and "strict = True" in text
+    assert _daemon_config(cfg, single_file=False) == (cfg.read_text(), ".ini")
+    assert _daemon_config(None, single_file=True)[1] == ".ini"
@@ -353,31 +353,33 @@ def test_entity_cross_ref_delete_has_no_sqlite_only_dml() -> None:
 
 
 def test_entity_cross_ref_builder_selects_have_no_sqlite_only_dml() -> None:
-    """Every read statement in entity_cross_ref_builder.py (resolve_caller,
-    resolve_callee, and the newer inheritance-resolution helpers) is plain
+    """Every read statement in entity_cross_ref_builder.py / entity_cross_ref_index.py
+    (span index, callee name map, resolve_callee, inheritance rows) is plain
     portable SQL - _adapt_sqlite_dml_for_postgres must not need to (and does
     not) rewrite any of them."""
     statements = [
-        # resolve_caller
+        # EntitySpanIndex.load
         "SELECT m.id, m.line, m.end_line FROM methods m "
         "JOIN classes c ON m.class_id = c.id WHERE c.file_id = ?",
         "SELECT id, line, end_line FROM functions WHERE file_id = ?",
         "SELECT id, line, end_line FROM classes WHERE file_id = ?",
+        # ProjectEntityNames.load
+        "SELECT c.id, c.file_id, c.name FROM classes c "
+        "JOIN files f ON c.file_id = f.id WHERE f.project_id = ? AND c.name IN (?,?)",
+        "SELECT m.id, c.file_id, c.name AS class_name, m.name FROM methods m "
+        "JOIN classes c ON m.class_id = c.id JOIN files f ON c.file_id = f.id "
+        "WHERE f.project_id = ? AND m.name IN (?)",
         # resolve_callee ("class" branch - the ORDER BY boolean expression is
         # standard PostgreSQL, not a SQLite-ism, and needs no rewriting)
         "SELECT c.id FROM classes c JOIN files f ON c.file_id = f.id "
         "WHERE f.project_id = ? AND c.name = ? ORDER BY (c.file_id = ?) DESC",
-        # _resolve_unique_base_class_id
-        "SELECT c.id FROM classes c JOIN files f ON c.file_id = f.id "
-        "WHERE f.project_id = ? AND c.name = ?",
-        # _inherit_edge_exists
-        "SELECT 1 FROM entity_cross_ref WHERE caller_class_id = ? "
-        "AND callee_class_id = ? AND ref_type = 'inherit'",
-        # _backfill_children_inheritance_for_class
-        "SELECT c.id, c.file_id, c.line, c.bases FROM classes c "
-        "JOIN files f ON c.file_id = f.id WHERE f.project_id = ? AND c.id != ?",
-        # _add_inheritance_cross_ref_for_file
+        # _inheritance_cross_ref_rows
         "SELECT id, name, line, bases FROM classes WHERE file_id = ?",
+        "SELECT c.id, c.file_id, c.name, c.line, c.bases FROM classes c "
+        "JOIN files f ON c.file_id = f.id WHERE f.project_id = ?",
+        "SELECT caller_class_id, callee_class_id FROM entity_cross_ref "
+        "WHERE ref_type = 'inherit' AND (caller_class_id IN (?) "
+        "OR callee_class_id IN (?))",
     ]
     for raw in statements:
         adapted = _adapt_sqlite_dml_for_postgres(raw)
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from code_analysis.core.database_driver_pkg.drivers.postgres_execute_lane import (
     postgres_batch_requires_write_pool,
+    postgres_execute_requires_autocommit,
     postgres_execute_requires_write_pool,
 )
 
@@ -57,3 +58,15 @@ def test_execute_multistatement_write_detected() -> None:
 def test_comment_stripped_before_classify() -> None:
     """Verify test comment stripped before classify."""
     assert postgres_execute_requires_write_pool("-- hint\nSELECT 1") is False
+
+
+def test_concurrent_index_ddl_requires_autocommit() -> None:
+    """Verify CONCURRENTLY statements are routed outside a transaction."""
+    assert (
+        postgres_execute_requires_autocommit(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS i ON t USING hnsw (v)"
+        )
+        is True
+    )
+    assert postgres_execute_requires_autocommit("CREATE INDEX i ON t (v)") is False
+    assert postgres_execute_requires_autocommit("-- CONCURRENTLY\nSELECT 1") is False
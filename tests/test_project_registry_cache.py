@@ -0,0 +1,237 @@
+"""
+Tests for the command-preamble project registry cache and its NOTIFY triggers.
+
+Author: Vasiliy Zdanovskiy
+email: vasilyvz@gmail.com
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from code_analysis.core import project_registry_cache as prc
+from code_analysis.core.database.migrations.project_registry_notify_triggers import (
+    NOTIFY_TABLES,
+    migrate_project_registry_notify_triggers,
+)
+from code_analysis.core.project_exclusive_lock import (
+    acquire_project_exclusive_lock,
+    get_project_exclusive_lock,
+)
+
+PID = "11111111-2222-4333-8444-555555555555"
+
+
+@pytest.fixture(autouse=True)
+def _reset_cache(monkeypatch: pytest.MonkeyPatch) -> Any:
+    monkeypatch.setattr(prc, "_enabled_override", True)
+    monkeypatch.setattr(prc, "_ttl_override", None)
+    monkeypatch.setattr(prc, "_fallback_ttl_override", None)
+    monkeypatch.setattr(prc, "_listener_connected", True)
+    prc.clear_project_registry_cache()
+    yield
+    prc.clear_project_registry_cache()
+
+
+class _Counter:
+    def __init__(self, value: Any = "v") -> None:
+        self.calls = 0
+        self.value = value
+
+    def __call__(self) -> Any:
+        self.calls += 1
+        return self.value
+
+
+def test_disabled_cache_always_reads_through(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Verify the loader runs on every call when the cache is off."""
+    monkeypatch.setattr(prc, "_enabled_override", False)
+    load = _Counter()
+    prc.cached_project_lookup("lock", PID, load)
+    prc.cached_project_lookup("lock", PID, load)
+    assert load.calls == 2
+
+
+def test_notifications_invalidate_one_project_or_all() -> None:
+    """Verify a project payload drops that project and a watch-dir payload drops all."""
+    load_a, load_b = _Counter(), _Counter()
+    prc.cached_project_lookup("root", PID, load_a)
+    prc.cached_project_lookup("root", "other", load_b)
+    prc.cached_project_lookup("root", PID, load_a)
+    assert (load_a.calls, load_b.calls) == (1, 1)
+
+    prc.handle_notification(json.dumps({"table": "projects", "project_id": PID}))
+    prc.cached_project_lookup("root", PID, load_a)
+    prc.cached_project_lookup("root", "other", load_b)
+    assert (load_a.calls, load_b.calls) == (2, 1)
+
+    prc.handle_notification(
+        json.dumps({"table": "watch_dir_paths", "op": "UPDATE", "project_id": None})
+    )
+    prc.cached_project_lookup("root", PID, load_a)
+    prc.cached_project_lookup("root", "other", load_b)
+    assert (load_a.calls, load_b.calls) == (3, 2)
+
+
+def test_ttl_falls_back_when_listener_is_down(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Verify entries expire after the fallback TTL without a listener."""
+    monkeypatch.setattr(prc, "_listener_connected", False)
+    monkeypatch.setattr(prc, "_fallback_ttl_override", 0.0)
+    load = _Counter()
+    prc.cached_project_lookup("lock", PID, load)
+    prc.cached_project_lookup("lock", PID, load)
+    assert load.calls == 2
+
+
+def test_invalidation_during_load_is_not_stored() -> None:
+    """Verify a value loaded across an invalidation is not cached."""
+    calls: List[int] = []
+
+    def racing_loader() -> str:
+        calls.append(1)
+        if len(calls) == 1:
+            prc.invalidate_project(PID)
+        return "stale" if len(calls) == 1 else "fresh"
+
+    assert prc.cached_project_lookup("record", PID, racing_loader) == "stale"
+    assert prc.cached_project_lookup("record", PID, racing_loader) == "fresh"
+    assert prc.cached_project_lookup("record", PID, racing_loader) == "fresh"
+    assert len(calls) == 2
+
+
+def test_none_is_not_cached_when_requested() -> None:
+    """Verify a not-found project is looked up again next time."""
+    load = _Counter(None)
+    prc.cached_project_lookup("project", PID, load, cache_none=False)
+    prc.cached_project_lookup("project", PID, load, cache_none=False)
+    assert load.calls == 2
+
+
+class _LockDb:
+    def __init__(self) -> None:
+        self.rows: Dict[str, Dict[str, Any]] = {}
+        self.selects = 0
+
+    def select(self, table: str, where: Dict[str, Any]) -> List[Dict[str, Any]]:
+        self.selects += 1
+        row = self.rows.get(where["project_id"])
+        return [row] if row else []
+
+    def execute(
+        self, sql: str, params: tuple, transaction_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        self.rows[params[0]] = {
+            "project_id": params[0],
+            "locked_at": params[1],
+            "owner": params[2],
+            "reason": params[3],
+        }
+        return {"affected_rows": 1}
+
+
+def test_cached_lock_lookup_sees_local_acquire() -> None:
+    """Verify acquiring a lock in this process invalidates the cached state."""
+    db = _LockDb()
+
+    def cached_lock() -> Optional[Dict[str, Any]]:
+        return prc.cached_project_lookup(
+            "lock", PID, lambda: get_project_exclusive_lock(db, PID)
+        )
+
+    assert cached_lock() is None
+    assert cached_lock() is None
+    assert db.selects == 1
+    acquire_project_exclusive_lock(db, PID, "rename_project:x", "test")
+    lock = cached_lock()
+    assert lock is not None and lock["owner"] == "rename_project:x"
+    assert cached_lock() == lock
+    assert db.selects == 2
+
+
+def test_lookup_scope_memoizes_even_when_cache_disabled(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Verify a lookup scope resolves a project once and honours invalidation."""
+    monkeypatch.setattr(prc, "_enabled_override", False)
+    load = _Counter()
+    with prc.project_lookup_scope():
+        prc.cached_project_lookup("root", PID, load)
+        with prc.project_lookup_scope():
+            prc.cached_project_lookup("root", PID, load)
+        assert load.calls == 1
+        prc.invalidate_project(PID)
+        prc.cached_project_lookup("root", PID, load)
+        assert load.calls == 2
+    prc.cached_project_lookup("root", PID, load)
+    assert load.calls == 3
+
+
+def test_migration_creates_function_and_triggers() -> None:
+    """Verify the migration installs one notify function and a trigger per table."""
+
+    class _Adapter:
+        def __init__(self) -> None:
+            self.sql: List[str] = []
+            self.commits = 0
+
+        def _execute(self, sql: str, params: Any = None) -> None:
+            self.sql.append(sql)
+
+        def _commit(self) -> None:
+            self.commits += 1
+
+    adapter = _Adapter()
+    migrate_project_registry_notify_triggers(adapter)
+    assert prc.NOTIFY_CHANNEL in adapter.sql[0]
+    creates = [s for s in adapter.sql if s.startswith("CREATE TRIGGER")]
+    assert [s.split(" ON ")[1].split()[0] for s in creates] == list(NOTIFY_TABLES)
+    assert adapter.commits == 1
+
+
+class _ListenConn:
+    """Fake autocommit connection answering LISTEN and the pg_trigger query."""
+
+    def __init__(self, listener: prc.ProjectRegistryListener, rows: List[Any]):
+        self.listener = listener
+        self.rows = rows
+        self.connected_seen: List[bool] = []
+        self.sql: List[str] = []
+
+    def execute(self, sql: str, params: Any = None) -> "_ListenConn":
+        self.sql.append(sql)
+        return self
+
+    def fetchall(self) -> List[Any]:
+        return self.rows
+
+    def notifies(self, timeout: float) -> List[Any]:
+        self.connected_seen.append(prc._listener_connected)
+        self.listener._stop.set()
+        return []
+
+    def close(self) -> None:
+        pass
+
+
+@pytest.mark.parametrize("installed", [True, False])
+def test_listener_extends_ttl_only_with_triggers_installed(
+    monkeypatch: pytest.MonkeyPatch, installed: bool
+) -> None:
+    """Verify a LISTEN without the notify triggers keeps the fallback TTL."""
+    import psycopg
+
+    monkeypatch.setattr(prc, "_listener_connected", False)
+    listener = prc.ProjectRegistryListener({}, reconnect_delay_sec=0.0)
+    rows = [(f"{t}_registry_notify", t) for t in NOTIFY_TABLES]
+    conn = _ListenConn(listener, rows if installed else rows[:1])
+    monkeypatch.setattr(psycopg, "connect", lambda **kwargs: conn)
+
+    listener._run()
+
+    assert conn.sql[0] == f"LISTEN {prc.NOTIFY_CHANNEL}"
+    assert "pg_trigger" in conn.sql[1]
+    assert conn.connected_seen == [installed]
+    assert prc._listener_connected is False
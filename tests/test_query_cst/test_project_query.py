@@ -0,0 +1,86 @@
+"""
+Tests for query_cst command - project-wide query (file_path omitted).
+
+Author: Vasiliy Zdanovskiy
+email: vasilyvz@gmail.com
+"""
+
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from code_analysis.commands.base_mcp_command import BaseMCPCommand
+from code_analysis.commands.query_cst_command import QueryCSTCommand
+from tests.test_query_cst.helpers import (
+    assert_error_result,
+    assert_success_result,
+    write_py_file,
+)
+
+
+class TestQueryCSTCommandProjectQuery:
+    """Test query_cst over every indexed file of a project."""
+
+    async def _run(self, project_root, mock_db, **params):
+        files = [
+            SimpleNamespace(path=str(project_root / "a.py"), relative_path="a.py"),
+            SimpleNamespace(path="pkg/b.py", relative_path="pkg/b.py"),
+            SimpleNamespace(path="broken.py", relative_path="broken.py"),
+            SimpleNamespace(path="notes.txt", relative_path="notes.txt"),
+        ]
+        with (
+            patch.object(
+                BaseMCPCommand, "_resolve_project_root", return_value=project_root
+            ),
+            patch.object(
+                BaseMCPCommand, "_open_database_from_config", return_value=mock_db
+            ),
+            patch(
+                "code_analysis.commands.query_cst_handler.get_project_files",
+                return_value=files,
+            ),
+        ):
+            return await QueryCSTCommand().execute(project_id="test-proj", **params)
+
+    @pytest.fixture(autouse=True)
+    def _sources(self, project_root):
+        write_py_file(project_root / "a.py", "def foo():\n    return 1\n")
+        write_py_file(
+            project_root / "pkg" / "b.py",
+            "class C:\n    def foo(self):\n        return 2\n\ndef bar():\n    pass\n",
+        )
+        write_py_file(project_root / "broken.py", "def (:\n")
+
+    @pytest.mark.asyncio
+    async def test_matches_carry_file_path(self, project_root, mock_db):
+        """Verify matches from all indexed .py files are returned in order."""
+        result = await self._run(project_root, mock_db, selector='Def:*[name="foo"]')
+        assert_success_result(result)
+        data = result.data
+        assert [(m["file_path"], m["qualname"]) for m in data["matches"]] == [
+            ("a.py", "foo"),
+            ("pkg/b.py", "C.foo"),
+        ]
+        assert data["files_total"] == 3
+        assert data["files_scanned"] == 3
+        assert [f["file_path"] for f in data["files_failed"]] == ["broken.py"]
+        assert data["truncated"] is False
+
+    @pytest.mark.asyncio
+    async def test_max_results_stops_early(self, project_root, mock_db):
+        """Verify collection stops once max_results matches are gathered."""
+        result = await self._run(project_root, mock_db, selector="Def:*", max_results=1)
+        assert_success_result(result)
+        assert len(result.data["matches"]) == 1
+        assert result.data["truncated"] is True
+        assert result.data["files_scanned"] == 2
+
+    @pytest.mark.asyncio
+    async def test_replace_requires_file_path(self, project_root, mock_db):
+        """Verify replace mode without file_path is rejected."""
+        result = await self._run(
+            project_root, mock_db, selector="function", replace_with="pass"
+        )
+        assert_error_result(result)
+        assert result.code == "CST_QUERY_MISSING_FILE_PATH"
@@ -0,0 +1,156 @@
+"""
+Tests for the background query journal writer and replay of its segments.
+
+Author: Vasiliy Zdanovskiy
+email: vasilyvz@gmail.com
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+from typing import Any, List, Tuple
+
+import pytest
+
+from code_analysis.core.config_validator.section_database_driver import (
+    _validate_driver_query_log_config,
+)
+from code_analysis.core.database_driver_pkg.query_journal import (
+    journal_blob_dir,
+    journal_segments,
+    replay_journal,
+)
+from code_analysis.core.database_driver_pkg.query_journal_async import (
+    AsyncQueryJournal,
+)
+
+
+def _replay_all(journal: Path) -> Tuple[List[Tuple[str, Any]], int]:
+    """Replay every segment oldest first; return calls and dropped count."""
+    calls: List[Tuple[str, Any]] = []
+    dropped = 0
+    for segment in journal_segments(journal):
+        result = replay_journal(segment, lambda sql, p: calls.append((sql, p)))
+        assert result["failed"] == 0, result["errors"]
+        dropped += result["dropped"]
+    return calls, dropped
+
+
+def test_async_journal_round_trips_through_replay(tmp_path: Path) -> None:
+    """Verify entries (including failed ones) are written in order."""
+    journal = tmp_path / "q.jsonl"
+    qj = AsyncQueryJournal(journal)
+    for i in range(50):
+        qj.write("INSERT INTO t VALUES (?, ?)", params=[i, "x"])
+    qj.write("SELECT broken", success=False, error="boom")
+    qj.write("UPDATE t SET v = %(v)s", params={"v": 1}, transaction_id="tx")
+    qj.close()
+    calls, _ = _replay_all(journal)
+    assert calls[:2] == [
+        ("INSERT INTO t VALUES (?, ?)", (0, "x")),
+        ("INSERT INTO t VALUES (?, ?)", (1, "x")),
+    ]
+    assert len(calls) == 51
+    assert calls[-1] == ("UPDATE t SET v = %(v)s", {"v": 1})
+    assert qj.stats()["written"] == 52
+
+
+def test_large_params_are_stored_once_by_content_hash(tmp_path: Path) -> None:
+    """Verify big strings go to the blob dir and replay reads them back."""
+    journal = tmp_path / "q.jsonl"
+    source = "x = 1\n" * 100
+    qj = AsyncQueryJournal(journal, blob_min_bytes=256)
+    qj.write("INSERT INTO cst_trees (code) VALUES (?)", params=(source,))
+    qj.write("INSERT INTO cst_trees (code) VALUES (?)", params=(source,))
+    qj.write("INSERT INTO t VALUES (?)", params=("small",))
+    qj.close()
+    assert source not in journal.read_text(encoding="utf-8")
+    assert qj.stats()["blobs_written"] == 1
+    assert len(list(journal_blob_dir(journal).rglob("*"))) == 2  # shard + blob
+    calls, _ = _replay_all(journal)
+    assert [p for _, p in calls] == [(source,), (source,), ("small",)]
+
+
+def test_rotation_by_byte_counter_keeps_replayable_segments(tmp_path: Path) -> None:
+    """Verify size-based rotation, backup pruning and segment order."""
+    journal = tmp_path / "q.jsonl"
+    qj = AsyncQueryJournal(journal, max_bytes=400, backup_count=3)
+    for i in range(40):
+        qj.write("INSERT INTO t VALUES (?)", params=[i])
+        if i % 5 == 4:
+            while qj.stats()["pending"]:
+                time.sleep(0.001)
+    qj.close()
+    segments = journal_segments(journal)
+    assert [s.name for s in segments] == [
+        "q.jsonl.3",
+        "q.jsonl.2",
+        "q.jsonl.1",
+        "q.jsonl",
+    ]
+    values = [p[0] for _, p in _replay_all(journal)[0]]
+    assert values == sorted(values)
+    assert values[-1] == 39
+
+
+def test_drop_policy_records_gap_marker(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Verify a full buffer drops records and replay reports the gap."""
+    journal = tmp_path / "q.jsonl"
+    release = threading.Event()
+    original = AsyncQueryJournal._write_batch
+
+    def _slow_write_batch(self: AsyncQueryJournal, *args: Any) -> None:
+        release.wait(5)
+        original(self, *args)
+
+    monkeypatch.setattr(AsyncQueryJournal, "_write_batch", _slow_write_batch)
+    qj = AsyncQueryJournal(journal, buffer_size=1, full_policy="drop")
+    qj.write("SELECT 1")
+    while qj.stats()["pending"]:
+        time.sleep(0.001)
+    qj.write("SELECT 2")
+    qj.write("SELECT 3")
+    release.set()
+    qj.close()
+    calls, dropped = _replay_all(journal)
+    assert [sql for sql, _ in calls] == ["SELECT 1", "SELECT 2"]
+    assert dropped == 1
+    assert qj.stats()["dropped"] == 1
+
+
+def test_rotated_segments_can_be_zstd_compressed(tmp_path: Path) -> None:
+    """Verify compressed segments are produced and replayed."""
+    pytest.importorskip("zstandard")
+    journal = tmp_path / "q.jsonl"
+    qj = AsyncQueryJournal(journal, max_bytes=200, compress=True)
+    for i in range(10):
+        qj.write("INSERT INTO t VALUES (?)", params=[i])
+        while qj.stats()["pending"]:
+            time.sleep(0.001)
+    qj.close()
+    assert any(s.name.endswith(".zst") for s in journal_segments(journal))
+    values = [p[0] for _, p in _replay_all(journal)[0]]
+    assert values == list(range(10))
+
+
+def test_query_log_config_validation() -> None:
+    """Verify async journal driver keys are type-checked."""
+    results: List[Any] = []
+    _validate_driver_query_log_config(
+        {
+            "query_log_async": "yes",
+            "query_log_buffer_size": 0,
+            "query_log_full_policy": "spill",
+            "query_log_blob_min_bytes": 0,
+        },
+        results,
+    )
+    assert sorted(r.key for r in results) == [
+        "database.driver.config.query_log_async",
+        "database.driver.config.query_log_buffer_size",
+        "database.driver.config.query_log_full_policy",
+    ]
@@ -29,6 +29,7 @@ from code_analysis.commands.read_only_batch_whitelist import (
     READ_ONLY_BATCH_WHITELIST,
 )
 from code_analysis.core.list_pagination import MAX_LIST_PAGE_SIZE
+from code_analysis.core.shared_database import _SharedDatabaseProxy
 
 
 class _FakeRegistry:
@@ -321,6 +322,175 @@ async def test_file_output_with_nested_uuid_payload(tmp_path: Any) -> None:
     assert isinstance(first_item["id"], str)
 
 
+class _ProjectRegistry:
+    """Registry whose commands declare ``project_id`` and record their params."""
+
+    def __init__(self, seen: List[Dict[str, Any]], on_execute: Any = None) -> None:
+        """Initialize the instance."""
+        self._seen = seen
+        self._on_execute = on_execute
+
+    def get_command(self, name: str) -> type:
+        """Return get command."""
+        seen, on_execute = self._seen, self._on_execute
+
+        class _Cmd:
+            """Represent Cmd."""
+
+            @classmethod
+            def get_schema(cls) -> Dict[str, Any]:
+                """Return the command schema."""
+                return {"properties": {"project_id": {"type": "string"}}}
+
+            def validate_params(self, params: Any) -> Dict[str, Any]:
+                """Reject a missing project_id like a real schema would."""
+                if not params.get("project_id"):
+                    raise ValueError("project_id is required")
+                return dict(params)
+
+            async def execute(self, **kwargs: Any) -> SuccessResult:
+                """Execute the command."""
+                seen.append(kwargs)
+                if on_execute is not None:
+                    on_execute()
+                return SuccessResult(data={"project_id": kwargs["project_id"]})
+
+        return _Cmd
+
+
+@pytest.mark.asyncio
+async def test_batch_project_id_is_inherited_and_errors_stay_per_item(
+    tmp_path: Any,
+) -> None:
+    """Items inherit the batch project_id; a rejected item does not abort the rest."""
+    seen: List[Dict[str, Any]] = []
+    invocations = [
+        {"command": "get_class_hierarchy", "params": {}},
+        {"command": "list_code_entities", "params": {"project_id": "p2"}},
+    ]
+    result = await run_read_only_batch(
+        cast(Sequence[_Invocation], invocations),
+        max_response_bytes=100_000,
+        output_dir=str(tmp_path),
+        registry=cast(Any, _ProjectRegistry(seen)),
+        project_id="p1",
+    )
+    assert [r["result"]["data"]["project_id"] for r in result["results"]] == [
+        "p1",
+        "p2",
+    ]
+
+    result = await run_read_only_batch(
+        cast(Sequence[_Invocation], invocations),
+        max_response_bytes=100_000,
+        output_dir=str(tmp_path),
+        registry=cast(Any, _ProjectRegistry(seen)),
+    )
+    first, second = (r["result"] for r in result["results"])
+    assert first["success"] is False
+    assert first["error_code"] == "BATCH_EXECUTION_ERROR"
+    assert second["success"] is True
+
+
+@pytest.mark.asyncio
+async def test_snapshot_binds_one_read_only_transaction(tmp_path: Any) -> None:
+    """With snapshot_database every item's execute() runs on one rolled-back transaction."""
+    calls: List[Any] = []
+
+    class _Driver:
+        def begin_transaction(self) -> str:
+            calls.append("begin")
+            return "tid-1"
+
+        def execute(self, sql: str, params: Any = None, transaction_id: Any = None):
+            calls.append((sql, transaction_id))
+            return {"data": []}
+
+        def rollback_transaction(self, transaction_id: str) -> bool:
+            calls.append(("rollback", transaction_id))
+            return True
+
+    db = _SharedDatabaseProxy(_Driver())
+    invocations = [
+        {"command": "get_class_hierarchy", "params": {}},
+        {"command": "find_usages", "params": {}},
+    ]
+    await run_read_only_batch(
+        cast(Sequence[_Invocation], invocations),
+        max_response_bytes=100_000,
+        output_dir=str(tmp_path),
+        registry=cast(Any, _ProjectRegistry([], lambda: db.execute("SELECT 1"))),
+        project_id="p1",
+        snapshot_database=db,
+    )
+    item = [
+        ("SAVEPOINT read_only_batch_item", "tid-1"),
+        ("SELECT 1", "tid-1"),
+        ("ROLLBACK TO SAVEPOINT read_only_batch_item", "tid-1"),
+        ("RELEASE SAVEPOINT read_only_batch_item", "tid-1"),
+    ]
+    assert calls == [
+        "begin",
+        ("SET TRANSACTION ISOLATION LEVEL REPEATABLE READ, READ ONLY", "tid-1"),
+        *item,
+        *item,
+        ("rollback", "tid-1"),
+    ]
+    db.execute("SELECT 2")
+    assert calls[-1] == ("SELECT 2", None)
+
+
+@pytest.mark.asyncio
+async def test_snapshot_failed_item_query_does_not_abort_later_items(
+    tmp_path: Any,
+) -> None:
+    """A query error in one item is rolled back to its savepoint; later items run."""
+
+    class _AbortingDriver:
+        """Refuse statements after an error until ROLLBACK TO SAVEPOINT."""
+
+        def __init__(self) -> None:
+            self.aborted = False
+
+        def begin_transaction(self) -> str:
+            return "tid-1"
+
+        def execute(self, sql: str, params: Any = None, transaction_id: Any = None):
+            if sql.startswith("ROLLBACK TO SAVEPOINT"):
+                self.aborted = False
+                return {"data": []}
+            if self.aborted:
+                raise RuntimeError("current transaction is aborted")
+            if sql == "SELECT broken":
+                self.aborted = True
+                raise RuntimeError("column broken does not exist")
+            return {"data": [{"ok": 1}]}
+
+        def rollback_transaction(self, transaction_id: str) -> bool:
+            return True
+
+    db = _SharedDatabaseProxy(_AbortingDriver())
+    queries = iter(["SELECT 1", "SELECT broken", "SELECT 1"])
+    invocations = [
+        {"command": "get_class_hierarchy", "params": {}},
+        {"command": "find_usages", "params": {}},
+        {"command": "list_code_entities", "params": {}},
+    ]
+    result = await run_read_only_batch(
+        cast(Sequence[_Invocation], invocations),
+        max_response_bytes=100_000,
+        output_dir=str(tmp_path),
+        registry=cast(Any, _ProjectRegistry([], lambda: db.execute(next(queries)))),
+        project_id="p1",
+        snapshot_database=db,
+    )
+    assert [r["result"]["success"] for r in result["results"]] == [
+        True,
+        False,
+        True,
+    ]
+
+
 def _paged_registry(count: int) -> _FakeRegistry:
     """Build a registry with ``count`` distinct whitelisted commands, each cheap to run."""
     commands = [
@@ -140,3 +140,15 @@ async def test_execute_loads_jsonc_config_not_stdlib_json(
     )
     assert isinstance(result, ErrorResult)
     assert "Expecting value" not in (result.message or "")
+
+
+@pytest.mark.parametrize("ef_search", [0, 1001])
+def test_validate_params_rejects_ef_search_out_of_range(
+    cmd: SemanticSearchMCPCommand,
+    base_params: dict[str, object],
+    ef_search: int,
+) -> None:
+    """Verify test validate params rejects ef_search out of range."""
+    with pytest.raises(ValidationError, match="ef_search") as exc_info:
+        cmd.validate_params({**base_params, "ef_search": ef_search})
+    assert exc_info.value.field == "ef_search"
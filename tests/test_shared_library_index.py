@@ -0,0 +1,198 @@
+"""
+Tests for the shared third-party library index (dedup across project venvs).
+
+Author: Vasiliy Zdanovskiy
+email: vasilyvz@gmail.com
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Dict, Optional
+
+import pytest
+
+from code_analysis.core import shared_library_index as sli
+from code_analysis.core.vectorization_worker_pkg.processing_cycle_projects import (
+    _shared_library_copy_filter,
+)
+
+_SCHEMA = """
+CREATE TABLE projects (id TEXT PRIMARY KEY, name TEXT);
+CREATE TABLE files (
+    id TEXT PRIMARY KEY, project_id TEXT, path TEXT,
+    deleted INTEGER DEFAULT 0, needs_chunking INTEGER DEFAULT 1
+);
+CREATE TABLE library_files (
+    id TEXT PRIMARY KEY, dist_name TEXT, dist_version TEXT,
+    relative_path TEXT, sha256 TEXT, canonical_file_id TEXT,
+    created_at REAL DEFAULT (julianday('now')),
+    UNIQUE (dist_name, dist_version, relative_path, sha256)
+);
+CREATE TABLE library_file_refs (
+    file_id TEXT PRIMARY KEY, project_id TEXT, library_file_id TEXT,
+    created_at REAL DEFAULT (julianday('now'))
+);
+CREATE TABLE classes (id INTEGER PRIMARY KEY, file_id TEXT, name TEXT);
+CREATE TABLE code_chunks (id INTEGER PRIMARY KEY, file_id TEXT, chunk_text TEXT);
+"""
+
+
+class _Db:
+    """``execute(sql, params)`` over in-memory SQLite, shaped like the driver."""
+
+    def __init__(self) -> None:
+        self.conn = sqlite3.connect(":memory:")
+        self.conn.row_factory = sqlite3.Row
+        self.conn.executescript(_SCHEMA)
+
+    def execute(
+        self, sql: str, params: Optional[tuple] = None, transaction_id: Any = None
+    ) -> Dict[str, Any]:
+        cur = self.conn.execute(sql, params or ())
+        return {"data": [dict(r) for r in cur.fetchall()]}
+
+    def one(self, sql: str, params: tuple = ()) -> Dict[str, Any]:
+        return self.execute(sql, params)["data"][0]
+
+
+def _make_project(tmp_path: Path, name: str, body: bytes = b"X = 1\n") -> Path:
+    root = tmp_path / name
+    sp = root / ".venv" / "lib" / "python3.11" / "site-packages"
+    (sp / "pkg").mkdir(parents=True)
+    (sp / "pkg" / "mod.py").write_bytes(body)
+    dist = sp / "Pkg_Lib-1.0.dist-info"
+    dist.mkdir()
+    (dist / "METADATA").write_text("Name: Pkg_Lib\nVersion: 1.0\n\nName: body\n")
+    (dist / "RECORD").write_text(
+        "pkg/mod.py,sha256=x,6\nPkg_Lib-1.0.dist-info/RECORD,,\n"
+    )
+    (root / "app.py").write_text("import pkg\n")
+    return root
+
+
+@pytest.fixture()
+def db() -> _Db:
+    database = _Db()
+    for pid in ("p1", "p2"):
+        database.execute("INSERT INTO projects VALUES (?, ?)", (pid, pid.upper()))
+    return database
+
+
+def _claim(db: _Db, root: Path, pid: str, fid: str) -> str:
+    path = str(root / ".venv/lib/python3.11/site-packages/pkg/mod.py")
+    db.execute(
+        "INSERT OR IGNORE INTO files (id, project_id, path) VALUES (?, ?, ?)",
+        (fid, pid, path),
+    )
+    return sli.claim_shared_library_file(db, pid, fid, path, root)
+
+
+def test_library_file_key_uses_record_owner(tmp_path: Path) -> None:
+    """Verify identity comes from dist-info METADATA/RECORD and file content."""
+    root = _make_project(tmp_path, "a")
+    key = sli.library_file_key(
+        root / ".venv/lib/python3.11/site-packages/pkg/mod.py", root
+    )
+    assert key is not None
+    assert key[:3] == ("pkg-lib", "1.0", "pkg/mod.py")
+    assert sli.library_file_key(root / "app.py", root) is None
+
+
+def test_second_project_references_first_copy(db: _Db, tmp_path: Path) -> None:
+    """Verify identical library files are indexed once and referenced after."""
+    a, b = _make_project(tmp_path, "a"), _make_project(tmp_path, "b")
+    assert _claim(db, a, "p1", "f1") == sli.LIBRARY_CANONICAL
+    assert _claim(db, b, "p2", "f2") == sli.LIBRARY_REFERENCED
+    assert _claim(db, b, "p2", "f2") == sli.LIBRARY_REFERENCED
+    assert db.one("SELECT COUNT(*) AS n FROM library_files")["n"] == 1
+
+    c = _make_project(tmp_path, "c", body=b"X = 2\n")
+    assert _claim(db, c, "p2", "f3") == sli.LIBRARY_CANONICAL
+
+
+def test_reference_keeps_entities_and_shares_only_chunks(
+    db: _Db, tmp_path: Path
+) -> None:
+    """Verify a copy keeps its entity rows; only its chunks defer to the canonical."""
+    a, b = _make_project(tmp_path, "a"), _make_project(tmp_path, "b")
+    _claim(db, a, "p1", "f1")
+    for fid in ("f1", "f2"):
+        db.execute("INSERT INTO classes (file_id, name) VALUES (?, 'Lib')", (fid,))
+        db.execute(
+            "INSERT INTO code_chunks (file_id, chunk_text) VALUES (?, 'x')", (fid,)
+        )
+    assert _claim(db, b, "p2", "f2") == sli.LIBRARY_REFERENCED
+
+    classes = db.execute(
+        "SELECT c.file_id FROM classes c JOIN files f ON f.id = c.file_id "
+        "WHERE f.project_id = ?",
+        ("p2",),
+    )["data"]
+    assert classes == [{"file_id": "f2"}]
+    chunks = db.execute("SELECT file_id FROM code_chunks")["data"]
+    assert chunks == [{"file_id": "f1"}]
+    copies = db.execute(f"SELECT id FROM files f WHERE {sli.library_copy_sql('f.id')}")[
+        "data"
+    ]
+    assert copies == [{"id": "f2"}]
+
+    pgvector = SimpleNamespace(vector_ann_backend="pgvector")
+    assert "library_file_refs" in _shared_library_copy_filter(pgvector)
+    assert _shared_library_copy_filter(SimpleNamespace()) == ""
+
+
+def test_purging_canonical_promotes_next_reference(db: _Db, tmp_path: Path) -> None:
+    """Verify reference counting hands the canonical copy over, then drops it."""
+    a, b = _make_project(tmp_path, "a"), _make_project(tmp_path, "b")
+    _claim(db, a, "p1", "f1")
+    _claim(db, b, "p2", "f2")
+    db.execute("UPDATE files SET needs_chunking = 0")
+
+    def purge(fid: str) -> None:
+        sel = "SELECT id FROM files WHERE id = ?"
+        for sql, params in sli.build_library_release_ops(sel, (fid,)):
+            db.execute(sql, params)
+        db.execute("DELETE FROM files WHERE id = ?", (fid,))
+
+    purge("f1")
+    lib = db.one("SELECT canonical_file_id FROM library_files")
+    assert lib["canonical_file_id"] == "f2"
+    assert db.one("SELECT needs_chunking FROM files WHERE id = 'f2'") == {
+        "needs_chunking": 1
+    }
+    assert _claim(db, b, "p2", "f2") == sli.LIBRARY_CANONICAL
+
+    purge("f2")
+    assert db.execute("SELECT * FROM library_files")["data"] == []
+    assert db.execute("SELECT * FROM library_file_refs")["data"] == []
+
+
+def test_localize_rows_reports_project_copy(db: _Db, tmp_path: Path) -> None:
+    """Verify hits on another project's copy come back as the local file."""
+    a, b = _make_project(tmp_path, "a"), _make_project(tmp_path, "b")
+    _claim(db, a, "p1", "f1")
+    _claim(db, b, "p2", "f2")
+    rows = [
+        {
+            "file_id": "f1",
+            "file_path": "a-path",
+            "project_id": "p1",
+            "project_name": "P1",
+        },
+        {
+            "file_id": "f9",
+            "file_path": "own.py",
+            "project_id": "p2",
+            "project_name": "P2",
+        },
+    ]
+    out = sli.localize_library_rows(db, "p2", rows)
+    assert out[0]["file_id"] == "f2"
+    assert out[0]["file_path"].startswith(str(b))
+    assert (out[0]["project_id"], out[0]["project_name"]) == ("p2", "P2")
+    assert out[0]["shared_library"] is True
+    assert out[1] == rows[1]
+    assert sli.localize_library_rows(db, "p1", rows[:1]) == rows[:1]
@@ -0,0 +1,104 @@
+"""
+Tests for the persisted site-packages dist-info / RECORD cache.
+
+Author: Vasiliy Zdanovskiy
+email: vasilyvz@gmail.com
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Dict
+
+import pytest
+
+from code_analysis.core import site_packages_cache as spc
+from code_analysis.core import venv_path_policy as vpp
+
+
+def _install(sp: Path, dist: str, module: str, version: str = "1.0") -> Path:
+    (sp / module).mkdir(parents=True, exist_ok=True)
+    mod = sp / module / "mod.py"
+    mod.write_text("x = 1\n", encoding="utf-8")
+    info = sp / f"{dist}-{version}.dist-info"
+    info.mkdir()
+    (info / "METADATA").write_text(f"Name: {dist}\nVersion: {version}\n")
+    (info / "RECORD").write_text(f"{module}/mod.py,sha256=abc,6\n", encoding="utf-8")
+    return mod.resolve()
+
+
+@pytest.fixture()
+def reads(monkeypatch: pytest.MonkeyPatch) -> Dict[str, int]:
+    counts = {"metadata": 0, "record": 0}
+    read_field, record_files = vpp._read_dist_info_field, vpp._record_py_files
+
+    def _field(*args: Any) -> Any:
+        counts["metadata"] += 1
+        return read_field(*args)
+
+    def _record(*args: Any) -> Any:
+        counts["record"] += 1
+        return record_files(*args)
+
+    monkeypatch.setattr(vpp, "_read_dist_info_field", _field)
+    monkeypatch.setattr(vpp, "_record_py_files", _record)
+    spc.clear_site_packages_cache()
+    return counts
+
+
+def test_unchanged_site_packages_is_not_reread(
+    tmp_path: Path, reads: Dict[str, int]
+) -> None:
+    """Verify repeated and cross-process (persisted) lookups skip METADATA/RECORD."""
+    root = tmp_path / "proj"
+    sp = root / ".venv" / "lib" / "python3.12" / "site-packages"
+    mod = _install(sp, "mypkg", "mypkg")
+    _install(sp, "other", "other")
+
+    assert vpp.build_allowlisted_site_packages_py_files(root, ["MyPkg"]) == {mod}
+    assert reads == {"metadata": 4, "record": 1}
+    vpp.build_allowlisted_site_packages_py_files(root, ["mypkg"])
+    assert reads == {"metadata": 4, "record": 1}
+
+    spc.clear_site_packages_cache()  # a fresh process loads the JSON file
+    assert vpp.build_allowlisted_site_packages_py_files(root, ["mypkg"]) == {mod}
+    assert reads == {"metadata": 4, "record": 1}
+    assert spc.cache_file_for(sp.resolve()).is_file()
+
+
+def test_install_and_record_change_are_picked_up(
+    tmp_path: Path, reads: Dict[str, int]
+) -> None:
+    """Verify a new dist-info and a rewritten RECORD invalidate only themselves."""
+    root = tmp_path / "proj"
+    sp = root / ".venv" / "lib" / "python3.12" / "site-packages"
+    mod = _install(sp, "mypkg", "mypkg")
+    vpp.build_allowlisted_site_packages_py_files(root, ["mypkg", "newpkg"])
+
+    new_mod = _install(sp, "newpkg", "newpkg")
+    record = sp / "mypkg-1.0.dist-info" / "RECORD"
+    (sp / "mypkg" / "extra.py").write_text("y = 2\n")
+    record.write_text(record.read_text() + "mypkg/extra.py,sha256=def,6\n")
+
+    found = vpp.build_allowlisted_site_packages_py_files(root, ["mypkg", "newpkg"])
+    assert found == {mod, new_mod, (sp / "mypkg" / "extra.py").resolve()}
+    assert reads == {"metadata": 6, "record": 3}
+
+
+def test_record_index_is_rebuilt_only_after_a_change(
+    tmp_path: Path, reads: Dict[str, int]
+) -> None:
+    """Verify the RECORD map is shared across lookups until a dist-info changes."""
+    sp = tmp_path / "site-packages"
+    _install(sp, "mypkg", "mypkg")
+
+    first = spc.cached_record_index(sp)
+    assert first == {"mypkg/mod.py": ("mypkg", "1.0")}
+    assert spc.cached_record_index(sp) is first
+
+    _install(sp, "newpkg", "newpkg", version="2.0")
+    second = spc.cached_record_index(sp)
+    assert second is not first
+    assert second["newpkg/mod.py"] == ("newpkg", "2.0")
+    assert spc.cached_record_index(sp) is second
+    assert reads["record"] == 2
@@ -0,0 +1,180 @@
+"""
+Tests for the in-memory project symbol graph and its per-file patching cache.
+
+Author: Vasiliy Zdanovskiy
+email: vasilyvz@gmail.com
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from typing import Any, Dict, Iterator, List
+
+import pytest
+
+from code_analysis.commands.ast.entity_dependencies_helpers import (
+    get_entity_refs_via_graph,
+    resolve_entity_node_by_name,
+)
+from code_analysis.core.symbol_graph import (
+    clear_symbol_graph_cache,
+    get_project_symbol_graph,
+)
+
+_SCHEMA = """
+CREATE TABLE files (id TEXT PRIMARY KEY, project_id TEXT, path TEXT,
+    relative_path TEXT, updated_at REAL);
+CREATE TABLE classes (id TEXT PRIMARY KEY, file_id TEXT, name TEXT, line INTEGER,
+    bases TEXT, cst_node_id TEXT);
+CREATE TABLE methods (id TEXT PRIMARY KEY, class_id TEXT, name TEXT, line INTEGER,
+    cst_node_id TEXT);
+CREATE TABLE functions (id TEXT PRIMARY KEY, file_id TEXT, name TEXT, line INTEGER,
+    cst_node_id TEXT);
+CREATE TABLE imports (file_id TEXT, name TEXT, module TEXT, line INTEGER);
+CREATE TABLE usages (file_id TEXT, line INTEGER, target_class TEXT,
+    target_name TEXT);
+CREATE TABLE entity_cross_ref (caller_class_id TEXT, caller_method_id TEXT,
+    caller_function_id TEXT, callee_class_id TEXT, callee_method_id TEXT,
+    callee_function_id TEXT, ref_type TEXT, file_id TEXT, line INTEGER);
+"""
+
+_CST_RUN = "11111111-1111-4111-8111-111111111111"
+
+
+class _SqliteDb:
+    """``execute(sql, params) -> {"data": [...]}`` over an in-memory SQLite DB."""
+
+    def __init__(self) -> None:
+        self.conn = sqlite3.connect(":memory:")
+        self.conn.row_factory = sqlite3.Row
+        self.conn.executescript(_SCHEMA)
+        self.statements: List[str] = []
+
+    def execute(self, sql: str, params: tuple = ()) -> Dict[str, Any]:
+        sql = sql.replace("EXTRACT(JULIAN FROM CURRENT_TIMESTAMP)", "julianday('now')")
+        self.statements.append(sql)
+        rows = self.conn.execute(sql, params).fetchall()
+        return {"data": [dict(r) for r in rows]}
+
+
+@pytest.fixture
+def db() -> Iterator[_SqliteDb]:
+    """Project p1: a.py (Base, Worker.run -> helper), b.py (helper, Sub(Worker))."""
+    clear_symbol_graph_cache()
+    d = _SqliteDb()
+    d.conn.executescript(
+        f"""
+        INSERT INTO files VALUES ('fa', 'p1', '/p/a.py', 'a.py', 2400000.0);
+        INSERT INTO files VALUES ('fb', 'p1', '/p/b.py', 'b.py', 2400000.0);
+        INSERT INTO classes VALUES ('c1', 'fa', 'Base', 1, '[]', NULL);
+        INSERT INTO classes VALUES ('c2', 'fa', 'Worker', 5, '["mod.Base"]', NULL);
+        INSERT INTO methods VALUES ('m1', 'c2', 'run', 6, '{_CST_RUN}');
+        INSERT INTO functions VALUES ('f1', 'fb', 'helper', 1, NULL);
+        INSERT INTO functions VALUES ('f2', 'fb', 'leaf', 9, NULL);
+        INSERT INTO classes VALUES ('c3', 'fb', 'Sub', 12, '["Worker"]', NULL);
+        INSERT INTO imports VALUES ('fb', 'Worker', 'a', 1);
+        INSERT INTO usages VALUES ('fa', 7, NULL, 'helper');
+        INSERT INTO entity_cross_ref VALUES
+            (NULL, 'm1', NULL, NULL, NULL, 'f1', 'call', 'fa', 7),
+            (NULL, NULL, 'f1', NULL, NULL, 'f2', 'call', 'fb', 2),
+            ('c3', NULL, NULL, 'c2', NULL, NULL, 'inherit', 'fb', 12);
+    """
+    )
+    yield d
+    clear_symbol_graph_cache()
+
+
+def test_graph_answers_neighbourhood_closure_and_reverse(db: _SqliteDb) -> None:
+    """Verify nodes, CSR edges in both directions and transitive walks."""
+    graph = get_project_symbol_graph(db, "p1")
+    run = graph.entity_node("method", "m1")
+    helper = graph.entity_node("function", "f1")
+    leaf = graph.entity_node("function", "f2")
+    assert graph.name(run) == "Worker.run"
+    assert graph.nodes_named("method", "run") == [run]
+    assert graph.neighbors(run, "calls") == [helper]
+    assert graph.neighbors(leaf, "calls", reverse=True) == [helper]
+    assert graph.closure([run], "calls") == {helper: 1, leaf: 2}
+
+    base = graph.nodes_named("class", "Base")[0]
+    sub = graph.nodes_named("class", "Sub")[0]
+    assert graph.closure([base], "inherits", reverse=True) == {
+        graph.nodes_named("class", "Worker")[0]: 1,
+        sub: 2,
+    }
+    fa, fb = graph.file_nodes()
+    assert graph.symbol_sources("imports", "a") == [fb]
+    assert list(graph.symbol_edges("uses")) == [(fa, "helper", 7)]
+
+    deps = get_entity_refs_via_graph(graph, run, max_depth=2)
+    assert [(d["callee_entity_id"], d["depth"]) for d in deps] == [
+        ("f1", 1),
+        ("f2", 2),
+    ]
+    assert deps[0]["file_path"] == "a.py"
+    callers = get_entity_refs_via_graph(graph, helper, reverse=True)
+    assert callers == [
+        {
+            "caller_entity_type": "method",
+            "caller_entity_id": "m1",
+            "ref_type": "call",
+            "file_path": "a.py",
+            "line": 7,
+            "cst_node_id": _CST_RUN,
+        }
+    ]
+    assert resolve_entity_node_by_name(graph, "method", "run", "Worker") == run
+
+
+def test_unchanged_project_costs_one_query(db: _SqliteDb) -> None:
+    """Verify a cached graph is reused after a single signature query."""
+    graph = get_project_symbol_graph(db, "p1")
+    db.statements.clear()
+    assert get_project_symbol_graph(db, "p1") is graph
+    assert len(db.statements) == 1
+
+
+def test_queries_run_without_the_shared_cache_lock(db: _SqliteDb) -> None:
+    """Verify loading one project never holds the lock other projects need."""
+    from code_analysis.core.symbol_graph import cache
+
+    execute = db.execute
+
+    def checked(sql: str, params: tuple = ()) -> Dict[str, Any]:
+        assert not cache._lock.locked()
+        return execute(sql, params)
+
+    db.execute = checked  # type: ignore[method-assign]
+    graph = get_project_symbol_graph(db, "p1")
+    assert get_project_symbol_graph(db, "p1") is graph
+
+
+def test_reindexed_file_is_patched_alone(db: _SqliteDb) -> None:
+    """Verify only the re-indexed file is reloaded and cross-file edges follow."""
+    get_project_symbol_graph(db, "p1")
+    # Re-index b.py: helper gets a new id; m1 -> helper is rebuilt against it.
+    db.conn.executescript(
+        """
+        DELETE FROM entity_cross_ref;
+        DELETE FROM functions WHERE file_id = 'fb';
+        INSERT INTO functions VALUES ('f9', 'fb', 'helper', 3, NULL);
+        INSERT INTO entity_cross_ref VALUES
+            (NULL, 'm1', NULL, NULL, NULL, 'f9', 'call', 'fa', 7),
+            ('c3', NULL, NULL, 'c2', NULL, NULL, 'inherit', 'fb', 12);
+        UPDATE files SET updated_at = 2400001.0 WHERE id = 'fb';
+    """
+    )
+    db.statements.clear()
+    graph = get_project_symbol_graph(db, "p1")
+    loads = [s for s in db.statements if "FROM classes c JOIN" in s]
+    assert len(loads) == 1 and "IN (?)" in loads[0]
+    run = graph.entity_node("method", "m1")
+    assert graph.entity_node("function", "f1") is None
+    assert [graph.entity_id(n) for n in graph.neighbors(run, "calls")] == ["f9"]
+    sub = graph.nodes_named("class", "Sub")[0]
+    assert graph.neighbors(sub, "calls") == graph.nodes_named("class", "Worker")
+
+    db.conn.execute("DELETE FROM files WHERE id = 'fb'")
+    graph = get_project_symbol_graph(db, "p1")
+    assert graph.nodes_named("class", "Sub") == []
+    assert graph.neighbors(graph.entity_node("method", "m1"), "calls") == []
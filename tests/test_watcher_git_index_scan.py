@@ -0,0 +1,135 @@
+"""
+Tests for the git-index-assisted file watcher change source.
+
+The index-based listing must produce exactly the same per-project files map as
+the ``os.walk`` scan, across cycles, and fall back when the index is unusable.
+
+Author: Vasiliy Zdanovskiy
+email: vasilyvz@gmail.com
+"""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import uuid
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import pytest
+
+from code_analysis.core.file_watcher_pkg.git_index_scan import (
+    GitIndexScanState,
+    load_git_index_scan_enabled_from_config_path,
+)
+from code_analysis.core.file_watcher_pkg.scanner import iter_watch_dir_project_scans
+
+
+def _git(cwd: Path, *args: str) -> None:
+    """Run git quietly in cwd."""
+    subprocess.run(["git", *args], cwd=str(cwd), check=True, capture_output=True)
+
+
+def _write(path: Path, content: str = "x = 1\n") -> None:
+    """Create ``path`` (and parents) with ``content``."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+
+
+def _scan(
+    watch_dir: Path, states: Optional[Dict[str, Any]] = None
+) -> Dict[str, Dict[str, Any]]:
+    """Return the merged files map for every project under ``watch_dir``."""
+    files: Dict[str, Dict[str, Any]] = {}
+    for _pid, _root, batch in iter_watch_dir_project_scans(
+        watch_dir,
+        [watch_dir],
+        ["**/__pycache__/**", "*.pyc"],
+        git_index_states=states,
+    ):
+        files.update(batch)
+    return files
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    """Create a watch dir with one git-tracked project."""
+    root = tmp_path / "watch" / "proj"
+    root.mkdir(parents=True)
+    (root / "projectid").write_text(
+        json.dumps({"id": str(uuid.uuid4()), "description": "Test"}),
+        encoding="utf-8",
+    )
+    _write(root / "main.py")
+    _write(root / "pkg" / "mod.py")
+    _write(root / "pkg" / "deep" / "leaf.py")
+    _write(root / "test_data" / "fixture.py")
+    _write(root / "pkg" / "__pycache__" / "mod.cpython-311.pyc")
+    _git(root, "init", "-q")
+    _git(root, "add", "-A", "-f")
+    _write(root / "pkg" / "scratch.py")
+    _write(root / "newdir" / "sub" / "fresh.py")
+    _write(root / ".venv" / "lib" / "site.py")
+    return root
+
+
+def test_index_scan_matches_walk_across_cycles(project: Path) -> None:
+    """Verify identical files maps on first and incremental cycles."""
+    watch_dir = project.parent
+    states: Dict[str, Any] = {}
+    assert _scan(watch_dir, states) == _scan(watch_dir)
+    state = states[str(project.resolve())]
+    assert isinstance(state, GitIndexScanState)
+    assert state.last_stats["untracked_dirs_walked"] == 1
+
+    assert _scan(watch_dir, states) == _scan(watch_dir)
+    assert state.last_stats["dirs_relisted"] == 0
+
+    (project / "pkg" / "deep" / "leaf.py").unlink()
+    _write(project / "pkg" / "deep" / "added.py")
+    _write(project / "main.py", "x = 2\n")
+    files = _scan(watch_dir, states)
+    assert files == _scan(watch_dir)
+    assert state.last_stats["dirs_relisted"] == 1
+    assert str((project / "pkg" / "deep" / "added.py").resolve()) in files
+
+
+def test_index_change_invalidates_cached_listings(project: Path) -> None:
+    """Verify staging an untracked file refreshes tracked/untracked split."""
+    watch_dir = project.parent
+    states: Dict[str, Any] = {}
+    _scan(watch_dir, states)
+    _git(project, "add", "pkg/scratch.py")
+    assert _scan(watch_dir, states) == _scan(watch_dir)
+    assert "pkg/scratch.py" in states[str(project.resolve())].tracked_files
+
+
+def test_falls_back_to_walk_without_usable_index(project: Path) -> None:
+    """Verify skip-worktree entries and non-git projects use the tree walk."""
+    watch_dir = project.parent
+    states: Dict[str, Any] = {}
+    _git(project, "update-index", "--skip-worktree", "main.py")
+    assert _scan(watch_dir, states) == _scan(watch_dir)
+    assert states == {}
+
+    plain = watch_dir / "plain"
+    plain.mkdir()
+    (plain / "projectid").write_text(
+        json.dumps({"id": str(uuid.uuid4()), "description": "Test"}),
+        encoding="utf-8",
+    )
+    _write(plain / "a.py")
+    assert _scan(watch_dir, states) == _scan(watch_dir)
+    assert str(plain.resolve()) not in states
+
+
+def test_config_flag_defaults_off(tmp_path: Path) -> None:
+    """Verify the scan mode is opt-in via code_analysis.file_watcher."""
+    cfg = tmp_path / "config.json"
+    cfg.write_text(json.dumps({"code_analysis": {"file_watcher": {}}}))
+    assert load_git_index_scan_enabled_from_config_path(cfg) is False
+    assert load_git_index_scan_enabled_from_config_path(None) is False
+    cfg.write_text(
+        json.dumps({"code_analysis": {"file_watcher": {"git_index_scan": True}}})
+    )
+    assert load_git_index_scan_enabled_from_config_path(cfg) is True
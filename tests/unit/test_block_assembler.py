@@ -13,12 +13,17 @@ from code_analysis.core.search_session.directory import (
     provision_search_session_directory,
 )
 from code_analysis.core.search_session.raw_finding_buffer import RawFindingBuffer
+from code_analysis.core.search_session.result_block import (
+    assemble_block,
+    serialize_block,
+)
 
 
 def _make_assembler(
     tmp_path,
     *,
     max_block_size_bytes: int,
+    max_results_per_block: int | None = None,
     append_index_entry=None,
     update_manifest_metrics=None,
 ):
@@ -35,6 +40,7 @@ def _make_assembler(
         layout,
         buffer,
         max_block_size_bytes,
+        max_results_per_block=max_results_per_block,
         append_index_entry=append_index_entry
         or (
             lambda position, completeness: index_entries.append(
@@ -140,3 +146,105 @@ def test_second_assembler_exits_when_live_lock_held(tmp_path) -> None:
         buffer.release_lock()
 
     assert published == 0
+
+
+def _entity(source: str, index: int, name: str, score: float) -> dict:
+    """Return a fulltext/semantic style finding for entity ``name``."""
+    return {
+        "result_id": f"{source}-{index:06d}",
+        "source": source,
+        "file_path": "m.py",
+        "entity_type": "function",
+        "entity_name": name,
+        "score": score,
+    }
+
+
+def test_relevance_set_fuses_published_and_buffered_findings(tmp_path) -> None:
+    """Verify the relevance set ranks every finding, not only unpublished ones."""
+    assembler, layout, buffer, _index_entries, _metrics_updates = _make_assembler(
+        tmp_path,
+        max_block_size_bytes=10_000,
+        max_results_per_block=2,
+    )
+    buffer.append_finding("ft-0", _entity("fulltext", 0, "solo", 0.9))
+    buffer.append_finding("ft-1", _entity("fulltext", 1, "shared", 0.2))
+    assert assembler.publish_settled(pending_sources=()) == 2
+    buffer.append_finding("sem-2", _entity("semantic", 2, "shared", 0.7))
+
+    assert assembler.run_until_idle(search_completed=True) == 1
+
+    payload = json.loads(
+        (layout.relevance_blocks_dir / "block_1.json").read_text(encoding="utf-8")
+    )
+    assert [item["entity_name"] for item in payload["items"]] == ["shared", "solo"]
+    assert len(payload["items"][0]["sources"]) == 2
+    assert buffer.buffer_dir.exists() is False
+
+
+def test_publish_settled_waits_for_a_full_settled_page(tmp_path) -> None:
+    """Verify the ranked head is published only once pending grep cannot change it."""
+    assembler, layout, buffer, index_entries, _metrics_updates = _make_assembler(
+        tmp_path,
+        max_block_size_bytes=10_000,
+        max_results_per_block=2,
+    )
+    buffer.append_finding("ft-0", _entity("fulltext", 0, "a", 0.9))
+    buffer.append_finding("ft-1", _entity("fulltext", 1, "b", 0.8))
+    buffer.append_finding("ft-2", _entity("fulltext", 2, "c", 0.7))
+
+    assert assembler.publish_settled(pending_sources=("semantic", "cross")) == 0
+    assert index_entries == []
+
+    buffer.append_finding("sem-3", _entity("semantic", 3, "b", 0.9))
+    buffer.append_finding("sem-4", _entity("semantic", 4, "a", 0.8))
+
+    assert assembler.publish_settled(pending_sources=("cross",)) == 2
+    payload = json.loads((layout.blocks_dir / "block_1.json").read_text("utf-8"))
+    assert {item["entity_name"] for item in payload["items"]} == {"a", "b"}
+    assert index_entries == [(1, COMPLETENESS_RUNNING)]
+    assert [p.name for p in buffer.list_findings()] == ["ft-2.json"]
+    assert buffer.lock_path.exists() is False
+
+
+def test_publish_settled_continues_after_published_head(tmp_path) -> None:
+    """Verify a settled block follows published items that lead the ranking."""
+    assembler, layout, buffer, index_entries, _metrics_updates = _make_assembler(
+        tmp_path,
+        max_block_size_bytes=10_000,
+        max_results_per_block=2,
+    )
+    for i, (name, score) in enumerate((("a", 0.9), ("b", 0.8), ("c", 0.7))):
+        buffer.append_finding(f"ft-{i}", _entity("fulltext", i, name, score))
+    buffer.append_finding("ft-3", _entity("fulltext", 3, "d", 0.6))
+    assert assembler.publish_settled(pending_sources=()) == 2
+
+    assert assembler.publish_settled(pending_sources=()) == 2
+    payload = json.loads((layout.blocks_dir / "block_2.json").read_text("utf-8"))
+    assert [item["entity_name"] for item in payload["items"]] == ["c", "d"]
+    assert index_entries == [(1, COMPLETENESS_RUNNING), (2, COMPLETENESS_RUNNING)]
+
+
+def test_publish_settled_refuses_when_published_block_is_not_the_head(
+    tmp_path,
+) -> None:
+    """Verify an arrival-order block_1 outside the ranked head blocks publication."""
+    assembler, layout, buffer, index_entries, _metrics_updates = _make_assembler(
+        tmp_path,
+        max_block_size_bytes=10_000,
+        max_results_per_block=2,
+    )
+    block = assemble_block(
+        [_entity("fulltext", 0, "weak", 0.1), _entity("fulltext", 1, "weaker", 0.05)],
+        max_block_size_bytes=10_000,
+        max_results=2,
+        position=1,
+    )
+    (layout.blocks_dir / "block_1.json").write_bytes(serialize_block(block))
+    buffer.append_finding("sem-2", _entity("semantic", 2, "a", 0.9))
+    buffer.append_finding("sem-3", _entity("semantic", 3, "b", 0.8))
+    buffer.append_finding("sem-4", _entity("semantic", 4, "c", 0.7))
+
+    assert assembler.publish_settled(pending_sources=()) == 0
+    assert index_entries == []
+    assert len(buffer.list_findings()) == 3
@@ -0,0 +1,92 @@
+"""Unit tests for reciprocal-rank-fusion hybrid ranking."""
+
+from __future__ import annotations
+
+from code_analysis.core.search_session.hybrid_rank import (
+    RRF_K,
+    fusion_key,
+    rank_findings,
+)
+
+
+def _ft(i: int, name: str, score: float) -> dict:
+    """Return a fulltext finding for entity ``name``."""
+    return {
+        "result_id": f"fulltext-{i:06d}",
+        "source": "fulltext",
+        "file_path": "a.py",
+        "entity_type": "function",
+        "entity_name": name,
+        "score": score,
+    }
+
+
+def _sem(i: int, name: str, score: float) -> dict:
+    """Return a semantic finding for entity ``name``."""
+    return {
+        **_ft(i, name, score),
+        "result_id": f"semantic-{i:06d}",
+        "source": "semantic",
+    }
+
+
+def test_fusion_key_prefers_entity_then_node_then_line() -> None:
+    """Verify findings merge on file + entity span, not on grep line ids."""
+    assert fusion_key(_ft(0, "foo", 0.1)) == fusion_key(_sem(5, "foo", 0.9))
+    node = {"file_path": "a.py", "stable_id": "n-1", "result_id": "cross-000001"}
+    assert fusion_key(node)[2:] == ("node", "n-1")
+    line = {"file_path": "a.py", "stable_id": "grep:a.py:7", "line": 7}
+    assert fusion_key(line)[2:] == ("line", "7")
+    assert fusion_key({"result_id": "x"}) != fusion_key({"result_id": "y"})
+
+
+def test_rank_fuses_sources_and_deduplicates() -> None:
+    """Verify consensus beats a single high score and duplicates collapse."""
+    findings = [
+        _ft(0, "only_ft", 0.9),
+        _ft(1, "both", 0.5),
+        _sem(2, "both", 0.8),
+        _sem(3, "only_sem", 0.95),
+    ]
+    ranking = rank_findings(findings)
+    names = [item["entity_name"] for item in ranking.items]
+    assert names == ["both", "only_ft", "only_sem"]
+    assert ranking.head_settled(3)
+    top = ranking.items[0]
+    assert top["rrf_score"] == 2 / (RRF_K + 2)
+    assert top["result_id"] == "fulltext-000001"
+    assert {c["source"] for c in top["sources"]} == {"fulltext", "semantic"}
+    assert "sources" not in ranking.items[1]
+    assert ranking.items[2]["source"] == "semantic"
+
+    again = rank_findings(list(reversed(ranking.items)))
+    assert [i["result_id"] for i in again.items] == [
+        i["result_id"] for i in ranking.items
+    ]
+    assert again.items[0]["rrf_score"] == top["rrf_score"]
+
+
+def test_settled_prefix_respects_pending_source_bound() -> None:
+    """Verify only results no pending source can overtake are settled."""
+    findings = [
+        _ft(0, "a", 0.9),
+        _sem(1, "a", 0.9),
+        _ft(2, "b", 0.8),
+        _sem(3, "b", 0.8),
+        _ft(4, "c", 0.7),
+        _ft(6, "d", 0.6),
+        {
+            "result_id": "cross-000005",
+            "source": "cross",
+            "file_path": "a.py",
+            "stable_id": "n-9",
+            "score": 1.0,
+        },
+    ]
+    ranking = rank_findings(findings, pending_sources=("cross",))
+    assert [i.get("entity_name") for i in ranking.items[:3]] == ["a", "b", "c"]
+    assert ranking.items[-1]["rrf_score"] == 0.0
+    assert ranking.head_settled(2)
+    assert not ranking.head_settled(1)  # b plus a top grep hit may pass a
+    assert not ranking.head_settled(3)  # d plus a top grep hit may pass c
+    assert not rank_findings(findings, pending_sources=("semantic",)).head_settled(2)
@@ -0,0 +1,138 @@
+"""Unit tests for the line-offset index behind large-file line reads and fs_grep."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Optional
+
+import pytest
+
+from code_analysis.commands.fs_grep_budget import FsGrepBudgetState, limits_for_queue
+from code_analysis.commands.fs_grep_command import _phase1_text_scan_targets
+from code_analysis.commands.fs_grep_sources import GrepScanTarget
+from code_analysis.core.file_handlers import line_index
+from code_analysis.core.file_handlers.line_index import (
+    TextLines,
+    get_line_index,
+    iter_lines_containing,
+)
+
+
+@pytest.fixture(autouse=True)
+def _small_index_threshold(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(line_index, "LINE_INDEX_MIN_BYTES", 0)
+    line_index.clear_line_index_cache()
+
+
+def _index(path: Path) -> Optional[line_index.LineIndex]:
+    return get_line_index(path)
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        b"",
+        b"one",
+        b"one\ntwo\n",
+        b"one\r\ntwo\r\n\r\nfour",
+        b"\n\n\n",
+        b"caf\xc3\xa9\nbad \xff\xfe bytes\n\xe2\x82\nend",
+    ],
+)
+def test_windows_match_splitlines(tmp_path: Path, data: bytes) -> None:
+    """Verify every window of an indexed file equals splitlines() of the text."""
+    path = tmp_path / "f.txt"
+    path.write_bytes(data)
+    expected = data.decode("utf-8", errors="replace").splitlines()
+
+    text_lines = line_index.open_text_lines(path)
+    assert text_lines.indexed
+    assert text_lines.total_lines == len(expected)
+    for start in range(1, len(expected) + 1):
+        for end in range(start, len(expected) + 1):
+            assert text_lines.window(start, end) == expected[start - 1 : end]
+
+
+@pytest.mark.parametrize(
+    "data", [b"a\rb\n", b"a\x0cb\n", b"a\xe2\x80\xa8b\n", b"a\xc2\x85b\n"]
+)
+def test_irregular_line_breaks_fall_back_to_text(tmp_path: Path, data: bytes) -> None:
+    """Verify files splitlines() splits beyond \\n are read as decoded text."""
+    path = tmp_path / "f.txt"
+    path.write_bytes(data)
+    expected = data.decode("utf-8", errors="replace").splitlines()
+
+    assert _index(path) is None
+    text_lines = line_index.open_text_lines(path)
+    assert not text_lines.indexed
+    assert text_lines.window(1, text_lines.total_lines) == expected
+
+
+def test_index_cached_by_fingerprint(tmp_path: Path) -> None:
+    """Verify the index is reused until the file changes, then rebuilt."""
+    path = tmp_path / "f.txt"
+    path.write_text("a\nb\n", encoding="utf-8")
+    first = _index(path)
+    assert first is not None and _index(path) is first
+
+    path.write_text("a\nb\nc\n", encoding="utf-8")
+    os.utime(path, ns=(1, 1))
+    second = _index(path)
+    assert second is not None and second is not first
+    assert second.total_lines == 3
+
+
+def test_stale_index_window_rereads_file(tmp_path: Path) -> None:
+    """Verify a window read after the file changed falls back to a full read."""
+    path = tmp_path / "f.txt"
+    path.write_text("a\nb\n", encoding="utf-8")
+    text_lines = TextLines(path, index=_index(path))
+
+    path.write_text("x\ny\nz\n", encoding="utf-8")
+    os.utime(path, ns=(1, 1))
+    assert text_lines.window(1, 2) == ["x", "y"]
+    assert not text_lines.indexed
+
+
+def test_iter_lines_containing_stops_at_nul_line(tmp_path: Path) -> None:
+    """Verify byte search yields each matching line once, before the NUL line."""
+    path = tmp_path / "f.txt"
+    path.write_bytes(b"x needle needle\r\nno\n\xff needle\nbin\x00 needle\nneedle\n")
+    index = _index(path)
+    assert index is not None
+
+    hits = list(iter_lines_containing(path, index, b"needle"))
+    assert hits == [(1, "x needle needle"), (3, "� needle")]
+
+
+@pytest.mark.parametrize("indexed", [True, False])
+def test_fs_grep_indexed_scan_matches_line_scan(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, indexed: bool
+) -> None:
+    """Verify both scans report the same rows and stop at the first NUL line."""
+    if not indexed:
+        monkeypatch.setattr(line_index, "LINE_INDEX_MIN_BYTES", 1 << 40)
+    lines = [f"row {i} {'héllo' if i % 7 == 0 else 'x'}" for i in range(200)]
+    lines[150] = "bin\0ary"
+    (tmp_path / "big.txt").write_text("\r\n".join(lines), encoding="utf-8")
+    targets = [GrepScanTarget(relative_path="big.txt", source="disk")]
+
+    def scan(needle: str, case_sensitive: bool) -> list:
+        matches, _stats = _phase1_text_scan_targets(
+            project_root=tmp_path,
+            scan_targets=targets,
+            needle=needle,
+            literal=True,
+            case_sensitive=case_sensitive,
+            regex=None,
+            max_matches=1000,
+            max_file_bytes=0,
+            line_preview_len=200,
+            budget=FsGrepBudgetState(limits=limits_for_queue(max_matches=1000)),
+        )
+        return [(m["line_number"], m["line"]) for m in matches]
+
+    expected = [(i + 1, line) for i, line in enumerate(lines[:150]) if "héllo" in line]
+    assert scan("héllo", True) == expected
+    assert scan("HÉLLO", False) == expected
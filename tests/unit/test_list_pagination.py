@@ -2,9 +2,19 @@
 
 from __future__ import annotations
 
+from typing import Any
+
+import pytest
+
+from code_analysis.core.exceptions import ValidationError
 from code_analysis.core.list_pagination import (
     build_list_page_payload,
+    decode_list_cursor,
+    encode_list_cursor,
+    keyset_after_sql,
+    resolve_list_cursor,
     resolve_list_pagination,
+    walk_keyset_sources,
 )
 
 
@@ -40,3 +50,59 @@ def test_build_list_page_payload_has_more() -> None:
     assert payload["has_more"] is True
     assert payload["paginated"] is True
     assert payload["total"] == 3
+
+
+def test_list_cursor_round_trip_and_scope_check() -> None:
+    """Verify cursors decode only for the listing that issued them."""
+    cursor = encode_list_cursor("list_code_entities:all", [0, "/p/a.py", 3, "x"])
+    assert decode_list_cursor(cursor, scope="list_code_entities:all", key_length=4) == (
+        0,
+        "/p/a.py",
+        3,
+        "x",
+    )
+    with pytest.raises(ValidationError):
+        decode_list_cursor(cursor, scope="get_imports", key_length=4)
+    with pytest.raises(ValidationError):
+        decode_list_cursor("not-a-cursor!", scope="get_imports", key_length=4)
+    assert resolve_list_cursor({}, scope="s", key_length=1) == (False, None)
+    assert resolve_list_cursor({"cursor": ""}, scope="s", key_length=1) == (
+        True,
+        None,
+    )
+
+
+def test_keyset_after_sql_uses_row_value_comparison() -> None:
+    """Verify keyset filter shape and params."""
+    assert keyset_after_sql(("f.path", "c.line", "c.id"), None) == ("", [])
+    sql, params = keyset_after_sql(("f.path", "c.line", "c.id"), ("a", 1, 2))
+    assert sql == " AND (f.path, c.line, c.id) > (?, ?, ?)"
+    assert params == ["a", 1, 2]
+
+
+def _list_source(rows: list[int]) -> Any:
+    """Return a keyset fetch over sorted ints; odd values are post-filtered."""
+
+    def fetch(after: Any, limit: int) -> list[tuple[tuple[int], Any]]:
+        start = after[0] if after is not None else -1
+        page = [v for v in rows if v > start][:limit]
+        return [((v,), v if v % 2 == 0 else None) for v in page]
+
+    return fetch
+
+
+@pytest.mark.parametrize("page_size", [1, 2, 3, 5, 50])
+def test_walk_keyset_sources_visits_every_row_once(page_size: int) -> None:
+    """Verify multi-source keyset walk equals concatenated sources."""
+    sources = [_list_source([0, 2, 3, 4]), _list_source([]), _list_source([1, 6])]
+    seen: list[int] = []
+    after = None
+    for _ in range(20):
+        items, next_key = walk_keyset_sources(sources, page_size=page_size, after=after)
+        seen.extend(items)
+        if next_key is None:
+            break
+        after = decode_list_cursor(
+            encode_list_cursor("t", next_key), scope="t", key_length=2
+        )
+    assert seen == [0, 2, 4, 6]
@@ -0,0 +1,128 @@
+"""
+Unit tests for the packed in-memory SessionRepo backend (C-013).
+
+Author: Vasiliy Zdanovskiy
+email: vasilyvz@gmail.com
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from code_analysis.core.edit_session.packed_session_repo import (
+    SESSION_REPO_BACKEND_ENV,
+    SESSION_REPO_BACKEND_LOOSE,
+    SESSION_REPO_BACKEND_PACKED,
+    PackedSessionRepo,
+    resolve_session_repo_backend,
+)
+from dulwich.repo import Repo
+
+SOURCE_NAME = "demo.json"
+TREE_NAME = "demo.json.tree"
+
+
+def _init_repo(repo_dir: Path, *, flush_every: int = 32) -> PackedSessionRepo:
+    """Write source/tree pair and init a packed repo over it."""
+    repo_dir.mkdir(parents=True, exist_ok=True)
+    (repo_dir / SOURCE_NAME).write_text('{"v":0}\n', encoding="utf-8")
+    (repo_dir / TREE_NAME).write_text("tree-0\n", encoding="utf-8")
+    return PackedSessionRepo.init(
+        repo_dir=repo_dir,
+        source_name=SOURCE_NAME,
+        tree_name=TREE_NAME,
+        include_tree=True,
+        source_abs=repo_dir / SOURCE_NAME,
+        flush_every=flush_every,
+    )
+
+
+def _loose_object_files(repo_dir: Path) -> list[Path]:
+    """Return loose object files under ``.git/objects``."""
+    objects_dir = repo_dir / ".git" / "objects"
+    return [
+        p
+        for p in objects_dir.glob("??/*")
+        if p.is_file() and p.parent.name not in ("info", "pack")
+    ]
+
+
+def test_log_and_show_served_from_memory(tmp_path: Path) -> None:
+    """Verify commits are readable before any packfile is written."""
+    repo_dir = tmp_path / "repo"
+    repo = _init_repo(repo_dir)
+    (repo_dir / TREE_NAME).write_text("tree-1\n", encoding="utf-8")
+    new_hash = repo.commit_full(message="session: mutation")
+    messages = [entry.message for entry in repo.log()]
+    assert messages == ["session: mutation", "session: initial commit"]
+    assert repo.log()[0].hash == new_hash
+    assert repo.show_tree(rev=new_hash) == b"tree-1\n"
+    assert repo.show_source(rev=new_hash) == b'{"v":0}\n'
+    assert repo.status_is_clean() is True
+    assert _loose_object_files(repo_dir) == []
+
+
+def test_degraded_commit_keeps_previously_staged_tree(tmp_path: Path) -> None:
+    """Verify degraded commits mirror index semantics of the loose backend."""
+    repo_dir = tmp_path / "repo"
+    repo = _init_repo(repo_dir)
+    (repo_dir / SOURCE_NAME).write_text("broken\n", encoding="utf-8")
+    rev = repo.commit_degraded(message="session: plaintext mutation")
+    assert repo.show_source(rev=rev) == b"broken\n"
+    assert repo.revision_includes_tree(rev=rev) is True
+    (repo_dir / TREE_NAME).unlink()
+    rev_full = repo.commit_full(message="session: mutation")
+    assert repo.revision_includes_tree(rev=rev_full) is False
+
+
+def test_periodic_flush_writes_single_pack(tmp_path: Path) -> None:
+    """Verify flush_every commits produce one packfile and no loose objects."""
+    repo_dir = tmp_path / "repo"
+    repo = _init_repo(repo_dir, flush_every=4)
+    hashes = []
+    for idx in range(1, 4):
+        (repo_dir / TREE_NAME).write_text(f"tree-{idx}\n" * 50, encoding="utf-8")
+        hashes.append(repo.commit_full(message=f"session: mutation {idx}"))
+    assert repo.pending_object_count == 0
+    packs = list((repo_dir / ".git" / "objects" / "pack").glob("*.pack"))
+    assert len(packs) == 1
+    assert _loose_object_files(repo_dir) == []
+    disk = Repo(str(repo_dir))
+    assert disk.refs[b"refs/heads/master"].decode("ascii") == hashes[-1]
+    assert len(list(disk.get_walker())) == 4
+
+
+def test_explicit_flush_then_revert(tmp_path: Path) -> None:
+    """Verify revert works across flushed and pending history."""
+    repo_dir = tmp_path / "repo"
+    repo = _init_repo(repo_dir)
+    initial = repo.log()[0].hash
+    (repo_dir / TREE_NAME).write_text("tree-changed\n", encoding="utf-8")
+    repo.commit_full(message="session: mutation")
+    repo.flush()
+    assert repo.pending_object_count == 0
+    new_hash = repo.revert(rev=initial)
+    assert repo.show_tree(rev=new_hash) == b"tree-0\n"
+    assert len(repo.log()) == 3
+
+
+@pytest.mark.parametrize(
+    ("env_value", "expected"),
+    [
+        (None, SESSION_REPO_BACKEND_PACKED),
+        ("loose", SESSION_REPO_BACKEND_LOOSE),
+        ("PACKED", SESSION_REPO_BACKEND_PACKED),
+        ("bogus", SESSION_REPO_BACKEND_PACKED),
+    ],
+)
+def test_resolve_backend_from_env(
+    monkeypatch: pytest.MonkeyPatch, env_value: str | None, expected: str
+) -> None:
+    """Verify backend env selection defaults to packed."""
+    if env_value is None:
+        monkeypatch.delenv(SESSION_REPO_BACKEND_ENV, raising=False)
+    else:
+        monkeypatch.setenv(SESSION_REPO_BACKEND_ENV, env_value)
+    assert resolve_session_repo_backend() == expected
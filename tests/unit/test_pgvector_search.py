@@ -0,0 +1,174 @@
+"""Unit tests for filtered pgvector search planning and partial HNSW upkeep."""
+
+from __future__ import annotations
+
+import uuid
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from code_analysis.core import pgvector_search as pvs
+from code_analysis.core.database.migrations.project_hnsw_indexes import (
+    migrate_project_hnsw_indexes,
+)
+
+BIG = str(uuid.UUID(int=1))
+SMALL = str(uuid.UUID(int=2))
+GONE = str(uuid.UUID(int=3))
+
+
+def test_plan_picks_strategy_and_overfetch() -> None:
+    """Verify strategy choice, candidate over-fetch and HNSW settings."""
+    exact = pvs.plan_pgvector_query(
+        chunk_count=500, has_project_index=False, limit=10, post_filtered=False
+    )
+    assert (exact.strategy, exact.candidate_limit) == (pvs.STRATEGY_EXACT, 10)
+
+    own = pvs.plan_pgvector_query(
+        chunk_count=50_000,
+        has_project_index=True,
+        limit=10,
+        post_filtered=True,
+        supports_iterative_scan=True,
+    )
+    assert (own.strategy, own.candidate_limit) == (pvs.STRATEGY_PROJECT_INDEX, 40)
+    assert dict(own.settings) == {
+        "hnsw.ef_search": "40",
+        "hnsw.iterative_scan": "off",
+    }
+
+    shared = pvs.plan_pgvector_query(
+        chunk_count=50_000,
+        has_project_index=False,
+        limit=100,
+        post_filtered=False,
+        ef_search=2000,
+        supports_iterative_scan=False,
+    )
+    assert shared.strategy == pvs.STRATEGY_GLOBAL_INDEX
+    assert shared.candidate_limit == 400
+    assert shared.settings == (("hnsw.ef_search", "1000"),)
+
+
+def test_knn_query_per_strategy() -> None:
+    """Verify the exact plan bypasses HNSW and the partial index gets a literal."""
+    exact = pvs.PgvectorQueryPlan(pvs.STRATEGY_EXACT, 20)
+    sql, params = pvs.pgvector_knn_query(
+        "c.id", "[1,0]", SMALL, exact, include_library=False
+    )
+    assert "<=> ?::vector) + 0" in sql and "UNION ALL" not in sql
+    assert params == ("[1,0]", SMALL, "[1,0]", 20, 20)
+
+    own = pvs.PgvectorQueryPlan(pvs.STRATEGY_PROJECT_INDEX, 40)
+    sql, params = pvs.pgvector_knn_query(
+        "c.id", "[1,0]", BIG, own, include_library=True
+    )
+    assert f"c.project_id = '{BIG}'::uuid" in sql
+    assert sql.count("UNION ALL") == 1 and sql.count("?") == len(params)
+    assert params[:3] == ("[1,0]", "[1,0]", 40)
+
+    with pytest.raises(ValueError):
+        pvs.pgvector_knn_query("c.id", "[1]", "x' OR 1=1", own, include_library=False)
+
+
+def test_plan_project_hnsw_indexes_with_hysteresis() -> None:
+    """Verify creates for large projects, keeps near the threshold, drops the rest."""
+    half = pvs.PROJECT_HNSW_MIN_CHUNKS // 2
+    existing = [
+        pvs.project_hnsw_index_name(SMALL),
+        pvs.project_hnsw_index_name(GONE),
+        "idx_code_chunks_embedding_vec_hnsw",
+    ]
+    creates, drops = pvs.plan_project_hnsw_indexes(
+        {BIG: pvs.PROJECT_HNSW_MIN_CHUNKS, SMALL: half}, existing
+    )
+    assert creates == [pvs.project_hnsw_index_sql(BIG)]
+    assert drops == [
+        f"DROP INDEX CONCURRENTLY IF EXISTS {pvs.project_hnsw_index_name(GONE)}"
+    ]
+
+    _, drops = pvs.plan_project_hnsw_indexes({SMALL: half - 1}, existing[:1])
+    assert drops == [f"DROP INDEX CONCURRENTLY IF EXISTS {existing[0]}"]
+
+
+def test_migration_applies_plan() -> None:
+    """Verify the migration sweep runs drops and creates from live counts."""
+
+    class _Adapter:
+        def __init__(self) -> None:
+            self.sql: List[str] = []
+
+        def _fetchall(
+            self, sql: str, params: Optional[Any] = None
+        ) -> List[Dict[str, Any]]:
+            if "information_schema" in sql:
+                return [{"present": 1}]
+            if "GROUP BY project_id" in sql:
+                return [{"project_id": BIG, "n": pvs.PROJECT_HNSW_MIN_CHUNKS}]
+            return [{"indexname": pvs.project_hnsw_index_name(GONE)}]
+
+        def _execute(self, sql: str, params: Any = None) -> None:
+            self.sql.append(sql)
+
+    adapter = _Adapter()
+    migrate_project_hnsw_indexes(adapter)
+    assert adapter.sql == [
+        f"DROP INDEX CONCURRENTLY IF EXISTS {pvs.project_hnsw_index_name(GONE)}",
+        pvs.project_hnsw_index_sql(BIG),
+    ]
+
+
+def test_ensure_creates_index_once_project_crosses_threshold() -> None:
+    """Verify runtime upkeep creates the index concurrently and never rebuilds it."""
+
+    class _Db:
+        def __init__(self, count: int, exists: bool) -> None:
+            self.count = count
+            self.exists = exists
+            self.ddl: List[str] = []
+
+        def execute(self, sql: str, params: Any = ()) -> Dict[str, Any]:
+            if "COUNT(*)" in sql:
+                return {"data": [{"n": self.count}]}
+            if "pg_indexes" in sql:
+                return {"data": [{"present": 1}] if self.exists else []}
+            self.ddl.append(sql)
+            return {"data": None}
+
+    crossed = _Db(pvs.PROJECT_HNSW_MIN_CHUNKS, exists=False)
+    pvs.ensure_project_hnsw_index(crossed, BIG)
+    assert crossed.ddl == [pvs.project_hnsw_index_sql(BIG)]
+    assert crossed.ddl[0].startswith("CREATE INDEX CONCURRENTLY")
+
+    indexed = _Db(pvs.PROJECT_HNSW_MIN_CHUNKS * 2, exists=True)
+    pvs.ensure_project_hnsw_index(indexed, BIG)
+    assert indexed.ddl == []
+
+
+def test_run_query_applies_settings_transaction_locally() -> None:
+    """Verify set_config runs inside the query transaction, then commits."""
+
+    class _Db:
+        def __init__(self) -> None:
+            self.calls: List[tuple] = []
+
+        def begin_transaction(self) -> str:
+            return "t1"
+
+        def execute(self, sql: str, params: Any = (), transaction_id: Any = None):
+            self.calls.append((sql, params, transaction_id))
+            return {"data": [{"dist": 0.1}]} if "FROM" in sql else {"data": []}
+
+        def commit_transaction(self, tid: str) -> None:
+            self.calls.append(("COMMIT", (), tid))
+
+    db = _Db()
+    rows = pvs.run_pgvector_query(
+        db, "SELECT 1 FROM hits", (), (("hnsw.ef_search", "80"),)
+    )
+    assert rows == [{"dist": 0.1}]
+    assert db.calls == [
+        ("SELECT set_config(?, ?, true)", ("hnsw.ef_search", "80"), "t1"),
+        ("SELECT 1 FROM hits", (), "t1"),
+        ("COMMIT", (), "t1"),
+    ]
@@ -0,0 +1,60 @@
+"""Unit tests for the server-side queue job waiter behind queue_wait_job."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Dict, List
+
+import pytest
+from mcp_proxy_adapter.core.errors import ValidationError
+
+from code_analysis.commands.queue_wait_job_command import QueueWaitJobCommand
+from code_analysis.core.queue_job_waiter import QueueJobWaiter
+
+
+def _reader(statuses: Dict[str, List[str]], reads: List[str]):
+    async def _read(job_id: str) -> Dict[str, str]:
+        reads.append(job_id)
+        seq = statuses[job_id]
+        return {"job_id": job_id, "status": seq.pop(0) if len(seq) > 1 else seq[0]}
+
+    return _read
+
+
+@pytest.mark.asyncio
+async def test_waiters_share_one_watch_and_wake_on_terminal() -> None:
+    """Verify concurrent waiters of one job share reads and wake on completion."""
+    reads: List[str] = []
+    statuses = {"a": ["pending", "running", "completed"]}
+    waiter = QueueJobWaiter(_reader(statuses, reads), min_interval=0.001)
+
+    results = await asyncio.gather(waiter.wait("a", 5.0), waiter.wait("a", 5.0))
+
+    assert [r[0]["status"] for r in results] == ["completed", "completed"]
+    assert [r[1] for r in results] == [False, False]
+    assert reads == ["a", "a", "a"]
+    assert waiter.watched_jobs == 0
+
+
+@pytest.mark.asyncio
+async def test_wait_times_out_with_last_status_and_propagates_errors() -> None:
+    """Verify a timeout returns the current status and read errors are raised."""
+    reads: List[str] = []
+    waiter = QueueJobWaiter(_reader({"slow": ["running"]}, reads), min_interval=0.001)
+
+    status, timed_out = await waiter.wait("slow", 0.05)
+    assert (status["status"], timed_out) == ("running", True)
+
+    async def _missing(job_id: str) -> None:
+        raise LookupError(job_id)
+
+    with pytest.raises(LookupError):
+        await QueueJobWaiter(_missing).wait("gone", 1.0)
+
+
+def test_validate_params_bounds_timeout() -> None:
+    """Verify queue_wait_job rejects timeouts outside 0..60 seconds."""
+    cmd = QueueWaitJobCommand()
+    assert cmd.validate_params({"job_id": "j", "timeout": 0})["timeout"] == 0
+    with pytest.raises(ValidationError, match="timeout"):
+        cmd.validate_params({"job_id": "j", "timeout": 61})
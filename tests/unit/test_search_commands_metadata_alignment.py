@@ -36,6 +36,7 @@ _PAGINATED_CROSS_PARAMS = frozenset(
         "literal",
         "case_sensitive",
         "hard_timeout_seconds",
+        "early_termination",
         "first_block_wait_seconds",
         "file_pattern",
         "path_filter",
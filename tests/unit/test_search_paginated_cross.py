@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
+import time
 import uuid
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -56,6 +58,7 @@ def _fake_assembler_factory(
         )
 
     assembler.run_until_idle.side_effect = run
+    assembler.publish_settled.return_value = 0
     return assembler
 
 
@@ -403,3 +406,158 @@ async def test_run_paginated_cross_global_semantic_skips_on_faiss_with_note(
     notes = json.loads(notes_path.read_text()).get("notes")
     assert notes and "FAISS" in notes[0]
     assert "pgvector" in notes[0]
+
+
+@pytest.mark.asyncio
+async def test_run_paginated_cross_settled_page_cuts_grep_short(
+    tmp_path: Path,
+) -> None:
+    """Fulltext + semantic agreeing on a full page -> that page is published
+    as block_1 in hybrid-rank order and the (slow) grep phase is stopped."""
+    session, layout = _session_and_layout(tmp_path)
+    command = MagicMock()
+    command._resolve_project_root.return_value = tmp_path
+    command._open_database_from_config.side_effect = RuntimeError("skip prefilter db")
+
+    def _rows(score_key: str) -> list[dict]:
+        """Return rows naming the same two entities."""
+        return [
+            {
+                "file_path": "c.py",
+                "content": f"def {name}(): pass",
+                "chunk_text": f"def {name}(): pass",
+                score_key: score,
+                "entity_type": "function",
+                "entity_name": name,
+            }
+            for name, score in (("lone", 0.95), ("foo", 0.9), ("bar", 0.8))
+            if score_key == "bm25_score" or name != "lone"
+        ]
+
+    ft_mock = MagicMock()
+    ft_mock.execute = AsyncMock(
+        return_value=SuccessResult(data={"results": _rows("bm25_score")})
+    )
+    sem_mock = MagicMock()
+    sem_mock.execute = AsyncMock(
+        return_value=SuccessResult(data={"results": _rows("score")})
+    )
+
+    async def _slow_grep(**kwargs: object) -> SuccessResult:
+        """Return grep execute that would outlive the test."""
+        await asyncio.sleep(60)
+        return SuccessResult(data={"matches": []})
+
+    grep_cmd = MagicMock()
+    grep_cmd.execute = AsyncMock(side_effect=_slow_grep)
+
+    t0 = time.monotonic()
+    with (
+        patch(
+            "code_analysis.commands.search_paginated_cross.SemanticSearchMCPCommand",
+            return_value=sem_mock,
+        ),
+        patch(
+            "code_analysis.commands.search_paginated_cross.FulltextSearchMCPCommand",
+            return_value=ft_mock,
+        ),
+        patch(
+            "code_analysis.commands.search_paginated_cross.FsGrepCommand",
+            return_value=grep_cmd,
+        ),
+    ):
+        pos = await run_paginated_cross(
+            command=command,
+            params={
+                "project_id": "pid",
+                "query": "foo",
+                "enable_grep": True,
+                "page_size": 2,
+            },
+            session=session,
+            layout=layout,
+            raw_config={"search_session": {"max_block_size_bytes": 65536}},
+        )
+
+    assert time.monotonic() - t0 < 30
+    assert pos == 1
+    data = json.loads((layout.blocks_dir / "block_1.json").read_text("utf-8"))
+    assert [r["entity_name"] for r in data["items"]] == ["foo", "bar"]
+    assert {c["source"] for c in data["items"][0]["sources"]} == {
+        "fulltext",
+        "semantic",
+    }
+
+
+@pytest.mark.asyncio
+async def test_run_paginated_cross_settled_page_under_default_block_size(
+    tmp_path: Path,
+) -> None:
+    """Fulltext alone overflows the default block size -> block_1 is still
+    the settled hybrid head, not fulltext in arrival order, and grep stops."""
+    session, layout = _session_and_layout(tmp_path)
+    command = MagicMock()
+    command._resolve_project_root.return_value = tmp_path
+    command._open_database_from_config.side_effect = RuntimeError("skip prefilter db")
+    body = "\n".join(f"    step_{i} = {i}" for i in range(60))
+
+    def _row(name: str, score_key: str, score: float) -> dict:
+        """Return one backend row for entity ``name`` with a long body."""
+        return {
+            "file_path": "c.py",
+            "content": f"def {name}():\n{body}",
+            "chunk_text": f"def {name}():\n{body}",
+            score_key: score,
+            "entity_type": "function",
+            "entity_name": name,
+        }
+
+    ft_rows = [_row(f"ft_only_{i}", "bm25_score", 0.99 - i / 100) for i in range(6)]
+    ft_rows += [_row("foo", "bm25_score", 0.5), _row("bar", "bm25_score", 0.4)]
+    sem_rows = [_row("foo", "score", 0.9), _row("bar", "score", 0.8)]
+
+    ft_mock = MagicMock()
+    ft_mock.execute = AsyncMock(return_value=SuccessResult(data={"results": ft_rows}))
+    sem_mock = MagicMock()
+    sem_mock.execute = AsyncMock(return_value=SuccessResult(data={"results": sem_rows}))
+
+    async def _slow_grep(**kwargs: object) -> SuccessResult:
+        """Return grep execute that would outlive the test."""
+        await asyncio.sleep(60)
+        return SuccessResult(data={"matches": []})
+
+    grep_cmd = MagicMock()
+    grep_cmd.execute = AsyncMock(side_effect=_slow_grep)
+
+    t0 = time.monotonic()
+    with (
+        patch(
+            "code_analysis.commands.search_paginated_cross.SemanticSearchMCPCommand",
+            return_value=sem_mock,
+        ),
+        patch(
+            "code_analysis.commands.search_paginated_cross.FulltextSearchMCPCommand",
+            return_value=ft_mock,
+        ),
+        patch(
+            "code_analysis.commands.search_paginated_cross.FsGrepCommand",
+            return_value=grep_cmd,
+        ),
+    ):
+        pos = await run_paginated_cross(
+            command=command,
+            params={
+                "project_id": "pid",
+                "query": "foo",
+                "enable_grep": True,
+                "page_size": 2,
+            },
+            session=session,
+            layout=layout,
+            raw_config={},
+        )
+
+    assert time.monotonic() - t0 < 30
+    assert pos == 1
+    data = json.loads((layout.blocks_dir / "block_1.json").read_text("utf-8"))
+    assert [r["entity_name"] for r in data["items"]] == ["foo", "bar"]